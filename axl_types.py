@@ -0,0 +1,3922 @@
+"""AXL schema lookup tables, generated by build_axl_types.py from
+schema/AXLEnums.xsd and schema/AXLSoap.xsd. Do not edit."""
+SCHEMA_DIGEST = 'a9d18f73544032ec97c001319377ffad6b57f11a'
+
+# Enum type -> allowed values
+ENUMS = {
+    'XASN1RoseOidEncoding': frozenset({'No Changes', 'Use Global Value ECMA', 'Use Global Value ISO', 'Use Local Value'}),
+    'XAlarmSeverity': frozenset({'Alert', 'Critical', 'Debug', 'Emergency', 'Error', 'Informational', 'Notice', 'Warning'}),
+    'XAppServer': frozenset({'CER Location Management', 'CUMA Provisioning Server', 'Cisco Unified CM IM and Presence (Obsolete)', 'Cisco Unity Connection', 'Cisco Unity Voice Mail 4.x or later', 'Cisco Web Dialer', 'Cisco Webex Hybrid Call Service', 'Remote Syslog Server'}),
+    'XAppServerContent': frozenset({'UNITY KUBRIK', 'UNITY PRE KUBRIK', 'UNITY_CONNECTION'}),
+    'XAuthenticationMode': frozenset({'By Authentication String', 'By Existing Certificate (precedence to LSC)', 'By Existing Certificate (precedence to MIC)', 'By Null String'}),
+    'XAutoAnswer': frozenset({'Auto Answer Off', 'Auto Answer with Headset', 'Auto Answer with Speakerphone'}),
+    'XBLFSDOption': frozenset({'Pickup'}),
+    'XBarge': frozenset({'Barge', 'CBarge', 'Default', 'Off'}),
+    'XBillingserverprotocol': frozenset({'FTP', 'SFTP'}),
+    'XBriProtocol': frozenset({'BRI NET3', 'NI', 'QSIG'}),
+    'XCALHeaders': frozenset({'Disabled', 'Preferred', 'Required'}),
+    'XCALMode': frozenset({'Fixed', 'Variable'}),
+    'XCFACSSActivationPolicy': frozenset({'Use System Default', 'With Activating Device/Line CSS', 'With Configured CSS'}),
+    'XCSUParam': frozenset({'-15dB', '-22.5dB', '-7.5dB', '0dB'}),
+    'XCUCMVersionInSipHeader': frozenset({'Full Build', 'Major And Minor', 'Major', 'Major, Minor And Revision', 'None'}),
+    'XCallTreatmentOnFailure': frozenset({'Allow Calls', 'Block Calls'}),
+    'XCallerFilterMask': frozenset({'Directory Number', 'Not Available', 'Private'}),
+    'XCallerID': frozenset({'ANI', 'DNIS'}),
+    'XCallingLineIdentification': frozenset({'Default', 'Strict From URI presentation Only', 'Strict Identity Headers presentation Only'}),
+    'XCallingPartySelection': frozenset({'First Redirect Number (External)', 'First Redirect Number', 'Last Redirect Number (External)', 'Last Redirect Number', 'Originator'}),
+    'XCertificateOperation': frozenset({'Delete', 'Install/Upgrade', 'No Pending Operation', 'Troubleshoot'}),
+    'XCertificateService': frozenset({'CAPF', 'CAPF-trust', 'CallManager', 'CallManager-ECDSA', 'CallManager-trust', 'GDS-trust', 'ITLRecovery', 'Phone-CTL-ASA-trust', 'Phone-CTL-trust', 'Phone-SAST-trust', 'Phone-VPN-trust', 'Phone-trust', 'TVS', 'TVS-trust', 'directory-trust', 'ipsec', 'ipsec-trust', 'tomcat', 'tomcat-ECDSA', 'tomcat-trust', 'userlicensing-trust'}),
+    'XCertificateStatus': frozenset({'Delete Failed', 'Delete Failed: CA Communication Failure', 'Delete Failed: CA Rejected Connection', 'Delete Failed: Invalid Authentication String', 'Delete Failed: Invalid Credentials', 'Delete Failed: Invalid LSC', 'Delete Failed: Invalid MIC', 'Delete Failed: Key Generation Failed/Timeout', 'Delete Failed: Phone Communication Failure', 'Delete Failed: User Initiated Request Late/Timedout', 'Delete Success', 'None', 'Operation Pending', 'Troubleshoot Failed', 'Troubleshoot Failed: Invalid Authentication String', 'Troubleshoot Failed: Invalid Credentials', 'Troubleshoot Failed: Invalid LSC', 'Troubleshoot Failed: Invalid MIC', 'Troubleshoot Failed: Key Generation Failed/Timeout', 'Troubleshoot Failed: Phone Communication Failure', 'Troubleshoot Failed: User Initiated Request Late/Timedout', 'Troubleshoot Success', 'Upgrade Failed', 'Upgrade Failed: CA Communication Failure', 'Upgrade Failed: CA Rejected Connection', 'Upgrade Failed: Invalid Authentication String', 'Upgrade Failed: Invalid Credentials', 'Upgrade Failed: Invalid LSC', 'Upgrade Failed: Invalid MIC', 'Upgrade Failed: Key Generation Failed/Timeout', 'Upgrade Failed: No Support for EC only in CAPF version 3', 'Upgrade Failed: Phone Communication Failure', 'Upgrade Failed: User Initiated Request Late/Timedout', 'Upgrade Success'}),
+    'XCertificateVerificationLevel': frozenset({'Any Certificate', 'Keystore Only', 'Self-signed or Keystore'}),
+    'XChangeAction': frozenset({'a', 'r', 'u'}),
+    'XChangeType': frozenset({'AarGroup', 'AarGroupMatrix', 'AdvertisedPatterns', 'Announcement', 'Annunciator', 'AppServerInfo', 'AppUser', 'ApplicationDialRules', 'ApplicationServer', 'ApplicationUserCapfProfile', 'AssignedPresenceServers', 'AssignedPresenceUsers', 'AudioCodecPreferenceList', 'BillingServer', 'BlockedLearnedPatterns', 'CCAProfiles', 'CallManager', 'CallManagerGroup', 'CallPark', 'CallPickupGroup', 'CalledPartyTracing', 'CalledPartyTransformationPattern', 'CallerFilterList', 'CallingPartyTransformationPattern', 'CcdAdvertisingService', 'CcdHostedDN', 'CcdHostedDNGroup', 'CcdRequestingService', 'CiscoCatalyst600024PortFXSGateway', 'CiscoCatalyst6000E1VoIPGateway', 'CiscoCatalyst6000T1VoIPGatewayPri', 'CiscoCatalyst6000T1VoIPGatewayT1', 'CiscoCloudOnboarding', 'CmcInfo', 'CommonDeviceConfig', 'CommonPhoneConfig', 'ConferenceBridge', 'ConferenceNow', 'CredentialPolicy', 'CredentialPolicyDefault', 'Css', 'CtiRoutePoint', 'CumaServerSecurityProfile', 'CustomUserField', 'Customer', 'DateTimeGroup', 'Ddi', 'DefaultDeviceProfile', 'DeviceDefaults', 'DeviceMobility', 'DeviceMobilityGroup', 'DevicePool', 'DeviceProfile', 'DhcpServer', 'DhcpSubnet', 'DialPlan', 'DialPlanTag', 'DirNumberAliasLookupandSync', 'DirectedCallPark', 'DirectoryLookupDialRules', 'ElinGroup', 'EmccFeatureConfig', 'EndUserCapfProfile', 'EnterpriseFeatureAccessConfiguration', 'ExpresswayCConfiguration', 'ExternalCallControlProfile', 'FacInfo', 'FallbackProfile', 'FeatureControlPolicy', 'FeatureGroupTemplate', 'FixedMohAudioSource', 'Gatekeeper', 'Gateway', 'GatewayEndpointAnalogAccess', 'GatewayEndpointDigitalAccessBri', 'GatewayEndpointDigitalAccessPri', 'GatewayEndpointDigitalAccessT1', 'GatewaySccpEndpoints', 'GatewaySubunits', 'GeoLocation', 'GeoLocationFilter', 'GeoLocationPolicy', 'H323Gateway', 'H323Phone', 'H323Trunk', 'HandoffConfiguration', 'HttpProfile', 'HuntList', 'HuntPilot', 'ImeClient', 'ImeE164Transformation', 'ImeEnrolledPattern', 'ImeEnrolledPatternGroup', 'ImeExclusionNumber', 'ImeExclusionNumberGroup', 'ImeFirewall', 'ImeRouteFilterElement', 'ImeRouteFilterGroup', 'ImeServer', 'ImportedDirectoryUriCatalogs', 'InfrastructureDevice', 'InterClusterServiceProfile', 'InteractiveVoiceResponse', 'IpPhoneServices', 'IvrUserLocale', 'LbmGroup', 'LbmHubGroup', 'LdapDirectory', 'LdapFilter', 'LdapSearch', 'LdapSyncCustomField', 'LicensedUser', 'Line', 'LineGroup', 'LocalRouteGroup', 'Location', 'MediaResourceGroup', 'MediaResourceList', 'MeetMe', 'MessageWaiting', 'MlppDomain', 'MobileSmartClientProfile', 'MobileVoiceAccess', 'MobilityProfile', 'MohAudioSource', 'MohServer', 'MraServiceDomain', 'Mtp', 'NetworkAccessProfile', 'Phone', 'PhoneActivationCode', 'PhoneButtonTemplate', 'PhoneNtp', 'PhoneSecurityProfile', 'PhysicalLocation', 'PresenceGroup', 'PresenceRedundancyGroup', 'ProcessNode', 'ProcessNodeService', 'RecordingProfile', 'Region', 'RegionMatrix', 'RegistrationDynamic', 'RemoteCluster', 'RemoteDestination', 'RemoteDestinationProfile', 'ResourcePriorityNamespace', 'ResourcePriorityNamespaceList', 'RouteFilter', 'RouteGroup', 'RouteList', 'RoutePartition', 'RoutePattern', 'RoutePlan', 'SIPNormalizationScript', 'SafCcdPurgeBlockLearnedRoutes', 'SafForwarder', 'SafSecurityProfile', 'SdpTransparencyProfile', 'SecureConfig', 'ServiceParameter', 'ServiceProfile', 'SipDialRules', 'SipProfile', 'SipRealm', 'SipRoutePattern', 'SipTrunk', 'SipTrunkSecurityProfile', 'SoftKeyTemplate', 'Srst', 'TimePeriod', 'TimeSchedule', 'TodAccess', 'TransPattern', 'Transcoder', 'TransformationProfile', 'TvsCertificate', 'UcService', 'UnassignedDevice', 'UnassignedPresenceServers', 'UnassignedPresenceUsers', 'UnitsToGateway', 'UniversalDeviceTemplate', 'UniversalLineTemplate', 'User', 'UserGroup', 'UserPhoneAssociation', 'UserProfileProvision', 'Vg224', 'VohServer', 'VoiceMailPilot', 'VoiceMailPort', 'VoiceMailProfile', 'VpnGateway', 'VpnGroup', 'VpnProfile', 'WLANProfile', 'WifiHotspot', 'WirelessAccessPointControllers', 'WlanProfileGroup'}),
+    'XClass': frozenset({'Add-on modules', 'CTI Route Point', 'Conference Bridge', 'Device Profile', 'EMCC Base Phone Template', 'EMCC Base Phone', 'GateKeeper', 'Gateway Template', 'Gateway', 'Hidden Phone', 'Interactive Voice Response', 'Invalid', 'Media Termination Point', 'Music On Hold', 'Phone Template', 'Phone', 'Pilot', 'Remote Destination Profile Template', 'Remote Destination Profile', 'Route List', 'Simulation', 'Tone Announcement Player', 'Trunk', 'UDP Template', 'Voice Mail'}),
+    'XClockReference': frozenset({'Internal', 'Network', 'Span 1', 'Span 2', 'Span 3', 'Span 4', 'Span 5', 'Span 6', 'Span 7', 'Span 8'}),
+    'XConnectProtocol': frozenset({'EWS', 'HTTP', 'HTTPS', 'OWA', 'SIP', 'SOAP', 'SSL', 'TCP + UDP', 'TCP', 'TLS', 'UDP', 'XMPP'}),
+    'XCountry': frozenset({'Algeria', 'Argentina', 'Australia', 'Austria', 'Bahrain', 'Belgium', 'Brazil', 'Bulgaria', 'Canada', 'Chile', 'China', 'Colombia', 'Croatia', 'Cyprus', 'Czech Republic', 'Denmark', 'Egypt', 'Estonia', 'Finland', 'France', 'Germany', 'Ghana', 'Greece', 'Hong Kong', 'Hungary', 'Iceland', 'India', 'Indonesia', 'Iraq', 'Ireland', 'Israel', 'Italy', 'Itu', 'Japan', 'Jordan', 'Kenya', 'Korea Republic', 'Kuwait', 'Latvia', 'Lebanon', 'Lithuania', 'Luxembourg', 'Malaysia', 'Mauritania', 'Mexico', 'Morocco', 'Nepal', 'Netherlands', 'New Zealand', 'Nigeria', 'Norway', 'Oman', 'Pakistan', 'Panama', 'Peru', 'Philippines', 'Poland', 'Portugal', 'Qatar', 'Republic of Montenegro', 'Republic of Serbia', 'Romania', 'Russian Federation', 'Saudi Arabia', 'Serbia and Montenegro', 'Singapore', 'Slovakia', 'Slovenia', 'South Africa', 'Spain', 'Sudan', 'Sweden', 'Switzerland', 'Taiwan', 'Thailand', 'Tunisia', 'Turkey', 'Ukraine', 'United Arab Emirates', 'United Kingdom', 'United States', 'Venezuela', 'Vietnam', 'Yemen', 'Zimbabwe'}),
+    'XCredential': frozenset({'PIN', 'Password'}),
+    'XCredentialUser': frozenset({'Application User', 'End User'}),
+    'XDNDOption': frozenset({'Call Reject', 'Ringer Off', 'Use Common Phone Profile Setting'}),
+    'XDTMFSignaling': frozenset({'No Preference', 'OOB and RFC 2833', 'Out of Band', 'RFC 2833'}),
+    'XDayOfWeek': frozenset({'Fri', 'Mon', 'None', 'Sat', 'Sun', 'Thu', 'Tue', 'Wed'}),
+    'XDeviceProtocol': frozenset({'Analog Access', 'CTI Remote Device', 'Digital Access BRI', 'Digital Access E1 R2', 'Digital Access PRI', 'Digital Access T1', 'H.225', 'Inter-Cluster Trunk', 'MGCP', 'Mobile Smart Client', 'Multicast Point', 'Protocol Not Specified', 'RAS', 'Remote Destination', 'Route Point', 'SCCP', 'SIP Connector', 'SIP', 'Static SIP Mobile Subscriber', 'Unicast Bridge'}),
+    'XDeviceSecurityMode': frozenset({'Authenticated', 'Encrypted', 'Non Secure'}),
+    'XDeviceTrustMode': frozenset({'Not Trusted', 'Trusted'}),
+    'XDialParameter': frozenset({'Button', 'Pattern', 'Timeout', 'User'}),
+    'XDialPattern': frozenset({'7905_7912', '7940_7960_OTHER'}),
+    'XDialViaOffice': frozenset({'Dial via Office Forward', 'Dial via Office Reverse'}),
+    'XDigitSending': frozenset({'DTMF', 'MF', 'PULSE'}),
+    'XDistributeAlgorithm': frozenset({'Broadcast', 'Circular', 'Longest Idle Time', 'Top Down'}),
+    'XECKeySize': frozenset({'256', '384', '521'}),
+    'XEOSuppVoiceCall': frozenset({'Best Effort (no MTP inserted)', 'Disabled (Default value)', 'Mandatory (insert MTP if needed)'}),
+    'XEncode': frozenset({'A-law', 'u-law'}),
+    'XEndpointConnection': frozenset({'CDP', 'LLDP', 'SSID', 'SWITCH'}),
+    'XFDLChannel': frozenset({'ANSI T1.403 NI', 'ANSI T1.403.CI', 'AT&T 54016', 'None'}),
+    'XFallBackCSSSelection': frozenset({'Calling device AAR Calling Search Space', 'Trunk ReRoute Calling Search Space'}),
+    'XFeature': frozenset({'AEC', 'Alerting Calls', 'All Calls', 'Answer Oldest', 'Answer/Release', 'Application Menu', 'Application Sharing', 'Auto Answer', 'Call Park BLF', 'Call Park', 'Call Pickup', 'CallBack', 'Chat', 'Conference List', 'Conference', 'Directories', 'Display', 'Do Not Disturb', 'End Call', 'File Transfer', 'Forward All', 'Group Call Pickup', 'Headset', 'Hold', 'Hunt Group Logout', 'Information', 'Intercom', 'Line', 'Malicious Call Identification', 'Meet Me Conference', 'Message Waiting', 'Messages', 'Mobility', 'New Call', 'None', 'Other Pickup', 'Privacy', 'Quality Reporting Tool', 'Queue Status', 'Record', 'Redial', 'Remove Last Participant', 'Service URL', 'Services', 'Settings', 'Speed Dial BLF', 'Speed Dial', 'Transfer', 'Video Mode', 'Video', 'Whiteboard'}),
+    'XGClear': frozenset({'CCD', 'CLEARMODE', 'Disabled', 'G.nX64', 'X-CCD'}),
+    'XGeoLocationDevice': frozenset({'Border', 'Interior'}),
+    'XGlobalNumber': frozenset({'+E.164 Number', 'Enterprise Number'}),
+    'XHTTPProxy': frozenset({'Auto', 'Manual', 'None'}),
+    'XHostedRoutePatternPSTNRule': frozenset({'No PSTN', 'Specify', 'Use pattern'}),
+    'XHotspotAuthenticationMethod': frozenset({'EAP-FAST', 'None', 'PEAP-GTC', 'PEAP-MSCHAPv2', 'WEP', 'WPA-PSK', 'WPA2-PSK'}),
+    'XHuntAlgorithm': frozenset({'Skip remaining members, and go directly to next group', 'Stop hunting', 'Try next member, but do not go to next group', 'Try next member; then, try next group in Hunt List'}),
+    'XIPAddressingMode': frozenset({'IPv4 Only', 'IPv4 and IPv6', 'IPv6 Only'}),
+    'XIPAddressingModePrefControl': frozenset({'IPv4', 'IPv6', 'Use System Default'}),
+    'XInterClusterService': frozenset({'EMCC', 'LBM', 'PSTN Access', 'RSVP Agent', 'TFTP', 'UDS'}),
+    'XKeepAliveTimeInterval': frozenset({'0', '10', '15', '20', '25', '30', '5'}),
+    'XKeyOrder': frozenset({'EC Only', 'EC Preferred, RSA Backup', 'RSA Only'}),
+    'XKeySize': frozenset({'1024', '2048', '3072', '4096', '512'}),
+    'XLDAPDirectoryFunction': frozenset({'Alias Sync only', 'DN Alias Sync and Lookup', 'DirSync', 'Lookup only'}),
+    'XLdapServer': frozenset({'Microsoft ADAM or Lightweight Directory Services', 'Microsoft Active Directory', 'OpenLDAP', 'Other LDAPv3 Compliant Directory', 'Sun or Oracle Directory Server'}),
+    'XLogicalPartitionPolicy': frozenset({'Allow', 'Deny', 'Use Default Policy'}),
+    'XLossyNetwork': frozenset({'Keep Current Setting', 'Lossy', 'Low Loss', 'Use System Default'}),
+    'XMGCPSlotModule': frozenset({'AIM-VOICE-30 (2 subunits)', 'AIM-VOICE-30-SLOT-0 (3 subunits- slot 0 only)', 'ANALOG', 'DIGITAL', 'ENCS-1NIM-MBRD', 'EVM-HD', 'FLEX-SLOT', 'GENERIC-SLOT', 'ISR-2NIM-MBRD', 'ISR-3NIM-MBRD', 'NM-1V', 'NM-2V', 'NM-3VWIC-MBRD', 'NM-4VWIC-MBRD', 'NM-HD-1V', 'NM-HD-2V', 'NM-HD-2VE', 'NM-HDA', 'NM-HDV', 'NM-HDV2-0PORT', 'NM-HDV2-1PORT-E1', 'NM-HDV2-1PORT-T1', 'NM-HDV2-2PORT-E1', 'NM-HDV2-2PORT-T1', 'NONE', 'PA-MCX', 'PA-VXA', 'PA-VXB', 'PA-VXC', 'SM-X-NIM-ADPTR', 'VG-1NIM-MBRD', 'VG-2VWIC-MBRD', 'VG-3VWIC-MBRD', 'VGC_PORT', 'VIC-SLOT', 'VWIC-SLOT', 'WS-X6600'}),
+    'XMGCPVic': frozenset({'16FXS', '16FXS8FXO', '1T1', '24FXS', '24FXS-SCCP', '2FXS-MGCP', '2FXS-SCCP', '48_PORTS', '4FXS-MGCP', '4FXS-SCCP', '8FXS', 'EM-4BRI-NT/TE', 'EM-4BRI-NT/TE-EM0', 'EM-4BRI-NT/TE-EM1', 'EM-4BRI-NT/TE-SCCP', 'EM-4FXO-EM0', 'EM-4FXO-EM1', 'EM-8FXS-EM0', 'EM-8FXS-EM0-SCCP', 'EM-8FXS-EM1', 'EM-8FXS-EM1-SCCP', 'EM-HDA-3FXS/4FXO', 'EM-HDA-3FXS/4FXO-SCCP', 'EM-HDA-6FXO', 'EM-HDA-8FXS', 'EM-HDA-8FXS-SCCP', 'EM2-4FXO-EM0', 'EM2-4FXO-EM1', 'EM3-HDA-8FXS/DID', 'EM3-HDA-8FXS/DID-SCCP', 'EVM-HD-8FXS/DID', 'EVM-HD-8FXS/DID-SCCP', 'HWIC-1CE1T1-PRI-E1', 'HWIC-1CE1T1-PRI-T1', 'HWIC-2CE1T1-PRI-E1', 'HWIC-2CE1T1-PRI-T1', 'HWIC-4CE1T1-PRI-E1', 'HWIC-4CE1T1-PRI-T1', 'Intelbras 80 Port FXS', 'NIM-1CE1T1-PRI-E1', 'NIM-1CE1T1-PRI-T1', 'NIM-1MFT-T1E1-E1', 'NIM-1MFT-T1E1-T1', 'NIM-2BRI-NT/TE', 'NIM-2BRI-NT/TE-SCCP', 'NIM-2CE1T1-PRI-E1', 'NIM-2CE1T1-PRI-T1', 'NIM-2FXO', 'NIM-2FXS', 'NIM-2FXS-SCCP', 'NIM-2FXS/4FXO', 'NIM-2FXS/4FXO-SCCP', 'NIM-2MFT-T1E1-E1', 'NIM-2MFT-T1E1-T1', 'NIM-4BRI-NT/TE', 'NIM-4BRI-NT/TE-SCCP', 'NIM-4FXO', 'NIM-4FXS', 'NIM-4FXS-SCCP', 'NIM-4MFT-T1E1-E1', 'NIM-4MFT-T1E1-T1', 'NIM-8CE1T1-PRI-E1', 'NIM-8CE1T1-PRI-T1', 'NIM-8MFT-T1E1-E1', 'NIM-8MFT-T1E1-T1', 'NM-HDA-4FXS', 'NM-HDA-4FXS-SCCP', 'NM-HDV2-ONBOARD-E1', 'NM-HDV2-ONBOARD-E1-2PORT', 'NM-HDV2-ONBOARD-T1', 'NM-HDV2-ONBOARD-T1-2PORT', 'PA-MCX-2TE1-E1', 'PA-MCX-2TE1-T1', 'PA-MCX-4TE1-E1', 'PA-MCX-4TE1-T1', 'PA-MCX-6TE1-E1', 'PA-MCX-6TE1-T1', 'PA-MCX-8TE1-E1', 'PA-MCX-8TE1-T1', 'PA-VXA-1TE1-24-T1', 'PA-VXA-1TE1-30-E1', 'PA-VXB-2TE1-E1', 'PA-VXB-2TE1-T1', 'PA-VXC-2TE1-E1', 'PA-VXC-2TE1-T1', 'SM-D-48FXS-E', 'SM-D-48FXS-E-SCCP', 'SM-D-72FXS', 'SM-D-72FXS-SCCP', 'SM-X-16FXS/2FXO', 'SM-X-16FXS/2FXO-SCCP', 'SM-X-24FXS/4FXO', 'SM-X-24FXS/4FXO-SCCP', 'SM-X-56FXS', 'SM-X-56FXS-SCCP', 'SM-X-72FXS', 'SM-X-72FXS-SCCP', 'SM-X-8FXS/12FXO', 'SM-X-8FXS/12FXO-SCCP', 'VG-2FXS/2FXO', 'VG-2FXS/2FXO-SCCP', 'VG-4FXS/4FXO', 'VG-4FXS/4FXO-SCCP', 'VG-6FXS/6FXO', 'VG-6FXS/6FXO-SCCP', 'VG-8FXS', 'VG-8FXS-SCCP', 'VGD-DFC-CT3', 'VIC-16FXS', 'VIC-2BRI', 'VIC-2FXO', 'VIC-2FXS', 'VIC-2FXS-SCCP', 'VIC-4FXO', 'VIC-4FXS', 'VIC-4FXS-SCCP', 'VIC-4FXS/DID', 'VIC-8FXO', 'VIC-8FXS', 'VIC2-1BRI', 'VIC2-1FXO', 'VIC2-1MFT-T1E1-E1', 'VIC2-1MFT-T1E1-T1', 'VIC2-2BRI', 'VIC2-2BRI-NT/TE-SCCP', 'VIC2-2FXO', 'VIC2-2FXS', 'VIC2-2FXS-SCCP', 'VIC2-2MFT-T1E1-E1', 'VIC2-2MFT-T1E1-T1', 'VIC2-4FXO', 'VIC3-2FXS-E/DID', 'VIC3-2FXS-E/DID-SCCP', 'VIC3-2FXS/DID', 'VIC3-2FXS/DID-SCCP', 'VIC3-4FXS/DID', 'VIC3-4FXS/DID-SCCP', 'VIC_NONE', 'VWIC-1MFT-E1', 'VWIC-1MFT-T1', 'VWIC-2MFT-E1', 'VWIC-2MFT-T1', 'VWIC2-1MFT-G703-E1', 'VWIC2-1MFT-G703-T1', 'VWIC2-1MFT-T1E1-E1', 'VWIC2-1MFT-T1E1-T1', 'VWIC2-2MFT-G703-E1', 'VWIC2-2MFT-G703-T1', 'VWIC2-2MFT-T1E1-E1', 'VWIC2-2MFT-T1E1-T1', 'VWIC3-1MFT-G703-E1', 'VWIC3-1MFT-G703-T1', 'VWIC3-1MFT-T1E1-E1', 'VWIC3-1MFT-T1E1-T1', 'VWIC3-2MFT-G703-E1', 'VWIC3-2MFT-G703-T1', 'VWIC3-2MFT-T1E1-E1', 'VWIC3-2MFT-T1E1-T1', 'VWIC3-4MFT-T1E1-E1', 'VWIC3-4MFT-T1E1-T1', 'WS-SVC-CMM-MS', 'WS-U4604-16FXS', 'WS-U4604-8FXO-2FXS', 'WS-U4604-8FXS', 'WS-X6600-24FXS', 'WS-X6600-6E1', 'WS-X6600-6T1'}),
+    'XMRAPolicy': frozenset({'IM & Presence only', 'IM & Presence, Voice and Video calls', 'No Service'}),
+    'XMWLPolicy': frozenset({'Light Only', 'Light and Prompt', 'None', 'Prompt Only', 'Use System Policy'}),
+    'XMatrixValue': frozenset({'Allow Subscription', 'Disallow Subscription', 'Mandatory', 'Mandatory(Video Desired)', 'No Reservation', 'Optional(Video Desired)', 'Use System Default'}),
+    'XMediaPayload': frozenset({'G711 a-law 64K', 'G711 u-law 64K', 'G723', 'G729', 'G729AnnexA', 'G729AnnexA-AnnexB', 'G729AnnexB'}),
+    'XMobileSmartClient': frozenset({'CUMC', 'Standard'}),
+    'XModel': frozenset({'7914 14-Button Line Expansion Module', '7915 12-Button Line Expansion Module', '7915 24-Button Line Expansion Module', '7916 12-Button Line Expansion Module', '7916 24-Button Line Expansion Module', 'Analog Access WS-X6624', 'Analog Access', 'Analog Phone', 'Ascom IP-DECT Device', 'BEKEM 36-Button Line Expansion Module', 'BlackBerry MVS VoWifi', 'CKEM 36-Button Line Expansion Module', 'CP-8800-Audio 28-Button Key Expansion Module', 'CP-8800-Video 28-Button Key Expansion Module', 'CTI Port', 'CTI Remote Device', 'CTI Route Point', 'Carrier-integrated Mobile', 'Cisco 12 S', 'Cisco 12 SP', 'Cisco 12 SP+', 'Cisco 30 SP+', 'Cisco 30 VIP', 'Cisco 3905', 'Cisco 3911', 'Cisco 3951', 'Cisco 6901', 'Cisco 6911', 'Cisco 6921', 'Cisco 6941', 'Cisco 6945', 'Cisco 6961', 'Cisco 7811', 'Cisco 7821', 'Cisco 7832', 'Cisco 7841', 'Cisco 7861', 'Cisco 7902', 'Cisco 7905', 'Cisco 7906', 'Cisco 7910', 'Cisco 7911', 'Cisco 7912', 'Cisco 7920', 'Cisco 7921', 'Cisco 7925', 'Cisco 7926', 'Cisco 7931', 'Cisco 7935', 'Cisco 7936', 'Cisco 7937', 'Cisco 7940', 'Cisco 7941', 'Cisco 7941G-GE', 'Cisco 7942', 'Cisco 7945', 'Cisco 7960', 'Cisco 7961', 'Cisco 7961G-GE', 'Cisco 7962', 'Cisco 7965', 'Cisco 7970', 'Cisco 7971', 'Cisco 7975', 'Cisco 7985', 'Cisco 8811', 'Cisco 8821', 'Cisco 8831', 'Cisco 8832', 'Cisco 8832NR', 'Cisco 8841', 'Cisco 8845', 'Cisco 8851', 'Cisco 8851NR', 'Cisco 8861', 'Cisco 8865', 'Cisco 8865NR', 'Cisco 8941', 'Cisco 8945', 'Cisco 8961', 'Cisco 9951', 'Cisco 9971', 'Cisco ATA 186', 'Cisco ATA 187', 'Cisco ATA 190', 'Cisco ATA 191', 'Cisco Cius SP', 'Cisco Cius', 'Cisco Collaboration Mobile Convergence', 'Cisco Conference Bridge (WS-SVC-CMM)', 'Cisco DX650', 'Cisco DX70', 'Cisco DX80', 'Cisco Dual Mode for Android', 'Cisco Dual Mode for iPhone', 'Cisco E20', 'Cisco IOS Conference Bridge (HDV2)', 'Cisco IOS Guaranteed Audio Video Conference Bridge', 'Cisco IOS Heterogeneous Video Conference Bridge', 'Cisco IOS Homogeneous Video Conference Bridge', 'Cisco IOS Media Termination Point (HDV2)', 'Cisco IOS Software Media Termination Point (HDV2)', 'Cisco IP Communicator', 'Cisco Jabber for Tablet', 'Cisco Media Server (WS-SVC-CMM-MS)', 'Cisco Media Termination Point (WS-SVC-CMM)', 'Cisco Meeting Server', 'Cisco Spark Remote Device', 'Cisco TelePresence 1000', 'Cisco TelePresence 1100', 'Cisco TelePresence 1300-47', 'Cisco TelePresence 1300-65', 'Cisco TelePresence 200', 'Cisco TelePresence 3000', 'Cisco TelePresence 3200', 'Cisco TelePresence 400', 'Cisco TelePresence 500-32', 'Cisco TelePresence 500-37', 'Cisco TelePresence Codec C40', 'Cisco TelePresence Codec C60', 'Cisco TelePresence Codec C90', 'Cisco TelePresence Conductor', 'Cisco TelePresence DX70', 'Cisco TelePresence EX60', 'Cisco TelePresence EX90', 'Cisco TelePresence Exchange System', 'Cisco TelePresence IX5000', 'Cisco TelePresence MCU', 'Cisco TelePresence MX200 G2', 'Cisco TelePresence MX200', 'Cisco TelePresence MX300 G2', 'Cisco TelePresence MX300', 'Cisco TelePresence MX700', 'Cisco TelePresence MX800 Dual', 'Cisco TelePresence MX800', 'Cisco TelePresence Profile 42 (C20)', 'Cisco TelePresence Profile 42 (C40)', 'Cisco TelePresence Profile 42 (C60)', 'Cisco TelePresence Profile 52 (C40)', 'Cisco TelePresence Profile 52 (C60)', 'Cisco TelePresence Profile 52 Dual (C60)', 'Cisco TelePresence Profile 65 (C60)', 'Cisco TelePresence Profile 65 Dual (C90)', 'Cisco TelePresence Quick Set C20', 'Cisco TelePresence SX10', 'Cisco TelePresence SX20', 'Cisco TelePresence SX80', 'Cisco TelePresence TX1310-65', 'Cisco TelePresence TX9000', 'Cisco TelePresence TX9200', 'Cisco TelePresence', 'Cisco Unified Client Services Framework', 'Cisco Unified Communications for RTX', 'Cisco Unified Mobile Communicator', 'Cisco Unified Personal Communicator', 'Cisco VGC Phone', 'Cisco VGC Virtual Phone', 'Cisco VXC 6215', 'Cisco Video Conference Bridge (IPVC-35xx)', 'Cisco Webex DX80', 'Cisco Webex Room 55 Dual', 'Cisco Webex Room 55', 'Cisco Webex Room 70 Dual G2', 'Cisco Webex Room 70 Dual', 'Cisco Webex Room 70 Single G2', 'Cisco Webex Room 70 Single', 'Cisco Webex Room Kit Mini', 'Cisco Webex Room Kit Plus', 'Cisco Webex Room Kit Pro', 'Cisco Webex Room Kit', 'Conference Bridge WS-X6608', 'Conference Bridge', 'Device Pilot', 'Digital Access WS-X6608', 'Digital Access', 'Digital Access+', 'EMCC Base Phone', 'GateKeeper', 'Generic Desktop Video Endpoint', 'Generic Multiple Screen Room System', 'Generic Single Screen Room System', 'H.323 Gateway', 'H.323 Phone', 'IMS-integrated Mobile (Basic)', 'IP-STE', 'ISDN BRI Phone', 'Interactive Voice Response', 'Load Simulator', 'MGCP Station', 'MGCP Trunk', 'Media Termination Point Hardware', 'Media Termination Point', 'Motorola CN622', 'Music On Hold', 'Nokia S60', 'Remote Destination Profile', 'Route List', 'SCCP Phone', 'SCCP gateway virtual phone', 'SIP Gateway', 'SIP Trunk', 'SPA8800', 'Third-party AS-SIP Endpoint', 'Third-party SIP Device (Advanced)', 'Third-party SIP Device (Basic)', 'Tone Announcement Player', 'Transnova S3', 'Trunk', 'Universal Device Template', 'Unknown MGCP Gateway', 'Unknown', 'Usage Profile', 'VGC Gateway', 'VKEM 36-Button Line Expansion Module', 'Voice Mail Port', 'WSM Trunk'}),
+    'XMonthOfYear': frozenset({'Apr', 'Aug', 'Dec', 'Feb', 'Jan', 'Jul', 'Jun', 'Mar', 'May', 'None', 'Nov', 'Oct', 'Sep'}),
+    'XNSFService': frozenset({'ACCUNET Switched Digital Service', 'Billing Number Only', 'Billing Number Preferred', 'Calling Party Number Only', 'Calling Party Number Preferred', 'Foreign Exchange Selection', 'Foreign Exchange', 'InterLATAOUTWATS', 'International Long Distance Service', 'IntraLATAOUTWATS', 'Long Distance Service', 'MEGACOM Telecom Service', 'National ISDN Banded OUTWATS', 'National ISDN Unbanded OUTWATS', 'OUTWATS Selection', 'Private Selection', 'Private', 'Software Defined Network', 'Tie Trunk (Cut-through)', 'Tie Trunk (Senderized)', 'Tie Trunk Selection (Cut-through)', 'Tie Trunk Selection (Senderized)', 'WATS Band Selection', 'WATS Maximal Subscribed Band'}),
+    'XNetworkLocation': frozenset({'OffNet', 'OnNet', 'Use System Default'}),
+    'XNodeUsage': frozenset({'Publisher', 'Subscriber'}),
+    'XNumberingPlan': frozenset({'Cisco CallManager', 'ISDN', 'National Standard', 'Private', 'Unknown'}),
+    'XOnboardingRegistrationStatus': frozenset({'Onboarding completed', 'Onboarding pending', 'Voucher Details unavailable'}),
+    'XOperator': frozenset({'==', 'DOES-NOT-EXIST', 'EXISTS', 'NOT-SELECTED'}),
+    'XOutboundCallRollover': frozenset({'No Rollover', 'Rollover Within Same DN', 'Rollover to any line'}),
+    'XPRIChanIE': frozenset({'Continuous Number', 'Slotmap', 'Timeslot Number', 'Use Number when 1B'}),
+    'XPacketCaptureMode': frozenset({'Batch Processing Mode', 'None'}),
+    'XParam': frozenset({'any digit', 'boolean', 'date/time', 'digits', 'double', 'long', 'more digits', 'string', 'terminating', 'timeout'}),
+    'XPartitionUsage': frozenset({'Call Control Discovery Learned Pattern', 'Directory URI', 'General', 'Intercom'}),
+    'XPatternPrecedence': frozenset({'Default', 'Executive Override', 'Flash Override', 'Flash', 'Immediate', 'Priority', 'Routine'}),
+    'XPatternRouteClass': frozenset({'Data', 'Default', 'Hotline Data', 'Hotline Voice', 'Satellite Avoidance', 'Voice'}),
+    'XPatternUsage': frozenset({'Alternate Number', 'Call Control Discovery Learned Pattern', 'Call Pick Up Group', 'CallPark', 'Called Party Number Transformation', 'Centralized Conference Number', 'Conference', 'Device Intercom Template', 'Device Intercom', 'Device template', 'Device', 'Directed Call Park', 'Domain Routing', 'Emergency Location ID Number', 'Hunt Pilot', 'ILS Imported E164 Number', 'ILS Learned E164 Number', 'ILS Learned E164 Numeric Pattern', 'ILS Learned Enterprise Number', 'ILS Learned Enterprise Numeric Pattern', 'ILS Learned PSTN Failover Rule', 'ILS Learned URI', 'IPAddress Routing', 'Message Waiting', 'Mobility Enterprise Feature Access', 'Mobility Handoff', 'Mobility IVR', 'Route', 'Translation Calling Party Number', 'Translation Intercom', 'Translation', 'Uri Routing', 'Voice Mail Port'}),
+    'XPhonePersonalization': frozenset({'Default', 'Disabled', 'Enabled', 'HTTPS Only'}),
+    'XPhoneService': frozenset({'Directories', 'Messages', 'Standard IP Phone Service'}),
+    'XPhoneServiceCategory': frozenset({'Android APK', 'Java MIDlet', 'Web Link', 'Web Widget', 'XML Service'}),
+    'XPhoneServiceDisplay': frozenset({'Both', 'Default', 'External URL', 'Internal'}),
+    'XPickupNotification': frozenset({'Audio Alert', 'Audio and Visual Alert', 'No Alert', 'Visual Alert'}),
+    'XPreemption': frozenset({'Default', 'Disabled', 'Forceful'}),
+    'XPreferredMediaSource': frozenset({'Gateway Preferred', 'Phone Preferred'}),
+    'XPresentationBit': frozenset({'Allowed', 'Default', 'Restricted'}),
+    'XPriOfNumber': frozenset({'Cisco CallManager', 'International', 'National', 'Subscriber', 'Unknown'}),
+    'XPriProtocol': frozenset({'PRI 4ESS', 'PRI 5E8 CUSTOM', 'PRI 5E8 INTECOME', 'PRI 5E8 TELEOS', 'PRI 5E8', 'PRI 5E9', 'PRI AUSTRALIAN', 'PRI DMS-100', 'PRI DMS-250', 'PRI ETSI SC', 'PRI EURO', 'PRI ISO QSIG E1', 'PRI ISO QSIG T1', 'PRI NI2', 'PRI NTT'}),
+    'XProcessNodeRole': frozenset({'CUCM IM and Presence', 'CUCM Voice/Video'}),
+    'XProduct': frozenset({'7914 14-Button Line Expansion Module', '7915 12-Button Line Expansion Module', '7915 24-Button Line Expansion Module', '7916 12-Button Line Expansion Module', '7916 24-Button Line Expansion Module', 'AIM-VOICE-30', 'Analog Phone', 'Annunciator', 'BEKEM 36-Button Line Expansion Module', 'C881V', 'C887VA-V', 'CKEM 36-Button Line Expansion Module', 'CP-8800-Audio 28-Button Key Expansion Module', 'CP-8800-Video 28-Button Key Expansion Module', 'CTI Port', 'CTI Remote Device', 'CTI Route Point', 'Carrier-integrated Mobile', 'Cisco  IAD2400', 'Cisco 12 S', 'Cisco 12 SP', 'Cisco 12 SP+', 'Cisco 1751', 'Cisco 1760', 'Cisco 1861', 'Cisco 269X', 'Cisco 26XX', 'Cisco 2801', 'Cisco 2811', 'Cisco 2821', 'Cisco 2851', 'Cisco 2901', 'Cisco 2911', 'Cisco 2921', 'Cisco 2951', 'Cisco 30 SP+', 'Cisco 30 VIP', 'Cisco 362X', 'Cisco 364X', 'Cisco 366X', 'Cisco 3725', 'Cisco 3745', 'Cisco 3825', 'Cisco 3845', 'Cisco 3905', 'Cisco 3911', 'Cisco 3925', 'Cisco 3925E', 'Cisco 3945', 'Cisco 3945E', 'Cisco 3951', 'Cisco 6901', 'Cisco 6911', 'Cisco 6921', 'Cisco 6941', 'Cisco 6945', 'Cisco 6961', 'Cisco 7811', 'Cisco 7821', 'Cisco 7832', 'Cisco 7841', 'Cisco 7861', 'Cisco 7902', 'Cisco 7905', 'Cisco 7906', 'Cisco 7910', 'Cisco 7911', 'Cisco 7912', 'Cisco 7920', 'Cisco 7921', 'Cisco 7925', 'Cisco 7926', 'Cisco 7931', 'Cisco 7935', 'Cisco 7936', 'Cisco 7937', 'Cisco 7940', 'Cisco 7941', 'Cisco 7941G-GE', 'Cisco 7942', 'Cisco 7945', 'Cisco 7960', 'Cisco 7961', 'Cisco 7961G-GE', 'Cisco 7962', 'Cisco 7965', 'Cisco 7970', 'Cisco 7971', 'Cisco 7975', 'Cisco 7985', 'Cisco 881', 'Cisco 8811', 'Cisco 8821', 'Cisco 8831', 'Cisco 8832', 'Cisco 8832NR', 'Cisco 8841', 'Cisco 8845', 'Cisco 8851', 'Cisco 8851NR', 'Cisco 8861', 'Cisco 8865', 'Cisco 8865NR', 'Cisco 888/887/886', 'Cisco 8941', 'Cisco 8945', 'Cisco 8961', 'Cisco 9951', 'Cisco 9971', 'Cisco ATA 186', 'Cisco ATA 187', 'Cisco ATA 190', 'Cisco ATA 191', 'Cisco Catalyst 4000 Access Gateway  Module', 'Cisco Catalyst 4224 Voice Gateway Switch', 'Cisco Catalyst 6000 12 port FXO Gateway', 'Cisco Catalyst 6000 24 port FXS Gateway', 'Cisco Catalyst 6000 E1 VoIP Gateway', 'Cisco Catalyst 6000 T1 VoIP Gateway', 'Cisco Cius SP', 'Cisco Cius', 'Cisco Collaboration Mobile Convergence', 'Cisco Conference Bridge (WS-SVC-CMM)', 'Cisco Conference Bridge Hardware', 'Cisco Conference Bridge Software', 'Cisco DX650', 'Cisco DX70', 'Cisco DX80', 'Cisco Dual Mode for Android', 'Cisco Dual Mode for iPhone', 'Cisco E20', 'Cisco ENCS 5400 ISRV', 'Cisco IOS Conference Bridge', 'Cisco IOS Enhanced Conference Bridge', 'Cisco IOS Enhanced Media Termination Point', 'Cisco IOS Enhanced Software Media Termination Point', 'Cisco IOS Guaranteed Audio Video Conference Bridge', 'Cisco IOS Heterogeneous Video Conference Bridge', 'Cisco IOS Homogeneous Video Conference Bridge', 'Cisco IOS Media Termination Point', 'Cisco IP Communicator', 'Cisco ISR 4321', 'Cisco ISR 4331', 'Cisco ISR 4351', 'Cisco ISR 4431', 'Cisco ISR 4451', 'Cisco ISR 4461', 'Cisco Jabber for Tablet', 'Cisco MGCP BRI Port', 'Cisco MGCP E1 Port', 'Cisco MGCP FXO Port', 'Cisco MGCP FXS Port', 'Cisco MGCP T1 Port', 'Cisco Media Server (WS-SVC-CMM-MS)', 'Cisco Media Termination Point (WS-SVC-CMM)', 'Cisco Media Termination Point Hardware', 'Cisco Media Termination Point Software', 'Cisco Meeting Server', 'Cisco Spark Remote Device', 'Cisco TelePresence 1000', 'Cisco TelePresence 1100', 'Cisco TelePresence 1300-47', 'Cisco TelePresence 1300-65', 'Cisco TelePresence 200', 'Cisco TelePresence 3000', 'Cisco TelePresence 3200', 'Cisco TelePresence 400', 'Cisco TelePresence 500-32', 'Cisco TelePresence 500-37', 'Cisco TelePresence Codec C40', 'Cisco TelePresence Codec C60', 'Cisco TelePresence Codec C90', 'Cisco TelePresence Conductor', 'Cisco TelePresence DX70', 'Cisco TelePresence EX60', 'Cisco TelePresence EX90', 'Cisco TelePresence Exchange System', 'Cisco TelePresence IX5000', 'Cisco TelePresence MCU', 'Cisco TelePresence MX200 G2', 'Cisco TelePresence MX200', 'Cisco TelePresence MX300 G2', 'Cisco TelePresence MX300', 'Cisco TelePresence MX700', 'Cisco TelePresence MX800 Dual', 'Cisco TelePresence MX800', 'Cisco TelePresence Profile 42 (C20)', 'Cisco TelePresence Profile 42 (C40)', 'Cisco TelePresence Profile 42 (C60)', 'Cisco TelePresence Profile 52 (C40)', 'Cisco TelePresence Profile 52 (C60)', 'Cisco TelePresence Profile 52 Dual (C60)', 'Cisco TelePresence Profile 65 (C60)', 'Cisco TelePresence Profile 65 Dual (C90)', 'Cisco TelePresence Quick Set C20', 'Cisco TelePresence SX10', 'Cisco TelePresence SX20', 'Cisco TelePresence SX80', 'Cisco TelePresence TX1310-65', 'Cisco TelePresence TX9000', 'Cisco TelePresence TX9200', 'Cisco TelePresence', 'Cisco Unified Client Services Framework', 'Cisco Unified Communications for RTX', 'Cisco Unified Mobile Communicator', 'Cisco Unified Personal Communicator', 'Cisco VG200', 'Cisco VG248 Gateway', 'Cisco VGC Phone', 'Cisco VGC Virtual Phone', 'Cisco VGD-1T3', 'Cisco VXC 6215', 'Cisco Video Conference Bridge(IPVC-35xx)', 'Cisco Voice Mail Port', 'Cisco Webex DX80', 'Cisco Webex Room 55 Dual', 'Cisco Webex Room 55', 'Cisco Webex Room 70 Dual G2', 'Cisco Webex Room 70 Dual', 'Cisco Webex Room 70 Single G2', 'Cisco Webex Room 70 Single', 'Cisco Webex Room Kit Mini', 'Cisco Webex Room Kit Plus', 'Cisco Webex Room Kit Pro', 'Cisco Webex Room Kit', 'Communication Media Module', 'EMCC Base Phone', 'FLEX_SLOT', 'Gatekeeper', 'Generic Desktop Video Endpoint', 'Generic Multiple Screen Room System', 'Generic Single Screen Room System', 'H.225 Trunk (Gatekeeper Controlled)', 'H.323 Client', 'H.323 Gateway', 'Hunt List', 'IAD2400_ANALOG', 'IAD2400_DIGITAL', 'IMS-integrated Mobile (Basic)', 'IP-STE', 'ISDN BRI Phone', 'Inter-Cluster Trunk (Gatekeeper Controlled)', 'Inter-Cluster Trunk (Non-Gatekeeper Controlled)', 'Interactive Voice Response', 'Load Simulator', 'Motorola CN622', 'Music On Hold', 'NM-1V', 'NM-2V', 'NM-4VWIC-MBRD', 'NM-HD-1V', 'NM-HD-2V', 'NM-HD-2VE', 'NM-HDA', 'NM-HDV', 'NM-HDV2-0PORT', 'NM-HDV2-1PORT', 'NM-HDV2-2PORT', 'Nokia S60', 'PA-MCX', 'PA-VXA', 'PA-VXB', 'PA-VXC', 'Pilot', 'Remote Destination Profile', 'Route List', 'SCCP Device', 'SCCP gateway virtual phone', 'SIP Trunk', 'SIP WSM Connection', 'SPA8800', 'Third-party AS-SIP Endpoint', 'Third-party SIP Device (Advanced)', 'Third-party SIP Device (Basic)', 'Transnova S3', 'Universal Device Template', 'Unknown', 'VG202', 'VG204', 'VG224', 'VG310', 'VG320', 'VG350', 'VG400', 'VG450', 'VGC Port', 'VIC_SLOT', 'VKEM 36-Button Line Expansion Module', 'VNM-HDA', 'VWIC_SLOT', 'WS-SVC-CMM-MS', 'WS-X6600'}),
+    'XProtocolSide': frozenset({'Network', 'User'}),
+    'XQSIGVariant': frozenset({'ECMA', 'ISO', 'No Changes'}),
+    'XRSVPOverSIP': frozenset({'E2E', 'Local RSVP'}),
+    'XRecordingFlag': frozenset({'Automatic Call Recording Enabled', 'Call Recording Disabled', 'Selective Call Recording Enabled'}),
+    'XReleaseCauseValue': frozenset({'Call Rejected', 'Invalid Number Format', 'No Error', 'Number Changed', 'Precedence Level Exceeded', 'Unallocated Number'}),
+    'XReset': frozenset({'Apply Configuration', 'Reset', 'Restart'}),
+    'XRevertPriority': frozenset({'Default', 'Highest'}),
+    'XRingSetting': frozenset({'Beep Only', 'Disable', 'Flash Only', 'Ring Once', 'Ring', 'Use System Default'}),
+    'XSIPBandwidthModifier': frozenset({'AS only', 'CT only', 'TIAS and AS', 'TIAS only'}),
+    'XSIPCodec': frozenset({'711alaw', '711ulaw', 'G729/G729a', 'G729b/G729ab'}),
+    'XSIPIdentityBlend': frozenset({'Deliver DN only in connected party', 'Deliver URI and DN in connected party, if available', 'Deliver URI only in connected party, if available'}),
+    'XSIPRel1XXOptions': frozenset({'Disabled', 'Send PRACK for all 1xx Messages', 'Send PRACK if 1xx Contains SDP'}),
+    'XSIPReroute': frozenset({'Call-Info Header with purpose=x-cisco-origIP', 'Contact Header', 'Never'}),
+    'XSIPScriptErrorHandling': frozenset({'Disable Script', 'Message Rollback Only', 'Reset Script', 'Reset Trunk / Restart Device'}),
+    'XSIPTrunkCallLegSecurity': frozenset({'When using both sRTP and TLS', 'When using sRTP Only'}),
+    'XSNMPAuthenticationProtocol': frozenset({'MD5', 'SHA'}),
+    'XSNMPPrivacyProtocol': frozenset({'AES-128', 'DES'}),
+    'XSNMPVersion': frozenset({'1', '2C', '3'}),
+    'XScheduleUnit': frozenset({'DAY', 'HOUR', 'MONTH', 'WEEK'}),
+    'XServerSecurityMode': frozenset({'Authenticated', 'Encrypted and Authenticated'}),
+    'XService': frozenset({'Cisco AMC Service', 'Cisco AXL Web Service', 'Cisco Audit Event Service', 'Cisco Bulk Provisioning Service', 'Cisco CAR Scheduler', 'Cisco CAR Web Service', 'Cisco CCM DBL Web Library', 'Cisco CCM NCS Web Library', 'Cisco CCM PD Web Service', 'Cisco CCMAdmin Web Service', 'Cisco CCMRealm Web Service', 'Cisco CCMService Web Service', 'Cisco CCMUser Web Service', 'Cisco CDR Agent', 'Cisco CDR Repository Manager', 'Cisco CTIManager', 'Cisco CTL Provider', 'Cisco CallManager Cisco IP Phone Services', 'Cisco CallManager SNMP Service', 'Cisco CallManager', 'Cisco Certificate Authority Proxy Function', 'Cisco Certificate Change Notification Service', 'Cisco Certificate Enrollment Service', 'Cisco Change Credential Application', 'Cisco Client Profile Agent', 'Cisco Common User Interface', 'Cisco Config Agent', 'Cisco CtlCli', 'Cisco DHCP Monitor Service', 'Cisco DRF Local', 'Cisco DRF Master', 'Cisco Database Layer Monitor', 'Cisco Device Activation Service', 'Cisco Dialed Number Analyzer Server', 'Cisco Dialed Number Analyzer', 'Cisco DirSync', 'Cisco Directory Number Alias Lookup', 'Cisco Directory Number Alias Sync', 'Cisco E911 Service', 'Cisco Extended Functions', 'Cisco Extension Mobility Application', 'Cisco Extension Mobility', 'Cisco External Call Control Service', 'Cisco GRT Communication Web Service', 'Cisco IM and Presence Admin', 'Cisco IM and Presence Data Monitor', 'Cisco IP Manager Assistant', 'Cisco IP Voice Media Streaming App', 'Cisco Intercluster Lookup Service', 'Cisco Intercluster Sync Agent', 'Cisco License Manager', 'Cisco Location Bandwidth Manager', 'Cisco Log Partition Monitoring Tool', 'Cisco Login Datastore', 'Cisco Management Agent Service', 'Cisco Messaging Interface', 'Cisco OAM Agent', 'Cisco Presence Datastore', 'Cisco Presence Engine', 'Cisco Push Notification Service', 'Cisco RCC Device Selection Service', 'Cisco RIS Data Collector', 'Cisco RTMT Web Service', 'Cisco RisBean Library', 'Cisco Role-based Security', 'Cisco Route Datastore', 'Cisco SIP Proxy Logger', 'Cisco SIP Proxy', 'Cisco SIP Registration Datastore', 'Cisco SOAP - CDRonDemand Service', 'Cisco SOAP Web Service', 'Cisco SOAPMessage Service', 'Cisco Security Agent', 'Cisco Server Recovery Manager', 'Cisco Serviceability Reporter', 'Cisco Smart License Manager', 'Cisco Sync Agent', 'Cisco TAPS Service', 'Cisco Tftp', 'Cisco Tomcat', 'Cisco Trace Collection Service', 'Cisco Trust Verification Service', 'Cisco UXL Web Service', 'Cisco Unified Mobile Voice Access Service', 'Cisco Unified OS Admin Web Service', 'Cisco Unified Reporting Web Service', 'Cisco Upgrade Agent Service', 'Cisco User Data Services', 'Cisco WebDialer Web Service', 'Cisco Wireless Controller Synchronization Service', 'Cisco XCP Authentication Service', 'Cisco XCP Config Manager', 'Cisco XCP Connection Manager', 'Cisco XCP Directory Service', 'Cisco XCP File Transfer Manager', 'Cisco XCP Message Archiver', 'Cisco XCP Router', 'Cisco XCP SIP Federation Connection Manager', 'Cisco XCP Text Conference Manager', 'Cisco XCP Web Connection Manager', 'Cisco XCP XMPP Federation Connection Manager', 'Enterprise Wide', 'Platform Administrative Web Service', 'Platform Communication Web Service', 'SOAP - Diagnostic Portal Database Service', 'Self Provisioning IVR'}),
+    'XServiceGrouping': frozenset({'Backup and Restore Services', 'CDR Services', 'CM Services', 'CTI Services', 'Cloud based Management Services', 'Database and Admin Services', 'Directory Services', 'IM and Presence Services', 'Location based Tracking Services', 'Performance and Monitoring Services', 'Platform Services', 'Security Services', 'Soap Services', 'System Services', 'Voice Quality Reporter Services'}),
+    'XSilenceSuppressionThreshold': frozenset({'-30dbm0', '-33dbm0', '-36dbm0', '-39dbm0', '-42dbm0', '-45dbm0', '-48dbm0', 'Disable'}),
+    'XSipAssertedType': frozenset({'Default', 'PAI', 'PPI'}),
+    'XSipPrivacy': frozenset({'Default', 'ID Critical', 'ID', 'None'}),
+    'XSipSessionRefreshMethod': frozenset({'Invite', 'Update'}),
+    'XStartDialProtocol': frozenset({'Delay Dial', 'Immediate', 'Not Set', 'Wink Start Feature Group B', 'Wink Start Feature Group D'}),
+    'XStatus': frozenset({'Default', 'Off', 'On'}),
+    'XSyncStatus': frozenset({'Cancelled', 'Failure', 'In Process', 'Never Synced', 'Pending', 'Success'}),
+    'XTelnetLevel': frozenset({'Disabled', 'Enabled', 'Limited'}),
+    'XTerminal': frozenset({'-- Not Selected --', 'Gateway', 'Terminal'}),
+    'XTimeOfDay': frozenset({'00:00', '00:15', '00:30', '00:45', '01:00', '01:15', '01:30', '01:45', '02:00', '02:15', '02:30', '02:45', '03:00', '03:15', '03:30', '03:45', '04:00', '04:15', '04:30', '04:45', '05:00', '05:15', '05:30', '05:45', '06:00', '06:15', '06:30', '06:45', '07:00', '07:15', '07:30', '07:45', '08:00', '08:15', '08:30', '08:45', '09:00', '09:15', '09:30', '09:45', '10:00', '10:15', '10:30', '10:45', '11:00', '11:15', '11:30', '11:45', '12:00', '12:15', '12:30', '12:45', '13:00', '13:15', '13:30', '13:45', '14:00', '14:15', '14:30', '14:45', '15:00', '15:15', '15:30', '15:45', '16:00', '16:15', '16:30', '16:45', '17:00', '17:15', '17:30', '17:45', '18:00', '18:15', '18:30', '18:45', '19:00', '19:15', '19:30', '19:45', '20:00', '20:15', '20:30', '20:45', '21:00', '21:15', '21:30', '21:45', '22:00', '22:15', '22:30', '22:45', '23:00', '23:15', '23:30', '23:45', '24:00', 'No Office Hours'}),
+    'XTimeScheduleCategory': frozenset({'Holiday or Vacation', 'Regular'}),
+    'XTimeZone': frozenset({'Africa/Abidjan', 'Africa/Accra', 'Africa/Addis_Ababa', 'Africa/Algiers', 'Africa/Asmara', 'Africa/Bamako', 'Africa/Bangui', 'Africa/Banjul', 'Africa/Bissau', 'Africa/Blantyre', 'Africa/Brazzaville', 'Africa/Bujumbura', 'Africa/Cairo', 'Africa/Casablanca', 'Africa/Ceuta', 'Africa/Conakry', 'Africa/Dakar', 'Africa/Dar_es_Salaam', 'Africa/Djibouti', 'Africa/Douala', 'Africa/El_Aaiun', 'Africa/Freetown', 'Africa/Gaborone', 'Africa/Harare', 'Africa/Johannesburg', 'Africa/Juba', 'Africa/Kampala', 'Africa/Khartoum', 'Africa/Kigali', 'Africa/Kinshasa', 'Africa/Lagos', 'Africa/Libreville', 'Africa/Lome', 'Africa/Luanda', 'Africa/Lubumbashi', 'Africa/Lusaka', 'Africa/Malabo', 'Africa/Maputo', 'Africa/Maseru', 'Africa/Mbabane', 'Africa/Mogadishu', 'Africa/Monrovia', 'Africa/Nairobi', 'Africa/Ndjamena', 'Africa/Niamey', 'Africa/Nouakchott', 'Africa/Ouagadougou', 'Africa/Porto-Novo', 'Africa/Sao_Tome', 'Africa/Tripoli', 'Africa/Tunis', 'Africa/Windhoek', 'America/Adak', 'America/Anchorage', 'America/Anguilla', 'America/Antigua', 'America/Araguaina', 'America/Argentina/Buenos_Aires', 'America/Argentina/Catamarca', 'America/Argentina/Cordoba', 'America/Argentina/Jujuy', 'America/Argentina/La_Rioja', 'America/Argentina/Mendoza', 'America/Argentina/Rio_Gallegos', 'America/Argentina/Salta', 'America/Argentina/San_Juan', 'America/Argentina/San_Luis', 'America/Argentina/Tucuman', 'America/Argentina/Ushuaia', 'America/Aruba', 'America/Asuncion', 'America/Atikokan', 'America/Bahia', 'America/Bahia_Banderas', 'America/Barbados', 'America/Belem', 'America/Belize', 'America/Blanc-Sablon', 'America/Boa_Vista', 'America/Bogota', 'America/Boise', 'America/Cambridge_Bay', 'America/Campo_Grande', 'America/Cancun', 'America/Caracas', 'America/Cayenne', 'America/Cayman', 'America/Chicago', 'America/Chihuahua', 'America/Costa_Rica', 'America/Creston', 'America/Cuiaba', 'America/Curacao', 'America/Danmarkshavn', 'America/Dawson', 'America/Dawson_Creek', 'America/Denver', 'America/Detroit', 'America/Dominica', 'America/Edmonton', 'America/Eirunepe', 'America/El_Salvador', 'America/Fortaleza', 'America/Glace_Bay', 'America/Godthab', 'America/Goose_Bay', 'America/Grand_Turk', 'America/Grenada', 'America/Guadeloupe', 'America/Guatemala', 'America/Guayaquil', 'America/Guyana', 'America/Halifax', 'America/Havana', 'America/Hermosillo', 'America/Indiana/Indianapolis', 'America/Indiana/Knox', 'America/Indiana/Marengo', 'America/Indiana/Petersburg', 'America/Indiana/Tell_City', 'America/Indiana/Vevay', 'America/Indiana/Vincennes', 'America/Indiana/Winamac', 'America/Inuvik', 'America/Iqaluit', 'America/Jamaica', 'America/Juneau', 'America/Kentucky/Louisville', 'America/Kentucky/Monticello', 'America/Kralendijk', 'America/La_Paz', 'America/Lima', 'America/Los_Angeles', 'America/Lower_Princes', 'America/Maceio', 'America/Managua', 'America/Manaus', 'America/Marigot', 'America/Martinique', 'America/Matamoros', 'America/Mazatlan', 'America/Menominee', 'America/Merida', 'America/Metlakatla', 'America/Mexico_City', 'America/Miquelon', 'America/Moncton', 'America/Monterrey', 'America/Montevideo', 'America/Montreal', 'America/Montserrat', 'America/Nassau', 'America/New_York', 'America/Nipigon', 'America/Nome', 'America/Noronha', 'America/North_Dakota/Beulah', 'America/North_Dakota/Center', 'America/North_Dakota/New_Salem', 'America/Ojinaga', 'America/Panama', 'America/Pangnirtung', 'America/Paramaribo', 'America/Phoenix', 'America/Port-au-Prince', 'America/Port_of_Spain', 'America/Porto_Velho', 'America/Puerto_Rico', 'America/Rainy_River', 'America/Rankin_Inlet', 'America/Recife', 'America/Regina', 'America/Resolute', 'America/Rio_Branco', 'America/Santa_Isabel', 'America/Santarem', 'America/Santiago', 'America/Santo_Domingo', 'America/Sao_Paulo', 'America/Scoresbysund', 'America/Shiprock', 'America/Sitka', 'America/St_Barthelemy', 'America/St_Johns', 'America/St_Kitts', 'America/St_Lucia', 'America/St_Thomas', 'America/St_Vincent', 'America/Swift_Current', 'America/Tegucigalpa', 'America/Thule', 'America/Thunder_Bay', 'America/Tijuana', 'America/Toronto', 'America/Tortola', 'America/Vancouver', 'America/Whitehorse', 'America/Winnipeg', 'America/Yakutat', 'America/Yellowknife', 'Antarctica/Casey', 'Antarctica/Davis', 'Antarctica/DumontDUrville', 'Antarctica/Macquarie', 'Antarctica/Mawson', 'Antarctica/McMurdo', 'Antarctica/Palmer', 'Antarctica/Rothera', 'Antarctica/South_Pole', 'Antarctica/Syowa', 'Antarctica/Vostok', 'Arctic/Longyearbyen', 'Asia/Aden', 'Asia/Almaty', 'Asia/Amman', 'Asia/Anadyr', 'Asia/Aqtau', 'Asia/Aqtobe', 'Asia/Ashgabat', 'Asia/Baghdad', 'Asia/Bahrain', 'Asia/Baku', 'Asia/Bangkok', 'Asia/Beirut', 'Asia/Bishkek', 'Asia/Brunei', 'Asia/Choibalsan', 'Asia/Chongqing', 'Asia/Colombo', 'Asia/Damascus', 'Asia/Dhaka', 'Asia/Dili', 'Asia/Dubai', 'Asia/Dushanbe', 'Asia/Gaza', 'Asia/Harbin', 'Asia/Hebron', 'Asia/Ho_Chi_Minh', 'Asia/Hong_Kong', 'Asia/Hovd', 'Asia/Irkutsk', 'Asia/Istanbul', 'Asia/Jakarta', 'Asia/Jayapura', 'Asia/Jerusalem', 'Asia/Kabul', 'Asia/Kamchatka', 'Asia/Karachi', 'Asia/Kashgar', 'Asia/Kathmandu', 'Asia/Kolkata', 'Asia/Krasnoyarsk', 'Asia/Kuala_Lumpur', 'Asia/Kuching', 'Asia/Kuwait', 'Asia/Macau', 'Asia/Magadan', 'Asia/Makassar', 'Asia/Manila', 'Asia/Muscat', 'Asia/Nicosia', 'Asia/Novokuznetsk', 'Asia/Novosibirsk', 'Asia/Omsk', 'Asia/Oral', 'Asia/Phnom_Penh', 'Asia/Pontianak', 'Asia/Pyongyang', 'Asia/Qatar', 'Asia/Qyzylorda', 'Asia/Rangoon', 'Asia/Riyadh', 'Asia/Riyadh87', 'Asia/Riyadh88', 'Asia/Riyadh89', 'Asia/Sakhalin', 'Asia/Samarkand', 'Asia/Seoul', 'Asia/Shanghai', 'Asia/Singapore', 'Asia/Taipei', 'Asia/Tashkent', 'Asia/Tbilisi', 'Asia/Tehran', 'Asia/Thimphu', 'Asia/Tokyo', 'Asia/Ulaanbaatar', 'Asia/Urumqi', 'Asia/Vientiane', 'Asia/Vladivostok', 'Asia/Yakutsk', 'Asia/Yekaterinburg', 'Asia/Yerevan', 'Atlantic/Azores', 'Atlantic/Bermuda', 'Atlantic/Canary', 'Atlantic/Cape_Verde', 'Atlantic/Faroe', 'Atlantic/Madeira', 'Atlantic/Reykjavik', 'Atlantic/South_Georgia', 'Atlantic/St_Helena', 'Atlantic/Stanley', 'Australia/Adelaide', 'Australia/Brisbane', 'Australia/Broken_Hill', 'Australia/Currie', 'Australia/Darwin', 'Australia/Eucla', 'Australia/Hobart', 'Australia/Lindeman', 'Australia/Lord_Howe', 'Australia/Melbourne', 'Australia/Perth', 'Australia/Sydney', 'CET', 'CST6CDT', 'EET', 'EST', 'EST5EDT', 'Etc/GMT', 'Etc/GMT+0', 'Etc/GMT+1', 'Etc/GMT+10', 'Etc/GMT+11', 'Etc/GMT+12', 'Etc/GMT+2', 'Etc/GMT+3', 'Etc/GMT+4', 'Etc/GMT+5', 'Etc/GMT+6', 'Etc/GMT+7', 'Etc/GMT+8', 'Etc/GMT+9', 'Etc/GMT-0', 'Etc/GMT-1', 'Etc/GMT-10', 'Etc/GMT-11', 'Etc/GMT-12', 'Etc/GMT-13', 'Etc/GMT-14', 'Etc/GMT-2', 'Etc/GMT-3', 'Etc/GMT-4', 'Etc/GMT-5', 'Etc/GMT-6', 'Etc/GMT-7', 'Etc/GMT-8', 'Etc/GMT-9', 'Etc/GMT0', 'Etc/Greenwich', 'Etc/UCT', 'Etc/UTC', 'Etc/Universal', 'Etc/Zulu', 'Europe/Amsterdam', 'Europe/Andorra', 'Europe/Athens', 'Europe/Belgrade', 'Europe/Berlin', 'Europe/Bratislava', 'Europe/Brussels', 'Europe/Bucharest', 'Europe/Budapest', 'Europe/Chisinau', 'Europe/Copenhagen', 'Europe/Dublin', 'Europe/Gibraltar', 'Europe/Guernsey', 'Europe/Helsinki', 'Europe/Isle_of_Man', 'Europe/Istanbul', 'Europe/Jersey', 'Europe/Kaliningrad', 'Europe/Kiev', 'Europe/Lisbon', 'Europe/Ljubljana', 'Europe/London', 'Europe/Luxembourg', 'Europe/Madrid', 'Europe/Malta', 'Europe/Mariehamn', 'Europe/Minsk', 'Europe/Monaco', 'Europe/Moscow', 'Europe/Nicosia', 'Europe/Oslo', 'Europe/Paris', 'Europe/Podgorica', 'Europe/Prague', 'Europe/Riga', 'Europe/Rome', 'Europe/Samara', 'Europe/San_Marino', 'Europe/Sarajevo', 'Europe/Simferopol', 'Europe/Skopje', 'Europe/Sofia', 'Europe/Stockholm', 'Europe/Tallinn', 'Europe/Tirane', 'Europe/Uzhgorod', 'Europe/Vaduz', 'Europe/Vatican', 'Europe/Vienna', 'Europe/Vilnius', 'Europe/Volgograd', 'Europe/Warsaw', 'Europe/Zagreb', 'Europe/Zaporozhye', 'Europe/Zurich', 'HST', 'Indian/Antananarivo', 'Indian/Chagos', 'Indian/Christmas', 'Indian/Cocos', 'Indian/Comoro', 'Indian/Kerguelen', 'Indian/Mahe', 'Indian/Maldives', 'Indian/Mauritius', 'Indian/Mayotte', 'Indian/Reunion', 'MET', 'MST', 'MST7MDT', 'Mideast/Riyadh87', 'Mideast/Riyadh88', 'Mideast/Riyadh89', 'PST8PDT', 'Pacific/Apia', 'Pacific/Auckland', 'Pacific/Chatham', 'Pacific/Chuuk', 'Pacific/Easter', 'Pacific/Efate', 'Pacific/Enderbury', 'Pacific/Fakaofo', 'Pacific/Fiji', 'Pacific/Funafuti', 'Pacific/Galapagos', 'Pacific/Gambier', 'Pacific/Guadalcanal', 'Pacific/Guam', 'Pacific/Honolulu', 'Pacific/Johnston', 'Pacific/Kiritimati', 'Pacific/Kosrae', 'Pacific/Kwajalein', 'Pacific/Majuro', 'Pacific/Marquesas', 'Pacific/Midway', 'Pacific/Nauru', 'Pacific/Niue', 'Pacific/Norfolk', 'Pacific/Noumea', 'Pacific/Pago_Pago', 'Pacific/Palau', 'Pacific/Pitcairn', 'Pacific/Pohnpei', 'Pacific/Port_Moresby', 'Pacific/Rarotonga', 'Pacific/Saipan', 'Pacific/Tahiti', 'Pacific/Tarawa', 'Pacific/Tongatapu', 'Pacific/Wake', 'Pacific/Wallis', 'US/Pacific-New', 'WET'}),
+    'XTransport': frozenset({'TCP', 'TCP+UDP', 'TLS', 'UDP'}),
+    'XTrunk': frozenset({'DID', 'EANDM', 'Ground Start', 'Loop Start', 'POTS'}),
+    'XTrunkDirection': frozenset({'Bothways', 'Inbound', 'Outbound'}),
+    'XTrunkLevel': frozenset({'A/TO', 'A/TT', 'AAL(A)', 'AAL(D)', 'DAL', 'ICS', 'ISD/TT', 'IST', 'ONS', 'OPS', 'S/ATT', 'S/DTT'}),
+    'XTrunkPad': frozenset({'Minus10db', 'Minus11db', 'Minus12db', 'Minus13db', 'Minus14db', 'Minus15db', 'Minus16db', 'Minus17db', 'Minus18db', 'Minus19db', 'Minus1db', 'Minus20db', 'Minus21db', 'Minus22db', 'Minus23db', 'Minus24db', 'Minus25db', 'Minus26db', 'Minus27db', 'Minus28db', 'Minus29db', 'Minus2db', 'Minus30db', 'Minus31db', 'Minus32db', 'Minus3db', 'Minus4db', 'Minus5db', 'Minus6db', 'Minus7db', 'Minus8db', 'Minus9db', 'NoDbPadding', 'Plus10db', 'Plus11db', 'Plus12db', 'Plus13db', 'Plus14db', 'Plus15db', 'Plus16db', 'Plus17db', 'Plus18db', 'Plus19db', 'Plus1db', 'Plus20db', 'Plus21db', 'Plus22db', 'Plus23db', 'Plus24db', 'Plus25db', 'Plus26db', 'Plus27db', 'Plus28db', 'Plus29db', 'Plus2db', 'Plus30db', 'Plus31db', 'Plus32db', 'Plus3db', 'Plus4db', 'Plus5db', 'Plus6db', 'Plus7db', 'Plus8db', 'Plus9db'}),
+    'XTrunkSelectionOrder': frozenset({'Bottom Up', 'Top Down'}),
+    'XTrunkService': frozenset({'Call Control Discovery', 'Cisco Intercompany Media Engine', 'Extension Mobility Cross Cluster', 'IP Multimedia Subsystem Service Control (ISC)', 'None(Default)'}),
+    'XTrustReceivedIdentity': frozenset({'Trust All (Default)', 'Trust None', 'Trust PAI Only'}),
+    'XTrustRole': frozenset({'Application Server', 'Authentication and Authorization', 'CAPF', 'CallManager', 'CallManager-ECDSA', 'CallManagerTFTP', 'Certificate Authority', 'Data Service', 'Firewall', 'GDS-trust', 'Network Element', 'Provisioning Service', 'SAST', 'SRST', 'Serviceability', 'Signaling and Call Control', 'TFTP', 'Unknown', 'Virtual Private Network'}),
+    'XTunneledProtocol': frozenset({'None', 'QSIG'}),
+    'XUCProduct': frozenset({'CTI', 'Directory', 'Enhanced Directory', 'Exchange', 'Jabber', 'MeetingPlace Classic', 'MeetingPlace Express', 'Telepresence Management System', 'Unified CM (IM and Presence)', 'Unity Connection', 'Unity', 'WebEx (Conferencing)', 'WebEx (IM and Presence)'}),
+    'XUCService': frozenset({'CTI', 'Conferencing', 'Directory', 'IM and Presence', 'Jabber Client Configuration (jabber-config.xml)', 'MailStore', 'Video Conference Scheduling Portal', 'Voicemail'}),
+    'XURIDisambiguationPolicy': frozenset({'Always treat all dial strings as URI addresses', 'Phone number consists of characters 0-9, *, #, and + (others treated as URI addresses)', 'Phone number consists of characters 0-9, A-D, *, #, and + (others treated as URI addresses)'}),
+    'XUserAgentServerHeaderInfo': frozenset({'Pass Through Received Information as Contact Header Parameters', 'Pass Through Received Information as User-Agent and Server Header', 'Send Unified CM Version Information as User-Agent Header'}),
+    'XUserLocale': frozenset({'English United States'}),
+    'XV150SDPFilter': frozenset({'No Filtering', 'Remove MER V.150', 'Remove Pre-MER V.150', 'Use Default Filter'}),
+    'XVMAvoidancePolicy': frozenset({'Timer Control', 'Use System Default', 'User Control'}),
+    'XVPNClientAuthentication': frozenset({'Certificate', 'Password Only', 'User and Password'}),
+    'XVideoCallTrafficClass': frozenset({'Desktop', 'Immersive', 'Mixed'}),
+    'XViprFilterElement': frozenset({'Domain', 'Prefix'}),
+    'XWLANProfileChanges': frozenset({'Allowed', 'Disallowed', 'Restricted'}),
+    'XWebPageDisplay': frozenset({'Collapsed', 'Expanded', 'Hidden'}),
+    'XWebPageSection': frozenset({'+E.164 Alternate Number', 'Automatic Alternate Routing (AAR) Settings', 'Busy Lamp Field (BLF) Settings', 'Call Forward Settings', 'Device Routing Settings', 'Device Settings', 'Directory Number Settings', 'Do Not Disturb (DND) Settings', 'Enterprise Alternate Number', 'Hold Reversion Settings', 'IP Phone Services Subscription', 'Locale Settings', 'Location Settings', 'Multilevel Precedence Preemption (MLPP) Alternate Party Settings', 'Multilevel Precedence Preemption (MLPP) Settings', 'Music On Hold (MOH) Settings', 'Music on Hold Settings', 'PSTN Failover for Enterprise and +E.164 Alternate Number and URI Dialing', 'Park Monitoring Settings', 'Phone Buttons Configuration', 'Phone Settings', 'Protocol Settings', 'Required and Frequently Entered Settings', 'Security Settings', 'Service Configuration Settings', 'Troubleshooting Settings'}),
+    'XWiFiAuthenticationMethod': frozenset({'EAP-FAST', 'EAP-TLS', 'None', 'PEAP-GTC', 'PEAP-MSCHAPv2', 'PSK', 'WEP'}),
+    'XWiFiFrequency': frozenset({'2.4 GHz', '5 GHz', 'Auto'}),
+    'XYellowAlarm': frozenset({'Bit2', 'F-Bit'}),
+    'XZeroSuppression': frozenset({'AMI', 'B8ZS', 'HDB3'}),
+    'XZzdndcontrol': frozenset({'Admin', 'User'}),
+    'XZzdtmfDbLevel': frozenset({'3 dB above nominal', '3 dB below nominal', '6 dB above nominal', '6 dB below nominal', 'Nominal'}),
+    'XZzntpmode': frozenset({'Anycast', 'Directed Broadcast', 'Multicast', 'Unicast'}),
+    'XZzpreff': frozenset({'Off', 'On'}),
+    'XZzuserInfo': frozenset({'IP', 'None', 'Phone'}),
+}
+
+# Simple type -> ("any",) | ("union", specs) |
+#     ("restriction", base, values, pattern, max length, min, max)
+SIMPLE_TYPES = {
+    'ApplyConfigEnterpriseParametersRes.return': ('restriction', 'xsd:string', None, '(true)|(false)|(\\{........-....-....-....-............\\})', None, None, None),
+    'DoAuthenticateUserReq.pin': ('restriction', 'xsd:string', None, '\\d\\d\\d\\d+', None, None, None),
+    'DoEnterpriseParametersResetRes.return': ('restriction', 'xsd:string', None, '(true)|(false)|(\\{........-....-....-....-............\\})', None, None, None),
+    'DoServiceParametersResetRes.return': ('restriction', 'xsd:string', None, '(true)|(false)|(\\{........-....-....-....-............\\})', None, None, None),
+    'DoSmartEntitlementRequestRes.return': ('any',),
+    'DoSmartLicenseDeRegisterRes.return': ('any',),
+    'DoSmartLicenseReRegisterRes.return': ('any',),
+    'DoSmartLicenseRegisterRes.return': ('any',),
+    'DoSmartLicenseRenewAuthorizationRes.return': ('any',),
+    'DoSmartLicenseRenewRegistrationRes.return': ('any',),
+    'DoUpdateLicenseUsageRes.return': ('restriction', 'xsd:string', None, '(true)|(false)|(\\{........-....-....-....-............\\})', None, None, None),
+    'DoUpdateTransportSettingsRes.return': ('any',),
+    'GetSmartLicenseStatusRes.LicenseDetails.SmartLicensing': ('any',),
+    'GetSmartLicenseStatusRes.return': ('any',),
+    'GetTransportSettingsRes.return': ('any',),
+    'Name128': ('restriction', 'xsd:Name', None, None, 128, None, None),
+    'Name50': ('restriction', 'xsd:Name', None, None, 50, None, None),
+    'ResetEnterpriseParametersRes.return': ('restriction', 'xsd:string', None, '(true)|(false)|(\\{........-....-....-....-............\\})', None, None, None),
+    'RestartEnterpriseParametersRes.return': ('restriction', 'xsd:string', None, '(true)|(false)|(\\{........-....-....-....-............\\})', None, None, None),
+    'StandardResponse.return': ('restriction', 'xsd:string', None, '(true)|(false)|(\\{........-....-....-....-............\\})', None, None, None),
+    'String10': ('restriction', 'xsd:string', None, None, 10, None, None),
+    'String100': ('restriction', 'xsd:string', None, None, 100, None, None),
+    'String1024': ('restriction', 'xsd:string', None, None, 1024, None, None),
+    'String128': ('restriction', 'xsd:string', None, None, 128, None, None),
+    'String129': ('restriction', 'xsd:string', None, None, 129, None, None),
+    'String15': ('restriction', 'xsd:string', None, None, 15, None, None),
+    'String16': ('restriction', 'xsd:string', None, None, 16, None, None),
+    'String200': ('restriction', 'xsd:string', None, None, 200, None, None),
+    'String2048': ('restriction', 'xsd:string', None, None, 2048, None, None),
+    'String255': ('restriction', 'xsd:string', None, None, 255, None, None),
+    'String32': ('restriction', 'xsd:string', None, None, 32, None, None),
+    'String4096': ('restriction', 'xsd:string', None, None, 4096, None, None),
+    'String50': ('restriction', 'xsd:string', None, None, 50, None, None),
+    'String64': ('restriction', 'xsd:string', None, None, 64, None, None),
+    'String75': ('restriction', 'xsd:string', None, None, 75, None, None),
+    'UniqueName128': ('restriction', 'xsd:Name', None, None, 128, None, None),
+    'UniqueName50': ('restriction', 'xsd:Name', None, None, 50, None, None),
+    'UniqueString128': ('restriction', 'xsd:string', None, None, 128, None, None),
+    'UniqueString255': ('restriction', 'xsd:string', None, None, 255, None, None),
+    'UniqueString50': ('restriction', 'xsd:string', None, None, 50, None, None),
+    'XASN1RoseOidEncoding': ('restriction', 'xsd:string', ENUMS['XASN1RoseOidEncoding'], None, None, None, None),
+    'XAccountType': ('any',),
+    'XAlarmSeverity': ('restriction', 'xsd:string', ENUMS['XAlarmSeverity'], None, None, None, None),
+    'XAppServer': ('restriction', 'xsd:string', ENUMS['XAppServer'], None, None, None, None),
+    'XAppServerContent': ('restriction', 'xsd:string', ENUMS['XAppServerContent'], None, None, None, None),
+    'XAuthenticationMode': ('restriction', 'xsd:string', ENUMS['XAuthenticationMode'], None, None, None, None),
+    'XAuthenticationType': ('any',),
+    'XAutoAnswer': ('restriction', 'xsd:string', ENUMS['XAutoAnswer'], None, None, None, None),
+    'XBLFSDOption': ('restriction', 'xsd:string', ENUMS['XBLFSDOption'], None, None, None, None),
+    'XBarge': ('restriction', 'xsd:string', ENUMS['XBarge'], None, None, None, None),
+    'XBillingserverprotocol': ('restriction', 'xsd:string', ENUMS['XBillingserverprotocol'], None, None, None, None),
+    'XBriProtocol': ('restriction', 'xsd:string', ENUMS['XBriProtocol'], None, None, None, None),
+    'XCALHeaders': ('restriction', 'xsd:string', ENUMS['XCALHeaders'], None, None, None, None),
+    'XCALMode': ('restriction', 'xsd:string', ENUMS['XCALMode'], None, None, None, None),
+    'XCFACSSActivationPolicy': ('restriction', 'xsd:string', ENUMS['XCFACSSActivationPolicy'], None, None, None, None),
+    'XCSUParam': ('restriction', 'xsd:string', ENUMS['XCSUParam'], None, None, None, None),
+    'XCUCMVersionInSipHeader': ('restriction', 'xsd:string', ENUMS['XCUCMVersionInSipHeader'], None, None, None, None),
+    'XCallTreatmentOnFailure': ('restriction', 'xsd:string', ENUMS['XCallTreatmentOnFailure'], None, None, None, None),
+    'XCallerFilterMask': ('restriction', 'xsd:string', ENUMS['XCallerFilterMask'], None, None, None, None),
+    'XCallerID': ('restriction', 'xsd:string', ENUMS['XCallerID'], None, None, None, None),
+    'XCallingLineIdentification': ('restriction', 'xsd:string', ENUMS['XCallingLineIdentification'], None, None, None, None),
+    'XCallingPartySelection': ('restriction', 'xsd:string', ENUMS['XCallingPartySelection'], None, None, None, None),
+    'XCertificateOperation': ('restriction', 'xsd:string', ENUMS['XCertificateOperation'], None, None, None, None),
+    'XCertificateService': ('restriction', 'xsd:string', ENUMS['XCertificateService'], None, None, None, None),
+    'XCertificateStatus': ('restriction', 'xsd:string', ENUMS['XCertificateStatus'], None, None, None, None),
+    'XCertificateVerificationLevel': ('restriction', 'xsd:string', ENUMS['XCertificateVerificationLevel'], None, None, None, None),
+    'XChangeAction': ('restriction', 'xsd:string', ENUMS['XChangeAction'], None, None, None, None),
+    'XChangeType': ('restriction', 'xsd:string', ENUMS['XChangeType'], None, None, None, None),
+    'XClass': ('restriction', 'xsd:string', ENUMS['XClass'], None, None, None, None),
+    'XClockReference': ('restriction', 'xsd:string', ENUMS['XClockReference'], None, None, None, None),
+    'XConnectProtocol': ('restriction', 'xsd:string', ENUMS['XConnectProtocol'], None, None, None, None),
+    'XCountry': ('restriction', 'xsd:string', ENUMS['XCountry'], None, None, None, None),
+    'XCredential': ('restriction', 'xsd:string', ENUMS['XCredential'], None, None, None, None),
+    'XCredentialUser': ('restriction', 'xsd:string', ENUMS['XCredentialUser'], None, None, None, None),
+    'XDNDOption': ('restriction', 'xsd:string', ENUMS['XDNDOption'], None, None, None, None),
+    'XDTMFSignaling': ('restriction', 'xsd:string', ENUMS['XDTMFSignaling'], None, None, None, None),
+    'XDayOfWeek': ('restriction', 'xsd:string', ENUMS['XDayOfWeek'], None, None, None, None),
+    'XDeviceProtocol': ('restriction', 'xsd:string', ENUMS['XDeviceProtocol'], None, None, None, None),
+    'XDeviceSecurityMode': ('restriction', 'xsd:string', ENUMS['XDeviceSecurityMode'], None, None, None, None),
+    'XDeviceTrustMode': ('restriction', 'xsd:string', ENUMS['XDeviceTrustMode'], None, None, None, None),
+    'XDialParameter': ('restriction', 'xsd:string', ENUMS['XDialParameter'], None, None, None, None),
+    'XDialPattern': ('restriction', 'xsd:string', ENUMS['XDialPattern'], None, None, None, None),
+    'XDialViaOffice': ('restriction', 'xsd:string', ENUMS['XDialViaOffice'], None, None, None, None),
+    'XDigitSending': ('restriction', 'xsd:string', ENUMS['XDigitSending'], None, None, None, None),
+    'XDistributeAlgorithm': ('restriction', 'xsd:string', ENUMS['XDistributeAlgorithm'], None, None, None, None),
+    'XECKeySize': ('restriction', 'xsd:string', ENUMS['XECKeySize'], None, None, None, None),
+    'XEOSuppVoiceCall': ('restriction', 'xsd:string', ENUMS['XEOSuppVoiceCall'], None, None, None, None),
+    'XEncode': ('restriction', 'xsd:string', ENUMS['XEncode'], None, None, None, None),
+    'XEndpointConnection': ('restriction', 'xsd:string', ENUMS['XEndpointConnection'], None, None, None, None),
+    'XFDLChannel': ('restriction', 'xsd:string', ENUMS['XFDLChannel'], None, None, None, None),
+    'XFallBackCSSSelection': ('restriction', 'xsd:string', ENUMS['XFallBackCSSSelection'], None, None, None, None),
+    'XFeature': ('restriction', 'xsd:string', ENUMS['XFeature'], None, None, None, None),
+    'XGClear': ('restriction', 'xsd:string', ENUMS['XGClear'], None, None, None, None),
+    'XGeoLocationDevice': ('restriction', 'xsd:string', ENUMS['XGeoLocationDevice'], None, None, None, None),
+    'XGlobalNumber': ('restriction', 'xsd:string', ENUMS['XGlobalNumber'], None, None, None, None),
+    'XHTTPProxy': ('restriction', 'xsd:string', ENUMS['XHTTPProxy'], None, None, None, None),
+    'XHostedRoutePatternPSTNRule': ('restriction', 'xsd:string', ENUMS['XHostedRoutePatternPSTNRule'], None, None, None, None),
+    'XHotspotAuthenticationMethod': ('restriction', 'xsd:string', ENUMS['XHotspotAuthenticationMethod'], None, None, None, None),
+    'XHuntAlgorithm': ('restriction', 'xsd:string', ENUMS['XHuntAlgorithm'], None, None, None, None),
+    'XIPAddressingMode': ('restriction', 'xsd:string', ENUMS['XIPAddressingMode'], None, None, None, None),
+    'XIPAddressingModePrefControl': ('restriction', 'xsd:string', ENUMS['XIPAddressingModePrefControl'], None, None, None, None),
+    'XInteger': ('union', (('restriction', 'xsd:integer', None, None, None, None, None), ('restriction', 'xsd:string', frozenset({''}), None, None, None, None))),
+    'XInterClusterService': ('restriction', 'xsd:string', ENUMS['XInterClusterService'], None, None, None, None),
+    'XKeepAliveTimeInterval': ('restriction', 'xsd:string', ENUMS['XKeepAliveTimeInterval'], None, None, None, None),
+    'XKeyOrder': ('restriction', 'xsd:string', ENUMS['XKeyOrder'], None, None, None, None),
+    'XKeySize': ('restriction', 'xsd:string', ENUMS['XKeySize'], None, None, None, None),
+    'XLDAPDirectoryFunction': ('restriction', 'xsd:string', ENUMS['XLDAPDirectoryFunction'], None, None, None, None),
+    'XLdapServer': ('restriction', 'xsd:string', ENUMS['XLdapServer'], None, None, None, None),
+    'XLogicalPartitionPolicy': ('restriction', 'xsd:string', ENUMS['XLogicalPartitionPolicy'], None, None, None, None),
+    'XLossyNetwork': ('restriction', 'xsd:string', ENUMS['XLossyNetwork'], None, None, None, None),
+    'XMGCPSlotModule': ('restriction', 'xsd:string', ENUMS['XMGCPSlotModule'], None, None, None, None),
+    'XMGCPVic': ('restriction', 'xsd:string', ENUMS['XMGCPVic'], None, None, None, None),
+    'XMOHAudioSourceId': ('union', (('restriction', 'xsd:nonNegativeInteger', None, None, None, 0, 51), ('restriction', 'xsd:string', frozenset({'', 'null'}), None, None, None, None))),
+    'XMRAPolicy': ('restriction', 'xsd:string', ENUMS['XMRAPolicy'], None, None, None, None),
+    'XMWLPolicy': ('restriction', 'xsd:string', ENUMS['XMWLPolicy'], None, None, None, None),
+    'XMacAddress': ('restriction', 'xsd:string', None, '([0-9]|[a-f]|[A-F]){12}', None, None, None),
+    'XMatrixValue': ('restriction', 'xsd:string', ENUMS['XMatrixValue'], None, None, None, None),
+    'XMediaPayload': ('restriction', 'xsd:string', ENUMS['XMediaPayload'], None, None, None, None),
+    'XMobileSmartClient': ('restriction', 'xsd:string', ENUMS['XMobileSmartClient'], None, None, None, None),
+    'XModel': ('restriction', 'xsd:string', ENUMS['XModel'], None, None, None, None),
+    'XMonthOfYear': ('restriction', 'xsd:string', ENUMS['XMonthOfYear'], None, None, None, None),
+    'XNSFService': ('restriction', 'xsd:string', ENUMS['XNSFService'], None, None, None, None),
+    'XNetworkLocation': ('restriction', 'xsd:string', ENUMS['XNetworkLocation'], None, None, None, None),
+    'XNodeUsage': ('restriction', 'xsd:string', ENUMS['XNodeUsage'], None, None, None, None),
+    'XNumberingPlan': ('restriction', 'xsd:string', ENUMS['XNumberingPlan'], None, None, None, None),
+    'XOnboardingRegistrationStatus': ('restriction', 'xsd:string', ENUMS['XOnboardingRegistrationStatus'], None, None, None, None),
+    'XOperator': ('restriction', 'xsd:string', ENUMS['XOperator'], None, None, None, None),
+    'XOutboundCallRollover': ('restriction', 'xsd:string', ENUMS['XOutboundCallRollover'], None, None, None, None),
+    'XPRIChanIE': ('restriction', 'xsd:string', ENUMS['XPRIChanIE'], None, None, None, None),
+    'XPacketCaptureMode': ('restriction', 'xsd:string', ENUMS['XPacketCaptureMode'], None, None, None, None),
+    'XParam': ('restriction', 'xsd:string', ENUMS['XParam'], None, None, None, None),
+    'XPartitionUsage': ('restriction', 'xsd:string', ENUMS['XPartitionUsage'], None, None, None, None),
+    'XPatternPrecedence': ('restriction', 'xsd:string', ENUMS['XPatternPrecedence'], None, None, None, None),
+    'XPatternRouteClass': ('restriction', 'xsd:string', ENUMS['XPatternRouteClass'], None, None, None, None),
+    'XPatternUsage': ('restriction', 'xsd:string', ENUMS['XPatternUsage'], None, None, None, None),
+    'XPhonePersonalization': ('restriction', 'xsd:string', ENUMS['XPhonePersonalization'], None, None, None, None),
+    'XPhoneService': ('restriction', 'xsd:string', ENUMS['XPhoneService'], None, None, None, None),
+    'XPhoneServiceCategory': ('restriction', 'xsd:string', ENUMS['XPhoneServiceCategory'], None, None, None, None),
+    'XPhoneServiceDisplay': ('restriction', 'xsd:string', ENUMS['XPhoneServiceDisplay'], None, None, None, None),
+    'XPickupNotification': ('restriction', 'xsd:string', ENUMS['XPickupNotification'], None, None, None, None),
+    'XPreemption': ('restriction', 'xsd:string', ENUMS['XPreemption'], None, None, None, None),
+    'XPreferredMediaSource': ('restriction', 'xsd:string', ENUMS['XPreferredMediaSource'], None, None, None, None),
+    'XPresentationBit': ('restriction', 'xsd:string', ENUMS['XPresentationBit'], None, None, None, None),
+    'XPriOfNumber': ('restriction', 'xsd:string', ENUMS['XPriOfNumber'], None, None, None, None),
+    'XPriProtocol': ('restriction', 'xsd:string', ENUMS['XPriProtocol'], None, None, None, None),
+    'XProcessNodeRole': ('restriction', 'xsd:string', ENUMS['XProcessNodeRole'], None, None, None, None),
+    'XProduct': ('restriction', 'xsd:string', ENUMS['XProduct'], None, None, None, None),
+    'XProtocolSide': ('restriction', 'xsd:string', ENUMS['XProtocolSide'], None, None, None, None),
+    'XQSIGVariant': ('restriction', 'xsd:string', ENUMS['XQSIGVariant'], None, None, None, None),
+    'XRSVPOverSIP': ('restriction', 'xsd:string', ENUMS['XRSVPOverSIP'], None, None, None, None),
+    'XRecordingFlag': ('restriction', 'xsd:string', ENUMS['XRecordingFlag'], None, None, None, None),
+    'XReleaseCauseValue': ('restriction', 'xsd:string', ENUMS['XReleaseCauseValue'], None, None, None, None),
+    'XRequestTimeout': ('restriction', 'xsd:integer', None, None, None, 250, 180000),
+    'XReset': ('restriction', 'xsd:string', ENUMS['XReset'], None, None, None, None),
+    'XRetryCount': ('restriction', 'xsd:integer', None, None, None, 1, 10),
+    'XRevertPriority': ('restriction', 'xsd:string', ENUMS['XRevertPriority'], None, None, None, None),
+    'XRingSetting': ('restriction', 'xsd:string', ENUMS['XRingSetting'], None, None, None, None),
+    'XSIPBandwidthModifier': ('restriction', 'xsd:string', ENUMS['XSIPBandwidthModifier'], None, None, None, None),
+    'XSIPCodec': ('restriction', 'xsd:string', ENUMS['XSIPCodec'], None, None, None, None),
+    'XSIPIdentityBlend': ('restriction', 'xsd:string', ENUMS['XSIPIdentityBlend'], None, None, None, None),
+    'XSIPRel1XXOptions': ('restriction', 'xsd:string', ENUMS['XSIPRel1XXOptions'], None, None, None, None),
+    'XSIPReroute': ('restriction', 'xsd:string', ENUMS['XSIPReroute'], None, None, None, None),
+    'XSIPScriptErrorHandling': ('restriction', 'xsd:string', ENUMS['XSIPScriptErrorHandling'], None, None, None, None),
+    'XSIPTrunkCallLegSecurity': ('restriction', 'xsd:string', ENUMS['XSIPTrunkCallLegSecurity'], None, None, None, None),
+    'XSNMPAuthenticationProtocol': ('restriction', 'xsd:string', ENUMS['XSNMPAuthenticationProtocol'], None, None, None, None),
+    'XSNMPPrivacyProtocol': ('restriction', 'xsd:string', ENUMS['XSNMPPrivacyProtocol'], None, None, None, None),
+    'XSNMPVersion': ('restriction', 'xsd:string', ENUMS['XSNMPVersion'], None, None, None, None),
+    'XScheduleUnit': ('restriction', 'xsd:string', ENUMS['XScheduleUnit'], None, None, None, None),
+    'XServerSecurityMode': ('restriction', 'xsd:string', ENUMS['XServerSecurityMode'], None, None, None, None),
+    'XService': ('restriction', 'xsd:string', ENUMS['XService'], None, None, None, None),
+    'XServiceGrouping': ('restriction', 'xsd:string', ENUMS['XServiceGrouping'], None, None, None, None),
+    'XSilenceSuppressionThreshold': ('restriction', 'xsd:string', ENUMS['XSilenceSuppressionThreshold'], None, None, None, None),
+    'XSipAssertedType': ('restriction', 'xsd:string', ENUMS['XSipAssertedType'], None, None, None, None),
+    'XSipPrivacy': ('restriction', 'xsd:string', ENUMS['XSipPrivacy'], None, None, None, None),
+    'XSipSessionRefreshMethod': ('restriction', 'xsd:string', ENUMS['XSipSessionRefreshMethod'], None, None, None, None),
+    'XStartDialProtocol': ('restriction', 'xsd:string', ENUMS['XStartDialProtocol'], None, None, None, None),
+    'XStatus': ('restriction', 'xsd:string', ENUMS['XStatus'], None, None, None, None),
+    'XSyncStatus': ('restriction', 'xsd:string', ENUMS['XSyncStatus'], None, None, None, None),
+    'XTelnetLevel': ('restriction', 'xsd:string', ENUMS['XTelnetLevel'], None, None, None, None),
+    'XTerminal': ('restriction', 'xsd:string', ENUMS['XTerminal'], None, None, None, None),
+    'XTimeOfDay': ('restriction', 'xsd:string', ENUMS['XTimeOfDay'], None, None, None, None),
+    'XTimeScheduleCategory': ('restriction', 'xsd:string', ENUMS['XTimeScheduleCategory'], None, None, None, None),
+    'XTimeZone': ('restriction', 'xsd:string', ENUMS['XTimeZone'], None, None, None, None),
+    'XTransport': ('restriction', 'xsd:string', ENUMS['XTransport'], None, None, None, None),
+    'XTrunk': ('restriction', 'xsd:string', ENUMS['XTrunk'], None, None, None, None),
+    'XTrunkDirection': ('restriction', 'xsd:string', ENUMS['XTrunkDirection'], None, None, None, None),
+    'XTrunkLevel': ('restriction', 'xsd:string', ENUMS['XTrunkLevel'], None, None, None, None),
+    'XTrunkPad': ('restriction', 'xsd:string', ENUMS['XTrunkPad'], None, None, None, None),
+    'XTrunkSelectionOrder': ('restriction', 'xsd:string', ENUMS['XTrunkSelectionOrder'], None, None, None, None),
+    'XTrunkService': ('restriction', 'xsd:string', ENUMS['XTrunkService'], None, None, None, None),
+    'XTrustReceivedIdentity': ('restriction', 'xsd:string', ENUMS['XTrustReceivedIdentity'], None, None, None, None),
+    'XTrustRole': ('restriction', 'xsd:string', ENUMS['XTrustRole'], None, None, None, None),
+    'XTunneledProtocol': ('restriction', 'xsd:string', ENUMS['XTunneledProtocol'], None, None, None, None),
+    'XUCProduct': ('restriction', 'xsd:string', ENUMS['XUCProduct'], None, None, None, None),
+    'XUCService': ('restriction', 'xsd:string', ENUMS['XUCService'], None, None, None, None),
+    'XURIDisambiguationPolicy': ('restriction', 'xsd:string', ENUMS['XURIDisambiguationPolicy'], None, None, None, None),
+    'XUUID': ('restriction', 'xsd:string', None, '\\{........-....-....-....-............\\}', None, None, None),
+    'XUserAgentServerHeaderInfo': ('restriction', 'xsd:string', ENUMS['XUserAgentServerHeaderInfo'], None, None, None, None),
+    'XUserLocale': ('restriction', 'xsd:string', ENUMS['XUserLocale'], None, None, None, None),
+    'XV150SDPFilter': ('restriction', 'xsd:string', ENUMS['XV150SDPFilter'], None, None, None, None),
+    'XVMAvoidancePolicy': ('restriction', 'xsd:string', ENUMS['XVMAvoidancePolicy'], None, None, None, None),
+    'XVPNClientAuthentication': ('restriction', 'xsd:string', ENUMS['XVPNClientAuthentication'], None, None, None, None),
+    'XVideoCallTrafficClass': ('restriction', 'xsd:string', ENUMS['XVideoCallTrafficClass'], None, None, None, None),
+    'XViprFilterElement': ('restriction', 'xsd:string', ENUMS['XViprFilterElement'], None, None, None, None),
+    'XWLANProfileChanges': ('restriction', 'xsd:string', ENUMS['XWLANProfileChanges'], None, None, None, None),
+    'XWebPageDisplay': ('restriction', 'xsd:string', ENUMS['XWebPageDisplay'], None, None, None, None),
+    'XWebPageSection': ('restriction', 'xsd:string', ENUMS['XWebPageSection'], None, None, None, None),
+    'XWiFiAuthenticationMethod': ('restriction', 'xsd:string', ENUMS['XWiFiAuthenticationMethod'], None, None, None, None),
+    'XWiFiFrequency': ('restriction', 'xsd:string', ENUMS['XWiFiFrequency'], None, None, None, None),
+    'XYellowAlarm': ('restriction', 'xsd:string', ENUMS['XYellowAlarm'], None, None, None, None),
+    'XZeroSuppression': ('restriction', 'xsd:string', ENUMS['XZeroSuppression'], None, None, None, None),
+    'XZzdndcontrol': ('restriction', 'xsd:string', ENUMS['XZzdndcontrol'], None, None, None, None),
+    'XZzdtmfDbLevel': ('restriction', 'xsd:string', ENUMS['XZzdtmfDbLevel'], None, None, None, None),
+    'XZzntpmode': ('restriction', 'xsd:string', ENUMS['XZzntpmode'], None, None, None, None),
+    'XZzpreff': ('restriction', 'xsd:string', ENUMS['XZzpreff'], None, None, None, None),
+    'XZzuserInfo': ('restriction', 'xsd:string', ENUMS['XZzuserInfo'], None, None, None, None),
+    'boolean': ('restriction', 'xsd:string', None, '(t)|(f)|(true)|(false)|(0)|(1)', None, None, None),
+}
+
+# Complex type -> (fields as (name, type, flags), attributes,
+#     simple content base, accepts any element)
+COMPLEX_TYPES = {
+    'AXLError': ((('axlcode', 'xsd:int', 1), ('axlmessage', 'xsd:string', 1), ('request', 'xsd:string', 1)), frozenset(), None, False),
+    'AddAarGroupReq': ((('aarGroup', 'XAarGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddAdvertisedPatternsReq': ((('advertisedPatterns', 'XAdvertisedPatterns', 1),), frozenset({'sequence'}), None, False),
+    'AddAnnouncementReq': ((('announcement', 'XAnnouncement', 1),), frozenset({'sequence'}), None, False),
+    'AddAppServerInfoReq': ((('appServerInfo', 'XAppServerInfo', 1),), frozenset({'sequence'}), None, False),
+    'AddAppUserReq': ((('appUser', 'XAppUser', 1),), frozenset({'sequence'}), None, False),
+    'AddApplicationDialRulesReq': ((('applicationDialRules', 'XApplicationDialRules', 1),), frozenset({'sequence'}), None, False),
+    'AddApplicationServerReq': ((('applicationServer', 'XApplicationServer', 1),), frozenset({'sequence'}), None, False),
+    'AddApplicationToSoftkeyTemplateReq': ((('applicationToSoftkeyTemplate', 'XApplicationToSoftKeyTemplate', 1),), frozenset({'sequence'}), None, False),
+    'AddApplicationUserCapfProfileReq': ((('applicationUserCapfProfile', 'XApplicationUserCapfProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddAudioCodecPreferenceListReq': ((('audioCodecPreferenceList', 'XAudioCodecPreferenceList', 1),), frozenset({'sequence'}), None, False),
+    'AddBillingServerReq': ((('billingServer', 'XBillingServer', 1),), frozenset({'sequence'}), None, False),
+    'AddBlockedLearnedPatternsReq': ((('blockedLearnedPatterns', 'XBlockedLearnedPatterns', 1),), frozenset({'sequence'}), None, False),
+    'AddCCAProfilesReq': ((('cCAProfiles', 'XCCAProfiles', 1),), frozenset({'sequence'}), None, False),
+    'AddCallManagerGroupReq': ((('callManagerGroup', 'XCallManagerGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddCallParkReq': ((('callPark', 'XCallPark', 1),), frozenset({'sequence'}), None, False),
+    'AddCallPickupGroupReq': ((('callPickupGroup', 'XCallPickupGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddCalledPartyTracingReq': ((('calledPartyTracing', 'XCalledPartyTracing', 1),), frozenset({'sequence'}), None, False),
+    'AddCalledPartyTransformationPatternReq': ((('calledPartyTransformationPattern', 'XCalledPartyTransformationPattern', 1),), frozenset({'sequence'}), None, False),
+    'AddCallerFilterListReq': ((('callerFilterList', 'XCallerFilterList', 1),), frozenset({'sequence'}), None, False),
+    'AddCallingPartyTransformationPatternReq': ((('callingPartyTransformationPattern', 'XCallingPartyTransformationPattern', 1),), frozenset({'sequence'}), None, False),
+    'AddCcdAdvertisingServiceReq': ((('ccdAdvertisingService', 'XCcdAdvertisingService', 1),), frozenset({'sequence'}), None, False),
+    'AddCcdHostedDNGroupReq': ((('ccdHostedDNGroup', 'XCcdHostedDNGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddCcdHostedDNReq': ((('ccdHostedDN', 'XCcdHostedDN', 1),), frozenset({'sequence'}), None, False),
+    'AddCcdRequestingServiceReq': ((('ccdRequestingService', 'XCcdRequestingService', 1),), frozenset({'sequence'}), None, False),
+    'AddCiscoCatalyst600024PortFXSGatewayReq': ((('ciscoCatalyst600024PortFXSGateway', 'XCiscoCatalyst600024PortFXSGateway', 1),), frozenset({'sequence'}), None, False),
+    'AddCiscoCatalyst6000E1VoIPGatewayReq': ((('ciscoCatalyst6000E1VoIPGateway', 'XCiscoCatalyst6000E1VoIPGateway', 1),), frozenset({'sequence'}), None, False),
+    'AddCiscoCatalyst6000T1VoIPGatewayPriReq': ((('ciscoCatalyst6000T1VoIPGatewayPri', 'XCiscoCatalyst6000T1VoIPGatewayPri', 1),), frozenset({'sequence'}), None, False),
+    'AddCiscoCatalyst6000T1VoIPGatewayT1Req': ((('ciscoCatalyst6000T1VoIPGatewayT1', 'XCiscoCatalyst6000T1VoIPGatewayT1', 1),), frozenset({'sequence'}), None, False),
+    'AddCmcInfoReq': ((('cmcInfo', 'XCmcInfo', 1),), frozenset({'sequence'}), None, False),
+    'AddCommonDeviceConfigReq': ((('commonDeviceConfig', 'XCommonDeviceConfig', 1),), frozenset({'sequence'}), None, False),
+    'AddCommonPhoneConfigReq': ((('commonPhoneConfig', 'XCommonPhoneConfig', 1),), frozenset({'sequence'}), None, False),
+    'AddConferenceBridgeReq': ((('conferenceBridge', 'XConferenceBridge', 1),), frozenset({'sequence'}), None, False),
+    'AddConferenceNowReq': ((('conferenceNow', 'XConferenceNow', 1),), frozenset({'sequence'}), None, False),
+    'AddCredentialPolicyReq': ((('credentialPolicy', 'XCredentialPolicy', 1),), frozenset({'sequence'}), None, False),
+    'AddCssReq': ((('css', 'XCss', 1),), frozenset({'sequence'}), None, False),
+    'AddCtiRoutePointReq': ((('ctiRoutePoint', 'XCtiRoutePoint', 1),), frozenset({'sequence'}), None, False),
+    'AddCumaServerSecurityProfileReq': ((('cumaServerSecurityProfile', 'XCumaServerSecurityProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddCustomUserFieldReq': ((('customUserField', 'XCustomUserField', 1),), frozenset({'sequence'}), None, False),
+    'AddCustomerReq': ((('customer', 'XCustomer', 1),), frozenset({'sequence'}), None, False),
+    'AddDateTimeGroupReq': ((('dateTimeGroup', 'XDateTimeGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddDefaultDeviceProfileReq': ((('defaultDeviceProfile', 'XDefaultDeviceProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddDeviceMobilityGroupReq': ((('deviceMobilityGroup', 'XDeviceMobilityGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddDeviceMobilityReq': ((('deviceMobility', 'XDeviceMobility', 1),), frozenset({'sequence'}), None, False),
+    'AddDevicePoolReq': ((('devicePool', 'XDevicePool', 1),), frozenset({'sequence'}), None, False),
+    'AddDeviceProfileReq': ((('deviceProfile', 'XDeviceProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddDhcpServerReq': ((('dhcpServer', 'XDhcpServer', 1),), frozenset({'sequence'}), None, False),
+    'AddDhcpSubnetReq': ((('dhcpSubnet', 'XDhcpSubnet', 1),), frozenset({'sequence'}), None, False),
+    'AddDirNumberAliasLookupandSyncReq': ((('dirNumberAliasLookupandSync', 'XDirNumberAliasLookupandSync', 1),), frozenset({'sequence'}), None, False),
+    'AddDirectedCallParkReq': ((('directedCallPark', 'XDirectedCallPark', 1),), frozenset({'sequence'}), None, False),
+    'AddDirectoryLookupDialRulesReq': ((('directoryLookupDialRules', 'XDirectoryLookupDialRules', 1),), frozenset({'sequence'}), None, False),
+    'AddElinGroupReq': ((('elinGroup', 'XElinGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddEndUserCapfProfileReq': ((('endUserCapfProfile', 'XEndUserCapfProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddEnterpriseFeatureAccessConfigurationReq': ((('enterpriseFeatureAccessConfiguration', 'XEnterpriseFeatureAccessConfiguration', 1),), frozenset({'sequence'}), None, False),
+    'AddExpresswayCConfigurationReq': ((('expresswayCConfiguration', 'XExpresswayCConfiguration', 1),), frozenset({'sequence'}), None, False),
+    'AddExternalCallControlProfileReq': ((('externalCallControlProfile', 'XExternalCallControlProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddFacInfoReq': ((('facInfo', 'XFacInfo', 1),), frozenset({'sequence'}), None, False),
+    'AddFallbackProfileReq': ((('fallbackProfile', 'XFallbackProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddFeatureControlPolicyReq': ((('featureControlPolicy', 'XFeatureControlPolicy', 1),), frozenset({'sequence'}), None, False),
+    'AddFeatureGroupTemplateReq': ((('featureGroupTemplate', 'XFeatureGroupTemplate', 1),), frozenset({'sequence'}), None, False),
+    'AddGatekeeperReq': ((('gatekeeper', 'XGatekeeper', 1),), frozenset({'sequence'}), None, False),
+    'AddGatewayEndpointAnalogAccessReq': ((('gatewayEndpointAnalogAccess', 'XGatewayEndpointAnalogAccess', 1),), frozenset({'sequence'}), None, False),
+    'AddGatewayEndpointDigitalAccessBriReq': ((('gatewayEndpointDigitalAccessBri', 'XGatewayEndpointDigitalAccessBri', 1),), frozenset({'sequence'}), None, False),
+    'AddGatewayEndpointDigitalAccessPriReq': ((('gatewayEndpointDigitalAccessPri', 'XGatewayEndpointDigitalAccessPri', 1),), frozenset({'sequence'}), None, False),
+    'AddGatewayEndpointDigitalAccessT1Req': ((('gatewayEndpointDigitalAccessT1', 'XGatewayEndpointDigitalAccessT1', 1),), frozenset({'sequence'}), None, False),
+    'AddGatewayReq': ((('gateway', 'XGateway', 1),), frozenset({'sequence'}), None, False),
+    'AddGatewaySccpEndpointsReq': ((('gatewaySccpEndpoints', 'XGatewaySccpEndpoints', 1),), frozenset({'sequence'}), None, False),
+    'AddGatewaySubunitsReq': ((('gatewaySubunits', 'XGatewaySubunits', 1),), frozenset({'sequence'}), None, False),
+    'AddGeoLocationFilterReq': ((('geoLocationFilter', 'XGeoLocationFilter', 1),), frozenset({'sequence'}), None, False),
+    'AddGeoLocationPolicyReq': ((('geoLocationPolicy', 'XGeoLocationPolicy', 1),), frozenset({'sequence'}), None, False),
+    'AddGeoLocationReq': ((('geoLocation', 'XGeoLocation', 1),), frozenset({'sequence'}), None, False),
+    'AddH323GatewayReq': ((('h323Gateway', 'XH323Gateway', 1),), frozenset({'sequence'}), None, False),
+    'AddH323PhoneReq': ((('h323Phone', 'XH323Phone', 1),), frozenset({'sequence'}), None, False),
+    'AddH323TrunkReq': ((('h323Trunk', 'XH323Trunk', 1),), frozenset({'sequence'}), None, False),
+    'AddHandoffConfigurationReq': ((('handoffConfiguration', 'XHandoffConfiguration', 1),), frozenset({'sequence'}), None, False),
+    'AddHttpProfileReq': ((('httpProfile', 'XHttpProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddHuntListReq': ((('huntList', 'XHuntList', 1),), frozenset({'sequence'}), None, False),
+    'AddHuntPilotReq': ((('huntPilot', 'XHuntPilot', 1),), frozenset({'sequence'}), None, False),
+    'AddImeClientReq': ((('imeClient', 'XImeClient', 1),), frozenset({'sequence'}), None, False),
+    'AddImeE164TransformationReq': ((('imeE164Transformation', 'XImeE164Transformation', 1),), frozenset({'sequence'}), None, False),
+    'AddImeEnrolledPatternGroupReq': ((('imeEnrolledPatternGroup', 'XImeEnrolledPatternGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddImeEnrolledPatternReq': ((('imeEnrolledPattern', 'XImeEnrolledPattern', 1),), frozenset({'sequence'}), None, False),
+    'AddImeExclusionNumberGroupReq': ((('imeExclusionNumberGroup', 'XImeExclusionNumberGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddImeExclusionNumberReq': ((('imeExclusionNumber', 'XImeExclusionNumber', 1),), frozenset({'sequence'}), None, False),
+    'AddImeFirewallReq': ((('imeFirewall', 'XImeFirewall', 1),), frozenset({'sequence'}), None, False),
+    'AddImeRouteFilterElementReq': ((('imeRouteFilterElement', 'XImeRouteFilterElement', 1),), frozenset({'sequence'}), None, False),
+    'AddImeRouteFilterGroupReq': ((('imeRouteFilterGroup', 'XImeRouteFilterGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddImeServerReq': ((('imeServer', 'XImeServer', 1),), frozenset({'sequence'}), None, False),
+    'AddImportedDirectoryUriCatalogsReq': ((('importedDirectoryUriCatalogs', 'XImportedDirectoryUriCatalogs', 1),), frozenset({'sequence'}), None, False),
+    'AddInfrastructureDeviceReq': ((('infrastructureDevice', 'XInfrastructureDevice', 1),), frozenset({'sequence'}), None, False),
+    'AddIpPhoneServicesReq': ((('ipPhoneServices', 'XIpPhoneServices', 1),), frozenset({'sequence'}), None, False),
+    'AddIvrUserLocaleReq': ((('ivrUserLocale', 'XIvrUserLocale', 1),), frozenset({'sequence'}), None, False),
+    'AddLbmGroupReq': ((('lbmGroup', 'XLbmGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddLbmHubGroupReq': ((('lbmHubGroup', 'XLbmHubGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddLdapDirectoryReq': ((('ldapDirectory', 'XLdapDirectory', 1),), frozenset({'sequence'}), None, False),
+    'AddLdapFilterReq': ((('ldapFilter', 'XLdapFilter', 1),), frozenset({'sequence'}), None, False),
+    'AddLdapSyncCustomFieldReq': ((('ldapSyncCustomField', 'XLdapSyncCustomField', 1),), frozenset({'sequence'}), None, False),
+    'AddLineGroupReq': ((('lineGroup', 'XLineGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddLineReq': ((('line', 'XLine', 1),), frozenset({'sequence'}), None, False),
+    'AddLocalRouteGroupReq': ((('localRouteGroup', 'XLocalRouteGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddLocationReq': ((('location', 'XLocation', 1),), frozenset({'sequence'}), None, False),
+    'AddMediaResourceGroupReq': ((('mediaResourceGroup', 'XMediaResourceGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddMediaResourceListReq': ((('mediaResourceList', 'XMediaResourceList', 1),), frozenset({'sequence'}), None, False),
+    'AddMeetMeReq': ((('meetMe', 'XMeetMe', 1),), frozenset({'sequence'}), None, False),
+    'AddMessageWaitingReq': ((('messageWaiting', 'XMessageWaiting', 1),), frozenset({'sequence'}), None, False),
+    'AddMlppDomainReq': ((('mlppDomain', 'XMlppDomain', 1),), frozenset({'sequence'}), None, False),
+    'AddMobileVoiceAccessReq': ((('mobileVoiceAccess', 'XMobileVoiceAccess', 1),), frozenset({'sequence'}), None, False),
+    'AddMobilityProfileReq': ((('mobilityProfile', 'XMobilityProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddMobilityReq': ((('mobility', 'XMobility', 1),), frozenset({'sequence'}), None, False),
+    'AddMraServiceDomainReq': ((('mraServiceDomain', 'XMraServiceDomain', 1),), frozenset({'sequence'}), None, False),
+    'AddMtpReq': ((('mtp', 'XMtp', 1),), frozenset({'sequence'}), None, False),
+    'AddNetworkAccessProfileReq': ((('networkAccessProfile', 'XNetworkAccessProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddPhoneActivationCodeReq': ((('phoneActivationCode', 'XPhoneActivationCode', 1),), frozenset({'sequence'}), None, False),
+    'AddPhoneButtonTemplateReq': ((('phoneButtonTemplate', 'XPhoneButtonTemplate', 1),), frozenset({'sequence'}), None, False),
+    'AddPhoneNtpReq': ((('phoneNtp', 'XPhoneNtp', 1),), frozenset({'sequence'}), None, False),
+    'AddPhoneReq': ((('phone', 'XPhone', 1),), frozenset({'sequence'}), None, False),
+    'AddPhoneSecurityProfileReq': ((('phoneSecurityProfile', 'XPhoneSecurityProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddPhysicalLocationReq': ((('physicalLocation', 'XPhysicalLocation', 1),), frozenset({'sequence'}), None, False),
+    'AddPresenceGroupReq': ((('presenceGroup', 'XPresenceGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddPresenceRedundancyGroupReq': ((('presenceRedundancyGroup', 'XPresenceRedundancyGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddProcessNodeReq': ((('processNode', 'XProcessNode', 1),), frozenset({'sequence'}), None, False),
+    'AddRecordingProfileReq': ((('recordingProfile', 'XRecordingProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddRegionReq': ((('region', 'XRegion', 1),), frozenset({'sequence'}), None, False),
+    'AddRemoteClusterReq': ((('remoteCluster', 'XRemoteCluster', 1),), frozenset({'sequence'}), None, False),
+    'AddRemoteDestinationProfileReq': ((('remoteDestinationProfile', 'XRemoteDestinationProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddRemoteDestinationReq': ((('remoteDestination', 'XRemoteDestination', 1),), frozenset({'sequence'}), None, False),
+    'AddResourcePriorityNamespaceListReq': ((('resourcePriorityNamespaceList', 'XResourcePriorityNamespaceList', 1),), frozenset({'sequence'}), None, False),
+    'AddResourcePriorityNamespaceReq': ((('resourcePriorityNamespace', 'XResourcePriorityNamespace', 1),), frozenset({'sequence'}), None, False),
+    'AddRouteFilterReq': ((('routeFilter', 'XRouteFilter', 1),), frozenset({'sequence'}), None, False),
+    'AddRouteGroupReq': ((('routeGroup', 'XRouteGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddRouteListReq': ((('routeList', 'XRouteList', 1),), frozenset({'sequence'}), None, False),
+    'AddRoutePartitionReq': ((('routePartition', 'XRoutePartition', 1),), frozenset({'sequence'}), None, False),
+    'AddRoutePatternReq': ((('routePattern', 'XRoutePattern', 1),), frozenset({'sequence'}), None, False),
+    'AddSIPNormalizationScriptReq': ((('sIPNormalizationScript', 'XSIPNormalizationScript', 1),), frozenset({'sequence'}), None, False),
+    'AddSNMPCommunityStringReq': ((('CommunityString', 'RCommunityString', 1),), frozenset({'sequence'}), None, False),
+    'AddSNMPUserReq': ((('user', 'RSNMPUser', 4),), frozenset({'sequence'}), None, False),
+    'AddSafCcdPurgeBlockLearnedRoutesReq': ((('safCcdPurgeBlockLearnedRoutes', 'XSafCcdPurgeBlockLearnedRoutes', 1),), frozenset({'sequence'}), None, False),
+    'AddSafForwarderReq': ((('safForwarder', 'XSafForwarder', 1),), frozenset({'sequence'}), None, False),
+    'AddSafSecurityProfileReq': ((('safSecurityProfile', 'XSafSecurityProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddSdpTransparencyProfileReq': ((('sdpTransparencyProfile', 'XSdpTransparencyProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddServiceProfileReq': ((('serviceProfile', 'XServiceProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddSipDialRulesReq': ((('sipDialRules', 'XSipDialRules', 1),), frozenset({'sequence'}), None, False),
+    'AddSipProfileReq': ((('sipProfile', 'XSipProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddSipRealmReq': ((('sipRealm', 'XSipRealm', 1),), frozenset({'sequence'}), None, False),
+    'AddSipRoutePatternReq': ((('sipRoutePattern', 'XSipRoutePattern', 1),), frozenset({'sequence'}), None, False),
+    'AddSipTrunkReq': ((('sipTrunk', 'XSipTrunk', 1),), frozenset({'sequence'}), None, False),
+    'AddSipTrunkSecurityProfileReq': ((('sipTrunkSecurityProfile', 'XSipTrunkSecurityProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddSoftKeyTemplateReq': ((('softKeyTemplate', 'XSoftKeyTemplate', 1),), frozenset({'sequence'}), None, False),
+    'AddSrstReq': ((('srst', 'XSrst', 1),), frozenset({'sequence'}), None, False),
+    'AddTimePeriodReq': ((('timePeriod', 'XTimePeriod', 1),), frozenset({'sequence'}), None, False),
+    'AddTimeScheduleReq': ((('timeSchedule', 'XTimeSchedule', 1),), frozenset({'sequence'}), None, False),
+    'AddTodAccessReq': ((('todAccess', 'XTodAccess', 1),), frozenset({'sequence'}), None, False),
+    'AddTransPatternReq': ((('transPattern', 'XTransPattern', 1),), frozenset({'sequence'}), None, False),
+    'AddTranscoderReq': ((('transcoder', 'XTranscoder', 1),), frozenset({'sequence'}), None, False),
+    'AddTransformationProfileReq': ((('transformationProfile', 'XTransformationProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddUcServiceReq': ((('ucService', 'XUcService', 1),), frozenset({'sequence'}), None, False),
+    'AddUnitsToGatewayReq': ((('unitsToGateway', 'XUnitsToGateway', 1),), frozenset({'sequence'}), None, False),
+    'AddUniversalDeviceTemplateReq': ((('universalDeviceTemplate', 'XUniversalDeviceTemplate', 1),), frozenset({'sequence'}), None, False),
+    'AddUniversalLineTemplateReq': ((('universalLineTemplate', 'XUniversalLineTemplate', 1),), frozenset({'sequence'}), None, False),
+    'AddUserGroupReq': ((('userGroup', 'XUserGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddUserPhoneAssociationReq': ((('userPhoneAssociation', 'XUserPhoneAssociation', 1),), frozenset({'sequence'}), None, False),
+    'AddUserProfileProvisionReq': ((('userProfileProvision', 'XUserProfileProvision', 1),), frozenset({'sequence'}), None, False),
+    'AddUserReq': ((('user', 'XUser', 1),), frozenset({'sequence'}), None, False),
+    'AddVg224Req': ((('vg224', 'XVg224', 1),), frozenset({'sequence'}), None, False),
+    'AddVohServerReq': ((('vohServer', 'XVohServer', 1),), frozenset({'sequence'}), None, False),
+    'AddVoiceMailPilotReq': ((('voiceMailPilot', 'XVoiceMailPilot', 1),), frozenset({'sequence'}), None, False),
+    'AddVoiceMailPortReq': ((('voiceMailPort', 'XVoiceMailPort', 1),), frozenset({'sequence'}), None, False),
+    'AddVoiceMailProfileReq': ((('voiceMailProfile', 'XVoiceMailProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddVpnGatewayReq': ((('vpnGateway', 'XVpnGateway', 1),), frozenset({'sequence'}), None, False),
+    'AddVpnGroupReq': ((('vpnGroup', 'XVpnGroup', 1),), frozenset({'sequence'}), None, False),
+    'AddVpnProfileReq': ((('vpnProfile', 'XVpnProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddWLANProfileReq': ((('wLANProfile', 'XWLANProfile', 1),), frozenset({'sequence'}), None, False),
+    'AddWifiHotspotReq': ((('wifiHotspot', 'XWifiHotspot', 1),), frozenset({'sequence'}), None, False),
+    'AddWirelessAccessPointControllersReq': ((('wirelessAccessPointControllers', 'XWirelessAccessPointControllers', 1),), frozenset({'sequence'}), None, False),
+    'AddWlanProfileGroupReq': ((('wlanProfileGroup', 'XWlanProfileGroup', 1),), frozenset({'sequence'}), None, False),
+    'ApplyConfigEnterpriseParametersReq': ((), frozenset(), None, False),
+    'ApplyDirectedCallParkReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'ApplyGatewayReq': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'ApplyLineReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'ApplyResourcePriorityNamespaceReq': ((('namespace', 'String10', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'AssignPresenceUserReq': ((('userid', 'xsd:string', 1), ('server', 'xsd:string', 1)), frozenset({'sequence'}), None, False),
+    'DoAuthenticateUserReq': ((('userid', 'xsd:string', 1), ('password', 'xsd:string', 0), ('pin', 'DoAuthenticateUserReq.pin', 0)), frozenset({'sequence'}), None, False),
+    'DoChangeDNDStatusReq': ((('userID', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('dndStatus', 'boolean', 1)), frozenset({'sequence'}), None, False),
+    'DoDeviceLoginReq': ((('deviceName', 'XFkType', 1), ('loginDuration', 'xsd:nonNegativeInteger', 1), ('profileName', 'XFkType', 1), ('userId', 'xsd:string', 1)), frozenset({'sequence'}), None, False),
+    'DoDeviceLogoutReq': ((('deviceName', 'XFkType', 1),), frozenset({'sequence'}), None, False),
+    'DoDeviceResetReq': ((('deviceName', 'XFkType', 1), ('isHardReset', 'boolean', 0), ('deviceResetType', 'XReset', 0)), frozenset({'isMGCP', 'sequence'}), None, False),
+    'DoEnterpriseParametersResetReq': ((), frozenset(), None, False),
+    'DoLdapSyncReq': ((('name', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('sync', 'boolean', 1)), frozenset({'sequence'}), None, False),
+    'DoServiceParametersResetReq': ((('processNodeName', 'XFkType', 1), ('service', 'XService', 1)), frozenset({'sequence'}), None, False),
+    'DoSmartEntitlementRequestReq': ((), frozenset(), None, False),
+    'DoSmartLicenseDeRegisterReq': ((), frozenset(), None, False),
+    'DoSmartLicenseReRegisterReq': ((('token', 'String255', 1),), frozenset(), None, False),
+    'DoSmartLicenseRegisterReq': ((('token', 'String255', 1), ('force', 'boolean', 1)), frozenset(), None, False),
+    'DoSmartLicenseRenewAuthorizationReq': ((), frozenset(), None, False),
+    'DoSmartLicenseRenewRegistrationReq': ((), frozenset(), None, False),
+    'DoUpdateLicenseUsageReq': ((), frozenset(), None, False),
+    'DoUpdateRemoteClusterReq': ((('server', 'String32', 1), ('clusterId', 'String32', 1)), frozenset({'sequence'}), None, False),
+    'DoUpdateTransportSettingsReq': ((('transportMode', 'String255', 1), ('url', 'String255', 1), ('httpHost', 'String255', 1), ('httpPort', 'String255', 1)), frozenset(), None, False),
+    'ExecuteSQLQueryReq': ((('sql', 'xsd:string', 1),), frozenset({'sequence'}), None, False),
+    'ExecuteSQLUpdateReq': ((('sql', 'xsd:string', 1),), frozenset({'sequence'}), None, False),
+    'GetAarGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RAarGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetAdvertisedPatternsReq': ((('pattern', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RAdvertisedPatterns', 0)), frozenset({'sequence'}), None, False),
+    'GetAnnouncementReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RAnnouncement', 0)), frozenset({'sequence'}), None, False),
+    'GetAnnunciatorReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RAnnunciator', 0)), frozenset({'sequence'}), None, False),
+    'GetAppServerInfoReq': ((('uuid', 'XUUID', 1), ('returnedTags', 'RAppServerInfo', 0)), frozenset({'sequence'}), None, False),
+    'GetAppUserReq': ((('userid', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RAppUser', 0)), frozenset({'sequence'}), None, False),
+    'GetApplicationDialRulesReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RApplicationDialRules', 0)), frozenset({'sequence'}), None, False),
+    'GetApplicationServerReq': ((('uuid', 'XUUID', 0), ('returnedTags', 'RApplicationServer', 0)), frozenset({'sequence'}), None, False),
+    'GetApplicationUserCapfProfileReq': ((('instanceId', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RApplicationUserCapfProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetAudioCodecPreferenceListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RAudioCodecPreferenceList', 0)), frozenset({'sequence'}), None, False),
+    'GetBillingServerReq': ((('uuid', 'XUUID', 1), ('returnedTags', 'RBillingServer', 0)), frozenset({'sequence'}), None, False),
+    'GetBlockedLearnedPatternsReq': ((('pattern', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RBlockedLearnedPatterns', 0)), frozenset({'sequence'}), None, False),
+    'GetCCAProfilesReq': ((('ccaId', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCCAProfiles', 0)), frozenset({'sequence'}), None, False),
+    'GetCCMVersionReq': ((('processNodeName', 'String255', 0),), frozenset(), None, False),
+    'GetCallManagerGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCallManagerGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetCallManagerReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCallManager', 0)), frozenset({'sequence'}), None, False),
+    'GetCallParkReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'RCallPark', 0)), frozenset({'sequence'}), None, False),
+    'GetCallPickupGroupReq': ((('uuid', 'XUUID', 0), ('name', 'xsd:string', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'RCallPickupGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetCalledPartyTransformationPatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4), ('returnedTags', 'RCalledPartyTransformationPattern', 0)), frozenset({'sequence'}), None, False),
+    'GetCallerFilterListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCallerFilterList', 0)), frozenset({'sequence'}), None, False),
+    'GetCallingPartyTransformationPatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4), ('returnedTags', 'RCallingPartyTransformationPattern', 0)), frozenset({'sequence'}), None, False),
+    'GetCcdAdvertisingServiceReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCcdAdvertisingService', 0)), frozenset({'sequence'}), None, False),
+    'GetCcdFeatureConfigReq': ((('paramName', 'xsd:string', 1), ('returnedTags', 'XCcdFeatureConfig', 1)), frozenset({'sequence'}), None, False),
+    'GetCcdHostedDNGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCcdHostedDNGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetCcdHostedDNReq': ((('hostedPattern', 'String50', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCcdHostedDN', 0)), frozenset({'sequence'}), None, False),
+    'GetCcdRequestingServiceReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCcdRequestingService', 0)), frozenset({'sequence'}), None, False),
+    'GetCiscoCatalyst600024PortFXSGatewayReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCiscoCatalyst600024PortFXSGateway', 0)), frozenset({'sequence'}), None, False),
+    'GetCiscoCatalyst6000E1VoIPGatewayReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCiscoCatalyst6000E1VoIPGateway', 0)), frozenset({'sequence'}), None, False),
+    'GetCiscoCatalyst6000T1VoIPGatewayPriReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCiscoCatalyst6000T1VoIPGatewayPri', 0)), frozenset({'sequence'}), None, False),
+    'GetCiscoCatalyst6000T1VoIPGatewayT1Req': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCiscoCatalyst6000T1VoIPGatewayT1', 0)), frozenset({'sequence'}), None, False),
+    'GetCmcInfoReq': ((('code', 'String16', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCmcInfo', 0)), frozenset({'sequence'}), None, False),
+    'GetCommonDeviceConfigReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCommonDeviceConfig', 0)), frozenset({'sequence'}), None, False),
+    'GetCommonPhoneConfigReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCommonPhoneConfig', 0)), frozenset({'sequence'}), None, False),
+    'GetConferenceBridgeReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RConferenceBridge', 0)), frozenset({'sequence'}), None, False),
+    'GetConferenceNowReq': ((('uuid', 'XUUID', 0), ('conferenceNowNumber', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'RConferenceNow', 0)), frozenset({'sequence'}), None, False),
+    'GetCredentialPolicyDefaultReq': ((('credentialUser', 'XCredentialUser', 0), ('credentialType', 'XCredential', 0), ('credPolicyName', 'XFkType', 0), ('returnedTags', 'RCredentialPolicyDefault', 0)), frozenset({'sequence'}), None, False),
+    'GetCredentialPolicyReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCredentialPolicy', 0)), frozenset({'sequence'}), None, False),
+    'GetCssReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCss', 0)), frozenset({'sequence'}), None, False),
+    'GetCtiRoutePointReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCtiRoutePoint', 0)), frozenset({'sequence'}), None, False),
+    'GetCumaServerSecurityProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCumaServerSecurityProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetCustomUserFieldReq': ((('field', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCustomUserField', 0)), frozenset({'sequence'}), None, False),
+    'GetCustomerReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RCustomer', 0)), frozenset({'sequence'}), None, False),
+    'GetDateTimeGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RDateTimeGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetDdiReq': ((('uuid', 'XUUID', 0), ('name', 'String50', 0), ('dialPlanName', 'XFkType', 0), ('returnedTags', 'RDdi', 0)), frozenset({'sequence'}), None, False),
+    'GetDefaultDeviceProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RDefaultDeviceProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetDeviceDefaultsReq': ((('uuid', 'XUUID', 0), ('Model', 'XModel', 0), ('Protocol', 'XDeviceProtocol', 0), ('returnedTags', 'RDeviceDefaults', 0)), frozenset({'sequence'}), None, False),
+    'GetDeviceMobilityGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RDeviceMobilityGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetDeviceMobilityReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RDeviceMobility', 0)), frozenset({'sequence'}), None, False),
+    'GetDevicePoolReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RDevicePool', 0)), frozenset({'sequence'}), None, False),
+    'GetDeviceProfileOptionsReq': ((('uuid', 'XUUID', 0), ('returnedChoices', 'OXDeviceProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetDeviceProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RDeviceProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetDhcpServerReq': ((('processNodeName', 'XFkType', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RDhcpServer', 0)), frozenset({'sequence'}), None, False),
+    'GetDhcpSubnetReq': ((('uuid', 'XUUID', 0), ('dhcpServerName', 'XFkType', 0), ('subnetIpAddress', 'xsd:string', 0), ('returnedTags', 'RDhcpSubnet', 0)), frozenset({'sequence'}), None, False),
+    'GetDialPlanReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RDialPlan', 0)), frozenset({'sequence'}), None, False),
+    'GetDialPlanTagReq': ((('uuid', 'XUUID', 0), ('name', 'String50', 0), ('dialPlanName', 'XFkType', 0), ('returnedTags', 'RDialPlanTag', 0)), frozenset({'sequence'}), None, False),
+    'GetDirNumberAliasLookupandSyncReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RDirNumberAliasLookupandSync', 0)), frozenset({'sequence'}), None, False),
+    'GetDirectedCallParkReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'RDirectedCallPark', 0)), frozenset({'sequence'}), None, False),
+    'GetDirectoryLookupDialRulesReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RDirectoryLookupDialRules', 0)), frozenset({'sequence'}), None, False),
+    'GetElinGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RElinGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetEmccFeatureConfigReq': ((('parameterName', 'String50', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'REmccFeatureConfig', 0)), frozenset({'sequence'}), None, False),
+    'GetEndUserCapfProfileReq': ((('instanceId', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'REndUserCapfProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetEnterpriseFeatureAccessConfigurationReq': ((('uuid', 'XUUID', 0), ('pattern', 'String16', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'REnterpriseFeatureAccessConfiguration', 0)), frozenset({'sequence'}), None, False),
+    'GetEnterprisePhoneConfigReq': ((), frozenset(), None, False),
+    'GetExpresswayCConfigurationReq': ((('HostNameOrIP', 'String255', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RExpresswayCConfiguration', 0)), frozenset({'sequence'}), None, False),
+    'GetExternalCallControlProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RExternalCallControlProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetFacInfoReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RFacInfo', 0)), frozenset({'sequence'}), None, False),
+    'GetFallbackFeatureConfigReq': ((), frozenset(), None, False),
+    'GetFallbackProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RFallbackProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetFeatureControlPolicyReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RFeatureControlPolicy', 0)), frozenset({'sequence'}), None, False),
+    'GetFeatureGroupTemplateReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RFeatureGroupTemplate', 0)), frozenset({'sequence'}), None, False),
+    'GetFixedMohAudioSourceReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RFixedMohAudioSource', 0)), frozenset({'sequence'}), None, False),
+    'GetGatekeeperReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RGatekeeper', 0)), frozenset({'sequence'}), None, False),
+    'GetGatewayEndpointAnalogAccessReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RGatewayEndpointAnalogAccess', 0)), frozenset({'sequence'}), None, False),
+    'GetGatewayEndpointDigitalAccessBriReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RGatewayEndpointDigitalAccessBri', 0)), frozenset({'sequence'}), None, False),
+    'GetGatewayEndpointDigitalAccessPriReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RGatewayEndpointDigitalAccessPri', 0)), frozenset({'sequence'}), None, False),
+    'GetGatewayEndpointDigitalAccessT1Req': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RGatewayEndpointDigitalAccessT1', 0)), frozenset({'sequence'}), None, False),
+    'GetGatewayReq': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RGateway', 0)), frozenset({'sequence'}), None, False),
+    'GetGatewaySccpEndpointsReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RGatewaySccpEndpoints', 0)), frozenset({'sequence'}), None, False),
+    'GetGeoLocationFilterReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RGeoLocationFilter', 0)), frozenset({'sequence'}), None, False),
+    'GetGeoLocationPolicyReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RGeoLocationPolicy', 0)), frozenset({'sequence'}), None, False),
+    'GetGeoLocationReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RGeoLocation', 0)), frozenset({'sequence'}), None, False),
+    'GetH323GatewayReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RH323Gateway', 0)), frozenset({'sequence'}), None, False),
+    'GetH323PhoneReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RH323Phone', 0)), frozenset({'sequence'}), None, False),
+    'GetH323TrunkReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RH323Trunk', 0)), frozenset({'sequence'}), None, False),
+    'GetHandoffConfigurationReq': ((('uuid', 'XUUID', 0), ('pattern', 'String16', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'RHandoffConfiguration', 0)), frozenset({'sequence'}), None, False),
+    'GetHttpProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RHttpProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetHuntListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RHuntList', 0)), frozenset({'sequence'}), None, False),
+    'GetHuntPilotReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'RHuntPilot', 0)), frozenset({'sequence'}), None, False),
+    'GetIlsConfigReq': ((('clusterId', 'xsd:string', 0), ('returnedTags', 'NewIlsConfig', 1)), frozenset(), None, False),
+    'GetImeClientReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImeClient', 0)), frozenset({'sequence'}), None, False),
+    'GetImeE164TransformationReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImeE164Transformation', 0)), frozenset({'sequence'}), None, False),
+    'GetImeEnrolledPatternGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImeEnrolledPatternGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetImeEnrolledPatternReq': ((('pattern', 'String16', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImeEnrolledPattern', 0)), frozenset({'sequence'}), None, False),
+    'GetImeExclusionNumberGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImeExclusionNumberGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetImeExclusionNumberReq': ((('pattern', 'String16', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImeExclusionNumber', 0)), frozenset({'sequence'}), None, False),
+    'GetImeFeatureConfigReq': ((), frozenset(), None, False),
+    'GetImeFirewallReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImeFirewall', 0)), frozenset({'sequence'}), None, False),
+    'GetImeLearnedRoutesReq': ((('uuid', 'XUUID', 0), ('e164Did', 'String32', 0), ('returnedTags', 'RImeLearnedRoutes', 0)), frozenset({'sequence'}), None, False),
+    'GetImeRouteFilterElementReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImeRouteFilterElement', 0)), frozenset({'sequence'}), None, False),
+    'GetImeRouteFilterGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImeRouteFilterGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetImeServerReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImeServer', 0)), frozenset({'sequence'}), None, False),
+    'GetImportedDirectoryUriCatalogsReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RImportedDirectoryUriCatalogs', 0)), frozenset({'sequence'}), None, False),
+    'GetInfrastructureDeviceReq': ((('uuid', 'XUUID', 0), ('returnedTags', 'RInfrastructureDevice', 0)), frozenset({'sequence'}), None, False),
+    'GetInterClusterServiceProfileReq': ((('interClusterService', 'XInterClusterService', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RInterClusterServiceProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetIpPhoneServicesReq': ((('serviceName', 'UniqueString128', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RIpPhoneServices', 0)), frozenset({'sequence'}), None, False),
+    'GetIvrUserLocaleReq': ((('userLocale', 'XUserLocale', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RIvrUserLocale', 0)), frozenset({'sequence'}), None, False),
+    'GetLbmGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RLbmGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetLbmHubGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RLbmHubGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetLdapAuthenticationReq': ((), frozenset(), None, False),
+    'GetLdapDirectoryReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RLdapDirectory', 0)), frozenset({'sequence'}), None, False),
+    'GetLdapFilterReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RLdapFilter', 0)), frozenset({'sequence'}), None, False),
+    'GetLdapSearchReq': ((('uuid', 'XUUID', 0), ('returnedTags', 'RLdapSearch', 0)), frozenset({'sequence'}), None, False),
+    'GetLdapSyncCustomFieldReq': ((('uuid', 'XUUID', 0), ('ldapConfigurationName', 'xsd:string', 0), ('customUserField', 'xsd:string', 0), ('returnedTags', 'RLdapSyncCustomField', 0)), frozenset({'sequence'}), None, False),
+    'GetLdapSyncStatusReq': ((('name', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'GetLdapSystemReq': ((), frozenset(), None, False),
+    'GetLicensedUserReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RLicensedUser', 0)), frozenset({'sequence'}), None, False),
+    'GetLineGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RLineGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetLineOptionsReq': ((('uuid', 'XUUID', 0), ('returnedChoices', 'OXLine', 0)), frozenset({'sequence'}), None, False),
+    'GetLineReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'RLine', 0)), frozenset({'sequence'}), None, False),
+    'GetLocalRouteGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RLocalRouteGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetLocationReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RLocation', 0)), frozenset({'sequence'}), None, False),
+    'GetMediaResourceGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RMediaResourceGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetMediaResourceListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RMediaResourceList', 0)), frozenset({'sequence'}), None, False),
+    'GetMeetMeReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'RMeetMe', 0)), frozenset({'sequence'}), None, False),
+    'GetMessageWaitingReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'RMessageWaiting', 0)), frozenset({'sequence'}), None, False),
+    'GetMlppDomainReq': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RMlppDomain', 0)), frozenset({'sequence'}), None, False),
+    'GetMobileSmartClientProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RMobileSmartClientProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetMobileVoiceAccessReq': ((('pattern', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RMobileVoiceAccess', 0)), frozenset({'sequence'}), None, False),
+    'GetMobilityProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RMobilityProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetMobilityReq': ((('handoffNumber', 'XFkType', 0), ('DTMFNumber', 'XFkType', 0), ('returnedTags', 'RMobility', 0)), frozenset(), None, False),
+    'GetMohAudioSourceReq': ((('sourceId', 'XMOHAudioSourceId', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RMohAudioSource', 0)), frozenset({'sequence'}), None, False),
+    'GetMohServerReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RMohServer', 0)), frozenset({'sequence'}), None, False),
+    'GetMraServiceDomainReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RMraServiceDomain', 0)), frozenset({'sequence'}), None, False),
+    'GetMtpReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RMtp', 0)), frozenset({'sequence'}), None, False),
+    'GetNetworkAccessProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RNetworkAccessProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetNumDevicesReq': ((('class', 'XClass', 1),), frozenset({'sequence'}), None, False),
+    'GetOSVersionReq': ((), frozenset(), None, False),
+    'GetPageLayoutPreferencesReq': ((('pageName', 'String100', 1), ('returnedTags', 'RPageLayoutPreferences', 0)), frozenset({'sequence'}), None, False),
+    'GetPhoneButtonTemplateReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RPhoneButtonTemplate', 0)), frozenset({'sequence'}), None, False),
+    'GetPhoneNtpReq': ((('uuid', 'XUUID', 0), ('ipAddress', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0), ('returnedTags', 'RPhoneNtp', 0)), frozenset({'sequence'}), None, False),
+    'GetPhoneOptionsReq': ((('uuid', 'XUUID', 0), ('returnedChoices', 'OXPhone', 0)), frozenset({'sequence'}), None, False),
+    'GetPhoneReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RPhone', 0)), frozenset({'sequence'}), None, False),
+    'GetPhoneSecurityProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RPhoneSecurityProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetPhoneTypeDisplayInstanceReq': ((('productName', 'String32', 1), ('protocol', 'String32', 1), ('trunkType', 'String32', 0)), frozenset({'sequence'}), None, False),
+    'GetPhysicalLocationReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RPhysicalLocation', 0)), frozenset({'sequence'}), None, False),
+    'GetPresenceGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RPresenceGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetPresenceRedundancyGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RPresenceRedundancyGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetProcessNodeReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RProcessNode', 0)), frozenset({'sequence'}), None, False),
+    'GetProcessNodeServiceReq': ((('uuid', 'XUUID', 0), ('processNodeName', 'XFkType', 0), ('service', 'XService', 0), ('returnedTags', 'RProcessNodeService', 0)), frozenset({'sequence'}), None, False),
+    'GetRecordingProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RRecordingProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetRegionReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RRegion', 0)), frozenset({'sequence'}), None, False),
+    'GetRegistrationDynamicReq': ((('device', 'XFkType', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RRegistrationDynamic', 0)), frozenset({'sequence'}), None, False),
+    'GetRemoteClusterReq': ((('clusterId', 'String255', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RRemoteCluster', 0)), frozenset({'sequence'}), None, False),
+    'GetRemoteDestinationProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RRemoteDestinationProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetRemoteDestinationReq': ((('destination', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RRemoteDestination', 0)), frozenset({'sequence'}), None, False),
+    'GetResourcePriorityNamespaceListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RResourcePriorityNamespaceList', 0)), frozenset({'sequence'}), None, False),
+    'GetResourcePriorityNamespaceReq': ((('namespace', 'String10', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RResourcePriorityNamespace', 0)), frozenset({'sequence'}), None, False),
+    'GetRouteFilterReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RRouteFilter', 0)), frozenset({'sequence'}), None, False),
+    'GetRouteGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RRouteGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetRouteListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RRouteList', 0)), frozenset({'sequence'}), None, False),
+    'GetRoutePartitionReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RRoutePartition', 0)), frozenset({'sequence'}), None, False),
+    'GetRoutePatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4), ('returnedTags', 'RRoutePattern', 0)), frozenset({'sequence'}), None, False),
+    'GetSIPNormalizationScriptReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSIPNormalizationScript', 0)), frozenset({'sequence'}), None, False),
+    'GetSNMPCommunityStringReq': ((('communityName', 'String32', 1),), frozenset({'sequence'}), None, False),
+    'GetSNMPMIB2ListReq': ((('sysContact', 'String32', 1),), frozenset({'sequence'}), None, False),
+    'GetSNMPUserReq': ((('userName', 'String32', 1),), frozenset({'sequence'}), None, False),
+    'GetSafCcdPurgeBlockLearnedRoutesReq': ((('uuid', 'XUUID', 0), ('learnedPattern', 'String50', 0), ('learnedPatternPrefix', 'String50', 0), ('callControlIdentity', 'String50', 0), ('ipAddress', 'String50', 0), ('returnedTags', 'RSafCcdPurgeBlockLearnedRoutes', 0)), frozenset({'sequence'}), None, False),
+    'GetSafForwarderReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSafForwarder', 0)), frozenset({'sequence'}), None, False),
+    'GetSafSecurityProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSafSecurityProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetSdpTransparencyProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSdpTransparencyProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetSecureConfigReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSecureConfig', 0)), frozenset({'sequence'}), None, False),
+    'GetServiceParameterReq': ((('uuid', 'XUUID', 0), ('processNodeName', 'XFkType', 0), ('name', 'xsd:string', 0), ('service', 'XService', 0), ('returnedTags', 'RServiceParameter', 0)), frozenset({'sequence'}), None, False),
+    'GetServiceProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RServiceProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetSipDialRulesReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSipDialRules', 0)), frozenset({'sequence'}), None, False),
+    'GetSipProfileOptionsReq': ((('uuid', 'XUUID', 0), ('returnedChoices', 'OXSipProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetSipProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSipProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetSipRealmReq': ((('realm', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSipRealm', 0)), frozenset({'sequence'}), None, False),
+    'GetSipRoutePatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('returnedTags', 'RSipRoutePattern', 0)), frozenset({'sequence'}), None, False),
+    'GetSipTrunkReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSipTrunk', 0)), frozenset({'sequence'}), None, False),
+    'GetSipTrunkSecurityProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSipTrunkSecurityProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetSmartLicenseStatusReq': ((), frozenset(), None, False),
+    'GetSoftKeySetReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSoftKeySet', 0)), frozenset({'sequence'}), None, False),
+    'GetSoftKeyTemplateReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSoftKeyTemplate', 0)), frozenset({'sequence'}), None, False),
+    'GetSrstReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RSrst', 0)), frozenset({'sequence'}), None, False),
+    'GetSyslogConfigurationReq': ((('serverName', 'xsd:string', 1), ('serviceGroup', 'XServiceGrouping', 1), ('service', 'xsd:string', 1), ('returnedTags', 'RSyslogConfiguration', 0)), frozenset({'sequence'}), None, False),
+    'GetTimePeriodReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RTimePeriod', 0)), frozenset({'sequence'}), None, False),
+    'GetTimeScheduleReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RTimeSchedule', 0)), frozenset({'sequence'}), None, False),
+    'GetTodAccessReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RTodAccess', 0)), frozenset({'sequence'}), None, False),
+    'GetTransPatternOptionsReq': ((('uuid', 'XUUID', 0), ('returnedChoices', 'OXTransPattern', 0)), frozenset({'sequence'}), None, False),
+    'GetTransPatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4), ('returnedTags', 'RTransPattern', 0)), frozenset({'sequence'}), None, False),
+    'GetTranscoderReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RTranscoder', 0)), frozenset({'sequence'}), None, False),
+    'GetTransformationProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RTransformationProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetTransportSettingsReq': ((), frozenset(), None, False),
+    'GetTvsCertificateReq': ((('uuid', 'XUUID', 0), ('issuerName', 'xsd:string', 0), ('serialNumber', 'xsd:string', 0), ('returnedTags', 'RTvsCertificate', 0)), frozenset({'sequence'}), None, False),
+    'GetUcServiceReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RUcService', 0)), frozenset({'sequence'}), None, False),
+    'GetUniversalDeviceTemplateReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RUniversalDeviceTemplate', 0)), frozenset({'sequence'}), None, False),
+    'GetUniversalLineTemplateReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RUniversalLineTemplate', 0)), frozenset({'sequence'}), None, False),
+    'GetUserGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RUserGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetUserProfileProvisionReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RUserProfileProvision', 0)), frozenset({'sequence'}), None, False),
+    'GetUserReq': ((('userid', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RUser', 0)), frozenset({'sequence'}), None, False),
+    'GetVg224Req': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RVg224', 0)), frozenset({'sequence'}), None, False),
+    'GetVohServerReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RVohServer', 0)), frozenset({'sequence'}), None, False),
+    'GetVoiceMailPilotReq': ((('uuid', 'XUUID', 0), ('dirn', 'String255', 4), ('cssName', 'XFkType', 4), ('returnedTags', 'RVoiceMailPilot', 0)), frozenset({'sequence'}), None, False),
+    'GetVoiceMailPortReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RVoiceMailPort', 0)), frozenset({'sequence'}), None, False),
+    'GetVoiceMailProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RVoiceMailProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetVpnGatewayReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RVpnGateway', 0)), frozenset({'sequence'}), None, False),
+    'GetVpnGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RVpnGroup', 0)), frozenset({'sequence'}), None, False),
+    'GetVpnProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RVpnProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetWLANProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RWLANProfile', 0)), frozenset({'sequence'}), None, False),
+    'GetWifiHotspotReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RWifiHotspot', 0)), frozenset({'sequence'}), None, False),
+    'GetWirelessAccessPointControllersReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RWirelessAccessPointControllers', 0)), frozenset({'sequence'}), None, False),
+    'GetWlanProfileGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('returnedTags', 'RWlanProfileGroup', 0)), frozenset({'sequence'}), None, False),
+    'LAarGroup': ((('name', 'String32', 0),), frozenset({'uuid'}), None, False),
+    'LAdvertisedPatterns': ((('description', 'xsd:string', 0), ('pattern', 'xsd:string', 0), ('patternType', 'XGlobalNumber', 0), ('hostedRoutePSTNRule', 'XHostedRoutePatternPSTNRule', 0), ('pstnFailStrip', 'XInteger', 0), ('pstnFailPrepend', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LAnnouncement': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('announcementFile', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LAnnunciator': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('serverName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LAppUser': ((('userid', 'xsd:string', 0), ('presenceGroupName', 'XFkType', 0), ('acceptPresenceSubscription', 'boolean', 0), ('acceptOutOfDialogRefer', 'boolean', 0), ('acceptUnsolicitedNotification', 'boolean', 0), ('allowReplaceHeader', 'boolean', 0), ('isStandard', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LApplicationDialRules': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('numberBeginWith', 'xsd:string', 0), ('numberOfDigits', 'XInteger', 0), ('digitsToBeRemoved', 'XInteger', 0), ('prefixPattern', 'xsd:string', 0), ('priority', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LApplicationServer': ((('appServerType', 'XAppServer', 0), ('name', 'xsd:string', 0), ('ipAddress', 'xsd:string', 0), ('url', 'xsd:string', 0), ('endUserUrl', 'xsd:string', 0), ('processNodeName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LApplicationUserCapfProfile': ((('applicationUser', 'XFkType', 0), ('instanceId', 'xsd:string', 0), ('certificateOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('operationCompletion', 'xsd:string', 0), ('certificationOperationStatus', 'XCertificateStatus', 0)), frozenset({'uuid'}), None, False),
+    'LAssignedPresenceServers': ((('name', 'String255', 0), ('description', 'String255', 0), ('nodeUsage', 'XNodeUsage', 0), ('numUsers', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LAssignedPresenceUsers': ((('userid', 'xsd:string', 0), ('server', 'XFkType', 0), ('presenceRedundancyGroup', 'String255', 0)), frozenset({'uuid'}), None, False),
+    'LAudioCodecPreferenceList': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LBillingServer': ((('hostName', 'xsd:string', 0), ('userId', 'xsd:string', 0), ('password', 'xsd:string', 0), ('directory', 'xsd:string', 0), ('resendOnFailure', 'boolean', 0), ('billingServerProtocol', 'XBillingserverprotocol', 0)), frozenset({'uuid'}), None, False),
+    'LBlockedLearnedPatterns': ((('description', 'xsd:string', 0), ('pattern', 'xsd:string', 0), ('prefix', 'xsd:string', 0), ('clusterId', 'xsd:string', 0), ('patternType', 'XGlobalNumber', 0)), frozenset({'uuid'}), None, False),
+    'LCCAProfiles': ((('ccaId', 'xsd:string', 0), ('primarySoftSwitchId', 'xsd:string', 0), ('secondarySoftSwitchId', 'xsd:string', 0), ('objectClass', 'xsd:string', 0), ('subscriberType', 'xsd:string', 0), ('sipAliasSuffix', 'xsd:string', 0), ('sipUserNameSuffix', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LCallManager': ((('name', 'String50', 0), ('description', 'String50', 0), ('autoRegistration', 'LCallManager.autoRegistration', 0), ('processNodeName', 'XFkType', 0), ('lbmGroup', 'XFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'LCallManager.autoRegistration': ((('startDn', 'String255', 0), ('endDn', 'String255', 0), ('nextDn', 'String255', 0), ('routePartitionName', 'XFkType', 0), ('e164Mask', 'String50', 0), ('autoRegistrationEnabled', 'boolean', 0), ('universalDeviceTemplate', 'XFkType', 0), ('lineTemplate', 'XFkType', 0)), frozenset(), None, False),
+    'LCallManagerGroup': ((('name', 'String50', 0), ('tftpDefault', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LCallPark': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('callManagerName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LCallPickupGroup': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('pickupNotification', 'XPickupNotification', 0), ('pickupNotificationTimer', 'XInteger', 0), ('callInfoForPickupNotification', 'LCallPickupGroup.callInfoForPickupNotification', 0), ('name', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LCallPickupGroup.callInfoForPickupNotification': ((('callingPartyInfo', 'boolean', 0), ('calledPartyInfo', 'boolean', 0)), frozenset(), None, False),
+    'LCalledPartyTracing': ((('directorynumber', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LCalledPartyTransformationPattern': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('calledPartyTransformationMask', 'xsd:string', 0), ('dialPlanName', 'XFkType', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('patternUrgency', 'boolean', 0), ('routeFilterName', 'XFkType', 0), ('calledPartyPrefixDigits', 'xsd:string', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('mlppPreemptionDisabled', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LCallerFilterList': ((('name', 'String50', 0), ('description', 'String128', 0), ('isAllowedType', 'boolean', 0), ('endUserIdName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LCallingPartyTransformationPattern': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('callingPartyTransformationMask', 'xsd:string', 0), ('useCallingPartyPhoneMask', 'XStatus', 0), ('dialPlanName', 'XFkType', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('patternUrgency', 'boolean', 0), ('callingPartyPrefixDigits', 'String50', 0), ('routeFilterName', 'XFkType', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('mlppPreemptionDisabled', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LCallsQueue': ((('maxCallersInQueue', 'XInteger', 0), ('queueFullDestination', 'String50', 0), ('callingSearchSpacePilotQueueFull', 'XFkType', 0), ('maxWaitTimeInQueue', 'XInteger', 0), ('maxWaitTimeDestination', 'String50', 0), ('callingSearchSpaceMaxWaitTime', 'XFkType', 0), ('noAgentDestination', 'String50', 0), ('callingSearchSpaceNoAgent', 'XFkType', 0), ('networkHoldMohAudioSourceID', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LCcdAdvertisingService': ((('name', 'String50', 0), ('description', 'String50', 0), ('isActivated', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LCcdHostedDN': ((('hostedPattern', 'String50', 0), ('description', 'String255', 0), ('CcdHostedDnGroup', 'XFkType', 0), ('pstnFailoverStripDigits', 'XInteger', 0), ('pstnFailoverPrependDigits', 'String255', 0), ('usePstnFailover', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LCcdHostedDNGroup': ((('name', 'String255', 0), ('description', 'String255', 0), ('pstnFailoverStripDigits', 'XInteger', 0), ('pstnFailoverPrependDigits', 'String255', 0), ('usePstnFailover', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LCiscoCatalyst600024PortFXSGateway': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('traceFlag', 'boolean', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('portSelectionOrder', 'XTrunkSelectionOrder', 0), ('transmitUtf8', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LCiscoCatalyst6000E1VoIPGateway': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('redirectInboundNumberIe', 'boolean', 0), ('calledPlan', 'XNumberingPlan', 0), ('calledPri', 'XPriOfNumber', 0), ('callerIdDn', 'String255', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingPlan', 'XNumberingPlan', 0), ('callingPri', 'XPriOfNumber', 0), ('chanIe', 'XPRIChanIE', 0), ('clockReference', 'XClockReference', 0), ('dChannelEnable', 'boolean', 0), ('channelSelectionOrder', 'XTrunkSelectionOrder', 0), ('displayIE', 'boolean', 0), ('pcmType', 'XEncode', 0), ('csuParam', 'XCSUParam', 0), ('firstDelay', 'XInteger', 0), ('interfaceIdPresent', 'boolean', 0), ('interfaceId', 'XInteger', 0), ('intraDelay', 'XInteger', 0), ('mcdnEnable', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('numDigitsToStrip', 'XInteger', 0), ('passingPrecedenceLevelThrough', 'boolean', 0), ('prefix', 'xsd:string', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('connectedLineIdPresentation', 'XPresentationBit', 0), ('priProtocol', 'XPriProtocol', 0), ('securityAccessLevel', 'XInteger', 0), ('sendCallingNameInFacilityIe', 'boolean', 0), ('sendExLeadingCharInDispIe', 'boolean', 0), ('sendRestart', 'boolean', 0), ('setupNonIsdnPi', 'boolean', 0), ('sigDigits', 'LCiscoCatalyst6000E1VoIPGateway.sigDigits', 0), ('span', 'XInteger', 0), ('statusPoll', 'boolean', 0), ('smdiBasePort', 'XInteger', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('transmitUtf8', 'boolean', 0), ('v150', 'boolean', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('QSIGVariant', 'XQSIGVariant', 0), ('unattendedPort', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('geoLocationFilterName', 'XFkType', 0), ('nationalStripDigits', 'XInteger', 0), ('internationalStripDigits', 'XInteger', 0), ('unknownStripDigits', 'XInteger', 0), ('subscriberStripDigits', 'XInteger', 0), ('nationalTransformationCssName', 'XFkType', 0), ('internationalTransformationCssName', 'XFkType', 0), ('unknownTransformationCssName', 'XFkType', 0), ('subscriberTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LCiscoCatalyst6000E1VoIPGateway.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'LCiscoCatalyst6000T1VoIPGatewayPri': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('mlppIndicationStatus', 'XStatus', 0), ('mlppPreemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('redirectInboundNumberIe', 'boolean', 0), ('calledPlan', 'XNumberingPlan', 0), ('calledPri', 'XPriOfNumber', 0), ('callerIdDn', 'String255', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingPlan', 'XNumberingPlan', 0), ('callingPri', 'XPriOfNumber', 0), ('chanIe', 'XPRIChanIE', 0), ('clockReference', 'XClockReference', 0), ('dChannelEnable', 'boolean', 0), ('channelSelectionOrder', 'XTrunkSelectionOrder', 0), ('displayIE', 'boolean', 0), ('pcmType', 'XEncode', 0), ('csuParam', 'XCSUParam', 0), ('firstDelay', 'XInteger', 0), ('interfaceIdPresent', 'boolean', 0), ('interfaceId', 'XInteger', 0), ('intraDelay', 'XInteger', 0), ('mcdnEnable', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('numDigitsToStrip', 'XInteger', 0), ('passingPrecedenceLevelThrough', 'boolean', 0), ('prefix', 'xsd:string', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('connectedLineIdPresentation', 'XPresentationBit', 0), ('priProtocol', 'XPriProtocol', 0), ('securityAccessLevel', 'XInteger', 0), ('sendCallingNameInFacilityIe', 'boolean', 0), ('sendExLeadingCharInDispIe', 'boolean', 0), ('sendRestart', 'boolean', 0), ('setupNonIsdnPi', 'boolean', 0), ('sigDigits', 'LCiscoCatalyst6000T1VoIPGatewayPri.sigDigits', 0), ('span', 'XInteger', 0), ('statusPoll', 'boolean', 0), ('smdiBasePort', 'XInteger', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('transmitUtf8', 'boolean', 0), ('v150', 'boolean', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('QSIGVariant', 'XQSIGVariant', 0), ('unattendedPort', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('geoLocationFilterName', 'XFkType', 0), ('nationalStripDigits', 'XInteger', 0), ('internationalStripDigits', 'XInteger', 0), ('unknownStripDigits', 'XInteger', 0), ('subscriberStripDigits', 'XInteger', 0), ('nationalTransformationCssName', 'XFkType', 0), ('internationalTransformationCssName', 'XFkType', 0), ('unknownTransformationCssName', 'XFkType', 0), ('subscriberTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LCiscoCatalyst6000T1VoIPGatewayPri.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'LCiscoCatalyst6000T1VoIPGatewayT1': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('traceFlag', 'boolean', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('sendGeoLocation', 'boolean', 0), ('trunkSelectionOrder', 'XTrunkSelectionOrder', 0), ('clockReference', 'XClockReference', 0), ('csuParam', 'XCSUParam', 0), ('digitSending', 'XDigitSending', 0), ('pcmType', 'XEncode', 0), ('fdlChannel', 'XFDLChannel', 0), ('yellowAlarm', 'XYellowAlarm', 0), ('zeroSupression', 'XZeroSuppression', 0), ('smdiBasePort', 'XInteger', 0), ('handleDtmfPrecedenceSignals', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LCiscoCloudOnboarding': ((('voucherExists', 'boolean', 0), ('enablePushNotifications', 'boolean', 0), ('enableHttpProxy', 'boolean', 0), ('httpProxyAddress', 'xsd:string', 0), ('proxyUsername', 'xsd:string', 0), ('proxyPassword', 'xsd:string', 0), ('enableTrustCACertificate', 'boolean', 0), ('allowAnalyticsCollection', 'boolean', 0), ('enableTroubleshooting', 'boolean', 0), ('alarmSendEncryptedData', 'boolean', 0), ('orgId', 'xsd:string', 0), ('alarmPushIntervalSecs', 'XInteger', 0), ('alarmEncryptKey', 'xsd:string', 0), ('serviceAddress', 'xsd:string', 0), ('onboardingRegistrationStatus', 'XOnboardingRegistrationStatus', 0), ('email', 'xsd:string', 0), ('partnerEmail', 'xsd:string', 0), ('orgName', 'xsd:string', 0), ('customerOneTimePassword', 'xsd:string', 0), ('alarmSeverity', 'XAlarmSeverity', 0), ('alarmPushNowToggle', 'XInteger', 0), ('enableGDSCommunication', 'boolean', 0), ('mraActivationDomain', 'xsd:string', 0), ('errorStatus', 'LCiscoCloudOnboarding.errorStatus', 0)), frozenset({'uuid'}), None, False),
+    'LCiscoCloudOnboarding.errorStatus': ((('status', 'xsd:string', 2),), frozenset(), None, False),
+    'LCmcInfo': ((('code', 'String16', 0), ('description', 'String50', 0)), frozenset({'uuid'}), None, False),
+    'LCommonDeviceConfig': ((('name', 'UniqueString50', 0), ('softkeyTemplateName', 'XFkType', 0), ('userLocale', 'XUserLocale', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('mlppIndicationStatus', 'XStatus', 0), ('useTrustedRelayPoint', 'boolean', 0), ('preemption', 'XPreemption', 0), ('ipAddressingMode', 'XIPAddressingMode', 0), ('ipAddressingModePreferenceControl', 'XIPAddressingModePrefControl', 0), ('allowAutoConfigurationForPhones', 'XStatus', 0), ('useImeForOutboundCalls', 'XStatus', 0), ('confidentialAccess', 'LCommonDeviceConfig.confidentialAccess', 0), ('allowDuplicateAddressDetection', 'XStatus', 0), ('acceptRedirectMessages', 'XStatus', 0), ('replyMulticastEchoRequest', 'XStatus', 0)), frozenset({'uuid'}), None, False),
+    'LCommonDeviceConfig.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'LCommonPhoneConfig': ((('name', 'UniqueString50', 0), ('description', 'String128', 0), ('dndOption', 'XDNDOption', 0), ('dndAlertingType', 'XRingSetting', 0), ('backgroundImage', 'boolean', 0), ('phonePersonalization', 'XPhonePersonalization', 0), ('phoneServiceDisplay', 'XPhoneServiceDisplay', 0), ('sshUserId', 'String50', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('vpnGroupName', 'XFkType', 0), ('vpnProfileName', 'XFkType', 0), ('featureControlPolicy', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LConferenceBridge': ((('name', 'UniqueName128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('subUnit', 'XInteger', 0), ('loadInformation', 'XLoadInformation', 0), ('maximumCapacity', 'XInteger', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('securityProfileName', 'XFkType', 0), ('destinationAddress', 'xsd:string', 0), ('mcuConferenceBridgeSipPort', 'XInteger', 0), ('sipProfile', 'XFkType', 0), ('srtpAllowed', 'boolean', 0), ('normalizationScript', 'XFkType', 0), ('enableTrace', 'boolean', 0), ('userName', 'xsd:string', 0), ('password', 'xsd:string', 0), ('httpPort', 'XInteger', 0), ('useHttps', 'boolean', 0), ('conferenceBridgePrefix', 'xsd:string', 0), ('allowCFBControlOfCallSecurityIcon', 'boolean', 0), ('overrideSIPTrunkAddress', 'boolean', 0), ('sipTrunkName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LConferenceNow': ((('conferenceNowNumber', 'xsd:string', 0), ('routePartitionName', 'XFkType', 0), ('description', 'xsd:string', 0), ('maxWaitTimeForHost', 'XInteger', 0), ('MohAudioSourceId', 'XMOHAudioSourceId', 0)), frozenset({'uuid'}), None, False),
+    'LCredentialPolicy': ((('name', 'String255', 0), ('failedLogon', 'XInteger', 0), ('resetFailedLogonAttempts', 'XInteger', 0), ('lockoutDuration', 'XInteger', 0), ('credChangeDuration', 'XInteger', 0), ('credExpiresAfter', 'XInteger', 0), ('minCredLength', 'XInteger', 0), ('prevCredStoredNum', 'XInteger', 0), ('inactiveDaysAllowed', 'XInteger', 0), ('expiryWarningDays', 'XInteger', 0), ('trivialCredCheck', 'boolean', 0), ('minCharsToChange', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LCss': ((('description', 'String50', 0), ('clause', 'String1024', 0), ('dialPlanWizardGenId', 'XInteger', 0), ('partitionUsage', 'XPartitionUsage', 0), ('name', 'UniqueString50', 0)), frozenset({'uuid'}), None, False),
+    'LCtiRoutePoint': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('userLocale', 'XUserLocale', 0)), frozenset({'uuid'}), None, False),
+    'LCumaServerSecurityProfile': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('securityMode', 'XDeviceSecurityMode', 0), ('transportType', 'XTransport', 0), ('x509SubjectName', 'xsd:string', 0), ('serverIpHostName', 'String255', 0)), frozenset({'uuid'}), None, False),
+    'LCustomUserField': ((('field', 'xsd:string', 0),), frozenset({'uuid'}), None, False),
+    'LCustomer': ((('name', 'xsd:string', 0), ('createTime', 'XInteger', 0), ('lastAuditTime', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LDateTimeGroup': ((('name', 'xsd:string', 0), ('timeZone', 'XTimeZone', 0), ('dateformat', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LDdi': ((('name', 'String50', 0), ('clause', 'String1024', 0), ('dialPlanName', 'XFkType', 0), ('digitAnalysisId', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LDefaultDeviceProfile': ((('name', 'UniqueString128', 0), ('description', 'String255', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userLocale', 'XUserLocale', 0), ('phoneButtonTemplate', 'XFkType', 0), ('softkeyTemplate', 'XFkType', 0), ('privacy', 'XStatus', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('ignorePi', 'boolean', 0), ('dndStatus', 'boolean', 0), ('dndRingSetting', 'XRingSetting', 0), ('dndOption', 'XDNDOption', 0), ('mlppIndication', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0)), frozenset({'uuid'}), None, False),
+    'LDeviceDefaults': ((('Model', 'XModel', 0), ('Protocol', 'XDeviceProtocol', 0), ('LoadInformation', 'XLoadInformation', 0), ('InactiveLoadInformation', 'XLoadInformation', 0), ('DevicePoolName', 'XFkType', 0), ('PhoneButtonTemplate', 'XFkType', 0), ('PreferActCodeOverAutoReg', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LDeviceMobility': ((('name', 'xsd:string', 0), ('subNetDetails', 'LDeviceMobility.subNetDetails', 0)), frozenset({'uuid'}), None, False),
+    'LDeviceMobility.subNetDetails': ((('ipv4SubNetDetails', 'LDeviceMobility.subNetDetails.ipv4SubNetDetails', 0), ('ipv6SubNetDetails', 'LDeviceMobility.subNetDetails.ipv6SubNetDetails', 0)), frozenset(), None, False),
+    'LDeviceMobility.subNetDetails.ipv4SubNetDetails': ((('ipv4Subnet', 'xsd:string', 0), ('ipv4SubNetMaskSz', 'XInteger', 0)), frozenset(), None, False),
+    'LDeviceMobility.subNetDetails.ipv6SubNetDetails': ((('ipv6Subnet', 'xsd:string', 0), ('ipv6SubNetMaskSz', 'XInteger', 0)), frozenset(), None, False),
+    'LDeviceMobilityGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LDevicePool': ((('name', 'UniqueString50', 0), ('autoSearchSpaceName', 'XFkType', 0), ('dateTimeSettingName', 'XFkType', 0), ('callManagerGroupName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('regionName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('srstName', 'XFkType', 0), ('connectionMonitorDuration', 'XInteger', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('mobilityCssName', 'XFkType', 0), ('physicalLocationName', 'XFkType', 0), ('deviceMobilityGroupName', 'XFkType', 0), ('revertPriority', 'XRevertPriority', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('localRouteGroupName', 'XFkType', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('callingPartyNationalPrefix', 'String16', 0), ('callingPartyInternationalPrefix', 'String16', 0), ('callingPartyUnknownPrefix', 'String16', 0), ('callingPartySubscriberPrefix', 'String16', 0), ('adjunctCallingSearchSpace', 'XFkType', 0), ('callingPartyNationalStripDigits', 'XInteger', 0), ('callingPartyInternationalStripDigits', 'XInteger', 0), ('callingPartyUnknownStripDigits', 'XInteger', 0), ('callingPartySubscriberStripDigits', 'XInteger', 0), ('callingPartyNationalTransformationCssName', 'XFkType', 0), ('callingPartyInternationalTransformationCssName', 'XFkType', 0), ('callingPartyUnknownTransformationCssName', 'XFkType', 0), ('callingPartySubscriberTransformationCssName', 'XFkType', 0), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 0), ('calledPartyInternationalStripDigits', 'XInteger', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartySubscriberStripDigits', 'XInteger', 0), ('calledPartyNationalTransformationCssName', 'XFkType', 0), ('calledPartyInternationalTransformationCssName', 'XFkType', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('calledPartySubscriberTransformationCssName', 'XFkType', 0), ('imeEnrolledPatternGroupName', 'XFkType', 0), ('localRouteGroup', 'LDevicePool.localRouteGroup', 2), ('mraServiceDomain', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LDevicePool.localRouteGroup': ((('name', 'xsd:string', 0), ('value', 'xsd:string', 0)), frozenset(), None, False),
+    'LDeviceProfile': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('traceFlag', 'boolean', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('phoneTemplateName', 'XFkType', 0), ('userLocale', 'XUserLocale', 0), ('defaultProfileName', 'String50', 0), ('currentProfileName', 'XFkType', 0), ('loginTime', 'XInteger', 0), ('loginDuration', 'XInteger', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('loginUserId', 'XFkType', 0), ('ignorePresentationIndicators', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndRingSetting', 'XRingSetting', 0), ('dndStatus', 'boolean', 0), ('emccCallingSearchSpace', 'XFkType', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('softkeyTemplateName', 'XFkType', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('currentConfig', 'LDeviceProfile.currentConfig', 0), ('featureControlPolicy', 'XFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'LDeviceProfile.currentConfig': ((('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('phoneTemplateName', 'XFkType', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('softkeyTemplateName', 'XFkType', 0), ('ignorePresentationIndicators', 'boolean', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('dndStatus', 'boolean', 0), ('dndRingSetting', 'XRingSetting', 0), ('dndOption', 'XDNDOption', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('emccCallingSearchSpaceName', 'XFkType', 0), ('deviceName', 'String255', 0), ('model', 'XModel', 0), ('product', 'XProduct', 0), ('deviceProtocol', 'XDeviceProtocol', 0), ('class', 'XClass', 0), ('addressMode', 'XIPAddressingMode', 0), ('allowAutoConfig', 'XStatus', 0), ('remoteSrstOption', 'String50', 0), ('remoteSrstIp', 'String15', 0), ('remoteSrstPort', 'XInteger', 0), ('remoteSipSrstIp', 'String15', 0), ('remoteSipSrstPort', 'XInteger', 0), ('geolocationInfo', 'String2048', 0), ('remoteLocationName', 'String50', 0)), frozenset(), None, False),
+    'LDhcpServer': ((('processNodeName', 'XFkType', 0), ('primaryDnsIpAddress', 'xsd:string', 0), ('secondaryDnsIpAddress', 'xsd:string', 0), ('primaryTftpServerIpAddress', 'xsd:string', 0), ('secondaryTftpServerIpAddress', 'xsd:string', 0), ('bootstrapServerIpAddress', 'xsd:string', 0), ('domainName', 'xsd:string', 0), ('tftpServerName', 'xsd:string', 0), ('arpCacheTimeout', 'XInteger', 0), ('ipAddressLeaseTime', 'XInteger', 0), ('renewalTime', 'XInteger', 0), ('rebindingTime', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LDhcpSubnet': ((('subnetIpAddress', 'xsd:string', 0), ('primaryStartIpAddress', 'xsd:string', 0), ('primaryEndIpAddress', 'xsd:string', 0), ('secondaryStartIpAddress', 'xsd:string', 0), ('secondaryEndIpAddress', 'xsd:string', 0), ('primaryRouterIpAddress', 'xsd:string', 0), ('secondaryRouterIpAddress', 'xsd:string', 0), ('subnetMask', 'xsd:string', 0), ('domainName', 'xsd:string', 0), ('primaryDnsIpAddress', 'xsd:string', 0), ('secondaryDnsIpAddress', 'xsd:string', 0), ('tftpServerName', 'xsd:string', 0), ('primaryTftpServerIpAddress', 'xsd:string', 0), ('secondaryTftpServerIpAddress', 'xsd:string', 0), ('bootstrapServerIpAddress', 'xsd:string', 0), ('arpCacheTimeout', 'XInteger', 0), ('ipAddressLeaseTime', 'XInteger', 0), ('renewalTime', 'XInteger', 0), ('rebindingTime', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LDialPlan': ((('name', 'String50', 0), ('description', 'String50', 0)), frozenset({'uuid'}), None, False),
+    'LDialPlanTag': ((('name', 'String50', 0), ('dialPlanName', 'XFkType', 0), ('operator', 'XOperator', 0), ('suppressFromRouteFilter', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LDirNumberAliasLookupandSync': ((('ldapConfigName', 'String50', 0), ('ldapManagerDisgName', 'String128', 0), ('ldapPassword', 'String128', 0), ('ldapUserSearch', 'String255', 0), ('ldapDirectoryServerUsage', 'XLDAPDirectoryFunction', 0), ('keepAliveSearch', 'xsd:string', 0), ('keepAliveTime', 'XKeepAliveTimeInterval', 0), ('sipAliasSuffix', 'xsd:string', 0), ('enableCachingofRecords', 'boolean', 0), ('cacheSizeforAliasLookup', 'XInteger', 0), ('cacheAgeforAliasLookup', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LDirectedCallPark': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('retrievalPrefix', 'xsd:string', 0), ('reversionPattern', 'xsd:string', 0), ('revertCssName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LDirectoryLookupDialRules': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('numberBeginWith', 'xsd:string', 0), ('numberOfDigits', 'XInteger', 0), ('digitsToBeRemoved', 'XInteger', 0), ('prefixPattern', 'xsd:string', 0), ('priority', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LE164AltNum': ((('numberMask', 'xsd:string', 0), ('addToLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 0), ('isUrgent', 'boolean', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LELINNumber': ((('pattern', 'String16', 0), ('partition', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LElinGroup': ((('name', 'UniqueString50', 0), ('elinNumbers', 'LElinGroup.elinNumbers', 0)), frozenset({'uuid'}), None, False),
+    'LElinGroup.elinNumbers': ((('elinNumber', 'LELINNumber', 2),), frozenset(), None, False),
+    'LEndUserCapfProfile': ((('endUserId', 'XFkType', 0), ('instanceId', 'xsd:string', 0), ('certificationOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('operationCompletion', 'xsd:string', 0), ('certificationOperationStatus', 'XCertificateStatus', 0)), frozenset({'uuid'}), None, False),
+    'LEnterpriseAltNum': ((('numberMask', 'xsd:string', 0), ('addToLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 0), ('isUrgent', 'boolean', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LEnterpriseFeatureAccessConfiguration': ((('pattern', 'String16', 0), ('routePartitionName', 'XFkType', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LExpresswayCConfiguration': ((('HostNameOrIP', 'String255', 0), ('description', 'String50', 0), ('X509SubjectNameorSubjectAlternateName', 'String4096', 0)), frozenset({'uuid'}), None, False),
+    'LExternalCallControlProfile': ((('name', 'String50', 0), ('primaryUri', 'String255', 0), ('secondaryUri', 'String255', 0), ('enableLoadBalancing', 'boolean', 0), ('routingRequestTimer', 'XInteger', 0), ('diversionReroutingCssName', 'XFkType', 0), ('callTreatmentOnFailure', 'XCallTreatmentOnFailure', 0)), frozenset({'uuid'}), None, False),
+    'LFacInfo': ((('name', 'String50', 0), ('code', 'String16', 0), ('authorizationLevel', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LFallbackProfile': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('advertisedFallbackDirectoryE164Number', 'xsd:string', 0), ('qosSensistivityLevel', 'XInteger', 0), ('callCss', 'XFallBackCSSSelection', 0), ('callAnswerTimer', 'XInteger', 0), ('directoryNumberPartition', 'XFkType', 0), ('directoryNumber', 'String16', 0), ('numberOfDigitsForCallerIDPartialMatch', 'XInteger', 0), ('numberOfCorrelationDtmfDigits', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LFeatureControlPolicy': ((('name', 'String50', 0), ('description', 'String100', 0)), frozenset({'uuid'}), None, False),
+    'LFeatureGroupTemplate': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('homeCluster', 'boolean', 0), ('imAndUcPresenceEnable', 'boolean', 0), ('serviceProfile', 'XFkType', 0), ('enableUserToHostConferenceNow', 'boolean', 0), ('allowCTIControl', 'boolean', 0), ('enableEMCC', 'boolean', 0), ('enableMobility', 'boolean', 0), ('enableMobileVoiceAccess', 'boolean', 0), ('maxDeskPickupWait', 'XInteger', 0), ('remoteDestinationLimit', 'XInteger', 0), ('BLFPresenceGp', 'XFkType', 0), ('subscribeCallingSearch', 'XFkType', 0), ('userLocale', 'XUserLocale', 0), ('userProfile', 'XFkType', 0), ('meetingInformation', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LGatekeeper': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('rrqTimeToLive', 'XInteger', 0), ('retryTimeout', 'XInteger', 0), ('enableDevice', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LGateway': ((('domainName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('product', 'XProduct', 0), ('protocol', 'XDeviceProtocol', 0), ('callManagerGroupName', 'XFkType', 0), ('scratch', 'xsd:string', 0), ('loadInformation', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LGeoLocation': ((('name', 'String50', 0), ('country', 'xsd:string', 0), ('description', 'String255', 0), ('nationalSubDivision', 'String100', 0), ('district', 'String255', 0), ('communityName', 'String255', 0), ('cityDivision', 'String255', 0), ('neighbourhood', 'String255', 0), ('street', 'String255', 0), ('leadingStreetDirection', 'String50', 0), ('trailingStreetSuffix', 'String50', 0), ('streetSuffix', 'String255', 0), ('houseNumber', 'String16', 0), ('houseNumberSuffix', 'String100', 0), ('landmark', 'String255', 0), ('location', 'String255', 0), ('floor', 'String16', 0), ('occupantName', 'String255', 0), ('postalCode', 'String100', 0)), frozenset({'uuid'}), None, False),
+    'LGeoLocationFilter': ((('name', 'String50', 0), ('description', 'String255', 0), ('useCountry', 'boolean', 0), ('useNationalSubDivision', 'boolean', 0), ('useDistrict', 'boolean', 0), ('useCommunityName', 'boolean', 0), ('useCityDivision', 'boolean', 0), ('useNeighbourhood', 'boolean', 0), ('useStreet', 'boolean', 0), ('useLeadingStreetDirection', 'boolean', 0), ('useTrailingStreetSuffix', 'boolean', 0), ('useStreetSuffix', 'boolean', 0), ('useHouseNumber', 'boolean', 0), ('useHouseNumberSuffix', 'boolean', 0), ('useLandmark', 'boolean', 0), ('useLocation', 'boolean', 0), ('useFloor', 'boolean', 0), ('useOccupantName', 'boolean', 0), ('usePostalCode', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LGeoLocationPolicy': ((('name', 'String50', 0), ('country', 'xsd:string', 0), ('description', 'String255', 0), ('nationalSubDivision', 'String100', 0), ('district', 'String255', 0), ('communityName', 'String255', 0), ('cityDivision', 'String255', 0), ('neighbourhood', 'String255', 0), ('street', 'String255', 0), ('leadingStreetDirection', 'String50', 0), ('trailingStreetSuffix', 'String50', 0), ('streetSuffix', 'String255', 0), ('houseNumber', 'String16', 0), ('houseNumberSuffix', 'String100', 0), ('landmark', 'String255', 0), ('location', 'String255', 0), ('floor', 'String16', 0), ('occupantName', 'String255', 0), ('postalCode', 'String100', 0)), frozenset({'uuid'}), None, False),
+    'LH323Gateway': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('pathReplacementSupport', 'boolean', 0), ('traceFlag', 'boolean', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('srtpAllowed', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('callerIdDn', 'String50', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('enableInboundFaststart', 'boolean', 0), ('enableOutboundFaststart', 'boolean', 0), ('codecForOutboundFaststart', 'XMediaPayload', 0), ('transmitUtf8', 'boolean', 0), ('signalingPort', 'XInteger', 0), ('allowH235PassThrough', 'boolean', 0), ('sigDigits', 'LH323Gateway.sigDigits', 0), ('prefixDn', 'String50', 0), ('calledPartyIeNumberType', 'XPriOfNumber', 0), ('callingPartyIeNumberType', 'XPriOfNumber', 0), ('calledNumberingPlan', 'XNumberingPlan', 0), ('callingNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNationalPrefix', 'String16', 0), ('callingPartyInternationalPrefix', 'String16', 0), ('callingPartyUnknownPrefix', 'String16', 0), ('callingPartySubscriberPrefix', 'String16', 0), ('callingPartyNationalStripDigits', 'XInteger', 0), ('callingPartyInternationalStripDigits', 'XInteger', 0), ('callingPartyUnknownStripDigits', 'XInteger', 0), ('callingPartySubscriberStripDigits', 'XInteger', 0), ('callingPartyNationalTransformationCssName', 'XFkType', 0), ('callingPartyInternationalTransformationCssName', 'XFkType', 0), ('callingPartyUnknownTransformationCssName', 'XFkType', 0), ('callingPartySubscriberTransformationCssName', 'XFkType', 0), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 0), ('calledPartyInternationalStripDigits', 'XInteger', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartySubscriberStripDigits', 'XInteger', 0), ('calledPartyNationalTransformationCssName', 'XFkType', 0), ('calledPartyInternationalTransformationCssName', 'XFkType', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('calledPartySubscriberTransformationCssName', 'XFkType', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('displayIeDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('confidentialAccess', 'LH323Gateway.confidentialAccess', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'LH323Gateway.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'LH323Gateway.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'LH323Phone': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('commonPhoneConfigName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('traceFlag', 'boolean', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('remoteDevice', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('srtpAllowed', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('mtpRequired', 'boolean', 0), ('mtpPreferredCodec', 'XSIPCodec', 0), ('callerIdDn', 'String50', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('displayIEDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('hlogStatus', 'boolean', 0), ('ownerUserName', 'XFkType', 0), ('signalingPort', 'XInteger', 0), ('ignorePresentationIndicators', 'boolean', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'LH323Trunk': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('traceFlag', 'boolean', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('sendGeoLocation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('srtpAllowed', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('callerIdDn', 'String50', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('displayIEDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('enableInboundFaststart', 'boolean', 0), ('enableOutboundFaststart', 'boolean', 0), ('codecForOutboundFaststart', 'XMediaPayload', 0), ('allowH235PassThrough', 'boolean', 0), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('transmitUtf8', 'boolean', 0), ('signalingPort', 'XInteger', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('sigDigits', 'LH323Trunk.sigDigits', 0), ('prefixDn', 'String50', 0), ('calledPartyIeNumberType', 'XPriOfNumber', 0), ('callingPartyIeNumberType', 'XPriOfNumber', 0), ('calledNumberingPlan', 'XNumberingPlan', 0), ('callingNumberingPlan', 'XNumberingPlan', 0), ('pathReplacementSupport', 'boolean', 0), ('gateKeeperInfo', 'LH323Trunk.gateKeeperInfo', 0), ('ictPassingPrecedenceLevelThroughUuie', 'boolean', 0), ('ictSecurityAccessLevel', 'XInteger', 0), ('isSafEnabled', 'boolean', 0), ('callingPartyNationalStripDigits', 'XInteger', 0), ('callingPartyInternationalStripDigits', 'XInteger', 0), ('callingPartyUnknownStripDigits', 'XInteger', 0), ('callingPartySubscriberStripDigits', 'XInteger', 0), ('callingPartyNationalTransformationCssName', 'XFkType', 0), ('callingPartyInternationalTransformationCssName', 'XFkType', 0), ('callingPartyUnknownTransformationCssName', 'XFkType', 0), ('callingPartySubscriberTransformationCssName', 'XFkType', 0), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('calledPartyNationalStripDigits', 'XInteger', 0), ('calledPartyInternationalStripDigits', 'XInteger', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartySubscriberStripDigits', 'XInteger', 0), ('calledPartyNationalTransformationCssName', 'XFkType', 0), ('calledPartyInternationalTransformationCssName', 'XFkType', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('calledPartySubscriberTransformationCssName', 'XFkType', 0), ('runOnEveryNode', 'boolean', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('confidentialAccess', 'LH323Trunk.confidentialAccess', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'LH323Trunk.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'LH323Trunk.gateKeeperInfo': ((('gateKeeper', 'XFkType', 0), ('terminalType', 'XTerminal', 0), ('technologyPrefix', 'String50', 0), ('zone', 'String50', 0)), frozenset(), None, False),
+    'LH323Trunk.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'LHuntList': ((('description', 'xsd:string', 0), ('callManagerGroupName', 'XFkType', 0), ('routeListEnabled', 'boolean', 0), ('voiceMailUsage', 'boolean', 0), ('name', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LHuntPilot': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('blockEnable', 'boolean', 0), ('calledPartyTransformationMask', 'xsd:string', 0), ('callingPartyTransformationMask', 'xsd:string', 0), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 0), ('dialPlanName', 'XFkType', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 0), ('routeFilterName', 'XFkType', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('huntListName', 'XFkType', 0), ('parkMonForwardNoRetrieve', 'LHuntPilot.parkMonForwardNoRetrieve', 0), ('alertingName', 'String50', 0), ('asciiAlertingName', 'String32', 0), ('aarNeighborhoodName', 'XFkType', 0), ('forwardHuntNoAnswer', 'LHuntPilot.forwardHuntNoAnswer', 0), ('forwardHuntBusy', 'LHuntPilot.forwardHuntBusy', 0), ('callPickupGroupName', 'XFkType', 0), ('maxHuntduration', 'XInteger', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('displayConnectedNumber', 'boolean', 0), ('queueCalls', 'LCallsQueue', 0)), frozenset({'uuid'}), None, False),
+    'LHuntPilot.forwardHuntBusy': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'xsd:string', 0), ('callingSearchSpaceName', 'XFkType', 0)), frozenset(), None, False),
+    'LHuntPilot.forwardHuntNoAnswer': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'xsd:string', 0), ('callingSearchSpaceName', 'XFkType', 0)), frozenset(), None, False),
+    'LHuntPilot.parkMonForwardNoRetrieve': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'String50', 0), ('callingSearchSpaceName', 'XFkType', 0)), frozenset(), None, False),
+    'LImeClient': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('domain', 'String255', 0), ('isActivated', 'boolean', 0), ('sipTrunkName', 'XFkType', 0), ('primaryImeServerName', 'XFkType', 0), ('secondaryImeServerName', 'XFkType', 0), ('learnedRouteFilterGroupName', 'XFkType', 0), ('exclusionNumberGroupName', 'XFkType', 0), ('firewallName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LImeE164Transformation': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('isCgpnPreTransformation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('isCdpnPreTransformation', 'boolean', 0), ('incomingCgpnTransformationProfileName', 'XFkType', 0), ('incomingCdpnTransformationProfileName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LImeEnrolledPattern': ((('pattern', 'String16', 0), ('description', 'xsd:string', 0), ('imeEnrolledPatternGroupName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LImeEnrolledPatternGroup': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('fallbackProfileName', 'XFkType', 0), ('isPatternAllAlias', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LImeExclusionNumber': ((('pattern', 'String16', 0), ('description', 'xsd:string', 0), ('imeExclusionNumberGroupName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LImeExclusionNumberGroup': ((('name', 'String50', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LImeFirewall': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('ipAddress', 'String15', 0), ('port', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LImeRouteFilterElement': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('elementType', 'XViprFilterElement', 0), ('imeRouteFilterGroupName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LImeRouteFilterGroup': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('groupTrustSetting', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LImeServer': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('ipAddress', 'xsd:string', 0), ('port', 'XInteger', 0), ('deviceSecurityMode', 'XServerSecurityMode', 0), ('applicationUser', 'XFkType', 0), ('reconnectInterval', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LImportedDirectoryUriCatalogs': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routeString', 'xsd:string', 0), ('lastLoadedFileName', 'xsd:string', 0), ('fileLoadDateTime', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LInfrastructureDevice': ((('name', 'xsd:string', 0), ('ipv4Address', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0), ('bssidWithMask', 'xsd:string', 0), ('wapLocation', 'xsd:string', 0), ('isActive', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LIpPhoneServices': ((('serviceName', 'UniqueString128', 0), ('asciiServiceName', 'UniqueString128', 0), ('serviceDescription', 'String128', 0), ('serviceUrl', 'xsd:string', 0), ('secureServiceUrl', 'xsd:string', 0), ('serviceCategory', 'XPhoneServiceCategory', 0), ('serviceType', 'XPhoneService', 0), ('serviceVendor', 'xsd:string', 0), ('serviceVersion', 'xsd:string', 0), ('enabled', 'boolean', 0), ('enterpriseSubscription', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LIvrUserLocale': ((('userLocale', 'XUserLocale', 0), ('orderIndex', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LLbmGroup': ((('name', 'xsd:string', 0), ('Description', 'xsd:string', 0), ('ProcessnodeActive', 'XFkType', 0), ('ProcessnodeStandby', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LLbmHubGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('member1', 'xsd:string', 0), ('member2', 'xsd:string', 0), ('member3', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LLdapDirectory': ((('name', 'String50', 0), ('ldapDn', 'String128', 0), ('userSearchBase', 'String255', 0), ('repeatable', 'boolean', 0), ('intervalValue', 'XInteger', 0), ('scheduleUnit', 'XScheduleUnit', 0), ('nextExecTime', 'String32', 0), ('accessControlGroupInfo', 'LLdapDirectory.accessControlGroupInfo', 0)), frozenset({'uuid'}), None, False),
+    'LLdapDirectory.accessControlGroupInfo': ((('accessControlGroupName', 'LLdapDirectory.accessControlGroupInfo.accessControlGroupName', 2),), frozenset(), None, False),
+    'LLdapDirectory.accessControlGroupInfo.accessControlGroupName': ((('accessControlGroup', 'xsd:string', 0),), frozenset(), None, False),
+    'LLdapFilter': ((('name', 'String4096', 0), ('filter', 'String255', 0)), frozenset({'uuid'}), None, False),
+    'LLdapSearch': ((('enableDirectorySearch', 'boolean', 0), ('distinguishedName', 'String128', 0), ('userSearchBase1', 'String255', 0), ('userSearchBase2', 'String255', 0), ('userSearchBase3', 'String255', 0), ('enableRecursiveSearch', 'boolean', 0), ('primary', 'XFkType', 0), ('secondary', 'XFkType', 0), ('tertiary', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LLicensedUser': ((('userId', 'xsd:string', 0), ('firstName', 'xsd:string', 0), ('lastName', 'xsd:string', 0), ('snrEnabled', 'xsd:string', 0), ('emEnabled', 'xsd:string', 0), ('deviceCount', 'xsd:string', 0), ('licenseType', 'xsd:string', 0), ('licenseUsed', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LLine': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('aarDestinationMask', 'String128', 0), ('aarKeepCallHistory', 'boolean', 0), ('aarVoiceMailEnabled', 'boolean', 0), ('callPickupGroupName', 'XFkType', 0), ('autoAnswer', 'XAutoAnswer', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('callingIdPresentationWhenDiverted', 'XPresentationBit', 0), ('alertingName', 'String50', 0), ('asciiAlertingName', 'String32', 0), ('presenceGroupName', 'XFkType', 0), ('shareLineAppearanceCssName', 'XFkType', 0), ('voiceMailProfileName', 'XFkType', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('hrDuration', 'XInteger', 0), ('hrInterval', 'XInteger', 0), ('cfaCssPolicy', 'XCFACSSActivationPolicy', 0), ('defaultActivatedDeviceName', 'XFkType', 0), ('parkMonForwardNoRetrieveDn', 'String50', 0), ('parkMonForwardNoRetrieveIntDn', 'String50', 0), ('parkMonForwardNoRetrieveVmEnabled', 'boolean', 0), ('parkMonForwardNoRetrieveIntVmEnabled', 'boolean', 0), ('parkMonForwardNoRetrieveCssName', 'XFkType', 0), ('parkMonForwardNoRetrieveIntCssName', 'XFkType', 0), ('parkMonReversionTimer', 'XInteger', 0), ('partyEntranceTone', 'XStatus', 0), ('allowCtiControlFlag', 'boolean', 0), ('rejectAnonymousCall', 'boolean', 0), ('confidentialAccess', 'LLine.confidentialAccess', 0), ('externalCallControlProfile', 'XFkType', 0), ('enterpriseAltNum', 'LLine.enterpriseAltNum', 0), ('e164AltNum', 'LLine.e164AltNum', 0), ('pstnFailover', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LLine.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'LLine.e164AltNum': ((('numMask', 'xsd:string', 0), ('isUrgent', 'boolean', 0), ('addLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'LLine.enterpriseAltNum': ((('numMask', 'xsd:string', 0), ('isUrgent', 'boolean', 0), ('addLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'LLineGroup': ((('distributionAlgorithm', 'XDistributeAlgorithm', 0), ('rnaReversionTimeOut', 'XInteger', 0), ('huntAlgorithmNoAnswer', 'XHuntAlgorithm', 0), ('huntAlgorithmBusy', 'XHuntAlgorithm', 0), ('huntAlgorithmNotAvailable', 'XHuntAlgorithm', 0), ('name', 'xsd:string', 0), ('autoLogOffHunt', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LLocalRouteGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LLocation': ((('name', 'String50', 0), ('id', 'XInteger', 0), ('withinAudioBandwidth', 'XInteger', 0), ('withinVideoBandwidth', 'XInteger', 0), ('withinImmersiveKbits', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LMediaResourceGroup': ((('name', 'String50', 0), ('description', 'String50', 0), ('multicast', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LMediaResourceList': ((('name', 'String50', 0), ('clause', 'String1024', 0)), frozenset({'uuid'}), None, False),
+    'LMeetMe': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('minimumSecurityLevel', 'XDeviceSecurityMode', 0)), frozenset({'uuid'}), None, False),
+    'LMessageWaiting': ((('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 0), ('description', 'String128', 0), ('messageWaitingIndicator', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LMlppDomain': ((('domainName', 'xsd:string', 0), ('domainId', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LMobileSmartClientProfile': ((('name', 'xsd:string', 0), ('mobileSmartClient', 'XMobileSmartClient', 0), ('enableSnrUri', 'xsd:string', 0), ('enableCFAUri', 'xsd:string', 0), ('handOffUri', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LMobilityProfile': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('mobileClientCallingOption', 'XDialViaOffice', 0), ('dvofServiceAccessNumber', 'xsd:string', 0), ('dvorCallerId', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LMohAudioSource': ((('sourceId', 'XMOHAudioSourceId', 0), ('name', 'String50', 0), ('sourceFile', 'String255', 0), ('multicast', 'boolean', 0), ('mohFileStatus', 'XInteger', 0), ('initialAnnouncement', 'XFkType', 0), ('periodicAnnouncement', 'XFkType', 0), ('periodicAnnouncementInterval', 'XInteger', 0), ('localeAnnouncement', 'XUserLocale', 0), ('initialAnnouncementPlayed', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LMohServer': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('processNodeName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('maxUnicastConnections', 'XInteger', 0), ('maxMulticastConnections', 'XInteger', 0), ('fixedAudioSourceDevice', 'xsd:string', 0), ('runFlag', 'boolean', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('isMultiCastEnabled', 'boolean', 0), ('baseMulticastIpaddress', 'xsd:string', 0), ('baseMulticastPort', 'XInteger', 0), ('multicastIncrementOnIp', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LMraServiceDomain': ((('name', 'xsd:string', 0), ('isDefault', 'boolean', 0), ('serviceDomains', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LMtp': ((('mtpType', 'XProduct', 0), ('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'XFkType', 0), ('trustedRelayPoint', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LNetworkAccessProfile': ((('name', 'UniqueString128', 0), ('description', 'String255', 0)), frozenset({'uuid'}), None, False),
+    'LPhone': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('commonPhoneConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('traceFlag', 'boolean', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('securityProfileName', 'XFkType', 0), ('sipProfileName', 'XFkType', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('sendGeoLocation', 'boolean', 0), ('numberOfButtons', 'XInteger', 0), ('phoneTemplateName', 'XFkType', 0), ('primaryPhoneName', 'XFkType', 0), ('ringSettingIdleBlfAudibleAlert', 'XStatus', 0), ('ringSettingBusyBlfAudibleAlert', 'XStatus', 0), ('userLocale', 'XUserLocale', 0), ('networkLocale', 'XCountry', 0), ('idleTimeout', 'XInteger', 0), ('authenticationUrl', 'xsd:string', 0), ('directoryUrl', 'xsd:string', 0), ('idleUrl', 'xsd:string', 0), ('informationUrl', 'xsd:string', 0), ('messagesUrl', 'xsd:string', 0), ('proxyServerUrl', 'xsd:string', 0), ('servicesUrl', 'xsd:string', 0), ('softkeyTemplateName', 'XFkType', 0), ('loginUserId', 'String255', 0), ('defaultProfileName', 'XFkType', 0), ('enableExtensionMobility', 'boolean', 0), ('currentProfileName', 'XFkType', 0), ('loginTime', 'XInteger', 0), ('loginDuration', 'XInteger', 0), ('currentConfig', 'LPhone.currentConfig', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('builtInBridgeStatus', 'XStatus', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('hlogStatus', 'XStatus', 0), ('ownerUserName', 'XFkType', 0), ('ignorePresentationIndicators', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('rerouteCallingSearchSpaceName', 'XFkType', 0), ('allowCtiControlFlag', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('unattendedPort', 'boolean', 0), ('requireDtmfReception', 'boolean', 0), ('rfc2833Disabled', 'boolean', 0), ('certificateOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('authenticationString', 'String128', 0), ('certificateStatus', 'XCertificateStatus', 0), ('upgradeFinishTime', 'xsd:string', 0), ('deviceMobilityMode', 'XStatus', 0), ('roamingDevicePoolName', 'XFkType', 0), ('remoteDevice', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndRingSetting', 'XRingSetting', 0), ('dndStatus', 'boolean', 0), ('isActive', 'boolean', 0), ('isDualMode', 'boolean', 0), ('mobilityUserIdName', 'XFkType', 0), ('phoneSuite', 'XPhonePersonalization', 0), ('phoneServiceDisplay', 'XPhoneServiceDisplay', 0), ('isProtected', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('mtpPreferedCodec', 'XSIPCodec', 0), ('dialRulesName', 'XFkType', 0), ('sshUserId', 'String50', 0), ('digestUser', 'String255', 0), ('outboundCallRollover', 'XOutboundCallRollover', 0), ('hotlineDevice', 'boolean', 0), ('secureInformationUrl', 'String255', 0), ('secureDirectoryUrl', 'String255', 0), ('secureMessageUrl', 'String255', 0), ('secureServicesUrl', 'String255', 0), ('secureAuthenticationUrl', 'String255', 0), ('secureIdleUrl', 'String255', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('featureControlPolicy', 'XFkType', 0), ('deviceTrustMode', 'XDeviceTrustMode', 0), ('earlyOfferSupportForVoiceCall', 'boolean', 0), ('requireThirdPartyRegistration', 'boolean', 0), ('blockIncomingCallsWhenRoaming', 'boolean', 0), ('homeNetworkId', 'xsd:string', 0), ('AllowPresentationSharingUsingBfcp', 'boolean', 0), ('confidentialAccess', 'LPhone.confidentialAccess', 0), ('requireOffPremiseLocation', 'boolean', 0), ('allowiXApplicableMedia', 'boolean', 0), ('enableCallRoutingToRdWhenNoneIsActive', 'boolean', 0), ('enableActivationID', 'boolean', 0), ('mraServiceDomain', 'XFkType', 0), ('allowMraMode', 'boolean', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'LPhone.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'LPhone.currentConfig': ((('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('phoneTemplateName', 'XFkType', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('softkeyTemplateName', 'XFkType', 0), ('ignorePresentationIndicators', 'boolean', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('dndStatus', 'boolean', 0), ('dndRingSetting', 'XRingSetting', 0), ('dndOption', 'XDNDOption', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('emccCallingSearchSpaceName', 'XFkType', 0), ('deviceName', 'String255', 0), ('model', 'XModel', 0), ('product', 'XProduct', 0), ('deviceProtocol', 'XDeviceProtocol', 0), ('class', 'XClass', 0), ('addressMode', 'XIPAddressingMode', 0), ('allowAutoConfig', 'XStatus', 0), ('remoteSrstOption', 'String50', 0), ('remoteSrstIp', 'String15', 0), ('remoteSrstPort', 'XInteger', 0), ('remoteSipSrstIp', 'String15', 0), ('remoteSipSrstPort', 'XInteger', 0), ('geolocationInfo', 'String2048', 0), ('remoteLocationName', 'String50', 0)), frozenset(), None, False),
+    'LPhoneActivationCode': ((('activationCode', 'String255', 0), ('activationCodeExpiry', 'XInteger', 0), ('phoneName', 'String255', 0), ('phoneDescription', 'String255', 0), ('phoneModel', 'XModel', 0), ('enableActivationId', 'boolean', 0), ('userId', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LPhoneButtonTemplate': ((('name', 'xsd:string', 0), ('isUserModifiable', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LPhoneNtp': ((('ipAddress', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0), ('description', 'xsd:string', 0), ('mode', 'XZzntpmode', 0)), frozenset({'uuid'}), None, False),
+    'LPhoneSecurityProfile': ((('phoneType', 'XModel', 0), ('protocol', 'XDeviceProtocol', 0), ('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('deviceSecurityMode', 'XDeviceSecurityMode', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('tftpEncryptedConfig', 'boolean', 0), ('EnableOAuthAuthentication', 'boolean', 0), ('nonceValidityTime', 'XInteger', 0), ('transportType', 'XTransport', 0), ('sipPhonePort', 'XInteger', 0), ('enableDigestAuthentication', 'boolean', 0), ('excludeDigestCredentials', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LPhysicalLocation': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LPresenceGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LPresenceRedundancyGroup': ((('name', 'String255', 0), ('description', 'String255', 0), ('server1', 'XFkType', 0), ('server2', 'XFkType', 0), ('haEnabled', 'boolean', 0), ('numUsers', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LProcessNode': ((('name', 'String255', 0), ('description', 'String50', 0), ('mac', 'XMacAddress', 0), ('ipv6Name', 'xsd:string', 0), ('nodeUsage', 'XNodeUsage', 0), ('lbmHubGroup', 'XFkType', 0), ('processNodeRole', 'XProcessNodeRole', 0)), frozenset({'uuid'}), None, False),
+    'LProcessNodeService': ((('processNodeName', 'XFkType', 0), ('service', 'XService', 0), ('traceLevel', 'XInteger', 0), ('userCategories', 'XInteger', 0), ('enable', 'boolean', 0), ('numFiles', 'XInteger', 0), ('maxFileSize', 'XInteger', 0), ('isActive', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LRecordingProfile': ((('name', 'String50', 0), ('recordingCssName', 'XFkType', 0), ('recorderDestination', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LRegion': ((('name', 'String50', 0), ('defaultCodec', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LRegistrationDynamic': ((('device', 'XFkType', 0), ('lastKnownIpAddress', 'xsd:string', 0), ('lastKnownUcm', 'xsd:string', 0), ('lastKnownConfigVersion', 'xsd:string', 0), ('locationDetails', 'xsd:string', 0), ('endpointConnection', 'XEndpointConnection', 0), ('portOrSsid', 'xsd:string', 0), ('lastSeen', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LRemoteCluster': ((('clusterId', 'String255', 0), ('description', 'xsd:string', 0), ('fullyQualifiedName', 'String50', 0), ('emcc', 'LRemoteClusterMember', 0), ('pstnAccess', 'LRemoteClusterMember', 0), ('rsvpAgent', 'LRemoteClusterMember', 0), ('tftp', 'LRemoteClusterMember', 0), ('lbm', 'LRemoteClusterMember', 0), ('uds', 'LRemoteClusterMember', 0)), frozenset({'uuid'}), None, False),
+    'LRemoteClusterMember': ((('enabled', 'boolean', 0), ('remoteIpAddress1', 'String15', 0), ('remoteIpAddress2', 'String15', 0), ('remoteIpAddress3', 'String15', 0)), frozenset(), None, False),
+    'LRemoteDestination': ((('name', 'xsd:string', 0), ('destination', 'xsd:string', 0), ('answerTooSoonTimer', 'XInteger', 0), ('answerTooLateTimer', 'XInteger', 0), ('delayBeforeRingingCell', 'XInteger', 0), ('remoteDestinationProfileName', 'XFkType', 0), ('ctiRemoteDeviceName', 'XFkType', 0), ('dualModeDeviceName', 'XFkType', 0), ('isMobilePhone', 'boolean', 0), ('enableMobileConnect', 'boolean', 0), ('timeZone', 'XTimeZone', 0), ('todAccessName', 'XFkType', 0), ('mobileSmartClientName', 'XFkType', 0), ('mobilityProfileName', 'XFkType', 0), ('singleNumberReachVoicemail', 'XVMAvoidancePolicy', 0), ('dialViaOfficeReverseVoicemail', 'XVMAvoidancePolicy', 0)), frozenset({'uuid'}), None, False),
+    'LRemoteDestinationProfile': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('userId', 'xsd:string', 0), ('ignorePresentationIndicators', 'boolean', 0), ('rerouteCallingSearchSpaceName', 'XFkType', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('userLocale', 'XUserLocale', 0), ('networkLocale', 'XCountry', 0), ('primaryPhoneName', 'XFkType', 0), ('dndOption', 'XDNDOption', 0), ('dndStatus', 'boolean', 0), ('mobileSmartClientProfileName', 'XFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'LResourcePriorityNamespace': ((('namespace', 'String10', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LResourcePriorityNamespaceList': ((('name', 'String50', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LRouteFilter': ((('name', 'xsd:string', 0), ('clause', 'xsd:string', 0), ('dialPlanName', 'XFkType', 0), ('dialPlanWizardGenId', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LRouteGroup': ((('dialPlanWizardGenld', 'XInteger', 0), ('distributionAlgorithm', 'XDistributeAlgorithm', 0), ('name', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LRouteList': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callManagerGroupName', 'XFkType', 0), ('routeListEnabled', 'boolean', 0), ('runOnEveryNode', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LRoutePartition': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('dialPlanWizardGenId', 'XInteger', 0), ('timeScheduleIdName', 'XFkType', 0), ('useOriginatingDeviceTimeZone', 'boolean', 0), ('timeZone', 'XTimeZone', 0), ('partitionUsage', 'XPartitionUsage', 0)), frozenset({'uuid'}), None, False),
+    'LRoutePattern': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('blockEnable', 'boolean', 0), ('calledPartyTransformationMask', 'xsd:string', 0), ('callingPartyTransformationMask', 'xsd:string', 0), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 0), ('dialPlanName', 'XFkType', 0), ('dialPlanWizardGenId', 'XInteger', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 0), ('routeFilterName', 'XFkType', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('supportOverlapSending', 'boolean', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('allowDeviceOverride', 'boolean', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('authorizationCodeRequired', 'boolean', 0), ('authorizationLevelRequired', 'XInteger', 0), ('clientCodeRequired', 'boolean', 0), ('withTag', 'String50', 0), ('withValueClause', 'String255', 0), ('resourcePriorityNamespaceName', 'XFkType', 0), ('routeClass', 'XPatternRouteClass', 0), ('externalCallControl', 'XFkType', 0), ('isEmergencyServiceNumber', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LRoutePlan': ((('dnOrPattern', 'String255', 0), ('partition', 'XFkType', 0), ('type', 'XPatternUsage', 0), ('routeDetail', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LSIPNormalizationScript': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('scriptExecutionErrorRecoveryAction', 'XSIPScriptErrorHandling', 0), ('systemResourceErrorRecoveryAction', 'XSIPScriptErrorHandling', 0), ('maxMemoryThreshold', 'xsd:string', 0), ('maxLuaInstructionsThreshold', 'xsd:string', 0), ('isStandard', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LSafCcdPurgeBlockLearnedRoutes': ((('learnedPattern', 'String50', 0), ('learnedPatternPrefix', 'String50', 0), ('callControlIdentity', 'String50', 0), ('ipAddress', 'String50', 0)), frozenset({'uuid'}), None, False),
+    'LSafForwarder': ((('name', 'String255', 0), ('description', 'String255', 0), ('clientLabel', 'String255', 0), ('safSecurityProfile', 'XFkType', 0), ('ipAddress', 'String255', 0), ('port', 'XInteger', 0), ('enableTcpKeepAlive', 'boolean', 0), ('safReconnectInterval', 'XInteger', 0), ('safNotificationsWindowSize', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LSafSecurityProfile': ((('name', 'String255', 0), ('description', 'String255', 0), ('userid', 'String50', 0)), frozenset({'uuid'}), None, False),
+    'LSdpTransparencyProfile': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LServiceParameter': ((('processNodeName', 'XFkType', 0), ('name', 'xsd:string', 0), ('service', 'XService', 0), ('value', 'xsd:string', 0), ('valueType', 'XParam', 0)), frozenset({'uuid'}), None, False),
+    'LServiceProfile': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('isDefault', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LSipDialRules': ((('dialPattern', 'XDialPattern', 0), ('name', 'String50', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LSipProfile': ((('name', 'String50', 0), ('description', 'String100', 0), ('defaultTelephonyEventPayloadType', 'XInteger', 0), ('redirectByApplication', 'boolean', 0), ('ringing180', 'boolean', 0), ('timerInvite', 'XInteger', 0), ('timerRegisterDelta', 'XInteger', 0), ('timerRegister', 'XInteger', 0), ('timerT1', 'XInteger', 0), ('timerT2', 'XInteger', 0), ('retryInvite', 'XInteger', 0), ('retryNotInvite', 'XInteger', 0), ('startMediaPort', 'XInteger', 0), ('stopMediaPort', 'XInteger', 0), ('callpickupListUri', 'String128', 0), ('callpickupGroupUri', 'String128', 0), ('meetmeServiceUrl', 'String128', 0), ('userInfo', 'XZzuserInfo', 0), ('dtmfDbLevel', 'XZzdtmfDbLevel', 0), ('callHoldRingback', 'XZzpreff', 0), ('anonymousCallBlock', 'XZzpreff', 0), ('callerIdBlock', 'XZzpreff', 0), ('dndControl', 'XZzdndcontrol', 0), ('telnetLevel', 'XTelnetLevel', 0), ('timerKeepAlive', 'XInteger', 0), ('timerSubscribe', 'XInteger', 0), ('timerSubscribeDelta', 'XInteger', 0), ('maxRedirects', 'XInteger', 0), ('timerOffHookToFirstDigit', 'XInteger', 0), ('callForwardUri', 'String128', 0), ('abbreviatedDialUri', 'String128', 0), ('confJointEnable', 'boolean', 0), ('rfc2543Hold', 'boolean', 0), ('semiAttendedTransfer', 'boolean', 0), ('enableVad', 'boolean', 0), ('stutterMsgWaiting', 'boolean', 0), ('callStats', 'boolean', 0), ('t38Invite', 'boolean', 0), ('faxInvite', 'boolean', 0), ('rerouteIncomingRequest', 'XSIPReroute', 0), ('resourcePriorityNamespaceListName', 'XFkType', 0), ('enableAnatForEarlyOfferCalls', 'boolean', 0), ('rsvpOverSip', 'XRSVPOverSIP', 0), ('fallbackToLocalRsvp', 'boolean', 0), ('sipRe11XxEnabled', 'XSIPRel1XXOptions', 0), ('gClear', 'XGClear', 0), ('sendRecvSDPInMidCallInvite', 'boolean', 0), ('enableOutboundOptionsPing', 'boolean', 0), ('optionsPingIntervalWhenStatusOK', 'XInteger', 0), ('optionsPingIntervalWhenStatusNotOK', 'XInteger', 0), ('deliverConferenceBridgeIdentifier', 'boolean', 0), ('sipOptionsRetryCount', 'XInteger', 0), ('sipOptionsRetryTimer', 'XInteger', 0), ('sipBandwidthModifier', 'XSIPBandwidthModifier', 0), ('enableUriOutdialSupport', 'xsd:string', 0), ('userAgentServerHeaderInfo', 'XUserAgentServerHeaderInfo', 0), ('allowPresentationSharingUsingBfcp', 'boolean', 0), ('scriptParameters', 'xsd:string', 0), ('isScriptTraceEnabled', 'boolean', 0), ('sipNormalizationScript', 'XFkType', 0), ('allowiXApplicationMedia', 'boolean', 0), ('dialStringInterpretation', 'XURIDisambiguationPolicy', 0), ('acceptAudioCodecPreferences', 'XStatus', 0), ('mlppUserAuthorization', 'boolean', 0), ('isAssuredSipServiceEnabled', 'boolean', 0), ('resourcePriorityNamespace', 'XFkType', 0), ('useCallerIdCallerNameinUriOutgoingRequest', 'boolean', 0), ('callingLineIdentification', 'XCallingLineIdentification', 0), ('rejectAnonymousIncomingCall', 'boolean', 0), ('callpickupUri', 'String128', 0), ('rejectAnonymousOutgoingCall', 'boolean', 0), ('videoCallTrafficClass', 'XVideoCallTrafficClass', 0), ('sdpTransparency', 'XFkType', 0), ('allowMultipleCodecs', 'boolean', 0), ('sipSessionRefreshMethod', 'XSipSessionRefreshMethod', 0), ('earlyOfferSuppVoiceCall', 'XEOSuppVoiceCall', 0), ('cucmVersionInSipHeader', 'XCUCMVersionInSipHeader', 0), ('confidentialAccessLevelHeaders', 'XCALHeaders', 0), ('destRouteString', 'boolean', 0), ('inactiveSDPRequired', 'boolean', 0), ('allowRRAndRSBandwidthModifier', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LSipRealm': ((('realm', 'xsd:string', 0), ('userid', 'xsd:string', 0), ('digestCredentials', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LSipRoutePattern': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('blockEnable', 'boolean', 0), ('callingPartyTransformationMask', 'xsd:string', 0), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('sipTrunkName', 'XFkType', 0), ('dnOrPatternIpv6', 'xsd:string', 0), ('routeOnUserPart', 'boolean', 0), ('useCallerCss', 'boolean', 0), ('domainRoutingCssName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LSipTrunk': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('loadInformation', 'XLoadInformation', 0), ('traceFlag', 'boolean', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('securityProfileName', 'XFkType', 0), ('sipProfileName', 'XFkType', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('sendGeoLocation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('transmitUtf8', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('rerouteCallingSearchSpaceName', 'XFkType', 0), ('referCallingSearchSpaceName', 'XFkType', 0), ('mtpRequired', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('unknownPrefix', 'String16', 0), ('destAddrIsSrv', 'boolean', 0), ('tkSipCodec', 'XSIPCodec', 0), ('sigDigits', 'LSipTrunk.sigDigits', 0), ('connectedNamePresentation', 'XPresentationBit', 0), ('connectedPartyIdPresentation', 'XPresentationBit', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingname', 'XPresentationBit', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('prefixDn', 'String50', 0), ('acceptInboundRdnis', 'boolean', 0), ('acceptOutboundRdnis', 'boolean', 0), ('srtpAllowed', 'boolean', 0), ('srtpFallbackAllowed', 'boolean', 0), ('isPaiEnabled', 'boolean', 0), ('sipPrivacy', 'XSipPrivacy', 0), ('isRpidEnabled', 'boolean', 0), ('sipAssertedType', 'XSipAssertedType', 0), ('trustReceivedIdentity', 'XTrustReceivedIdentity', 0), ('dtmfSignalingMethod', 'XDTMFSignaling', 0), ('routeClassSignalling', 'XStatus', 0), ('sipTrunkType', 'XTrunkService', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('useImePublicIpPort', 'boolean', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('rdnTransformationCssName', 'XFkType', 0), ('useDevicePoolRdnTransformCss', 'boolean', 0), ('useOrigCallingPartyPresOnDivert', 'boolean', 0), ('sipNormalizationScriptName', 'XFkType', 0), ('runOnEveryNode', 'boolean', 0), ('unknownStripDigits', 'XInteger', 0), ('cgpnTransformationUnknownCssName', 'XFkType', 0), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('pathReplacementSupport', 'boolean', 0), ('enableQsigUtf8', 'boolean', 0), ('scriptParameters', 'xsd:string', 0), ('scriptTraceEnabled', 'boolean', 0), ('trunkTrafficSecure', 'XSIPTrunkCallLegSecurity', 0), ('callingAndCalledPartyInfoFormat', 'XSIPIdentityBlend', 0), ('useCallerIdCallerNameinUriOutgoingRequest', 'boolean', 0), ('requestUriDomainName', 'xsd:string', 0), ('enableCiscoRecordingQsigTunneling', 'boolean', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('confidentialAccess', 'LSipTrunk.confidentialAccess', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'LSipTrunk.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'LSipTrunk.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'LSipTrunkSecurityProfile': ((('name', 'String75', 0), ('description', 'String100', 0), ('securityMode', 'XDeviceSecurityMode', 0), ('incomingTransport', 'XTransport', 0), ('outgoingTransport', 'XTransport', 0), ('digestAuthentication', 'boolean', 0), ('noncePolicyTime', 'XInteger', 0), ('x509SubjectName', 'String4096', 0), ('incomingPort', 'XInteger', 0), ('applLevelAuthentication', 'boolean', 0), ('acceptPresenceSubscription', 'boolean', 0), ('acceptOutOfDialogRefer', 'boolean', 0), ('acceptUnsolicitedNotification', 'boolean', 0), ('allowReplaceHeader', 'boolean', 0), ('transmitSecurityStatus', 'boolean', 0), ('sipV150OutboundSdpOfferFiltering', 'XV150SDPFilter', 0), ('allowChargingHeader', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LSoftKeyTemplate': ((('name', 'String100', 0), ('description', 'String100', 0), ('baseSoftkeyTemplateName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LSrst': ((('name', 'xsd:string', 0), ('port', 'XInteger', 0), ('ipAddress', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0), ('SipNetwork', 'xsd:string', 0), ('SipPort', 'XInteger', 0), ('srstCertificatePort', 'XInteger', 0), ('isSecure', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LTimePeriod': ((('name', 'String50', 0), ('startTime', 'XTimeOfDay', 0), ('endTime', 'XTimeOfDay', 0), ('startDay', 'XDayOfWeek', 0), ('endDay', 'XDayOfWeek', 0), ('monthOfYear', 'XMonthOfYear', 0), ('dayOfMonth', 'XInteger', 0), ('description', 'String255', 0), ('isPublished', 'boolean', 0), ('todOwnerIdName', 'XFkType', 0), ('dayOfMonthEnd', 'XInteger', 0), ('monthOfYearEnd', 'XMonthOfYear', 0)), frozenset({'uuid'}), None, False),
+    'LTimeSchedule': ((('name', 'String50', 0), ('description', 'String255', 0), ('isPublished', 'boolean', 0), ('timeScheduleCategory', 'XTimeScheduleCategory', 0), ('todOwnerIdName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LTodAccess': ((('name', 'String128', 0), ('description', 'String255', 0), ('ownerIdName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LTransPattern': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('blockEnable', 'boolean', 0), ('calledPartyTransformationMask', 'xsd:string', 0), ('callingPartyTransformationMask', 'xsd:string', 0), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 0), ('dialPlanName', 'XFkType', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 0), ('routeFilterName', 'XFkType', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('callingSearchSpaceName', 'XFkType', 0), ('resourcePriorityNamespaceName', 'XFkType', 0), ('routeNextHopByCgpn', 'boolean', 0), ('routeClass', 'XPatternRouteClass', 0), ('callInterceptProfileName', 'XFkType', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('useOriginatorCss', 'boolean', 0), ('dontWaitForIDTOnSubsequentHops', 'boolean', 0), ('isEmergencyServiceNumber', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LTranscoder': ((('name', 'UniqueString255', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('subUnit', 'XInteger', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('isTrustedRelayPoint', 'boolean', 0), ('maximumCapacity', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'LTransformationProfile': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('nationalStripDigits', 'XInteger', 0), ('internationalStripDigits', 'XInteger', 0), ('unknownStripDigits', 'XInteger', 0), ('subscriberStripDigits', 'XInteger', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('nationalCssName', 'XFkType', 0), ('internationalCssName', 'XFkType', 0), ('unknownCssName', 'XFkType', 0), ('subscriberCssName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LTvsCertificate': ((('subjectName', 'xsd:string', 0), ('issuerName', 'xsd:string', 0), ('serialNumber', 'xsd:string', 0), ('timeToLive', 'xsd:integer', 0), ('ipv4Address', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LUcService': ((('serviceType', 'XUCService', 0), ('productType', 'XUCProduct', 0), ('name', 'String50', 0), ('description', 'xsd:string', 0), ('hostnameorip', 'String255', 0), ('port', 'XInteger', 0), ('protocol', 'XConnectProtocol', 0)), frozenset({'uuid'}), None, False),
+    'LUnassignedDevice': ((('name', 'String50', 0), ('description', 'String100', 0), ('deviceType', 'xsd:string', 0), ('licenseType', 'xsd:string', 0), ('extension', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LUnassignedPresenceServers': ((('name', 'String255', 0), ('description', 'String255', 0), ('nodeUsage', 'XNodeUsage', 0)), frozenset({'uuid'}), None, False),
+    'LUnassignedPresenceUsers': ((('userid', 'xsd:string', 0),), frozenset({'uuid'}), None, False),
+    'LUniversalDeviceTemplate': ((('name', 'xsd:string', 0), ('deviceDescription', 'xsd:string', 0), ('devicePool', 'XFkType', 0), ('deviceSecurityProfile', 'XFkType', 0), ('sipProfile', 'XFkType', 0), ('phoneButtonTemplate', 'XFkType', 0), ('sipDialRules', 'XFkType', 0), ('callingSearchSpace', 'XFkType', 0), ('callingPartyTransformationCSSForInboundCalls', 'XFkType', 0), ('callingPartyTransformationCSSForOutboundCalls', 'XFkType', 0), ('reroutingCallingSearchSpace', 'XFkType', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('useDevicePoolCallingPartyTransformationCSSforInboundCalls', 'boolean', 0), ('useDevicePoolCallingPartyTransformationCSSforOutboundCalls', 'boolean', 0), ('commonPhoneProfile', 'XFkType', 0), ('commonDeviceConfiguration', 'XFkType', 0), ('softkeyTemplate', 'XFkType', 0), ('featureControlPolicy', 'XFkType', 0), ('phonePersonalization', 'XPhonePersonalization', 0), ('mtpPreferredOriginatingCodec', 'XSIPCodec', 0), ('outboundCallRollover', 'XOutboundCallRollover', 0), ('mediaTerminationPointRequired', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('requiredDtmfReception', 'boolean', 0), ('rfc2833Disabled', 'boolean', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('protectedDevice', 'boolean', 0), ('certificateOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('servicesProvisioning', 'XPhoneServiceDisplay', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('secureShellUser', 'xsd:string', 0), ('secureShellPassword', 'xsd:string', 0), ('userLocale', 'XUserLocale', 0), ('networkLocale', 'XCountry', 0), ('mlppDomain', 'XFkType', 0), ('mlppIndication', 'XStatus', 0), ('mlppPreemption', 'XPreemption', 0), ('doNotDisturb', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndIncomingCallAlert', 'XRingSetting', 0), ('aarGroup', 'XFkType', 0), ('aarCallingSearchSpace', 'XFkType', 0), ('blfPresenceGroup', 'XFkType', 0), ('blfAudibleAlertSettingPhoneBusy', 'XStatus', 0), ('blfAudibleAlertSettingPhoneIdle', 'XStatus', 0), ('userHoldMohAudioSource', 'XInteger', 0), ('networkHoldMohAudioSource', 'XInteger', 0), ('location', 'XFkType', 0), ('geoLocation', 'XFkType', 0), ('deviceMobilityMode', 'XStatus', 0), ('mediaResourceGroupList', 'XFkType', 0), ('remoteDevice', 'boolean', 0), ('hotlineDevice', 'boolean', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('requireOffPremiseLocation', 'boolean', 0), ('ownerUserId', 'XFkType', 0), ('mobilityUserId', 'XFkType', 0), ('joinAcrossLines', 'XStatus', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('singleButtonBarge', 'XBarge', 0), ('builtInBridge', 'XStatus', 0), ('allowControlOfDeviceFromCti', 'boolean', 0), ('ignorePresentationIndicators', 'boolean', 0), ('enableExtensionMobility', 'boolean', 0), ('privacy', 'XStatus', 0), ('loggedIntoHuntGroup', 'boolean', 0), ('proxyServer', 'xsd:string', 0), ('servicesUrl', 'xsd:string', 0), ('idle', 'xsd:string', 0), ('idleTimer', 'XInteger', 0), ('secureDirUrl', 'xsd:string', 0), ('messages', 'xsd:string', 0), ('secureIdleUrl', 'xsd:string', 0), ('authenticationServer', 'xsd:string', 0), ('directory', 'xsd:string', 0), ('secureServicesUrl', 'xsd:string', 0), ('information', 'xsd:string', 0), ('secureMessagesUrl', 'xsd:string', 0), ('secureInformationUrl', 'xsd:string', 0), ('secureAuthenticationUrl', 'xsd:string', 0), ('confidentialAccess', 'LUniversalDeviceTemplate.confidentialAccess', 0)), frozenset({'uuid'}), None, False),
+    'LUniversalDeviceTemplate.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'LUniversalLineTemplate': ((('name', 'xsd:string', 0), ('urgentPriority', 'boolean', 0), ('lineDescription', 'xsd:string', 0), ('routePartition', 'XFkType', 0), ('voiceMailProfile', 'XFkType', 0), ('callingSearchSpace', 'XFkType', 0), ('alertingName', 'xsd:string', 0), ('extCallControlProfile', 'XFkType', 0), ('blfPresenceGroup', 'XFkType', 0), ('callPickupGroup', 'XFkType', 0), ('partyEntranceTone', 'XStatus', 0), ('autoAnswer', 'XAutoAnswer', 0), ('rejectAnonymousCall', 'boolean', 0), ('userHoldMohAudioSource', 'XMOHAudioSourceId', 0), ('networkHoldMohAudioSource', 'XMOHAudioSourceId', 0), ('aarDestinationMask', 'String128', 0), ('aarGroup', 'XFkType', 0), ('retainDestInCallFwdHistory', 'boolean', 0), ('forwardDestAllCalls', 'xsd:string', 0), ('primaryCssForwardingAllCalls', 'XFkType', 0), ('secondaryCssForwardingAllCalls', 'XFkType', 0), ('CssActivationPolicy', 'XCFACSSActivationPolicy', 0), ('fwdDestExtCallsWhenNotRetrieved', 'xsd:string', 0), ('cssFwdExtCallsWhenNotRetrieved', 'XFkType', 0), ('fwdDestInternalCallsWhenNotRetrieved', 'xsd:string', 0), ('cssFwdInternalCallsWhenNotRetrieved', 'XFkType', 0), ('parkMonitorReversionTime', 'XInteger', 0), ('target', 'xsd:string', 0), ('mlppCss', 'XFkType', 0), ('mlppNoAnsRingDuration', 'XInteger', 0), ('confidentialAccess', 'LUniversalLineTemplate.confidentialAccess', 0), ('holdReversionRingDuration', 'XInteger', 0), ('holdReversionNotificationInterval', 'XInteger', 0), ('busyIntCallsDestination', 'xsd:string', 0), ('busyIntCallsCss', 'XFkType', 0), ('busyExtCallsDestination', 'xsd:string', 0), ('busyExtCallsCss', 'XFkType', 0), ('noAnsIntCallsDestination', 'xsd:string', 0), ('noAnsIntCallsCss', 'XFkType', 0), ('noAnsExtCallsDestination', 'xsd:string', 0), ('noAnsExtCallsCss', 'XFkType', 0), ('noCoverageIntCallsDestination', 'xsd:string', 0), ('noCoverageIntCallsCss', 'XFkType', 0), ('noCoverageExtCallsDestination', 'xsd:string', 0), ('noCoverageExtCallsCss', 'XFkType', 0), ('unregisteredIntCallsDestination', 'xsd:string', 0), ('unregisteredIntCallsCss', 'XFkType', 0), ('unregisteredExtCallsDestination', 'xsd:string', 0), ('unregisteredExtCallsCss', 'XFkType', 0), ('ctiFailureDestination', 'xsd:string', 0), ('ctiFailureCss', 'XFkType', 0), ('callControlAgentProfile', 'xsd:string', 0), ('enterpriseAltNum', 'LUniversalLineTemplate.enterpriseAltNum', 0), ('e164AltNum', 'LUniversalLineTemplate.e164AltNum', 0), ('advertisedFailoverNumber', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LUniversalLineTemplate.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'LUniversalLineTemplate.e164AltNum': ((('member', 'LE164AltNum', 0),), frozenset(), None, False),
+    'LUniversalLineTemplate.enterpriseAltNum': ((('member', 'LEnterpriseAltNum', 0),), frozenset(), None, False),
+    'LUser': ((('firstName', 'xsd:string', 0), ('middleName', 'xsd:string', 0), ('lastName', 'xsd:string', 0), ('emMaxLoginTime', 'XInteger', 0), ('userid', 'xsd:string', 0), ('mailid', 'xsd:string', 0), ('department', 'xsd:string', 0), ('manager', 'xsd:string', 0), ('userLocale', 'XUserLocale', 0), ('primaryExtension', 'LUser.primaryExtension', 0), ('associatedPc', 'xsd:string', 0), ('enableCti', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('enableMobility', 'boolean', 0), ('enableMobileVoiceAccess', 'boolean', 0), ('maxDeskPickupWaitTime', 'XInteger', 0), ('remoteDestinationLimit', 'XInteger', 0), ('status', 'XInteger', 0), ('enableEmcc', 'boolean', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('numericUserId', 'xsd:string', 0), ('mlppPassword', 'xsd:string', 0), ('homeCluster', 'boolean', 0), ('imAndPresenceEnable', 'boolean', 0), ('serviceProfile', 'XFkType', 0), ('directoryUri', 'xsd:string', 0), ('telephoneNumber', 'xsd:string', 0), ('title', 'xsd:string', 0), ('mobileNumber', 'xsd:string', 0), ('homeNumber', 'xsd:string', 0), ('pagerNumber', 'xsd:string', 0), ('calendarPresence', 'boolean', 0), ('userIdentity', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LUser.primaryExtension': ((('pattern', 'String255', 0), ('routePartitionName', 'String50', 0)), frozenset(), None, False),
+    'LUserGroup': ((('name', 'UniqueString128', 0),), frozenset({'uuid'}), None, False),
+    'LUserProfileProvision': ((('name', 'String50', 0), ('description', 'String255', 0), ('allowProvision', 'boolean', 0), ('limitProvision', 'XInteger', 0), ('defaultUserProfile', 'XFkType', 0), ('allowProvisionEMMaxLoginTime', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LVohServer': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('sipTrunkName', 'XFkType', 0), ('defaultVideoStreamId', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LVoiceMailPilot': ((('dirn', 'String255', 0), ('description', 'String50', 0), ('cssName', 'XFkType', 0), ('isDefault', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LVoiceMailPort': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('securityProfileName', 'XFkType', 0), ('geoLocationName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('dnPattern', 'xsd:string', 0), ('callerIdDisplay', 'String128', 0), ('callerIdDisplayAscii', 'String50', 0), ('externalMask', 'xsd:string', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'LVoiceMailProfile': ((('name', 'String50', 0), ('description', 'String50', 0), ('isDefault', 'boolean', 0), ('voiceMailboxMask', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LVpnGateway': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('url', 'String255', 0)), frozenset({'uuid'}), None, False),
+    'LVpnGroup': ((('name', 'String50', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'LVpnProfile': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('autoNetworkDetection', 'boolean', 0), ('mtu', 'XInteger', 0), ('failToConnect', 'XInteger', 0), ('clientAuthentication', 'XVPNClientAuthentication', 0), ('pwdPersistant', 'boolean', 0), ('enableHostIdCheck', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'LWLANProfile': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('ssid', 'xsd:string', 0), ('frequencyBand', 'XWiFiFrequency', 0), ('userModifiable', 'XWLANProfileChanges', 0), ('authMethod', 'XWiFiAuthenticationMethod', 0), ('userName', 'xsd:string', 0), ('password', 'xsd:string', 0), ('pskPassphrase', 'xsd:string', 0), ('wepKey', 'xsd:string', 0), ('passwordDescription', 'xsd:string', 0), ('networkAccessProfile', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'LWifiHotspot': ((('name', 'UniqueString50', 0), ('description', 'String255', 0), ('ssidPrefix', 'xsd:string', 0), ('authenticationMethod', 'XHotspotAuthenticationMethod', 0)), frozenset({'uuid'}), None, False),
+    'LWirelessAccessPointControllers': ((('name', 'String255', 0), ('description', 'xsd:string', 0), ('snmpVersion', 'XSNMPVersion', 0), ('snmpUserIdOrCommunityString', 'xsd:string', 0), ('snmpAuthenticationProtocol', 'XSNMPAuthenticationProtocol', 0), ('snmpAuthenticationPassword', 'xsd:string', 0), ('snmpPrivacyProtocol', 'XSNMPPrivacyProtocol', 0), ('snmpPrivacyPassword', 'xsd:string', 0), ('syncNow', 'boolean', 0), ('syncStatus', 'XSyncStatus', 0), ('resyncInterval', 'XInteger', 0), ('nextSyncTime', 'XInteger', 0), ('scheduleUnit', 'XScheduleUnit', 0)), frozenset({'uuid'}), None, False),
+    'LWlanProfileGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'ListAarGroupReq': ((('searchCriteria', 'ListAarGroupReq.searchCriteria', 1), ('returnedTags', 'LAarGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListAarGroupReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListAdvertisedPatternsReq': ((('searchCriteria', 'ListAdvertisedPatternsReq.searchCriteria', 1), ('returnedTags', 'LAdvertisedPatterns', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListAdvertisedPatternsReq.searchCriteria': ((('description', 'xsd:string', 0), ('pattern', 'xsd:string', 0)), frozenset(), None, False),
+    'ListAnnouncementReq': ((('searchCriteria', 'ListAnnouncementReq.searchCriteria', 1), ('returnedTags', 'LAnnouncement', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListAnnouncementReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListAnnunciatorReq': ((('searchCriteria', 'ListAnnunciatorReq.searchCriteria', 1), ('returnedTags', 'LAnnunciator', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListAnnunciatorReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListAppUserReq': ((('searchCriteria', 'ListAppUserReq.searchCriteria', 1), ('returnedTags', 'LAppUser', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListAppUserReq.searchCriteria': ((('userid', 'xsd:string', 0),), frozenset(), None, False),
+    'ListApplicationDialRulesReq': ((('searchCriteria', 'ListApplicationDialRulesReq.searchCriteria', 1), ('returnedTags', 'LApplicationDialRules', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListApplicationDialRulesReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('numberBeginWith', 'xsd:string', 0)), frozenset(), None, False),
+    'ListApplicationServerReq': ((('searchCriteria', 'ListApplicationServerReq.searchCriteria', 1), ('returnedTags', 'LApplicationServer', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListApplicationServerReq.searchCriteria': ((('name', 'xsd:string', 0), ('ipAddress', 'xsd:string', 0)), frozenset(), None, False),
+    'ListApplicationUserCapfProfileReq': ((('searchCriteria', 'ListApplicationUserCapfProfileReq.searchCriteria', 1), ('returnedTags', 'LApplicationUserCapfProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListApplicationUserCapfProfileReq.searchCriteria': ((('applicationUser', 'xsd:string', 0), ('instanceId', 'xsd:string', 0)), frozenset(), None, False),
+    'ListAssignedPresenceServersReq': ((('searchCriteria', 'ListAssignedPresenceServersReq.searchCriteria', 1), ('returnedTags', 'LAssignedPresenceServers', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListAssignedPresenceServersReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListAssignedPresenceUsersReq': ((('searchCriteria', 'ListAssignedPresenceUsersReq.searchCriteria', 1), ('returnedTags', 'LAssignedPresenceUsers', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListAssignedPresenceUsersReq.searchCriteria': ((('userid', 'xsd:string', 0), ('server', 'xsd:string', 0), ('presenceRedundancyGroup', 'xsd:string', 0)), frozenset(), None, False),
+    'ListAudioCodecPreferenceListReq': ((('searchCriteria', 'ListAudioCodecPreferenceListReq.searchCriteria', 1), ('returnedTags', 'LAudioCodecPreferenceList', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListAudioCodecPreferenceListReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListBillingServerReq': ((('searchCriteria', 'ListBillingServerReq.searchCriteria', 1), ('returnedTags', 'LBillingServer', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListBillingServerReq.searchCriteria': ((('hostName', 'xsd:string', 0),), frozenset(), None, False),
+    'ListBlockedLearnedPatternsReq': ((('searchCriteria', 'ListBlockedLearnedPatternsReq.searchCriteria', 1), ('returnedTags', 'LBlockedLearnedPatterns', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListBlockedLearnedPatternsReq.searchCriteria': ((('description', 'xsd:string', 0), ('pattern', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCCAProfilesReq': ((('searchCriteria', 'ListCCAProfilesReq.searchCriteria', 1), ('returnedTags', 'LCCAProfiles', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCCAProfilesReq.searchCriteria': ((('ccaId', 'xsd:string', 0), ('primarySoftSwitchId', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCallManagerGroupReq': ((('searchCriteria', 'ListCallManagerGroupReq.searchCriteria', 1), ('returnedTags', 'LCallManagerGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCallManagerGroupReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListCallManagerReq': ((('searchCriteria', 'ListCallManagerReq.searchCriteria', 1), ('returnedTags', 'LCallManager', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCallManagerReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCallParkReq': ((('searchCriteria', 'ListCallParkReq.searchCriteria', 1), ('returnedTags', 'LCallPark', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCallParkReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0), ('callManagerName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCallPickupGroupReq': ((('searchCriteria', 'ListCallPickupGroupReq.searchCriteria', 1), ('returnedTags', 'LCallPickupGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCallPickupGroupReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCalledPartyTracingReq': ((('searchCriteria', 'ListCalledPartyTracingReq.searchCriteria', 1), ('returnedTags', 'LCalledPartyTracing', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCalledPartyTracingReq.searchCriteria': ((('directorynumber', 'xsd:string', 0),), frozenset(), None, False),
+    'ListCalledPartyTransformationPatternReq': ((('searchCriteria', 'ListCalledPartyTransformationPatternReq.searchCriteria', 1), ('returnedTags', 'LCalledPartyTransformationPattern', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCalledPartyTransformationPatternReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0), ('dialPlanName', 'xsd:string', 0), ('routeFilterName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCallerFilterListReq': ((('searchCriteria', 'ListCallerFilterListReq.searchCriteria', 1), ('returnedTags', 'LCallerFilterList', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCallerFilterListReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListCallingPartyTransformationPatternReq': ((('searchCriteria', 'ListCallingPartyTransformationPatternReq.searchCriteria', 1), ('returnedTags', 'LCallingPartyTransformationPattern', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCallingPartyTransformationPatternReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0), ('dialPlanName', 'xsd:string', 0), ('routeFilterName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCcdAdvertisingServiceReq': ((('searchCriteria', 'ListCcdAdvertisingServiceReq.searchCriteria', 1), ('returnedTags', 'LCcdAdvertisingService', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCcdAdvertisingServiceReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCcdHostedDNGroupReq': ((('searchCriteria', 'ListCcdHostedDNGroupReq.searchCriteria', 1), ('returnedTags', 'LCcdHostedDNGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCcdHostedDNGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCcdHostedDNReq': ((('searchCriteria', 'ListCcdHostedDNReq.searchCriteria', 1), ('returnedTags', 'LCcdHostedDN', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCcdHostedDNReq.searchCriteria': ((('hostedPattern', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListChangeReq': ((('startChangeId', 'StartChangeId', 0), ('objectList', 'ListChangeReq.objectList', 0)), frozenset({'sequence'}), None, False),
+    'ListChangeReq.objectList': ((('object', 'XChangeType', 2),), frozenset(), None, False),
+    'ListCiscoCatalyst600024PortFXSGatewayReq': ((('searchCriteria', 'ListCiscoCatalyst600024PortFXSGatewayReq.searchCriteria', 1), ('returnedTags', 'LCiscoCatalyst600024PortFXSGateway', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCiscoCatalyst600024PortFXSGatewayReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCiscoCatalyst6000E1VoIPGatewayReq': ((('searchCriteria', 'ListCiscoCatalyst6000E1VoIPGatewayReq.searchCriteria', 1), ('returnedTags', 'LCiscoCatalyst6000E1VoIPGateway', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCiscoCatalyst6000E1VoIPGatewayReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCiscoCatalyst6000T1VoIPGatewayPriReq': ((('searchCriteria', 'ListCiscoCatalyst6000T1VoIPGatewayPriReq.searchCriteria', 1), ('returnedTags', 'LCiscoCatalyst6000T1VoIPGatewayPri', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCiscoCatalyst6000T1VoIPGatewayPriReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCiscoCatalyst6000T1VoIPGatewayT1Req': ((('searchCriteria', 'ListCiscoCatalyst6000T1VoIPGatewayT1Req.searchCriteria', 1), ('returnedTags', 'LCiscoCatalyst6000T1VoIPGatewayT1', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCiscoCatalyst6000T1VoIPGatewayT1Req.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCiscoCloudOnboardingReq': ((('searchCriteria', 'ListCiscoCloudOnboardingReq.searchCriteria', 1), ('returnedTags', 'LCiscoCloudOnboarding', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCiscoCloudOnboardingReq.searchCriteria': ((), frozenset(), None, False),
+    'ListCmcInfoReq': ((('searchCriteria', 'ListCmcInfoReq.searchCriteria', 1), ('returnedTags', 'LCmcInfo', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCmcInfoReq.searchCriteria': ((('code', 'xsd:string', 0),), frozenset(), None, False),
+    'ListCommonDeviceConfigReq': ((('searchCriteria', 'ListCommonDeviceConfigReq.searchCriteria', 1), ('returnedTags', 'LCommonDeviceConfig', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCommonDeviceConfigReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListCommonPhoneConfigReq': ((('searchCriteria', 'ListCommonPhoneConfigReq.searchCriteria', 1), ('returnedTags', 'LCommonPhoneConfig', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCommonPhoneConfigReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListConferenceBridgeReq': ((('searchCriteria', 'ListConferenceBridgeReq.searchCriteria', 1), ('returnedTags', 'LConferenceBridge', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListConferenceBridgeReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListConferenceNowReq': ((('searchCriteria', 'ListConferenceNowReq.searchCriteria', 1), ('returnedTags', 'LConferenceNow', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListConferenceNowReq.searchCriteria': ((('conferenceNowNumber', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCredentialPolicyReq': ((('searchCriteria', 'ListCredentialPolicyReq.searchCriteria', 1), ('returnedTags', 'LCredentialPolicy', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCredentialPolicyReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListCssReq': ((('searchCriteria', 'ListCssReq.searchCriteria', 1), ('returnedTags', 'LCss', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCssReq.searchCriteria': ((('description', 'xsd:string', 0), ('partitionUsage', 'xsd:string', 0), ('name', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCtiRoutePointReq': ((('searchCriteria', 'ListCtiRoutePointReq.searchCriteria', 1), ('returnedTags', 'LCtiRoutePoint', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCtiRoutePointReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCumaServerSecurityProfileReq': ((('searchCriteria', 'ListCumaServerSecurityProfileReq.searchCriteria', 1), ('returnedTags', 'LCumaServerSecurityProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCumaServerSecurityProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListCustomUserFieldReq': ((('searchCriteria', 'ListCustomUserFieldReq.searchCriteria', 1), ('returnedTags', 'LCustomUserField', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCustomUserFieldReq.searchCriteria': ((('field', 'xsd:string', 0),), frozenset(), None, False),
+    'ListCustomerReq': ((('searchCriteria', 'ListCustomerReq.searchCriteria', 1), ('returnedTags', 'LCustomer', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListCustomerReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListDateTimeGroupReq': ((('searchCriteria', 'ListDateTimeGroupReq.searchCriteria', 1), ('returnedTags', 'LDateTimeGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDateTimeGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('timeZone', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDdiReq': ((('searchCriteria', 'ListDdiReq.searchCriteria', 1), ('returnedTags', 'LDdi', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDdiReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListDefaultDeviceProfileReq': ((('searchCriteria', 'ListDefaultDeviceProfileReq.searchCriteria', 1), ('returnedTags', 'LDefaultDeviceProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDefaultDeviceProfileReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListDeviceDefaultsReq': ((('searchCriteria', 'ListDeviceDefaultsReq.searchCriteria', 1), ('returnedTags', 'LDeviceDefaults', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDeviceDefaultsReq.searchCriteria': ((('Model', 'xsd:string', 0), ('Protocol', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDeviceMobilityGroupReq': ((('searchCriteria', 'ListDeviceMobilityGroupReq.searchCriteria', 1), ('returnedTags', 'LDeviceMobilityGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDeviceMobilityGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDeviceMobilityReq': ((('searchCriteria', 'ListDeviceMobilityReq.searchCriteria', 1), ('returnedTags', 'LDeviceMobility', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDeviceMobilityReq.searchCriteria': ((('name', 'xsd:string', 0), ('subNet', 'xsd:string', 0), ('subNetMaskSz', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDevicePoolReq': ((('searchCriteria', 'ListDevicePoolReq.searchCriteria', 1), ('returnedTags', 'LDevicePool', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDevicePoolReq.searchCriteria': ((('name', 'xsd:string', 0), ('callManagerGroupName', 'xsd:string', 0), ('regionName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDeviceProfileReq': ((('searchCriteria', 'ListDeviceProfileReq.searchCriteria', 1), ('returnedTags', 'LDeviceProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDeviceProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDhcpServerReq': ((('searchCriteria', 'ListDhcpServerReq.searchCriteria', 1), ('returnedTags', 'LDhcpServer', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDhcpServerReq.searchCriteria': ((('processNodeName', 'xsd:string', 0), ('primaryDnsIpAddress', 'xsd:string', 0), ('secondaryDnsIpAddress', 'xsd:string', 0), ('domainName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDhcpSubnetReq': ((('searchCriteria', 'ListDhcpSubnetReq.searchCriteria', 1), ('returnedTags', 'LDhcpSubnet', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDhcpSubnetReq.searchCriteria': ((('dhcpServerName', 'xsd:string', 0), ('subnetIpAddress', 'xsd:string', 0), ('primaryStartIpAddress', 'xsd:string', 0), ('primaryEndIpAddress', 'xsd:string', 0), ('secondaryStartIpAddress', 'xsd:string', 0), ('secondaryEndIpAddress', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDialPlanReq': ((('searchCriteria', 'ListDialPlanReq.searchCriteria', 1), ('returnedTags', 'LDialPlan', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDialPlanReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDialPlanTagReq': ((('searchCriteria', 'ListDialPlanTagReq.searchCriteria', 1), ('returnedTags', 'LDialPlanTag', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDialPlanTagReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListDirNumberAliasLookupandSyncReq': ((('searchCriteria', 'ListDirNumberAliasLookupandSyncReq.searchCriteria', 1), ('returnedTags', 'LDirNumberAliasLookupandSync', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDirNumberAliasLookupandSyncReq.searchCriteria': ((('ldapConfigName', 'xsd:string', 0), ('ldapManagerDisgName', 'xsd:string', 0), ('ldapUserSearch', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDirectedCallParkReq': ((('searchCriteria', 'ListDirectedCallParkReq.searchCriteria', 1), ('returnedTags', 'LDirectedCallPark', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDirectedCallParkReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0), ('reversionPattern', 'xsd:string', 0)), frozenset(), None, False),
+    'ListDirectoryLookupDialRulesReq': ((('searchCriteria', 'ListDirectoryLookupDialRulesReq.searchCriteria', 1), ('returnedTags', 'LDirectoryLookupDialRules', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListDirectoryLookupDialRulesReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('numberBeginWith', 'xsd:string', 0)), frozenset(), None, False),
+    'ListElinGroupReq': ((('searchCriteria', 'ListElinGroupReq.searchCriteria', 1), ('returnedTags', 'LElinGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListElinGroupReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListEndUserCapfProfileReq': ((('searchCriteria', 'ListEndUserCapfProfileReq.searchCriteria', 1), ('returnedTags', 'LEndUserCapfProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListEndUserCapfProfileReq.searchCriteria': ((('endUserId', 'xsd:string', 0), ('instanceId', 'xsd:string', 0)), frozenset(), None, False),
+    'ListEnterpriseFeatureAccessConfigurationReq': ((('searchCriteria', 'ListEnterpriseFeatureAccessConfigurationReq.searchCriteria', 1), ('returnedTags', 'LEnterpriseFeatureAccessConfiguration', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListEnterpriseFeatureAccessConfigurationReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListExpresswayCConfigurationReq': ((('searchCriteria', 'ListExpresswayCConfigurationReq.searchCriteria', 1), ('returnedTags', 'LExpresswayCConfiguration', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListExpresswayCConfigurationReq.searchCriteria': ((('HostNameOrIP', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListExternalCallControlProfileReq': ((('searchCriteria', 'ListExternalCallControlProfileReq.searchCriteria', 1), ('returnedTags', 'LExternalCallControlProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListExternalCallControlProfileReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListFacInfoReq': ((('searchCriteria', 'ListFacInfoReq.searchCriteria', 1), ('returnedTags', 'LFacInfo', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListFacInfoReq.searchCriteria': ((('name', 'xsd:string', 0), ('code', 'xsd:string', 0), ('authorizationLevel', 'xsd:string', 0)), frozenset(), None, False),
+    'ListFallbackProfileReq': ((('searchCriteria', 'ListFallbackProfileReq.searchCriteria', 1), ('returnedTags', 'LFallbackProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListFallbackProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListFeatureControlPolicyReq': ((('searchCriteria', 'ListFeatureControlPolicyReq.searchCriteria', 1), ('returnedTags', 'LFeatureControlPolicy', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListFeatureControlPolicyReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListFeatureGroupTemplateReq': ((('searchCriteria', 'ListFeatureGroupTemplateReq.searchCriteria', 1), ('returnedTags', 'LFeatureGroupTemplate', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListFeatureGroupTemplateReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListGatekeeperReq': ((('searchCriteria', 'ListGatekeeperReq.searchCriteria', 1), ('returnedTags', 'LGatekeeper', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListGatekeeperReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListGatewayReq': ((('searchCriteria', 'ListGatewayReq.searchCriteria', 1), ('returnedTags', 'LGateway', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListGatewayReq.searchCriteria': ((('domainName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('product', 'xsd:string', 0), ('protocol', 'xsd:string', 0)), frozenset(), None, False),
+    'ListGeoLocationFilterReq': ((('searchCriteria', 'ListGeoLocationFilterReq.searchCriteria', 1), ('returnedTags', 'LGeoLocationFilter', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListGeoLocationFilterReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListGeoLocationPolicyReq': ((('searchCriteria', 'ListGeoLocationPolicyReq.searchCriteria', 1), ('returnedTags', 'LGeoLocationPolicy', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListGeoLocationPolicyReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListGeoLocationReq': ((('searchCriteria', 'ListGeoLocationReq.searchCriteria', 1), ('returnedTags', 'LGeoLocation', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListGeoLocationReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListH323GatewayReq': ((('searchCriteria', 'ListH323GatewayReq.searchCriteria', 1), ('returnedTags', 'LH323Gateway', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListH323GatewayReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('protocol', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListH323PhoneReq': ((('searchCriteria', 'ListH323PhoneReq.searchCriteria', 1), ('returnedTags', 'LH323Phone', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListH323PhoneReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListH323TrunkReq': ((('searchCriteria', 'ListH323TrunkReq.searchCriteria', 1), ('returnedTags', 'LH323Trunk', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListH323TrunkReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListHuntListReq': ((('searchCriteria', 'ListHuntListReq.searchCriteria', 1), ('returnedTags', 'LHuntList', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListHuntListReq.searchCriteria': ((('description', 'xsd:string', 0), ('name', 'xsd:string', 0)), frozenset(), None, False),
+    'ListHuntPilotReq': ((('searchCriteria', 'ListHuntPilotReq.searchCriteria', 1), ('returnedTags', 'LHuntPilot', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListHuntPilotReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImeClientReq': ((('searchCriteria', 'ListImeClientReq.searchCriteria', 1), ('returnedTags', 'LImeClient', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImeClientReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('domain', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImeE164TransformationReq': ((('searchCriteria', 'ListImeE164TransformationReq.searchCriteria', 1), ('returnedTags', 'LImeE164Transformation', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImeE164TransformationReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImeEnrolledPatternGroupReq': ((('searchCriteria', 'ListImeEnrolledPatternGroupReq.searchCriteria', 1), ('returnedTags', 'LImeEnrolledPatternGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImeEnrolledPatternGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImeEnrolledPatternReq': ((('searchCriteria', 'ListImeEnrolledPatternReq.searchCriteria', 1), ('returnedTags', 'LImeEnrolledPattern', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImeEnrolledPatternReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('imeEnrolledPatternGroupName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImeExclusionNumberGroupReq': ((('searchCriteria', 'ListImeExclusionNumberGroupReq.searchCriteria', 1), ('returnedTags', 'LImeExclusionNumberGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImeExclusionNumberGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImeExclusionNumberReq': ((('searchCriteria', 'ListImeExclusionNumberReq.searchCriteria', 1), ('returnedTags', 'LImeExclusionNumber', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImeExclusionNumberReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('imeExclusionNumberGroupName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImeFirewallReq': ((('searchCriteria', 'ListImeFirewallReq.searchCriteria', 1), ('returnedTags', 'LImeFirewall', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImeFirewallReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('ipAddress', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImeRouteFilterElementReq': ((('searchCriteria', 'ListImeRouteFilterElementReq.searchCriteria', 1), ('returnedTags', 'LImeRouteFilterElement', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImeRouteFilterElementReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImeRouteFilterGroupReq': ((('searchCriteria', 'ListImeRouteFilterGroupReq.searchCriteria', 1), ('returnedTags', 'LImeRouteFilterGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImeRouteFilterGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImeServerReq': ((('searchCriteria', 'ListImeServerReq.searchCriteria', 1), ('returnedTags', 'LImeServer', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImeServerReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListImportedDirectoryUriCatalogsReq': ((('searchCriteria', 'ListImportedDirectoryUriCatalogsReq.searchCriteria', 1), ('returnedTags', 'LImportedDirectoryUriCatalogs', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListImportedDirectoryUriCatalogsReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routeString', 'xsd:string', 0)), frozenset(), None, False),
+    'ListInfrastructureDeviceReq': ((('searchCriteria', 'ListInfrastructureDeviceReq.searchCriteria', 1), ('returnedTags', 'LInfrastructureDevice', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListInfrastructureDeviceReq.searchCriteria': ((('name', 'xsd:string', 0), ('isActive', 'xsd:string', 0)), frozenset(), None, False),
+    'ListIpPhoneServicesReq': ((('searchCriteria', 'ListIpPhoneServicesReq.searchCriteria', 1), ('returnedTags', 'LIpPhoneServices', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListIpPhoneServicesReq.searchCriteria': ((('serviceName', 'xsd:string', 0), ('serviceDescription', 'xsd:string', 0)), frozenset(), None, False),
+    'ListIvrUserLocaleReq': ((('searchCriteria', 'ListIvrUserLocaleReq.searchCriteria', 1), ('returnedTags', 'LIvrUserLocale', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListIvrUserLocaleReq.searchCriteria': ((('userLocale', 'xsd:string', 0),), frozenset(), None, False),
+    'ListLbmGroupReq': ((('searchCriteria', 'ListLbmGroupReq.searchCriteria', 1), ('returnedTags', 'LLbmGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLbmGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('Description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListLbmHubGroupReq': ((('searchCriteria', 'ListLbmHubGroupReq.searchCriteria', 1), ('returnedTags', 'LLbmHubGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLbmHubGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListLdapDirectoryReq': ((('searchCriteria', 'ListLdapDirectoryReq.searchCriteria', 1), ('returnedTags', 'LLdapDirectory', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLdapDirectoryReq.searchCriteria': ((('name', 'xsd:string', 0), ('ldapDn', 'xsd:string', 0), ('userSearchBase', 'xsd:string', 0)), frozenset(), None, False),
+    'ListLdapFilterReq': ((('searchCriteria', 'ListLdapFilterReq.searchCriteria', 1), ('returnedTags', 'LLdapFilter', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLdapFilterReq.searchCriteria': ((('name', 'xsd:string', 0), ('filter', 'xsd:string', 0)), frozenset(), None, False),
+    'ListLdapSearchReq': ((('searchCriteria', 'ListLdapSearchReq.searchCriteria', 1), ('returnedTags', 'LLdapSearch', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLdapSearchReq.searchCriteria': ((('distinguishedName', 'xsd:string', 0),), frozenset(), None, False),
+    'ListLdapSyncCustomFieldReq': ((('searchCriteria', 'ListLdapSyncCustomFieldReq.searchCriteria', 1), ('returnedTags', 'NewLLdapSyncCustomField', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLdapSyncCustomFieldReq.searchCriteria': ((('ldapConfigurationName', 'xsd:string', 0),), frozenset(), None, False),
+    'ListLicensedUserReq': ((('searchCriteria', 'ListLicensedUserReq.searchCriteria', 1), ('returnedTags', 'LLicensedUser', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLicensedUserReq.searchCriteria': ((('userId', 'xsd:string', 0), ('firstName', 'xsd:string', 0), ('lastName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListLineGroupReq': ((('searchCriteria', 'ListLineGroupReq.searchCriteria', 1), ('returnedTags', 'LLineGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLineGroupReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListLineReq': ((('searchCriteria', 'ListLineReq.searchCriteria', 1), ('returnedTags', 'LLine', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLineReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListLocalRouteGroupReq': ((('searchCriteria', 'ListLocalRouteGroupReq.searchCriteria', 1), ('returnedTags', 'LLocalRouteGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLocalRouteGroupReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListLocationReq': ((('searchCriteria', 'ListLocationReq.searchCriteria', 1), ('returnedTags', 'LLocation', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListLocationReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListMediaResourceGroupReq': ((('searchCriteria', 'ListMediaResourceGroupReq.searchCriteria', 1), ('returnedTags', 'LMediaResourceGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMediaResourceGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListMediaResourceListReq': ((('searchCriteria', 'ListMediaResourceListReq.searchCriteria', 1), ('returnedTags', 'LMediaResourceList', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMediaResourceListReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListMeetMeReq': ((('searchCriteria', 'ListMeetMeReq.searchCriteria', 1), ('returnedTags', 'LMeetMe', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMeetMeReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListMessageWaitingReq': ((('searchCriteria', 'ListMessageWaitingReq.searchCriteria', 1), ('returnedTags', 'LMessageWaiting', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMessageWaitingReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListMlppDomainReq': ((('searchCriteria', 'ListMlppDomainReq.searchCriteria', 1), ('returnedTags', 'LMlppDomain', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMlppDomainReq.searchCriteria': ((('domainName', 'xsd:string', 0),), frozenset(), None, False),
+    'ListMobileSmartClientProfileReq': ((('searchCriteria', 'ListMobileSmartClientProfileReq.searchCriteria', 1), ('returnedTags', 'LMobileSmartClientProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMobileSmartClientProfileReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListMobilityProfileReq': ((('searchCriteria', 'ListMobilityProfileReq.searchCriteria', 1), ('returnedTags', 'LMobilityProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMobilityProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListMohAudioSourceReq': ((('searchCriteria', 'ListMohAudioSourceReq.searchCriteria', 1), ('returnedTags', 'LMohAudioSource', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMohAudioSourceReq.searchCriteria': ((('sourceId', 'xsd:string', 0), ('name', 'xsd:string', 0)), frozenset(), None, False),
+    'ListMohServerReq': ((('searchCriteria', 'ListMohServerReq.searchCriteria', 1), ('returnedTags', 'LMohServer', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMohServerReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListMraServiceDomainReq': ((('searchCriteria', 'ListMraServiceDomainReq.searchCriteria', 1), ('returnedTags', 'LMraServiceDomain', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMraServiceDomainReq.searchCriteria': ((('name', 'xsd:string', 0), ('isDefault', 'xsd:string', 0), ('serviceDomains', 'xsd:string', 0)), frozenset(), None, False),
+    'ListMtpReq': ((('searchCriteria', 'ListMtpReq.searchCriteria', 1), ('returnedTags', 'LMtp', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListMtpReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListNetworkAccessProfileReq': ((('searchCriteria', 'ListNetworkAccessProfileReq.searchCriteria', 1), ('returnedTags', 'LNetworkAccessProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListNetworkAccessProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListPhoneActivationCodeReq': ((('searchCriteria', 'ListPhoneActivationCodeReq.searchCriteria', 1), ('returnedTags', 'LPhoneActivationCode', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListPhoneActivationCodeReq.searchCriteria': ((('phoneName', 'xsd:string', 0), ('userId', 'xsd:string', 0)), frozenset(), None, False),
+    'ListPhoneButtonTemplateReq': ((('searchCriteria', 'ListPhoneButtonTemplateReq.searchCriteria', 1), ('returnedTags', 'LPhoneButtonTemplate', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListPhoneButtonTemplateReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListPhoneNtpReq': ((('searchCriteria', 'ListPhoneNtpReq.searchCriteria', 1), ('returnedTags', 'LPhoneNtp', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListPhoneNtpReq.searchCriteria': ((('ipAddress', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListPhoneReq': ((('searchCriteria', 'ListPhoneReq.searchCriteria', 1), ('returnedTags', 'LPhone', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListPhoneReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('protocol', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0), ('securityProfileName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListPhoneSecurityProfileReq': ((('searchCriteria', 'ListPhoneSecurityProfileReq.searchCriteria', 1), ('returnedTags', 'LPhoneSecurityProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListPhoneSecurityProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListPhysicalLocationReq': ((('searchCriteria', 'ListPhysicalLocationReq.searchCriteria', 1), ('returnedTags', 'LPhysicalLocation', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListPhysicalLocationReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListPresenceGroupReq': ((('searchCriteria', 'ListPresenceGroupReq.searchCriteria', 1), ('returnedTags', 'LPresenceGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListPresenceGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListPresenceRedundancyGroupReq': ((('searchCriteria', 'ListPresenceRedundancyGroupReq.searchCriteria', 1), ('returnedTags', 'LPresenceRedundancyGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListPresenceRedundancyGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListProcessNodeReq': ((('searchCriteria', 'ListProcessNodeReq.searchCriteria', 1), ('returnedTags', 'LProcessNode', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListProcessNodeReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('processNodeRole', 'xsd:string', 0)), frozenset(), None, False),
+    'ListProcessNodeServiceReq': ((('searchCriteria', 'ListProcessNodeServiceReq.searchCriteria', 1), ('returnedTags', 'LProcessNodeService', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListProcessNodeServiceReq.searchCriteria': ((('processNodeName', 'xsd:string', 0),), frozenset(), None, False),
+    'ListRecordingProfileReq': ((('searchCriteria', 'ListRecordingProfileReq.searchCriteria', 1), ('returnedTags', 'LRecordingProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRecordingProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('recordingCssName', 'xsd:string', 0), ('recorderDestination', 'xsd:string', 0)), frozenset(), None, False),
+    'ListRegionReq': ((('searchCriteria', 'ListRegionReq.searchCriteria', 1), ('returnedTags', 'LRegion', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRegionReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListRegistrationDynamicReq': ((('searchCriteria', 'ListRegistrationDynamicReq.searchCriteria', 1), ('returnedTags', 'LRegistrationDynamic', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRegistrationDynamicReq.searchCriteria': ((('device', 'xsd:string', 0),), frozenset(), None, False),
+    'ListRemoteClusterReq': ((('searchCriteria', 'ListRemoteClusterReq.searchCriteria', 1), ('returnedTags', 'LRemoteCluster', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRemoteClusterReq.searchCriteria': ((('clusterId', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListRemoteDestinationProfileReq': ((('searchCriteria', 'ListRemoteDestinationProfileReq.searchCriteria', 1), ('returnedTags', 'LRemoteDestinationProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRemoteDestinationProfileReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListRemoteDestinationReq': ((('searchCriteria', 'ListRemoteDestinationReq.searchCriteria', 1), ('returnedTags', 'LRemoteDestination', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRemoteDestinationReq.searchCriteria': ((('name', 'xsd:string', 0), ('remoteDestinationProfileName', 'xsd:string', 0), ('ctiRemoteDeviceName', 'xsd:string', 0), ('dualModeDeviceName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListResourcePriorityNamespaceListReq': ((('searchCriteria', 'ListResourcePriorityNamespaceListReq.searchCriteria', 1), ('returnedTags', 'LResourcePriorityNamespaceList', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListResourcePriorityNamespaceListReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListResourcePriorityNamespaceReq': ((('searchCriteria', 'ListResourcePriorityNamespaceReq.searchCriteria', 1), ('returnedTags', 'LResourcePriorityNamespace', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListResourcePriorityNamespaceReq.searchCriteria': ((('namespace', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListRouteFilterReq': ((('searchCriteria', 'ListRouteFilterReq.searchCriteria', 1), ('returnedTags', 'LRouteFilter', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRouteFilterReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListRouteGroupReq': ((('searchCriteria', 'ListRouteGroupReq.searchCriteria', 1), ('returnedTags', 'LRouteGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRouteGroupReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListRouteListReq': ((('searchCriteria', 'ListRouteListReq.searchCriteria', 1), ('returnedTags', 'LRouteList', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRouteListReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListRoutePartitionReq': ((('searchCriteria', 'ListRoutePartitionReq.searchCriteria', 1), ('returnedTags', 'LRoutePartition', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRoutePartitionReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListRoutePatternReq': ((('searchCriteria', 'ListRoutePatternReq.searchCriteria', 1), ('returnedTags', 'LRoutePattern', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRoutePatternReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0), ('isEmergencyServiceNumber', 'xsd:string', 0)), frozenset(), None, False),
+    'ListRoutePlanReq': ((('searchCriteria', 'ListRoutePlanReq.searchCriteria', 1), ('returnedTags', 'LRoutePlan', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListRoutePlanReq.searchCriteria': ((('dnOrPattern', 'xsd:string', 0), ('partition', 'xsd:string', 0), ('type', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSIPNormalizationScriptReq': ((('searchCriteria', 'ListSIPNormalizationScriptReq.searchCriteria', 1), ('returnedTags', 'LSIPNormalizationScript', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSIPNormalizationScriptReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSafCcdPurgeBlockLearnedRoutesReq': ((('searchCriteria', 'ListSafCcdPurgeBlockLearnedRoutesReq.searchCriteria', 1), ('returnedTags', 'LSafCcdPurgeBlockLearnedRoutes', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSafCcdPurgeBlockLearnedRoutesReq.searchCriteria': ((('learnedPattern', 'xsd:string', 0), ('learnedPatternPrefix', 'xsd:string', 0), ('callControlIdentity', 'xsd:string', 0), ('ipAddress', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSafForwarderReq': ((('searchCriteria', 'ListSafForwarderReq.searchCriteria', 1), ('returnedTags', 'LSafForwarder', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSafForwarderReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSafSecurityProfileReq': ((('searchCriteria', 'ListSafSecurityProfileReq.searchCriteria', 1), ('returnedTags', 'LSafSecurityProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSafSecurityProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('userid', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSdpTransparencyProfileReq': ((('searchCriteria', 'ListSdpTransparencyProfileReq.searchCriteria', 1), ('returnedTags', 'LSdpTransparencyProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSdpTransparencyProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListServiceParameterReq': ((('searchCriteria', 'ListServiceParameterReq.searchCriteria', 1), ('returnedTags', 'LServiceParameter', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListServiceParameterReq.searchCriteria': ((('processNodeName', 'xsd:string', 0), ('service', 'xsd:string', 0)), frozenset(), None, False),
+    'ListServiceProfileReq': ((('searchCriteria', 'ListServiceProfileReq.searchCriteria', 1), ('returnedTags', 'LServiceProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListServiceProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSipDialRulesReq': ((('searchCriteria', 'ListSipDialRulesReq.searchCriteria', 1), ('returnedTags', 'LSipDialRules', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSipDialRulesReq.searchCriteria': ((('dialPattern', 'xsd:string', 0), ('name', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSipProfileReq': ((('searchCriteria', 'ListSipProfileReq.searchCriteria', 1), ('returnedTags', 'LSipProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSipProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSipRealmReq': ((('searchCriteria', 'ListSipRealmReq.searchCriteria', 1), ('returnedTags', 'LSipRealm', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSipRealmReq.searchCriteria': ((('realm', 'xsd:string', 0), ('userid', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSipRoutePatternReq': ((('searchCriteria', 'ListSipRoutePatternReq.searchCriteria', 1), ('returnedTags', 'LSipRoutePattern', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSipRoutePatternReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0), ('dnOrPatternIpv6', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSipTrunkReq': ((('searchCriteria', 'ListSipTrunkReq.searchCriteria', 1), ('returnedTags', 'LSipTrunk', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSipTrunkReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSipTrunkSecurityProfileReq': ((('searchCriteria', 'ListSipTrunkSecurityProfileReq.searchCriteria', 1), ('returnedTags', 'LSipTrunkSecurityProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSipTrunkSecurityProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSoftKeyTemplateReq': ((('searchCriteria', 'ListSoftKeyTemplateReq.searchCriteria', 1), ('returnedTags', 'LSoftKeyTemplate', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSoftKeyTemplateReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListSrstReq': ((('searchCriteria', 'ListSrstReq.searchCriteria', 1), ('returnedTags', 'LSrst', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListSrstReq.searchCriteria': ((('name', 'xsd:string', 0), ('ipAddress', 'xsd:string', 0)), frozenset(), None, False),
+    'ListTimePeriodReq': ((('searchCriteria', 'ListTimePeriodReq.searchCriteria', 1), ('returnedTags', 'LTimePeriod', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListTimePeriodReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListTimeScheduleReq': ((('searchCriteria', 'ListTimeScheduleReq.searchCriteria', 1), ('returnedTags', 'LTimeSchedule', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListTimeScheduleReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListTodAccessReq': ((('searchCriteria', 'ListTodAccessReq.searchCriteria', 1), ('returnedTags', 'LTodAccess', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListTodAccessReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('ownerIdName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListTransPatternReq': ((('searchCriteria', 'ListTransPatternReq.searchCriteria', 1), ('returnedTags', 'LTransPattern', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListTransPatternReq.searchCriteria': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routePartitionName', 'xsd:string', 0), ('isEmergencyServiceNumber', 'xsd:string', 0)), frozenset(), None, False),
+    'ListTranscoderReq': ((('searchCriteria', 'ListTranscoderReq.searchCriteria', 1), ('returnedTags', 'LTranscoder', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListTranscoderReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListTransformationProfileReq': ((('searchCriteria', 'ListTransformationProfileReq.searchCriteria', 1), ('returnedTags', 'LTransformationProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListTransformationProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListTvsCertificateReq': ((('searchCriteria', 'ListTvsCertificateReq.searchCriteria', 1), ('returnedTags', 'LTvsCertificate', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListTvsCertificateReq.searchCriteria': ((('subjectName', 'xsd:string', 0), ('issuerName', 'xsd:string', 0), ('serialNumber', 'xsd:string', 0), ('timeToLive', 'xsd:string', 0)), frozenset(), None, False),
+    'ListUcServiceReq': ((('searchCriteria', 'ListUcServiceReq.searchCriteria', 1), ('returnedTags', 'LUcService', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListUcServiceReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListUnassignedDeviceReq': ((('searchCriteria', 'ListUnassignedDeviceReq.searchCriteria', 1), ('returnedTags', 'LUnassignedDevice', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListUnassignedDeviceReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListUnassignedPresenceServersReq': ((('searchCriteria', 'ListUnassignedPresenceServersReq.searchCriteria', 1), ('returnedTags', 'LUnassignedPresenceServers', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListUnassignedPresenceServersReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListUnassignedPresenceUsersReq': ((('searchCriteria', 'ListUnassignedPresenceUsersReq.searchCriteria', 1), ('returnedTags', 'LUnassignedPresenceUsers', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListUnassignedPresenceUsersReq.searchCriteria': ((('userid', 'xsd:string', 0),), frozenset(), None, False),
+    'ListUniversalDeviceTemplateReq': ((('searchCriteria', 'ListUniversalDeviceTemplateReq.searchCriteria', 1), ('returnedTags', 'LUniversalDeviceTemplate', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListUniversalDeviceTemplateReq.searchCriteria': ((('name', 'xsd:string', 0), ('deviceDescription', 'xsd:string', 0)), frozenset(), None, False),
+    'ListUniversalLineTemplateReq': ((('searchCriteria', 'ListUniversalLineTemplateReq.searchCriteria', 1), ('returnedTags', 'LUniversalLineTemplate', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListUniversalLineTemplateReq.searchCriteria': ((('name', 'xsd:string', 0), ('lineDescription', 'xsd:string', 0)), frozenset(), None, False),
+    'ListUserGroupReq': ((('searchCriteria', 'ListUserGroupReq.searchCriteria', 1), ('returnedTags', 'LUserGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListUserGroupReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListUserProfileProvisionReq': ((('searchCriteria', 'ListUserProfileProvisionReq.searchCriteria', 1), ('returnedTags', 'LUserProfileProvision', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListUserProfileProvisionReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListUserReq': ((('searchCriteria', 'ListUserReq.searchCriteria', 1), ('returnedTags', 'LUser', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListUserReq.searchCriteria': ((('firstName', 'xsd:string', 0), ('lastName', 'xsd:string', 0), ('userid', 'xsd:string', 0), ('department', 'xsd:string', 0)), frozenset(), None, False),
+    'ListVohServerReq': ((('searchCriteria', 'ListVohServerReq.searchCriteria', 1), ('returnedTags', 'LVohServer', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListVohServerReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('defaultVideoStreamId', 'xsd:string', 0)), frozenset(), None, False),
+    'ListVoiceMailPilotReq': ((('searchCriteria', 'ListVoiceMailPilotReq.searchCriteria', 1), ('returnedTags', 'LVoiceMailPilot', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListVoiceMailPilotReq.searchCriteria': ((('dirn', 'xsd:string', 0), ('description', 'xsd:string', 0), ('cssName', 'xsd:string', 0)), frozenset(), None, False),
+    'ListVoiceMailPortReq': ((('searchCriteria', 'ListVoiceMailPortReq.searchCriteria', 1), ('returnedTags', 'LVoiceMailPort', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListVoiceMailPortReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'xsd:string', 0), ('devicePoolName', 'xsd:string', 0), ('securityProfileName', 'xsd:string', 0), ('dnPattern', 'xsd:string', 0)), frozenset(), None, False),
+    'ListVoiceMailProfileReq': ((('searchCriteria', 'ListVoiceMailProfileReq.searchCriteria', 1), ('returnedTags', 'LVoiceMailProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListVoiceMailProfileReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListVpnGatewayReq': ((('searchCriteria', 'ListVpnGatewayReq.searchCriteria', 1), ('returnedTags', 'LVpnGateway', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListVpnGatewayReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListVpnGroupReq': ((('searchCriteria', 'ListVpnGroupReq.searchCriteria', 1), ('returnedTags', 'LVpnGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListVpnGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListVpnProfileReq': ((('searchCriteria', 'ListVpnProfileReq.searchCriteria', 1), ('returnedTags', 'LVpnProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListVpnProfileReq.searchCriteria': ((('name', 'xsd:string', 0),), frozenset(), None, False),
+    'ListWLANProfileReq': ((('searchCriteria', 'ListWLANProfileReq.searchCriteria', 1), ('returnedTags', 'LWLANProfile', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListWLANProfileReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('ssid', 'xsd:string', 0), ('networkAccessProfile', 'xsd:string', 0)), frozenset(), None, False),
+    'ListWifiHotspotReq': ((('searchCriteria', 'ListWifiHotspotReq.searchCriteria', 1), ('returnedTags', 'LWifiHotspot', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListWifiHotspotReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('ssidPrefix', 'xsd:string', 0), ('authenticationMethod', 'xsd:string', 0)), frozenset(), None, False),
+    'ListWirelessAccessPointControllersReq': ((('searchCriteria', 'ListWirelessAccessPointControllersReq.searchCriteria', 1), ('returnedTags', 'LWirelessAccessPointControllers', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListWirelessAccessPointControllersReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'ListWlanProfileGroupReq': ((('searchCriteria', 'ListWlanProfileGroupReq.searchCriteria', 1), ('returnedTags', 'LWlanProfileGroup', 1), ('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset({'sequence'}), None, False),
+    'ListWlanProfileGroupReq.searchCriteria': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'NameAndGUIDRequest': ((('name', 'String100', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'NewIlsConfig': ((('clusterId', 'xsd:string', 0), ('lastContactTime', 'xsd:string', 0), ('clusterUriString', 'xsd:string', 0), ('role', 'xsd:string', 0), ('lastDataRecieved', 'xsd:string', 0), ('syncronizationStatus', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'NewLLdapSyncCustomField': ((('ldapUserField', 'xsd:string', 0),), frozenset({'uuid'}), None, False),
+    'OXAddOnModule': ((('model', 'OXFkTypeProduct_Protocol', 0),), frozenset({'uuid'}), None, False),
+    'OXBLFDirectedCallPark': ((('directedCallParkId', 'XUUID', 0), ('directedCallParkDnAndPartition', 'OXBLFDirectedCallPark.directedCallParkDnAndPartition', 0)), frozenset(), None, False),
+    'OXBLFDirectedCallPark.directedCallParkDnAndPartition': ((('dnPattern', 'String255', 0), ('routePartitionName', 'OXFkType', 0)), frozenset(), None, False),
+    'OXCallForwardAll': ((('callingSearchSpaceName', 'OXFkType', 0), ('secondaryCallingSearchSpaceName', 'OXFkType', 0)), frozenset(), None, False),
+    'OXCallForwardAlternateParty': ((('callingSearchSpaceName', 'OXFkType', 0),), frozenset(), None, False),
+    'OXCallForwardBusy': ((('callingSearchSpaceName', 'OXFkType', 0),), frozenset(), None, False),
+    'OXCallForwardBusyInt': ((('callingSearchSpaceName', 'OXFkType', 0),), frozenset(), None, False),
+    'OXCallForwardNoAnswer': ((('callingSearchSpaceName', 'OXFkType', 0),), frozenset(), None, False),
+    'OXCallForwardNoAnswerInt': ((('callingSearchSpaceName', 'OXFkType', 0),), frozenset(), None, False),
+    'OXCallForwardNoCoverage': ((('callingSearchSpaceName', 'OXFkType', 0),), frozenset(), None, False),
+    'OXCallForwardNoCoverageInt': ((('callingSearchSpaceName', 'OXFkType', 0),), frozenset(), None, False),
+    'OXCallForwardNotRegistered': ((('callingSearchSpaceName', 'OXFkType', 0),), frozenset(), None, False),
+    'OXCallForwardNotRegisteredInt': ((('callingSearchSpaceName', 'OXFkType', 0),), frozenset(), None, False),
+    'OXCallForwardOnFailure': ((('callingSearchSpaceName', 'OXFkType', 0),), frozenset(), None, False),
+    'OXDeviceProfile': ((('product', 'OXFkType', 0), ('class', 'OXFkType', 0), ('protocol', 'OXFkTypeProduct', 0), ('protocolSide', 'OXFkType', 0), ('userHoldMohAudioSourceId', 'OXFkType', 0), ('mlppIndicationStatus', 'OXFkType', 0), ('preemption', 'OXFkType', 0), ('lines', 'OXDeviceProfile.lines', 0), ('phoneTemplateName', 'OXFkTypeProduct_Protocol', 0), ('blfDirectedCallParks', 'OXDeviceProfile.blfDirectedCallParks', 0), ('addOnModules', 'OXDeviceProfile.addOnModules', 0), ('userLocale', 'OXFkType', 0), ('singleButtonBarge', 'OXFkType', 0), ('joinAcrossLines', 'OXFkType', 0), ('loginUserId', 'OXFkType', 0), ('dndOption', 'OXFkType', 0), ('dndRingSetting', 'OXFkType', 0), ('emccCallingSearchSpace', 'OXFkType', 0), ('alwaysUsePrimeLine', 'OXFkType', 0), ('alwaysUsePrimeLineForVoiceMessage', 'OXFkType', 0), ('softkeyTemplateName', 'OXFkType', 0), ('callInfoPrivacyStatus', 'OXFkType', 0), ('services', 'OXDeviceProfile.services', 0), ('featureControlPolicy', 'OXFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'OXDeviceProfile.addOnModules': ((('addOnModule', 'OXAddOnModule', 2),), frozenset(), None, False),
+    'OXDeviceProfile.blfDirectedCallParks': ((('blfDirectedCallPark', 'OXBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'OXDeviceProfile.lines': ((('line', 'OXPhoneLine', 2), ('lineIdentifier', 'OXNumplanIdentifier', 2)), frozenset(), None, False),
+    'OXDeviceProfile.services': ((('service', 'OXSubscribedService', 2),), frozenset(), None, False),
+    'OXDirectoryUri': ((('partition', 'OXFkType', 0),), frozenset({'uuid'}), None, False),
+    'OXDirn': ((('routePartitionName', 'OXFkType', 0),), frozenset({'uuid'}), None, False),
+    'OXFkType': ((('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0)), frozenset(), None, False),
+    'OXFkTypeProduct': ((('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0), ('product', 'xsd:string', 1)), frozenset(), None, False),
+    'OXFkTypeProduct_Protocol': ((('skip', 'xsd:unsignedLong', 0), ('first', 'xsd:unsignedLong', 0), ('product', 'xsd:string', 1), ('protocol', 'xsd:string', 1)), frozenset(), None, False),
+    'OXLine': ((('usage', 'OXFkType', 0), ('routePartitionName', 'OXFkType', 0), ('aarNeighborhoodName', 'OXFkType', 0), ('callForwardAll', 'OXCallForwardAll', 0), ('callForwardBusy', 'OXCallForwardBusy', 0), ('callForwardBusyInt', 'OXCallForwardBusyInt', 0), ('callForwardNoAnswer', 'OXCallForwardNoAnswer', 0), ('callForwardNoAnswerInt', 'OXCallForwardNoAnswerInt', 0), ('callForwardNoCoverage', 'OXCallForwardNoCoverage', 0), ('callForwardNoCoverageInt', 'OXCallForwardNoCoverageInt', 0), ('callForwardOnFailure', 'OXCallForwardOnFailure', 0), ('callForwardAlternateParty', 'OXCallForwardAlternateParty', 0), ('callForwardNotRegistered', 'OXCallForwardNotRegistered', 0), ('callForwardNotRegisteredInt', 'OXCallForwardNotRegisteredInt', 0), ('callPickupGroupName', 'OXFkType', 0), ('autoAnswer', 'OXFkType', 0), ('networkHoldMohAudioSourceId', 'OXFkType', 0), ('userHoldMohAudioSourceId', 'OXFkType', 0), ('callingIdPresentationWhenDiverted', 'OXFkType', 0), ('presenceGroupName', 'OXFkType', 0), ('shareLineAppearanceCssName', 'OXFkType', 0), ('voiceMailProfileName', 'OXFkType', 0), ('patternPrecedence', 'OXFkType', 0), ('releaseClause', 'OXFkType', 0), ('cfaCssPolicy', 'OXFkType', 0), ('defaultActivatedDeviceName', 'OXFkType', 0), ('parkMonForwardNoRetrieveCssName', 'OXFkType', 0), ('parkMonForwardNoRetrieveIntCssName', 'OXFkType', 0), ('partyEntranceTone', 'OXFkType', 0), ('directoryURIs', 'OXLine.directoryURIs', 0), ('confidentialAccess', 'OXLine.confidentialAccess', 0), ('externalCallControlProfile', 'OXFkType', 0), ('enterpriseAltNum', 'OXLine.enterpriseAltNum', 0), ('e164AltNum', 'OXLine.e164AltNum', 0)), frozenset({'uuid'}), None, False),
+    'OXLine.confidentialAccess': ((('confidentialAccessMode', 'OXFkType', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'OXLine.directoryURIs': ((('directoryUri', 'OXDirectoryUri', 2),), frozenset(), None, False),
+    'OXLine.e164AltNum': ((('numMask', 'xsd:string', 0), ('isUrgent', 'boolean', 0), ('addLocalRoutePartition', 'boolean', 0), ('routePartition', 'OXFkType', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'OXLine.enterpriseAltNum': ((('numMask', 'xsd:string', 0), ('isUrgent', 'boolean', 0), ('addLocalRoutePartition', 'boolean', 0), ('routePartition', 'OXFkType', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'OXNumplanIdentifier': ((), frozenset(), None, False),
+    'OXPhone': ((('product', 'OXFkType', 0), ('class', 'OXFkType', 0), ('protocol', 'OXFkTypeProduct', 0), ('protocolSide', 'OXFkType', 0), ('callingSearchSpaceName', 'OXFkType', 0), ('devicePoolName', 'OXFkType', 0), ('commonDeviceConfigName', 'OXFkType', 0), ('commonPhoneConfigName', 'OXFkType', 0), ('networkLocation', 'OXFkType', 0), ('locationName', 'OXFkType', 0), ('mediaResourceListName', 'OXFkType', 0), ('networkHoldMohAudioSourceId', 'OXFkType', 0), ('userHoldMohAudioSourceId', 'OXFkType', 0), ('automatedAlternateRoutingCssName', 'OXFkType', 0), ('aarNeighborhoodName', 'OXFkType', 0), ('mlppIndicationStatus', 'OXFkType', 0), ('preemption', 'OXFkType', 0), ('useTrustedRelayPoint', 'OXFkType', 0), ('securityProfileName', 'OXFkTypeProduct_Protocol', 0), ('sipProfileName', 'OXFkType', 0), ('cgpnTransformationCssName', 'OXFkType', 0), ('geoLocationName', 'OXFkType', 0), ('geoLocationFilterName', 'OXFkType', 0), ('lines', 'OXPhone.lines', 0), ('phoneTemplateName', 'OXFkType', 0), ('primaryPhoneName', 'OXFkType', 0), ('ringSettingIdleBlfAudibleAlert', 'OXFkType', 0), ('ringSettingBusyBlfAudibleAlert', 'OXFkType', 0), ('blfDirectedCallParks', 'OXPhone.blfDirectedCallParks', 0), ('addOnModules', 'OXPhone.addOnModules', 0), ('userLocale', 'OXFkType', 0), ('networkLocale', 'OXFkTypeProduct', 0), ('services', 'OXPhone.services', 0), ('softkeyTemplateName', 'OXFkType', 0), ('defaultProfileName', 'OXFkTypeProduct_Protocol', 0), ('singleButtonBarge', 'OXFkType', 0), ('joinAcrossLines', 'OXFkType', 0), ('builtInBridgeStatus', 'OXFkType', 0), ('callInfoPrivacyStatus', 'OXFkType', 0), ('ownerUserName', 'OXFkTypeProduct', 0), ('packetCaptureMode', 'OXFkType', 0), ('subscribeCallingSearchSpaceName', 'OXFkType', 0), ('rerouteCallingSearchSpaceName', 'OXFkType', 0), ('presenceGroupName', 'OXFkType', 0), ('certificateOperation', 'OXFkType', 0), ('authenticationMode', 'OXFkType', 0), ('keySize', 'OXFkType', 0), ('keyOrder', 'OXFkType', 0), ('ecKeySize', 'OXFkType', 0), ('deviceMobilityMode', 'OXFkType', 0), ('dndOption', 'OXFkTypeProduct_Protocol', 0), ('dndRingSetting', 'OXFkType', 0), ('mobilityUserIdName', 'OXFkType', 0), ('phoneSuite', 'OXFkType', 0), ('phoneServiceDisplay', 'OXFkType', 0), ('mtpPreferedCodec', 'OXFkType', 0), ('dialRulesName', 'OXFkTypeProduct', 0), ('outboundCallRollover', 'OXFkType', 0), ('alwaysUsePrimeLine', 'OXFkType', 0), ('alwaysUsePrimeLineForVoiceMessage', 'OXFkType', 0), ('featureControlPolicy', 'OXFkType', 0), ('deviceTrustMode', 'OXFkType', 0), ('confidentialAccess', 'OXPhone.confidentialAccess', 0), ('cgpnIngressDN', 'OXFkType', 0), ('wifiHotspotProfile', 'OXFkType', 0), ('wirelessLanProfileGroup', 'OXFkType', 0), ('elinGroup', 'OXFkType', 0), ('mraServiceDomain', 'OXFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'OXPhone.addOnModules': ((('addOnModule', 'OXAddOnModule', 2),), frozenset(), None, False),
+    'OXPhone.blfDirectedCallParks': ((('blfDirectedCallPark', 'OXBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'OXPhone.confidentialAccess': ((('confidentialAccessMode', 'OXFkType', 0), ('confidentialAccessLevel', 'OXFkType', 0)), frozenset(), None, False),
+    'OXPhone.lines': ((('line', 'OXPhoneLine', 2), ('lineIdentifier', 'OXNumplanIdentifier', 2)), frozenset(), None, False),
+    'OXPhone.services': ((('service', 'OXSubscribedService', 2),), frozenset(), None, False),
+    'OXPhoneLine': ((('dirn', 'OXDirn', 0), ('ringSetting', 'OXFkType', 0), ('consecutiveRingSetting', 'OXFkType', 0), ('ringSettingIdlePickupAlert', 'OXFkType', 0), ('ringSettingActivePickupAlert', 'OXFkType', 0), ('mwlPolicy', 'OXFkType', 0), ('recordingProfileName', 'OXFkType', 0), ('monitoringCssName', 'OXFkType', 0), ('recordingFlag', 'OXFkType', 0), ('audibleMwi', 'OXFkType', 0), ('partitionUsage', 'OXFkType', 0), ('recordingMediaSource', 'OXFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'OXSipProfile': ((('userInfo', 'OXFkType', 0), ('dtmfDbLevel', 'OXFkType', 0), ('callHoldRingback', 'OXFkType', 0), ('anonymousCallBlock', 'OXFkType', 0), ('callerIdBlock', 'OXFkType', 0), ('dndControl', 'OXFkType', 0), ('telnetLevel', 'OXFkType', 0), ('rerouteIncomingRequest', 'OXFkType', 0), ('resourcePriorityNamespaceListName', 'OXFkType', 0), ('rsvpOverSip', 'OXFkType', 0), ('sipRe11XxEnabled', 'OXFkType', 0), ('gClear', 'OXFkType', 0), ('sipBandwidthModifier', 'OXFkType', 0), ('userAgentServerHeaderInfo', 'OXFkType', 0), ('sipNormalizationScript', 'OXFkType', 0), ('dialStringInterpretation', 'OXFkType', 0), ('acceptAudioCodecPreferences', 'OXFkType', 0), ('resourcePriorityNamespace', 'OXFkType', 0), ('callingLineIdentification', 'OXFkType', 0), ('videoCallTrafficClass', 'OXFkType', 0), ('sdpTransparency', 'OXFkType', 0), ('sipSessionRefreshMethod', 'OXFkType', 0), ('earlyOfferSuppVoiceCall', 'OXFkType', 0), ('cucmVersionInSipHeader', 'OXFkType', 0), ('confidentialAccessLevelHeaders', 'OXFkType', 0)), frozenset({'uuid'}), None, False),
+    'OXSubscribedService': ((('telecasterServiceName', 'OXFkType', 0),), frozenset({'uuid'}), None, False),
+    'OXTransPattern': ((('usage', 'OXFkType', 0), ('routePartitionName', 'OXFkType', 0), ('useCallingPartyPhoneMask', 'OXFkType', 0), ('dialPlanName', 'OXFkType', 0), ('digitDiscardInstructionName', 'OXFkType', 0), ('routeFilterName', 'OXFkType', 0), ('callingLinePresentationBit', 'OXFkType', 0), ('callingNamePresentationBit', 'OXFkType', 0), ('connectedLinePresentationBit', 'OXFkType', 0), ('connectedNamePresentationBit', 'OXFkType', 0), ('patternPrecedence', 'OXFkType', 0), ('callingPartyNumberingPlan', 'OXFkType', 0), ('callingPartyNumberType', 'OXFkType', 0), ('calledPartyNumberingPlan', 'OXFkType', 0), ('calledPartyNumberType', 'OXFkType', 0), ('callingSearchSpaceName', 'OXFkType', 0), ('resourcePriorityNamespaceName', 'OXFkType', 0), ('routeClass', 'OXFkType', 0), ('callInterceptProfileName', 'OXFkType', 0), ('releaseClause', 'OXFkType', 0)), frozenset({'uuid'}), None, False),
+    'RAarGroup': ((('name', 'String32', 0), ('relatedGroups', 'RAarGroup.relatedGroups', 0)), frozenset({'uuid'}), None, False),
+    'RAarGroup.relatedGroups': ((('relatedGroup', 'RAarGroupRelationship', 2),), frozenset(), None, False),
+    'RAarGroupRelationship': ((('aarGroupFromName', 'XFkType', 0), ('aarGroupToName', 'XFkType', 0), ('prefixDigit', 'String32', 0)), frozenset({'uuid'}), None, False),
+    'RAddOnModule': ((('loadInformation', 'XLoadInformation', 0), ('model', 'XModel', 0), ('index', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RAdvertisedPatterns': ((('description', 'xsd:string', 0), ('pattern', 'xsd:string', 0), ('patternType', 'XGlobalNumber', 0), ('hostedRoutePSTNRule', 'XHostedRoutePatternPSTNRule', 0), ('pstnFailStrip', 'XInteger', 0), ('pstnFailPrepend', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RAnalogPort': ((('portNumber', 'XInteger', 0), ('attendantDn', 'String255', 0), ('unattendedPort', 'boolean', 0), ('callerIdDn', 'String255', 0), ('callerIdEnable', 'boolean', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('digitSending', 'XDigitSending', 0), ('expectedDigits', 'XInteger', 0), ('sigDigits', 'RAnalogPort.sigDigits', 0), ('lines', 'RAnalogPort.lines', 0), ('prefixDn', 'String255', 0), ('presentationBit', 'XPresentationBit', 0), ('silenceSuppressionThreshold', 'XSilenceSuppressionThreshold', 0), ('smdiPortNumber', 'XInteger', 0), ('startDialProtocol', 'XStartDialProtocol', 0), ('trunk', 'XTrunk', 0), ('trunkDirection', 'XTrunkDirection', 0), ('trunkLevel', 'XTrunkLevel', 0), ('trunkPadRx', 'XTrunkPad', 0), ('trunkPadTx', 'XTrunkPad', 0), ('vendorConfig', 'XVendorConfig', 0), ('timer1', 'XInteger', 0), ('timer2', 'XInteger', 0), ('timer3', 'XInteger', 0), ('timer4', 'XInteger', 0), ('timer5', 'XInteger', 0), ('timer6', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RAnalogPort.lines': ((('line', 'RPhoneLine', 0), ('lineIdentifier', 'RNumplanIdentifier', 0)), frozenset(), None, False),
+    'RAnalogPort.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'RAnnouncement': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('announcementFile', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RAnnunciator': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('serverName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RAppServerInfo': ((('appServerName', 'XFkType', 0), ('appServerContent', 'XAppServerContent', 0), ('content', 'XContent', 0)), frozenset({'uuid'}), None, False),
+    'RAppUser': ((('userid', 'xsd:string', 0), ('password', 'xsd:string', 0), ('passwordCredentials', 'RAppUser.passwordCredentials', 0), ('digestCredentials', 'xsd:string', 0), ('presenceGroupName', 'XFkType', 0), ('acceptPresenceSubscription', 'boolean', 0), ('acceptOutOfDialogRefer', 'boolean', 0), ('acceptUnsolicitedNotification', 'boolean', 0), ('allowReplaceHeader', 'boolean', 0), ('isStandard', 'boolean', 0), ('associatedDevices', 'RAppUser.associatedDevices', 0), ('associatedGroups', 'RAppUser.associatedGroups', 0), ('associatedCapfProfiles', 'RAppUser.associatedCapfProfiles', 0), ('ctiControlledDeviceProfiles', 'RAppUser.ctiControlledDeviceProfiles', 0)), frozenset({'uuid'}), None, False),
+    'RAppUser.associatedCapfProfiles': ((('capfProfileInstanceId', 'String128', 2),), frozenset(), None, False),
+    'RAppUser.associatedDevices': ((('device', 'String50', 2),), frozenset(), None, False),
+    'RAppUser.associatedGroups': ((('userGroup', 'RAppUser.associatedGroups.userGroup', 2),), frozenset(), None, False),
+    'RAppUser.associatedGroups.userGroup': ((('name', 'String100', 0), ('userRoles', 'RAppUser.associatedGroups.userGroup.userRoles', 0)), frozenset(), None, False),
+    'RAppUser.associatedGroups.userGroup.userRoles': ((('userRole', 'String100', 2),), frozenset(), None, False),
+    'RAppUser.ctiControlledDeviceProfiles': ((('deviceProfile', 'String50', 2),), frozenset(), None, False),
+    'RAppUser.passwordCredentials': ((('pwdCredPolicyName', 'XFkType', 0), ('pwdCredUserCantChange', 'boolean', 0), ('pwdCredUserMustChange', 'boolean', 0), ('pwdCredDoesNotExpire', 'boolean', 0), ('pwdCredTimeChanged', 'xsd:string', 0), ('pwdCredTimeAdminLockout', 'xsd:string', 0), ('pwdCredLockedByAdministrator', 'boolean', 0), ('pwdResetHackCount', 'boolean', 0)), frozenset(), None, False),
+    'RApplicationDialRules': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('numberBeginWith', 'xsd:string', 0), ('numberOfDigits', 'XInteger', 0), ('digitsToBeRemoved', 'XInteger', 0), ('prefixPattern', 'xsd:string', 0), ('priority', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RApplicationServer': ((('appServerType', 'XAppServer', 0), ('name', 'xsd:string', 0), ('ipAddress', 'xsd:string', 0), ('appUsers', 'RApplicationServer.appUsers', 0), ('url', 'xsd:string', 0), ('endUserUrl', 'xsd:string', 0), ('processNodeName', 'XFkType', 0), ('endUsers', 'RApplicationServer.endUsers', 0)), frozenset({'uuid'}), None, False),
+    'RApplicationServer.appUsers': ((('selectedAppUser', 'RApplicationServer.appUsers.selectedAppUser', 2),), frozenset(), None, False),
+    'RApplicationServer.appUsers.selectedAppUser': ((('appUserName', 'XFkType', 0), ('content', 'XContent', 0)), frozenset(), None, False),
+    'RApplicationServer.endUsers': ((('selectedEndUser', 'RApplicationServer.endUsers.selectedEndUser', 2),), frozenset(), None, False),
+    'RApplicationServer.endUsers.selectedEndUser': ((('endUserName', 'XFkType', 0), ('content', 'XContent', 0)), frozenset(), None, False),
+    'RApplicationUserCapfProfile': ((('applicationUser', 'XFkType', 0), ('instanceId', 'xsd:string', 0), ('certificateOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('operationCompletion', 'xsd:string', 0), ('certificationOperationStatus', 'XCertificateStatus', 0)), frozenset({'uuid'}), None, False),
+    'RArrayOfHosts': ((('item', 'xsd:string', 2),), frozenset(), None, False),
+    'RAudioCodecPreferenceList': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('codecsInList', 'RAudioCodecPreferenceList.codecsInList', 0)), frozenset({'uuid'}), None, False),
+    'RAudioCodecPreferenceList.codecsInList': ((('codecNames', 'xsd:string', 2),), frozenset(), None, False),
+    'RBLFDirectedCallPark': ((('label', 'String50', 0), ('directedCallParkId', 'XUUID', 0), ('directedCallParkDnAndPartition', 'RBLFDirectedCallPark.directedCallParkDnAndPartition', 0), ('index', 'XInteger', 0)), frozenset(), None, False),
+    'RBLFDirectedCallPark.directedCallParkDnAndPartition': ((('dnPattern', 'String255', 0), ('routePartitionName', 'XFkType', 0)), frozenset(), None, False),
+    'RBillingServer': ((('hostName', 'xsd:string', 0), ('userId', 'xsd:string', 0), ('password', 'xsd:string', 0), ('directory', 'xsd:string', 0), ('resendOnFailure', 'boolean', 0), ('billingServerProtocol', 'XBillingserverprotocol', 0)), frozenset({'uuid'}), None, False),
+    'RBlockedLearnedPatterns': ((('description', 'xsd:string', 0), ('pattern', 'xsd:string', 0), ('prefix', 'xsd:string', 0), ('clusterId', 'xsd:string', 0), ('patternType', 'XGlobalNumber', 0)), frozenset({'uuid'}), None, False),
+    'RBusyLampField': ((('blfDest', 'xsd:string', 0), ('blfDirn', 'String255', 0), ('routePartition', 'xsd:string', 0), ('label', 'xsd:string', 0), ('associatedBlfSdFeatures', 'RBusyLampField.associatedBlfSdFeatures', 0), ('index', 'XInteger', 0)), frozenset(), None, False),
+    'RBusyLampField.associatedBlfSdFeatures': ((('feature', 'XBLFSDOption', 2),), frozenset(), None, False),
+    'RButton': ((('feature', 'XFeature', 0), ('label', 'String50', 0), ('buttonNumber', 'XInteger', 0), ('isFixedFeature', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RCCAProfiles': ((('ccaId', 'xsd:string', 0), ('primarySoftSwitchId', 'xsd:string', 0), ('secondarySoftSwitchId', 'xsd:string', 0), ('objectClass', 'xsd:string', 0), ('subscriberType', 'xsd:string', 0), ('sipAliasSuffix', 'xsd:string', 0), ('sipUserNameSuffix', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RCallForwardAll': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('secondaryCallingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0)), frozenset(), None, False),
+    'RCallForwardAlternateParty': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0), ('duration', 'XInteger', 0)), frozenset(), None, False),
+    'RCallForwardBusy': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0)), frozenset(), None, False),
+    'RCallForwardBusyInt': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0)), frozenset(), None, False),
+    'RCallForwardNoAnswer': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0), ('duration', 'XInteger', 0)), frozenset(), None, False),
+    'RCallForwardNoAnswerInt': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0), ('duration', 'XInteger', 0)), frozenset(), None, False),
+    'RCallForwardNoCoverage': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0)), frozenset(), None, False),
+    'RCallForwardNoCoverageInt': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0)), frozenset(), None, False),
+    'RCallForwardNotRegistered': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0)), frozenset(), None, False),
+    'RCallForwardNotRegisteredInt': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0)), frozenset(), None, False),
+    'RCallForwardOnFailure': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0), ('destination', 'String50', 0)), frozenset(), None, False),
+    'RCallManager': ((('name', 'String50', 0), ('description', 'String50', 0), ('autoRegistration', 'RCallManager.autoRegistration', 0), ('ports', 'RCallManager.ports', 0), ('processNodeName', 'XFkType', 0), ('lbmGroup', 'XFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RCallManager.autoRegistration': ((('startDn', 'String255', 0), ('endDn', 'String255', 0), ('nextDn', 'String255', 0), ('routePartitionName', 'XFkType', 0), ('e164Mask', 'String50', 0), ('autoRegistrationEnabled', 'boolean', 0), ('universalDeviceTemplate', 'XFkType', 0), ('lineTemplate', 'XFkType', 0)), frozenset(), None, False),
+    'RCallManager.ports': ((('ethernetPhonePort', 'XInteger', 0), ('mgcpPorts', 'RCallManager.ports.mgcpPorts', 0), ('sipPorts', 'RCallManager.ports.sipPorts', 0)), frozenset(), None, False),
+    'RCallManager.ports.mgcpPorts': ((('listen', 'XInteger', 0), ('keepAlive', 'XInteger', 0)), frozenset(), None, False),
+    'RCallManager.ports.sipPorts': ((('sipPhonePort', 'XInteger', 0), ('sipPhoneSecurePort', 'XInteger', 0), ('sipOAuthPort', 'XInteger', 0), ('sipOAuthMRAPort', 'XInteger', 0)), frozenset(), None, False),
+    'RCallManagerGroup': ((('name', 'String50', 0), ('tftpDefault', 'boolean', 0), ('members', 'RCallManagerGroup.members', 0)), frozenset({'uuid'}), None, False),
+    'RCallManagerGroup.members': ((('member', 'RCallManagerMember', 2),), frozenset(), None, False),
+    'RCallManagerMember': ((('callManagerName', 'XFkType', 0), ('priority', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RCallPark': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('callManagerName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RCallPickupGroup': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('members', 'RCallPickupGroup.members', 0), ('pickupNotification', 'XPickupNotification', 0), ('pickupNotificationTimer', 'XInteger', 0), ('callInfoForPickupNotification', 'RCallPickupGroup.callInfoForPickupNotification', 0), ('name', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RCallPickupGroup.callInfoForPickupNotification': ((('callingPartyInfo', 'boolean', 0), ('calledPartyInfo', 'boolean', 0)), frozenset(), None, False),
+    'RCallPickupGroup.members': ((('member', 'RPickupGroupMember', 2),), frozenset(), None, False),
+    'RCallStateMember': ((('callStateName', 'xsd:string', 4), ('softKeys', 'RCallStateMember.softKeys', 0)), frozenset(), None, False),
+    'RCallStateMember.softKeys': ((('softKey', 'RSoftKeyMember', 2),), frozenset(), None, False),
+    'RCalledPartyTransformationPattern': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('calledPartyTransformationMask', 'xsd:string', 0), ('dialPlanName', 'XFkType', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('patternUrgency', 'boolean', 0), ('routeFilterName', 'XFkType', 0), ('calledPartyPrefixDigits', 'xsd:string', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('mlppPreemptionDisabled', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RCallerFilterList': ((('name', 'String50', 0), ('description', 'String128', 0), ('isAllowedType', 'boolean', 0), ('endUserIdName', 'XFkType', 0), ('members', 'RCallerFilterList.members', 0)), frozenset({'uuid'}), None, False),
+    'RCallerFilterList.members': ((('member', 'RCallerFilterListMember', 2),), frozenset(), None, False),
+    'RCallerFilterListMember': ((('DnMask', 'String50', 0), ('callerFilterMask', 'XCallerFilterMask', 0)), frozenset({'uuid'}), None, False),
+    'RCallingPartyTransformationPattern': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('callingPartyTransformationMask', 'xsd:string', 0), ('useCallingPartyPhoneMask', 'XStatus', 0), ('dialPlanName', 'XFkType', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('patternUrgency', 'boolean', 0), ('callingPartyPrefixDigits', 'String50', 0), ('routeFilterName', 'XFkType', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('mlppPreemptionDisabled', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RCallingSearchSpaceMember': ((('routePartitionName', 'XFkType', 0), ('index', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RCallsQueue': ((('maxCallersInQueue', 'XInteger', 0), ('queueFullDestination', 'String50', 0), ('callingSearchSpacePilotQueueFull', 'XFkType', 0), ('maxWaitTimeInQueue', 'XInteger', 0), ('maxWaitTimeDestination', 'String50', 0), ('callingSearchSpaceMaxWaitTime', 'XFkType', 0), ('noAgentDestination', 'String50', 0), ('callingSearchSpaceNoAgent', 'XFkType', 0), ('networkHoldMohAudioSourceID', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RCcdAdvertisingService': ((('name', 'String50', 0), ('description', 'String50', 0), ('isActivated', 'boolean', 0), ('hostDnGroup', 'XFkType', 0), ('safSipTrunk', 'XFkType', 0), ('safH323Trunk', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RCcdHostedDN': ((('hostedPattern', 'String50', 0), ('description', 'String255', 0), ('CcdHostedDnGroup', 'XFkType', 0), ('pstnFailoverStripDigits', 'XInteger', 0), ('pstnFailoverPrependDigits', 'String255', 0), ('usePstnFailover', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RCcdHostedDNGroup': ((('name', 'String255', 0), ('description', 'String255', 0), ('pstnFailoverStripDigits', 'XInteger', 0), ('pstnFailoverPrependDigits', 'String255', 0), ('usePstnFailover', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RCcdParam': ((('ccdParamName', 'xsd:string', 0), ('ccdParamValue', 'xsd:string', 0)), frozenset(), None, False),
+    'RCcdRequestingService': ((('name', 'String50', 0), ('description', 'String50', 0), ('isActivated', 'boolean', 0), ('routePartitionName', 'XFkType', 0), ('learnedPatternPrefix', 'String50', 0), ('pstnPrefix', 'String50', 0), ('associatedTrunks', 'RCcdRequestingService.associatedTrunks', 0)), frozenset({'uuid'}), None, False),
+    'RCcdRequestingService.associatedTrunks': ((('associatedTrunk', 'RCcdRequestingServiceMember', 2),), frozenset(), None, False),
+    'RCcdRequestingServiceMember': ((('trunkName', 'XFkType', 0),), frozenset({'uuid'}), None, False),
+    'RCcmExternalIpMap': ((('callManagerName', 'XFkType', 0), ('ipAddressHost', 'String255', 0), ('port', 'String255', 0)), frozenset({'uuid'}), None, False),
+    'RCertificateRole': ((('roleName', 'XTrustRole', 0),), frozenset({'uuid'}), None, False),
+    'RCiscoCatalyst600024PortFXSGateway': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('vendorConfig', 'XVendorConfig', 0), ('versionStamp', 'String128', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('ports', 'RCiscoCatalyst600024PortFXSGateway.ports', 0), ('portSelectionOrder', 'XTrunkSelectionOrder', 0), ('transmitUtf8', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RCiscoCatalyst600024PortFXSGateway.ports': ((('port', 'RAnalogPort', 2),), frozenset(), None, False),
+    'RCiscoCatalyst6000E1VoIPGateway': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('redirectInboundNumberIe', 'boolean', 0), ('calledPlan', 'XNumberingPlan', 0), ('calledPri', 'XPriOfNumber', 0), ('callerIdDn', 'String255', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingPlan', 'XNumberingPlan', 0), ('callingPri', 'XPriOfNumber', 0), ('chanIe', 'XPRIChanIE', 0), ('clockReference', 'XClockReference', 0), ('dChannelEnable', 'boolean', 0), ('channelSelectionOrder', 'XTrunkSelectionOrder', 0), ('displayIE', 'boolean', 0), ('pcmType', 'XEncode', 0), ('csuParam', 'XCSUParam', 0), ('firstDelay', 'XInteger', 0), ('interfaceIdPresent', 'boolean', 0), ('interfaceId', 'XInteger', 0), ('intraDelay', 'XInteger', 0), ('mcdnEnable', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('numDigitsToStrip', 'XInteger', 0), ('passingPrecedenceLevelThrough', 'boolean', 0), ('prefix', 'xsd:string', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('connectedLineIdPresentation', 'XPresentationBit', 0), ('priProtocol', 'XPriProtocol', 0), ('securityAccessLevel', 'XInteger', 0), ('sendCallingNameInFacilityIe', 'boolean', 0), ('sendExLeadingCharInDispIe', 'boolean', 0), ('sendRestart', 'boolean', 0), ('setupNonIsdnPi', 'boolean', 0), ('sigDigits', 'RCiscoCatalyst6000E1VoIPGateway.sigDigits', 0), ('span', 'XInteger', 0), ('statusPoll', 'boolean', 0), ('smdiBasePort', 'XInteger', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('transmitUtf8', 'boolean', 0), ('v150', 'boolean', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('QSIGVariant', 'XQSIGVariant', 0), ('unattendedPort', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('geoLocationFilterName', 'XFkType', 0), ('nationalStripDigits', 'XInteger', 0), ('internationalStripDigits', 'XInteger', 0), ('unknownStripDigits', 'XInteger', 0), ('subscriberStripDigits', 'XInteger', 0), ('nationalTransformationCssName', 'XFkType', 0), ('internationalTransformationCssName', 'XFkType', 0), ('unknownTransformationCssName', 'XFkType', 0), ('subscriberTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RCiscoCatalyst6000E1VoIPGateway.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'RCiscoCatalyst6000T1VoIPGatewayPri': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('mlppPreemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('redirectInboundNumberIe', 'boolean', 0), ('calledPlan', 'XNumberingPlan', 0), ('calledPri', 'XPriOfNumber', 0), ('callerIdDn', 'String255', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingPlan', 'XNumberingPlan', 0), ('callingPri', 'XPriOfNumber', 0), ('chanIe', 'XPRIChanIE', 0), ('clockReference', 'XClockReference', 0), ('dChannelEnable', 'boolean', 0), ('channelSelectionOrder', 'XTrunkSelectionOrder', 0), ('displayIE', 'boolean', 0), ('pcmType', 'XEncode', 0), ('csuParam', 'XCSUParam', 0), ('firstDelay', 'XInteger', 0), ('interfaceIdPresent', 'boolean', 0), ('interfaceId', 'XInteger', 0), ('intraDelay', 'XInteger', 0), ('mcdnEnable', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('numDigitsToStrip', 'XInteger', 0), ('passingPrecedenceLevelThrough', 'boolean', 0), ('prefix', 'xsd:string', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('connectedLineIdPresentation', 'XPresentationBit', 0), ('priProtocol', 'XPriProtocol', 0), ('securityAccessLevel', 'XInteger', 0), ('sendCallingNameInFacilityIe', 'boolean', 0), ('sendExLeadingCharInDispIe', 'boolean', 0), ('sendRestart', 'boolean', 0), ('setupNonIsdnPi', 'boolean', 0), ('sigDigits', 'RCiscoCatalyst6000T1VoIPGatewayPri.sigDigits', 0), ('span', 'XInteger', 0), ('statusPoll', 'boolean', 0), ('smdiBasePort', 'XInteger', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('transmitUtf8', 'boolean', 0), ('v150', 'boolean', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('QSIGVariant', 'XQSIGVariant', 0), ('unattendedPort', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('geoLocationFilterName', 'XFkType', 0), ('nationalStripDigits', 'XInteger', 0), ('internationalStripDigits', 'XInteger', 0), ('unknownStripDigits', 'XInteger', 0), ('subscriberStripDigits', 'XInteger', 0), ('nationalTransformationCssName', 'XFkType', 0), ('internationalTransformationCssName', 'XFkType', 0), ('unknownTransformationCssName', 'XFkType', 0), ('subscriberTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RCiscoCatalyst6000T1VoIPGatewayPri.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'RCiscoCatalyst6000T1VoIPGatewayT1': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('vendorConfig', 'XVendorConfig', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('sendGeoLocation', 'boolean', 0), ('ports', 'RCiscoCatalyst6000T1VoIPGatewayT1.ports', 0), ('trunkSelectionOrder', 'XTrunkSelectionOrder', 0), ('clockReference', 'XClockReference', 0), ('csuParam', 'XCSUParam', 0), ('digitSending', 'XDigitSending', 0), ('pcmType', 'XEncode', 0), ('fdlChannel', 'XFDLChannel', 0), ('yellowAlarm', 'XYellowAlarm', 0), ('zeroSupression', 'XZeroSuppression', 0), ('smdiBasePort', 'XInteger', 0), ('handleDtmfPrecedenceSignals', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RCiscoCatalyst6000T1VoIPGatewayT1.ports': ((('port', 'RT1Port', 2),), frozenset(), None, False),
+    'RCmcInfo': ((('code', 'String16', 0), ('description', 'String50', 0)), frozenset({'uuid'}), None, False),
+    'RCommonDeviceConfig': ((('name', 'UniqueString50', 0), ('softkeyTemplateName', 'XFkType', 0), ('userLocale', 'XUserLocale', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('useTrustedRelayPoint', 'boolean', 0), ('preemption', 'XPreemption', 0), ('ipAddressingMode', 'XIPAddressingMode', 0), ('ipAddressingModePreferenceControl', 'XIPAddressingModePrefControl', 0), ('allowAutoConfigurationForPhones', 'XStatus', 0), ('useImeForOutboundCalls', 'XStatus', 0), ('confidentialAccess', 'RCommonDeviceConfig.confidentialAccess', 0), ('allowDuplicateAddressDetection', 'XStatus', 0), ('acceptRedirectMessages', 'XStatus', 0), ('replyMulticastEchoRequest', 'XStatus', 0)), frozenset({'uuid'}), None, False),
+    'RCommonDeviceConfig.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RCommonPhoneConfig': ((('name', 'UniqueString50', 0), ('description', 'String128', 0), ('unlockPwd', 'String50', 0), ('dndOption', 'XDNDOption', 0), ('dndAlertingType', 'XRingSetting', 0), ('backgroundImage', 'boolean', 0), ('phonePersonalization', 'XPhonePersonalization', 0), ('phoneServiceDisplay', 'XPhoneServiceDisplay', 0), ('sshUserId', 'String50', 0), ('sshPwd', 'String255', 0), ('vendorConfig', 'XVendorConfig', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('vpnGroupName', 'XFkType', 0), ('vpnProfileName', 'XFkType', 0), ('featureControlPolicy', 'XFkType', 0), ('wifiHotspotProfile', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RCommunityString': ((('communityName', 'xsd:string', 1), ('accessPrivilege', 'xsd:string', 1), ('ArrayOfHosts', 'RArrayOfHosts', 1)), frozenset(), None, False),
+    'RConferenceBridge': ((('name', 'UniqueName128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('subUnit', 'XInteger', 0), ('loadInformation', 'XLoadInformation', 0), ('vendorConfig', 'XVendorConfig', 0), ('maximumCapacity', 'XInteger', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('securityProfileName', 'XFkType', 0), ('destinationAddress', 'xsd:string', 0), ('mcuConferenceBridgeSipPort', 'XInteger', 0), ('sipProfile', 'XFkType', 0), ('srtpAllowed', 'boolean', 0), ('normalizationScript', 'XFkType', 0), ('enableTrace', 'boolean', 0), ('normalizationScriptInfos', 'RConferenceBridge.normalizationScriptInfos', 0), ('userName', 'xsd:string', 0), ('password', 'xsd:string', 0), ('httpPort', 'XInteger', 0), ('useHttps', 'boolean', 0), ('addresses', 'RConferenceBridge.addresses', 0), ('conferenceBridgePrefix', 'xsd:string', 0), ('allowCFBControlOfCallSecurityIcon', 'boolean', 0), ('overrideSIPTrunkAddress', 'boolean', 0), ('sipTrunkName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RConferenceBridge.addresses': ((('address', 'xsd:string', 2),), frozenset(), None, False),
+    'RConferenceBridge.normalizationScriptInfos': ((('normalizationScriptInfo', 'RNormalizationScriptInfo', 2),), frozenset(), None, False),
+    'RConferenceNow': ((('conferenceNowNumber', 'xsd:string', 0), ('routePartitionName', 'XFkType', 0), ('description', 'xsd:string', 0), ('maxWaitTimeForHost', 'XInteger', 0), ('MohAudioSourceId', 'XMOHAudioSourceId', 0)), frozenset({'uuid'}), None, False),
+    'RCredentialPolicy': ((('name', 'String255', 0), ('failedLogon', 'XInteger', 0), ('resetFailedLogonAttempts', 'XInteger', 0), ('lockoutDuration', 'XInteger', 0), ('credChangeDuration', 'XInteger', 0), ('credExpiresAfter', 'XInteger', 0), ('minCredLength', 'XInteger', 0), ('prevCredStoredNum', 'XInteger', 0), ('inactiveDaysAllowed', 'XInteger', 0), ('expiryWarningDays', 'XInteger', 0), ('trivialCredCheck', 'boolean', 0), ('minCharsToChange', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RCredentialPolicyDefault': ((('credentialUser', 'XCredentialUser', 0), ('credentialType', 'XCredential', 0), ('credPolicyName', 'XFkType', 0), ('credentials', 'xsd:string', 0), ('confirmCredentials', 'xsd:string', 0), ('credUserCantChange', 'boolean', 0), ('credUserMustChange', 'boolean', 0), ('credDoesNotExpire', 'boolean', 0)), frozenset(), None, False),
+    'RCss': ((('description', 'String50', 0), ('clause', 'String1024', 0), ('dialPlanWizardGenId', 'XInteger', 0), ('members', 'RCss.members', 0), ('partitionUsage', 'XPartitionUsage', 0), ('name', 'UniqueString50', 0)), frozenset({'uuid'}), None, False),
+    'RCss.members': ((('member', 'RCallingSearchSpaceMember', 2),), frozenset(), None, False),
+    'RCtiRemoteDeviceLineAssociation': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 0), ('index', 'XInteger', 0)), frozenset(), None, False),
+    'RCtiRoutePoint': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('userLocale', 'XUserLocale', 0), ('lines', 'RCtiRoutePoint.lines', 0)), frozenset({'uuid'}), None, False),
+    'RCtiRoutePoint.lines': ((('line', 'RPhoneLine', 2), ('lineIdentifier', 'RNumplanIdentifier', 2)), frozenset(), None, False),
+    'RCumaServerSecurityProfile': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('securityMode', 'XDeviceSecurityMode', 0), ('transportType', 'XTransport', 0), ('x509SubjectName', 'xsd:string', 0), ('serverIpHostName', 'String255', 0)), frozenset({'uuid'}), None, False),
+    'RCustomUserField': ((('field', 'xsd:string', 0),), frozenset({'uuid'}), None, False),
+    'RCustomer': ((('name', 'xsd:string', 0), ('createTime', 'XInteger', 0), ('lastAuditTime', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RDateTimeGroup': ((('name', 'xsd:string', 0), ('timeZone', 'XTimeZone', 0), ('separator', 'xsd:string', 0), ('dateformat', 'xsd:string', 0), ('timeFormat', 'xsd:string', 0), ('phoneNtpReferences', 'RDateTimeGroup.phoneNtpReferences', 0)), frozenset({'uuid'}), None, False),
+    'RDateTimeGroup.phoneNtpReferences': ((('selectedPhoneNtpReference', 'RDateTimeGroupNtpReference', 2),), frozenset(), None, False),
+    'RDateTimeGroupNtpReference': ((('phoneNtpName', 'XFkType', 0), ('selectionOrder', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RDdi': ((('name', 'String50', 0), ('clause', 'String1024', 0), ('dialPlanName', 'XFkType', 0), ('digitAnalysisId', 'XInteger', 0), ('members', 'RDdi.members', 0)), frozenset({'uuid'}), None, False),
+    'RDdi.members': ((('member', 'RDigitDiscardInstructionMember', 2),), frozenset(), None, False),
+    'RDefaultDeviceProfile': ((('name', 'UniqueString128', 0), ('description', 'String255', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userLocale', 'XUserLocale', 0), ('phoneButtonTemplate', 'XFkType', 0), ('softkeyTemplate', 'XFkType', 0), ('privacy', 'XStatus', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('ignorePi', 'boolean', 0), ('dndStatus', 'boolean', 0), ('dndRingSetting', 'XRingSetting', 0), ('dndOption', 'XDNDOption', 0), ('mlppDomainId', 'String128', 0), ('mlppIndication', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('emccCallingSearchSpace', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RDeviceDefaults': ((('Model', 'XModel', 0), ('Protocol', 'XDeviceProtocol', 0), ('LoadInformation', 'XLoadInformation', 0), ('InactiveLoadInformation', 'XLoadInformation', 0), ('DevicePoolName', 'XFkType', 0), ('PhoneButtonTemplate', 'XFkType', 0), ('VersionStamp', 'String128', 0), ('PreferActCodeOverAutoReg', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RDeviceMobility': ((('name', 'xsd:string', 0), ('subNetDetails', 'RDeviceMobility.subNetDetails', 0), ('members', 'RDeviceMobility.members', 0)), frozenset({'uuid'}), None, False),
+    'RDeviceMobility.members': ((('member', 'RDevicePoolDeviceMobility', 2),), frozenset(), None, False),
+    'RDeviceMobility.subNetDetails': ((('ipv4SubNetDetails', 'RDeviceMobility.subNetDetails.ipv4SubNetDetails', 0), ('ipv6SubNetDetails', 'RDeviceMobility.subNetDetails.ipv6SubNetDetails', 0)), frozenset(), None, False),
+    'RDeviceMobility.subNetDetails.ipv4SubNetDetails': ((('ipv4Subnet', 'xsd:string', 0), ('ipv4SubNetMaskSz', 'XInteger', 0)), frozenset(), None, False),
+    'RDeviceMobility.subNetDetails.ipv6SubNetDetails': ((('ipv6Subnet', 'xsd:string', 0), ('ipv6SubNetMaskSz', 'XInteger', 0)), frozenset(), None, False),
+    'RDeviceMobilityGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RDevicePool': ((('name', 'UniqueString50', 0), ('autoSearchSpaceName', 'XFkType', 0), ('dateTimeSettingName', 'XFkType', 0), ('callManagerGroupName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('regionName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('srstName', 'XFkType', 0), ('connectionMonitorDuration', 'XInteger', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('mobilityCssName', 'XFkType', 0), ('physicalLocationName', 'XFkType', 0), ('deviceMobilityGroupName', 'XFkType', 0), ('revertPriority', 'XRevertPriority', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('localRouteGroupName', 'XFkType', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('callingPartyNationalPrefix', 'String16', 0), ('callingPartyInternationalPrefix', 'String16', 0), ('callingPartyUnknownPrefix', 'String16', 0), ('callingPartySubscriberPrefix', 'String16', 0), ('adjunctCallingSearchSpace', 'XFkType', 0), ('callingPartyNationalStripDigits', 'XInteger', 0), ('callingPartyInternationalStripDigits', 'XInteger', 0), ('callingPartyUnknownStripDigits', 'XInteger', 0), ('callingPartySubscriberStripDigits', 'XInteger', 0), ('callingPartyNationalTransformationCssName', 'XFkType', 0), ('callingPartyInternationalTransformationCssName', 'XFkType', 0), ('callingPartyUnknownTransformationCssName', 'XFkType', 0), ('callingPartySubscriberTransformationCssName', 'XFkType', 0), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 0), ('calledPartyInternationalStripDigits', 'XInteger', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartySubscriberStripDigits', 'XInteger', 0), ('calledPartyNationalTransformationCssName', 'XFkType', 0), ('calledPartyInternationalTransformationCssName', 'XFkType', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('calledPartySubscriberTransformationCssName', 'XFkType', 0), ('imeEnrolledPatternGroupName', 'XFkType', 0), ('cntdPnTransformationCssName', 'XFkType', 0), ('localRouteGroup', 'RDevicePool.localRouteGroup', 2), ('redirectingPartyTransformationCSS', 'XFkType', 0), ('callingPartyTransformationCSS', 'XFkType', 0), ('wirelessLanProfileGroup', 'XFkType', 0), ('elinGroup', 'XFkType', 0), ('mraServiceDomain', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RDevicePool.localRouteGroup': ((('name', 'xsd:string', 0), ('value', 'xsd:string', 0)), frozenset(), None, False),
+    'RDevicePoolDeviceMobility': ((('devicePoolName', 'XFkType', 0),), frozenset({'uuid'}), None, False),
+    'RDeviceProfile': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('type', 'xsd:string', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('vendorConfig', 'XVendorConfig', 0), ('versionStamp', 'String128', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('lines', 'RDeviceProfile.lines', 0), ('numberOfButtons', 'XInteger', 0), ('phoneTemplateName', 'XFkType', 0), ('speeddials', 'RDeviceProfile.speeddials', 0), ('busyLampFields', 'RDeviceProfile.busyLampFields', 0), ('blfDirectedCallParks', 'RDeviceProfile.blfDirectedCallParks', 0), ('addOnModules', 'RDeviceProfile.addOnModules', 0), ('userLocale', 'XUserLocale', 0), ('defaultProfileName', 'String50', 0), ('currentProfileName', 'XFkType', 0), ('loginTime', 'XInteger', 0), ('loginDuration', 'XInteger', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('loginUserId', 'XFkType', 0), ('ignorePresentationIndicators', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndRingSetting', 'XRingSetting', 0), ('dndStatus', 'boolean', 0), ('emccCallingSearchSpace', 'XFkType', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('softkeyTemplateName', 'XFkType', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('currentConfig', 'RDeviceProfile.currentConfig', 0), ('services', 'RDeviceProfile.services', 0), ('featureControlPolicy', 'XFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RDeviceProfile.addOnModules': ((('addOnModule', 'RAddOnModule', 2),), frozenset(), None, False),
+    'RDeviceProfile.blfDirectedCallParks': ((('blfDirectedCallPark', 'RBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'RDeviceProfile.busyLampFields': ((('busyLampField', 'RBusyLampField', 2),), frozenset(), None, False),
+    'RDeviceProfile.currentConfig': ((('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('phoneTemplateName', 'XFkType', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('softkeyTemplateName', 'XFkType', 0), ('ignorePresentationIndicators', 'boolean', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('dndStatus', 'boolean', 0), ('dndRingSetting', 'XRingSetting', 0), ('dndOption', 'XDNDOption', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('emccCallingSearchSpaceName', 'XFkType', 0), ('deviceName', 'String255', 0), ('model', 'XModel', 0), ('product', 'XProduct', 0), ('deviceProtocol', 'XDeviceProtocol', 0), ('class', 'XClass', 0), ('addressMode', 'XIPAddressingMode', 0), ('allowAutoConfig', 'XStatus', 0), ('remoteSrstOption', 'String50', 0), ('remoteSrstIp', 'String15', 0), ('remoteSrstPort', 'XInteger', 0), ('remoteSipSrstIp', 'String15', 0), ('remoteSipSrstPort', 'XInteger', 0), ('geolocationInfo', 'String2048', 0), ('remoteLocationName', 'String50', 0)), frozenset(), None, False),
+    'RDeviceProfile.lines': ((('line', 'RPhoneLine', 2), ('lineIdentifier', 'RNumplanIdentifier', 2)), frozenset(), None, False),
+    'RDeviceProfile.services': ((('service', 'RSubscribedService', 2),), frozenset(), None, False),
+    'RDeviceProfile.speeddials': ((('speeddial', 'RSpeeddial', 2),), frozenset(), None, False),
+    'RDhcpServer': ((('processNodeName', 'XFkType', 0), ('primaryDnsIpAddress', 'xsd:string', 0), ('secondaryDnsIpAddress', 'xsd:string', 0), ('primaryTftpServerIpAddress', 'xsd:string', 0), ('secondaryTftpServerIpAddress', 'xsd:string', 0), ('bootstrapServerIpAddress', 'xsd:string', 0), ('domainName', 'xsd:string', 0), ('tftpServerName', 'xsd:string', 0), ('arpCacheTimeout', 'XInteger', 0), ('ipAddressLeaseTime', 'XInteger', 0), ('renewalTime', 'XInteger', 0), ('rebindingTime', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RDhcpSubnet': ((('dhcpServerName', 'XFkType', 0), ('subnetIpAddress', 'xsd:string', 0), ('primaryStartIpAddress', 'xsd:string', 0), ('primaryEndIpAddress', 'xsd:string', 0), ('secondaryStartIpAddress', 'xsd:string', 0), ('secondaryEndIpAddress', 'xsd:string', 0), ('primaryRouterIpAddress', 'xsd:string', 0), ('secondaryRouterIpAddress', 'xsd:string', 0), ('subnetMask', 'xsd:string', 0), ('domainName', 'xsd:string', 0), ('primaryDnsIpAddress', 'xsd:string', 0), ('secondaryDnsIpAddress', 'xsd:string', 0), ('tftpServerName', 'xsd:string', 0), ('primaryTftpServerIpAddress', 'xsd:string', 0), ('secondaryTftpServerIpAddress', 'xsd:string', 0), ('bootstrapServerIpAddress', 'xsd:string', 0), ('arpCacheTimeout', 'XInteger', 0), ('ipAddressLeaseTime', 'XInteger', 0), ('renewalTime', 'XInteger', 0), ('rebindingTime', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RDialPlan': ((('name', 'String50', 0), ('description', 'String50', 0)), frozenset({'uuid'}), None, False),
+    'RDialPlanTag': ((('name', 'String50', 0), ('dialPlanName', 'XFkType', 0), ('operator', 'XOperator', 0), ('suppressFromRouteFilter', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RDigitDiscardInstructionMember': ((('dialPlanTagName', 'XFkType', 0),), frozenset({'uuid'}), None, False),
+    'RDirNumberAliasLookupandSync': ((('ldapConfigName', 'String50', 0), ('ldapManagerDisgName', 'String128', 0), ('ldapPassword', 'String128', 0), ('ldapUserSearch', 'String255', 0), ('ldapDirectoryServerUsage', 'XLDAPDirectoryFunction', 0), ('keepAliveSearch', 'xsd:string', 0), ('keepAliveTime', 'XKeepAliveTimeInterval', 0), ('sipAliasSuffix', 'xsd:string', 0), ('enableCachingofRecords', 'boolean', 0), ('servers', 'RDirNumberAliasLookupandSync.servers', 0), ('cacheSizeforAliasLookup', 'XInteger', 0), ('cacheAgeforAliasLookup', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RDirNumberAliasLookupandSync.servers': ((('server', 'RDirNumberAliasLookupandSync.servers.server', 2),), frozenset(), None, False),
+    'RDirNumberAliasLookupandSync.servers.server': ((('hostName', 'xsd:string', 0), ('ldapPort', 'XInteger', 0), ('sslEnabled', 'boolean', 0)), frozenset(), None, False),
+    'RDirectedCallPark': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('retrievalPrefix', 'xsd:string', 0), ('reversionPattern', 'xsd:string', 0), ('revertCssName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RDirectoryLookupDialRules': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('numberBeginWith', 'xsd:string', 0), ('numberOfDigits', 'XInteger', 0), ('digitsToBeRemoved', 'XInteger', 0), ('prefixPattern', 'xsd:string', 0), ('priority', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RDirectoryUri': ((('isPrimary', 'boolean', 0), ('uri', 'String128', 0), ('partition', 'XFkType', 0), ('advertiseGloballyViaIls', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RDirn': ((('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RE164AltNum': ((('numberMask', 'xsd:string', 0), ('addToLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 0), ('isUrgent', 'boolean', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RELINNumber': ((('pattern', 'String16', 0), ('partition', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RElinGroup': ((('name', 'UniqueString50', 0), ('description', 'String255', 0), ('elinNumbers', 'RElinGroup.elinNumbers', 0)), frozenset({'uuid'}), None, False),
+    'RElinGroup.elinNumbers': ((('elinNumber', 'RELINNumber', 2),), frozenset(), None, False),
+    'REmccFeatureConfig': ((('parameterName', 'String50', 0), ('value', 'String255', 0)), frozenset({'uuid'}), None, False),
+    'REndUserCapfProfile': ((('endUserId', 'XFkType', 0), ('instanceId', 'xsd:string', 0), ('certificationOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('operationCompletion', 'xsd:string', 0), ('certificationOperationStatus', 'XCertificateStatus', 0)), frozenset({'uuid'}), None, False),
+    'REnduserMember': ((('userId', 'xsd:string', 0),), frozenset(), None, False),
+    'REnterpriseAltNum': ((('numberMask', 'xsd:string', 0), ('addToLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 0), ('isUrgent', 'boolean', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'REnterpriseFeatureAccessConfiguration': ((('pattern', 'String16', 0), ('routePartitionName', 'XFkType', 0), ('description', 'xsd:string', 0), ('isDefaultEafNumber', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RExpresswayCConfiguration': ((('HostNameOrIP', 'String255', 0), ('description', 'String50', 0), ('X509SubjectNameorSubjectAlternateName', 'String4096', 0)), frozenset({'uuid'}), None, False),
+    'RExtension': ((('sortOrder', 'XInteger', 0), ('pattern', 'XFkType', 0), ('routePartition', 'xsd:string', 0), ('linePrimaryUri', 'xsd:string', 0), ('partition', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RExternalCallControlProfile': ((('name', 'String50', 0), ('primaryUri', 'String255', 0), ('secondaryUri', 'String255', 0), ('enableLoadBalancing', 'boolean', 0), ('routingRequestTimer', 'XInteger', 0), ('diversionReroutingCssName', 'XFkType', 0), ('callTreatmentOnFailure', 'XCallTreatmentOnFailure', 0)), frozenset({'uuid'}), None, False),
+    'RFacInfo': ((('name', 'String50', 0), ('code', 'String16', 0), ('authorizationLevel', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RFallbackProfile': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('advertisedFallbackDirectoryE164Number', 'xsd:string', 0), ('qosSensistivityLevel', 'XInteger', 0), ('callCss', 'XFallBackCSSSelection', 0), ('callAnswerTimer', 'XInteger', 0), ('directoryNumberPartition', 'XFkType', 0), ('directoryNumber', 'String16', 0), ('numberOfDigitsForCallerIDPartialMatch', 'XInteger', 0), ('numberOfCorrelationDtmfDigits', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RFeatureControlConfig': ((('featureName', 'String50', 0), ('defaultValue', 'boolean', 0), ('overrideDefault', 'boolean', 0), ('enableSetting', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RFeatureControlPolicy': ((('name', 'String50', 0), ('description', 'String100', 0), ('features', 'RFeatureControlPolicy.features', 0)), frozenset({'uuid'}), None, False),
+    'RFeatureControlPolicy.features': ((('feature', 'RFeatureControlConfig', 2),), frozenset(), None, False),
+    'RFeatureGroupTemplate': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('homeCluster', 'boolean', 0), ('imAndUcPresenceEnable', 'boolean', 0), ('serviceProfile', 'XFkType', 0), ('enableUserToHostConferenceNow', 'boolean', 0), ('allowCTIControl', 'boolean', 0), ('enableEMCC', 'boolean', 0), ('enableMobility', 'boolean', 0), ('enableMobileVoiceAccess', 'boolean', 0), ('maxDeskPickupWait', 'XInteger', 0), ('remoteDestinationLimit', 'XInteger', 0), ('BLFPresenceGp', 'XFkType', 0), ('subscribeCallingSearch', 'XFkType', 0), ('userLocale', 'XUserLocale', 0), ('userProfile', 'XFkType', 0), ('meetingInformation', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RFixedMohAudioSource': ((('sourceId', 'XInteger', 0), ('name', 'xsd:string', 0), ('multicast', 'boolean', 0), ('enable', 'xsd:string', 0), ('initialAnnouncement', 'XFkType', 0), ('periodicAnnouncement', 'XFkType', 0), ('periodicAnnouncementInterval', 'XInteger', 0), ('localeAnnouncement', 'XUserLocale', 0), ('initialAnnouncementPlayed', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RGatekeeper': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('rrqTimeToLive', 'XInteger', 0), ('retryTimeout', 'XInteger', 0), ('enableDevice', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RGateway': ((('domainName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('product', 'XProduct', 0), ('protocol', 'XDeviceProtocol', 0), ('callManagerGroupName', 'XFkType', 0), ('units', 'RGateway.units', 0), ('scratch', 'xsd:string', 0), ('vendorConfig', 'XVendorConfig', 0), ('versionStamp', 'xsd:string', 0), ('loadInformation', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RGateway.units': ((('unit', 'RGateway.units.unit', 2),), frozenset(), None, False),
+    'RGateway.units.unit': ((('index', 'XInteger', 0), ('product', 'XMGCPSlotModule', 0), ('subunits', 'RGateway.units.unit.subunits', 0)), frozenset(), None, False),
+    'RGateway.units.unit.subunits': ((('subunit', 'RGateway.units.unit.subunits.subunit', 2),), frozenset(), None, False),
+    'RGateway.units.unit.subunits.subunit': ((('index', 'XInteger', 0), ('product', 'XMGCPVic', 0), ('beginPort', 'XInteger', 0)), frozenset(), None, False),
+    'RGatewayEndpointAnalog': ((('index', 'XInteger', 0), ('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('port', 'RAnalogPort', 0), ('trunkSelectionOrder', 'XTrunkSelectionOrder', 0), ('transmitUtf8', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('callingPartyNumberPrefix', 'String16', 0), ('callingPartyStripDigits', 'XInteger', 0), ('callingPartyUnknownTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssUnknown', 'boolean', 0), ('hotlineDevice', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('imeE164DirectoryNumber', 'String16', 0), ('confidentialAccess', 'RGatewayEndpointAnalog.confidentialAccess', 0), ('elinGroup', 'XFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RGatewayEndpointAnalog.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RGatewayEndpointAnalogAccess': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 0), ('subunit', 'XInteger', 0), ('endpoint', 'RGatewayEndpointAnalog', 0)), frozenset({'uuid'}), None, False),
+    'RGatewayEndpointDigitalAccessBri': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 0), ('subunit', 'XInteger', 0), ('endpoint', 'RGatewayEndpointDigitalBri', 0)), frozenset({'uuid'}), None, False),
+    'RGatewayEndpointDigitalAccessPri': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 0), ('subunit', 'XInteger', 0), ('endpoint', 'RGatewayEndpointDigitalPri', 0)), frozenset({'uuid'}), None, False),
+    'RGatewayEndpointDigitalAccessT1': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 0), ('subunit', 'XInteger', 0), ('endpoint', 'RGatewayEndpointDigitalT1', 0)), frozenset({'uuid'}), None, False),
+    'RGatewayEndpointDigitalBri': ((('index', 'XInteger', 0), ('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('vendorConfig', 'XVendorConfig', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('redirectInboundNumberIe', 'boolean', 0), ('briProtocol', 'XBriProtocol', 0), ('calledPlan', 'XNumberingPlan', 0), ('calledPri', 'XPriOfNumber', 0), ('callerIdDn', 'String255', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingPlan', 'XNumberingPlan', 0), ('callingPri', 'XPriOfNumber', 0), ('clockReference', 'XClockReference', 0), ('csuParam', 'XCSUParam', 0), ('dChannelEnable', 'boolean', 0), ('channelSelectionOrder', 'XTrunkSelectionOrder', 0), ('pcmType', 'XEncode', 0), ('firstDelay', 'XInteger', 0), ('intraDelay', 'XInteger', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('numDigitsToStrip', 'XInteger', 0), ('prefix', 'xsd:string', 0), ('presentationBit', 'XPresentationBit', 0), ('sendRestart', 'boolean', 0), ('setupNonIsdnPi', 'boolean', 0), ('sigDigits', 'RGatewayEndpointDigitalBri.sigDigits', 0), ('statusPoll', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('nationalStripDigits', 'XInteger', 0), ('internationalStripDigits', 'XInteger', 0), ('unknownStripDigits', 'XInteger', 0), ('subscriberStripDigits', 'XInteger', 0), ('nationalTransformationCssName', 'XFkType', 0), ('internationalTransformationCssName', 'XFkType', 0), ('unknownTransformationCssName', 'XFkType', 0), ('subscriberTransformationCssName', 'XFkType', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('GClearEnable', 'boolean', 0), ('enableDatalinkOnFirstCall', 'boolean', 0), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 0), ('calledPartyInternationalStripDigits', 'XInteger', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartySubscriberStripDigits', 'XInteger', 0), ('calledPartyNationalTransformationCssName', 'XFkType', 0), ('calledPartyInternationalTransformationCssName', 'XFkType', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('calledPartySubscriberTransformationCssName', 'XFkType', 0), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RGatewayEndpointDigitalBri.sigDigits': ((), frozenset({'enable'}), 'xsd:nonNegativeInteger', False),
+    'RGatewayEndpointDigitalPri': ((('index', 'XInteger', 0), ('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('mlppPreemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('redirectInboundNumberIe', 'boolean', 0), ('calledPlan', 'XNumberingPlan', 0), ('calledPri', 'XPriOfNumber', 0), ('callerIdDn', 'String255', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingPlan', 'XNumberingPlan', 0), ('callingPri', 'XPriOfNumber', 0), ('chanIE', 'XPRIChanIE', 0), ('clockReference', 'XClockReference', 0), ('dChannelEnable', 'boolean', 0), ('channelSelectionOrder', 'XTrunkSelectionOrder', 0), ('displayIe', 'boolean', 0), ('pcmType', 'XEncode', 0), ('csuParam', 'XCSUParam', 0), ('firstDelay', 'XInteger', 0), ('interfaceIdPresent', 'boolean', 0), ('interfaceId', 'XInteger', 0), ('intraDelay', 'XInteger', 0), ('mcdnEnable', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('numDigitsToStrip', 'XInteger', 0), ('passingPrecedenceLevelThrough', 'boolean', 0), ('prefix', 'xsd:string', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('connectedLineIdPresentation', 'XPresentationBit', 0), ('priProtocol', 'XPriProtocol', 0), ('securityAccessLevel', 'XInteger', 0), ('sendCallingNameInFacilityIe', 'boolean', 0), ('sendExLeadingCharInDispIe', 'boolean', 0), ('sendRestart', 'boolean', 0), ('setupNonIsdnPi', 'boolean', 0), ('sigDigits', 'RGatewayEndpointDigitalPri.sigDigits', 0), ('span', 'XInteger', 0), ('statusPoll', 'boolean', 0), ('smdiBasePort', 'XInteger', 0), ('GClearEnable', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('transmitUtf8', 'boolean', 0), ('v150', 'boolean', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('unattendedPort', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('geoLocationFilterName', 'XFkType', 0), ('routeClassSignalling', 'XStatus', 0), ('nationalStripDigits', 'XInteger', 0), ('internationalStripDigits', 'XInteger', 0), ('unknownStripDigits', 'XInteger', 0), ('subscriberStripDigits', 'XInteger', 0), ('nationalTransformationCssName', 'XFkType', 0), ('internationalTransformationCssName', 'XFkType', 0), ('unknownTransformationCssName', 'XFkType', 0), ('subscriberTransformationCssName', 'XFkType', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 0), ('calledPartyInternationalStripDigits', 'XInteger', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartySubscriberStripDigits', 'XInteger', 0), ('calledPartyNationalTransformationCssName', 'XFkType', 0), ('calledPartyInternationalTransformationCssName', 'XFkType', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('calledPartySubscriberTransformationCssName', 'XFkType', 0), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('useDevicePoolCntdPartyTransformationCss', 'boolean', 0), ('cntdPartyTransformationCssName', 'XFkType', 0), ('confidentialAccess', 'RGatewayEndpointDigitalPri.confidentialAccess', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RGatewayEndpointDigitalPri.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RGatewayEndpointDigitalPri.sigDigits': ((), frozenset({'enable'}), 'xsd:nonNegativeInteger', False),
+    'RGatewayEndpointDigitalT1': ((('index', 'XInteger', 0), ('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('vendorConfig', 'XVendorConfig', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('sendGeoLocation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('v150', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 0), ('ports', 'RGatewayEndpointDigitalT1.ports', 0), ('trunkSelectionOrder', 'XTrunkSelectionOrder', 0), ('clockReference', 'XClockReference', 0), ('csuParam', 'XCSUParam', 0), ('digitSending', 'XDigitSending', 0), ('pcmType', 'XEncode', 0), ('fdlChannel', 'XFDLChannel', 0), ('yellowAlarm', 'XYellowAlarm', 0), ('zeroSupression', 'XZeroSuppression', 0), ('smdiBasePort', 'XInteger', 0), ('handleDtmfPrecedenceSignals', 'boolean', 0), ('encodeOutboundVoiceRouteClass', 'boolean', 0), ('routeClassSignalling', 'XStatus', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('confidentialAccess', 'RGatewayEndpointDigitalT1.confidentialAccess', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RGatewayEndpointDigitalT1.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RGatewayEndpointDigitalT1.ports': ((('port', 'RT1Port', 2),), frozenset(), None, False),
+    'RGatewaySccp': ((('index', 'XInteger', 0), ('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocale', 'XCountry', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('transmitUtf8', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('callingPartyNumberPrefix', 'String16', 0), ('callingPartyStripDigits', 'XInteger', 0), ('callingPartyUnknownTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssUnknown', 'boolean', 0), ('hotlineDevice', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('phoneTemplateName', 'XFkType', 0), ('securityProfileName', 'XFkType', 0), ('userLocale', 'XUserLocale', 0), ('deviceMobilityMode', 'XStatus', 0), ('ownerUserId', 'XFkType', 0), ('commonPhoneConfigName', 'XFkType', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVM', 'XStatus', 0), ('allowCtiControlFlag', 'boolean', 0), ('remoteDevice', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('unattendedPort', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('hlogStatus', 'boolean', 0), ('ignorePresentationIndicators', 'XPresentationBit', 0), ('lines', 'RGatewaySccp.lines', 0), ('confidentialAccess', 'RGatewaySccp.confidentialAccess', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RGatewaySccp.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RGatewaySccp.lines': ((('line', 'RPhoneLine', 0), ('lineIdentifier', 'RNumplanIdentifier', 0)), frozenset(), None, False),
+    'RGatewaySccpEndpoints': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 0), ('subunit', 'XInteger', 0), ('endpoint', 'RGatewaySccp', 0)), frozenset({'uuid'}), None, False),
+    'RGeoLocation': ((('name', 'String50', 0), ('country', 'xsd:string', 0), ('description', 'String255', 0), ('nationalSubDivision', 'String100', 0), ('district', 'String255', 0), ('communityName', 'String255', 0), ('cityDivision', 'String255', 0), ('neighbourhood', 'String255', 0), ('street', 'String255', 0), ('leadingStreetDirection', 'String50', 0), ('trailingStreetSuffix', 'String50', 0), ('streetSuffix', 'String255', 0), ('houseNumber', 'String16', 0), ('houseNumberSuffix', 'String100', 0), ('landmark', 'String255', 0), ('location', 'String255', 0), ('floor', 'String16', 0), ('occupantName', 'String255', 0), ('postalCode', 'String100', 0)), frozenset({'uuid'}), None, False),
+    'RGeoLocationFilter': ((('name', 'String50', 0), ('description', 'String255', 0), ('useCountry', 'boolean', 0), ('useNationalSubDivision', 'boolean', 0), ('useDistrict', 'boolean', 0), ('useCommunityName', 'boolean', 0), ('useCityDivision', 'boolean', 0), ('useNeighbourhood', 'boolean', 0), ('useStreet', 'boolean', 0), ('useLeadingStreetDirection', 'boolean', 0), ('useTrailingStreetSuffix', 'boolean', 0), ('useStreetSuffix', 'boolean', 0), ('useHouseNumber', 'boolean', 0), ('useHouseNumberSuffix', 'boolean', 0), ('useLandmark', 'boolean', 0), ('useLocation', 'boolean', 0), ('useFloor', 'boolean', 0), ('useOccupantName', 'boolean', 0), ('usePostalCode', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RGeoLocationPolicy': ((('name', 'String50', 0), ('country', 'xsd:string', 0), ('description', 'String255', 0), ('nationalSubDivision', 'String100', 0), ('district', 'String255', 0), ('communityName', 'String255', 0), ('cityDivision', 'String255', 0), ('neighbourhood', 'String255', 0), ('street', 'String255', 0), ('leadingStreetDirection', 'String50', 0), ('trailingStreetSuffix', 'String50', 0), ('streetSuffix', 'String255', 0), ('houseNumber', 'String16', 0), ('houseNumberSuffix', 'String100', 0), ('landmark', 'String255', 0), ('location', 'String255', 0), ('floor', 'String16', 0), ('occupantName', 'String255', 0), ('postalCode', 'String100', 0), ('relatedPolicies', 'RGeoLocationPolicy.relatedPolicies', 0)), frozenset({'uuid'}), None, False),
+    'RGeoLocationPolicy.relatedPolicies': ((('relatedPolicy', 'RPolicyRelationship', 2),), frozenset(), None, False),
+    'RH323Gateway': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('vendorConfig', 'XVendorConfig', 0), ('pathReplacementSupport', 'boolean', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('srtpAllowed', 'boolean', 0), ('waitForFarEndH245TerminalSet', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('callerIdDn', 'String50', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('enableInboundFaststart', 'boolean', 0), ('enableOutboundFaststart', 'boolean', 0), ('codecForOutboundFaststart', 'XMediaPayload', 0), ('transmitUtf8', 'boolean', 0), ('signalingPort', 'XInteger', 0), ('allowH235PassThrough', 'boolean', 0), ('sigDigits', 'RH323Gateway.sigDigits', 0), ('prefixDn', 'String50', 0), ('calledPartyIeNumberType', 'XPriOfNumber', 0), ('callingPartyIeNumberType', 'XPriOfNumber', 0), ('calledNumberingPlan', 'XNumberingPlan', 0), ('callingNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNationalPrefix', 'String16', 0), ('callingPartyInternationalPrefix', 'String16', 0), ('callingPartyUnknownPrefix', 'String16', 0), ('callingPartySubscriberPrefix', 'String16', 0), ('callingPartyNationalStripDigits', 'XInteger', 0), ('callingPartyInternationalStripDigits', 'XInteger', 0), ('callingPartyUnknownStripDigits', 'XInteger', 0), ('callingPartySubscriberStripDigits', 'XInteger', 0), ('callingPartyNationalTransformationCssName', 'XFkType', 0), ('callingPartyInternationalTransformationCssName', 'XFkType', 0), ('callingPartyUnknownTransformationCssName', 'XFkType', 0), ('callingPartySubscriberTransformationCssName', 'XFkType', 0), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 0), ('calledPartyInternationalStripDigits', 'XInteger', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartySubscriberStripDigits', 'XInteger', 0), ('calledPartyNationalTransformationCssName', 'XFkType', 0), ('calledPartyInternationalTransformationCssName', 'XFkType', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('calledPartySubscriberTransformationCssName', 'XFkType', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('displayIeDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('cntdPnTransformationCssName', 'XFkType', 0), ('confidentialAccess', 'RH323Gateway.confidentialAccess', 0), ('redirectingPartyTransformationCSS', 'XFkType', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RH323Gateway.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RH323Gateway.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'RH323Line': ((('index', 'XInteger', 0), ('label', 'String50', 0), ('asciiLabel', 'String50', 0), ('display', 'String50', 0), ('dirn', 'RDirn', 0), ('displayAscii', 'String50', 0), ('e164Mask', 'String255', 0), ('dialPlanWizardId', 'XInteger', 0), ('maxNumCalls', 'XInteger', 0), ('busyTrigger', 'XInteger', 0), ('callInfoDisplay', 'RH323Line.callInfoDisplay', 0), ('recordingProfileName', 'XFkType', 0), ('monitoringCssName', 'XFkType', 0), ('recordingFlag', 'XRecordingFlag', 0), ('audibleMwi', 'XStatus', 0), ('speedDial', 'xsd:string', 0), ('partitionUsage', 'XPartitionUsage', 0), ('associatedEndusers', 'RH323Line.associatedEndusers', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RH323Line.associatedEndusers': ((('enduser', 'REnduserMember', 2),), frozenset(), None, False),
+    'RH323Line.callInfoDisplay': ((('callerName', 'boolean', 0), ('callerNumber', 'boolean', 0), ('redirectedNumber', 'boolean', 0), ('dialedNumber', 'boolean', 0)), frozenset(), None, False),
+    'RH323Phone': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('commonPhoneConfigName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('remoteDevice', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('srtpAllowed', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('waitForFarEndH245TerminalSet', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('mtpPreferredCodec', 'XSIPCodec', 0), ('callerIdDn', 'String50', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('displayIEDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('hlogStatus', 'boolean', 0), ('ownerUserName', 'XFkType', 0), ('signalingPort', 'XInteger', 0), ('gateKeeperInfo', 'RH323Phone.gateKeeperInfo', 0), ('lines', 'RH323Phone.lines', 0), ('ignorePresentationIndicators', 'boolean', 0), ('elinGroup', 'XFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RH323Phone.gateKeeperInfo': ((('gateKeeperName', 'XFkType', 0), ('e164', 'String50', 0), ('technologyPrefix', 'String50', 0), ('zone', 'String50', 0)), frozenset(), None, False),
+    'RH323Phone.lines': ((('line', 'RH323Line', 2), ('lineIdentifier', 'RNumplanIdentifier', 2)), frozenset(), None, False),
+    'RH323Trunk': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('rdnTransformationCssName', 'XFkType', 0), ('useDevicePoolRdnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('sendGeoLocation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('srtpAllowed', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('waitForFarEndH245TerminalSet', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('callerIdDn', 'String50', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('displayIEDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('enableInboundFaststart', 'boolean', 0), ('enableOutboundFaststart', 'boolean', 0), ('codecForOutboundFaststart', 'XMediaPayload', 0), ('allowH235PassThrough', 'boolean', 0), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('transmitUtf8', 'boolean', 0), ('signalingPort', 'XInteger', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('sigDigits', 'RH323Trunk.sigDigits', 0), ('prefixDn', 'String50', 0), ('calledPartyIeNumberType', 'XPriOfNumber', 0), ('callingPartyIeNumberType', 'XPriOfNumber', 0), ('calledNumberingPlan', 'XNumberingPlan', 0), ('callingNumberingPlan', 'XNumberingPlan', 0), ('pathReplacementSupport', 'boolean', 0), ('gateKeeperInfo', 'RH323Trunk.gateKeeperInfo', 0), ('ictPassingPrecedenceLevelThroughUuie', 'boolean', 0), ('ictSecurityAccessLevel', 'XInteger', 0), ('isSafEnabled', 'boolean', 0), ('callingPartyNationalStripDigits', 'XInteger', 0), ('callingPartyInternationalStripDigits', 'XInteger', 0), ('callingPartyUnknownStripDigits', 'XInteger', 0), ('callingPartySubscriberStripDigits', 'XInteger', 0), ('callingPartyNationalTransformationCssName', 'XFkType', 0), ('callingPartyInternationalTransformationCssName', 'XFkType', 0), ('callingPartyUnknownTransformationCssName', 'XFkType', 0), ('callingPartySubscriberTransformationCssName', 'XFkType', 0), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('calledPartyNationalStripDigits', 'XInteger', 0), ('calledPartyInternationalStripDigits', 'XInteger', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartySubscriberStripDigits', 'XInteger', 0), ('calledPartyNationalTransformationCssName', 'XFkType', 0), ('calledPartyInternationalTransformationCssName', 'XFkType', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('calledPartySubscriberTransformationCssName', 'XFkType', 0), ('runOnEveryNode', 'boolean', 0), ('destinations', 'RH323Trunk.destinations', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('cntdPnTransformationCssName', 'XFkType', 0), ('confidentialAccess', 'RH323Trunk.confidentialAccess', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RH323Trunk.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RH323Trunk.destinations': ((('destination', 'RH323TrunkDestination', 2),), frozenset(), None, False),
+    'RH323Trunk.gateKeeperInfo': ((('gateKeeper', 'XFkType', 0), ('terminalType', 'XTerminal', 0), ('technologyPrefix', 'String50', 0), ('zone', 'String50', 0)), frozenset(), None, False),
+    'RH323Trunk.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'RH323TrunkDestination': ((('addressIpv4', 'String255', 0), ('sortOrder', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RHandoffConfiguration': ((('pattern', 'String16', 0), ('routePartitionName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RHttpProfile': ((('name', 'xsd:string', 0), ('userName', 'xsd:string', 0), ('password', 'xsd:string', 0), ('requestTimeout', 'XRequestTimeout', 0), ('retryCount', 'XRetryCount', 0), ('webServiceRootUri', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RHuntList': ((('description', 'xsd:string', 0), ('callManagerGroupName', 'XFkType', 0), ('routeListEnabled', 'boolean', 0), ('voiceMailUsage', 'boolean', 0), ('members', 'RHuntList.members', 0), ('name', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RHuntList.members': ((('member', 'RHuntListMember', 2),), frozenset(), None, False),
+    'RHuntListMember': ((('lineGroupName', 'XFkType', 0), ('selectionOrder', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RHuntPilot': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('blockEnable', 'boolean', 0), ('calledPartyTransformationMask', 'xsd:string', 0), ('callingPartyTransformationMask', 'xsd:string', 0), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 0), ('dialPlanName', 'XFkType', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 0), ('routeFilterName', 'XFkType', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('huntListName', 'XFkType', 0), ('parkMonForwardNoRetrieve', 'RHuntPilot.parkMonForwardNoRetrieve', 0), ('alertingName', 'String50', 0), ('asciiAlertingName', 'String32', 0), ('e164Mask', 'xsd:string', 0), ('aarNeighborhoodName', 'XFkType', 0), ('forwardHuntNoAnswer', 'RHuntPilot.forwardHuntNoAnswer', 0), ('forwardHuntBusy', 'RHuntPilot.forwardHuntBusy', 0), ('callPickupGroupName', 'XFkType', 0), ('maxHuntduration', 'XInteger', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('displayConnectedNumber', 'boolean', 0), ('queueCalls', 'RCallsQueue', 0)), frozenset({'uuid'}), None, False),
+    'RHuntPilot.forwardHuntBusy': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'xsd:string', 0), ('callingSearchSpaceName', 'XFkType', 0)), frozenset(), None, False),
+    'RHuntPilot.forwardHuntNoAnswer': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'xsd:string', 0), ('callingSearchSpaceName', 'XFkType', 0)), frozenset(), None, False),
+    'RHuntPilot.parkMonForwardNoRetrieve': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'String50', 0), ('callingSearchSpaceName', 'XFkType', 0)), frozenset(), None, False),
+    'RImeClient': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('domain', 'String255', 0), ('isActivated', 'boolean', 0), ('sipTrunkName', 'XFkType', 0), ('primaryImeServerName', 'XFkType', 0), ('secondaryImeServerName', 'XFkType', 0), ('learnedRouteFilterGroupName', 'XFkType', 0), ('exclusionNumberGroupName', 'XFkType', 0), ('firewallName', 'XFkType', 0), ('members', 'RImeClient.members', 0), ('ccmExternalIpMaps', 'RImeClient.ccmExternalIpMaps', 0)), frozenset({'uuid'}), None, False),
+    'RImeClient.ccmExternalIpMaps': ((('ccmExternalIpMap', 'RCcmExternalIpMap', 2),), frozenset(), None, False),
+    'RImeClient.members': ((('member', 'RImeClientMember', 2),), frozenset(), None, False),
+    'RImeClientMember': ((('enrolledPatternGroupName', 'XFkType', 0),), frozenset({'uuid'}), None, False),
+    'RImeE164Transformation': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('isCgpnPreTransformation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('isCdpnPreTransformation', 'boolean', 0), ('incomingCgpnTransformationProfileName', 'XFkType', 0), ('incomingCdpnTransformationProfileName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RImeEnrolledPattern': ((('pattern', 'String16', 0), ('description', 'xsd:string', 0), ('imeEnrolledPatternGroupName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RImeEnrolledPatternGroup': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('fallbackProfileName', 'XFkType', 0), ('isPatternAllAlias', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RImeExclusionNumber': ((('pattern', 'String16', 0), ('description', 'xsd:string', 0), ('imeExclusionNumberGroupName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RImeExclusionNumberGroup': ((('name', 'String50', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RImeFirewall': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('ipAddress', 'String15', 0), ('port', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RImeLearnedRoutes': ((('e164Did', 'String32', 0), ('domain', 'String255', 0), ('signaling', 'String1024', 0), ('learnedOn', 'String32', 0), ('expiresOn', 'String32', 0), ('adminEnabled', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RImeRouteFilterElement': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('elementType', 'XViprFilterElement', 0), ('imeRouteFilterGroupName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RImeRouteFilterGroup': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('groupTrustSetting', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RImeServer': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('ipAddress', 'xsd:string', 0), ('port', 'XInteger', 0), ('deviceSecurityMode', 'XServerSecurityMode', 0), ('applicationUser', 'XFkType', 0), ('reconnectInterval', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RImportedDirectoryUriCatalogs': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('routeString', 'xsd:string', 0), ('lastLoadedFileName', 'xsd:string', 0), ('fileLoadDateTime', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RInfrastructureDevice': ((('name', 'xsd:string', 0), ('ipv4Address', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0), ('bssidWithMask', 'xsd:string', 0), ('wapLocation', 'xsd:string', 0), ('isActive', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RInterClusterServiceProfile': ((('interClusterService', 'XInterClusterService', 0), ('isActivated', 'boolean', 0), ('sipTrunkName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RIpPhoneServices': ((('serviceName', 'UniqueString128', 0), ('asciiServiceName', 'UniqueString128', 0), ('serviceDescription', 'String128', 0), ('serviceUrl', 'xsd:string', 0), ('secureServiceUrl', 'xsd:string', 0), ('serviceCategory', 'XPhoneServiceCategory', 0), ('serviceType', 'XPhoneService', 0), ('serviceVendor', 'xsd:string', 0), ('serviceVersion', 'xsd:string', 0), ('enabled', 'boolean', 0), ('enterpriseSubscription', 'boolean', 0), ('parameters', 'RIpPhoneServices.parameters', 0)), frozenset({'uuid'}), None, False),
+    'RIpPhoneServices.parameters': ((('parameter', 'RIpPhoneServicesParameter', 2),), frozenset(), None, False),
+    'RIpPhoneServicesParameter': ((('name', 'UniqueString50', 0), ('displayName', 'String128', 0), ('default', 'String255', 0), ('description', 'String255', 0), ('paramRequired', 'boolean', 0), ('paramPassword', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RIvrUserLocale': ((('userLocale', 'XUserLocale', 0), ('orderIndex', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RJabberClientConfigurationProfile': ((('common', 'xsd:string', 0), ('desktop', 'xsd:string', 0), ('mobile', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RLbmGroup': ((('name', 'xsd:string', 0), ('Description', 'xsd:string', 0), ('ProcessnodeActive', 'XFkType', 0), ('ProcessnodeStandby', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RLbmHubGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('member1', 'xsd:string', 0), ('member2', 'xsd:string', 0), ('member3', 'xsd:string', 0), ('members', 'RLbmHubGroup.members', 0)), frozenset({'uuid'}), None, False),
+    'RLbmHubGroup.members': ((('member', 'RProcessNodes', 2),), frozenset(), None, False),
+    'RLdapDirectory': ((('name', 'String50', 0), ('ldapDn', 'String128', 0), ('ldapPassword', 'String128', 0), ('userSearchBase', 'String255', 0), ('repeatable', 'boolean', 0), ('intervalValue', 'XInteger', 0), ('scheduleUnit', 'XScheduleUnit', 0), ('nextExecTime', 'String32', 0), ('servers', 'RLdapDirectory.servers', 0), ('middleName', 'String128', 0), ('phoneNumber', 'String128', 0), ('mailId', 'String128', 0), ('userId', 'String128', 0), ('managerId', 'String128', 0), ('firstName', 'String128', 0), ('lastName', 'String128', 0), ('department', 'String128', 0), ('ldapFilter', 'XFkType', 0), ('synchronize', 'boolean', 0), ('ldapFilterForGroups', 'XFkType', 0), ('directoryUri', 'String128', 0), ('accessControlGroupInfo', 'RLdapDirectory.accessControlGroupInfo', 0), ('featureGroupTemplate', 'XFkType', 0), ('applyMask', 'boolean', 0), ('mask', 'xsd:string', 0), ('applyPoolList', 'boolean', 0), ('addDns', 'RLdapDirectory.addDns', 0)), frozenset({'uuid'}), None, False),
+    'RLdapDirectory.accessControlGroupInfo': ((('accessControlGroupName', 'RLdapDirectory.accessControlGroupInfo.accessControlGroupName', 2),), frozenset(), None, False),
+    'RLdapDirectory.accessControlGroupInfo.accessControlGroupName': ((('accessControlGroup', 'xsd:string', 0),), frozenset(), None, False),
+    'RLdapDirectory.addDns': ((('addDn', 'RLdapDirectory.addDns.addDn', 2),), frozenset(), None, False),
+    'RLdapDirectory.addDns.addDn': ((('startDn', 'xsd:string', 0), ('endDn', 'xsd:string', 0), ('dnPrefix', 'xsd:string', 0)), frozenset(), None, False),
+    'RLdapDirectory.servers': ((('server', 'RLdapDirectory.servers.server', 2),), frozenset(), None, False),
+    'RLdapDirectory.servers.server': ((('hostName', 'String128', 0), ('ldapPortNumber', 'XInteger', 0), ('sslEnabled', 'boolean', 0)), frozenset(), None, False),
+    'RLdapFilter': ((('name', 'String4096', 0), ('filter', 'String255', 0)), frozenset({'uuid'}), None, False),
+    'RLdapSearch': ((('enableDirectorySearch', 'boolean', 0), ('distinguishedName', 'String128', 0), ('password', 'String128', 0), ('userSearchBase1', 'String255', 0), ('userSearchBase2', 'String255', 0), ('userSearchBase3', 'String255', 0), ('ldapFilterForUser', 'XFkType', 0), ('ldapFilterForGroups', 'XFkType', 0), ('enableRecursiveSearch', 'boolean', 0), ('primary', 'XFkType', 0), ('secondary', 'XFkType', 0), ('tertiary', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RLdapSyncCustomField': ((('ldapConfigurationName', 'xsd:string', 0), ('customUserField', 'xsd:string', 0), ('ldapUserField', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RLicensedUser': ((('userId', 'xsd:string', 0), ('firstName', 'xsd:string', 0), ('lastName', 'xsd:string', 0), ('snrEnabled', 'xsd:string', 0), ('emEnabled', 'xsd:string', 0), ('deviceCount', 'xsd:string', 0), ('licenseType', 'xsd:string', 0), ('licenseUsed', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RLine': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('aarDestinationMask', 'String128', 0), ('aarKeepCallHistory', 'boolean', 0), ('aarVoiceMailEnabled', 'boolean', 0), ('callForwardAll', 'RCallForwardAll', 0), ('callForwardBusy', 'RCallForwardBusy', 0), ('callForwardBusyInt', 'RCallForwardBusyInt', 0), ('callForwardNoAnswer', 'RCallForwardNoAnswer', 0), ('callForwardNoAnswerInt', 'RCallForwardNoAnswerInt', 0), ('callForwardNoCoverage', 'RCallForwardNoCoverage', 0), ('callForwardNoCoverageInt', 'RCallForwardNoCoverageInt', 0), ('callForwardOnFailure', 'RCallForwardOnFailure', 0), ('callForwardAlternateParty', 'RCallForwardAlternateParty', 0), ('callForwardNotRegistered', 'RCallForwardNotRegistered', 0), ('callForwardNotRegisteredInt', 'RCallForwardNotRegisteredInt', 0), ('callPickupGroupName', 'XFkType', 0), ('autoAnswer', 'XAutoAnswer', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('callingIdPresentationWhenDiverted', 'XPresentationBit', 0), ('alertingName', 'String50', 0), ('asciiAlertingName', 'String32', 0), ('presenceGroupName', 'XFkType', 0), ('shareLineAppearanceCssName', 'XFkType', 0), ('voiceMailProfileName', 'XFkType', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('hrDuration', 'XInteger', 0), ('hrInterval', 'XInteger', 0), ('cfaCssPolicy', 'XCFACSSActivationPolicy', 0), ('defaultActivatedDeviceName', 'XFkType', 0), ('parkMonForwardNoRetrieveDn', 'String50', 0), ('parkMonForwardNoRetrieveIntDn', 'String50', 0), ('parkMonForwardNoRetrieveVmEnabled', 'boolean', 0), ('parkMonForwardNoRetrieveIntVmEnabled', 'boolean', 0), ('parkMonForwardNoRetrieveCssName', 'XFkType', 0), ('parkMonForwardNoRetrieveIntCssName', 'XFkType', 0), ('parkMonReversionTimer', 'XInteger', 0), ('partyEntranceTone', 'XStatus', 0), ('directoryURIs', 'RLine.directoryURIs', 0), ('allowCtiControlFlag', 'boolean', 0), ('rejectAnonymousCall', 'boolean', 0), ('patternUrgency', 'boolean', 0), ('confidentialAccess', 'RLine.confidentialAccess', 0), ('externalCallControlProfile', 'XFkType', 0), ('enterpriseAltNum', 'RLine.enterpriseAltNum', 0), ('e164AltNum', 'RLine.e164AltNum', 0), ('pstnFailover', 'xsd:string', 0), ('callControlAgentProfile', 'xsd:string', 0), ('associatedDevices', 'RLine.associatedDevices', 0), ('useEnterpriseAltNum', 'boolean', 0), ('useE164AltNum', 'boolean', 0), ('active', 'boolean', 0), ('externalPresentationInfo', 'RLine.externalPresentationInfo', 0)), frozenset({'uuid'}), None, False),
+    'RLine.associatedDevices': ((('device', 'xsd:string', 2),), frozenset(), None, False),
+    'RLine.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RLine.directoryURIs': ((('directoryUri', 'RDirectoryUri', 2),), frozenset(), None, False),
+    'RLine.e164AltNum': ((('numMask', 'xsd:string', 0), ('isUrgent', 'boolean', 0), ('addLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'RLine.enterpriseAltNum': ((('numMask', 'xsd:string', 0), ('isUrgent', 'boolean', 0), ('addLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'RLine.externalPresentationInfo': ((('isAnonymous', 'boolean', 0), ('presentationInfo', 'RLine.externalPresentationInfo.presentationInfo', 0)), frozenset(), None, False),
+    'RLine.externalPresentationInfo.presentationInfo': ((('externalPresentationNumber', 'xsd:string', 0), ('externalPresentationName', 'String50', 0)), frozenset(), None, False),
+    'RLineAppearanceAssociationForPresence': ((('laapAssociate', 'XFkType', 0), ('laapProductType', 'String128', 0), ('laapDeviceName', 'String128', 0), ('laapDirectory', 'String128', 0), ('laapPartition', 'String128', 0), ('laapDescription', 'String128', 0)), frozenset({'uuid'}), None, False),
+    'RLineAssociation': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 0), ('index', 'XInteger', 0)), frozenset(), None, False),
+    'RLineGroup': ((('distributionAlgorithm', 'XDistributeAlgorithm', 0), ('rnaReversionTimeOut', 'XInteger', 0), ('huntAlgorithmNoAnswer', 'XHuntAlgorithm', 0), ('huntAlgorithmBusy', 'XHuntAlgorithm', 0), ('huntAlgorithmNotAvailable', 'XHuntAlgorithm', 0), ('members', 'RLineGroup.members', 0), ('name', 'xsd:string', 0), ('autoLogOffHunt', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RLineGroup.members': ((('member', 'RLineGroupMember', 2),), frozenset(), None, False),
+    'RLineGroupMember': ((('lineSelectionOrder', 'XInteger', 0), ('directoryNumber', 'RDirn', 0)), frozenset({'uuid'}), None, False),
+    'RLocalRouteGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RLocation': ((('name', 'String50', 0), ('id', 'XInteger', 0), ('relatedLocations', 'RLocation.relatedLocations', 0), ('withinAudioBandwidth', 'XInteger', 0), ('withinVideoBandwidth', 'XInteger', 0), ('withinImmersiveKbits', 'XInteger', 0), ('betweenLocations', 'RLocation.betweenLocations', 0)), frozenset({'uuid'}), None, False),
+    'RLocation.betweenLocations': ((('betweenLocation', 'RLocationBetween', 2),), frozenset(), None, False),
+    'RLocation.relatedLocations': ((('relatedLocation', 'RLocationRelationship', 2),), frozenset(), None, False),
+    'RLocationBetween': ((('locationName', 'XFkType', 0), ('weight', 'XInteger', 0), ('audioBandwidth', 'XInteger', 0), ('videoBandwidth', 'XInteger', 0), ('immersiveBandwidth', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RLocationRelationship': ((('locationName', 'XFkType', 0), ('rsvpSetting', 'XMatrixValue', 0)), frozenset({'uuid'}), None, False),
+    'RMediaResourceGroup': ((('name', 'String50', 0), ('description', 'String50', 0), ('multicast', 'boolean', 0), ('members', 'RMediaResourceGroup.members', 0)), frozenset({'uuid'}), None, False),
+    'RMediaResourceGroup.members': ((('member', 'RMediaResourceGroupMember', 2),), frozenset(), None, False),
+    'RMediaResourceGroupMember': ((('deviceName', 'XFkType', 0),), frozenset({'uuid'}), None, False),
+    'RMediaResourceList': ((('name', 'String50', 0), ('clause', 'String1024', 0), ('members', 'RMediaResourceList.members', 0)), frozenset({'uuid'}), None, False),
+    'RMediaResourceList.members': ((('member', 'RMediaResourceListMember', 2),), frozenset(), None, False),
+    'RMediaResourceListMember': ((('mediaResourceGroupName', 'XFkType', 0), ('order', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RMeetMe': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('minimumSecurityLevel', 'XDeviceSecurityMode', 0)), frozenset({'uuid'}), None, False),
+    'RMessageWaiting': ((('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 0), ('description', 'String128', 0), ('messageWaitingIndicator', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RMlppDomain': ((('domainName', 'xsd:string', 0), ('domainId', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RMobileSmartClientProfile': ((('name', 'xsd:string', 0), ('mobileSmartClient', 'XMobileSmartClient', 0), ('enableSnrUri', 'xsd:string', 0), ('enableCFAUri', 'xsd:string', 0), ('handOffUri', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RMobileVoiceAccess': ((('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 0), ('locales', 'RMobileVoiceAccess.locales', 0)), frozenset({'uuid'}), None, False),
+    'RMobileVoiceAccess.locales': ((('locale', 'RMobileVoiceMember', 2),), frozenset(), None, False),
+    'RMobileVoiceMember': ((('userLocale', 'XUserLocale', 0), ('orderIndex', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RMobility': ((('handoffNumber', 'XFkType', 0), ('handoffPartitionName', 'XFkType', 0), ('DTMFNumber', 'XFkType', 0), ('DTMFPartitionName', 'XFkType', 0)), frozenset(), None, False),
+    'RMobilityProfile': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('mobileClientCallingOption', 'XDialViaOffice', 0), ('dvofServiceAccessNumber', 'xsd:string', 0), ('dirn', 'RDirn', 0), ('dvorCallerId', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RMohAudioSource': ((('sourceId', 'XMOHAudioSourceId', 0), ('name', 'String50', 0), ('sourceFile', 'String255', 0), ('multicast', 'boolean', 0), ('mohFileStatus', 'XInteger', 0), ('initialAnnouncement', 'XFkType', 0), ('periodicAnnouncement', 'XFkType', 0), ('periodicAnnouncementInterval', 'XInteger', 0), ('localeAnnouncement', 'XUserLocale', 0), ('initialAnnouncementPlayed', 'boolean', 0), ('isExternalSource', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RMohServer': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('processNodeName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('maxUnicastConnections', 'XInteger', 0), ('maxMulticastConnections', 'XInteger', 0), ('fixedAudioSourceDevice', 'xsd:string', 0), ('runFlag', 'boolean', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('isMultiCastEnabled', 'boolean', 0), ('baseMulticastIpaddress', 'xsd:string', 0), ('baseMulticastPort', 'XInteger', 0), ('multicastIncrementOnIp', 'boolean', 0), ('audioSources', 'RMohServer.audioSources', 0)), frozenset({'uuid'}), None, False),
+    'RMohServer.audioSources': ((('audioSource', 'RMohServer.audioSources.audioSource', 2),), frozenset(), None, False),
+    'RMohServer.audioSources.audioSource': ((('sourceId', 'XInteger', 0), ('maxHops', 'XInteger', 0)), frozenset(), None, False),
+    'RMraServiceDomain': ((('name', 'xsd:string', 0), ('isDefault', 'boolean', 0), ('serviceDomains', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RMtp': ((('mtpType', 'XProduct', 0), ('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'XFkType', 0), ('trustedRelayPoint', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RNetworkAccessProfile': ((('name', 'UniqueString128', 0), ('description', 'String255', 0), ('vpnRequired', 'XStatus', 0), ('proxySettings', 'XHTTPProxy', 0), ('proxyHostname', 'xsd:string', 0), ('proxyPort', 'XInteger', 0), ('proxyRequiresAuthentication', 'boolean', 0), ('provideSharedCredentials', 'boolean', 0), ('username', 'xsd:string', 0), ('password', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RNormalizationScriptInfo': ((('parameterName', 'String128', 0), ('parameterValue', 'String128', 0)), frozenset({'uuid'}), None, False),
+    'RNumplanIdentifier': ((('directoryNumber', 'String255', 0), ('routePartitionName', 'String50', 0)), frozenset(), None, False),
+    'RPageLayoutPreferences': ((('pageName', 'xsd:string', 0), ('pageSections', 'RPageLayoutPreferences.pageSections', 0)), frozenset({'uuid'}), None, False),
+    'RPageLayoutPreferences.pageSections': ((('pageSection', 'RPageLayoutPreferences.pageSections.pageSection', 2),), frozenset(), None, False),
+    'RPageLayoutPreferences.pageSections.pageSection': ((('name', 'XWebPageSection', 0), ('state', 'XWebPageDisplay', 0), ('order', 'XInteger', 0)), frozenset(), None, False),
+    'RParameterMember': ((('parameter', 'XDialParameter', 0), ('value', 'xsd:string', 0), ('selectionOrder', 'XInteger', 0)), frozenset(), None, False),
+    'RPatternMember': ((('description', 'xsd:string', 0), ('dialParameters', 'RPatternMember.dialParameters', 0), ('selectionOrder', 'XInteger', 0)), frozenset(), None, False),
+    'RPatternMember.dialParameters': ((('dialParameter', 'RParameterMember', 2),), frozenset(), None, False),
+    'RPhone': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('commonPhoneConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('vendorConfig', 'XVendorConfig', 0), ('versionStamp', 'String128', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('securityProfileName', 'XFkType', 0), ('sipProfileName', 'XFkType', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('sendGeoLocation', 'boolean', 0), ('lines', 'RPhone.lines', 0), ('numberOfButtons', 'XInteger', 0), ('phoneTemplateName', 'XFkType', 0), ('speeddials', 'RPhone.speeddials', 0), ('busyLampFields', 'RPhone.busyLampFields', 0), ('primaryPhoneName', 'XFkType', 0), ('ringSettingIdleBlfAudibleAlert', 'XStatus', 0), ('ringSettingBusyBlfAudibleAlert', 'XStatus', 0), ('blfDirectedCallParks', 'RPhone.blfDirectedCallParks', 0), ('addOnModules', 'RPhone.addOnModules', 0), ('userLocale', 'XUserLocale', 0), ('networkLocale', 'XCountry', 0), ('idleTimeout', 'XInteger', 0), ('authenticationUrl', 'xsd:string', 0), ('directoryUrl', 'xsd:string', 0), ('idleUrl', 'xsd:string', 0), ('informationUrl', 'xsd:string', 0), ('messagesUrl', 'xsd:string', 0), ('proxyServerUrl', 'xsd:string', 0), ('servicesUrl', 'xsd:string', 0), ('services', 'RPhone.services', 0), ('softkeyTemplateName', 'XFkType', 0), ('loginUserId', 'String255', 0), ('defaultProfileName', 'XFkType', 0), ('enableExtensionMobility', 'boolean', 0), ('currentProfileName', 'XFkType', 0), ('loginTime', 'XInteger', 0), ('loginDuration', 'XInteger', 0), ('currentConfig', 'RPhone.currentConfig', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('builtInBridgeStatus', 'XStatus', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('hlogStatus', 'XStatus', 0), ('ownerUserName', 'XFkType', 0), ('ignorePresentationIndicators', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('rerouteCallingSearchSpaceName', 'XFkType', 0), ('allowCtiControlFlag', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('unattendedPort', 'boolean', 0), ('requireDtmfReception', 'boolean', 0), ('rfc2833Disabled', 'boolean', 0), ('certificateOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('authenticationString', 'String128', 0), ('certificateStatus', 'XCertificateStatus', 0), ('upgradeFinishTime', 'xsd:string', 0), ('deviceMobilityMode', 'XStatus', 0), ('roamingDevicePoolName', 'XFkType', 0), ('remoteDevice', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndRingSetting', 'XRingSetting', 0), ('dndStatus', 'boolean', 0), ('isActive', 'boolean', 0), ('isDualMode', 'boolean', 0), ('mobilityUserIdName', 'XFkType', 0), ('phoneSuite', 'XPhonePersonalization', 0), ('phoneServiceDisplay', 'XPhoneServiceDisplay', 0), ('isProtected', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('mtpPreferedCodec', 'XSIPCodec', 0), ('dialRulesName', 'XFkType', 0), ('sshUserId', 'String50', 0), ('sshPwd', 'String255', 0), ('digestUser', 'String255', 0), ('outboundCallRollover', 'XOutboundCallRollover', 0), ('hotlineDevice', 'boolean', 0), ('secureInformationUrl', 'String255', 0), ('secureDirectoryUrl', 'String255', 0), ('secureMessageUrl', 'String255', 0), ('secureServicesUrl', 'String255', 0), ('secureAuthenticationUrl', 'String255', 0), ('secureIdleUrl', 'String255', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('featureControlPolicy', 'XFkType', 0), ('deviceTrustMode', 'XDeviceTrustMode', 0), ('earlyOfferSupportForVoiceCall', 'boolean', 0), ('requireThirdPartyRegistration', 'boolean', 0), ('blockIncomingCallsWhenRoaming', 'boolean', 0), ('homeNetworkId', 'xsd:string', 0), ('AllowPresentationSharingUsingBfcp', 'boolean', 0), ('confidentialAccess', 'RPhone.confidentialAccess', 0), ('requireOffPremiseLocation', 'boolean', 0), ('allowiXApplicableMedia', 'boolean', 0), ('cgpnIngressDN', 'XFkType', 0), ('useDevicePoolCgpnIngressDN', 'boolean', 0), ('msisdn', 'String128', 0), ('enableCallRoutingToRdWhenNoneIsActive', 'boolean', 0), ('wifiHotspotProfile', 'XFkType', 0), ('wirelessLanProfileGroup', 'XFkType', 0), ('elinGroup', 'XFkType', 0), ('enableActivationID', 'boolean', 0), ('activationIDStatus', 'String255', 0), ('mraServiceDomain', 'XFkType', 0), ('allowMraMode', 'boolean', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RPhone.addOnModules': ((('addOnModule', 'RAddOnModule', 2),), frozenset(), None, False),
+    'RPhone.blfDirectedCallParks': ((('blfDirectedCallPark', 'RBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'RPhone.busyLampFields': ((('busyLampField', 'RBusyLampField', 2),), frozenset(), None, False),
+    'RPhone.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RPhone.currentConfig': ((('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('phoneTemplateName', 'XFkType', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('softkeyTemplateName', 'XFkType', 0), ('ignorePresentationIndicators', 'boolean', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('dndStatus', 'boolean', 0), ('dndRingSetting', 'XRingSetting', 0), ('dndOption', 'XDNDOption', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('emccCallingSearchSpaceName', 'XFkType', 0), ('deviceName', 'String255', 0), ('model', 'XModel', 0), ('product', 'XProduct', 0), ('deviceProtocol', 'XDeviceProtocol', 0), ('class', 'XClass', 0), ('addressMode', 'XIPAddressingMode', 0), ('allowAutoConfig', 'XStatus', 0), ('remoteSrstOption', 'String50', 0), ('remoteSrstIp', 'String15', 0), ('remoteSrstPort', 'XInteger', 0), ('remoteSipSrstIp', 'String15', 0), ('remoteSipSrstPort', 'XInteger', 0), ('geolocationInfo', 'String2048', 0), ('remoteLocationName', 'String50', 0)), frozenset(), None, False),
+    'RPhone.lines': ((('line', 'RPhoneLine', 2), ('lineIdentifier', 'RNumplanIdentifier', 2)), frozenset(), None, False),
+    'RPhone.services': ((('service', 'RSubscribedService', 2),), frozenset(), None, False),
+    'RPhone.speeddials': ((('speeddial', 'RSpeeddial', 2),), frozenset(), None, False),
+    'RPhoneButtonTemplate': ((('name', 'xsd:string', 0), ('isUserModifiable', 'boolean', 0), ('buttons', 'RPhoneButtonTemplate.buttons', 0)), frozenset({'uuid'}), None, False),
+    'RPhoneButtonTemplate.buttons': ((('button', 'RButton', 2),), frozenset(), None, False),
+    'RPhoneLine': ((('index', 'XInteger', 0), ('label', 'String50', 0), ('display', 'String50', 0), ('dirn', 'RDirn', 0), ('ringSetting', 'XRingSetting', 0), ('consecutiveRingSetting', 'XRingSetting', 0), ('ringSettingIdlePickupAlert', 'XRingSetting', 0), ('ringSettingActivePickupAlert', 'XRingSetting', 0), ('displayAscii', 'String50', 0), ('e164Mask', 'String255', 0), ('dialPlanWizardId', 'XInteger', 0), ('mwlPolicy', 'XMWLPolicy', 0), ('maxNumCalls', 'XInteger', 0), ('busyTrigger', 'XInteger', 0), ('callInfoDisplay', 'RPhoneLine.callInfoDisplay', 0), ('recordingProfileName', 'XFkType', 0), ('monitoringCssName', 'XFkType', 0), ('recordingFlag', 'XRecordingFlag', 0), ('audibleMwi', 'XStatus', 0), ('speedDial', 'xsd:string', 0), ('partitionUsage', 'XPartitionUsage', 0), ('associatedEndusers', 'RPhoneLine.associatedEndusers', 0), ('missedCallLogging', 'boolean', 0), ('recordingMediaSource', 'XPreferredMediaSource', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RPhoneLine.associatedEndusers': ((('enduser', 'REnduserMember', 2),), frozenset(), None, False),
+    'RPhoneLine.callInfoDisplay': ((('callerName', 'boolean', 0), ('callerNumber', 'boolean', 0), ('redirectedNumber', 'boolean', 0), ('dialedNumber', 'boolean', 0)), frozenset(), None, False),
+    'RPhoneNtp': ((('ipAddress', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0), ('description', 'xsd:string', 0), ('mode', 'XZzntpmode', 0)), frozenset({'uuid'}), None, False),
+    'RPhoneSecurityProfile': ((('phoneType', 'XModel', 0), ('protocol', 'XDeviceProtocol', 0), ('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('deviceSecurityMode', 'XDeviceSecurityMode', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('tftpEncryptedConfig', 'boolean', 0), ('EnableOAuthAuthentication', 'boolean', 0), ('nonceValidityTime', 'XInteger', 0), ('transportType', 'XTransport', 0), ('sipPhonePort', 'XInteger', 0), ('enableDigestAuthentication', 'boolean', 0), ('excludeDigestCredentials', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RPhysicalLocation': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RPickupGroupMember': ((('priority', 'XInteger', 0), ('pickupGroupName', 'XFkType', 0), ('pickupDnAndPartition', 'RPickupGroupMember.pickupDnAndPartition', 0)), frozenset({'uuid'}), None, False),
+    'RPickupGroupMember.pickupDnAndPartition': ((('dnPattern', 'String255', 0), ('routePartitionName', 'XFkType', 0)), frozenset(), None, False),
+    'RPolicyRelationship': ((('geoLocationPolicyAName', 'XFkType', 0), ('geoLocationDeviceA', 'XGeoLocationDevice', 0), ('geoLocationPolicyBName', 'XFkType', 0), ('geoLocationDeviceB', 'XGeoLocationDevice', 0), ('logicalPartitionPolicy', 'XLogicalPartitionPolicy', 0)), frozenset({'uuid'}), None, False),
+    'RPresenceGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('presenceGroups', 'RPresenceGroup.presenceGroups', 0)), frozenset({'uuid'}), None, False),
+    'RPresenceGroup.presenceGroups': ((('presenceGroup', 'RPresenceGroupMember', 2),), frozenset(), None, False),
+    'RPresenceGroupMember': ((('presenceGroupName', 'XFkType', 0), ('subscriptionPermission', 'XMatrixValue', 0)), frozenset({'uuid'}), None, False),
+    'RPresenceRedundancyGroup': ((('name', 'String255', 0), ('description', 'String255', 0), ('server1', 'XFkType', 0), ('server2', 'XFkType', 0), ('haEnabled', 'boolean', 0), ('numUsers', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RProcessNode': ((('name', 'String255', 0), ('description', 'String50', 0), ('mac', 'XMacAddress', 0), ('ipv6Name', 'xsd:string', 0), ('nodeUsage', 'XNodeUsage', 0), ('lbmHubGroup', 'XFkType', 0), ('processNodeRole', 'XProcessNodeRole', 0), ('cupDomain', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RProcessNodeService': ((('processNodeName', 'XFkType', 0), ('service', 'XService', 0), ('traceLevel', 'XInteger', 0), ('userCategories', 'XInteger', 0), ('enable', 'boolean', 0), ('numFiles', 'XInteger', 0), ('maxFileSize', 'XInteger', 0), ('isActive', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RProcessNodes': ((('lbmAssignedServices', 'XFkType', 0),), frozenset({'uuid'}), None, False),
+    'RRecordingProfile': ((('name', 'String50', 0), ('recordingCssName', 'XFkType', 0), ('recorderDestination', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RRegion': ((('name', 'String50', 0), ('relatedRegions', 'RRegion.relatedRegions', 0), ('defaultCodec', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RRegion.relatedRegions': ((('relatedRegion', 'RRegionRelationship', 2),), frozenset(), None, False),
+    'RRegionRelationship': ((('regionName', 'XFkType', 0), ('bandwidth', 'xsd:string', 0), ('videoBandwidth', 'XInteger', 0), ('lossyNetwork', 'XLossyNetwork', 0), ('codecPreference', 'XFkType', 0), ('immersiveVideoBandwidth', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RRegistrationDynamic': ((('device', 'XFkType', 0), ('lastKnownIpAddress', 'xsd:string', 0), ('lastKnownUcm', 'xsd:string', 0), ('lastKnownConfigVersion', 'xsd:string', 0), ('locationDetails', 'xsd:string', 0), ('endpointConnection', 'XEndpointConnection', 0), ('portOrSsid', 'xsd:string', 0), ('lastSeen', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RRemoteCluster': ((('clusterId', 'String255', 0), ('description', 'xsd:string', 0), ('fullyQualifiedName', 'String50', 0), ('emcc', 'RRemoteClusterMember', 0), ('pstnAccess', 'RRemoteClusterMember', 0), ('rsvpAgent', 'RRemoteClusterMember', 0), ('tftp', 'RRemoteClusterMember', 0), ('lbm', 'RRemoteClusterMember', 0), ('uds', 'RRemoteClusterMember', 0)), frozenset({'uuid'}), None, False),
+    'RRemoteClusterMember': ((('enabled', 'boolean', 0), ('remoteIpAddress1', 'String15', 0), ('remoteIpAddress2', 'String15', 0), ('remoteIpAddress3', 'String15', 0)), frozenset(), None, False),
+    'RRemoteDestination': ((('name', 'xsd:string', 0), ('destination', 'xsd:string', 0), ('answerTooSoonTimer', 'XInteger', 0), ('answerTooLateTimer', 'XInteger', 0), ('delayBeforeRingingCell', 'XInteger', 0), ('ownerUserId', 'XFkType', 0), ('remoteDestinationProfileName', 'XFkType', 0), ('ctiRemoteDeviceName', 'XFkType', 0), ('dualModeDeviceName', 'XFkType', 0), ('isMobilePhone', 'boolean', 0), ('enableMobileConnect', 'boolean', 0), ('lineAssociations', 'RRemoteDestination.lineAssociations', 0), ('ctiRemoteDeviceLineAssociations', 'RRemoteDestination.ctiRemoteDeviceLineAssociations', 0), ('timeZone', 'XTimeZone', 0), ('todAccessName', 'XFkType', 0), ('mobileSmartClientName', 'XFkType', 0), ('mobilityProfileName', 'XFkType', 0), ('singleNumberReachVoicemail', 'XVMAvoidancePolicy', 0), ('dialViaOfficeReverseVoicemail', 'XVMAvoidancePolicy', 0), ('ringSchedule', 'RRemoteDestination.ringSchedule', 0), ('accessListName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RRemoteDestination.ctiRemoteDeviceLineAssociations': ((('ctiRemoteDeviceLineAssociation', 'RCtiRemoteDeviceLineAssociation', 2),), frozenset(), None, False),
+    'RRemoteDestination.lineAssociations': ((('lineAssociation', 'RLineAssociation', 2),), frozenset(), None, False),
+    'RRemoteDestination.ringSchedule': ((('member', 'RRingingSchedule', 2),), frozenset(), None, False),
+    'RRemoteDestinationProfile': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('lines', 'RRemoteDestinationProfile.lines', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('userId', 'xsd:string', 0), ('ignorePresentationIndicators', 'boolean', 0), ('rerouteCallingSearchSpaceName', 'XFkType', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('userLocale', 'XUserLocale', 0), ('networkLocale', 'XCountry', 0), ('primaryPhoneName', 'XFkType', 0), ('dndOption', 'XDNDOption', 0), ('dndStatus', 'boolean', 0), ('mobileSmartClientProfileName', 'XFkType', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RRemoteDestinationProfile.lines': ((('line', 'RPhoneLine', 2), ('lineIdentifier', 'RNumplanIdentifier', 2)), frozenset(), None, False),
+    'RResourcePriorityNamespace': ((('namespace', 'String10', 0), ('description', 'xsd:string', 0), ('isDefault', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RResourcePriorityNamespaceList': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('members', 'RResourcePriorityNamespaceList.members', 0)), frozenset({'uuid'}), None, False),
+    'RResourcePriorityNamespaceList.members': ((('member', 'RResourcePriorityNamespaceListMember', 2),), frozenset(), None, False),
+    'RResourcePriorityNamespaceListMember': ((('resourcePriorityNamespaceName', 'XFkType', 0), ('index', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RRingingSchedule': ((('startTime', 'XTimeOfDay', 0), ('endTime', 'XTimeOfDay', 0), ('startDay', 'XDayOfWeek', 0), ('endDay', 'XDayOfWeek', 0)), frozenset({'uuid'}), None, False),
+    'RRouteFilter': ((('name', 'xsd:string', 0), ('clause', 'xsd:string', 0), ('dialPlanName', 'XFkType', 0), ('dialPlanWizardGenId', 'XInteger', 0), ('members', 'RRouteFilter.members', 0)), frozenset({'uuid'}), None, False),
+    'RRouteFilter.members': ((('member', 'RRouteFilterMember', 2),), frozenset(), None, False),
+    'RRouteFilterMember': ((('dialPlanTagName', 'XFkType', 0), ('digits', 'String50', 0), ('operator', 'XOperator', 0), ('priority', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RRouteGroup': ((('dialPlanWizardGenld', 'XInteger', 0), ('distributionAlgorithm', 'XDistributeAlgorithm', 0), ('members', 'RRouteGroup.members', 0), ('name', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RRouteGroup.members': ((('member', 'RRouteGroupMember', 2),), frozenset(), None, False),
+    'RRouteGroupMember': ((('deviceSelectionOrder', 'XInteger', 0), ('dialPlanWizardGenId', 'XInteger', 0), ('deviceName', 'XFkType', 0), ('port', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RRouteList': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callManagerGroupName', 'XFkType', 0), ('routeListEnabled', 'boolean', 0), ('members', 'RRouteList.members', 0), ('runOnEveryNode', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RRouteList.members': ((('member', 'RRouteListMember', 2),), frozenset(), None, False),
+    'RRouteListMember': ((('routeGroupName', 'XFkType', 0), ('selectionOrder', 'XInteger', 0), ('calledPartyTransformationMask', 'String50', 0), ('callingPartyTransformationMask', 'String50', 0), ('dialPlanWizardGenId', 'XInteger', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('callingPartyPrefixDigits', 'String50', 0), ('prefixDigitsOut', 'String50', 0), ('useFullyQualifiedCallingPartyNumber', 'XStatus', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0)), frozenset({'uuid'}), None, False),
+    'RRoutePartition': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('dialPlanWizardGenId', 'XInteger', 0), ('timeScheduleIdName', 'XFkType', 0), ('useOriginatingDeviceTimeZone', 'boolean', 0), ('timeZone', 'XTimeZone', 0), ('partitionUsage', 'XPartitionUsage', 0)), frozenset({'uuid'}), None, False),
+    'RRoutePattern': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('blockEnable', 'boolean', 0), ('calledPartyTransformationMask', 'xsd:string', 0), ('callingPartyTransformationMask', 'xsd:string', 0), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 0), ('dialPlanName', 'XFkType', 0), ('dialPlanWizardGenId', 'XInteger', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 0), ('routeFilterName', 'XFkType', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('supportOverlapSending', 'boolean', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('allowDeviceOverride', 'boolean', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('destination', 'RRoutePattern.destination', 0), ('authorizationCodeRequired', 'boolean', 0), ('authorizationLevelRequired', 'XInteger', 0), ('clientCodeRequired', 'boolean', 0), ('withTag', 'String50', 0), ('withValueClause', 'String255', 0), ('isdnNsfInfoElement', 'RRoutePattern.isdnNsfInfoElement', 0), ('resourcePriorityNamespaceName', 'XFkType', 0), ('routeClass', 'XPatternRouteClass', 0), ('enableDccEnforcement', 'boolean', 0), ('blockedCallPercentage', 'xsd:string', 0), ('externalCallControl', 'XFkType', 0), ('isEmergencyServiceNumber', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RRoutePattern.destination': ((('gatewayName', 'XFkType', 0), ('routeListName', 'XFkType', 0)), frozenset(), None, False),
+    'RRoutePattern.isdnNsfInfoElement': ((('cic', 'xsd:string', 0), ('networkServiceProtocol', 'XPriProtocol', 0), ('networkService', 'XNSFService', 0), ('paramValue', 'xsd:string', 0)), frozenset(), None, False),
+    'RSIPNormalizationScript': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('content', 'xsd:string', 0), ('scriptExecutionErrorRecoveryAction', 'XSIPScriptErrorHandling', 0), ('systemResourceErrorRecoveryAction', 'XSIPScriptErrorHandling', 0), ('maxMemoryThreshold', 'xsd:string', 0), ('maxLuaInstructionsThreshold', 'xsd:string', 0), ('isStandard', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RSNMPCommunityString1': ((('accessPrivilege', 'xsd:string', 0), ('ArrayOfHosts', 'RArrayOfHosts', 1)), frozenset(), None, False),
+    'RSNMPUser': ((('userName', 'xsd:string', 1), ('authRequired', 'boolean', 1), ('authPassword', 'xsd:string', 1), ('authProtocol', 'xsd:string', 1), ('privacyRequired', 'boolean', 1), ('privacyPassword', 'xsd:string', 1), ('privacyProtocol', 'xsd:string', 1), ('accessPrivilege', 'xsd:string', 1), ('ArrayOfHosts', 'RArrayOfHosts', 1)), frozenset(), None, False),
+    'RSafCcdPurgeBlockLearnedRoutes': ((('learnedPattern', 'String50', 0), ('learnedPatternPrefix', 'String50', 0), ('callControlIdentity', 'String50', 0), ('ipAddress', 'String50', 0)), frozenset({'uuid'}), None, False),
+    'RSafForwarder': ((('name', 'String255', 0), ('description', 'String255', 0), ('clientLabel', 'String255', 0), ('safSecurityProfile', 'XFkType', 0), ('ipAddress', 'String255', 0), ('port', 'XInteger', 0), ('enableTcpKeepAlive', 'boolean', 0), ('safReconnectInterval', 'XInteger', 0), ('safNotificationsWindowSize', 'XInteger', 0), ('associatedCucms', 'RSafForwarder.associatedCucms', 0)), frozenset({'uuid'}), None, False),
+    'RSafForwarder.associatedCucms': ((('associatedCucm', 'RSafForwarderMember', 2),), frozenset(), None, False),
+    'RSafForwarderMember': ((('callManagerName', 'XFkType', 0),), frozenset({'uuid'}), None, False),
+    'RSafSecurityProfile': ((('name', 'String255', 0), ('description', 'String255', 0), ('userid', 'String50', 0), ('password', 'String128', 0)), frozenset({'uuid'}), None, False),
+    'RSdpTransparencyProfile': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('attributeSet', 'RSdpTransparencyProfile.attributeSet', 2)), frozenset({'uuid'}), None, False),
+    'RSdpTransparencyProfile.attributeSet': ((('attributeNameString', 'xsd:string', 0), ('sdpAttributeHandling', 'xsd:string', 0), ('allowedValue', 'xsd:string', 2)), frozenset(), None, False),
+    'RSecureConfig': ((('name', 'String50', 0), ('value', 'String50', 0)), frozenset({'uuid'}), None, False),
+    'RServiceParameter': ((('processNodeName', 'XFkType', 0), ('name', 'xsd:string', 0), ('service', 'XService', 0), ('value', 'xsd:string', 0), ('valueType', 'XParam', 0)), frozenset({'uuid'}), None, False),
+    'RServiceProfile': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('isDefault', 'boolean', 0), ('serviceProfileInfos', 'RServiceProfile.serviceProfileInfos', 0)), frozenset({'uuid'}), None, False),
+    'RServiceProfile.serviceProfileInfos': ((('serviceProfileInfo', 'RServiceProfileList', 2), ('jabberClientConfigurationProfileInfo', 'RJabberClientConfigurationProfile', 0)), frozenset(), None, False),
+    'RServiceProfileList': ((('profileName', 'xsd:string', 0), ('primary', 'xsd:string', 0), ('secondary', 'xsd:string', 0), ('tertiary', 'xsd:string', 0), ('serverCertificateVerification', 'XCertificateVerificationLevel', 0), ('serviceProfileXml', 'XVendorConfig', 0)), frozenset({'uuid'}), None, False),
+    'RSipDialRules': ((('dialPattern', 'XDialPattern', 0), ('name', 'String50', 0), ('description', 'xsd:string', 0), ('patterns', 'RSipDialRules.patterns', 0), ('plars', 'RSipDialRules.plars', 0)), frozenset({'uuid'}), None, False),
+    'RSipDialRules.patterns': ((('pattern', 'RPatternMember', 2),), frozenset(), None, False),
+    'RSipDialRules.plars': ((('plar', 'RPatternMember', 2),), frozenset(), None, False),
+    'RSipProfile': ((('name', 'String50', 0), ('description', 'String100', 0), ('defaultTelephonyEventPayloadType', 'XInteger', 0), ('redirectByApplication', 'boolean', 0), ('ringing180', 'boolean', 0), ('timerInvite', 'XInteger', 0), ('timerRegisterDelta', 'XInteger', 0), ('timerRegister', 'XInteger', 0), ('timerT1', 'XInteger', 0), ('timerT2', 'XInteger', 0), ('retryInvite', 'XInteger', 0), ('retryNotInvite', 'XInteger', 0), ('startMediaPort', 'XInteger', 0), ('stopMediaPort', 'XInteger', 0), ('startVideoPort', 'XInteger', 0), ('stopVideoPort', 'XInteger', 0), ('dscpForAudioCalls', 'xsd:string', 0), ('dscpForVideoCalls', 'xsd:string', 0), ('dscpForAudioPortionOfVideoCalls', 'xsd:string', 0), ('dscpForTelePresenceCalls', 'xsd:string', 0), ('dscpForAudioPortionOfTelePresenceCalls', 'xsd:string', 0), ('callpickupListUri', 'String128', 0), ('callpickupGroupUri', 'String128', 0), ('meetmeServiceUrl', 'String128', 0), ('userInfo', 'XZzuserInfo', 0), ('dtmfDbLevel', 'XZzdtmfDbLevel', 0), ('callHoldRingback', 'XZzpreff', 0), ('anonymousCallBlock', 'XZzpreff', 0), ('callerIdBlock', 'XZzpreff', 0), ('dndControl', 'XZzdndcontrol', 0), ('telnetLevel', 'XTelnetLevel', 0), ('timerKeepAlive', 'XInteger', 0), ('timerSubscribe', 'XInteger', 0), ('timerSubscribeDelta', 'XInteger', 0), ('maxRedirects', 'XInteger', 0), ('timerOffHookToFirstDigit', 'XInteger', 0), ('callForwardUri', 'String128', 0), ('abbreviatedDialUri', 'String128', 0), ('confJointEnable', 'boolean', 0), ('rfc2543Hold', 'boolean', 0), ('semiAttendedTransfer', 'boolean', 0), ('enableVad', 'boolean', 0), ('stutterMsgWaiting', 'boolean', 0), ('callStats', 'boolean', 0), ('t38Invite', 'boolean', 0), ('faxInvite', 'boolean', 0), ('rerouteIncomingRequest', 'XSIPReroute', 0), ('resourcePriorityNamespaceListName', 'XFkType', 0), ('enableAnatForEarlyOfferCalls', 'boolean', 0), ('rsvpOverSip', 'XRSVPOverSIP', 0), ('fallbackToLocalRsvp', 'boolean', 0), ('sipRe11XxEnabled', 'XSIPRel1XXOptions', 0), ('gClear', 'XGClear', 0), ('sendRecvSDPInMidCallInvite', 'boolean', 0), ('enableOutboundOptionsPing', 'boolean', 0), ('optionsPingIntervalWhenStatusOK', 'XInteger', 0), ('optionsPingIntervalWhenStatusNotOK', 'XInteger', 0), ('deliverConferenceBridgeIdentifier', 'boolean', 0), ('sipOptionsRetryCount', 'XInteger', 0), ('sipOptionsRetryTimer', 'XInteger', 0), ('sipBandwidthModifier', 'XSIPBandwidthModifier', 0), ('enableUriOutdialSupport', 'xsd:string', 0), ('userAgentServerHeaderInfo', 'XUserAgentServerHeaderInfo', 0), ('allowPresentationSharingUsingBfcp', 'boolean', 0), ('scriptParameters', 'xsd:string', 0), ('isScriptTraceEnabled', 'boolean', 0), ('sipNormalizationScript', 'XFkType', 0), ('allowiXApplicationMedia', 'boolean', 0), ('dialStringInterpretation', 'XURIDisambiguationPolicy', 0), ('acceptAudioCodecPreferences', 'XStatus', 0), ('mlppUserAuthorization', 'boolean', 0), ('isAssuredSipServiceEnabled', 'boolean', 0), ('enableExternalQoS', 'boolean', 0), ('resourcePriorityNamespace', 'XFkType', 0), ('useCallerIdCallerNameinUriOutgoingRequest', 'boolean', 0), ('externalPresentationInfo', 'RSipProfile.externalPresentationInfo', 0), ('callingLineIdentification', 'XCallingLineIdentification', 0), ('rejectAnonymousIncomingCall', 'boolean', 0), ('callpickupUri', 'String128', 0), ('rejectAnonymousOutgoingCall', 'boolean', 0), ('videoCallTrafficClass', 'XVideoCallTrafficClass', 0), ('sdpTransparency', 'XFkType', 0), ('allowMultipleCodecs', 'boolean', 0), ('sipSessionRefreshMethod', 'XSipSessionRefreshMethod', 0), ('earlyOfferSuppVoiceCall', 'XEOSuppVoiceCall', 0), ('cucmVersionInSipHeader', 'XCUCMVersionInSipHeader', 0), ('confidentialAccessLevelHeaders', 'XCALHeaders', 0), ('destRouteString', 'boolean', 0), ('inactiveSDPRequired', 'boolean', 0), ('allowRRAndRSBandwidthModifier', 'boolean', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RSipProfile.externalPresentationInfo': ((('isAnonymous', 'boolean', 0), ('presentationInfo', 'RSipProfile.externalPresentationInfo.presentationInfo', 0)), frozenset(), None, False),
+    'RSipProfile.externalPresentationInfo.presentationInfo': ((('externalPresentationNumber', 'xsd:string', 0), ('externalPresentationName', 'String50', 0)), frozenset(), None, False),
+    'RSipRealm': ((('realm', 'xsd:string', 0), ('userid', 'xsd:string', 0), ('digestCredentials', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RSipRoutePattern': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('blockEnable', 'boolean', 0), ('callingPartyTransformationMask', 'xsd:string', 0), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('sipTrunkName', 'XFkType', 0), ('dnOrPatternIpv6', 'xsd:string', 0), ('routeOnUserPart', 'boolean', 0), ('useCallerCss', 'boolean', 0), ('domainRoutingCssName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RSipTrunk': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('loadInformation', 'XLoadInformation', 0), ('versionStamp', 'String128', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('securityProfileName', 'XFkType', 0), ('sipProfileName', 'XFkType', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('geoLocationFilterName', 'XFkType', 0), ('sendGeoLocation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('transmitUtf8', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('rerouteCallingSearchSpaceName', 'XFkType', 0), ('referCallingSearchSpaceName', 'XFkType', 0), ('mtpRequired', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('unknownPrefix', 'String16', 0), ('destAddrIsSrv', 'boolean', 0), ('tkSipCodec', 'XSIPCodec', 0), ('sigDigits', 'RSipTrunk.sigDigits', 0), ('connectedNamePresentation', 'XPresentationBit', 0), ('connectedPartyIdPresentation', 'XPresentationBit', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingname', 'XPresentationBit', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('prefixDn', 'String50', 0), ('externalPresentationInfo', 'RSipTrunk.externalPresentationInfo', 0), ('acceptInboundRdnis', 'boolean', 0), ('acceptOutboundRdnis', 'boolean', 0), ('srtpAllowed', 'boolean', 0), ('srtpFallbackAllowed', 'boolean', 0), ('isPaiEnabled', 'boolean', 0), ('sipPrivacy', 'XSipPrivacy', 0), ('isRpidEnabled', 'boolean', 0), ('sipAssertedType', 'XSipAssertedType', 0), ('trustReceivedIdentity', 'XTrustReceivedIdentity', 0), ('dtmfSignalingMethod', 'XDTMFSignaling', 0), ('routeClassSignalling', 'XStatus', 0), ('sipTrunkType', 'XTrunkService', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('useImePublicIpPort', 'boolean', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('cntdPnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('rdnTransformationCssName', 'XFkType', 0), ('useDevicePoolRdnTransformCss', 'boolean', 0), ('useOrigCallingPartyPresOnDivert', 'boolean', 0), ('sipNormalizationScriptName', 'XFkType', 0), ('runOnEveryNode', 'boolean', 0), ('destinations', 'RSipTrunk.destinations', 0), ('unknownStripDigits', 'XInteger', 0), ('cgpnTransformationUnknownCssName', 'XFkType', 0), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('pathReplacementSupport', 'boolean', 0), ('enableQsigUtf8', 'boolean', 0), ('scriptParameters', 'xsd:string', 0), ('scriptTraceEnabled', 'boolean', 0), ('trunkTrafficSecure', 'XSIPTrunkCallLegSecurity', 0), ('callingAndCalledPartyInfoFormat', 'XSIPIdentityBlend', 0), ('useCallerIdCallerNameinUriOutgoingRequest', 'boolean', 0), ('service', 'xsd:string', 0), ('parameterLabel', 'xsd:string', 0), ('originatingParameterValue', 'xsd:string', 0), ('terminatingParameterValue', 'xsd:string', 0), ('outboundUriRoutingInstructions', 'xsd:string', 0), ('requestUriDomainName', 'xsd:string', 0), ('enableCiscoRecordingQsigTunneling', 'boolean', 0), ('recordingInformation', 'xsd:string', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('confidentialAccess', 'RSipTrunk.confidentialAccess', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RSipTrunk.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RSipTrunk.destinations': ((('destination', 'RSipTrunkDestination', 2),), frozenset(), None, False),
+    'RSipTrunk.externalPresentationInfo': ((('isAnonymous', 'boolean', 0), ('presentationInfo', 'RSipTrunk.externalPresentationInfo.presentationInfo', 0)), frozenset(), None, False),
+    'RSipTrunk.externalPresentationInfo.presentationInfo': ((('externalPresentationNumber', 'xsd:string', 0), ('externalPresentationName', 'String50', 0)), frozenset(), None, False),
+    'RSipTrunk.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'RSipTrunkDestination': ((('addressIpv4', 'String255', 0), ('addressIpv6', 'String255', 0), ('port', 'XInteger', 0), ('sortOrder', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RSipTrunkSecurityProfile': ((('name', 'String75', 0), ('description', 'String100', 0), ('securityMode', 'XDeviceSecurityMode', 0), ('incomingTransport', 'XTransport', 0), ('outgoingTransport', 'XTransport', 0), ('digestAuthentication', 'boolean', 0), ('noncePolicyTime', 'XInteger', 0), ('x509SubjectName', 'String4096', 0), ('incomingPort', 'XInteger', 0), ('applLevelAuthentication', 'boolean', 0), ('acceptPresenceSubscription', 'boolean', 0), ('acceptOutOfDialogRefer', 'boolean', 0), ('acceptUnsolicitedNotification', 'boolean', 0), ('allowReplaceHeader', 'boolean', 0), ('transmitSecurityStatus', 'boolean', 0), ('sipV150OutboundSdpOfferFiltering', 'XV150SDPFilter', 0), ('allowChargingHeader', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RSoftKeyMember': ((('positionId', 'xsd:nonNegativeInteger', 0), ('softKeyName', 'xsd:string', 0)), frozenset(), None, False),
+    'RSoftKeySet': ((('softKeyTemplateName', 'XFkType', 0), ('callStates', 'RSoftKeySet.callStates', 0)), frozenset({'uuid'}), None, False),
+    'RSoftKeySet.callStates': ((('callState', 'RCallStateMember', 2),), frozenset(), None, False),
+    'RSoftKeyTemplate': ((('name', 'String100', 0), ('description', 'String100', 0), ('baseSoftkeyTemplateName', 'XFkType', 0), ('isDefault', 'boolean', 0), ('applications', 'RSoftKeyTemplate.applications', 0)), frozenset({'uuid'}), None, False),
+    'RSoftKeyTemplate.applications': ((('application', 'String50', 2),), frozenset(), None, False),
+    'RSpeeddial': ((('dirn', 'String255', 0), ('label', 'xsd:string', 0), ('index', 'XInteger', 0)), frozenset(), None, False),
+    'RSrst': ((('name', 'xsd:string', 0), ('port', 'XInteger', 0), ('ipAddress', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0), ('SipNetwork', 'xsd:string', 0), ('SipPort', 'XInteger', 0), ('srstCertificatePort', 'XInteger', 0), ('isSecure', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RSubscribedService': ((('telecasterServiceName', 'XFkType', 0), ('name', 'String100', 0), ('url', 'xsd:string', 0), ('urlButtonIndex', 'XInteger', 0), ('urlLabel', 'String50', 0), ('serviceNameAscii', 'String50', 0), ('phoneService', 'XPhoneService', 0), ('phoneServiceCategory', 'XPhoneServiceCategory', 0), ('vendor', 'xsd:string', 0), ('version', 'xsd:string', 0), ('priority', 'xsd:int', 0)), frozenset({'uuid'}), None, False),
+    'RSyslogConfig': ((('AlarmLevelEvent', 'XAlarmSeverity', 0), ('RemoteServerName1', 'xsd:string', 0), ('RemoteServerName2', 'xsd:string', 0), ('RemoteServerName3', 'xsd:string', 0), ('RemoteServerName4', 'xsd:string', 0), ('RemoteServerName5', 'xsd:string', 0), ('monitor', 'xsd:string', 0), ('Enable', 'boolean', 0)), frozenset(), None, False),
+    'RSyslogConfiguration': ((('serverName', 'xsd:string', 0), ('serviceGroup', 'XServiceGrouping', 0), ('service', 'xsd:string', 0), ('alarmConfigs', 'RSyslogConfiguration.alarmConfigs', 1), ('EndPointAlarm', 'boolean', 0)), frozenset(), None, False),
+    'RSyslogConfiguration.alarmConfigs': ((('AlarmConfig', 'RSyslogConfig', 3),), frozenset(), None, False),
+    'RT1Port': ((('portNumber', 'XInteger', 0), ('attendantDn', 'String255', 0), ('unattendedPort', 'boolean', 0), ('callerIdDn', 'String255', 0), ('callerIdEnable', 'boolean', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('digitSending', 'XDigitSending', 0), ('expectedDigits', 'XInteger', 0), ('sigDigits', 'RT1Port.sigDigits', 0), ('prefixDn', 'String255', 0), ('presentationBit', 'XPresentationBit', 0), ('silenceSuppressionThreshold', 'XSilenceSuppressionThreshold', 0), ('startDialProtocol', 'XStartDialProtocol', 0), ('trunk', 'XTrunk', 0), ('trunkDirection', 'XTrunkDirection', 0), ('trunkLevel', 'XTrunkLevel', 0), ('trunkPadRx', 'XTrunkPad', 0), ('trunkPadTx', 'XTrunkPad', 0), ('vendorConfig', 'XVendorConfig', 0), ('callerId', 'XCallerID', 0), ('endpointId', 'String128', 0), ('timer1', 'XInteger', 0), ('timer2', 'XInteger', 0), ('timer3', 'XInteger', 0), ('timer4', 'XInteger', 0), ('timer5', 'XInteger', 0), ('timer6', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RT1Port.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'RTODAccessMember': ((('timeScheduleName', 'XFkType', 0), ('accessListName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RTimePeriod': ((('name', 'String50', 0), ('startTime', 'XTimeOfDay', 0), ('endTime', 'XTimeOfDay', 0), ('startDay', 'XDayOfWeek', 0), ('endDay', 'XDayOfWeek', 0), ('monthOfYear', 'XMonthOfYear', 0), ('dayOfMonth', 'XInteger', 0), ('description', 'String255', 0), ('isPublished', 'boolean', 0), ('todOwnerIdName', 'XFkType', 0), ('dayOfMonthEnd', 'XInteger', 0), ('monthOfYearEnd', 'XMonthOfYear', 0)), frozenset({'uuid'}), None, False),
+    'RTimeSchedule': ((('name', 'String50', 0), ('members', 'RTimeSchedule.members', 0), ('description', 'String255', 0), ('isPublished', 'boolean', 0), ('timeScheduleCategory', 'XTimeScheduleCategory', 0), ('todOwnerIdName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RTimeSchedule.members': ((('member', 'RTimeScheduleTimePeriod', 2),), frozenset(), None, False),
+    'RTimeScheduleTimePeriod': ((('timePeriodName', 'XFkType', 0),), frozenset({'uuid'}), None, False),
+    'RTodAccess': ((('name', 'String128', 0), ('description', 'String255', 0), ('ownerIdName', 'XFkType', 0), ('members', 'RTodAccess.members', 0), ('associatedRemoteDestination', 'RTodAccess.associatedRemoteDestination', 0)), frozenset({'uuid'}), None, False),
+    'RTodAccess.associatedRemoteDestination': ((('remoteDestination', 'xsd:string', 2),), frozenset(), None, False),
+    'RTodAccess.members': ((('member', 'RTODAccessMember', 0),), frozenset(), None, False),
+    'RTransPattern': ((('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 0), ('routePartitionName', 'XFkType', 0), ('blockEnable', 'boolean', 0), ('calledPartyTransformationMask', 'xsd:string', 0), ('callingPartyTransformationMask', 'xsd:string', 0), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 0), ('dialPlanName', 'XFkType', 0), ('digitDiscardInstructionName', 'XFkType', 0), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 0), ('routeFilterName', 'XFkType', 0), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('callingSearchSpaceName', 'XFkType', 0), ('resourcePriorityNamespaceName', 'XFkType', 0), ('routeNextHopByCgpn', 'boolean', 0), ('routeClass', 'XPatternRouteClass', 0), ('callInterceptProfileName', 'XFkType', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('useOriginatorCss', 'boolean', 0), ('dontWaitForIDTOnSubsequentHops', 'boolean', 0), ('isEmergencyServiceNumber', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RTranscoder': ((('name', 'UniqueString255', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('subUnit', 'XInteger', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('vendorConfig', 'XVendorConfig', 0), ('isTrustedRelayPoint', 'boolean', 0), ('maximumCapacity', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RTransformationProfile': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('nationalStripDigits', 'XInteger', 0), ('internationalStripDigits', 'XInteger', 0), ('unknownStripDigits', 'XInteger', 0), ('subscriberStripDigits', 'XInteger', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('nationalCssName', 'XFkType', 0), ('internationalCssName', 'XFkType', 0), ('unknownCssName', 'XFkType', 0), ('subscriberCssName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RTvsCertificate': ((('subjectName', 'xsd:string', 0), ('issuerName', 'xsd:string', 0), ('serialNumber', 'xsd:string', 0), ('timeToLive', 'xsd:integer', 0), ('ipv4Address', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0), ('roles', 'RTvsCertificate.roles', 0), ('services', 'RTvsCertificate.services', 0)), frozenset({'uuid'}), None, False),
+    'RTvsCertificate.roles': ((('role', 'RCertificateRole', 2),), frozenset(), None, False),
+    'RTvsCertificate.services': ((('service', 'RTvsCertificateService', 2),), frozenset(), None, False),
+    'RTvsCertificateService': ((('serviceName', 'XCertificateService', 0),), frozenset({'uuid'}), None, False),
+    'RUDTLine': ((('index', 'XInteger', 0), ('label', 'String50', 0), ('display', 'String50', 0), ('e164Mask', 'String255', 0), ('dirn', 'RDirn', 0), ('maxNumCalls', 'XInteger', 0), ('missedCallLogging', 'boolean', 0), ('mwlPolicy', 'XMWLPolicy', 0), ('busyTrigger', 'XInteger', 0), ('ringSetting', 'XRingSetting', 0), ('consecutiveRingSetting', 'XRingSetting', 0), ('audibleMwi', 'XStatus', 0), ('ringSettingActivePickupAlert', 'XRingSetting', 0), ('ringSettingIdlePickupAlert', 'XRingSetting', 0), ('monitoringCssName', 'XFkType', 0), ('recordingProfileName', 'XFkType', 0), ('recordingFlag', 'XRecordingFlag', 0), ('recordingMediaSource', 'XPreferredMediaSource', 0), ('callInfoDisplay', 'RUDTLine.callInfoDisplay', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RUDTLine.callInfoDisplay': ((('callerName', 'boolean', 0), ('callerNumber', 'boolean', 0), ('redirectedNumber', 'boolean', 0), ('dialedNumber', 'boolean', 0)), frozenset(), None, False),
+    'RUcService': ((('serviceType', 'XUCService', 0), ('productType', 'XUCProduct', 0), ('name', 'String50', 0), ('description', 'xsd:string', 0), ('hostnameorip', 'String255', 0), ('port', 'XInteger', 0), ('protocol', 'XConnectProtocol', 0), ('ucServiceXml', 'XVendorConfig', 0)), frozenset({'uuid'}), None, False),
+    'RUniversalDeviceTemplate': ((('name', 'xsd:string', 0), ('deviceDescription', 'xsd:string', 0), ('devicePool', 'XFkType', 0), ('deviceSecurityProfile', 'XFkType', 0), ('sipProfile', 'XFkType', 0), ('phoneButtonTemplate', 'XFkType', 0), ('sipDialRules', 'XFkType', 0), ('callingSearchSpace', 'XFkType', 0), ('callingPartyTransformationCSSForInboundCalls', 'XFkType', 0), ('callingPartyTransformationCSSForOutboundCalls', 'XFkType', 0), ('reroutingCallingSearchSpace', 'XFkType', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('useDevicePoolCallingPartyTransformationCSSforInboundCalls', 'boolean', 0), ('useDevicePoolCallingPartyTransformationCSSforOutboundCalls', 'boolean', 0), ('commonPhoneProfile', 'XFkType', 0), ('commonDeviceConfiguration', 'XFkType', 0), ('softkeyTemplate', 'XFkType', 0), ('featureControlPolicy', 'XFkType', 0), ('phonePersonalization', 'XPhonePersonalization', 0), ('mtpPreferredOriginatingCodec', 'XSIPCodec', 0), ('outboundCallRollover', 'XOutboundCallRollover', 0), ('mediaTerminationPointRequired', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('requiredDtmfReception', 'boolean', 0), ('rfc2833Disabled', 'boolean', 0), ('speeddials', 'RUniversalDeviceTemplate.speeddials', 0), ('lines', 'RUniversalDeviceTemplate.lines', 0), ('blfDirectedCallParks', 'RUniversalDeviceTemplate.blfDirectedCallParks', 0), ('busyLampFields', 'RUniversalDeviceTemplate.busyLampFields', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('protectedDevice', 'boolean', 0), ('certificateOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('servicesProvisioning', 'XPhoneServiceDisplay', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 0), ('secureShellUser', 'xsd:string', 0), ('secureShellPassword', 'xsd:string', 0), ('userLocale', 'XUserLocale', 0), ('networkLocale', 'XCountry', 0), ('mlppDomain', 'XFkType', 0), ('mlppIndication', 'XStatus', 0), ('mlppPreemption', 'XPreemption', 0), ('doNotDisturb', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndIncomingCallAlert', 'XRingSetting', 0), ('aarGroup', 'XFkType', 0), ('aarCallingSearchSpace', 'XFkType', 0), ('blfPresenceGroup', 'XFkType', 0), ('blfAudibleAlertSettingPhoneBusy', 'XStatus', 0), ('blfAudibleAlertSettingPhoneIdle', 'XStatus', 0), ('userHoldMohAudioSource', 'XInteger', 0), ('networkHoldMohAudioSource', 'XInteger', 0), ('location', 'XFkType', 0), ('geoLocation', 'XFkType', 0), ('deviceMobilityMode', 'XStatus', 0), ('mediaResourceGroupList', 'XFkType', 0), ('remoteDevice', 'boolean', 0), ('hotlineDevice', 'boolean', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('requireOffPremiseLocation', 'boolean', 0), ('ownerUserId', 'XFkType', 0), ('mobilityUserId', 'XFkType', 0), ('joinAcrossLines', 'XStatus', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('singleButtonBarge', 'XBarge', 0), ('builtInBridge', 'XStatus', 0), ('allowControlOfDeviceFromCti', 'boolean', 0), ('ignorePresentationIndicators', 'boolean', 0), ('enableExtensionMobility', 'boolean', 0), ('privacy', 'XStatus', 0), ('loggedIntoHuntGroup', 'boolean', 0), ('proxyServer', 'xsd:string', 0), ('servicesUrl', 'xsd:string', 0), ('idle', 'xsd:string', 0), ('idleTimer', 'XInteger', 0), ('secureDirUrl', 'xsd:string', 0), ('messages', 'xsd:string', 0), ('secureIdleUrl', 'xsd:string', 0), ('authenticationServer', 'xsd:string', 0), ('directory', 'xsd:string', 0), ('secureServicesUrl', 'xsd:string', 0), ('information', 'xsd:string', 0), ('secureMessagesUrl', 'xsd:string', 0), ('secureInformationUrl', 'xsd:string', 0), ('secureAuthenticationUrl', 'xsd:string', 0), ('confidentialAccess', 'RUniversalDeviceTemplate.confidentialAccess', 0), ('services', 'RUniversalDeviceTemplate.services', 0)), frozenset({'uuid'}), None, False),
+    'RUniversalDeviceTemplate.blfDirectedCallParks': ((('blfDirectedCallPark', 'RBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'RUniversalDeviceTemplate.busyLampFields': ((('busyLampField', 'RBusyLampField', 2),), frozenset(), None, False),
+    'RUniversalDeviceTemplate.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RUniversalDeviceTemplate.lines': ((('line', 'RUDTLine', 2), ('lineIdentifier', 'RNumplanIdentifier', 2)), frozenset(), None, False),
+    'RUniversalDeviceTemplate.services': ((('service', 'RSubscribedService', 2),), frozenset(), None, False),
+    'RUniversalDeviceTemplate.speeddials': ((('speeddial', 'RSpeeddial', 2),), frozenset(), None, False),
+    'RUniversalLineTemplate': ((('name', 'xsd:string', 0), ('urgentPriority', 'boolean', 0), ('lineDescription', 'xsd:string', 0), ('routePartition', 'XFkType', 0), ('voiceMailProfile', 'XFkType', 0), ('callingSearchSpace', 'XFkType', 0), ('alertingName', 'xsd:string', 0), ('extCallControlProfile', 'XFkType', 0), ('blfPresenceGroup', 'XFkType', 0), ('callPickupGroup', 'XFkType', 0), ('partyEntranceTone', 'XStatus', 0), ('autoAnswer', 'XAutoAnswer', 0), ('rejectAnonymousCall', 'boolean', 0), ('userHoldMohAudioSource', 'XMOHAudioSourceId', 0), ('networkHoldMohAudioSource', 'XMOHAudioSourceId', 0), ('aarDestinationMask', 'String128', 0), ('aarGroup', 'XFkType', 0), ('retainDestInCallFwdHistory', 'boolean', 0), ('forwardDestAllCalls', 'xsd:string', 0), ('primaryCssForwardingAllCalls', 'XFkType', 0), ('secondaryCssForwardingAllCalls', 'XFkType', 0), ('CssActivationPolicy', 'XCFACSSActivationPolicy', 0), ('fwdDestExtCallsWhenNotRetrieved', 'xsd:string', 0), ('cssFwdExtCallsWhenNotRetrieved', 'XFkType', 0), ('fwdDestInternalCallsWhenNotRetrieved', 'xsd:string', 0), ('cssFwdInternalCallsWhenNotRetrieved', 'XFkType', 0), ('parkMonitorReversionTime', 'XInteger', 0), ('target', 'xsd:string', 0), ('mlppCss', 'XFkType', 0), ('mlppNoAnsRingDuration', 'XInteger', 0), ('confidentialAccess', 'RUniversalLineTemplate.confidentialAccess', 0), ('holdReversionRingDuration', 'XInteger', 0), ('holdReversionNotificationInterval', 'XInteger', 0), ('busyIntCallsDestination', 'xsd:string', 0), ('busyIntCallsCss', 'XFkType', 0), ('busyExtCallsDestination', 'xsd:string', 0), ('busyExtCallsCss', 'XFkType', 0), ('noAnsIntCallsDestination', 'xsd:string', 0), ('noAnsIntCallsCss', 'XFkType', 0), ('noAnsExtCallsDestination', 'xsd:string', 0), ('noAnsExtCallsCss', 'XFkType', 0), ('noCoverageIntCallsDestination', 'xsd:string', 0), ('noCoverageIntCallsCss', 'XFkType', 0), ('noCoverageExtCallsDestination', 'xsd:string', 0), ('noCoverageExtCallsCss', 'XFkType', 0), ('unregisteredIntCallsDestination', 'xsd:string', 0), ('unregisteredIntCallsCss', 'XFkType', 0), ('unregisteredExtCallsDestination', 'xsd:string', 0), ('unregisteredExtCallsCss', 'XFkType', 0), ('ctiFailureDestination', 'xsd:string', 0), ('ctiFailureCss', 'XFkType', 0), ('callControlAgentProfile', 'xsd:string', 0), ('noAnswerRingDuration', 'XInteger', 0), ('enterpriseAltNum', 'RUniversalLineTemplate.enterpriseAltNum', 0), ('e164AltNum', 'RUniversalLineTemplate.e164AltNum', 0), ('advertisedFailoverNumber', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RUniversalLineTemplate.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'RUniversalLineTemplate.e164AltNum': ((('member', 'RE164AltNum', 0),), frozenset(), None, False),
+    'RUniversalLineTemplate.enterpriseAltNum': ((('member', 'REnterpriseAltNum', 0),), frozenset(), None, False),
+    'RUser': ((('firstName', 'xsd:string', 0), ('displayName', 'xsd:string', 0), ('middleName', 'xsd:string', 0), ('lastName', 'xsd:string', 0), ('emMaxLoginTime', 'XInteger', 0), ('userid', 'xsd:string', 0), ('password', 'xsd:string', 0), ('pin', 'xsd:string', 0), ('mailid', 'xsd:string', 0), ('department', 'xsd:string', 0), ('manager', 'xsd:string', 0), ('userLocale', 'XUserLocale', 0), ('associatedDevices', 'RUser.associatedDevices', 0), ('primaryExtension', 'RUser.primaryExtension', 0), ('associatedPc', 'xsd:string', 0), ('associatedGroups', 'RUser.associatedGroups', 0), ('enableCti', 'boolean', 0), ('digestCredentials', 'xsd:string', 0), ('phoneProfiles', 'RUser.phoneProfiles', 0), ('defaultProfile', 'XFkType', 0), ('presenceGroupName', 'XFkType', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 0), ('enableMobility', 'boolean', 0), ('enableMobileVoiceAccess', 'boolean', 0), ('maxDeskPickupWaitTime', 'XInteger', 0), ('remoteDestinationLimit', 'XInteger', 0), ('associatedRemoteDestinationProfiles', 'RUser.associatedRemoteDestinationProfiles', 0), ('passwordCredentials', 'RUser.passwordCredentials', 0), ('pinCredentials', 'RUser.pinCredentials', 0), ('associatedTodAccess', 'RUser.associatedTodAccess', 0), ('status', 'XInteger', 0), ('enableEmcc', 'boolean', 0), ('associatedCapfProfiles', 'RUser.associatedCapfProfiles', 0), ('ctiControlledDeviceProfiles', 'RUser.ctiControlledDeviceProfiles', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('numericUserId', 'xsd:string', 0), ('mlppPassword', 'xsd:string', 0), ('customUserFields', 'RUser.customUserFields', 0), ('homeCluster', 'boolean', 0), ('imAndPresenceEnable', 'boolean', 0), ('serviceProfile', 'XFkType', 0), ('lineAppearanceAssociationForPresences', 'RUser.lineAppearanceAssociationForPresences', 0), ('directoryUri', 'xsd:string', 0), ('telephoneNumber', 'xsd:string', 0), ('title', 'xsd:string', 0), ('mobileNumber', 'xsd:string', 0), ('homeNumber', 'xsd:string', 0), ('pagerNumber', 'xsd:string', 0), ('extensionsInfo', 'RUser.extensionsInfo', 0), ('selfService', 'UniqueString50', 0), ('userProfile', 'XFkType', 0), ('calendarPresence', 'boolean', 0), ('ldapDirectoryName', 'XFkType', 0), ('userIdentity', 'xsd:string', 0), ('nameDialing', 'xsd:string', 0), ('ipccExtension', 'XFkType', 0), ('ipccRoutePartition', 'XFkType', 0), ('convertUserAccount', 'XFkType', 0), ('enableUserToHostConferenceNow', 'boolean', 0), ('attendeesAccessCode', 'xsd:string', 0), ('zeroHop', 'boolean', 0), ('customerName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RUser.associatedCapfProfiles': ((('capfProfileInstanceId', 'String128', 2),), frozenset(), None, False),
+    'RUser.associatedDevices': ((('device', 'String50', 2),), frozenset(), None, False),
+    'RUser.associatedGroups': ((('userGroup', 'RUser.associatedGroups.userGroup', 2),), frozenset(), None, False),
+    'RUser.associatedGroups.userGroup': ((('name', 'String100', 0), ('userRoles', 'RUser.associatedGroups.userGroup.userRoles', 0)), frozenset(), None, False),
+    'RUser.associatedGroups.userGroup.userRoles': ((('userRole', 'String100', 2),), frozenset(), None, False),
+    'RUser.associatedRemoteDestinationProfiles': ((('remoteDestinationProfile', 'xsd:string', 2),), frozenset(), None, False),
+    'RUser.associatedTodAccess': ((('todAccess', 'xsd:string', 2),), frozenset(), None, False),
+    'RUser.ctiControlledDeviceProfiles': ((('profileName', 'XFkType', 2),), frozenset(), None, False),
+    'RUser.customUserFields': ((('customUserField', 'RUserCustomUserField', 2),), frozenset(), None, False),
+    'RUser.extensionsInfo': ((('extension', 'RExtension', 2),), frozenset(), None, False),
+    'RUser.lineAppearanceAssociationForPresences': ((('lineAppearanceAssociationForPresence', 'RLineAppearanceAssociationForPresence', 2),), frozenset(), None, False),
+    'RUser.passwordCredentials': ((('pwdCredPolicyName', 'XFkType', 0), ('pwdCredUserCantChange', 'boolean', 0), ('pwdCredUserMustChange', 'boolean', 0), ('pwdCredDoesNotExpire', 'boolean', 0), ('pwdCredTimeChanged', 'xsd:string', 0), ('pwdCredTimeAdminLockout', 'xsd:string', 0), ('pwdCredLockedByAdministrator', 'boolean', 0), ('pwdResetHackCount', 'boolean', 0)), frozenset(), None, False),
+    'RUser.phoneProfiles': ((('profileName', 'XFkType', 2),), frozenset(), None, False),
+    'RUser.pinCredentials': ((('pinCredPolicyName', 'XFkType', 0), ('pinCredUserCantChange', 'boolean', 0), ('pinCredUserMustChange', 'boolean', 0), ('pinCredDoesNotExpire', 'boolean', 0), ('pinCredTimeChanged', 'boolean', 0), ('pinCredTimeAdminLockout', 'xsd:string', 0), ('pinCredLockedByAdministrator', 'boolean', 0), ('pinResetHackCount', 'boolean', 0)), frozenset(), None, False),
+    'RUser.primaryExtension': ((('pattern', 'String255', 0), ('routePartitionName', 'String50', 0)), frozenset(), None, False),
+    'RUserCustomUserField': ((('name', 'xsd:string', 0), ('value', 'xsd:string', 0)), frozenset(), None, False),
+    'RUserGroup': ((('members', 'RUserGroup.members', 0), ('userRoles', 'RUserGroup.userRoles', 0), ('name', 'UniqueString128', 0)), frozenset({'uuid'}), None, False),
+    'RUserGroup.members': ((('member', 'RUserGroupMember', 2),), frozenset(), None, False),
+    'RUserGroup.userRoles': ((('userRole', 'RUserGroupRoles', 2),), frozenset(), None, False),
+    'RUserGroupMember': ((('userId', 'xsd:string', 0),), frozenset({'uuid'}), None, False),
+    'RUserGroupRoles': ((('roleName', 'XFkType', 0),), frozenset({'uuid'}), None, False),
+    'RUserProfileProvision': ((('name', 'String50', 0), ('description', 'String255', 0), ('deskPhones', 'XFkType', 0), ('mobileDevices', 'XFkType', 0), ('profile', 'XFkType', 0), ('universalLineTemplate', 'XFkType', 0), ('allowProvision', 'boolean', 0), ('limitProvision', 'XInteger', 0), ('defaultUserProfile', 'XFkType', 0), ('enableMra', 'boolean', 0), ('mraPolicy_Desktop', 'XMRAPolicy', 0), ('mraPolicy_Mobile', 'XMRAPolicy', 0), ('allowProvisionEMMaxLoginTime', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RVg224': ((('domainName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('product', 'XProduct', 0), ('protocol', 'XDeviceProtocol', 0), ('callManagerGroupName', 'XFkType', 0), ('units', 'RVg224.units', 0), ('vendorConfig', 'XVendorConfig', 0), ('versionStamp', 'String128', 0)), frozenset({'uuid'}), None, False),
+    'RVg224.units': ((('unit', 'RVg224.units.unit', 0),), frozenset(), None, False),
+    'RVg224.units.unit': ((('index', 'XInteger', 0), ('product', 'XMGCPSlotModule', 0), ('subunits', 'RVg224.units.unit.subunits', 0)), frozenset(), None, False),
+    'RVg224.units.unit.subunits': ((('subunit', 'RVg224.units.unit.subunits.subunit', 0),), frozenset(), None, False),
+    'RVg224.units.unit.subunits.subunit': ((('index', 'XInteger', 0), ('product', 'XMGCPVic', 0), ('beginPort', 'XInteger', 0)), frozenset(), None, False),
+    'RVmPilot': ((('dirn', 'String50', 0), ('cssName', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RVohServer': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('sipTrunkName', 'XFkType', 0), ('defaultVideoStreamId', 'xsd:string', 0)), frozenset({'uuid'}), None, False),
+    'RVoiceMailPilot': ((('dirn', 'String255', 0), ('description', 'String50', 0), ('cssName', 'XFkType', 0), ('isDefault', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RVoiceMailPort': ((('name', 'UniqueString128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('model', 'XModel', 0), ('class', 'XClass', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('securityProfileName', 'XFkType', 0), ('geoLocationName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('dnPattern', 'xsd:string', 0), ('routePartition', 'XFkType', 0), ('dnCallingSearchSpace', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('callerIdDisplay', 'String128', 0), ('callerIdDisplayAscii', 'String50', 0), ('externalMask', 'xsd:string', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'RVoiceMailProfile': ((('name', 'String50', 0), ('description', 'String50', 0), ('isDefault', 'boolean', 0), ('voiceMailboxMask', 'xsd:string', 0), ('voiceMailPilot', 'RVmPilot', 0)), frozenset({'uuid'}), None, False),
+    'RVpnGateway': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('url', 'String255', 0), ('certificates', 'RVpnGateway.certificates', 0)), frozenset({'uuid'}), None, False),
+    'RVpnGateway.certificates': ((('certificate', 'RVpnGatewayMember', 2),), frozenset(), None, False),
+    'RVpnGatewayMember': ((('issuerName', 'String255', 0), ('serialNumber', 'String50', 0)), frozenset({'uuid'}), None, False),
+    'RVpnGroup': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('vpnGateways', 'RVpnGroup.vpnGateways', 0)), frozenset({'uuid'}), None, False),
+    'RVpnGroup.vpnGateways': ((('vpnGateway', 'RVpnGroupMember', 2),), frozenset(), None, False),
+    'RVpnGroupMember': ((('vpnGatewayName', 'XFkType', 0), ('priority', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RVpnProfile': ((('name', 'String50', 0), ('description', 'xsd:string', 0), ('autoNetworkDetection', 'boolean', 0), ('mtu', 'XInteger', 0), ('failToConnect', 'XInteger', 0), ('clientAuthentication', 'XVPNClientAuthentication', 0), ('pwdPersistant', 'boolean', 0), ('enableHostIdCheck', 'boolean', 0)), frozenset({'uuid'}), None, False),
+    'RWLANProfile': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('ssid', 'xsd:string', 0), ('frequencyBand', 'XWiFiFrequency', 0), ('userModifiable', 'XWLANProfileChanges', 0), ('authMethod', 'XWiFiAuthenticationMethod', 0), ('userName', 'xsd:string', 0), ('password', 'xsd:string', 0), ('pskPassphrase', 'xsd:string', 0), ('wepKey', 'xsd:string', 0), ('passwordDescription', 'xsd:string', 0), ('networkAccessProfile', 'XFkType', 0)), frozenset({'uuid'}), None, False),
+    'RWifiHotspot': ((('name', 'UniqueString50', 0), ('description', 'String255', 0), ('ssidPrefix', 'xsd:string', 0), ('userModifiable', 'XWLANProfileChanges', 0), ('frequencyBand', 'XWiFiFrequency', 0), ('authenticationMethod', 'XHotspotAuthenticationMethod', 0), ('hostName', 'String64', 0), ('port', 'XInteger', 0), ('sharedSecret', 'xsd:string', 0), ('pskPassPhrase', 'xsd:string', 0), ('wepKey', 'xsd:string', 0), ('passwordDescription', 'String255', 0)), frozenset({'uuid'}), None, False),
+    'RWirelessAccessPointControllers': ((('name', 'String255', 0), ('description', 'xsd:string', 0), ('snmpVersion', 'XSNMPVersion', 0), ('snmpUserIdOrCommunityString', 'xsd:string', 0), ('snmpAuthenticationProtocol', 'XSNMPAuthenticationProtocol', 0), ('snmpAuthenticationPassword', 'xsd:string', 0), ('snmpPrivacyProtocol', 'XSNMPPrivacyProtocol', 0), ('snmpPrivacyPassword', 'xsd:string', 0), ('syncNow', 'boolean', 0), ('syncStatus', 'XSyncStatus', 0), ('resyncInterval', 'XInteger', 0), ('nextSyncTime', 'XInteger', 0), ('scheduleUnit', 'XScheduleUnit', 0)), frozenset({'uuid'}), None, False),
+    'RWirelessLanProfileGroup': ((('wirelessProfile', 'XFkType', 0), ('index', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'RWlanProfileGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0), ('members', 'RWlanProfileGroup.members', 0)), frozenset({'uuid'}), None, False),
+    'RWlanProfileGroup.members': ((('member', 'RWirelessLanProfileGroup', 2),), frozenset(), None, False),
+    'RemoveAdvertisedPatternsReq': ((('pattern', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveAppServerInfoReq': ((('uuid', 'XUUID', 1),), frozenset({'sequence'}), None, False),
+    'RemoveAppUserReq': ((('userid', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveApplicationServerReq': ((('uuid', 'XUUID', 0),), frozenset({'sequence'}), None, False),
+    'RemoveApplicationUserCapfProfileReq': ((('instanceId', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveBillingServerReq': ((('uuid', 'XUUID', 1),), frozenset({'sequence'}), None, False),
+    'RemoveBlockedLearnedPatternsReq': ((('pattern', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveCCAProfilesReq': ((('ccaId', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveCallParkReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveCallPickupGroupReq': ((('uuid', 'XUUID', 0), ('name', 'xsd:string', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveCalledPartyTracingReq': ((('directorynumber', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveCalledPartyTransformationPatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveCallingPartyTransformationPatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveCcdHostedDNReq': ((('hostedPattern', 'String50', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveCmcInfoReq': ((('code', 'String16', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveConferenceNowReq': ((('uuid', 'XUUID', 0), ('conferenceNowNumber', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveCustomUserFieldReq': ((('field', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveDhcpServerReq': ((('processNodeName', 'XFkType', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveDhcpSubnetReq': ((('uuid', 'XUUID', 0), ('dhcpServerName', 'XFkType', 0), ('subnetIpAddress', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'RemoveDirectedCallParkReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveEndUserCapfProfileReq': ((('instanceId', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveEnterpriseFeatureAccessConfigurationReq': ((('uuid', 'XUUID', 0), ('pattern', 'String16', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveExpresswayCConfigurationReq': ((('HostNameOrIP', 'String255', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveGatewayReq': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveGatewaySubunitsReq': ((('gatewayUuid', 'XUUID', 0), ('domainName', 'xsd:string', 0), ('unit', 'xsd:nonNegativeInteger', 1), ('subunits', 'RemoveGatewaySubunitsReq.subunits', 1)), frozenset({'sequence'}), None, False),
+    'RemoveGatewaySubunitsReq.subunits': ((('subunit', 'RemoveGatewaySubunitsReq.subunits.subunit', 3),), frozenset(), None, False),
+    'RemoveGatewaySubunitsReq.subunits.subunit': ((('index', 'XInteger', 1),), frozenset(), None, False),
+    'RemoveHandoffConfigurationReq': ((('uuid', 'XUUID', 0), ('pattern', 'String16', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveHuntPilotReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveImeEnrolledPatternReq': ((('pattern', 'String16', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveImeExclusionNumberReq': ((('pattern', 'String16', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveImeLearnedRoutesReq': ((('uuid', 'XUUID', 0), ('e164Did', 'String32', 0)), frozenset(), None, False),
+    'RemoveInfrastructureDeviceReq': ((('uuid', 'XUUID', 0),), frozenset({'sequence'}), None, False),
+    'RemoveIpPhoneServicesReq': ((('serviceName', 'UniqueString128', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveIvrUserLocaleReq': ((('userLocale', 'XUserLocale', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveLdapSyncCustomFieldReq': ((('uuid', 'XUUID', 0), ('ldapConfigurationName', 'xsd:string', 0), ('customUserField', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'RemoveLineReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveMeetMeReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveMessageWaitingReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveMlppDomainReq': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveMobileVoiceAccessReq': ((('pattern', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveMohAudioSourceReq': ((('sourceId', 'XMOHAudioSourceId', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemovePhoneActivationCodeReq': ((('activationCode', 'String255', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemovePhoneNtpReq': ((('uuid', 'XUUID', 0), ('ipAddress', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'RemoveRemoteClusterReq': ((('clusterId', 'String255', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveRemoteDestinationReq': ((('destination', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveResourcePriorityNamespaceReq': ((('namespace', 'String10', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveRoutePatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveSNMPCommunityStringReq': ((('CommunityString', 'xsd:string', 1),), frozenset({'sequence'}), None, False),
+    'RemoveSNMPUserReq': ((('User', 'xsd:string', 1),), frozenset({'sequence'}), None, False),
+    'RemoveSafCcdPurgeBlockLearnedRoutesReq': ((('uuid', 'XUUID', 0), ('learnedPattern', 'String50', 0), ('learnedPatternPrefix', 'String50', 0), ('callControlIdentity', 'String50', 0), ('ipAddress', 'String50', 0)), frozenset({'sequence'}), None, False),
+    'RemoveSipRealmReq': ((('realm', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveSipRoutePatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveTransPatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RemoveUnitsToGatewayReq': ((('gatewayUuid', 'XUUID', 0), ('domainName', 'xsd:string', 0), ('units', 'RemoveUnitsToGatewayReq.units', 1)), frozenset({'sequence'}), None, False),
+    'RemoveUnitsToGatewayReq.units': ((('unit', 'RemoveUnitsToGatewayReq.units.unit', 3),), frozenset(), None, False),
+    'RemoveUnitsToGatewayReq.units.unit': ((('index', 'XInteger', 1),), frozenset(), None, False),
+    'RemoveUserReq': ((('userid', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveVg224Req': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RemoveVoiceMailPilotReq': ((('uuid', 'XUUID', 0), ('dirn', 'String255', 4), ('cssName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'ResetDirectedCallParkReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'ResetEnterpriseParametersReq': ((), frozenset(), None, False),
+    'ResetGatewayReq': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'ResetLineReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'ResetResourcePriorityNamespaceReq': ((('namespace', 'String10', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'ResetVg224Req': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RestartEnterpriseParametersReq': ((), frozenset(), None, False),
+    'RestartGatewayReq': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RestartLineReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'RestartResourcePriorityNamespaceReq': ((('namespace', 'String10', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'RestartVg224Req': ((('domainName', 'xsd:string', 0), ('uuid', 'XUUID', 0)), frozenset({'sequence'}), None, False),
+    'StartChangeId': ((), frozenset({'queueId'}), 'xsd:integer', False),
+    'UGatewayEndpointDigitalT1': ((('index', 'XInteger', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 0), ('devicePoolName', 'XFkType', 0), ('commonDeviceConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 0), ('automatedAlternateRoutingCssName', 'XFkType', 0), ('aarNeighborhoodName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 0), ('vendorConfig', 'XVendorConfig', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 0), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 0), ('sendGeoLocation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 0), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('v150', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 0), ('ports', 'UGatewayEndpointDigitalT1.ports', 0), ('trunkSelectionOrder', 'XTrunkSelectionOrder', 0), ('clockReference', 'XClockReference', 0), ('csuParam', 'XCSUParam', 0), ('digitSending', 'XDigitSending', 0), ('pcmType', 'XEncode', 0), ('fdlChannel', 'XFDLChannel', 0), ('yellowAlarm', 'XYellowAlarm', 0), ('zeroSupression', 'XZeroSuppression', 0), ('smdiBasePort', 'XInteger', 0), ('handleDtmfPrecedenceSignals', 'boolean', 0), ('encodeOutboundVoiceRouteClass', 'boolean', 0), ('routeClassSignalling', 'XStatus', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 0), ('confidentialAccess', 'UGatewayEndpointDigitalT1.confidentialAccess', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0)), frozenset({'ctiid', 'uuid'}), None, False),
+    'UGatewayEndpointDigitalT1.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 0), ('confidentialAccessLevel', 'XInteger', 0)), frozenset(), None, False),
+    'UGatewayEndpointDigitalT1.ports': ((('port', 'UT1Port', 2),), frozenset(), None, False),
+    'UT1Port': ((('portNumber', 'XInteger', 0), ('attendantDn', 'String255', 0), ('unattendedPort', 'boolean', 0), ('callerIdDn', 'String255', 0), ('callerIdEnable', 'boolean', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('digitSending', 'XDigitSending', 0), ('expectedDigits', 'XInteger', 0), ('sigDigits', 'UT1Port.sigDigits', 0), ('prefixDn', 'String255', 0), ('presentationBit', 'XPresentationBit', 0), ('silenceSuppressionThreshold', 'XSilenceSuppressionThreshold', 0), ('startDialProtocol', 'XStartDialProtocol', 0), ('trunk', 'XTrunk', 0), ('trunkDirection', 'XTrunkDirection', 0), ('trunkLevel', 'XTrunkLevel', 0), ('trunkPadRx', 'XTrunkPad', 0), ('trunkPadTx', 'XTrunkPad', 0), ('vendorConfig', 'XVendorConfig', 0), ('callerId', 'XCallerID', 0), ('endpointId', 'String128', 0), ('timer1', 'XInteger', 0), ('timer2', 'XInteger', 0), ('timer3', 'XInteger', 0), ('timer4', 'XInteger', 0), ('timer5', 'XInteger', 0), ('timer6', 'XInteger', 0)), frozenset({'uuid'}), None, False),
+    'UT1Port.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'UnassignPresenceUserReq': ((('userid', 'xsd:string', 1),), frozenset({'sequence'}), None, False),
+    'UpdateAarGroupMatrixReq': ((('uuid', 'XUUID', 0), ('aarGroupFromName', 'XFkType', 0), ('aarGroupToName', 'XFkType', 0), ('prefixDigit', 'String255', 0)), frozenset({'sequence'}), None, False),
+    'UpdateAarGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String32', 0)), frozenset({'sequence'}), None, False),
+    'UpdateAdvertisedPatternsReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newPattern', 'xsd:string', 0), ('patternType', 'XGlobalNumber', 0), ('hostedRoutePSTNRule', 'XHostedRoutePatternPSTNRule', 0), ('pstnFailStrip', 'XInteger', 0), ('pstnFailPrepend', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateAnnouncementReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 4), ('announcementFile', 'xsd:string', 4)), frozenset({'sequence'}), None, False),
+    'UpdateAnnunciatorReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'XFkType', 4), ('locationName', 'XFkType', 0), ('useTrustedRelayPoint', 'XStatus', 0)), frozenset({'sequence'}), None, False),
+    'UpdateAppServerInfoReq': ((('uuid', 'XUUID', 0), ('appServerName', 'XFkType', 0), ('appServerContent', 'XAppServerContent', 0), ('content', 'XContent', 4)), frozenset({'sequence'}), None, False),
+    'UpdateAppUserReq': ((('uuid', 'XUUID', 0), ('userid', 'xsd:string', 0), ('newUserid', 'xsd:string', 0), ('password', 'xsd:string', 0), ('passwordCredentials', 'UpdateAppUserReq.passwordCredentials', 0), ('digestCredentials', 'xsd:string', 0), ('presenceGroupName', 'XFkType', 0), ('acceptPresenceSubscription', 'boolean', 0), ('acceptOutOfDialogRefer', 'boolean', 0), ('acceptUnsolicitedNotification', 'boolean', 0), ('allowReplaceHeader', 'boolean', 0), ('associatedDevices', 'UpdateAppUserReq.associatedDevices', 0), ('associatedGroups', 'UpdateAppUserReq.associatedGroups', 0), ('ctiControlledDeviceProfiles', 'UpdateAppUserReq.ctiControlledDeviceProfiles', 0)), frozenset({'sequence'}), None, False),
+    'UpdateAppUserReq.associatedDevices': ((('device', 'String50', 2),), frozenset(), None, False),
+    'UpdateAppUserReq.associatedGroups': ((('userGroup', 'UpdateAppUserReq.associatedGroups.userGroup', 2),), frozenset(), None, False),
+    'UpdateAppUserReq.associatedGroups.userGroup': ((('name', 'String100', 1), ('userRoles', 'UpdateAppUserReq.associatedGroups.userGroup.userRoles', 0)), frozenset(), None, False),
+    'UpdateAppUserReq.associatedGroups.userGroup.userRoles': ((('userRole', 'String100', 2),), frozenset(), None, False),
+    'UpdateAppUserReq.ctiControlledDeviceProfiles': ((('deviceProfile', 'String50', 2),), frozenset(), None, False),
+    'UpdateAppUserReq.passwordCredentials': ((('pwdCredPolicyName', 'XFkType', 0), ('pwdCredUserCantChange', 'boolean', 0), ('pwdCredUserMustChange', 'boolean', 0), ('pwdCredDoesNotExpire', 'boolean', 0), ('pwdCredTimeChanged', 'xsd:string', 0), ('pwdCredTimeAdminLockout', 'xsd:string', 4), ('pwdCredLockedByAdministrator', 'boolean', 0), ('pwdResetHackCount', 'boolean', 0)), frozenset(), None, False),
+    'UpdateApplicationDialRulesReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('numberBeginWith', 'xsd:string', 0), ('numberOfDigits', 'XInteger', 0), ('digitsToBeRemoved', 'XInteger', 0), ('prefixPattern', 'xsd:string', 0), ('priority', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateApplicationServerReq': ((('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('ipAddress', 'xsd:string', 0), ('removeAppUsers', 'UpdateApplicationServerReq.removeAppUsers', 0), ('addAppUsers', 'UpdateApplicationServerReq.addAppUsers', 0), ('appUsers', 'UpdateApplicationServerReq.appUsers', 0), ('url', 'xsd:string', 0), ('endUserUrl', 'xsd:string', 0), ('processNodeName', 'XFkType', 4), ('removeEndUsers', 'UpdateApplicationServerReq.removeEndUsers', 0), ('addEndUsers', 'UpdateApplicationServerReq.addEndUsers', 0), ('endUsers', 'UpdateApplicationServerReq.endUsers', 0)), frozenset({'sequence'}), None, False),
+    'UpdateApplicationServerReq.addAppUsers': ((('selectedAppUser', 'UpdateApplicationServerReq.addAppUsers.selectedAppUser', 3),), frozenset(), None, False),
+    'UpdateApplicationServerReq.addAppUsers.selectedAppUser': ((('appUserName', 'XFkType', 1), ('content', 'XContent', 4)), frozenset(), None, False),
+    'UpdateApplicationServerReq.addEndUsers': ((('selectedEndUser', 'UpdateApplicationServerReq.addEndUsers.selectedEndUser', 3),), frozenset(), None, False),
+    'UpdateApplicationServerReq.addEndUsers.selectedEndUser': ((('endUserName', 'XFkType', 1), ('content', 'XContent', 4)), frozenset(), None, False),
+    'UpdateApplicationServerReq.appUsers': ((('selectedAppUser', 'UpdateApplicationServerReq.appUsers.selectedAppUser', 3),), frozenset(), None, False),
+    'UpdateApplicationServerReq.appUsers.selectedAppUser': ((('appUserName', 'XFkType', 1), ('content', 'XContent', 4)), frozenset(), None, False),
+    'UpdateApplicationServerReq.endUsers': ((('selectedEndUser', 'UpdateApplicationServerReq.endUsers.selectedEndUser', 3),), frozenset(), None, False),
+    'UpdateApplicationServerReq.endUsers.selectedEndUser': ((('endUserName', 'XFkType', 1), ('content', 'XContent', 4)), frozenset(), None, False),
+    'UpdateApplicationServerReq.removeAppUsers': ((('selectedAppUser', 'UpdateApplicationServerReq.removeAppUsers.selectedAppUser', 3),), frozenset(), None, False),
+    'UpdateApplicationServerReq.removeAppUsers.selectedAppUser': ((('appUserName', 'XFkType', 1), ('content', 'XContent', 4)), frozenset(), None, False),
+    'UpdateApplicationServerReq.removeEndUsers': ((('selectedEndUser', 'UpdateApplicationServerReq.removeEndUsers.selectedEndUser', 3),), frozenset(), None, False),
+    'UpdateApplicationServerReq.removeEndUsers.selectedEndUser': ((('endUserName', 'XFkType', 1), ('content', 'XContent', 4)), frozenset(), None, False),
+    'UpdateApplicationUserCapfProfileReq': ((('uuid', 'XUUID', 0), ('instanceId', 'xsd:string', 0), ('certificateOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('operationCompletion', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateAudioCodecPreferenceListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('codecsInList', 'UpdateAudioCodecPreferenceListReq.codecsInList', 0)), frozenset({'sequence'}), None, False),
+    'UpdateAudioCodecPreferenceListReq.codecsInList': ((('codecNames', 'xsd:string', 3),), frozenset(), None, False),
+    'UpdateBillingServerReq': ((('uuid', 'XUUID', 1), ('userId', 'xsd:string', 0), ('password', 'xsd:string', 0), ('resendOnFailure', 'boolean', 0), ('billingServerProtocol', 'XBillingserverprotocol', 0)), frozenset({'sequence'}), None, False),
+    'UpdateBlockedLearnedPatternsReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newPattern', 'xsd:string', 0), ('prefix', 'xsd:string', 0), ('clusterId', 'xsd:string', 0), ('patternType', 'XGlobalNumber', 4)), frozenset({'sequence'}), None, False),
+    'UpdateCCAProfilesReq': ((('uuid', 'XUUID', 0), ('ccaId', 'xsd:string', 0), ('newCcaId', 'xsd:string', 0), ('primarySoftSwitchId', 'xsd:string', 0), ('secondarySoftSwitchId', 'xsd:string', 4), ('objectClass', 'xsd:string', 0), ('subscriberType', 'xsd:string', 4), ('sipAliasSuffix', 'xsd:string', 4), ('sipUserNameSuffix', 'xsd:string', 4)), frozenset({'sequence'}), None, False),
+    'UpdateCallManagerGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('tftpDefault', 'boolean', 0), ('removeMembers', 'UpdateCallManagerGroupReq.removeMembers', 0), ('addMembers', 'UpdateCallManagerGroupReq.addMembers', 0), ('members', 'UpdateCallManagerGroupReq.members', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCallManagerGroupReq.addMembers': ((('member', 'XCallManagerMember', 3),), frozenset(), None, False),
+    'UpdateCallManagerGroupReq.members': ((('member', 'XCallManagerMember', 3),), frozenset(), None, False),
+    'UpdateCallManagerGroupReq.removeMembers': ((('member', 'XCallManagerMember', 3),), frozenset(), None, False),
+    'UpdateCallManagerReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'String50', 0), ('autoRegistration', 'UpdateCallManagerReq.autoRegistration', 0), ('ports', 'UpdateCallManagerReq.ports', 0), ('lbmGroup', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateCallManagerReq.autoRegistration': ((('startDn', 'String255', 0), ('endDn', 'String255', 0), ('nextDn', 'String255', 0), ('routePartitionName', 'XFkType', 4), ('e164Mask', 'String50', 4), ('autoRegistrationEnabled', 'boolean', 0), ('universalDeviceTemplate', 'XFkType', 0), ('lineTemplate', 'XFkType', 0)), frozenset(), None, False),
+    'UpdateCallManagerReq.ports': ((('ethernetPhonePort', 'XInteger', 1), ('mgcpPorts', 'UpdateCallManagerReq.ports.mgcpPorts', 1), ('sipPorts', 'UpdateCallManagerReq.ports.sipPorts', 1)), frozenset(), None, False),
+    'UpdateCallManagerReq.ports.mgcpPorts': ((('listen', 'XInteger', 1), ('keepAlive', 'XInteger', 1)), frozenset(), None, False),
+    'UpdateCallManagerReq.ports.sipPorts': ((('sipPhonePort', 'XInteger', 1), ('sipPhoneSecurePort', 'XInteger', 1), ('sipOAuthPort', 'XInteger', 1), ('sipOAuthMRAPort', 'XInteger', 1)), frozenset(), None, False),
+    'UpdateCallParkReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('callManagerName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateCallPickupGroupReq': ((('uuid', 'XUUID', 0), ('name', 'xsd:Name', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('removeMembers', 'UpdateCallPickupGroupReq.removeMembers', 0), ('addMembers', 'UpdateCallPickupGroupReq.addMembers', 0), ('members', 'UpdateCallPickupGroupReq.members', 0), ('pickupNotification', 'XPickupNotification', 0), ('pickupNotificationTimer', 'XInteger', 0), ('callInfoForPickupNotification', 'UpdateCallPickupGroupReq.callInfoForPickupNotification', 0), ('newName', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCallPickupGroupReq.addMembers': ((('member', 'XPickupGroupMember', 2),), frozenset(), None, False),
+    'UpdateCallPickupGroupReq.callInfoForPickupNotification': ((('callingPartyInfo', 'boolean', 0), ('calledPartyInfo', 'boolean', 0)), frozenset(), None, False),
+    'UpdateCallPickupGroupReq.members': ((('member', 'XPickupGroupMember', 2),), frozenset(), None, False),
+    'UpdateCallPickupGroupReq.removeMembers': ((('member', 'XPickupGroupMember', 2),), frozenset(), None, False),
+    'UpdateCalledPartyTransformationPatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('calledPartyTransformationMask', 'xsd:string', 4), ('newDialPlanName', 'XFkType', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('newRouteFilterName', 'XFkType', 4), ('calledPartyPrefixDigits', 'xsd:string', 4), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('mlppPreemptionDisabled', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCallerFilterListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'String128', 0), ('removeMembers', 'UpdateCallerFilterListReq.removeMembers', 0), ('addMembers', 'UpdateCallerFilterListReq.addMembers', 0), ('members', 'UpdateCallerFilterListReq.members', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCallerFilterListReq.addMembers': ((('member', 'XCallerFilterListMember', 3),), frozenset(), None, False),
+    'UpdateCallerFilterListReq.members': ((('member', 'XCallerFilterListMember', 3),), frozenset(), None, False),
+    'UpdateCallerFilterListReq.removeMembers': ((('member', 'XCallerFilterListMember', 3),), frozenset(), None, False),
+    'UpdateCallingPartyTransformationPatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('callingPartyTransformationMask', 'xsd:string', 4), ('useCallingPartyPhoneMask', 'XStatus', 0), ('newDialPlanName', 'XFkType', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('callingPartyPrefixDigits', 'String50', 4), ('newRouteFilterName', 'XFkType', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('mlppPreemptionDisabled', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCcdAdvertisingServiceReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'String50', 0), ('isActivated', 'boolean', 0), ('hostDnGroup', 'XFkType', 0), ('safSipTrunk', 'XFkType', 4), ('safH323Trunk', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateCcdFeatureConfigReq': ((('ccdParam', 'RCcdParam', 3),), frozenset({'sequence'}), None, False),
+    'UpdateCcdHostedDNGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String255', 0), ('description', 'String255', 0), ('pstnFailoverStripDigits', 'XInteger', 4), ('pstnFailoverPrependDigits', 'String255', 0), ('usePstnFailover', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCcdHostedDNReq': ((('uuid', 'XUUID', 0), ('hostedPattern', 'String50', 0), ('newHostedPattern', 'String50', 0), ('description', 'String255', 0), ('CcdHostedDnGroup', 'XFkType', 0), ('pstnFailoverStripDigits', 'XInteger', 4), ('pstnFailoverPrependDigits', 'String255', 0), ('usePstnFailover', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCcdRequestingServiceReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'String50', 0), ('isActivated', 'boolean', 0), ('routePartitionName', 'XFkType', 4), ('learnedPatternPrefix', 'String50', 0), ('pstnPrefix', 'String50', 0), ('removeAssociatedTrunks', 'UpdateCcdRequestingServiceReq.removeAssociatedTrunks', 0), ('addAssociatedTrunks', 'UpdateCcdRequestingServiceReq.addAssociatedTrunks', 0), ('associatedTrunks', 'UpdateCcdRequestingServiceReq.associatedTrunks', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCcdRequestingServiceReq.addAssociatedTrunks': ((('associatedTrunk', 'XCcdRequestingServiceMember', 3),), frozenset(), None, False),
+    'UpdateCcdRequestingServiceReq.associatedTrunks': ((('associatedTrunk', 'XCcdRequestingServiceMember', 3),), frozenset(), None, False),
+    'UpdateCcdRequestingServiceReq.removeAssociatedTrunks': ((('associatedTrunk', 'XCcdRequestingServiceMember', 3),), frozenset(), None, False),
+    'UpdateCiscoCatalyst600024PortFXSGatewayReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocale', 'XCountry', 4), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('ports', 'UpdateCiscoCatalyst600024PortFXSGatewayReq.ports', 0), ('portSelectionOrder', 'XTrunkSelectionOrder', 0), ('transmitUtf8', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateCiscoCatalyst600024PortFXSGatewayReq.ports': ((('port', 'XAnalogPort', 3),), frozenset(), None, False),
+    'UpdateCiscoCatalyst6000E1VoIPGatewayReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('networkLocale', 'XCountry', 4), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 4), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('redirectInboundNumberIe', 'boolean', 0), ('calledPlan', 'XNumberingPlan', 0), ('calledPri', 'XPriOfNumber', 0), ('callerIdDn', 'String255', 4), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingPlan', 'XNumberingPlan', 0), ('callingPri', 'XPriOfNumber', 0), ('chanIe', 'XPRIChanIE', 0), ('clockReference', 'XClockReference', 0), ('dChannelEnable', 'boolean', 0), ('channelSelectionOrder', 'XTrunkSelectionOrder', 0), ('displayIE', 'boolean', 0), ('pcmType', 'XEncode', 0), ('csuParam', 'XCSUParam', 0), ('firstDelay', 'XInteger', 0), ('interfaceIdPresent', 'boolean', 0), ('interfaceId', 'XInteger', 0), ('intraDelay', 'XInteger', 0), ('mcdnEnable', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('numDigitsToStrip', 'XInteger', 0), ('passingPrecedenceLevelThrough', 'boolean', 0), ('prefix', 'xsd:string', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('connectedLineIdPresentation', 'XPresentationBit', 0), ('priProtocol', 'XPriProtocol', 0), ('securityAccessLevel', 'XInteger', 0), ('sendCallingNameInFacilityIe', 'boolean', 0), ('sendExLeadingCharInDispIe', 'boolean', 0), ('sendRestart', 'boolean', 0), ('setupNonIsdnPi', 'boolean', 0), ('sigDigits', 'UpdateCiscoCatalyst6000E1VoIPGatewayReq.sigDigits', 0), ('span', 'XInteger', 0), ('statusPoll', 'boolean', 0), ('smdiBasePort', 'XInteger', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('transmitUtf8', 'boolean', 0), ('v150', 'boolean', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('QSIGVariant', 'XQSIGVariant', 0), ('unattendedPort', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('geoLocationFilterName', 'XFkType', 4), ('nationalStripDigits', 'XInteger', 4), ('internationalStripDigits', 'XInteger', 4), ('unknownStripDigits', 'XInteger', 4), ('subscriberStripDigits', 'XInteger', 4), ('nationalTransformationCssName', 'XFkType', 4), ('internationalTransformationCssName', 'XFkType', 4), ('unknownTransformationCssName', 'XFkType', 4), ('subscriberTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateCiscoCatalyst6000E1VoIPGatewayReq.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'UpdateCiscoCatalyst6000T1VoIPGatewayPriReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('networkLocale', 'XCountry', 4), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('mlppPreemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('redirectInboundNumberIe', 'boolean', 0), ('calledPlan', 'XNumberingPlan', 0), ('calledPri', 'XPriOfNumber', 0), ('callerIdDn', 'String255', 4), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingPlan', 'XNumberingPlan', 0), ('callingPri', 'XPriOfNumber', 0), ('chanIe', 'XPRIChanIE', 0), ('clockReference', 'XClockReference', 0), ('dChannelEnable', 'boolean', 0), ('channelSelectionOrder', 'XTrunkSelectionOrder', 0), ('displayIE', 'boolean', 0), ('pcmType', 'XEncode', 0), ('csuParam', 'XCSUParam', 0), ('firstDelay', 'XInteger', 0), ('interfaceIdPresent', 'boolean', 0), ('interfaceId', 'XInteger', 0), ('intraDelay', 'XInteger', 0), ('mcdnEnable', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('numDigitsToStrip', 'XInteger', 0), ('passingPrecedenceLevelThrough', 'boolean', 0), ('prefix', 'xsd:string', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('connectedLineIdPresentation', 'XPresentationBit', 0), ('priProtocol', 'XPriProtocol', 0), ('securityAccessLevel', 'XInteger', 0), ('sendCallingNameInFacilityIe', 'boolean', 0), ('sendExLeadingCharInDispIe', 'boolean', 0), ('sendRestart', 'boolean', 0), ('setupNonIsdnPi', 'boolean', 0), ('sigDigits', 'UpdateCiscoCatalyst6000T1VoIPGatewayPriReq.sigDigits', 0), ('span', 'XInteger', 0), ('statusPoll', 'boolean', 0), ('smdiBasePort', 'XInteger', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('transmitUtf8', 'boolean', 0), ('v150', 'boolean', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('QSIGVariant', 'XQSIGVariant', 0), ('unattendedPort', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('geoLocationFilterName', 'XFkType', 4), ('nationalStripDigits', 'XInteger', 4), ('internationalStripDigits', 'XInteger', 4), ('unknownStripDigits', 'XInteger', 4), ('subscriberStripDigits', 'XInteger', 4), ('nationalTransformationCssName', 'XFkType', 4), ('internationalTransformationCssName', 'XFkType', 4), ('unknownTransformationCssName', 'XFkType', 4), ('subscriberTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateCiscoCatalyst6000T1VoIPGatewayPriReq.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'UpdateCiscoCatalyst6000T1VoIPGatewayT1Req': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('sendGeoLocation', 'boolean', 0), ('ports', 'UpdateCiscoCatalyst6000T1VoIPGatewayT1Req.ports', 0), ('trunkSelectionOrder', 'XTrunkSelectionOrder', 0), ('clockReference', 'XClockReference', 0), ('csuParam', 'XCSUParam', 0), ('digitSending', 'XDigitSending', 0), ('pcmType', 'XEncode', 0), ('fdlChannel', 'XFDLChannel', 0), ('yellowAlarm', 'XYellowAlarm', 0), ('zeroSupression', 'XZeroSuppression', 0), ('smdiBasePort', 'XInteger', 0), ('handleDtmfPrecedenceSignals', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 4), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateCiscoCatalyst6000T1VoIPGatewayT1Req.ports': ((('port', 'XT1Port', 3),), frozenset(), None, False),
+    'UpdateCiscoCloudOnboardingReq': ((('uuid', 'XUUID', 0), ('voucherExists', 'boolean', 0), ('enablePushNotifications', 'boolean', 0), ('enableHttpProxy', 'boolean', 0), ('httpProxyAddress', 'xsd:string', 0), ('proxyUsername', 'xsd:string', 0), ('proxyPassword', 'xsd:string', 0), ('enableTrustCACertificate', 'boolean', 0), ('allowAnalyticsCollection', 'boolean', 0), ('enableTroubleshooting', 'boolean', 0), ('alarmSendEncryptedData', 'boolean', 0), ('orgId', 'xsd:string', 0), ('alarmPushIntervalSecs', 'XInteger', 0), ('alarmEncryptKey', 'xsd:string', 0), ('serviceAddress', 'xsd:string', 0), ('onboardingRegistrationStatus', 'XOnboardingRegistrationStatus', 0), ('email', 'xsd:string', 0), ('partnerEmail', 'xsd:string', 0), ('orgName', 'xsd:string', 0), ('customerOneTimePassword', 'xsd:string', 0), ('alarmSeverity', 'XAlarmSeverity', 0), ('alarmPushNowToggle', 'XInteger', 0), ('enableGDSCommunication', 'boolean', 0), ('mraActivationDomain', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCmcInfoReq': ((('uuid', 'XUUID', 0), ('code', 'String16', 0), ('newCode', 'String16', 0), ('description', 'String50', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCommonDeviceConfigReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString50', 0), ('softkeyTemplateName', 'XFkType', 4), ('userLocale', 'XUserLocale', 4), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('useTrustedRelayPoint', 'boolean', 0), ('preemption', 'XPreemption', 0), ('ipAddressingMode', 'XIPAddressingMode', 0), ('ipAddressingModePreferenceControl', 'XIPAddressingModePrefControl', 0), ('allowAutoConfigurationForPhones', 'XStatus', 0), ('useImeForOutboundCalls', 'XStatus', 0), ('confidentialAccess', 'UpdateCommonDeviceConfigReq.confidentialAccess', 0), ('allowDuplicateAddressDetection', 'XStatus', 0), ('acceptRedirectMessages', 'XStatus', 0), ('replyMulticastEchoRequest', 'XStatus', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCommonDeviceConfigReq.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'UpdateCommonPhoneConfigReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString50', 0), ('description', 'String128', 0), ('unlockPwd', 'String50', 0), ('dndOption', 'XDNDOption', 0), ('dndAlertingType', 'XRingSetting', 0), ('backgroundImage', 'boolean', 0), ('phonePersonalization', 'XPhonePersonalization', 0), ('phoneServiceDisplay', 'XPhoneServiceDisplay', 0), ('sshUserId', 'String50', 0), ('sshPwd', 'String255', 0), ('vendorConfig', 'XVendorConfig', 4), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('vpnGroupName', 'XFkType', 4), ('vpnProfileName', 'XFkType', 4), ('featureControlPolicy', 'XFkType', 4), ('wifiHotspotProfile', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateConferenceBridgeReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueName128', 0), ('description', 'String128', 0), ('product', 'XProduct', 0), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('locationName', 'XFkType', 0), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('maximumCapacity', 'XInteger', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('securityProfileName', 'XFkType', 4), ('destinationAddress', 'xsd:string', 0), ('mcuConferenceBridgeSipPort', 'XInteger', 0), ('sipProfile', 'XFkType', 4), ('srtpAllowed', 'boolean', 0), ('normalizationScript', 'XFkType', 4), ('enableTrace', 'boolean', 0), ('normalizationScriptInfos', 'UpdateConferenceBridgeReq.normalizationScriptInfos', 0), ('userName', 'xsd:string', 0), ('password', 'xsd:string', 0), ('httpPort', 'XInteger', 0), ('useHttps', 'boolean', 0), ('addresses', 'UpdateConferenceBridgeReq.addresses', 0), ('conferenceBridgePrefix', 'xsd:string', 4), ('allowCFBControlOfCallSecurityIcon', 'boolean', 4), ('overrideSIPTrunkAddress', 'boolean', 4), ('sipTrunkName', 'XFkType', 0)), frozenset({'sequence'}), None, False),
+    'UpdateConferenceBridgeReq.addresses': ((('address', 'xsd:string', 2),), frozenset(), None, False),
+    'UpdateConferenceBridgeReq.normalizationScriptInfos': ((('normalizationScriptInfo', 'XNormalizationScriptInfo', 2),), frozenset(), None, False),
+    'UpdateConferenceNowReq': ((('uuid', 'XUUID', 0), ('conferenceNowNumber', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('newConferenceNowNumber', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('description', 'xsd:string', 0), ('maxWaitTimeForHost', 'XInteger', 0), ('MohAudioSourceId', 'XMOHAudioSourceId', 4)), frozenset({'sequence'}), None, False),
+    'UpdateCredentialPolicyDefaultReq': ((('credentialUser', 'XCredentialUser', 1), ('credentialType', 'XCredential', 1), ('credPolicyName', 'XFkType', 1), ('newCredPolicyName', 'XFkType', 0), ('credentials', 'xsd:string', 4), ('confirmCredentials', 'xsd:string', 0), ('credUserCantChange', 'boolean', 0), ('credUserMustChange', 'boolean', 0), ('credDoesNotExpire', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCredentialPolicyReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String255', 0), ('failedLogon', 'XInteger', 0), ('resetFailedLogonAttempts', 'XInteger', 0), ('lockoutDuration', 'XInteger', 0), ('credChangeDuration', 'XInteger', 0), ('credExpiresAfter', 'XInteger', 0), ('minCredLength', 'XInteger', 0), ('prevCredStoredNum', 'XInteger', 0), ('inactiveDaysAllowed', 'XInteger', 0), ('expiryWarningDays', 'XInteger', 0), ('trivialCredCheck', 'boolean', 0), ('minCharsToChange', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCssReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('description', 'String50', 0), ('removeMembers', 'UpdateCssReq.removeMembers', 0), ('addMembers', 'UpdateCssReq.addMembers', 0), ('members', 'UpdateCssReq.members', 0), ('newName', 'UniqueString50', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCssReq.addMembers': ((('member', 'XCallingSearchSpaceMember', 2),), frozenset(), None, False),
+    'UpdateCssReq.members': ((('member', 'XCallingSearchSpaceMember', 2),), frozenset(), None, False),
+    'UpdateCssReq.removeMembers': ((('member', 'XCallingSearchSpaceMember', 2),), frozenset(), None, False),
+    'UpdateCtiRoutePointReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('protocol', 'XDeviceProtocol', 0), ('protocolSide', 'XProtocolSide', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 4), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('userLocale', 'XUserLocale', 4), ('lines', 'UpdateCtiRoutePointReq.lines', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCtiRoutePointReq.lines': ((('line', 'XPhoneLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'UpdateCumaServerSecurityProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 4), ('securityMode', 'XDeviceSecurityMode', 4), ('transportType', 'XTransport', 0), ('x509SubjectName', 'xsd:string', 0), ('serverIpHostName', 'String255', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCustomUserFieldReq': ((('uuid', 'XUUID', 0), ('field', 'xsd:string', 0), ('newField', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateCustomerReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateDateTimeGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('timeZone', 'XTimeZone', 0), ('separator', 'xsd:string', 0), ('dateformat', 'xsd:string', 0), ('timeFormat', 'xsd:string', 0), ('removePhoneNtpReferences', 'UpdateDateTimeGroupReq.removePhoneNtpReferences', 0), ('addPhoneNtpReferences', 'UpdateDateTimeGroupReq.addPhoneNtpReferences', 0), ('phoneNtpReferences', 'UpdateDateTimeGroupReq.phoneNtpReferences', 0)), frozenset({'sequence'}), None, False),
+    'UpdateDateTimeGroupReq.addPhoneNtpReferences': ((('selectedPhoneNtpReference', 'XDateTimeGroupNtpReference', 3),), frozenset(), None, False),
+    'UpdateDateTimeGroupReq.phoneNtpReferences': ((('selectedPhoneNtpReference', 'XDateTimeGroupNtpReference', 3),), frozenset(), None, False),
+    'UpdateDateTimeGroupReq.removePhoneNtpReferences': ((('selectedPhoneNtpReference', 'XDateTimeGroupNtpReference', 3),), frozenset(), None, False),
+    'UpdateDefaultDeviceProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('description', 'String255', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userLocale', 'XUserLocale', 4), ('phoneButtonTemplate', 'XFkType', 4), ('softkeyTemplate', 'XFkType', 4), ('privacy', 'XStatus', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('ignorePi', 'boolean', 0), ('dndStatus', 'boolean', 0), ('dndRingSetting', 'XRingSetting', 4), ('dndOption', 'XDNDOption', 0), ('mlppDomainId', 'String128', 4), ('mlppIndication', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('emccCallingSearchSpace', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateDeviceDefaultsReq': ((('uuid', 'XUUID', 0), ('Model', 'XModel', 0), ('Protocol', 'XDeviceProtocol', 0), ('LoadInformation', 'XLoadInformation', 0), ('InactiveLoadInformation', 'XLoadInformation', 0), ('DevicePoolName', 'XFkType', 4), ('PhoneButtonTemplate', 'XFkType', 4), ('VersionStamp', 'String128', 4), ('PreferActCodeOverAutoReg', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateDeviceMobilityGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateDeviceMobilityReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('subNetDetails', 'UpdateDeviceMobilityReq.subNetDetails', 0), ('removeMembers', 'UpdateDeviceMobilityReq.removeMembers', 0), ('addMembers', 'UpdateDeviceMobilityReq.addMembers', 0), ('members', 'UpdateDeviceMobilityReq.members', 0)), frozenset({'sequence'}), None, False),
+    'UpdateDeviceMobilityReq.addMembers': ((('member', 'XDevicePoolDeviceMobility', 3),), frozenset(), None, False),
+    'UpdateDeviceMobilityReq.members': ((('member', 'XDevicePoolDeviceMobility', 3),), frozenset(), None, False),
+    'UpdateDeviceMobilityReq.removeMembers': ((('member', 'XDevicePoolDeviceMobility', 3),), frozenset(), None, False),
+    'UpdateDeviceMobilityReq.subNetDetails': ((('ipv4SubNetDetails', 'UpdateDeviceMobilityReq.subNetDetails.ipv4SubNetDetails', 0), ('ipv6SubNetDetails', 'UpdateDeviceMobilityReq.subNetDetails.ipv6SubNetDetails', 0)), frozenset(), None, False),
+    'UpdateDeviceMobilityReq.subNetDetails.ipv4SubNetDetails': ((('ipv4Subnet', 'xsd:string', 1), ('ipv4SubNetMaskSz', 'XInteger', 1)), frozenset(), None, False),
+    'UpdateDeviceMobilityReq.subNetDetails.ipv6SubNetDetails': ((('ipv6Subnet', 'xsd:string', 1), ('ipv6SubNetMaskSz', 'XInteger', 1)), frozenset(), None, False),
+    'UpdateDevicePoolReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString50', 0), ('autoSearchSpaceName', 'XFkType', 4), ('dateTimeSettingName', 'XFkType', 0), ('callManagerGroupName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 4), ('regionName', 'XFkType', 0), ('networkLocale', 'XCountry', 4), ('srstName', 'XFkType', 0), ('connectionMonitorDuration', 'XInteger', 0), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('locationName', 'XFkType', 4), ('mobilityCssName', 'XFkType', 4), ('physicalLocationName', 'XFkType', 4), ('deviceMobilityGroupName', 'XFkType', 4), ('revertPriority', 'XRevertPriority', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('cdpnTransformationCssName', 'XFkType', 4), ('localRouteGroupName', 'XFkType', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('callingPartyNationalPrefix', 'String16', 0), ('callingPartyInternationalPrefix', 'String16', 0), ('callingPartyUnknownPrefix', 'String16', 0), ('callingPartySubscriberPrefix', 'String16', 0), ('adjunctCallingSearchSpace', 'XFkType', 4), ('callingPartyNationalStripDigits', 'XInteger', 4), ('callingPartyInternationalStripDigits', 'XInteger', 4), ('callingPartyUnknownStripDigits', 'XInteger', 4), ('callingPartySubscriberStripDigits', 'XInteger', 4), ('callingPartyNationalTransformationCssName', 'XFkType', 4), ('callingPartyInternationalTransformationCssName', 'XFkType', 4), ('callingPartyUnknownTransformationCssName', 'XFkType', 4), ('callingPartySubscriberTransformationCssName', 'XFkType', 4), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 4), ('calledPartyInternationalStripDigits', 'XInteger', 4), ('calledPartyUnknownStripDigits', 'XInteger', 4), ('calledPartySubscriberStripDigits', 'XInteger', 4), ('calledPartyNationalTransformationCssName', 'XFkType', 4), ('calledPartyInternationalTransformationCssName', 'XFkType', 4), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('calledPartySubscriberTransformationCssName', 'XFkType', 4), ('imeEnrolledPatternGroupName', 'XFkType', 4), ('cntdPnTransformationCssName', 'XFkType', 4), ('localRouteGroup', 'UpdateDevicePoolReq.localRouteGroup', 2), ('redirectingPartyTransformationCSS', 'XFkType', 4), ('callingPartyTransformationCSS', 'XFkType', 4), ('wirelessLanProfileGroup', 'XFkType', 4), ('elinGroup', 'XFkType', 4), ('mraServiceDomain', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateDevicePoolReq.localRouteGroup': ((('name', 'xsd:string', 4), ('value', 'xsd:string', 0)), frozenset(), None, False),
+    'UpdateDeviceProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('lines', 'UpdateDeviceProfileReq.lines', 0), ('phoneTemplateName', 'XFkType', 0), ('speeddials', 'UpdateDeviceProfileReq.speeddials', 0), ('busyLampFields', 'UpdateDeviceProfileReq.busyLampFields', 0), ('blfDirectedCallParks', 'UpdateDeviceProfileReq.blfDirectedCallParks', 0), ('addOnModules', 'UpdateDeviceProfileReq.addOnModules', 0), ('userLocale', 'XUserLocale', 4), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('loginUserId', 'XFkType', 4), ('ignorePresentationIndicators', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndRingSetting', 'XRingSetting', 4), ('dndStatus', 'boolean', 0), ('emccCallingSearchSpace', 'XFkType', 4), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('softkeyTemplateName', 'XFkType', 4), ('callInfoPrivacyStatus', 'XStatus', 0), ('services', 'UpdateDeviceProfileReq.services', 0), ('featureControlPolicy', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateDeviceProfileReq.addOnModules': ((('addOnModule', 'XAddOnModule', 2),), frozenset(), None, False),
+    'UpdateDeviceProfileReq.blfDirectedCallParks': ((('blfDirectedCallPark', 'XBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'UpdateDeviceProfileReq.busyLampFields': ((('busyLampField', 'XBusyLampField', 2),), frozenset(), None, False),
+    'UpdateDeviceProfileReq.lines': ((('line', 'XPhoneLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'UpdateDeviceProfileReq.services': ((('service', 'XSubscribedService', 2),), frozenset(), None, False),
+    'UpdateDeviceProfileReq.speeddials': ((('speeddial', 'XSpeeddial', 2),), frozenset(), None, False),
+    'UpdateDhcpServerReq': ((('uuid', 'XUUID', 0), ('processNodeName', 'XFkType', 0), ('newProcessNodeName', 'XFkType', 0), ('primaryDnsIpAddress', 'xsd:string', 0), ('secondaryDnsIpAddress', 'xsd:string', 0), ('primaryTftpServerIpAddress', 'xsd:string', 0), ('secondaryTftpServerIpAddress', 'xsd:string', 0), ('bootstrapServerIpAddress', 'xsd:string', 0), ('domainName', 'xsd:string', 0), ('tftpServerName', 'xsd:string', 0), ('arpCacheTimeout', 'XInteger', 0), ('ipAddressLeaseTime', 'XInteger', 0), ('renewalTime', 'XInteger', 0), ('rebindingTime', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateDhcpSubnetReq': ((('uuid', 'XUUID', 0), ('dhcpServerName', 'XFkType', 0), ('subnetIpAddress', 'xsd:string', 0), ('newDhcpServerName', 'XFkType', 0), ('newSubnetIpAddress', 'xsd:string', 0), ('primaryStartIpAddress', 'xsd:string', 0), ('primaryEndIpAddress', 'xsd:string', 0), ('secondaryStartIpAddress', 'xsd:string', 0), ('secondaryEndIpAddress', 'xsd:string', 0), ('primaryRouterIpAddress', 'xsd:string', 0), ('secondaryRouterIpAddress', 'xsd:string', 0), ('subnetMask', 'xsd:string', 0), ('domainName', 'xsd:string', 0), ('primaryDnsIpAddress', 'xsd:string', 0), ('secondaryDnsIpAddress', 'xsd:string', 0), ('tftpServerName', 'xsd:string', 0), ('primaryTftpServerIpAddress', 'xsd:string', 0), ('secondaryTftpServerIpAddress', 'xsd:string', 0), ('bootstrapServerIpAddress', 'xsd:string', 0), ('arpCacheTimeout', 'XInteger', 0), ('ipAddressLeaseTime', 'XInteger', 0), ('renewalTime', 'XInteger', 0), ('rebindingTime', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateDirNumberAliasLookupandSyncReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('ldapConfigName', 'String50', 0), ('ldapManagerDisgName', 'String128', 0), ('ldapPassword', 'String128', 0), ('ldapUserSearch', 'String255', 0), ('ldapDirectoryServerUsage', 'XLDAPDirectoryFunction', 0), ('keepAliveSearch', 'xsd:string', 4), ('keepAliveTime', 'XKeepAliveTimeInterval', 0), ('sipAliasSuffix', 'xsd:string', 4), ('enableCachingofRecords', 'boolean', 0), ('servers', 'UpdateDirNumberAliasLookupandSyncReq.servers', 0), ('cacheSizeforAliasLookup', 'XInteger', 0), ('cacheAgeforAliasLookup', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateDirNumberAliasLookupandSyncReq.servers': ((('server', 'UpdateDirNumberAliasLookupandSyncReq.servers.server', 3),), frozenset(), None, False),
+    'UpdateDirNumberAliasLookupandSyncReq.servers.server': ((('hostName', 'xsd:string', 1), ('ldapPort', 'XInteger', 1), ('sslEnabled', 'boolean', 0)), frozenset(), None, False),
+    'UpdateDirectedCallParkReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('retrievalPrefix', 'xsd:string', 4), ('reversionPattern', 'xsd:string', 4), ('revertCssName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateDirectoryLookupDialRulesReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('numberBeginWith', 'xsd:string', 0), ('numberOfDigits', 'XInteger', 0), ('digitsToBeRemoved', 'XInteger', 0), ('prefixPattern', 'xsd:string', 0), ('priority', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateElinGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString50', 0), ('description', 'String255', 4), ('removeElinNumbers', 'UpdateElinGroupReq.removeElinNumbers', 0), ('addElinNumbers', 'UpdateElinGroupReq.addElinNumbers', 0), ('elinNumbers', 'UpdateElinGroupReq.elinNumbers', 0)), frozenset({'sequence'}), None, False),
+    'UpdateElinGroupReq.addElinNumbers': ((('elinNumber', 'XELINNumber', 3),), frozenset(), None, False),
+    'UpdateElinGroupReq.elinNumbers': ((('elinNumber', 'XELINNumber', 3),), frozenset(), None, False),
+    'UpdateElinGroupReq.removeElinNumbers': ((('elinNumber', 'XELINNumber', 3),), frozenset(), None, False),
+    'UpdateEmccFeatureConfigReq': ((('uuid', 'XUUID', 0), ('parameterName', 'String50', 0), ('value', 'String255', 4)), frozenset({'sequence'}), None, False),
+    'UpdateEndUserCapfProfileReq': ((('uuid', 'XUUID', 0), ('instanceId', 'xsd:string', 0), ('certificationOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('operationCompletion', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateEnterpriseFeatureAccessConfigurationReq': ((('uuid', 'XUUID', 0), ('pattern', 'String16', 0), ('routePartitionName', 'XFkType', 4), ('newPattern', 'String16', 0), ('newRoutePartitionName', 'XFkType', 4), ('description', 'xsd:string', 0), ('isDefaultEafNumber', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateEnterprisePhoneConfigReq': ((('vendorConfig', 'XVendorConfig', 4),), frozenset(), None, False),
+    'UpdateExpresswayCConfigurationReq': ((('uuid', 'XUUID', 0), ('HostNameOrIP', 'String255', 0), ('newHostNameOrIP', 'String255', 0), ('description', 'String50', 4), ('X509SubjectNameorSubjectAlternateName', 'String4096', 4)), frozenset({'sequence'}), None, False),
+    'UpdateExternalCallControlProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('primaryUri', 'String255', 0), ('secondaryUri', 'String255', 0), ('enableLoadBalancing', 'boolean', 0), ('routingRequestTimer', 'XInteger', 4), ('diversionReroutingCssName', 'XFkType', 4), ('callTreatmentOnFailure', 'XCallTreatmentOnFailure', 0)), frozenset({'sequence'}), None, False),
+    'UpdateFacInfoReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('code', 'String16', 0), ('authorizationLevel', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateFallbackFeatureConfigReq': ((('enableFallbackForImeCalls', 'boolean', 4), ('qosSensistivityLevel', 'XInteger', 4), ('dtmfCorrelationDigits', 'XInteger', 4), ('dtmfCollectionTimer', 'XInteger', 4), ('callAnswerTimer', 'XInteger', 4), ('clearImeCallDelayTimer', 'XInteger', 4), ('dtmfInterDigitDelayTimer', 'XInteger', 4), ('postConnectFallbackDelayTimer', 'XInteger', 4), ('fallbackSplitDelayTimer', 'XInteger', 4), ('callCss', 'XInteger', 4)), frozenset(), None, False),
+    'UpdateFallbackProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('advertisedFallbackDirectoryE164Number', 'xsd:string', 0), ('qosSensistivityLevel', 'XInteger', 0), ('callCss', 'XFallBackCSSSelection', 0), ('callAnswerTimer', 'XInteger', 0), ('directoryNumberPartition', 'XFkType', 4), ('directoryNumber', 'String16', 0), ('numberOfDigitsForCallerIDPartialMatch', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateFeatureControlPolicyReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'String100', 0), ('features', 'UpdateFeatureControlPolicyReq.features', 0)), frozenset({'sequence'}), None, False),
+    'UpdateFeatureControlPolicyReq.features': ((('feature', 'XFeatureControlConfig', 2),), frozenset(), None, False),
+    'UpdateFeatureGroupTemplateReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('homeCluster', 'boolean', 0), ('imAndUcPresenceEnable', 'boolean', 0), ('serviceProfile', 'XFkType', 4), ('enableUserToHostConferenceNow', 'boolean', 0), ('allowCTIControl', 'boolean', 0), ('enableEMCC', 'boolean', 0), ('enableMobility', 'boolean', 0), ('enableMobileVoiceAccess', 'boolean', 0), ('maxDeskPickupWait', 'XInteger', 0), ('remoteDestinationLimit', 'XInteger', 0), ('BLFPresenceGp', 'XFkType', 0), ('subscribeCallingSearch', 'XFkType', 4), ('userLocale', 'XUserLocale', 4), ('userProfile', 'XFkType', 4), ('meetingInformation', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateFixedMohAudioSourceReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('multicast', 'boolean', 0), ('enable', 'xsd:string', 0), ('initialAnnouncement', 'XFkType', 4), ('periodicAnnouncement', 'XFkType', 4), ('periodicAnnouncementInterval', 'XInteger', 0), ('localeAnnouncement', 'XUserLocale', 0), ('initialAnnouncementPlayed', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateGatekeeperReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('rrqTimeToLive', 'XInteger', 0), ('retryTimeout', 'XInteger', 0), ('enableDevice', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateGatewayEndpointAnalogAccessReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('endpoint', 'XGatewayEndpointAnalog', 0)), frozenset({'sequence'}), None, False),
+    'UpdateGatewayEndpointDigitalAccessBriReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('endpoint', 'XGatewayEndpointDigitalBri', 0)), frozenset({'sequence'}), None, False),
+    'UpdateGatewayEndpointDigitalAccessPriReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('endpoint', 'XGatewayEndpointDigitalPri', 0)), frozenset({'sequence'}), None, False),
+    'UpdateGatewayEndpointDigitalAccessT1Req': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('endpoint', 'UGatewayEndpointDigitalT1', 0)), frozenset({'sequence'}), None, False),
+    'UpdateGatewayReq': ((('uuid', 'XUUID', 0), ('domainName', 'xsd:string', 0), ('newDomainName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('product', 'XProduct', 4), ('protocol', 'XDeviceProtocol', 0), ('callManagerGroupName', 'XFkType', 4), ('vendorConfig', 'XVendorConfig', 4)), frozenset({'sequence'}), None, False),
+    'UpdateGatewaySccpEndpointsReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('endpoint', 'XGatewaySccp', 0)), frozenset({'sequence'}), None, False),
+    'UpdateGeoLocationFilterReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'String255', 0), ('useCountry', 'boolean', 0), ('useNationalSubDivision', 'boolean', 0), ('useDistrict', 'boolean', 0), ('useCommunityName', 'boolean', 0), ('useCityDivision', 'boolean', 0), ('useNeighbourhood', 'boolean', 0), ('useStreet', 'boolean', 0), ('useLeadingStreetDirection', 'boolean', 0), ('useTrailingStreetSuffix', 'boolean', 0), ('useStreetSuffix', 'boolean', 0), ('useHouseNumber', 'boolean', 0), ('useHouseNumberSuffix', 'boolean', 0), ('useLandmark', 'boolean', 0), ('useLocation', 'boolean', 0), ('useFloor', 'boolean', 0), ('useOccupantName', 'boolean', 0), ('usePostalCode', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateGeoLocationPolicyReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('country', 'xsd:string', 0), ('description', 'String255', 0), ('nationalSubDivision', 'String100', 0), ('district', 'String255', 0), ('communityName', 'String255', 0), ('cityDivision', 'String255', 0), ('neighbourhood', 'String255', 0), ('street', 'String255', 0), ('leadingStreetDirection', 'String50', 0), ('trailingStreetSuffix', 'String50', 0), ('streetSuffix', 'String255', 0), ('houseNumber', 'String16', 0), ('houseNumberSuffix', 'String100', 0), ('landmark', 'String255', 0), ('location', 'String255', 0), ('floor', 'String16', 0), ('occupantName', 'String255', 0), ('postalCode', 'String100', 0), ('removeRelatedPolicies', 'UpdateGeoLocationPolicyReq.removeRelatedPolicies', 0), ('addRelatedPolicies', 'UpdateGeoLocationPolicyReq.addRelatedPolicies', 0), ('relatedPolicies', 'UpdateGeoLocationPolicyReq.relatedPolicies', 0)), frozenset({'sequence'}), None, False),
+    'UpdateGeoLocationPolicyReq.addRelatedPolicies': ((('relatedPolicy', 'XPolicyRelationship', 3),), frozenset(), None, False),
+    'UpdateGeoLocationPolicyReq.relatedPolicies': ((('relatedPolicy', 'XPolicyRelationship', 3),), frozenset(), None, False),
+    'UpdateGeoLocationPolicyReq.removeRelatedPolicies': ((('relatedPolicy', 'XPolicyRelationship', 3),), frozenset(), None, False),
+    'UpdateGeoLocationReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('country', 'xsd:string', 0), ('description', 'String255', 0), ('nationalSubDivision', 'String100', 0), ('district', 'String255', 0), ('communityName', 'String255', 0), ('cityDivision', 'String255', 0), ('neighbourhood', 'String255', 0), ('street', 'String255', 0), ('leadingStreetDirection', 'String50', 0), ('trailingStreetSuffix', 'String50', 0), ('streetSuffix', 'String255', 0), ('houseNumber', 'String16', 0), ('houseNumberSuffix', 'String100', 0), ('landmark', 'String255', 0), ('location', 'String255', 0), ('floor', 'String16', 0), ('occupantName', 'String255', 0), ('postalCode', 'String100', 0)), frozenset({'sequence'}), None, False),
+    'UpdateH323GatewayReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('vendorConfig', 'XVendorConfig', 0), ('pathReplacementSupport', 'boolean', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('srtpAllowed', 'boolean', 0), ('waitForFarEndH245TerminalSet', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('callerIdDn', 'String50', 4), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('enableInboundFaststart', 'boolean', 0), ('enableOutboundFaststart', 'boolean', 0), ('codecForOutboundFaststart', 'XMediaPayload', 4), ('transmitUtf8', 'boolean', 0), ('signalingPort', 'XInteger', 0), ('allowH235PassThrough', 'boolean', 0), ('sigDigits', 'UpdateH323GatewayReq.sigDigits', 0), ('prefixDn', 'String50', 4), ('calledPartyIeNumberType', 'XPriOfNumber', 0), ('callingPartyIeNumberType', 'XPriOfNumber', 0), ('calledNumberingPlan', 'XNumberingPlan', 0), ('callingNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNationalPrefix', 'String16', 0), ('callingPartyInternationalPrefix', 'String16', 0), ('callingPartyUnknownPrefix', 'String16', 0), ('callingPartySubscriberPrefix', 'String16', 0), ('callingPartyNationalStripDigits', 'XInteger', 4), ('callingPartyInternationalStripDigits', 'XInteger', 4), ('callingPartyUnknownStripDigits', 'XInteger', 4), ('callingPartySubscriberStripDigits', 'XInteger', 4), ('callingPartyNationalTransformationCssName', 'XFkType', 4), ('callingPartyInternationalTransformationCssName', 'XFkType', 4), ('callingPartyUnknownTransformationCssName', 'XFkType', 4), ('callingPartySubscriberTransformationCssName', 'XFkType', 4), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 4), ('calledPartyInternationalStripDigits', 'XInteger', 4), ('calledPartyUnknownStripDigits', 'XInteger', 4), ('calledPartySubscriberStripDigits', 'XInteger', 4), ('calledPartyNationalTransformationCssName', 'XFkType', 4), ('calledPartyInternationalTransformationCssName', 'XFkType', 4), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('calledPartySubscriberTransformationCssName', 'XFkType', 4), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('displayIeDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('cntdPnTransformationCssName', 'XFkType', 4), ('confidentialAccess', 'UpdateH323GatewayReq.confidentialAccess', 0), ('redirectingPartyTransformationCSS', 'XFkType', 4), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateH323GatewayReq.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'UpdateH323GatewayReq.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'UpdateH323PhoneReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('commonPhoneConfigName', 'XFkType', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('remoteDevice', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('srtpAllowed', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 4), ('waitForFarEndH245TerminalSet', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('mtpPreferredCodec', 'XSIPCodec', 0), ('callerIdDn', 'String50', 4), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('displayIEDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('hlogStatus', 'boolean', 0), ('ownerUserName', 'XFkType', 4), ('signalingPort', 'XInteger', 0), ('gateKeeperInfo', 'UpdateH323PhoneReq.gateKeeperInfo', 0), ('lines', 'UpdateH323PhoneReq.lines', 0), ('ignorePresentationIndicators', 'boolean', 0), ('elinGroup', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateH323PhoneReq.gateKeeperInfo': ((('gateKeeperName', 'XFkType', 4), ('e164', 'String50', 4), ('technologyPrefix', 'String50', 1), ('zone', 'String50', 1)), frozenset(), None, False),
+    'UpdateH323PhoneReq.lines': ((('line', 'XH323Line', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'UpdateH323TrunkReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('rdnTransformationCssName', 'XFkType', 4), ('useDevicePoolRdnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('sendGeoLocation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('srtpAllowed', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('waitForFarEndH245TerminalSet', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('callerIdDn', 'String50', 4), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('displayIEDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('enableInboundFaststart', 'boolean', 0), ('enableOutboundFaststart', 'boolean', 0), ('codecForOutboundFaststart', 'XMediaPayload', 4), ('allowH235PassThrough', 'boolean', 0), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('transmitUtf8', 'boolean', 0), ('signalingPort', 'XInteger', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('sigDigits', 'UpdateH323TrunkReq.sigDigits', 0), ('prefixDn', 'String50', 4), ('calledPartyIeNumberType', 'XPriOfNumber', 0), ('callingPartyIeNumberType', 'XPriOfNumber', 0), ('calledNumberingPlan', 'XNumberingPlan', 0), ('callingNumberingPlan', 'XNumberingPlan', 0), ('pathReplacementSupport', 'boolean', 0), ('gateKeeperInfo', 'UpdateH323TrunkReq.gateKeeperInfo', 0), ('ictPassingPrecedenceLevelThroughUuie', 'boolean', 0), ('ictSecurityAccessLevel', 'XInteger', 0), ('isSafEnabled', 'boolean', 0), ('callingPartyNationalStripDigits', 'XInteger', 4), ('callingPartyInternationalStripDigits', 'XInteger', 4), ('callingPartyUnknownStripDigits', 'XInteger', 4), ('callingPartySubscriberStripDigits', 'XInteger', 4), ('callingPartyNationalTransformationCssName', 'XFkType', 4), ('callingPartyInternationalTransformationCssName', 'XFkType', 4), ('callingPartyUnknownTransformationCssName', 'XFkType', 4), ('callingPartySubscriberTransformationCssName', 'XFkType', 4), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('calledPartyNationalStripDigits', 'XInteger', 4), ('calledPartyInternationalStripDigits', 'XInteger', 4), ('calledPartyUnknownStripDigits', 'XInteger', 4), ('calledPartySubscriberStripDigits', 'XInteger', 4), ('calledPartyNationalTransformationCssName', 'XFkType', 4), ('calledPartyInternationalTransformationCssName', 'XFkType', 4), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('calledPartySubscriberTransformationCssName', 'XFkType', 4), ('runOnEveryNode', 'boolean', 0), ('removeDestinations', 'UpdateH323TrunkReq.removeDestinations', 0), ('addDestinations', 'UpdateH323TrunkReq.addDestinations', 0), ('destinations', 'UpdateH323TrunkReq.destinations', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('cntdPnTransformationCssName', 'XFkType', 4), ('confidentialAccess', 'UpdateH323TrunkReq.confidentialAccess', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateH323TrunkReq.addDestinations': ((('destination', 'XH323TrunkDestination', 2),), frozenset(), None, False),
+    'UpdateH323TrunkReq.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'UpdateH323TrunkReq.destinations': ((('destination', 'XH323TrunkDestination', 2),), frozenset(), None, False),
+    'UpdateH323TrunkReq.gateKeeperInfo': ((('gateKeeper', 'XFkType', 4), ('terminalType', 'XTerminal', 4), ('technologyPrefix', 'String50', 0), ('zone', 'String50', 0)), frozenset(), None, False),
+    'UpdateH323TrunkReq.removeDestinations': ((('destination', 'XH323TrunkDestination', 2),), frozenset(), None, False),
+    'UpdateH323TrunkReq.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'UpdateHandoffConfigurationReq': ((('uuid', 'XUUID', 0), ('pattern', 'String16', 0), ('routePartitionName', 'XFkType', 4), ('newPattern', 'String16', 0), ('newRoutePartitionName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateHttpProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('userName', 'xsd:string', 0), ('password', 'xsd:string', 0), ('requestTimeout', 'XRequestTimeout', 0), ('retryCount', 'XRetryCount', 0), ('webServiceRootUri', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateHuntListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('description', 'xsd:string', 0), ('callManagerGroupName', 'XFkType', 4), ('routeListEnabled', 'boolean', 0), ('voiceMailUsage', 'boolean', 0), ('removeMembers', 'UpdateHuntListReq.removeMembers', 0), ('addMembers', 'UpdateHuntListReq.addMembers', 0), ('members', 'UpdateHuntListReq.members', 0), ('newName', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateHuntListReq.addMembers': ((('member', 'XHuntListMember', 2),), frozenset(), None, False),
+    'UpdateHuntListReq.members': ((('member', 'XHuntListMember', 2),), frozenset(), None, False),
+    'UpdateHuntListReq.removeMembers': ((('member', 'XHuntListMember', 2),), frozenset(), None, False),
+    'UpdateHuntPilotReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('blockEnable', 'boolean', 0), ('calledPartyTransformationMask', 'xsd:string', 4), ('callingPartyTransformationMask', 'xsd:string', 4), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 4), ('dialPlanName', 'XFkType', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 4), ('routeFilterName', 'XFkType', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('huntListName', 'XFkType', 0), ('parkMonForwardNoRetrieve', 'UpdateHuntPilotReq.parkMonForwardNoRetrieve', 0), ('alertingName', 'String50', 0), ('asciiAlertingName', 'String32', 0), ('e164Mask', 'xsd:string', 4), ('aarNeighborhoodName', 'XFkType', 4), ('forwardHuntNoAnswer', 'UpdateHuntPilotReq.forwardHuntNoAnswer', 0), ('forwardHuntBusy', 'UpdateHuntPilotReq.forwardHuntBusy', 0), ('callPickupGroupName', 'XFkType', 0), ('maxHuntduration', 'XInteger', 4), ('releaseClause', 'XReleaseCauseValue', 0), ('displayConnectedNumber', 'boolean', 0), ('queueCalls', 'XCallsQueue', 0)), frozenset({'sequence'}), None, False),
+    'UpdateHuntPilotReq.forwardHuntBusy': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'xsd:string', 4), ('callingSearchSpaceName', 'XFkType', 4)), frozenset(), None, False),
+    'UpdateHuntPilotReq.forwardHuntNoAnswer': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'xsd:string', 4), ('callingSearchSpaceName', 'XFkType', 4)), frozenset(), None, False),
+    'UpdateHuntPilotReq.parkMonForwardNoRetrieve': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'String50', 4), ('callingSearchSpaceName', 'XFkType', 4)), frozenset(), None, False),
+    'UpdateIlsConfigReq': ((('role', 'xsd:string', 1), ('registrationServer', 'xsd:string', 1), ('activateIls', 'boolean', 1), ('synchronizeClustersEvery', 'String50', 1), ('activatedServers', 'xsd:string', 1), ('deactivatedServers', 'xsd:string', 1), ('useTls', 'boolean', 1), ('enableUsePassword', 'boolean', 1), ('usePassword', 'xsd:string', 1)), frozenset({'sequence'}), None, False),
+    'UpdateImeClientReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('domain', 'String255', 0), ('isActivated', 'boolean', 0), ('sipTrunkName', 'XFkType', 0), ('primaryImeServerName', 'XFkType', 0), ('secondaryImeServerName', 'XFkType', 4), ('learnedRouteFilterGroupName', 'XFkType', 4), ('exclusionNumberGroupName', 'XFkType', 4), ('firewallName', 'XFkType', 4), ('removeMembers', 'UpdateImeClientReq.removeMembers', 0), ('addMembers', 'UpdateImeClientReq.addMembers', 0), ('members', 'UpdateImeClientReq.members', 0), ('removeCcmExternalIpMaps', 'UpdateImeClientReq.removeCcmExternalIpMaps', 0), ('addCcmExternalIpMaps', 'UpdateImeClientReq.addCcmExternalIpMaps', 0), ('ccmExternalIpMaps', 'UpdateImeClientReq.ccmExternalIpMaps', 0)), frozenset({'sequence'}), None, False),
+    'UpdateImeClientReq.addCcmExternalIpMaps': ((('ccmExternalIpMap', 'XCcmExternalIpMap', 2),), frozenset(), None, False),
+    'UpdateImeClientReq.addMembers': ((('member', 'XImeClientMember', 3),), frozenset(), None, False),
+    'UpdateImeClientReq.ccmExternalIpMaps': ((('ccmExternalIpMap', 'XCcmExternalIpMap', 2),), frozenset(), None, False),
+    'UpdateImeClientReq.members': ((('member', 'XImeClientMember', 3),), frozenset(), None, False),
+    'UpdateImeClientReq.removeCcmExternalIpMaps': ((('ccmExternalIpMap', 'XCcmExternalIpMap', 2),), frozenset(), None, False),
+    'UpdateImeClientReq.removeMembers': ((('member', 'XImeClientMember', 3),), frozenset(), None, False),
+    'UpdateImeE164TransformationReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('isCgpnPreTransformation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('isCdpnPreTransformation', 'boolean', 0), ('incomingCgpnTransformationProfileName', 'XFkType', 4), ('incomingCdpnTransformationProfileName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateImeEnrolledPatternGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('fallbackProfileName', 'XFkType', 4), ('isPatternAllAlias', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateImeEnrolledPatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'String16', 0), ('newPattern', 'String16', 0), ('description', 'xsd:string', 0), ('imeEnrolledPatternGroupName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateImeExclusionNumberGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateImeExclusionNumberReq': ((('uuid', 'XUUID', 0), ('pattern', 'String16', 0), ('newPattern', 'String16', 0), ('description', 'xsd:string', 0), ('imeExclusionNumberGroupName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateImeFeatureConfigReq': ((('preventImeCallsFromAnalogGateways', 'boolean', 4), ('enableIntraDomain', 'boolean', 4), ('allowMwiNotification', 'boolean', 4), ('trunkConnectionTimer', 'XInteger', 4), ('firewallConnectionTimer', 'XInteger', 4), ('firewallTranscationTimer', 'XInteger', 4), ('firewallIdleTimer', 'XInteger', 0), ('failedCallAttemptThreshold', 'XInteger', 4), ('callFallbackAttemptThreshold', 'XInteger', 4), ('qualityTimer', 'XInteger', 4), ('useImeForOutboundCalls', 'boolean', 4)), frozenset(), None, False),
+    'UpdateImeFirewallReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('ipAddress', 'String15', 0), ('port', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateImeLearnedRoutesReq': ((('uuid', 'XUUID', 0), ('e164Did', 'String32', 0), ('adminEnabled', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateImeRouteFilterElementReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('elementType', 'XViprFilterElement', 0), ('imeRouteFilterGroupName', 'XFkType', 0)), frozenset({'sequence'}), None, False),
+    'UpdateImeRouteFilterGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('groupTrustSetting', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateImeServerReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('ipAddress', 'xsd:string', 0), ('port', 'XInteger', 0), ('deviceSecurityMode', 'XServerSecurityMode', 0), ('applicationUser', 'XFkType', 0), ('reconnectInterval', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateImportedDirectoryUriCatalogsReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 4), ('routeString', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateInfrastructureDeviceReq': ((('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('ipv4Address', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 4), ('bssidWithMask', 'xsd:string', 4), ('wapLocation', 'xsd:string', 4), ('isActive', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateInterClusterDirectoryUriReq': ((('exchangeDirectoryUri', 'boolean', 1), ('routeString', 'String50', 1)), frozenset({'sequence'}), None, False),
+    'UpdateInterClusterServiceProfileReq': ((('uuid', 'XUUID', 0), ('interClusterService', 'XInterClusterService', 0), ('isActivated', 'boolean', 0), ('sipTrunkName', 'XFkType', 0)), frozenset({'sequence'}), None, False),
+    'UpdateIpPhoneServicesReq': ((('uuid', 'XUUID', 0), ('serviceName', 'UniqueString128', 0), ('newServiceName', 'UniqueString128', 0), ('asciiServiceName', 'UniqueString128', 0), ('serviceDescription', 'String128', 4), ('serviceUrl', 'xsd:string', 4), ('secureServiceUrl', 'xsd:string', 4), ('serviceCategory', 'XPhoneServiceCategory', 0), ('serviceType', 'XPhoneService', 0), ('serviceVendor', 'xsd:string', 0), ('serviceVersion', 'xsd:string', 0), ('enabled', 'boolean', 0), ('removeParameters', 'UpdateIpPhoneServicesReq.removeParameters', 0), ('addParameters', 'UpdateIpPhoneServicesReq.addParameters', 0), ('parameters', 'UpdateIpPhoneServicesReq.parameters', 0)), frozenset({'sequence'}), None, False),
+    'UpdateIpPhoneServicesReq.addParameters': ((('parameter', 'XIpPhoneServicesParameter', 3),), frozenset(), None, False),
+    'UpdateIpPhoneServicesReq.parameters': ((('parameter', 'XIpPhoneServicesParameter', 3),), frozenset(), None, False),
+    'UpdateIpPhoneServicesReq.removeParameters': ((('parameter', 'XIpPhoneServicesParameter', 3),), frozenset(), None, False),
+    'UpdateIvrUserLocaleReq': ((('uuid', 'XUUID', 0), ('userLocale', 'XUserLocale', 0), ('newUserLocale', 'XUserLocale', 0), ('orderIndex', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateLbmGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('Description', 'xsd:string', 0), ('ProcessnodeActive', 'XFkType', 4), ('ProcessnodeStandby', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateLbmHubGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('member1', 'xsd:string', 0), ('member2', 'xsd:string', 0), ('member3', 'xsd:string', 0), ('removeMembers', 'UpdateLbmHubGroupReq.removeMembers', 0), ('addMembers', 'UpdateLbmHubGroupReq.addMembers', 0), ('members', 'UpdateLbmHubGroupReq.members', 0)), frozenset({'sequence'}), None, False),
+    'UpdateLbmHubGroupReq.addMembers': ((('member', 'XProcessNodes', 2),), frozenset(), None, False),
+    'UpdateLbmHubGroupReq.members': ((('member', 'XProcessNodes', 2),), frozenset(), None, False),
+    'UpdateLbmHubGroupReq.removeMembers': ((('member', 'XProcessNodes', 2),), frozenset(), None, False),
+    'UpdateLdapAuthenticationReq': ((('authenticateEndUsers', 'boolean', 0), ('distinguishedName', 'String128', 0), ('ldapPassword', 'String128', 0), ('userSearchBase', 'String255', 0), ('servers', 'UpdateLdapAuthenticationReq.servers', 0)), frozenset(), None, False),
+    'UpdateLdapAuthenticationReq.servers': ((('server', 'UpdateLdapAuthenticationReq.servers.server', 2),), frozenset(), None, False),
+    'UpdateLdapAuthenticationReq.servers.server': ((('hostName', 'String128', 0), ('ldapPortNumber', 'XInteger', 0), ('sslEnabled', 'boolean', 0)), frozenset(), None, False),
+    'UpdateLdapDirectoryReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('ldapDn', 'String128', 0), ('ldapPassword', 'String128', 0), ('userSearchBase', 'String255', 0), ('repeatable', 'boolean', 0), ('intervalValue', 'XInteger', 4), ('scheduleUnit', 'XScheduleUnit', 0), ('nextExecTime', 'String32', 0), ('servers', 'UpdateLdapDirectoryReq.servers', 0), ('ldapFilter', 'XFkType', 4), ('synchronize', 'boolean', 0), ('ldapFilterForGroups', 'XFkType', 4), ('removeAccessControlGroupInfo', 'UpdateLdapDirectoryReq.removeAccessControlGroupInfo', 0), ('addAccessControlGroupInfo', 'UpdateLdapDirectoryReq.addAccessControlGroupInfo', 0), ('accessControlGroupInfo', 'UpdateLdapDirectoryReq.accessControlGroupInfo', 0), ('featureGroupTemplate', 'XFkType', 4), ('applyMask', 'boolean', 0), ('mask', 'xsd:string', 4), ('applyPoolList', 'boolean', 0), ('addDns', 'UpdateLdapDirectoryReq.addDns', 0)), frozenset({'sequence'}), None, False),
+    'UpdateLdapDirectoryReq.accessControlGroupInfo': ((('accessControlGroupName', 'UpdateLdapDirectoryReq.accessControlGroupInfo.accessControlGroupName', 2),), frozenset(), None, False),
+    'UpdateLdapDirectoryReq.accessControlGroupInfo.accessControlGroupName': ((('accessControlGroup', 'xsd:string', 0),), frozenset(), None, False),
+    'UpdateLdapDirectoryReq.addAccessControlGroupInfo': ((('accessControlGroupName', 'UpdateLdapDirectoryReq.addAccessControlGroupInfo.accessControlGroupName', 2),), frozenset(), None, False),
+    'UpdateLdapDirectoryReq.addAccessControlGroupInfo.accessControlGroupName': ((('accessControlGroup', 'xsd:string', 0),), frozenset(), None, False),
+    'UpdateLdapDirectoryReq.addDns': ((('addDn', 'UpdateLdapDirectoryReq.addDns.addDn', 2),), frozenset(), None, False),
+    'UpdateLdapDirectoryReq.addDns.addDn': ((('startDn', 'xsd:string', 0), ('endDn', 'xsd:string', 0), ('dnPrefix', 'xsd:string', 0)), frozenset(), None, False),
+    'UpdateLdapDirectoryReq.removeAccessControlGroupInfo': ((('accessControlGroupName', 'UpdateLdapDirectoryReq.removeAccessControlGroupInfo.accessControlGroupName', 2),), frozenset(), None, False),
+    'UpdateLdapDirectoryReq.removeAccessControlGroupInfo.accessControlGroupName': ((('accessControlGroup', 'xsd:string', 0),), frozenset(), None, False),
+    'UpdateLdapDirectoryReq.servers': ((('server', 'UpdateLdapDirectoryReq.servers.server', 3),), frozenset(), None, False),
+    'UpdateLdapDirectoryReq.servers.server': ((('hostName', 'String128', 1), ('ldapPortNumber', 'XInteger', 1), ('sslEnabled', 'boolean', 0)), frozenset(), None, False),
+    'UpdateLdapFilterReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String4096', 0), ('filter', 'String255', 0)), frozenset({'sequence'}), None, False),
+    'UpdateLdapSearchReq': ((('uuid', 'XUUID', 0), ('enableDirectorySearch', 'boolean', 4), ('distinguishedName', 'String128', 0), ('password', 'String128', 0), ('userSearchBase1', 'String255', 0), ('userSearchBase2', 'String255', 0), ('userSearchBase3', 'String255', 0), ('ldapFilterForUser', 'XFkType', 4), ('ldapFilterForGroups', 'XFkType', 4), ('enableRecursiveSearch', 'boolean', 0), ('primary', 'XFkType', 4), ('secondary', 'XFkType', 4), ('tertiary', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateLdapSyncCustomFieldReq': ((('uuid', 'XUUID', 0), ('ldapConfigurationName', 'xsd:string', 0), ('customUserField', 'xsd:string', 0), ('ldapUserField', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateLdapSystemReq': ((('syncEnabled', 'boolean', 0), ('ldapServer', 'XLdapServer', 4), ('userIdAttribute', 'String64', 0)), frozenset(), None, False),
+    'UpdateLineGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('distributionAlgorithm', 'XDistributeAlgorithm', 0), ('rnaReversionTimeOut', 'XInteger', 0), ('huntAlgorithmNoAnswer', 'XHuntAlgorithm', 0), ('huntAlgorithmBusy', 'XHuntAlgorithm', 0), ('huntAlgorithmNotAvailable', 'XHuntAlgorithm', 0), ('removeMembers', 'UpdateLineGroupReq.removeMembers', 0), ('addMembers', 'UpdateLineGroupReq.addMembers', 0), ('members', 'UpdateLineGroupReq.members', 0), ('newName', 'xsd:string', 0), ('autoLogOffHunt', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateLineGroupReq.addMembers': ((('member', 'XLineGroupMember', 2),), frozenset(), None, False),
+    'UpdateLineGroupReq.members': ((('member', 'XLineGroupMember', 2),), frozenset(), None, False),
+    'UpdateLineGroupReq.removeMembers': ((('member', 'XLineGroupMember', 2),), frozenset(), None, False),
+    'UpdateLineReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('aarDestinationMask', 'String128', 4), ('aarKeepCallHistory', 'boolean', 0), ('aarVoiceMailEnabled', 'boolean', 0), ('callForwardAll', 'XCallForwardAll', 0), ('callForwardBusy', 'XCallForwardBusy', 0), ('callForwardBusyInt', 'XCallForwardBusyInt', 0), ('callForwardNoAnswer', 'XCallForwardNoAnswer', 0), ('callForwardNoAnswerInt', 'XCallForwardNoAnswerInt', 0), ('callForwardNoCoverage', 'XCallForwardNoCoverage', 0), ('callForwardNoCoverageInt', 'XCallForwardNoCoverageInt', 0), ('callForwardOnFailure', 'XCallForwardOnFailure', 0), ('callForwardAlternateParty', 'XCallForwardAlternateParty', 0), ('callForwardNotRegistered', 'XCallForwardNotRegistered', 0), ('callForwardNotRegisteredInt', 'XCallForwardNotRegisteredInt', 0), ('callPickupGroupName', 'XFkType', 0), ('autoAnswer', 'XAutoAnswer', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('callingIdPresentationWhenDiverted', 'XPresentationBit', 0), ('alertingName', 'String50', 0), ('asciiAlertingName', 'String32', 0), ('presenceGroupName', 'XFkType', 0), ('shareLineAppearanceCssName', 'XFkType', 4), ('voiceMailProfileName', 'XFkType', 4), ('patternPrecedence', 'XPatternPrecedence', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('hrDuration', 'XInteger', 4), ('hrInterval', 'XInteger', 4), ('cfaCssPolicy', 'XCFACSSActivationPolicy', 0), ('defaultActivatedDeviceName', 'XFkType', 4), ('parkMonForwardNoRetrieveDn', 'String50', 4), ('parkMonForwardNoRetrieveIntDn', 'String50', 4), ('parkMonForwardNoRetrieveVmEnabled', 'boolean', 0), ('parkMonForwardNoRetrieveIntVmEnabled', 'boolean', 0), ('parkMonForwardNoRetrieveCssName', 'XFkType', 4), ('parkMonForwardNoRetrieveIntCssName', 'XFkType', 4), ('parkMonReversionTimer', 'XInteger', 4), ('partyEntranceTone', 'XStatus', 0), ('directoryURIs', 'UpdateLineReq.directoryURIs', 0), ('allowCtiControlFlag', 'boolean', 0), ('rejectAnonymousCall', 'boolean', 0), ('patternUrgency', 'boolean', 0), ('confidentialAccess', 'UpdateLineReq.confidentialAccess', 0), ('externalCallControlProfile', 'XFkType', 4), ('enterpriseAltNum', 'UpdateLineReq.enterpriseAltNum', 0), ('e164AltNum', 'UpdateLineReq.e164AltNum', 0), ('pstnFailover', 'xsd:string', 0), ('callControlAgentProfile', 'xsd:string', 0), ('useEnterpriseAltNum', 'boolean', 0), ('useE164AltNum', 'boolean', 0), ('active', 'boolean', 0), ('externalPresentationInfo', 'UpdateLineReq.externalPresentationInfo', 0)), frozenset({'sequence'}), None, False),
+    'UpdateLineReq.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'UpdateLineReq.directoryURIs': ((('directoryUri', 'XDirectoryUri', 2),), frozenset(), None, False),
+    'UpdateLineReq.e164AltNum': ((('numMask', 'xsd:string', 4), ('isUrgent', 'boolean', 0), ('addLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 4), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'UpdateLineReq.enterpriseAltNum': ((('numMask', 'xsd:string', 4), ('isUrgent', 'boolean', 0), ('addLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 4), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'UpdateLineReq.externalPresentationInfo': ((('isAnonymous', 'boolean', 0), ('presentationInfo', 'UpdateLineReq.externalPresentationInfo.presentationInfo', 0)), frozenset(), None, False),
+    'UpdateLineReq.externalPresentationInfo.presentationInfo': ((('externalPresentationNumber', 'xsd:string', 4), ('externalPresentationName', 'String50', 4)), frozenset(), None, False),
+    'UpdateLocalRouteGroupReq': ((('localRouteGroup', 'UpdateLocalRouteGroupReq.localRouteGroup', 0),), frozenset({'sequence'}), None, False),
+    'UpdateLocalRouteGroupReq.localRouteGroup': ((('uuid', 'XUUID', 1), ('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('newName', 'xsd:string', 0), ('newDescription', 'xsd:string', 0)), frozenset(), None, False),
+    'UpdateLocationReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('relatedLocations', 'UpdateLocationReq.relatedLocations', 0), ('withinAudioBandwidth', 'XInteger', 0), ('withinVideoBandwidth', 'XInteger', 0), ('withinImmersiveKbits', 'XInteger', 0), ('betweenLocations', 'UpdateLocationReq.betweenLocations', 0)), frozenset({'sequence'}), None, False),
+    'UpdateLocationReq.betweenLocations': ((('betweenLocation', 'XLocationBetween', 3),), frozenset(), None, False),
+    'UpdateLocationReq.relatedLocations': ((('relatedLocation', 'XLocationRelationship', 3),), frozenset(), None, False),
+    'UpdateMediaResourceGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'String50', 0), ('multicast', 'boolean', 0), ('removeMembers', 'UpdateMediaResourceGroupReq.removeMembers', 0), ('addMembers', 'UpdateMediaResourceGroupReq.addMembers', 0), ('members', 'UpdateMediaResourceGroupReq.members', 0)), frozenset({'sequence'}), None, False),
+    'UpdateMediaResourceGroupReq.addMembers': ((('member', 'XMediaResourceGroupMember', 3),), frozenset(), None, False),
+    'UpdateMediaResourceGroupReq.members': ((('member', 'XMediaResourceGroupMember', 3),), frozenset(), None, False),
+    'UpdateMediaResourceGroupReq.removeMembers': ((('member', 'XMediaResourceGroupMember', 3),), frozenset(), None, False),
+    'UpdateMediaResourceListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('removeMembers', 'UpdateMediaResourceListReq.removeMembers', 0), ('addMembers', 'UpdateMediaResourceListReq.addMembers', 0), ('members', 'UpdateMediaResourceListReq.members', 0)), frozenset({'sequence'}), None, False),
+    'UpdateMediaResourceListReq.addMembers': ((('member', 'XMediaResourceListMember', 3),), frozenset(), None, False),
+    'UpdateMediaResourceListReq.members': ((('member', 'XMediaResourceListMember', 3),), frozenset(), None, False),
+    'UpdateMediaResourceListReq.removeMembers': ((('member', 'XMediaResourceListMember', 3),), frozenset(), None, False),
+    'UpdateMeetMeReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('minimumSecurityLevel', 'XDeviceSecurityMode', 4)), frozenset({'sequence'}), None, False),
+    'UpdateMessageWaitingReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('description', 'String128', 0), ('messageWaitingIndicator', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateMlppDomainReq': ((('uuid', 'XUUID', 0), ('domainName', 'xsd:string', 0), ('newDomainName', 'xsd:string', 0), ('domainId', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateMobileVoiceAccessReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('newPattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('removeLocales', 'UpdateMobileVoiceAccessReq.removeLocales', 0), ('addLocales', 'UpdateMobileVoiceAccessReq.addLocales', 0), ('locales', 'UpdateMobileVoiceAccessReq.locales', 4)), frozenset({'sequence'}), None, False),
+    'UpdateMobileVoiceAccessReq.addLocales': ((('locale', 'XMobileVoiceMember', 3),), frozenset(), None, False),
+    'UpdateMobileVoiceAccessReq.locales': ((('locale', 'XMobileVoiceMember', 3),), frozenset(), None, False),
+    'UpdateMobileVoiceAccessReq.removeLocales': ((('locale', 'XMobileVoiceMember', 3),), frozenset(), None, False),
+    'UpdateMobilityProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('mobileClientCallingOption', 'XDialViaOffice', 0), ('dvofServiceAccessNumber', 'xsd:string', 0), ('dirn', 'XDirn', 0), ('dvorCallerId', 'xsd:string', 4)), frozenset({'sequence'}), None, False),
+    'UpdateMobilityReq': ((('handoffNumber', 'XFkType', 0), ('DTMFNumber', 'XFkType', 0), ('newHandoffNumber', 'xsd:string', 0), ('newHandoffPartitionName', 'XFkType', 0), ('newDTMFNumber', 'xsd:string', 0), ('newDTMFPartitionName', 'XFkType', 0)), frozenset(), None, False),
+    'UpdateMohAudioSourceReq': ((('uuid', 'XUUID', 0), ('sourceId', 'XMOHAudioSourceId', 0), ('newName', 'String50', 0), ('sourceFile', 'String255', 0), ('multicast', 'boolean', 0), ('mohFileStatus', 'XInteger', 4), ('initialAnnouncement', 'XFkType', 4), ('periodicAnnouncement', 'XFkType', 4), ('periodicAnnouncementInterval', 'XInteger', 0), ('localeAnnouncement', 'XUserLocale', 0), ('initialAnnouncementPlayed', 'boolean', 0), ('isExternalSource', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateMohServerReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'XFkType', 4), ('locationName', 'XFkType', 0), ('maxUnicastConnections', 'XInteger', 0), ('maxMulticastConnections', 'XInteger', 0), ('fixedAudioSourceDevice', 'xsd:string', 0), ('runFlag', 'boolean', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('isMultiCastEnabled', 'boolean', 0), ('baseMulticastIpaddress', 'xsd:string', 0), ('baseMulticastPort', 'XInteger', 0), ('multicastIncrementOnIp', 'boolean', 0), ('audioSources', 'UpdateMohServerReq.audioSources', 0)), frozenset({'sequence'}), None, False),
+    'UpdateMohServerReq.audioSources': ((('audioSource', 'UpdateMohServerReq.audioSources.audioSource', 2),), frozenset(), None, False),
+    'UpdateMohServerReq.audioSources.audioSource': ((('sourceId', 'XInteger', 1), ('maxHops', 'XInteger', 0)), frozenset(), None, False),
+    'UpdateMraServiceDomainReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('isDefault', 'boolean', 0), ('serviceDomains', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateMtpReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('devicePoolName', 'XFkType', 4), ('trustedRelayPoint', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateNetworkAccessProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String255', 0), ('vpnRequired', 'XStatus', 0), ('proxySettings', 'XHTTPProxy', 0), ('proxyHostname', 'xsd:string', 0), ('proxyPort', 'XInteger', 0), ('proxyRequiresAuthentication', 'boolean', 0), ('provideSharedCredentials', 'boolean', 0), ('username', 'xsd:string', 0), ('password', 'xsd:string', 4)), frozenset({'sequence'}), None, False),
+    'UpdatePageLayoutPreferencesReq': ((('pageName', 'xsd:string', 1), ('pageSections', 'UpdatePageLayoutPreferencesReq.pageSections', 1)), frozenset({'sequence'}), None, False),
+    'UpdatePageLayoutPreferencesReq.pageSections': ((('pageSection', 'UpdatePageLayoutPreferencesReq.pageSections.pageSection', 3),), frozenset(), None, False),
+    'UpdatePageLayoutPreferencesReq.pageSections.pageSection': ((('name', 'XWebPageSection', 1), ('state', 'XWebPageDisplay', 0), ('order', 'XInteger', 0)), frozenset(), None, False),
+    'UpdatePhoneButtonTemplateReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('buttons', 'UpdatePhoneButtonTemplateReq.buttons', 0)), frozenset({'sequence'}), None, False),
+    'UpdatePhoneButtonTemplateReq.buttons': ((('button', 'XButton', 2),), frozenset(), None, False),
+    'UpdatePhoneNtpReq': ((('uuid', 'XUUID', 0), ('ipAddress', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 0), ('newIpAddress', 'xsd:string', 0), ('newIpv6Address', 'xsd:string', 0), ('description', 'xsd:string', 0), ('mode', 'XZzntpmode', 0)), frozenset({'sequence'}), None, False),
+    'UpdatePhoneReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('commonPhoneConfigName', 'XFkType', 0), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 4), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('versionStamp', 'String128', 4), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('securityProfileName', 'XFkType', 4), ('sipProfileName', 'XFkType', 4), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('sendGeoLocation', 'boolean', 0), ('removeLines', 'UpdatePhoneReq.removeLines', 0), ('addLines', 'UpdatePhoneReq.addLines', 0), ('lines', 'UpdatePhoneReq.lines', 0), ('phoneTemplateName', 'XFkType', 4), ('speeddials', 'UpdatePhoneReq.speeddials', 0), ('busyLampFields', 'UpdatePhoneReq.busyLampFields', 0), ('primaryPhoneName', 'XFkType', 4), ('ringSettingIdleBlfAudibleAlert', 'XStatus', 0), ('ringSettingBusyBlfAudibleAlert', 'XStatus', 0), ('blfDirectedCallParks', 'UpdatePhoneReq.blfDirectedCallParks', 0), ('addOnModules', 'UpdatePhoneReq.addOnModules', 0), ('userLocale', 'XUserLocale', 4), ('networkLocale', 'XCountry', 4), ('idleTimeout', 'XInteger', 4), ('authenticationUrl', 'xsd:string', 0), ('directoryUrl', 'xsd:string', 0), ('idleUrl', 'xsd:string', 0), ('informationUrl', 'xsd:string', 0), ('messagesUrl', 'xsd:string', 0), ('proxyServerUrl', 'xsd:string', 0), ('servicesUrl', 'xsd:string', 0), ('services', 'UpdatePhoneReq.services', 0), ('softkeyTemplateName', 'XFkType', 4), ('defaultProfileName', 'XFkType', 4), ('enableExtensionMobility', 'boolean', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('builtInBridgeStatus', 'XStatus', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('hlogStatus', 'XStatus', 0), ('ownerUserName', 'XFkType', 4), ('ignorePresentationIndicators', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('subscribeCallingSearchSpaceName', 'XFkType', 4), ('rerouteCallingSearchSpaceName', 'XFkType', 4), ('allowCtiControlFlag', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('unattendedPort', 'boolean', 0), ('requireDtmfReception', 'boolean', 0), ('rfc2833Disabled', 'boolean', 0), ('certificateOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('authenticationString', 'String128', 0), ('upgradeFinishTime', 'xsd:string', 0), ('deviceMobilityMode', 'XStatus', 0), ('remoteDevice', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndRingSetting', 'XRingSetting', 4), ('dndStatus', 'boolean', 0), ('isActive', 'boolean', 0), ('mobilityUserIdName', 'XFkType', 4), ('phoneSuite', 'XPhonePersonalization', 0), ('phoneServiceDisplay', 'XPhoneServiceDisplay', 0), ('isProtected', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('mtpPreferedCodec', 'XSIPCodec', 0), ('dialRulesName', 'XFkType', 4), ('sshUserId', 'String50', 0), ('sshPwd', 'String255', 0), ('digestUser', 'String255', 0), ('outboundCallRollover', 'XOutboundCallRollover', 0), ('hotlineDevice', 'boolean', 0), ('secureInformationUrl', 'String255', 0), ('secureDirectoryUrl', 'String255', 0), ('secureMessageUrl', 'String255', 0), ('secureServicesUrl', 'String255', 0), ('secureAuthenticationUrl', 'String255', 0), ('secureIdleUrl', 'String255', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('featureControlPolicy', 'XFkType', 4), ('deviceTrustMode', 'XDeviceTrustMode', 0), ('earlyOfferSupportForVoiceCall', 'boolean', 0), ('requireThirdPartyRegistration', 'boolean', 0), ('blockIncomingCallsWhenRoaming', 'boolean', 0), ('homeNetworkId', 'xsd:string', 0), ('AllowPresentationSharingUsingBfcp', 'boolean', 0), ('confidentialAccess', 'UpdatePhoneReq.confidentialAccess', 0), ('requireOffPremiseLocation', 'boolean', 0), ('allowiXApplicableMedia', 'boolean', 0), ('cgpnIngressDN', 'XFkType', 4), ('useDevicePoolCgpnIngressDN', 'boolean', 0), ('msisdn', 'String128', 4), ('enableCallRoutingToRdWhenNoneIsActive', 'boolean', 0), ('wifiHotspotProfile', 'XFkType', 4), ('wirelessLanProfileGroup', 'XFkType', 4), ('elinGroup', 'XFkType', 4), ('enableActivationID', 'boolean', 0), ('mraServiceDomain', 'XFkType', 4), ('allowMraMode', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdatePhoneReq.addLines': ((('line', 'XPhoneLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'UpdatePhoneReq.addOnModules': ((('addOnModule', 'XAddOnModule', 2),), frozenset(), None, False),
+    'UpdatePhoneReq.blfDirectedCallParks': ((('blfDirectedCallPark', 'XBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'UpdatePhoneReq.busyLampFields': ((('busyLampField', 'XBusyLampField', 2),), frozenset(), None, False),
+    'UpdatePhoneReq.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'UpdatePhoneReq.lines': ((('line', 'XPhoneLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'UpdatePhoneReq.removeLines': ((('line', 'XPhoneLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'UpdatePhoneReq.services': ((('service', 'XSubscribedService', 2),), frozenset(), None, False),
+    'UpdatePhoneReq.speeddials': ((('speeddial', 'XSpeeddial', 2),), frozenset(), None, False),
+    'UpdatePhoneSecurityProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 4), ('deviceSecurityMode', 'XDeviceSecurityMode', 4), ('authenticationMode', 'XAuthenticationMode', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('tftpEncryptedConfig', 'boolean', 0), ('EnableOAuthAuthentication', 'boolean', 0), ('nonceValidityTime', 'XInteger', 0), ('transportType', 'XTransport', 0), ('sipPhonePort', 'XInteger', 0), ('enableDigestAuthentication', 'boolean', 0), ('excludeDigestCredentials', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdatePhysicalLocationReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdatePresenceGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 4), ('presenceGroups', 'UpdatePresenceGroupReq.presenceGroups', 0)), frozenset({'sequence'}), None, False),
+    'UpdatePresenceGroupReq.presenceGroups': ((('presenceGroup', 'XPresenceGroupMember', 2),), frozenset(), None, False),
+    'UpdatePresenceRedundancyGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String255', 0), ('description', 'String255', 0), ('server1', 'XFkType', 4), ('server2', 'XFkType', 4), ('haEnabled', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateProcessNodeReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String255', 0), ('description', 'String50', 0), ('mac', 'XMacAddress', 0), ('ipv6Name', 'xsd:string', 0), ('lbmHubGroup', 'XFkType', 4), ('cupDomain', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateProcessNodeServiceReq': ((('uuid', 'XUUID', 0), ('processNodeName', 'XFkType', 0), ('service', 'XService', 0), ('traceLevel', 'XInteger', 0), ('userCategories', 'XInteger', 0), ('enable', 'boolean', 0), ('numFiles', 'XInteger', 0), ('maxFileSize', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateRecordingProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('recordingCssName', 'XFkType', 4), ('recorderDestination', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateRegionMatrixReq': ((('uuid', 'XUUID', 0), ('regionAName', 'XFkType', 0), ('regionBName', 'XFkType', 0), ('bandwidth', 'xsd:string', 0), ('videoBandwidth', 'XInteger', 0), ('codecPreference', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateRegionReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('relatedRegions', 'UpdateRegionReq.relatedRegions', 0)), frozenset({'sequence'}), None, False),
+    'UpdateRegionReq.relatedRegions': ((('relatedRegion', 'XRegionRelationship', 3),), frozenset(), None, False),
+    'UpdateRemoteClusterReq': ((('uuid', 'XUUID', 0), ('clusterId', 'String255', 0), ('emcc', 'XRemoteClusterMember', 0), ('pstnAccess', 'XRemoteClusterMember', 0), ('rsvpAgent', 'XRemoteClusterMember', 0), ('tftp', 'XRemoteClusterMember', 0), ('lbm', 'XRemoteClusterMember', 0), ('uds', 'XRemoteClusterMember', 0)), frozenset({'sequence'}), None, False),
+    'UpdateRemoteDestinationProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('lines', 'UpdateRemoteDestinationProfileReq.lines', 0), ('callInfoPrivacyStatus', 'XStatus', 0), ('userId', 'xsd:string', 4), ('ignorePresentationIndicators', 'boolean', 0), ('rerouteCallingSearchSpaceName', 'XFkType', 4), ('cgpnTransformationCssName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('userLocale', 'XUserLocale', 4), ('networkLocale', 'XCountry', 4), ('primaryPhoneName', 'XFkType', 4), ('dndOption', 'XDNDOption', 0), ('dndStatus', 'boolean', 0), ('mobileSmartClientProfileName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateRemoteDestinationProfileReq.lines': ((('line', 'XPhoneLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'UpdateRemoteDestinationReq': ((('uuid', 'XUUID', 0), ('destination', 'xsd:string', 0), ('newName', 'xsd:string', 0), ('newDestination', 'xsd:string', 0), ('answerTooSoonTimer', 'XInteger', 0), ('answerTooLateTimer', 'XInteger', 0), ('delayBeforeRingingCell', 'XInteger', 0), ('ownerUserId', 'XFkType', 0), ('enableUnifiedMobility', 'boolean', 0), ('remoteDestinationProfileName', 'XFkType', 4), ('enableExtendAndConnect', 'boolean', 0), ('ctiRemoteDeviceName', 'XFkType', 4), ('dualModeDeviceName', 'XFkType', 4), ('isMobilePhone', 'boolean', 0), ('enableMobileConnect', 'boolean', 0), ('lineAssociations', 'UpdateRemoteDestinationReq.lineAssociations', 0), ('timeZone', 'XTimeZone', 0), ('todAccessName', 'XFkType', 4), ('mobileSmartClientName', 'XFkType', 4), ('mobilityProfileName', 'XFkType', 4), ('singleNumberReachVoicemail', 'XVMAvoidancePolicy', 0), ('dialViaOfficeReverseVoicemail', 'XVMAvoidancePolicy', 0), ('removeRingSchedule', 'UpdateRemoteDestinationReq.removeRingSchedule', 0), ('addRingSchedule', 'UpdateRemoteDestinationReq.addRingSchedule', 0), ('ringSchedule', 'UpdateRemoteDestinationReq.ringSchedule', 0), ('accessListName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateRemoteDestinationReq.addRingSchedule': ((('member', 'XRingingSchedule', 3),), frozenset(), None, False),
+    'UpdateRemoteDestinationReq.lineAssociations': ((('lineAssociation', 'XLineAssociation', 3),), frozenset(), None, False),
+    'UpdateRemoteDestinationReq.removeRingSchedule': ((('member', 'XRingingSchedule', 3),), frozenset(), None, False),
+    'UpdateRemoteDestinationReq.ringSchedule': ((('member', 'XRingingSchedule', 3),), frozenset(), None, False),
+    'UpdateResourcePriorityNamespaceListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('removeMembers', 'UpdateResourcePriorityNamespaceListReq.removeMembers', 0), ('addMembers', 'UpdateResourcePriorityNamespaceListReq.addMembers', 0), ('members', 'UpdateResourcePriorityNamespaceListReq.members', 0)), frozenset({'sequence'}), None, False),
+    'UpdateResourcePriorityNamespaceListReq.addMembers': ((('member', 'XResourcePriorityNamespaceListMember', 3),), frozenset(), None, False),
+    'UpdateResourcePriorityNamespaceListReq.members': ((('member', 'XResourcePriorityNamespaceListMember', 3),), frozenset(), None, False),
+    'UpdateResourcePriorityNamespaceListReq.removeMembers': ((('member', 'XResourcePriorityNamespaceListMember', 3),), frozenset(), None, False),
+    'UpdateResourcePriorityNamespaceReq': ((('uuid', 'XUUID', 0), ('namespace', 'String10', 0), ('newNamespace', 'String10', 0), ('description', 'xsd:string', 0), ('isDefault', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateRouteFilterReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('dialPlanName', 'XFkType', 0), ('removeMembers', 'UpdateRouteFilterReq.removeMembers', 0), ('addMembers', 'UpdateRouteFilterReq.addMembers', 0), ('members', 'UpdateRouteFilterReq.members', 0)), frozenset({'sequence'}), None, False),
+    'UpdateRouteFilterReq.addMembers': ((('member', 'XRouteFilterMember', 2),), frozenset(), None, False),
+    'UpdateRouteFilterReq.members': ((('member', 'XRouteFilterMember', 2),), frozenset(), None, False),
+    'UpdateRouteFilterReq.removeMembers': ((('member', 'XRouteFilterMember', 2),), frozenset(), None, False),
+    'UpdateRouteGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('distributionAlgorithm', 'XDistributeAlgorithm', 0), ('removeMembers', 'UpdateRouteGroupReq.removeMembers', 0), ('addMembers', 'UpdateRouteGroupReq.addMembers', 0), ('members', 'UpdateRouteGroupReq.members', 0), ('newName', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateRouteGroupReq.addMembers': ((('member', 'XRouteGroupMember', 3),), frozenset(), None, False),
+    'UpdateRouteGroupReq.members': ((('member', 'XRouteGroupMember', 3),), frozenset(), None, False),
+    'UpdateRouteGroupReq.removeMembers': ((('member', 'XRouteGroupMember', 3),), frozenset(), None, False),
+    'UpdateRouteListReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callManagerGroupName', 'XFkType', 4), ('routeListEnabled', 'boolean', 0), ('removeMembers', 'UpdateRouteListReq.removeMembers', 0), ('addMembers', 'UpdateRouteListReq.addMembers', 0), ('members', 'UpdateRouteListReq.members', 0), ('runOnEveryNode', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateRouteListReq.addMembers': ((('member', 'XRouteListMember', 2),), frozenset(), None, False),
+    'UpdateRouteListReq.members': ((('member', 'XRouteListMember', 2),), frozenset(), None, False),
+    'UpdateRouteListReq.removeMembers': ((('member', 'XRouteListMember', 2),), frozenset(), None, False),
+    'UpdateRoutePartitionReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('timeScheduleIdName', 'XFkType', 4), ('useOriginatingDeviceTimeZone', 'boolean', 0), ('timeZone', 'XTimeZone', 0)), frozenset({'sequence'}), None, False),
+    'UpdateRoutePartitionsForLearnedPatternsReq': ((('partitionForEnterpriseANo', 'xsd:string', 1), ('partitionForE164ANo', 'xsd:string', 1), ('partitionForEnterprisePatterns', 'xsd:string', 1), ('partitionForE164Pattern', 'xsd:string', 1), ('markLearnedEntAltNumbers', 'boolean', 1), ('markLearnedE164AltNumbers', 'boolean', 1), ('markFixedLengthEntPatterns', 'boolean', 1), ('markVariableLengthEntPatterns', 'boolean', 1), ('markFixedLengthE164Patterns', 'boolean', 1), ('markVariableLengthE164Patterns', 'boolean', 1)), frozenset({'sequence'}), None, False),
+    'UpdateRoutePatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('blockEnable', 'boolean', 0), ('calledPartyTransformationMask', 'xsd:string', 4), ('callingPartyTransformationMask', 'xsd:string', 4), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 4), ('newDialPlanName', 'XFkType', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 4), ('newRouteFilterName', 'XFkType', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('supportOverlapSending', 'boolean', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('allowDeviceOverride', 'boolean', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('destination', 'UpdateRoutePatternReq.destination', 0), ('authorizationCodeRequired', 'boolean', 0), ('authorizationLevelRequired', 'XInteger', 0), ('clientCodeRequired', 'boolean', 0), ('isdnNsfInfoElement', 'UpdateRoutePatternReq.isdnNsfInfoElement', 0), ('resourcePriorityNamespaceName', 'XFkType', 4), ('routeClass', 'XPatternRouteClass', 0), ('enableDccEnforcement', 'boolean', 0), ('blockedCallPercentage', 'xsd:string', 4), ('externalCallControl', 'XFkType', 4), ('isEmergencyServiceNumber', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateRoutePatternReq.destination': ((('gatewayName', 'XFkType', 0), ('routeListName', 'XFkType', 0)), frozenset(), None, False),
+    'UpdateRoutePatternReq.isdnNsfInfoElement': ((('cic', 'xsd:string', 0), ('networkServiceProtocol', 'XPriProtocol', 1), ('networkService', 'XNSFService', 0), ('paramValue', 'xsd:string', 0)), frozenset(), None, False),
+    'UpdateSIPNormalizationScriptReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('content', 'xsd:string', 0), ('scriptExecutionErrorRecoveryAction', 'XSIPScriptErrorHandling', 0), ('systemResourceErrorRecoveryAction', 'XSIPScriptErrorHandling', 0), ('maxMemoryThreshold', 'xsd:string', 0), ('maxLuaInstructionsThreshold', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSNMPCommunityStringReq': ((('communityName', 'xsd:string', 0), ('newValues', 'RSNMPCommunityString1', 1)), frozenset({'sequence'}), None, False),
+    'UpdateSNMPMIB2ListReq': ((('sysLocation', 'xsd:string', 1), ('sysContact', 'xsd:string', 1)), frozenset({'sequence'}), None, False),
+    'UpdateSNMPUserReq': ((('user', 'RSNMPUser', 4),), frozenset({'sequence'}), None, False),
+    'UpdateSafCcdPurgeBlockLearnedRoutesReq': ((('uuid', 'XUUID', 0), ('learnedPattern', 'String50', 0), ('learnedPatternPrefix', 'String50', 0), ('callControlIdentity', 'String50', 0), ('ipAddress', 'String50', 0), ('newLearnedPattern', 'String50', 0), ('newLearnedPatternPrefix', 'String50', 0), ('newCallControlIdentity', 'String50', 0), ('newIpAddress', 'String50', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSafForwarderReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String255', 0), ('description', 'String255', 0), ('clientLabel', 'String255', 0), ('safSecurityProfile', 'XFkType', 0), ('ipAddress', 'String255', 0), ('port', 'XInteger', 0), ('enableTcpKeepAlive', 'boolean', 0), ('safReconnectInterval', 'XInteger', 0), ('safNotificationsWindowSize', 'XInteger', 0), ('removeAssociatedCucms', 'UpdateSafForwarderReq.removeAssociatedCucms', 0), ('addAssociatedCucms', 'UpdateSafForwarderReq.addAssociatedCucms', 0), ('associatedCucms', 'UpdateSafForwarderReq.associatedCucms', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSafForwarderReq.addAssociatedCucms': ((('associatedCucm', 'XSafForwarderMember', 3),), frozenset(), None, False),
+    'UpdateSafForwarderReq.associatedCucms': ((('associatedCucm', 'XSafForwarderMember', 3),), frozenset(), None, False),
+    'UpdateSafForwarderReq.removeAssociatedCucms': ((('associatedCucm', 'XSafForwarderMember', 3),), frozenset(), None, False),
+    'UpdateSafSecurityProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String255', 0), ('description', 'String255', 0), ('userid', 'String50', 0), ('password', 'String128', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSdpTransparencyProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSecureConfigReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('value', 'String50', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSelfProvisioningReq': ((('requireAuthentication', 'xsd:string', 4), ('allowAuthentication', 'xsd:string', 4), ('authenticationCode', 'xsd:string', 4), ('ctiRoutePoint', 'xsd:string', 4), ('applicationUser', 'xsd:string', 4), ('removeLanguages', 'UpdateSelfProvisioningReq.removeLanguages', 0), ('addLanguages', 'UpdateSelfProvisioningReq.addLanguages', 0), ('languages', 'UpdateSelfProvisioningReq.languages', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSelfProvisioningReq.addLanguages': ((('language', 'XSelfProvision', 2),), frozenset(), None, False),
+    'UpdateSelfProvisioningReq.languages': ((('language', 'XSelfProvision', 2),), frozenset(), None, False),
+    'UpdateSelfProvisioningReq.removeLanguages': ((('language', 'XSelfProvisionRemove', 2),), frozenset(), None, False),
+    'UpdateServiceParameterReq': ((('uuid', 'XUUID', 0), ('processNodeName', 'XFkType', 0), ('name', 'xsd:string', 0), ('service', 'XService', 0), ('value', 'xsd:string', 4)), frozenset({'sequence'}), None, False),
+    'UpdateServiceProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('isDefault', 'boolean', 0), ('serviceProfileInfos', 'UpdateServiceProfileReq.serviceProfileInfos', 0)), frozenset({'sequence'}), None, False),
+    'UpdateServiceProfileReq.serviceProfileInfos': ((('serviceProfileInfo', 'XServiceProfileList', 2), ('jabberClientConfigurationProfileInfo', 'XJabberClientConfigurationProfile', 0)), frozenset(), None, False),
+    'UpdateSipDialRulesReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 4), ('removePatterns', 'UpdateSipDialRulesReq.removePatterns', 0), ('addPatterns', 'UpdateSipDialRulesReq.addPatterns', 0), ('patterns', 'UpdateSipDialRulesReq.patterns', 0), ('removePlars', 'UpdateSipDialRulesReq.removePlars', 0), ('addPlars', 'UpdateSipDialRulesReq.addPlars', 0), ('plars', 'UpdateSipDialRulesReq.plars', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSipDialRulesReq.addPatterns': ((('pattern', 'XPatternMember', 3),), frozenset(), None, False),
+    'UpdateSipDialRulesReq.addPlars': ((('plar', 'XPatternMember', 3),), frozenset(), None, False),
+    'UpdateSipDialRulesReq.patterns': ((('pattern', 'XPatternMember', 3),), frozenset(), None, False),
+    'UpdateSipDialRulesReq.plars': ((('plar', 'XPatternMember', 3),), frozenset(), None, False),
+    'UpdateSipDialRulesReq.removePatterns': ((('pattern', 'XPatternMember', 3),), frozenset(), None, False),
+    'UpdateSipDialRulesReq.removePlars': ((('plar', 'XPatternMember', 3),), frozenset(), None, False),
+    'UpdateSipProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'String100', 4), ('defaultTelephonyEventPayloadType', 'XInteger', 0), ('redirectByApplication', 'boolean', 0), ('ringing180', 'boolean', 0), ('timerInvite', 'XInteger', 0), ('timerRegisterDelta', 'XInteger', 0), ('timerRegister', 'XInteger', 0), ('timerT1', 'XInteger', 0), ('timerT2', 'XInteger', 0), ('retryInvite', 'XInteger', 0), ('retryNotInvite', 'XInteger', 0), ('startMediaPort', 'XInteger', 0), ('stopMediaPort', 'XInteger', 0), ('startVideoPort', 'XInteger', 0), ('stopVideoPort', 'XInteger', 0), ('dscpForAudioCalls', 'xsd:string', 4), ('dscpForVideoCalls', 'xsd:string', 4), ('dscpForAudioPortionOfVideoCalls', 'xsd:string', 4), ('dscpForTelePresenceCalls', 'xsd:string', 4), ('dscpForAudioPortionOfTelePresenceCalls', 'xsd:string', 4), ('callpickupListUri', 'String128', 0), ('callpickupGroupUri', 'String128', 0), ('meetmeServiceUrl', 'String128', 0), ('userInfo', 'XZzuserInfo', 0), ('dtmfDbLevel', 'XZzdtmfDbLevel', 0), ('callHoldRingback', 'XZzpreff', 0), ('anonymousCallBlock', 'XZzpreff', 0), ('callerIdBlock', 'XZzpreff', 0), ('dndControl', 'XZzdndcontrol', 0), ('telnetLevel', 'XTelnetLevel', 0), ('timerKeepAlive', 'XInteger', 0), ('timerSubscribe', 'XInteger', 0), ('timerSubscribeDelta', 'XInteger', 0), ('maxRedirects', 'XInteger', 0), ('timerOffHookToFirstDigit', 'XInteger', 0), ('callForwardUri', 'String128', 0), ('abbreviatedDialUri', 'String128', 0), ('confJointEnable', 'boolean', 0), ('rfc2543Hold', 'boolean', 0), ('semiAttendedTransfer', 'boolean', 0), ('enableVad', 'boolean', 0), ('stutterMsgWaiting', 'boolean', 0), ('callStats', 'boolean', 0), ('t38Invite', 'boolean', 0), ('faxInvite', 'boolean', 0), ('rerouteIncomingRequest', 'XSIPReroute', 0), ('resourcePriorityNamespaceListName', 'XFkType', 4), ('enableAnatForEarlyOfferCalls', 'boolean', 0), ('rsvpOverSip', 'XRSVPOverSIP', 0), ('fallbackToLocalRsvp', 'boolean', 0), ('sipRe11XxEnabled', 'XSIPRel1XXOptions', 0), ('gClear', 'XGClear', 0), ('sendRecvSDPInMidCallInvite', 'boolean', 0), ('enableOutboundOptionsPing', 'boolean', 0), ('optionsPingIntervalWhenStatusOK', 'XInteger', 0), ('optionsPingIntervalWhenStatusNotOK', 'XInteger', 0), ('deliverConferenceBridgeIdentifier', 'boolean', 0), ('sipOptionsRetryCount', 'XInteger', 0), ('sipOptionsRetryTimer', 'XInteger', 0), ('sipBandwidthModifier', 'XSIPBandwidthModifier', 0), ('enableUriOutdialSupport', 'xsd:string', 0), ('userAgentServerHeaderInfo', 'XUserAgentServerHeaderInfo', 0), ('allowPresentationSharingUsingBfcp', 'boolean', 0), ('scriptParameters', 'xsd:string', 0), ('isScriptTraceEnabled', 'boolean', 0), ('sipNormalizationScript', 'XFkType', 4), ('allowiXApplicationMedia', 'boolean', 0), ('dialStringInterpretation', 'XURIDisambiguationPolicy', 0), ('acceptAudioCodecPreferences', 'XStatus', 0), ('mlppUserAuthorization', 'boolean', 0), ('isAssuredSipServiceEnabled', 'boolean', 0), ('enableExternalQoS', 'boolean', 0), ('resourcePriorityNamespace', 'XFkType', 4), ('useCallerIdCallerNameinUriOutgoingRequest', 'boolean', 0), ('externalPresentationInfo', 'UpdateSipProfileReq.externalPresentationInfo', 0), ('callingLineIdentification', 'XCallingLineIdentification', 0), ('rejectAnonymousIncomingCall', 'boolean', 0), ('callpickupUri', 'String128', 0), ('rejectAnonymousOutgoingCall', 'boolean', 0), ('videoCallTrafficClass', 'XVideoCallTrafficClass', 0), ('sdpTransparency', 'XFkType', 4), ('allowMultipleCodecs', 'boolean', 0), ('sipSessionRefreshMethod', 'XSipSessionRefreshMethod', 0), ('earlyOfferSuppVoiceCall', 'XEOSuppVoiceCall', 0), ('cucmVersionInSipHeader', 'XCUCMVersionInSipHeader', 0), ('confidentialAccessLevelHeaders', 'XCALHeaders', 0), ('destRouteString', 'boolean', 0), ('inactiveSDPRequired', 'boolean', 0), ('allowRRAndRSBandwidthModifier', 'boolean', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSipProfileReq.externalPresentationInfo': ((('isAnonymous', 'boolean', 0), ('presentationInfo', 'UpdateSipProfileReq.externalPresentationInfo.presentationInfo', 0)), frozenset(), None, False),
+    'UpdateSipProfileReq.externalPresentationInfo.presentationInfo': ((('externalPresentationNumber', 'xsd:string', 4), ('externalPresentationName', 'String50', 4)), frozenset(), None, False),
+    'UpdateSipRealmReq': ((('uuid', 'XUUID', 0), ('realm', 'xsd:string', 0), ('newRealm', 'xsd:string', 0), ('userid', 'xsd:string', 0), ('digestCredentials', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSipRoutePatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('blockEnable', 'boolean', 0), ('callingPartyTransformationMask', 'xsd:string', 4), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('sipTrunkName', 'XFkType', 0), ('dnOrPatternIpv6', 'xsd:string', 0), ('routeOnUserPart', 'boolean', 0), ('useCallerCss', 'boolean', 0), ('domainRoutingCssName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateSipTrunkReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 0), ('mediaResourceListName', 'XFkType', 4), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('securityProfileName', 'XFkType', 4), ('sipProfileName', 'XFkType', 4), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('sendGeoLocation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('transmitUtf8', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 4), ('rerouteCallingSearchSpaceName', 'XFkType', 4), ('referCallingSearchSpaceName', 'XFkType', 4), ('mtpRequired', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('unknownPrefix', 'String16', 0), ('destAddrIsSrv', 'boolean', 0), ('tkSipCodec', 'XSIPCodec', 0), ('sigDigits', 'UpdateSipTrunkReq.sigDigits', 4), ('connectedNamePresentation', 'XPresentationBit', 0), ('connectedPartyIdPresentation', 'XPresentationBit', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingname', 'XPresentationBit', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('prefixDn', 'String50', 4), ('externalPresentationInfo', 'UpdateSipTrunkReq.externalPresentationInfo', 0), ('acceptInboundRdnis', 'boolean', 0), ('acceptOutboundRdnis', 'boolean', 0), ('srtpAllowed', 'boolean', 0), ('srtpFallbackAllowed', 'boolean', 0), ('isPaiEnabled', 'boolean', 0), ('sipPrivacy', 'XSipPrivacy', 0), ('isRpidEnabled', 'boolean', 0), ('sipAssertedType', 'XSipAssertedType', 0), ('trustReceivedIdentity', 'XTrustReceivedIdentity', 4), ('dtmfSignalingMethod', 'XDTMFSignaling', 0), ('routeClassSignalling', 'XStatus', 0), ('sipTrunkType', 'XTrunkService', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('useImePublicIpPort', 'boolean', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('cntdPnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('rdnTransformationCssName', 'XFkType', 4), ('useDevicePoolRdnTransformCss', 'boolean', 0), ('useOrigCallingPartyPresOnDivert', 'boolean', 0), ('sipNormalizationScriptName', 'XFkType', 4), ('runOnEveryNode', 'boolean', 0), ('removeDestinations', 'UpdateSipTrunkReq.removeDestinations', 0), ('addDestinations', 'UpdateSipTrunkReq.addDestinations', 0), ('destinations', 'UpdateSipTrunkReq.destinations', 0), ('unknownStripDigits', 'XInteger', 4), ('cgpnTransformationUnknownCssName', 'XFkType', 4), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('pathReplacementSupport', 'boolean', 0), ('enableQsigUtf8', 'boolean', 0), ('scriptParameters', 'xsd:string', 0), ('scriptTraceEnabled', 'boolean', 0), ('trunkTrafficSecure', 'XSIPTrunkCallLegSecurity', 0), ('callingAndCalledPartyInfoFormat', 'XSIPIdentityBlend', 0), ('useCallerIdCallerNameinUriOutgoingRequest', 'boolean', 0), ('service', 'xsd:string', 0), ('parameterLabel', 'xsd:string', 0), ('originatingParameterValue', 'xsd:string', 0), ('terminatingParameterValue', 'xsd:string', 0), ('outboundUriRoutingInstructions', 'xsd:string', 0), ('requestUriDomainName', 'xsd:string', 0), ('enableCiscoRecordingQsigTunneling', 'boolean', 0), ('recordingInformation', 'xsd:string', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartyUnknownStripDigits', 'XInteger', 4), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('confidentialAccess', 'UpdateSipTrunkReq.confidentialAccess', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSipTrunkReq.addDestinations': ((('destination', 'XSipTrunkDestination', 2),), frozenset(), None, False),
+    'UpdateSipTrunkReq.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'UpdateSipTrunkReq.destinations': ((('destination', 'XSipTrunkDestination', 2),), frozenset(), None, False),
+    'UpdateSipTrunkReq.externalPresentationInfo': ((('isAnonymous', 'boolean', 0), ('presentationInfo', 'UpdateSipTrunkReq.externalPresentationInfo.presentationInfo', 0)), frozenset(), None, False),
+    'UpdateSipTrunkReq.externalPresentationInfo.presentationInfo': ((('externalPresentationNumber', 'xsd:string', 4), ('externalPresentationName', 'String50', 4)), frozenset(), None, False),
+    'UpdateSipTrunkReq.removeDestinations': ((('destination', 'XSipTrunkDestination', 2),), frozenset(), None, False),
+    'UpdateSipTrunkReq.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'UpdateSipTrunkSecurityProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String75', 0), ('description', 'String100', 4), ('securityMode', 'XDeviceSecurityMode', 4), ('incomingTransport', 'XTransport', 0), ('outgoingTransport', 'XTransport', 4), ('digestAuthentication', 'boolean', 0), ('noncePolicyTime', 'XInteger', 0), ('x509SubjectName', 'String4096', 0), ('incomingPort', 'XInteger', 0), ('applLevelAuthentication', 'boolean', 0), ('acceptPresenceSubscription', 'boolean', 0), ('acceptOutOfDialogRefer', 'boolean', 0), ('acceptUnsolicitedNotification', 'boolean', 0), ('allowReplaceHeader', 'boolean', 0), ('transmitSecurityStatus', 'boolean', 0), ('sipV150OutboundSdpOfferFiltering', 'XV150SDPFilter', 0), ('allowChargingHeader', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSoftKeySetReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('removeCallStates', 'UpdateSoftKeySetReq.removeCallStates', 0), ('addCallStates', 'UpdateSoftKeySetReq.addCallStates', 0), ('callStates', 'UpdateSoftKeySetReq.callStates', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSoftKeySetReq.addCallStates': ((('callState', 'XCallStateMember', 3),), frozenset(), None, False),
+    'UpdateSoftKeySetReq.callStates': ((('callState', 'XCallStateMember', 3),), frozenset(), None, False),
+    'UpdateSoftKeySetReq.removeCallStates': ((('callState', 'XCallStateMember', 3),), frozenset(), None, False),
+    'UpdateSoftKeyTemplateReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String100', 0), ('description', 'String100', 0), ('isDefault', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSrstReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('port', 'XInteger', 0), ('ipAddress', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 4), ('SipNetwork', 'xsd:string', 0), ('SipPort', 'XInteger', 0), ('isSecure', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSyslogConfigurationReq': ((('serverName', 'xsd:string', 1), ('serviceGroup', 'XServiceGrouping', 1), ('service', 'xsd:string', 1), ('alarmConfigs', 'UpdateSyslogConfigurationReq.alarmConfigs', 1), ('EndPointAlarm', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateSyslogConfigurationReq.alarmConfigs': ((('AlarmConfig', 'XSyslogConfig', 3),), frozenset(), None, False),
+    'UpdateTimePeriodReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('startTime', 'XTimeOfDay', 0), ('endTime', 'XTimeOfDay', 0), ('startDay', 'XDayOfWeek', 0), ('endDay', 'XDayOfWeek', 0), ('monthOfYear', 'XMonthOfYear', 0), ('dayOfMonth', 'XInteger', 0), ('description', 'String255', 0), ('dayOfMonthEnd', 'XInteger', 0), ('monthOfYearEnd', 'XMonthOfYear', 0)), frozenset({'sequence'}), None, False),
+    'UpdateTimeScheduleReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('removeMembers', 'UpdateTimeScheduleReq.removeMembers', 0), ('addMembers', 'UpdateTimeScheduleReq.addMembers', 0), ('members', 'UpdateTimeScheduleReq.members', 0), ('description', 'String255', 0), ('timeScheduleCategory', 'XTimeScheduleCategory', 0)), frozenset({'sequence'}), None, False),
+    'UpdateTimeScheduleReq.addMembers': ((('member', 'XTimeScheduleTimePeriod', 3),), frozenset(), None, False),
+    'UpdateTimeScheduleReq.members': ((('member', 'XTimeScheduleTimePeriod', 3),), frozenset(), None, False),
+    'UpdateTimeScheduleReq.removeMembers': ((('member', 'XTimeScheduleTimePeriod', 3),), frozenset(), None, False),
+    'UpdateTodAccessReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String128', 0), ('description', 'String255', 0), ('members', 'UpdateTodAccessReq.members', 0)), frozenset({'sequence'}), None, False),
+    'UpdateTodAccessReq.members': ((('member', 'XTODAccessMember', 1),), frozenset(), None, False),
+    'UpdateTransPatternReq': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('dialPlanName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4), ('newPattern', 'xsd:string', 0), ('description', 'xsd:string', 0), ('newRoutePartitionName', 'XFkType', 4), ('blockEnable', 'boolean', 0), ('calledPartyTransformationMask', 'xsd:string', 4), ('callingPartyTransformationMask', 'xsd:string', 4), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 4), ('newDialPlanName', 'XFkType', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 4), ('newRouteFilterName', 'XFkType', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('callingSearchSpaceName', 'XFkType', 4), ('resourcePriorityNamespaceName', 'XFkType', 4), ('routeNextHopByCgpn', 'boolean', 0), ('routeClass', 'XPatternRouteClass', 0), ('callInterceptProfileName', 'XFkType', 4), ('releaseClause', 'XReleaseCauseValue', 0), ('useOriginatorCss', 'boolean', 0), ('dontWaitForIDTOnSubsequentHops', 'boolean', 0), ('isEmergencyServiceNumber', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateTranscoderReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString255', 0), ('description', 'String128', 0), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('isTrustedRelayPoint', 'boolean', 0), ('maximumCapacity', 'XInteger', 0)), frozenset({'sequence'}), None, False),
+    'UpdateTransformationProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('nationalStripDigits', 'XInteger', 4), ('internationalStripDigits', 'XInteger', 4), ('unknownStripDigits', 'XInteger', 4), ('subscriberStripDigits', 'XInteger', 4), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('nationalCssName', 'XFkType', 4), ('internationalCssName', 'XFkType', 4), ('unknownCssName', 'XFkType', 4), ('subscriberCssName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateTvsCertificateReq': ((('uuid', 'XUUID', 0), ('issuerName', 'xsd:string', 0), ('serialNumber', 'xsd:string', 0), ('timeToLive', 'xsd:integer', 4)), frozenset({'sequence'}), None, False),
+    'UpdateUcServiceReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('hostnameorip', 'String255', 0), ('port', 'XInteger', 4), ('protocol', 'XConnectProtocol', 4), ('ucServiceXml', 'XVendorConfig', 0)), frozenset({'sequence'}), None, False),
+    'UpdateUniversalDeviceTemplateReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('deviceDescription', 'xsd:string', 0), ('devicePool', 'XFkType', 4), ('deviceSecurityProfile', 'XFkType', 4), ('sipProfile', 'XFkType', 4), ('phoneButtonTemplate', 'XFkType', 4), ('sipDialRules', 'XFkType', 4), ('callingSearchSpace', 'XFkType', 4), ('callingPartyTransformationCSSForInboundCalls', 'XFkType', 4), ('callingPartyTransformationCSSForOutboundCalls', 'XFkType', 4), ('reroutingCallingSearchSpace', 'XFkType', 4), ('subscribeCallingSearchSpaceName', 'XFkType', 4), ('useDevicePoolCallingPartyTransformationCSSforInboundCalls', 'boolean', 0), ('useDevicePoolCallingPartyTransformationCSSforOutboundCalls', 'boolean', 0), ('commonPhoneProfile', 'XFkType', 0), ('commonDeviceConfiguration', 'XFkType', 4), ('softkeyTemplate', 'XFkType', 4), ('featureControlPolicy', 'XFkType', 4), ('phonePersonalization', 'XPhonePersonalization', 0), ('mtpPreferredOriginatingCodec', 'XSIPCodec', 0), ('outboundCallRollover', 'XOutboundCallRollover', 0), ('mediaTerminationPointRequired', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('requiredDtmfReception', 'boolean', 0), ('rfc2833Disabled', 'boolean', 0), ('speeddials', 'UpdateUniversalDeviceTemplateReq.speeddials', 0), ('lines', 'UpdateUniversalDeviceTemplateReq.lines', 0), ('blfDirectedCallParks', 'UpdateUniversalDeviceTemplateReq.blfDirectedCallParks', 0), ('busyLampFields', 'UpdateUniversalDeviceTemplateReq.busyLampFields', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('protectedDevice', 'boolean', 0), ('certificateOperation', 'XCertificateOperation', 0), ('authenticationMode', 'XAuthenticationMode', 0), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('servicesProvisioning', 'XPhoneServiceDisplay', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('secureShellUser', 'xsd:string', 0), ('secureShellPassword', 'xsd:string', 0), ('userLocale', 'XUserLocale', 4), ('networkLocale', 'XCountry', 4), ('mlppDomain', 'XFkType', 4), ('mlppIndication', 'XStatus', 0), ('mlppPreemption', 'XPreemption', 0), ('doNotDisturb', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndIncomingCallAlert', 'XRingSetting', 4), ('aarGroup', 'XFkType', 4), ('aarCallingSearchSpace', 'XFkType', 4), ('blfPresenceGroup', 'XFkType', 0), ('blfAudibleAlertSettingPhoneBusy', 'XStatus', 0), ('blfAudibleAlertSettingPhoneIdle', 'XStatus', 0), ('userHoldMohAudioSource', 'XInteger', 4), ('networkHoldMohAudioSource', 'XInteger', 4), ('location', 'XFkType', 0), ('geoLocation', 'XFkType', 4), ('deviceMobilityMode', 'XStatus', 0), ('mediaResourceGroupList', 'XFkType', 4), ('remoteDevice', 'boolean', 0), ('hotlineDevice', 'boolean', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('requireOffPremiseLocation', 'boolean', 0), ('ownerUserId', 'XFkType', 4), ('mobilityUserId', 'XFkType', 4), ('joinAcrossLines', 'XStatus', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('singleButtonBarge', 'XBarge', 0), ('builtInBridge', 'XStatus', 0), ('allowControlOfDeviceFromCti', 'boolean', 0), ('ignorePresentationIndicators', 'boolean', 0), ('enableExtensionMobility', 'boolean', 0), ('privacy', 'XStatus', 0), ('loggedIntoHuntGroup', 'boolean', 0), ('proxyServer', 'xsd:string', 0), ('servicesUrl', 'xsd:string', 0), ('idle', 'xsd:string', 0), ('idleTimer', 'XInteger', 4), ('secureDirUrl', 'xsd:string', 0), ('messages', 'xsd:string', 0), ('secureIdleUrl', 'xsd:string', 0), ('authenticationServer', 'xsd:string', 0), ('directory', 'xsd:string', 0), ('secureServicesUrl', 'xsd:string', 0), ('information', 'xsd:string', 0), ('secureMessagesUrl', 'xsd:string', 0), ('secureInformationUrl', 'xsd:string', 0), ('secureAuthenticationUrl', 'xsd:string', 0), ('confidentialAccess', 'UpdateUniversalDeviceTemplateReq.confidentialAccess', 0), ('services', 'UpdateUniversalDeviceTemplateReq.services', 0)), frozenset({'sequence'}), None, False),
+    'UpdateUniversalDeviceTemplateReq.blfDirectedCallParks': ((('blfDirectedCallPark', 'XBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'UpdateUniversalDeviceTemplateReq.busyLampFields': ((('busyLampField', 'XBusyLampField', 2),), frozenset(), None, False),
+    'UpdateUniversalDeviceTemplateReq.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'UpdateUniversalDeviceTemplateReq.lines': ((('line', 'XUDTLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'UpdateUniversalDeviceTemplateReq.services': ((('service', 'XSubscribedService', 2),), frozenset(), None, False),
+    'UpdateUniversalDeviceTemplateReq.speeddials': ((('speeddial', 'XSpeeddial', 2),), frozenset(), None, False),
+    'UpdateUniversalLineTemplateReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('urgentPriority', 'boolean', 0), ('lineDescription', 'xsd:string', 0), ('routePartition', 'XFkType', 4), ('voiceMailProfile', 'XFkType', 4), ('callingSearchSpace', 'XFkType', 4), ('alertingName', 'xsd:string', 0), ('extCallControlProfile', 'XFkType', 4), ('blfPresenceGroup', 'XFkType', 0), ('callPickupGroup', 'XFkType', 0), ('partyEntranceTone', 'XStatus', 0), ('autoAnswer', 'XAutoAnswer', 0), ('rejectAnonymousCall', 'boolean', 0), ('userHoldMohAudioSource', 'XMOHAudioSourceId', 4), ('networkHoldMohAudioSource', 'XMOHAudioSourceId', 4), ('aarDestinationMask', 'String128', 4), ('aarGroup', 'XFkType', 4), ('retainDestInCallFwdHistory', 'boolean', 0), ('forwardDestAllCalls', 'xsd:string', 0), ('primaryCssForwardingAllCalls', 'XFkType', 4), ('secondaryCssForwardingAllCalls', 'XFkType', 4), ('CssActivationPolicy', 'XCFACSSActivationPolicy', 0), ('fwdDestExtCallsWhenNotRetrieved', 'xsd:string', 4), ('cssFwdExtCallsWhenNotRetrieved', 'XFkType', 4), ('fwdDestInternalCallsWhenNotRetrieved', 'xsd:string', 0), ('cssFwdInternalCallsWhenNotRetrieved', 'XFkType', 4), ('parkMonitorReversionTime', 'XInteger', 4), ('target', 'xsd:string', 4), ('mlppCss', 'XFkType', 4), ('mlppNoAnsRingDuration', 'XInteger', 4), ('confidentialAccess', 'UpdateUniversalLineTemplateReq.confidentialAccess', 0), ('holdReversionRingDuration', 'XInteger', 4), ('holdReversionNotificationInterval', 'XInteger', 4), ('busyIntCallsDestination', 'xsd:string', 0), ('busyIntCallsCss', 'XFkType', 4), ('busyExtCallsDestination', 'xsd:string', 0), ('busyExtCallsCss', 'XFkType', 4), ('noAnsIntCallsDestination', 'xsd:string', 0), ('noAnsIntCallsCss', 'XFkType', 4), ('noAnsExtCallsDestination', 'xsd:string', 0), ('noAnsExtCallsCss', 'XFkType', 4), ('noCoverageIntCallsDestination', 'xsd:string', 0), ('noCoverageIntCallsCss', 'XFkType', 4), ('noCoverageExtCallsDestination', 'xsd:string', 0), ('noCoverageExtCallsCss', 'XFkType', 4), ('unregisteredIntCallsDestination', 'xsd:string', 0), ('unregisteredIntCallsCss', 'XFkType', 4), ('unregisteredExtCallsDestination', 'xsd:string', 0), ('unregisteredExtCallsCss', 'XFkType', 4), ('ctiFailureDestination', 'xsd:string', 0), ('ctiFailureCss', 'XFkType', 4), ('callControlAgentProfile', 'xsd:string', 0), ('noAnswerRingDuration', 'XInteger', 4), ('enterpriseAltNum', 'UpdateUniversalLineTemplateReq.enterpriseAltNum', 0), ('e164AltNum', 'UpdateUniversalLineTemplateReq.e164AltNum', 0), ('advertisedFailoverNumber', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateUniversalLineTemplateReq.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'UpdateUniversalLineTemplateReq.e164AltNum': ((('member', 'XE164AltNum', 0),), frozenset(), None, False),
+    'UpdateUniversalLineTemplateReq.enterpriseAltNum': ((('member', 'XEnterpriseAltNum', 0),), frozenset(), None, False),
+    'UpdateUserGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('removeMembers', 'UpdateUserGroupReq.removeMembers', 0), ('addMembers', 'UpdateUserGroupReq.addMembers', 0), ('members', 'UpdateUserGroupReq.members', 0), ('removeUserRoles', 'UpdateUserGroupReq.removeUserRoles', 0), ('addUserRoles', 'UpdateUserGroupReq.addUserRoles', 0), ('userRoles', 'UpdateUserGroupReq.userRoles', 0), ('newName', 'UniqueString128', 0)), frozenset({'sequence'}), None, False),
+    'UpdateUserGroupReq.addMembers': ((('member', 'XUserGroupMember', 2),), frozenset(), None, False),
+    'UpdateUserGroupReq.addUserRoles': ((('userRole', 'XUserGroupRoles', 2),), frozenset(), None, False),
+    'UpdateUserGroupReq.members': ((('member', 'XUserGroupMember', 2),), frozenset(), None, False),
+    'UpdateUserGroupReq.removeMembers': ((('member', 'XUserGroupMember', 2),), frozenset(), None, False),
+    'UpdateUserGroupReq.removeUserRoles': ((('userRole', 'XUserGroupRoles', 2),), frozenset(), None, False),
+    'UpdateUserGroupReq.userRoles': ((('userRole', 'XUserGroupRoles', 2),), frozenset(), None, False),
+    'UpdateUserProfileProvisionReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'String255', 0), ('deskPhones', 'XFkType', 0), ('mobileDevices', 'XFkType', 0), ('profile', 'XFkType', 0), ('universalLineTemplate', 'XFkType', 0), ('allowProvision', 'boolean', 0), ('limitProvision', 'XInteger', 0), ('defaultUserProfile', 'XFkType', 0), ('enableMra', 'boolean', 0), ('mraPolicy_Desktop', 'XMRAPolicy', 0), ('mraPolicy_Mobile', 'XMRAPolicy', 0), ('allowProvisionEMMaxLoginTime', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateUserReq': ((('uuid', 'XUUID', 0), ('userid', 'xsd:string', 0), ('firstName', 'xsd:string', 0), ('displayName', 'xsd:string', 0), ('middleName', 'xsd:string', 0), ('lastName', 'xsd:string', 0), ('emMaxLoginTime', 'XInteger', 4), ('newUserid', 'xsd:string', 0), ('password', 'xsd:string', 0), ('pin', 'xsd:string', 0), ('mailid', 'xsd:string', 0), ('department', 'xsd:string', 0), ('manager', 'xsd:string', 0), ('userLocale', 'XUserLocale', 4), ('associatedDevices', 'UpdateUserReq.associatedDevices', 0), ('primaryExtension', 'UpdateUserReq.primaryExtension', 0), ('associatedPc', 'xsd:string', 0), ('associatedGroups', 'UpdateUserReq.associatedGroups', 0), ('enableCti', 'boolean', 0), ('digestCredentials', 'xsd:string', 4), ('phoneProfiles', 'UpdateUserReq.phoneProfiles', 0), ('defaultProfile', 'XFkType', 0), ('presenceGroupName', 'XFkType', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 4), ('enableMobility', 'boolean', 0), ('enableMobileVoiceAccess', 'boolean', 0), ('maxDeskPickupWaitTime', 'XInteger', 0), ('remoteDestinationLimit', 'XInteger', 0), ('passwordCredentials', 'UpdateUserReq.passwordCredentials', 0), ('pinCredentials', 'UpdateUserReq.pinCredentials', 0), ('enableEmcc', 'boolean', 0), ('ctiControlledDeviceProfiles', 'UpdateUserReq.ctiControlledDeviceProfiles', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('numericUserId', 'xsd:string', 0), ('mlppPassword', 'xsd:string', 4), ('customUserFields', 'UpdateUserReq.customUserFields', 0), ('homeCluster', 'boolean', 0), ('imAndPresenceEnable', 'boolean', 0), ('serviceProfile', 'XFkType', 4), ('lineAppearanceAssociationForPresences', 'UpdateUserReq.lineAppearanceAssociationForPresences', 0), ('directoryUri', 'xsd:string', 4), ('telephoneNumber', 'xsd:string', 0), ('title', 'xsd:string', 0), ('mobileNumber', 'xsd:string', 0), ('homeNumber', 'xsd:string', 0), ('pagerNumber', 'xsd:string', 0), ('removeExtensionsInfo', 'UpdateUserReq.removeExtensionsInfo', 0), ('addExtensionsInfo', 'UpdateUserReq.addExtensionsInfo', 0), ('extensionsInfo', 'UpdateUserReq.extensionsInfo', 0), ('selfService', 'UniqueString50', 4), ('userProfile', 'XFkType', 4), ('calendarPresence', 'boolean', 0), ('ldapDirectoryName', 'XFkType', 4), ('userIdentity', 'xsd:string', 0), ('nameDialing', 'xsd:string', 0), ('ipccExtension', 'XFkType', 4), ('ipccRoutePartition', 'XFkType', 4), ('convertUserAccount', 'XFkType', 4), ('enableUserToHostConferenceNow', 'boolean', 0), ('attendeesAccessCode', 'xsd:string', 0), ('zeroHop', 'boolean', 0), ('customerName', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateUserReq.addExtensionsInfo': ((('extension', 'XExtension', 2),), frozenset(), None, False),
+    'UpdateUserReq.associatedDevices': ((('device', 'String50', 2),), frozenset(), None, False),
+    'UpdateUserReq.associatedGroups': ((('userGroup', 'UpdateUserReq.associatedGroups.userGroup', 2),), frozenset(), None, False),
+    'UpdateUserReq.associatedGroups.userGroup': ((('name', 'String100', 1), ('userRoles', 'UpdateUserReq.associatedGroups.userGroup.userRoles', 0)), frozenset(), None, False),
+    'UpdateUserReq.associatedGroups.userGroup.userRoles': ((('userRole', 'String100', 2),), frozenset(), None, False),
+    'UpdateUserReq.ctiControlledDeviceProfiles': ((('profileName', 'XFkType', 3),), frozenset(), None, False),
+    'UpdateUserReq.customUserFields': ((('customUserField', 'XUserCustomUserField', 2),), frozenset(), None, False),
+    'UpdateUserReq.extensionsInfo': ((('extension', 'XExtension', 2),), frozenset(), None, False),
+    'UpdateUserReq.lineAppearanceAssociationForPresences': ((('lineAppearanceAssociationForPresence', 'XLineAppearanceAssociationForPresence', 2),), frozenset(), None, False),
+    'UpdateUserReq.passwordCredentials': ((('pwdCredPolicyName', 'XFkType', 0), ('pwdCredUserCantChange', 'boolean', 0), ('pwdCredUserMustChange', 'boolean', 0), ('pwdCredDoesNotExpire', 'boolean', 0), ('pwdCredTimeChanged', 'xsd:string', 0), ('pwdCredTimeAdminLockout', 'xsd:string', 4), ('pwdCredLockedByAdministrator', 'boolean', 0), ('pwdResetHackCount', 'boolean', 0)), frozenset(), None, False),
+    'UpdateUserReq.phoneProfiles': ((('profileName', 'XFkType', 3),), frozenset(), None, False),
+    'UpdateUserReq.pinCredentials': ((('pinCredPolicyName', 'XFkType', 0), ('pinCredUserCantChange', 'boolean', 0), ('pinCredUserMustChange', 'boolean', 0), ('pinCredDoesNotExpire', 'boolean', 0), ('pinCredTimeChanged', 'boolean', 0), ('pinCredTimeAdminLockout', 'xsd:string', 4), ('pinCredLockedByAdministrator', 'boolean', 0), ('pinResetHackCount', 'boolean', 0)), frozenset(), None, False),
+    'UpdateUserReq.primaryExtension': ((('pattern', 'String255', 1), ('routePartitionName', 'String50', 0)), frozenset(), None, False),
+    'UpdateUserReq.removeExtensionsInfo': ((('extension', 'XExtension', 2),), frozenset(), None, False),
+    'UpdateVg224Req': ((('uuid', 'XUUID', 0), ('domainName', 'xsd:string', 0), ('newDomainName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('callManagerGroupName', 'XFkType', 4), ('vendorConfig', 'XVendorConfig', 4)), frozenset({'sequence'}), None, False),
+    'UpdateVohServerReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('sipTrunkName', 'XFkType', 0), ('defaultVideoStreamId', 'xsd:string', 0)), frozenset({'sequence'}), None, False),
+    'UpdateVoiceMailPilotReq': ((('uuid', 'XUUID', 0), ('dirn', 'String255', 4), ('cssName', 'XFkType', 4), ('newDirn', 'String255', 4), ('description', 'String50', 0), ('newCssName', 'XFkType', 4), ('isDefault', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateVoiceMailPortReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString128', 0), ('description', 'String128', 0), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('locationName', 'XFkType', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('securityProfileName', 'XFkType', 4), ('geoLocationName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('dnPattern', 'xsd:string', 0), ('routePartition', 'XFkType', 4), ('dnCallingSearchSpace', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('callerIdDisplay', 'String128', 0), ('callerIdDisplayAscii', 'String50', 0), ('externalMask', 'xsd:string', 4)), frozenset({'sequence'}), None, False),
+    'UpdateVoiceMailProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'String50', 0), ('isDefault', 'boolean', 0), ('voiceMailboxMask', 'xsd:string', 4), ('voiceMailPilot', 'XVmPilot', 0)), frozenset({'sequence'}), None, False),
+    'UpdateVpnGatewayReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('url', 'String255', 0), ('certificates', 'UpdateVpnGatewayReq.certificates', 0)), frozenset({'sequence'}), None, False),
+    'UpdateVpnGatewayReq.certificates': ((('certificate', 'XVpnGatewayMember', 3),), frozenset(), None, False),
+    'UpdateVpnGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('vpnGateways', 'UpdateVpnGroupReq.vpnGateways', 0)), frozenset({'sequence'}), None, False),
+    'UpdateVpnGroupReq.vpnGateways': ((('vpnGateway', 'XVpnGroupMember', 2),), frozenset(), None, False),
+    'UpdateVpnProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String50', 0), ('description', 'xsd:string', 0), ('autoNetworkDetection', 'boolean', 0), ('mtu', 'XInteger', 0), ('failToConnect', 'XInteger', 0), ('clientAuthentication', 'XVPNClientAuthentication', 0), ('pwdPersistant', 'boolean', 0), ('enableHostIdCheck', 'boolean', 0)), frozenset({'sequence'}), None, False),
+    'UpdateWLANProfileReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('ssid', 'xsd:string', 0), ('frequencyBand', 'XWiFiFrequency', 0), ('userModifiable', 'XWLANProfileChanges', 0), ('authMethod', 'XWiFiAuthenticationMethod', 0), ('userName', 'xsd:string', 0), ('password', 'xsd:string', 0), ('pskPassphrase', 'xsd:string', 0), ('wepKey', 'xsd:string', 0), ('passwordDescription', 'xsd:string', 0), ('networkAccessProfile', 'XFkType', 4)), frozenset({'sequence'}), None, False),
+    'UpdateWifiHotspotReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'UniqueString50', 0), ('description', 'String255', 0), ('ssidPrefix', 'xsd:string', 0), ('userModifiable', 'XWLANProfileChanges', 0), ('frequencyBand', 'XWiFiFrequency', 0), ('authenticationMethod', 'XHotspotAuthenticationMethod', 0), ('hostName', 'String64', 0), ('port', 'XInteger', 0), ('sharedSecret', 'xsd:string', 4), ('pskPassPhrase', 'xsd:string', 4), ('wepKey', 'xsd:string', 4), ('passwordDescription', 'String255', 0)), frozenset({'sequence'}), None, False),
+    'UpdateWirelessAccessPointControllersReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'String255', 0), ('description', 'xsd:string', 0), ('snmpVersion', 'XSNMPVersion', 0), ('snmpUserIdOrCommunityString', 'xsd:string', 0), ('snmpAuthenticationProtocol', 'XSNMPAuthenticationProtocol', 0), ('snmpAuthenticationPassword', 'xsd:string', 0), ('snmpPrivacyProtocol', 'XSNMPPrivacyProtocol', 0), ('snmpPrivacyPassword', 'xsd:string', 0), ('syncNow', 'boolean', 0), ('resyncInterval', 'XInteger', 0), ('nextSyncTime', 'XInteger', 0), ('scheduleUnit', 'XScheduleUnit', 0)), frozenset({'sequence'}), None, False),
+    'UpdateWlanProfileGroupReq': ((('name', 'String100', 0), ('uuid', 'XUUID', 0), ('newName', 'xsd:string', 0), ('description', 'xsd:string', 0), ('removeMembers', 'UpdateWlanProfileGroupReq.removeMembers', 0), ('addMembers', 'UpdateWlanProfileGroupReq.addMembers', 0), ('members', 'UpdateWlanProfileGroupReq.members', 0)), frozenset({'sequence'}), None, False),
+    'UpdateWlanProfileGroupReq.addMembers': ((('member', 'XWirelessLanProfileGroup', 2),), frozenset(), None, False),
+    'UpdateWlanProfileGroupReq.members': ((('member', 'XWirelessLanProfileGroup', 2),), frozenset(), None, False),
+    'UpdateWlanProfileGroupReq.removeMembers': ((('member', 'XWirelessLanProfileGroup', 2),), frozenset(), None, False),
+    'XAarGroup': ((('name', 'String32', 1),), frozenset(), None, False),
+    'XAddOnModule': ((('loadInformation', 'XLoadInformation', 4), ('model', 'XModel', 1), ('index', 'XInteger', 1)), frozenset(), None, False),
+    'XAdvertisedPatterns': ((('description', 'xsd:string', 0), ('pattern', 'xsd:string', 1), ('patternType', 'XGlobalNumber', 0), ('hostedRoutePSTNRule', 'XHostedRoutePatternPSTNRule', 0), ('pstnFailStrip', 'XInteger', 1), ('pstnFailPrepend', 'xsd:string', 0)), frozenset(), None, False),
+    'XAnalogPort': ((('portNumber', 'XInteger', 1), ('attendantDn', 'String255', 0), ('unattendedPort', 'boolean', 4), ('callerIdDn', 'String255', 4), ('callerIdEnable', 'boolean', 1), ('callingPartySelection', 'XCallingPartySelection', 0), ('digitSending', 'XDigitSending', 0), ('expectedDigits', 'XInteger', 1), ('sigDigits', 'XAnalogPort.sigDigits', 1), ('lines', 'XAnalogPort.lines', 0), ('prefixDn', 'String255', 4), ('presentationBit', 'XPresentationBit', 0), ('silenceSuppressionThreshold', 'XSilenceSuppressionThreshold', 0), ('smdiPortNumber', 'XInteger', 1), ('startDialProtocol', 'XStartDialProtocol', 0), ('trunk', 'XTrunk', 0), ('trunkDirection', 'XTrunkDirection', 1), ('trunkLevel', 'XTrunkLevel', 0), ('trunkPadRx', 'XTrunkPad', 0), ('trunkPadTx', 'XTrunkPad', 0), ('vendorConfig', 'XVendorConfig', 4), ('timer1', 'XInteger', 1), ('timer2', 'XInteger', 1), ('timer3', 'XInteger', 1), ('timer4', 'XInteger', 1), ('timer5', 'XInteger', 1), ('timer6', 'XInteger', 1)), frozenset(), None, False),
+    'XAnalogPort.lines': ((('line', 'XPhoneLine', 0), ('lineIdentifier', 'XNumplanIdentifier', 0)), frozenset(), None, False),
+    'XAnalogPort.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'XAnnouncement': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 4), ('announcementFile', 'xsd:string', 4)), frozenset(), None, False),
+    'XAppServerInfo': ((('appServerName', 'XFkType', 1), ('appServerContent', 'XAppServerContent', 1), ('content', 'XContent', 4)), frozenset(), None, False),
+    'XAppUser': ((('userid', 'xsd:string', 1), ('password', 'xsd:string', 0), ('passwordCredentials', 'XAppUser.passwordCredentials', 0), ('digestCredentials', 'xsd:string', 0), ('presenceGroupName', 'XFkType', 0), ('acceptPresenceSubscription', 'boolean', 0), ('acceptOutOfDialogRefer', 'boolean', 0), ('acceptUnsolicitedNotification', 'boolean', 0), ('allowReplaceHeader', 'boolean', 0), ('associatedDevices', 'XAppUser.associatedDevices', 0), ('associatedGroups', 'XAppUser.associatedGroups', 0), ('ctiControlledDeviceProfiles', 'XAppUser.ctiControlledDeviceProfiles', 0)), frozenset(), None, False),
+    'XAppUser.associatedDevices': ((('device', 'String50', 2),), frozenset(), None, False),
+    'XAppUser.associatedGroups': ((('userGroup', 'XAppUser.associatedGroups.userGroup', 2),), frozenset(), None, False),
+    'XAppUser.associatedGroups.userGroup': ((('name', 'String100', 1), ('userRoles', 'XAppUser.associatedGroups.userGroup.userRoles', 0)), frozenset(), None, False),
+    'XAppUser.associatedGroups.userGroup.userRoles': ((('userRole', 'String100', 2),), frozenset(), None, False),
+    'XAppUser.ctiControlledDeviceProfiles': ((('deviceProfile', 'String50', 2),), frozenset(), None, False),
+    'XAppUser.passwordCredentials': ((('pwdCredPolicyName', 'XFkType', 0), ('pwdCredUserCantChange', 'boolean', 0), ('pwdCredUserMustChange', 'boolean', 0), ('pwdCredDoesNotExpire', 'boolean', 0), ('pwdCredTimeChanged', 'xsd:string', 0), ('pwdCredTimeAdminLockout', 'xsd:string', 4), ('pwdCredLockedByAdministrator', 'boolean', 0), ('pwdResetHackCount', 'boolean', 0)), frozenset(), None, False),
+    'XApplicationDialRules': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('numberBeginWith', 'xsd:string', 0), ('numberOfDigits', 'XInteger', 1), ('digitsToBeRemoved', 'XInteger', 1), ('prefixPattern', 'xsd:string', 0), ('priority', 'XInteger', 1)), frozenset(), None, False),
+    'XApplicationServer': ((('appServerType', 'XAppServer', 1), ('name', 'xsd:string', 1), ('ipAddress', 'xsd:string', 0), ('appUsers', 'XApplicationServer.appUsers', 0), ('url', 'xsd:string', 0), ('endUserUrl', 'xsd:string', 0), ('processNodeName', 'XFkType', 4), ('endUsers', 'XApplicationServer.endUsers', 0)), frozenset(), None, False),
+    'XApplicationServer.appUsers': ((('selectedAppUser', 'XApplicationServer.appUsers.selectedAppUser', 3),), frozenset(), None, False),
+    'XApplicationServer.appUsers.selectedAppUser': ((('appUserName', 'XFkType', 1), ('content', 'XContent', 4)), frozenset(), None, False),
+    'XApplicationServer.endUsers': ((('selectedEndUser', 'XApplicationServer.endUsers.selectedEndUser', 3),), frozenset(), None, False),
+    'XApplicationServer.endUsers.selectedEndUser': ((('endUserName', 'XFkType', 1), ('content', 'XContent', 4)), frozenset(), None, False),
+    'XApplicationToSoftKeyTemplate': ((('softKeyTemplateName', 'XFkType', 1), ('standardSoftKeyTemplateName', 'XFkType', 1)), frozenset({'uuid'}), None, False),
+    'XApplicationUserCapfProfile': ((('applicationUser', 'XFkType', 1), ('instanceId', 'xsd:string', 1), ('certificateOperation', 'XCertificateOperation', 1), ('authenticationMode', 'XAuthenticationMode', 1), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 1), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('operationCompletion', 'xsd:string', 0)), frozenset(), None, False),
+    'XAudioCodecPreferenceList': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 1), ('codecsInList', 'XAudioCodecPreferenceList.codecsInList', 1)), frozenset(), None, False),
+    'XAudioCodecPreferenceList.codecsInList': ((('codecNames', 'xsd:string', 3),), frozenset(), None, False),
+    'XBLFDirectedCallPark': ((('label', 'String50', 0), ('directedCallParkId', 'XUUID', 0), ('directedCallParkDnAndPartition', 'XBLFDirectedCallPark.directedCallParkDnAndPartition', 0), ('index', 'XInteger', 1)), frozenset(), None, False),
+    'XBLFDirectedCallPark.directedCallParkDnAndPartition': ((('dnPattern', 'String255', 1), ('routePartitionName', 'XFkType', 0)), frozenset(), None, False),
+    'XBillingServer': ((('hostName', 'xsd:string', 1), ('userId', 'xsd:string', 1), ('password', 'xsd:string', 1), ('directory', 'xsd:string', 1), ('resendOnFailure', 'boolean', 0), ('billingServerProtocol', 'XBillingserverprotocol', 1)), frozenset(), None, False),
+    'XBlockedLearnedPatterns': ((('description', 'xsd:string', 0), ('pattern', 'xsd:string', 0), ('prefix', 'xsd:string', 0), ('clusterId', 'xsd:string', 0), ('patternType', 'XGlobalNumber', 4)), frozenset(), None, False),
+    'XBusyLampField': ((('blfDest', 'xsd:string', 1), ('blfDirn', 'String255', 0), ('routePartition', 'xsd:string', 0), ('label', 'xsd:string', 0), ('associatedBlfSdFeatures', 'XBusyLampField.associatedBlfSdFeatures', 0), ('index', 'XInteger', 1)), frozenset(), None, False),
+    'XBusyLampField.associatedBlfSdFeatures': ((('feature', 'XBLFSDOption', 2),), frozenset(), None, False),
+    'XButton': ((('feature', 'XFeature', 1), ('label', 'String50', 0), ('buttonNumber', 'XInteger', 1)), frozenset(), None, False),
+    'XCCAProfiles': ((('ccaId', 'xsd:string', 1), ('primarySoftSwitchId', 'xsd:string', 1), ('secondarySoftSwitchId', 'xsd:string', 4), ('objectClass', 'xsd:string', 1), ('subscriberType', 'xsd:string', 4), ('sipAliasSuffix', 'xsd:string', 4), ('sipUserNameSuffix', 'xsd:string', 4)), frozenset(), None, False),
+    'XCallForwardAll': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4), ('secondaryCallingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4)), frozenset(), None, False),
+    'XCallForwardAlternateParty': ((('callingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4), ('duration', 'XInteger', 0)), frozenset(), None, False),
+    'XCallForwardBusy': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4)), frozenset(), None, False),
+    'XCallForwardBusyInt': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4)), frozenset(), None, False),
+    'XCallForwardNoAnswer': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4), ('duration', 'XInteger', 4)), frozenset(), None, False),
+    'XCallForwardNoAnswerInt': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4), ('duration', 'XInteger', 4)), frozenset(), None, False),
+    'XCallForwardNoCoverage': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4)), frozenset(), None, False),
+    'XCallForwardNoCoverageInt': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4)), frozenset(), None, False),
+    'XCallForwardNotRegistered': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4)), frozenset(), None, False),
+    'XCallForwardNotRegisteredInt': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4)), frozenset(), None, False),
+    'XCallForwardOnFailure': ((('forwardToVoiceMail', 'boolean', 0), ('callingSearchSpaceName', 'XFkType', 4), ('destination', 'String50', 4)), frozenset(), None, False),
+    'XCallManagerGroup': ((('name', 'String50', 1), ('tftpDefault', 'boolean', 0), ('members', 'XCallManagerGroup.members', 1)), frozenset(), None, False),
+    'XCallManagerGroup.members': ((('member', 'XCallManagerMember', 3),), frozenset(), None, False),
+    'XCallManagerMember': ((('callManagerName', 'XFkType', 1), ('priority', 'XInteger', 1)), frozenset(), None, False),
+    'XCallPark': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('callManagerName', 'XFkType', 4)), frozenset(), None, False),
+    'XCallPickupGroup': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('members', 'XCallPickupGroup.members', 0), ('pickupNotification', 'XPickupNotification', 0), ('pickupNotificationTimer', 'XInteger', 0), ('callInfoForPickupNotification', 'XCallPickupGroup.callInfoForPickupNotification', 0), ('name', 'xsd:string', 1)), frozenset(), None, False),
+    'XCallPickupGroup.callInfoForPickupNotification': ((('callingPartyInfo', 'boolean', 0), ('calledPartyInfo', 'boolean', 0)), frozenset(), None, False),
+    'XCallPickupGroup.members': ((('member', 'XPickupGroupMember', 2),), frozenset(), None, False),
+    'XCallStateMember': ((('callStateName', 'xsd:string', 4), ('softKeys', 'XCallStateMember.softKeys', 0)), frozenset(), None, False),
+    'XCallStateMember.softKeys': ((('softKey', 'XSoftKeyMember', 2),), frozenset(), None, False),
+    'XCalledPartyTracing': ((('directorynumber', 'xsd:string', 1), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'XCalledPartyTransformationPattern': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('calledPartyTransformationMask', 'xsd:string', 4), ('dialPlanName', 'XFkType', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('routeFilterName', 'XFkType', 4), ('calledPartyPrefixDigits', 'xsd:string', 4), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('mlppPreemptionDisabled', 'boolean', 0)), frozenset(), None, False),
+    'XCallerFilterList': ((('name', 'String50', 1), ('description', 'String128', 0), ('isAllowedType', 'boolean', 1), ('endUserIdName', 'XFkType', 4), ('members', 'XCallerFilterList.members', 0)), frozenset(), None, False),
+    'XCallerFilterList.members': ((('member', 'XCallerFilterListMember', 3),), frozenset(), None, False),
+    'XCallerFilterListMember': ((('DnMask', 'String50', 1), ('callerFilterMask', 'XCallerFilterMask', 1)), frozenset(), None, False),
+    'XCallingPartyTransformationPattern': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('callingPartyTransformationMask', 'xsd:string', 4), ('useCallingPartyPhoneMask', 'XStatus', 0), ('dialPlanName', 'XFkType', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('callingPartyPrefixDigits', 'String50', 4), ('routeFilterName', 'XFkType', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('mlppPreemptionDisabled', 'boolean', 0)), frozenset(), None, False),
+    'XCallingSearchSpaceMember': ((('routePartitionName', 'XFkType', 1), ('index', 'XInteger', 1)), frozenset(), None, False),
+    'XCallsQueue': ((('maxCallersInQueue', 'XInteger', 1), ('queueFullDestination', 'String50', 4), ('callingSearchSpacePilotQueueFull', 'XFkType', 4), ('maxWaitTimeInQueue', 'XInteger', 1), ('maxWaitTimeDestination', 'String50', 4), ('callingSearchSpaceMaxWaitTime', 'XFkType', 4), ('noAgentDestination', 'String50', 4), ('callingSearchSpaceNoAgent', 'XFkType', 4), ('networkHoldMohAudioSourceID', 'XInteger', 4)), frozenset(), None, False),
+    'XCcdAdvertisingService': ((('name', 'String50', 1), ('description', 'String50', 0), ('isActivated', 'boolean', 0), ('hostDnGroup', 'XFkType', 1), ('safSipTrunk', 'XFkType', 4), ('safH323Trunk', 'XFkType', 4)), frozenset(), None, False),
+    'XCcdFeatureConfig': ((('ccdParamName', 'xsd:string', 1), ('ccdParamValue', 'xsd:string', 1)), frozenset(), None, False),
+    'XCcdHostedDN': ((('hostedPattern', 'String50', 1), ('description', 'String255', 0), ('CcdHostedDnGroup', 'XFkType', 1), ('pstnFailoverStripDigits', 'XInteger', 4), ('pstnFailoverPrependDigits', 'String255', 0), ('usePstnFailover', 'boolean', 0)), frozenset(), None, False),
+    'XCcdHostedDNGroup': ((('name', 'String255', 1), ('description', 'String255', 0), ('pstnFailoverStripDigits', 'XInteger', 4), ('pstnFailoverPrependDigits', 'String255', 0), ('usePstnFailover', 'boolean', 0)), frozenset(), None, False),
+    'XCcdRequestingService': ((('name', 'String50', 1), ('description', 'String50', 0), ('isActivated', 'boolean', 0), ('routePartitionName', 'XFkType', 4), ('learnedPatternPrefix', 'String50', 0), ('pstnPrefix', 'String50', 0), ('associatedTrunks', 'XCcdRequestingService.associatedTrunks', 0)), frozenset(), None, False),
+    'XCcdRequestingService.associatedTrunks': ((('associatedTrunk', 'XCcdRequestingServiceMember', 3),), frozenset(), None, False),
+    'XCcdRequestingServiceMember': ((('trunkName', 'XFkType', 1),), frozenset(), None, False),
+    'XCcmExternalIpMap': ((('callManagerName', 'XFkType', 0), ('ipAddressHost', 'String255', 0), ('port', 'String255', 0)), frozenset(), None, False),
+    'XCiscoCatalyst600024PortFXSGateway': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocale', 'XCountry', 4), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('ports', 'XCiscoCatalyst600024PortFXSGateway.ports', 0), ('portSelectionOrder', 'XTrunkSelectionOrder', 1), ('transmitUtf8', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 4)), frozenset(), None, False),
+    'XCiscoCatalyst600024PortFXSGateway.ports': ((('port', 'XAnalogPort', 3),), frozenset(), None, False),
+    'XCiscoCatalyst6000E1VoIPGateway': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 1), ('networkLocale', 'XCountry', 4), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 4), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('redirectInboundNumberIe', 'boolean', 1), ('calledPlan', 'XNumberingPlan', 1), ('calledPri', 'XPriOfNumber', 1), ('callerIdDn', 'String255', 4), ('callingPartySelection', 'XCallingPartySelection', 1), ('callingPlan', 'XNumberingPlan', 1), ('callingPri', 'XPriOfNumber', 1), ('chanIe', 'XPRIChanIE', 1), ('clockReference', 'XClockReference', 1), ('dChannelEnable', 'boolean', 1), ('channelSelectionOrder', 'XTrunkSelectionOrder', 1), ('displayIE', 'boolean', 1), ('pcmType', 'XEncode', 1), ('csuParam', 'XCSUParam', 1), ('firstDelay', 'XInteger', 1), ('interfaceIdPresent', 'boolean', 1), ('interfaceId', 'XInteger', 1), ('intraDelay', 'XInteger', 1), ('mcdnEnable', 'boolean', 1), ('redirectOutboundNumberIe', 'boolean', 1), ('numDigitsToStrip', 'XInteger', 1), ('passingPrecedenceLevelThrough', 'boolean', 1), ('prefix', 'xsd:string', 4), ('callingLinePresentationBit', 'XPresentationBit', 1), ('connectedLineIdPresentation', 'XPresentationBit', 1), ('priProtocol', 'XPriProtocol', 1), ('securityAccessLevel', 'XInteger', 1), ('sendCallingNameInFacilityIe', 'boolean', 1), ('sendExLeadingCharInDispIe', 'boolean', 1), ('sendRestart', 'boolean', 1), ('setupNonIsdnPi', 'boolean', 1), ('sigDigits', 'XCiscoCatalyst6000E1VoIPGateway.sigDigits', 1), ('span', 'XInteger', 1), ('statusPoll', 'boolean', 1), ('smdiBasePort', 'XInteger', 1), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('transmitUtf8', 'boolean', 0), ('v150', 'boolean', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('QSIGVariant', 'XQSIGVariant', 0), ('unattendedPort', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('geoLocationFilterName', 'XFkType', 4), ('nationalStripDigits', 'XInteger', 4), ('internationalStripDigits', 'XInteger', 4), ('unknownStripDigits', 'XInteger', 4), ('subscriberStripDigits', 'XInteger', 4), ('nationalTransformationCssName', 'XFkType', 4), ('internationalTransformationCssName', 'XFkType', 4), ('unknownTransformationCssName', 'XFkType', 4), ('subscriberTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4)), frozenset(), None, False),
+    'XCiscoCatalyst6000E1VoIPGateway.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'XCiscoCatalyst6000T1VoIPGatewayPri': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 1), ('networkLocale', 'XCountry', 4), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('mlppPreemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('redirectInboundNumberIe', 'boolean', 1), ('calledPlan', 'XNumberingPlan', 1), ('calledPri', 'XPriOfNumber', 1), ('callerIdDn', 'String255', 4), ('callingPartySelection', 'XCallingPartySelection', 1), ('callingPlan', 'XNumberingPlan', 1), ('callingPri', 'XPriOfNumber', 1), ('chanIe', 'XPRIChanIE', 1), ('clockReference', 'XClockReference', 1), ('dChannelEnable', 'boolean', 1), ('channelSelectionOrder', 'XTrunkSelectionOrder', 1), ('displayIE', 'boolean', 1), ('pcmType', 'XEncode', 1), ('csuParam', 'XCSUParam', 1), ('firstDelay', 'XInteger', 1), ('interfaceIdPresent', 'boolean', 1), ('interfaceId', 'XInteger', 1), ('intraDelay', 'XInteger', 1), ('mcdnEnable', 'boolean', 1), ('redirectOutboundNumberIe', 'boolean', 1), ('numDigitsToStrip', 'XInteger', 1), ('passingPrecedenceLevelThrough', 'boolean', 1), ('prefix', 'xsd:string', 4), ('callingLinePresentationBit', 'XPresentationBit', 1), ('connectedLineIdPresentation', 'XPresentationBit', 1), ('priProtocol', 'XPriProtocol', 1), ('securityAccessLevel', 'XInteger', 1), ('sendCallingNameInFacilityIe', 'boolean', 1), ('sendExLeadingCharInDispIe', 'boolean', 1), ('sendRestart', 'boolean', 1), ('setupNonIsdnPi', 'boolean', 1), ('sigDigits', 'XCiscoCatalyst6000T1VoIPGatewayPri.sigDigits', 1), ('span', 'XInteger', 1), ('statusPoll', 'boolean', 1), ('smdiBasePort', 'XInteger', 1), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('transmitUtf8', 'boolean', 0), ('v150', 'boolean', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('QSIGVariant', 'XQSIGVariant', 0), ('unattendedPort', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('geoLocationFilterName', 'XFkType', 4), ('nationalStripDigits', 'XInteger', 4), ('internationalStripDigits', 'XInteger', 4), ('unknownStripDigits', 'XInteger', 4), ('subscriberStripDigits', 'XInteger', 4), ('nationalTransformationCssName', 'XFkType', 4), ('internationalTransformationCssName', 'XFkType', 4), ('unknownTransformationCssName', 'XFkType', 4), ('subscriberTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4)), frozenset(), None, False),
+    'XCiscoCatalyst6000T1VoIPGatewayPri.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'XCiscoCatalyst6000T1VoIPGatewayT1': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('sendGeoLocation', 'boolean', 1), ('ports', 'XCiscoCatalyst6000T1VoIPGatewayT1.ports', 0), ('trunkSelectionOrder', 'XTrunkSelectionOrder', 1), ('clockReference', 'XClockReference', 1), ('csuParam', 'XCSUParam', 1), ('digitSending', 'XDigitSending', 1), ('pcmType', 'XEncode', 1), ('fdlChannel', 'XFDLChannel', 1), ('yellowAlarm', 'XYellowAlarm', 1), ('zeroSupression', 'XZeroSuppression', 1), ('smdiBasePort', 'XInteger', 1), ('handleDtmfPrecedenceSignals', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 4), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4)), frozenset(), None, False),
+    'XCiscoCatalyst6000T1VoIPGatewayT1.ports': ((('port', 'XT1Port', 3),), frozenset(), None, False),
+    'XCmcInfo': ((('code', 'String16', 1), ('description', 'String50', 0)), frozenset(), None, False),
+    'XCommonDeviceConfig': ((('name', 'UniqueString50', 1), ('softkeyTemplateName', 'XFkType', 4), ('userLocale', 'XUserLocale', 4), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('useTrustedRelayPoint', 'boolean', 0), ('preemption', 'XPreemption', 0), ('ipAddressingMode', 'XIPAddressingMode', 0), ('ipAddressingModePreferenceControl', 'XIPAddressingModePrefControl', 0), ('allowAutoConfigurationForPhones', 'XStatus', 0), ('useImeForOutboundCalls', 'XStatus', 0), ('confidentialAccess', 'XCommonDeviceConfig.confidentialAccess', 0), ('allowDuplicateAddressDetection', 'XStatus', 0), ('acceptRedirectMessages', 'XStatus', 0), ('replyMulticastEchoRequest', 'XStatus', 0)), frozenset(), None, False),
+    'XCommonDeviceConfig.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XCommonPhoneConfig': ((('name', 'UniqueString50', 1), ('description', 'String128', 0), ('unlockPwd', 'String50', 0), ('dndOption', 'XDNDOption', 0), ('dndAlertingType', 'XRingSetting', 0), ('backgroundImage', 'boolean', 0), ('phonePersonalization', 'XPhonePersonalization', 0), ('phoneServiceDisplay', 'XPhoneServiceDisplay', 0), ('sshUserId', 'String50', 0), ('sshPwd', 'String255', 0), ('vendorConfig', 'XVendorConfig', 4), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('vpnGroupName', 'XFkType', 4), ('vpnProfileName', 'XFkType', 4), ('featureControlPolicy', 'XFkType', 4), ('wifiHotspotProfile', 'XFkType', 4)), frozenset(), None, False),
+    'XConferenceBridge': ((('name', 'UniqueName128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('locationName', 'XFkType', 1), ('subUnit', 'XInteger', 0), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('maximumCapacity', 'XInteger', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('securityProfileName', 'XFkType', 4), ('destinationAddress', 'xsd:string', 0), ('mcuConferenceBridgeSipPort', 'XInteger', 0), ('sipProfile', 'XFkType', 4), ('srtpAllowed', 'boolean', 0), ('normalizationScript', 'XFkType', 4), ('enableTrace', 'boolean', 0), ('normalizationScriptInfos', 'XConferenceBridge.normalizationScriptInfos', 0), ('userName', 'xsd:string', 0), ('password', 'xsd:string', 0), ('httpPort', 'XInteger', 0), ('useHttps', 'boolean', 0), ('addresses', 'XConferenceBridge.addresses', 0), ('conferenceBridgePrefix', 'xsd:string', 4), ('allowCFBControlOfCallSecurityIcon', 'boolean', 4), ('overrideSIPTrunkAddress', 'boolean', 4), ('sipTrunkName', 'XFkType', 0)), frozenset(), None, False),
+    'XConferenceBridge.addresses': ((('address', 'xsd:string', 2),), frozenset(), None, False),
+    'XConferenceBridge.normalizationScriptInfos': ((('normalizationScriptInfo', 'XNormalizationScriptInfo', 2),), frozenset(), None, False),
+    'XConferenceNow': ((('conferenceNowNumber', 'xsd:string', 1), ('routePartitionName', 'XFkType', 4), ('description', 'xsd:string', 0), ('maxWaitTimeForHost', 'XInteger', 1), ('MohAudioSourceId', 'XMOHAudioSourceId', 4)), frozenset(), None, False),
+    'XContent': ((), frozenset(), None, True),
+    'XCredentialPolicy': ((('name', 'String255', 1), ('failedLogon', 'XInteger', 1), ('resetFailedLogonAttempts', 'XInteger', 1), ('lockoutDuration', 'XInteger', 1), ('credChangeDuration', 'XInteger', 1), ('credExpiresAfter', 'XInteger', 1), ('minCredLength', 'XInteger', 1), ('prevCredStoredNum', 'XInteger', 1), ('inactiveDaysAllowed', 'XInteger', 1), ('expiryWarningDays', 'XInteger', 1), ('trivialCredCheck', 'boolean', 1), ('minCharsToChange', 'XInteger', 1)), frozenset(), None, False),
+    'XCss': ((('description', 'String50', 0), ('members', 'XCss.members', 0), ('partitionUsage', 'XPartitionUsage', 0), ('name', 'UniqueString50', 1)), frozenset(), None, False),
+    'XCss.members': ((('member', 'XCallingSearchSpaceMember', 2),), frozenset(), None, False),
+    'XCtiRoutePoint': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('useTrustedRelayPoint', 'XStatus', 1), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('userLocale', 'XUserLocale', 4), ('lines', 'XCtiRoutePoint.lines', 0)), frozenset(), None, False),
+    'XCtiRoutePoint.lines': ((('line', 'XPhoneLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'XCumaServerSecurityProfile': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 4), ('securityMode', 'XDeviceSecurityMode', 4), ('transportType', 'XTransport', 1), ('x509SubjectName', 'xsd:string', 0), ('serverIpHostName', 'String255', 1)), frozenset(), None, False),
+    'XCustomUserField': ((('field', 'xsd:string', 1),), frozenset(), None, False),
+    'XCustomer': ((('name', 'xsd:string', 1),), frozenset(), None, False),
+    'XDateTimeGroup': ((('name', 'xsd:string', 1), ('timeZone', 'XTimeZone', 1), ('separator', 'xsd:string', 1), ('dateformat', 'xsd:string', 1), ('timeFormat', 'xsd:string', 1), ('phoneNtpReferences', 'XDateTimeGroup.phoneNtpReferences', 0)), frozenset(), None, False),
+    'XDateTimeGroup.phoneNtpReferences': ((('selectedPhoneNtpReference', 'XDateTimeGroupNtpReference', 3),), frozenset(), None, False),
+    'XDateTimeGroupNtpReference': ((('phoneNtpName', 'XFkType', 1), ('selectionOrder', 'XInteger', 4)), frozenset(), None, False),
+    'XDefaultDeviceProfile': ((('name', 'UniqueString128', 1), ('description', 'String255', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userLocale', 'XUserLocale', 4), ('phoneButtonTemplate', 'XFkType', 4), ('softkeyTemplate', 'XFkType', 4), ('privacy', 'XStatus', 1), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('ignorePi', 'boolean', 0), ('dndStatus', 'boolean', 0), ('dndRingSetting', 'XRingSetting', 4), ('dndOption', 'XDNDOption', 0), ('mlppDomainId', 'String128', 4), ('mlppIndication', 'XStatus', 1), ('preemption', 'XPreemption', 1), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('emccCallingSearchSpace', 'XFkType', 4)), frozenset(), None, False),
+    'XDeviceMobility': ((('name', 'xsd:string', 1), ('subNetDetails', 'XDeviceMobility.subNetDetails', 1), ('members', 'XDeviceMobility.members', 1)), frozenset(), None, False),
+    'XDeviceMobility.members': ((('member', 'XDevicePoolDeviceMobility', 3),), frozenset(), None, False),
+    'XDeviceMobility.subNetDetails': ((('ipv4SubNetDetails', 'XDeviceMobility.subNetDetails.ipv4SubNetDetails', 0), ('ipv6SubNetDetails', 'XDeviceMobility.subNetDetails.ipv6SubNetDetails', 0)), frozenset(), None, False),
+    'XDeviceMobility.subNetDetails.ipv4SubNetDetails': ((('ipv4Subnet', 'xsd:string', 1), ('ipv4SubNetMaskSz', 'XInteger', 1)), frozenset(), None, False),
+    'XDeviceMobility.subNetDetails.ipv6SubNetDetails': ((('ipv6Subnet', 'xsd:string', 1), ('ipv6SubNetMaskSz', 'XInteger', 1)), frozenset(), None, False),
+    'XDeviceMobilityGroup': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'XDevicePool': ((('name', 'UniqueString50', 1), ('autoSearchSpaceName', 'XFkType', 4), ('dateTimeSettingName', 'XFkType', 1), ('callManagerGroupName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('regionName', 'XFkType', 1), ('networkLocale', 'XCountry', 4), ('srstName', 'XFkType', 1), ('connectionMonitorDuration', 'XInteger', 0), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('locationName', 'XFkType', 4), ('mobilityCssName', 'XFkType', 4), ('physicalLocationName', 'XFkType', 4), ('deviceMobilityGroupName', 'XFkType', 4), ('revertPriority', 'XRevertPriority', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('cdpnTransformationCssName', 'XFkType', 4), ('localRouteGroupName', 'XFkType', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('callingPartyNationalPrefix', 'String16', 0), ('callingPartyInternationalPrefix', 'String16', 0), ('callingPartyUnknownPrefix', 'String16', 0), ('callingPartySubscriberPrefix', 'String16', 0), ('adjunctCallingSearchSpace', 'XFkType', 4), ('callingPartyNationalStripDigits', 'XInteger', 4), ('callingPartyInternationalStripDigits', 'XInteger', 4), ('callingPartyUnknownStripDigits', 'XInteger', 4), ('callingPartySubscriberStripDigits', 'XInteger', 4), ('callingPartyNationalTransformationCssName', 'XFkType', 4), ('callingPartyInternationalTransformationCssName', 'XFkType', 4), ('callingPartyUnknownTransformationCssName', 'XFkType', 4), ('callingPartySubscriberTransformationCssName', 'XFkType', 4), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 4), ('calledPartyInternationalStripDigits', 'XInteger', 4), ('calledPartyUnknownStripDigits', 'XInteger', 4), ('calledPartySubscriberStripDigits', 'XInteger', 4), ('calledPartyNationalTransformationCssName', 'XFkType', 4), ('calledPartyInternationalTransformationCssName', 'XFkType', 4), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('calledPartySubscriberTransformationCssName', 'XFkType', 4), ('imeEnrolledPatternGroupName', 'XFkType', 4), ('cntdPnTransformationCssName', 'XFkType', 4), ('localRouteGroup', 'XDevicePool.localRouteGroup', 2), ('redirectingPartyTransformationCSS', 'XFkType', 4), ('callingPartyTransformationCSS', 'XFkType', 4), ('wirelessLanProfileGroup', 'XFkType', 4), ('elinGroup', 'XFkType', 4), ('mraServiceDomain', 'XFkType', 4)), frozenset(), None, False),
+    'XDevicePool.localRouteGroup': ((('name', 'xsd:string', 4), ('value', 'xsd:string', 0)), frozenset(), None, False),
+    'XDevicePoolDeviceMobility': ((('devicePoolName', 'XFkType', 1),), frozenset(), None, False),
+    'XDeviceProfile': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('vendorConfig', 'XVendorConfig', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('lines', 'XDeviceProfile.lines', 0), ('phoneTemplateName', 'XFkType', 1), ('speeddials', 'XDeviceProfile.speeddials', 0), ('busyLampFields', 'XDeviceProfile.busyLampFields', 0), ('blfDirectedCallParks', 'XDeviceProfile.blfDirectedCallParks', 0), ('addOnModules', 'XDeviceProfile.addOnModules', 0), ('userLocale', 'XUserLocale', 4), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('loginUserId', 'XFkType', 4), ('ignorePresentationIndicators', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndRingSetting', 'XRingSetting', 4), ('dndStatus', 'boolean', 0), ('emccCallingSearchSpace', 'XFkType', 4), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('softkeyTemplateName', 'XFkType', 4), ('callInfoPrivacyStatus', 'XStatus', 0), ('services', 'XDeviceProfile.services', 0), ('featureControlPolicy', 'XFkType', 4)), frozenset({'ctiid'}), None, False),
+    'XDeviceProfile.addOnModules': ((('addOnModule', 'XAddOnModule', 2),), frozenset(), None, False),
+    'XDeviceProfile.blfDirectedCallParks': ((('blfDirectedCallPark', 'XBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'XDeviceProfile.busyLampFields': ((('busyLampField', 'XBusyLampField', 2),), frozenset(), None, False),
+    'XDeviceProfile.lines': ((('line', 'XPhoneLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'XDeviceProfile.services': ((('service', 'XSubscribedService', 2),), frozenset(), None, False),
+    'XDeviceProfile.speeddials': ((('speeddial', 'XSpeeddial', 2),), frozenset(), None, False),
+    'XDhcpServer': ((('processNodeName', 'XFkType', 1), ('primaryDnsIpAddress', 'xsd:string', 0), ('secondaryDnsIpAddress', 'xsd:string', 0), ('primaryTftpServerIpAddress', 'xsd:string', 0), ('secondaryTftpServerIpAddress', 'xsd:string', 0), ('bootstrapServerIpAddress', 'xsd:string', 0), ('domainName', 'xsd:string', 0), ('tftpServerName', 'xsd:string', 0), ('arpCacheTimeout', 'XInteger', 1), ('ipAddressLeaseTime', 'XInteger', 1), ('renewalTime', 'XInteger', 1), ('rebindingTime', 'XInteger', 1)), frozenset(), None, False),
+    'XDhcpSubnet': ((('dhcpServerName', 'XFkType', 1), ('subnetIpAddress', 'xsd:string', 1), ('primaryStartIpAddress', 'xsd:string', 1), ('primaryEndIpAddress', 'xsd:string', 1), ('secondaryStartIpAddress', 'xsd:string', 0), ('secondaryEndIpAddress', 'xsd:string', 0), ('primaryRouterIpAddress', 'xsd:string', 0), ('secondaryRouterIpAddress', 'xsd:string', 0), ('subnetMask', 'xsd:string', 1), ('domainName', 'xsd:string', 0), ('primaryDnsIpAddress', 'xsd:string', 0), ('secondaryDnsIpAddress', 'xsd:string', 0), ('tftpServerName', 'xsd:string', 0), ('primaryTftpServerIpAddress', 'xsd:string', 0), ('secondaryTftpServerIpAddress', 'xsd:string', 0), ('bootstrapServerIpAddress', 'xsd:string', 0), ('arpCacheTimeout', 'XInteger', 0), ('ipAddressLeaseTime', 'XInteger', 0), ('renewalTime', 'XInteger', 0), ('rebindingTime', 'XInteger', 0)), frozenset(), None, False),
+    'XDirNumberAliasLookupandSync': ((('ldapConfigName', 'String50', 1), ('ldapManagerDisgName', 'String128', 1), ('ldapPassword', 'String128', 1), ('ldapUserSearch', 'String255', 1), ('ldapDirectoryServerUsage', 'XLDAPDirectoryFunction', 0), ('keepAliveSearch', 'xsd:string', 4), ('keepAliveTime', 'XKeepAliveTimeInterval', 0), ('sipAliasSuffix', 'xsd:string', 4), ('enableCachingofRecords', 'boolean', 0), ('servers', 'XDirNumberAliasLookupandSync.servers', 1), ('cacheSizeforAliasLookup', 'XInteger', 0), ('cacheAgeforAliasLookup', 'XInteger', 0)), frozenset(), None, False),
+    'XDirNumberAliasLookupandSync.servers': ((('server', 'XDirNumberAliasLookupandSync.servers.server', 3),), frozenset(), None, False),
+    'XDirNumberAliasLookupandSync.servers.server': ((('hostName', 'xsd:string', 1), ('ldapPort', 'XInteger', 1), ('sslEnabled', 'boolean', 0)), frozenset(), None, False),
+    'XDirectedCallPark': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('retrievalPrefix', 'xsd:string', 4), ('reversionPattern', 'xsd:string', 4), ('revertCssName', 'XFkType', 4)), frozenset(), None, False),
+    'XDirectoryLookupDialRules': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('numberBeginWith', 'xsd:string', 0), ('numberOfDigits', 'XInteger', 1), ('digitsToBeRemoved', 'XInteger', 1), ('prefixPattern', 'xsd:string', 0), ('priority', 'XInteger', 1)), frozenset(), None, False),
+    'XDirectoryUri': ((('isPrimary', 'boolean', 1), ('uri', 'String128', 4), ('partition', 'XFkType', 4), ('advertiseGloballyViaIls', 'boolean', 0)), frozenset(), None, False),
+    'XDirn': ((('pattern', 'xsd:string', 1), ('routePartitionName', 'XFkType', 4)), frozenset({'uuid'}), None, False),
+    'XE164AltNum': ((('numberMask', 'xsd:string', 4), ('addToLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 4), ('isUrgent', 'boolean', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'XELINNumber': ((('pattern', 'String16', 1), ('partition', 'XFkType', 4)), frozenset(), None, False),
+    'XElinGroup': ((('name', 'UniqueString50', 1), ('description', 'String255', 4), ('elinNumbers', 'XElinGroup.elinNumbers', 1)), frozenset(), None, False),
+    'XElinGroup.elinNumbers': ((('elinNumber', 'XELINNumber', 3),), frozenset(), None, False),
+    'XEndUserCapfProfile': ((('endUserId', 'XFkType', 1), ('instanceId', 'xsd:string', 1), ('certificationOperation', 'XCertificateOperation', 1), ('authenticationMode', 'XAuthenticationMode', 1), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 1), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('operationCompletion', 'xsd:string', 0)), frozenset(), None, False),
+    'XEnduserMember': ((('userId', 'xsd:string', 1),), frozenset(), None, False),
+    'XEnterpriseAltNum': ((('numberMask', 'xsd:string', 4), ('addToLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 4), ('isUrgent', 'boolean', 0), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'XEnterpriseFeatureAccessConfiguration': ((('pattern', 'String16', 1), ('routePartitionName', 'XFkType', 4), ('description', 'xsd:string', 0), ('isDefaultEafNumber', 'boolean', 0)), frozenset(), None, False),
+    'XExpresswayCConfiguration': ((('HostNameOrIP', 'String255', 1), ('description', 'String50', 4), ('X509SubjectNameorSubjectAlternateName', 'String4096', 4)), frozenset(), None, False),
+    'XExtension': ((('sortOrder', 'XInteger', 4), ('pattern', 'XFkType', 1), ('routePartition', 'xsd:string', 0), ('linePrimaryUri', 'xsd:string', 4), ('partition', 'XFkType', 4)), frozenset(), None, False),
+    'XExternalCallControlProfile': ((('name', 'String50', 1), ('primaryUri', 'String255', 1), ('secondaryUri', 'String255', 0), ('enableLoadBalancing', 'boolean', 0), ('routingRequestTimer', 'XInteger', 4), ('diversionReroutingCssName', 'XFkType', 4), ('callTreatmentOnFailure', 'XCallTreatmentOnFailure', 1)), frozenset(), None, False),
+    'XFacInfo': ((('name', 'String50', 1), ('code', 'String16', 1), ('authorizationLevel', 'XInteger', 1)), frozenset(), None, False),
+    'XFallbackProfile': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('advertisedFallbackDirectoryE164Number', 'xsd:string', 0), ('qosSensistivityLevel', 'XInteger', 0), ('callCss', 'XFallBackCSSSelection', 1), ('callAnswerTimer', 'XInteger', 0), ('directoryNumberPartition', 'XFkType', 4), ('directoryNumber', 'String16', 0), ('numberOfDigitsForCallerIDPartialMatch', 'XInteger', 0)), frozenset(), None, False),
+    'XFeatureControlConfig': ((('featureName', 'String50', 1), ('overrideDefault', 'boolean', 0), ('enableSetting', 'boolean', 0)), frozenset(), None, False),
+    'XFeatureControlPolicy': ((('name', 'String50', 1), ('description', 'String100', 0), ('features', 'XFeatureControlPolicy.features', 0)), frozenset(), None, False),
+    'XFeatureControlPolicy.features': ((('feature', 'XFeatureControlConfig', 2),), frozenset(), None, False),
+    'XFeatureGroupTemplate': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('homeCluster', 'boolean', 0), ('imAndUcPresenceEnable', 'boolean', 0), ('serviceProfile', 'XFkType', 4), ('enableUserToHostConferenceNow', 'boolean', 0), ('allowCTIControl', 'boolean', 0), ('enableEMCC', 'boolean', 0), ('enableMobility', 'boolean', 0), ('enableMobileVoiceAccess', 'boolean', 0), ('maxDeskPickupWait', 'XInteger', 1), ('remoteDestinationLimit', 'XInteger', 1), ('BLFPresenceGp', 'XFkType', 1), ('subscribeCallingSearch', 'XFkType', 4), ('userLocale', 'XUserLocale', 4), ('userProfile', 'XFkType', 4), ('meetingInformation', 'boolean', 0)), frozenset(), None, False),
+    'XFkType': ((), frozenset({'uuid'}), 'xsd:string', False),
+    'XGatekeeper': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('rrqTimeToLive', 'XInteger', 1), ('retryTimeout', 'XInteger', 1), ('enableDevice', 'boolean', 0)), frozenset(), None, False),
+    'XGateway': ((('domainName', 'xsd:string', 1), ('description', 'xsd:string', 0), ('product', 'XProduct', 4), ('protocol', 'XDeviceProtocol', 1), ('callManagerGroupName', 'XFkType', 4), ('units', 'XGateway.units', 0), ('vendorConfig', 'XVendorConfig', 4)), frozenset(), None, False),
+    'XGateway.units': ((('unit', 'XGateway.units.unit', 3),), frozenset(), None, False),
+    'XGateway.units.unit': ((('index', 'XInteger', 1), ('product', 'XMGCPSlotModule', 4), ('subunits', 'XGateway.units.unit.subunits', 0)), frozenset(), None, False),
+    'XGateway.units.unit.subunits': ((('subunit', 'XGateway.units.unit.subunits.subunit', 3),), frozenset(), None, False),
+    'XGateway.units.unit.subunits.subunit': ((('index', 'XInteger', 4), ('product', 'XMGCPVic', 4), ('beginPort', 'XInteger', 4)), frozenset(), None, False),
+    'XGatewayEndpointAnalog': ((('index', 'XInteger', 1), ('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('model', 'XModel', 0), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocale', 'XCountry', 4), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 4), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('port', 'XAnalogPort', 1), ('trunkSelectionOrder', 'XTrunkSelectionOrder', 1), ('transmitUtf8', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('callingPartyNumberPrefix', 'String16', 0), ('callingPartyStripDigits', 'XInteger', 4), ('callingPartyUnknownTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssUnknown', 'boolean', 0), ('hotlineDevice', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('imeE164DirectoryNumber', 'String16', 0), ('confidentialAccess', 'XGatewayEndpointAnalog.confidentialAccess', 0), ('elinGroup', 'XFkType', 4)), frozenset({'ctiid'}), None, False),
+    'XGatewayEndpointAnalog.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XGatewayEndpointAnalogAccess': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 1), ('subunit', 'XInteger', 4), ('endpoint', 'XGatewayEndpointAnalog', 1)), frozenset(), None, False),
+    'XGatewayEndpointDigitalAccessBri': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 1), ('subunit', 'XInteger', 1), ('endpoint', 'XGatewayEndpointDigitalBri', 1)), frozenset(), None, False),
+    'XGatewayEndpointDigitalAccessPri': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 1), ('subunit', 'XInteger', 1), ('endpoint', 'XGatewayEndpointDigitalPri', 1)), frozenset(), None, False),
+    'XGatewayEndpointDigitalAccessT1': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 1), ('subunit', 'XInteger', 1), ('endpoint', 'XGatewayEndpointDigitalT1', 1)), frozenset(), None, False),
+    'XGatewayEndpointDigitalBri': ((('index', 'XInteger', 1), ('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('networkLocale', 'XCountry', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('vendorConfig', 'XVendorConfig', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('redirectInboundNumberIe', 'boolean', 1), ('briProtocol', 'XBriProtocol', 1), ('calledPlan', 'XNumberingPlan', 1), ('calledPri', 'XPriOfNumber', 1), ('callerIdDn', 'String255', 4), ('callingPartySelection', 'XCallingPartySelection', 1), ('callingPlan', 'XNumberingPlan', 1), ('callingPri', 'XPriOfNumber', 1), ('clockReference', 'XClockReference', 1), ('csuParam', 'XCSUParam', 1), ('dChannelEnable', 'boolean', 1), ('channelSelectionOrder', 'XTrunkSelectionOrder', 1), ('pcmType', 'XEncode', 1), ('firstDelay', 'XInteger', 1), ('intraDelay', 'XInteger', 1), ('redirectOutboundNumberIe', 'boolean', 1), ('numDigitsToStrip', 'XInteger', 1), ('prefix', 'xsd:string', 4), ('presentationBit', 'XPresentationBit', 1), ('sendRestart', 'boolean', 1), ('setupNonIsdnPi', 'boolean', 1), ('sigDigits', 'XGatewayEndpointDigitalBri.sigDigits', 1), ('statusPoll', 'boolean', 1), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 4), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('nationalStripDigits', 'XInteger', 4), ('internationalStripDigits', 'XInteger', 4), ('unknownStripDigits', 'XInteger', 4), ('subscriberStripDigits', 'XInteger', 4), ('nationalTransformationCssName', 'XFkType', 4), ('internationalTransformationCssName', 'XFkType', 4), ('unknownTransformationCssName', 'XFkType', 4), ('subscriberTransformationCssName', 'XFkType', 4), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('GClearEnable', 'boolean', 1), ('enableDatalinkOnFirstCall', 'boolean', 0), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 4), ('calledPartyInternationalStripDigits', 'XInteger', 4), ('calledPartyUnknownStripDigits', 'XInteger', 4), ('calledPartySubscriberStripDigits', 'XInteger', 4), ('calledPartyNationalTransformationCssName', 'XFkType', 4), ('calledPartyInternationalTransformationCssName', 'XFkType', 4), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('calledPartySubscriberTransformationCssName', 'XFkType', 4), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'ctiid'}), None, False),
+    'XGatewayEndpointDigitalBri.sigDigits': ((), frozenset({'enable'}), 'xsd:nonNegativeInteger', False),
+    'XGatewayEndpointDigitalPri': ((('index', 'XInteger', 1), ('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 1), ('networkLocale', 'XCountry', 4), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('mlppPreemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('redirectInboundNumberIe', 'boolean', 1), ('calledPlan', 'XNumberingPlan', 1), ('calledPri', 'XPriOfNumber', 1), ('callerIdDn', 'String255', 4), ('callingPartySelection', 'XCallingPartySelection', 1), ('callingPlan', 'XNumberingPlan', 1), ('callingPri', 'XPriOfNumber', 1), ('chanIE', 'XPRIChanIE', 1), ('clockReference', 'XClockReference', 1), ('dChannelEnable', 'boolean', 1), ('channelSelectionOrder', 'XTrunkSelectionOrder', 1), ('displayIe', 'boolean', 1), ('pcmType', 'XEncode', 1), ('csuParam', 'XCSUParam', 1), ('firstDelay', 'XInteger', 1), ('interfaceIdPresent', 'boolean', 1), ('interfaceId', 'XInteger', 1), ('intraDelay', 'XInteger', 1), ('mcdnEnable', 'boolean', 1), ('redirectOutboundNumberIe', 'boolean', 1), ('numDigitsToStrip', 'XInteger', 1), ('passingPrecedenceLevelThrough', 'boolean', 1), ('prefix', 'xsd:string', 4), ('callingLinePresentationBit', 'XPresentationBit', 1), ('connectedLineIdPresentation', 'XPresentationBit', 1), ('priProtocol', 'XPriProtocol', 1), ('securityAccessLevel', 'XInteger', 1), ('sendCallingNameInFacilityIe', 'boolean', 1), ('sendExLeadingCharInDispIe', 'boolean', 1), ('sendRestart', 'boolean', 1), ('setupNonIsdnPi', 'boolean', 1), ('sigDigits', 'XGatewayEndpointDigitalPri.sigDigits', 1), ('span', 'XInteger', 1), ('statusPoll', 'boolean', 1), ('smdiBasePort', 'XInteger', 1), ('GClearEnable', 'boolean', 1), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('transmitUtf8', 'boolean', 0), ('v150', 'boolean', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('unattendedPort', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('geoLocationFilterName', 'XFkType', 4), ('routeClassSignalling', 'XStatus', 0), ('nationalStripDigits', 'XInteger', 4), ('internationalStripDigits', 'XInteger', 4), ('unknownStripDigits', 'XInteger', 4), ('subscriberStripDigits', 'XInteger', 4), ('nationalTransformationCssName', 'XFkType', 4), ('internationalTransformationCssName', 'XFkType', 4), ('unknownTransformationCssName', 'XFkType', 4), ('subscriberTransformationCssName', 'XFkType', 4), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 4), ('calledPartyInternationalStripDigits', 'XInteger', 4), ('calledPartyUnknownStripDigits', 'XInteger', 4), ('calledPartySubscriberStripDigits', 'XInteger', 4), ('calledPartyNationalTransformationCssName', 'XFkType', 4), ('calledPartyInternationalTransformationCssName', 'XFkType', 4), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('calledPartySubscriberTransformationCssName', 'XFkType', 4), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('useDevicePoolCntdPartyTransformationCss', 'boolean', 0), ('cntdPartyTransformationCssName', 'XFkType', 4), ('confidentialAccess', 'XGatewayEndpointDigitalPri.confidentialAccess', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'ctiid'}), None, False),
+    'XGatewayEndpointDigitalPri.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XGatewayEndpointDigitalPri.sigDigits': ((), frozenset({'enable'}), 'xsd:nonNegativeInteger', False),
+    'XGatewayEndpointDigitalT1': ((('index', 'XInteger', 1), ('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('sendGeoLocation', 'boolean', 1), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('v150', 'boolean', 0), ('geoLocationFilterName', 'XFkType', 4), ('ports', 'XGatewayEndpointDigitalT1.ports', 0), ('trunkSelectionOrder', 'XTrunkSelectionOrder', 1), ('clockReference', 'XClockReference', 1), ('csuParam', 'XCSUParam', 1), ('digitSending', 'XDigitSending', 1), ('pcmType', 'XEncode', 1), ('fdlChannel', 'XFDLChannel', 1), ('yellowAlarm', 'XYellowAlarm', 1), ('zeroSupression', 'XZeroSuppression', 1), ('smdiBasePort', 'XInteger', 1), ('handleDtmfPrecedenceSignals', 'boolean', 0), ('encodeOutboundVoiceRouteClass', 'boolean', 0), ('routeClassSignalling', 'XStatus', 1), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('confidentialAccess', 'XGatewayEndpointDigitalT1.confidentialAccess', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartyUnknownStripDigits', 'XInteger', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('useDevicePoolCalledCssUnkn', 'boolean', 0)), frozenset({'ctiid'}), None, False),
+    'XGatewayEndpointDigitalT1.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XGatewayEndpointDigitalT1.ports': ((('port', 'XT1Port', 3),), frozenset(), None, False),
+    'XGatewaySccp': ((('index', 'XInteger', 1), ('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('model', 'XModel', 0), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocale', 'XCountry', 4), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('vendorConfig', 'XVendorConfig', 0), ('mlppDomainId', 'String128', 4), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('transmitUtf8', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('callingPartyNumberPrefix', 'String16', 0), ('callingPartyStripDigits', 'XInteger', 4), ('callingPartyUnknownTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssUnknown', 'boolean', 0), ('hotlineDevice', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('phoneTemplateName', 'XFkType', 4), ('securityProfileName', 'XFkType', 4), ('userLocale', 'XUserLocale', 4), ('deviceMobilityMode', 'XStatus', 1), ('ownerUserId', 'XFkType', 4), ('commonPhoneConfigName', 'XFkType', 1), ('alwaysUsePrimeLine', 'XStatus', 1), ('alwaysUsePrimeLineForVM', 'XStatus', 1), ('allowCtiControlFlag', 'boolean', 0), ('remoteDevice', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 1), ('unattendedPort', 'boolean', 4), ('presenceGroupName', 'XFkType', 1), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('hlogStatus', 'boolean', 0), ('ignorePresentationIndicators', 'XPresentationBit', 0), ('lines', 'XGatewaySccp.lines', 0), ('confidentialAccess', 'XGatewaySccp.confidentialAccess', 0)), frozenset({'ctiid'}), None, False),
+    'XGatewaySccp.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XGatewaySccp.lines': ((('line', 'XPhoneLine', 0), ('lineIdentifier', 'XNumplanIdentifier', 0)), frozenset(), None, False),
+    'XGatewaySccpEndpoints': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 1), ('subunit', 'XInteger', 4), ('endpoint', 'XGatewaySccp', 1)), frozenset(), None, False),
+    'XGatewaySubunits': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('unit', 'XInteger', 1), ('subunits', 'XGatewaySubunits.subunits', 1)), frozenset(), None, False),
+    'XGatewaySubunits.subunits': ((('subunit', 'XGatewaySubunits.subunits.subunit', 3),), frozenset(), None, False),
+    'XGatewaySubunits.subunits.subunit': ((('index', 'XInteger', 4), ('product', 'XMGCPVic', 4), ('beginPort', 'XInteger', 4)), frozenset(), None, False),
+    'XGeoLocation': ((('name', 'String50', 1), ('country', 'xsd:string', 0), ('description', 'String255', 0), ('nationalSubDivision', 'String100', 0), ('district', 'String255', 0), ('communityName', 'String255', 0), ('cityDivision', 'String255', 0), ('neighbourhood', 'String255', 0), ('street', 'String255', 0), ('leadingStreetDirection', 'String50', 0), ('trailingStreetSuffix', 'String50', 0), ('streetSuffix', 'String255', 0), ('houseNumber', 'String16', 0), ('houseNumberSuffix', 'String100', 0), ('landmark', 'String255', 0), ('location', 'String255', 0), ('floor', 'String16', 0), ('occupantName', 'String255', 0), ('postalCode', 'String100', 0)), frozenset(), None, False),
+    'XGeoLocationFilter': ((('name', 'String50', 1), ('description', 'String255', 0), ('useCountry', 'boolean', 0), ('useNationalSubDivision', 'boolean', 0), ('useDistrict', 'boolean', 0), ('useCommunityName', 'boolean', 0), ('useCityDivision', 'boolean', 0), ('useNeighbourhood', 'boolean', 0), ('useStreet', 'boolean', 0), ('useLeadingStreetDirection', 'boolean', 0), ('useTrailingStreetSuffix', 'boolean', 0), ('useStreetSuffix', 'boolean', 0), ('useHouseNumber', 'boolean', 0), ('useHouseNumberSuffix', 'boolean', 0), ('useLandmark', 'boolean', 0), ('useLocation', 'boolean', 0), ('useFloor', 'boolean', 0), ('useOccupantName', 'boolean', 0), ('usePostalCode', 'boolean', 0)), frozenset(), None, False),
+    'XGeoLocationPolicy': ((('name', 'String50', 1), ('country', 'xsd:string', 0), ('description', 'String255', 0), ('nationalSubDivision', 'String100', 0), ('district', 'String255', 0), ('communityName', 'String255', 0), ('cityDivision', 'String255', 0), ('neighbourhood', 'String255', 0), ('street', 'String255', 0), ('leadingStreetDirection', 'String50', 0), ('trailingStreetSuffix', 'String50', 0), ('streetSuffix', 'String255', 0), ('houseNumber', 'String16', 0), ('houseNumberSuffix', 'String100', 0), ('landmark', 'String255', 0), ('location', 'String255', 0), ('floor', 'String16', 0), ('occupantName', 'String255', 0), ('postalCode', 'String100', 0), ('relatedPolicies', 'XGeoLocationPolicy.relatedPolicies', 0)), frozenset(), None, False),
+    'XGeoLocationPolicy.relatedPolicies': ((('relatedPolicy', 'XPolicyRelationship', 3),), frozenset(), None, False),
+    'XH323Gateway': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('tunneledProtocol', 'XTunneledProtocol', 1), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('vendorConfig', 'XVendorConfig', 0), ('pathReplacementSupport', 'boolean', 0), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('useTrustedRelayPoint', 'XStatus', 1), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 1), ('packetCaptureDuration', 'XInteger', 4), ('srtpAllowed', 'boolean', 0), ('waitForFarEndH245TerminalSet', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('callerIdDn', 'String50', 4), ('callingPartySelection', 'XCallingPartySelection', 1), ('callingLineIdPresentation', 'XPresentationBit', 1), ('enableInboundFaststart', 'boolean', 0), ('enableOutboundFaststart', 'boolean', 0), ('codecForOutboundFaststart', 'XMediaPayload', 4), ('transmitUtf8', 'boolean', 0), ('signalingPort', 'XInteger', 1), ('allowH235PassThrough', 'boolean', 0), ('sigDigits', 'XH323Gateway.sigDigits', 0), ('prefixDn', 'String50', 4), ('calledPartyIeNumberType', 'XPriOfNumber', 1), ('callingPartyIeNumberType', 'XPriOfNumber', 1), ('calledNumberingPlan', 'XNumberingPlan', 1), ('callingNumberingPlan', 'XNumberingPlan', 1), ('callingPartyNationalPrefix', 'String16', 0), ('callingPartyInternationalPrefix', 'String16', 0), ('callingPartyUnknownPrefix', 'String16', 0), ('callingPartySubscriberPrefix', 'String16', 0), ('callingPartyNationalStripDigits', 'XInteger', 4), ('callingPartyInternationalStripDigits', 'XInteger', 4), ('callingPartyUnknownStripDigits', 'XInteger', 4), ('callingPartySubscriberStripDigits', 'XInteger', 4), ('callingPartyNationalTransformationCssName', 'XFkType', 4), ('callingPartyInternationalTransformationCssName', 'XFkType', 4), ('callingPartyUnknownTransformationCssName', 'XFkType', 4), ('callingPartySubscriberTransformationCssName', 'XFkType', 4), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('calledPartyNationalStripDigits', 'XInteger', 4), ('calledPartyInternationalStripDigits', 'XInteger', 4), ('calledPartyUnknownStripDigits', 'XInteger', 4), ('calledPartySubscriberStripDigits', 'XInteger', 4), ('calledPartyNationalTransformationCssName', 'XFkType', 4), ('calledPartyInternationalTransformationCssName', 'XFkType', 4), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('calledPartySubscriberTransformationCssName', 'XFkType', 4), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('displayIeDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('cntdPnTransformationCssName', 'XFkType', 4), ('confidentialAccess', 'XH323Gateway.confidentialAccess', 0), ('redirectingPartyTransformationCSS', 'XFkType', 4), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'ctiid'}), None, False),
+    'XH323Gateway.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XH323Gateway.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'XH323Line': ((('index', 'XInteger', 1), ('label', 'String50', 0), ('asciiLabel', 'String50', 0), ('display', 'String50', 0), ('dirn', 'XDirn', 1), ('displayAscii', 'String50', 0), ('e164Mask', 'String255', 4), ('maxNumCalls', 'XInteger', 0), ('busyTrigger', 'XInteger', 0), ('callInfoDisplay', 'XH323Line.callInfoDisplay', 0), ('recordingProfileName', 'XFkType', 4), ('monitoringCssName', 'XFkType', 4), ('recordingFlag', 'XRecordingFlag', 0), ('audibleMwi', 'XStatus', 0), ('speedDial', 'xsd:string', 4), ('partitionUsage', 'XPartitionUsage', 0), ('associatedEndusers', 'XH323Line.associatedEndusers', 0)), frozenset({'ctiid'}), None, False),
+    'XH323Line.associatedEndusers': ((('enduser', 'XEnduserMember', 2),), frozenset(), None, False),
+    'XH323Line.callInfoDisplay': ((('callerName', 'boolean', 0), ('callerNumber', 'boolean', 0), ('redirectedNumber', 'boolean', 0), ('dialedNumber', 'boolean', 0)), frozenset(), None, False),
+    'XH323Phone': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('commonPhoneConfigName', 'XFkType', 1), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('useTrustedRelayPoint', 'XStatus', 1), ('retryVideoCallAsAudio', 'boolean', 0), ('remoteDevice', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('srtpAllowed', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 4), ('waitForFarEndH245TerminalSet', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('mtpPreferredCodec', 'XSIPCodec', 0), ('callerIdDn', 'String50', 4), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('displayIEDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('hlogStatus', 'boolean', 0), ('ownerUserName', 'XFkType', 4), ('signalingPort', 'XInteger', 1), ('gateKeeperInfo', 'XH323Phone.gateKeeperInfo', 0), ('lines', 'XH323Phone.lines', 0), ('ignorePresentationIndicators', 'boolean', 0), ('elinGroup', 'XFkType', 4)), frozenset({'ctiid'}), None, False),
+    'XH323Phone.gateKeeperInfo': ((('gateKeeperName', 'XFkType', 4), ('e164', 'String50', 4), ('technologyPrefix', 'String50', 1), ('zone', 'String50', 1)), frozenset(), None, False),
+    'XH323Phone.lines': ((('line', 'XH323Line', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'XH323Trunk': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('rdnTransformationCssName', 'XFkType', 4), ('useDevicePoolRdnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('sendGeoLocation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('srtpAllowed', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('waitForFarEndH245TerminalSet', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('callerIdDn', 'String50', 4), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('displayIEDelivery', 'boolean', 0), ('redirectOutboundNumberIe', 'boolean', 0), ('redirectInboundNumberIe', 'boolean', 0), ('enableInboundFaststart', 'boolean', 0), ('enableOutboundFaststart', 'boolean', 0), ('codecForOutboundFaststart', 'XMediaPayload', 4), ('allowH235PassThrough', 'boolean', 0), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('transmitUtf8', 'boolean', 0), ('signalingPort', 'XInteger', 0), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('sigDigits', 'XH323Trunk.sigDigits', 0), ('prefixDn', 'String50', 4), ('calledPartyIeNumberType', 'XPriOfNumber', 0), ('callingPartyIeNumberType', 'XPriOfNumber', 0), ('calledNumberingPlan', 'XNumberingPlan', 0), ('callingNumberingPlan', 'XNumberingPlan', 0), ('pathReplacementSupport', 'boolean', 0), ('gateKeeperInfo', 'XH323Trunk.gateKeeperInfo', 0), ('ictPassingPrecedenceLevelThroughUuie', 'boolean', 0), ('ictSecurityAccessLevel', 'XInteger', 0), ('isSafEnabled', 'boolean', 0), ('callingPartyNationalStripDigits', 'XInteger', 4), ('callingPartyInternationalStripDigits', 'XInteger', 4), ('callingPartyUnknownStripDigits', 'XInteger', 4), ('callingPartySubscriberStripDigits', 'XInteger', 4), ('callingPartyNationalTransformationCssName', 'XFkType', 4), ('callingPartyInternationalTransformationCssName', 'XFkType', 4), ('callingPartyUnknownTransformationCssName', 'XFkType', 4), ('callingPartySubscriberTransformationCssName', 'XFkType', 4), ('calledPartyNationalPrefix', 'String16', 0), ('calledPartyInternationalPrefix', 'String16', 0), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartySubscriberPrefix', 'String16', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssNatl', 'boolean', 0), ('useDevicePoolCgpnTransformCssIntl', 'boolean', 0), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('useDevicePoolCgpnTransformCssSubs', 'boolean', 0), ('useDevicePoolCalledCssNatl', 'boolean', 0), ('useDevicePoolCalledCssIntl', 'boolean', 0), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('useDevicePoolCalledCssSubs', 'boolean', 0), ('calledPartyNationalStripDigits', 'XInteger', 4), ('calledPartyInternationalStripDigits', 'XInteger', 4), ('calledPartyUnknownStripDigits', 'XInteger', 4), ('calledPartySubscriberStripDigits', 'XInteger', 4), ('calledPartyNationalTransformationCssName', 'XFkType', 4), ('calledPartyInternationalTransformationCssName', 'XFkType', 4), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('calledPartySubscriberTransformationCssName', 'XFkType', 4), ('runOnEveryNode', 'boolean', 0), ('destinations', 'XH323Trunk.destinations', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('cntdPnTransformationCssName', 'XFkType', 4), ('confidentialAccess', 'XH323Trunk.confidentialAccess', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset({'ctiid'}), None, False),
+    'XH323Trunk.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XH323Trunk.destinations': ((('destination', 'XH323TrunkDestination', 2),), frozenset(), None, False),
+    'XH323Trunk.gateKeeperInfo': ((('gateKeeper', 'XFkType', 4), ('terminalType', 'XTerminal', 4), ('technologyPrefix', 'String50', 0), ('zone', 'String50', 0)), frozenset(), None, False),
+    'XH323Trunk.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'XH323TrunkDestination': ((('addressIpv4', 'String255', 0), ('sortOrder', 'XInteger', 1)), frozenset(), None, False),
+    'XHandoffConfiguration': ((('pattern', 'String16', 1), ('routePartitionName', 'XFkType', 4)), frozenset(), None, False),
+    'XHttpProfile': ((('name', 'xsd:string', 1), ('userName', 'xsd:string', 1), ('password', 'xsd:string', 1), ('requestTimeout', 'XRequestTimeout', 0), ('retryCount', 'XRetryCount', 0), ('webServiceRootUri', 'xsd:string', 1)), frozenset(), None, False),
+    'XHuntList': ((('description', 'xsd:string', 0), ('callManagerGroupName', 'XFkType', 4), ('routeListEnabled', 'boolean', 0), ('voiceMailUsage', 'boolean', 0), ('members', 'XHuntList.members', 0), ('name', 'xsd:string', 1)), frozenset(), None, False),
+    'XHuntList.members': ((('member', 'XHuntListMember', 2),), frozenset(), None, False),
+    'XHuntListMember': ((('lineGroupName', 'XFkType', 4), ('selectionOrder', 'XInteger', 1)), frozenset(), None, False),
+    'XHuntPilot': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('blockEnable', 'boolean', 1), ('calledPartyTransformationMask', 'xsd:string', 4), ('callingPartyTransformationMask', 'xsd:string', 4), ('useCallingPartyPhoneMask', 'XStatus', 1), ('callingPartyPrefixDigits', 'String50', 4), ('dialPlanName', 'XFkType', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 4), ('routeFilterName', 'XFkType', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('huntListName', 'XFkType', 1), ('parkMonForwardNoRetrieve', 'XHuntPilot.parkMonForwardNoRetrieve', 0), ('alertingName', 'String50', 0), ('asciiAlertingName', 'String32', 0), ('e164Mask', 'xsd:string', 4), ('aarNeighborhoodName', 'XFkType', 4), ('forwardHuntNoAnswer', 'XHuntPilot.forwardHuntNoAnswer', 0), ('forwardHuntBusy', 'XHuntPilot.forwardHuntBusy', 0), ('callPickupGroupName', 'XFkType', 0), ('maxHuntduration', 'XInteger', 4), ('releaseClause', 'XReleaseCauseValue', 0), ('displayConnectedNumber', 'boolean', 0), ('queueCalls', 'XCallsQueue', 0)), frozenset(), None, False),
+    'XHuntPilot.forwardHuntBusy': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'xsd:string', 4), ('callingSearchSpaceName', 'XFkType', 4)), frozenset(), None, False),
+    'XHuntPilot.forwardHuntNoAnswer': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'xsd:string', 4), ('callingSearchSpaceName', 'XFkType', 4)), frozenset(), None, False),
+    'XHuntPilot.parkMonForwardNoRetrieve': ((('usePersonalPreferences', 'boolean', 0), ('destination', 'String50', 4), ('callingSearchSpaceName', 'XFkType', 4)), frozenset(), None, False),
+    'XImeClient': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('domain', 'String255', 1), ('isActivated', 'boolean', 0), ('sipTrunkName', 'XFkType', 1), ('primaryImeServerName', 'XFkType', 1), ('secondaryImeServerName', 'XFkType', 4), ('learnedRouteFilterGroupName', 'XFkType', 4), ('exclusionNumberGroupName', 'XFkType', 4), ('firewallName', 'XFkType', 4), ('members', 'XImeClient.members', 0), ('ccmExternalIpMaps', 'XImeClient.ccmExternalIpMaps', 0)), frozenset(), None, False),
+    'XImeClient.ccmExternalIpMaps': ((('ccmExternalIpMap', 'XCcmExternalIpMap', 2),), frozenset(), None, False),
+    'XImeClient.members': ((('member', 'XImeClientMember', 3),), frozenset(), None, False),
+    'XImeClientMember': ((('enrolledPatternGroupName', 'XFkType', 1),), frozenset(), None, False),
+    'XImeE164Transformation': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('cgpnTransformationCssName', 'XFkType', 4), ('isCgpnPreTransformation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('isCdpnPreTransformation', 'boolean', 0), ('incomingCgpnTransformationProfileName', 'XFkType', 4), ('incomingCdpnTransformationProfileName', 'XFkType', 4)), frozenset(), None, False),
+    'XImeEnrolledPattern': ((('pattern', 'String16', 1), ('description', 'xsd:string', 0), ('imeEnrolledPatternGroupName', 'XFkType', 4)), frozenset(), None, False),
+    'XImeEnrolledPatternGroup': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('fallbackProfileName', 'XFkType', 4), ('isPatternAllAlias', 'boolean', 0)), frozenset(), None, False),
+    'XImeExclusionNumber': ((('pattern', 'String16', 1), ('description', 'xsd:string', 0), ('imeExclusionNumberGroupName', 'XFkType', 4)), frozenset(), None, False),
+    'XImeExclusionNumberGroup': ((('name', 'String50', 1), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'XImeFirewall': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('ipAddress', 'String15', 1), ('port', 'XInteger', 0)), frozenset(), None, False),
+    'XImeRouteFilterElement': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('elementType', 'XViprFilterElement', 0), ('imeRouteFilterGroupName', 'XFkType', 1)), frozenset(), None, False),
+    'XImeRouteFilterGroup': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('groupTrustSetting', 'boolean', 0)), frozenset(), None, False),
+    'XImeServer': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('ipAddress', 'xsd:string', 1), ('port', 'XInteger', 0), ('deviceSecurityMode', 'XServerSecurityMode', 0), ('applicationUser', 'XFkType', 1), ('reconnectInterval', 'XInteger', 0)), frozenset(), None, False),
+    'XImportedDirectoryUriCatalogs': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 4), ('routeString', 'xsd:string', 1), ('lastLoadedFileName', 'xsd:string', 4), ('fileLoadDateTime', 'XInteger', 4)), frozenset(), None, False),
+    'XInfrastructureDevice': ((('name', 'xsd:string', 0), ('ipv4Address', 'xsd:string', 0), ('ipv6Address', 'xsd:string', 4), ('bssidWithMask', 'xsd:string', 4), ('wapLocation', 'xsd:string', 4), ('isActive', 'boolean', 0)), frozenset(), None, False),
+    'XIpPhoneServices': ((('serviceName', 'UniqueString128', 1), ('asciiServiceName', 'UniqueString128', 1), ('serviceDescription', 'String128', 4), ('serviceUrl', 'xsd:string', 4), ('secureServiceUrl', 'xsd:string', 4), ('serviceCategory', 'XPhoneServiceCategory', 1), ('serviceType', 'XPhoneService', 1), ('serviceVendor', 'xsd:string', 0), ('serviceVersion', 'xsd:string', 0), ('enabled', 'boolean', 0), ('enterpriseSubscription', 'boolean', 0), ('parameters', 'XIpPhoneServices.parameters', 0)), frozenset(), None, False),
+    'XIpPhoneServices.parameters': ((('parameter', 'XIpPhoneServicesParameter', 3),), frozenset(), None, False),
+    'XIpPhoneServicesParameter': ((('name', 'UniqueString50', 1), ('displayName', 'String128', 1), ('default', 'String255', 0), ('description', 'String255', 4), ('paramRequired', 'boolean', 0), ('paramPassword', 'boolean', 0)), frozenset(), None, False),
+    'XIvrUserLocale': ((('userLocale', 'XUserLocale', 1), ('orderIndex', 'XInteger', 1)), frozenset(), None, False),
+    'XJabberClientConfigurationProfile': ((('common', 'xsd:string', 4), ('desktop', 'xsd:string', 4), ('mobile', 'xsd:string', 4)), frozenset(), None, False),
+    'XLbmGroup': ((('name', 'xsd:string', 1), ('Description', 'xsd:string', 0), ('ProcessnodeActive', 'XFkType', 4), ('ProcessnodeStandby', 'XFkType', 4)), frozenset(), None, False),
+    'XLbmHubGroup': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('member1', 'xsd:string', 1), ('member2', 'xsd:string', 0), ('member3', 'xsd:string', 0), ('members', 'XLbmHubGroup.members', 0)), frozenset(), None, False),
+    'XLbmHubGroup.members': ((('member', 'XProcessNodes', 2),), frozenset(), None, False),
+    'XLdapDirectory': ((('name', 'String50', 1), ('ldapDn', 'String128', 1), ('ldapPassword', 'String128', 1), ('userSearchBase', 'String255', 1), ('repeatable', 'boolean', 0), ('intervalValue', 'XInteger', 4), ('scheduleUnit', 'XScheduleUnit', 0), ('nextExecTime', 'String32', 1), ('servers', 'XLdapDirectory.servers', 1), ('middleName', 'String128', 0), ('phoneNumber', 'String128', 0), ('mailId', 'String128', 0), ('ldapFilter', 'XFkType', 4), ('synchronize', 'boolean', 0), ('ldapFilterForGroups', 'XFkType', 4), ('directoryUri', 'String128', 0), ('accessControlGroupInfo', 'XLdapDirectory.accessControlGroupInfo', 0), ('featureGroupTemplate', 'XFkType', 4), ('applyMask', 'boolean', 0), ('mask', 'xsd:string', 4), ('applyPoolList', 'boolean', 0), ('addDns', 'XLdapDirectory.addDns', 0)), frozenset(), None, False),
+    'XLdapDirectory.accessControlGroupInfo': ((('accessControlGroupName', 'XLdapDirectory.accessControlGroupInfo.accessControlGroupName', 2),), frozenset(), None, False),
+    'XLdapDirectory.accessControlGroupInfo.accessControlGroupName': ((('accessControlGroup', 'xsd:string', 0),), frozenset(), None, False),
+    'XLdapDirectory.addDns': ((('addDn', 'XLdapDirectory.addDns.addDn', 2),), frozenset(), None, False),
+    'XLdapDirectory.addDns.addDn': ((('startDn', 'xsd:string', 0), ('endDn', 'xsd:string', 0), ('dnPrefix', 'xsd:string', 0)), frozenset(), None, False),
+    'XLdapDirectory.servers': ((('server', 'XLdapDirectory.servers.server', 3),), frozenset(), None, False),
+    'XLdapDirectory.servers.server': ((('hostName', 'String128', 1), ('ldapPortNumber', 'XInteger', 1), ('sslEnabled', 'boolean', 0)), frozenset(), None, False),
+    'XLdapFilter': ((('name', 'String4096', 1), ('filter', 'String255', 1)), frozenset(), None, False),
+    'XLdapSyncCustomField': ((('ldapConfigurationName', 'xsd:string', 1), ('customUserField', 'xsd:string', 1), ('ldapUserField', 'xsd:string', 1)), frozenset(), None, False),
+    'XLine': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 1), ('routePartitionName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('aarDestinationMask', 'String128', 4), ('aarKeepCallHistory', 'boolean', 0), ('aarVoiceMailEnabled', 'boolean', 0), ('callForwardAll', 'XCallForwardAll', 0), ('callForwardBusy', 'XCallForwardBusy', 0), ('callForwardBusyInt', 'XCallForwardBusyInt', 0), ('callForwardNoAnswer', 'XCallForwardNoAnswer', 0), ('callForwardNoAnswerInt', 'XCallForwardNoAnswerInt', 0), ('callForwardNoCoverage', 'XCallForwardNoCoverage', 0), ('callForwardNoCoverageInt', 'XCallForwardNoCoverageInt', 0), ('callForwardOnFailure', 'XCallForwardOnFailure', 0), ('callForwardAlternateParty', 'XCallForwardAlternateParty', 0), ('callForwardNotRegistered', 'XCallForwardNotRegistered', 0), ('callForwardNotRegisteredInt', 'XCallForwardNotRegisteredInt', 0), ('callPickupGroupName', 'XFkType', 0), ('autoAnswer', 'XAutoAnswer', 0), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('callingIdPresentationWhenDiverted', 'XPresentationBit', 0), ('alertingName', 'String50', 0), ('asciiAlertingName', 'String32', 0), ('presenceGroupName', 'XFkType', 0), ('shareLineAppearanceCssName', 'XFkType', 4), ('voiceMailProfileName', 'XFkType', 4), ('patternPrecedence', 'XPatternPrecedence', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('hrDuration', 'XInteger', 4), ('hrInterval', 'XInteger', 4), ('cfaCssPolicy', 'XCFACSSActivationPolicy', 0), ('defaultActivatedDeviceName', 'XFkType', 4), ('parkMonForwardNoRetrieveDn', 'String50', 4), ('parkMonForwardNoRetrieveIntDn', 'String50', 4), ('parkMonForwardNoRetrieveVmEnabled', 'boolean', 0), ('parkMonForwardNoRetrieveIntVmEnabled', 'boolean', 0), ('parkMonForwardNoRetrieveCssName', 'XFkType', 4), ('parkMonForwardNoRetrieveIntCssName', 'XFkType', 4), ('parkMonReversionTimer', 'XInteger', 4), ('partyEntranceTone', 'XStatus', 0), ('directoryURIs', 'XLine.directoryURIs', 0), ('allowCtiControlFlag', 'boolean', 0), ('rejectAnonymousCall', 'boolean', 0), ('patternUrgency', 'boolean', 0), ('confidentialAccess', 'XLine.confidentialAccess', 0), ('externalCallControlProfile', 'XFkType', 4), ('enterpriseAltNum', 'XLine.enterpriseAltNum', 0), ('e164AltNum', 'XLine.e164AltNum', 0), ('pstnFailover', 'xsd:string', 0), ('callControlAgentProfile', 'xsd:string', 0), ('useEnterpriseAltNum', 'boolean', 0), ('useE164AltNum', 'boolean', 0), ('active', 'boolean', 0), ('externalPresentationInfo', 'XLine.externalPresentationInfo', 0)), frozenset(), None, False),
+    'XLine.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XLine.directoryURIs': ((('directoryUri', 'XDirectoryUri', 2),), frozenset(), None, False),
+    'XLine.e164AltNum': ((('numMask', 'xsd:string', 4), ('isUrgent', 'boolean', 0), ('addLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 4), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'XLine.enterpriseAltNum': ((('numMask', 'xsd:string', 4), ('isUrgent', 'boolean', 0), ('addLocalRoutePartition', 'boolean', 0), ('routePartition', 'XFkType', 4), ('advertiseGloballyIls', 'boolean', 0)), frozenset(), None, False),
+    'XLine.externalPresentationInfo': ((('isAnonymous', 'boolean', 0), ('presentationInfo', 'XLine.externalPresentationInfo.presentationInfo', 0)), frozenset(), None, False),
+    'XLine.externalPresentationInfo.presentationInfo': ((('externalPresentationNumber', 'xsd:string', 4), ('externalPresentationName', 'String50', 4)), frozenset(), None, False),
+    'XLineAppearanceAssociationForPresence': ((('laapAssociate', 'XFkType', 0), ('laapProductType', 'String128', 0), ('laapDeviceName', 'String128', 0), ('laapDirectory', 'String128', 0), ('laapPartition', 'String128', 0), ('laapDescription', 'String128', 0)), frozenset(), None, False),
+    'XLineAssociation': ((('uuid', 'XUUID', 0), ('pattern', 'xsd:string', 0), ('routePartitionName', 'XFkType', 0)), frozenset(), None, False),
+    'XLineGroup': ((('distributionAlgorithm', 'XDistributeAlgorithm', 1), ('rnaReversionTimeOut', 'XInteger', 1), ('huntAlgorithmNoAnswer', 'XHuntAlgorithm', 1), ('huntAlgorithmBusy', 'XHuntAlgorithm', 1), ('huntAlgorithmNotAvailable', 'XHuntAlgorithm', 1), ('members', 'XLineGroup.members', 0), ('name', 'xsd:string', 1), ('autoLogOffHunt', 'boolean', 0)), frozenset(), None, False),
+    'XLineGroup.members': ((('member', 'XLineGroupMember', 2),), frozenset(), None, False),
+    'XLineGroupMember': ((('lineSelectionOrder', 'XInteger', 1), ('directoryNumber', 'XDirn', 1)), frozenset(), None, False),
+    'XLoadInformation': ((), frozenset({'special'}), 'xsd:string', False),
+    'XLocalRouteGroup': ((('name', 'xsd:string', 0), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'XLocation': ((('name', 'String50', 1), ('relatedLocations', 'XLocation.relatedLocations', 0), ('withinAudioBandwidth', 'XInteger', 1), ('withinVideoBandwidth', 'XInteger', 1), ('withinImmersiveKbits', 'XInteger', 1), ('betweenLocations', 'XLocation.betweenLocations', 1)), frozenset(), None, False),
+    'XLocation.betweenLocations': ((('betweenLocation', 'XLocationBetween', 3),), frozenset(), None, False),
+    'XLocation.relatedLocations': ((('relatedLocation', 'XLocationRelationship', 3),), frozenset(), None, False),
+    'XLocationBetween': ((('locationName', 'XFkType', 1), ('weight', 'XInteger', 1), ('audioBandwidth', 'XInteger', 1), ('videoBandwidth', 'XInteger', 1), ('immersiveBandwidth', 'XInteger', 1)), frozenset(), None, False),
+    'XLocationRelationship': ((('locationName', 'XFkType', 1), ('rsvpSetting', 'XMatrixValue', 1)), frozenset(), None, False),
+    'XMediaResourceGroup': ((('name', 'String50', 1), ('description', 'String50', 0), ('multicast', 'boolean', 1), ('members', 'XMediaResourceGroup.members', 1)), frozenset(), None, False),
+    'XMediaResourceGroup.members': ((('member', 'XMediaResourceGroupMember', 3),), frozenset(), None, False),
+    'XMediaResourceGroupMember': ((('deviceName', 'XFkType', 1),), frozenset(), None, False),
+    'XMediaResourceList': ((('name', 'String50', 1), ('members', 'XMediaResourceList.members', 1)), frozenset(), None, False),
+    'XMediaResourceList.members': ((('member', 'XMediaResourceListMember', 3),), frozenset(), None, False),
+    'XMediaResourceListMember': ((('mediaResourceGroupName', 'XFkType', 1), ('order', 'XInteger', 1)), frozenset(), None, False),
+    'XMeetMe': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('minimumSecurityLevel', 'XDeviceSecurityMode', 4)), frozenset(), None, False),
+    'XMessageWaiting': ((('pattern', 'xsd:string', 1), ('routePartitionName', 'XFkType', 4), ('description', 'String128', 0), ('messageWaitingIndicator', 'boolean', 1), ('callingSearchSpaceName', 'XFkType', 4)), frozenset(), None, False),
+    'XMlppDomain': ((('domainName', 'xsd:string', 1), ('domainId', 'xsd:string', 1)), frozenset(), None, False),
+    'XMobileVoiceAccess': ((('pattern', 'xsd:string', 1), ('routePartitionName', 'XFkType', 4), ('locales', 'XMobileVoiceAccess.locales', 4)), frozenset(), None, False),
+    'XMobileVoiceAccess.locales': ((('locale', 'XMobileVoiceMember', 3),), frozenset(), None, False),
+    'XMobileVoiceMember': ((('userLocale', 'XUserLocale', 1), ('orderIndex', 'XInteger', 1)), frozenset(), None, False),
+    'XMobility': ((('handoffNumber', 'xsd:string', 1), ('handoffPartitionName', 'XFkType', 0), ('DTMFNumber', 'xsd:string', 1), ('DTMFPartitionName', 'XFkType', 0)), frozenset(), None, False),
+    'XMobilityProfile': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('mobileClientCallingOption', 'XDialViaOffice', 0), ('dvofServiceAccessNumber', 'xsd:string', 0), ('dirn', 'XDirn', 0), ('dvorCallerId', 'xsd:string', 4)), frozenset(), None, False),
+    'XMraServiceDomain': ((('name', 'xsd:string', 1), ('isDefault', 'boolean', 0), ('serviceDomains', 'xsd:string', 1)), frozenset(), None, False),
+    'XMtp': ((('mtpType', 'XProduct', 1), ('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('devicePoolName', 'XFkType', 4), ('trustedRelayPoint', 'boolean', 0)), frozenset(), None, False),
+    'XNetworkAccessProfile': ((('name', 'UniqueString128', 1), ('description', 'String255', 0), ('vpnRequired', 'XStatus', 1), ('proxySettings', 'XHTTPProxy', 1), ('proxyHostname', 'xsd:string', 1), ('proxyPort', 'XInteger', 1), ('proxyRequiresAuthentication', 'boolean', 0), ('provideSharedCredentials', 'boolean', 0), ('username', 'xsd:string', 0), ('password', 'xsd:string', 4)), frozenset(), None, False),
+    'XNormalizationScriptInfo': ((('parameterName', 'String128', 0), ('parameterValue', 'String128', 0)), frozenset(), None, False),
+    'XNumplanIdentifier': ((('directoryNumber', 'String255', 1), ('routePartitionName', 'String50', 4)), frozenset(), None, False),
+    'XParameterMember': ((('parameter', 'XDialParameter', 0), ('value', 'xsd:string', 0), ('selectionOrder', 'XInteger', 4)), frozenset(), None, False),
+    'XPatternMember': ((('description', 'xsd:string', 4), ('dialParameters', 'XPatternMember.dialParameters', 0), ('selectionOrder', 'XInteger', 1)), frozenset(), None, False),
+    'XPatternMember.dialParameters': ((('dialParameter', 'XParameterMember', 3),), frozenset(), None, False),
+    'XPhone': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('commonPhoneConfigName', 'XFkType', 1), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('versionStamp', 'String128', 4), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 1), ('retryVideoCallAsAudio', 'boolean', 0), ('securityProfileName', 'XFkType', 4), ('sipProfileName', 'XFkType', 4), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('sendGeoLocation', 'boolean', 0), ('lines', 'XPhone.lines', 0), ('phoneTemplateName', 'XFkType', 4), ('speeddials', 'XPhone.speeddials', 0), ('busyLampFields', 'XPhone.busyLampFields', 0), ('primaryPhoneName', 'XFkType', 4), ('ringSettingIdleBlfAudibleAlert', 'XStatus', 0), ('ringSettingBusyBlfAudibleAlert', 'XStatus', 0), ('blfDirectedCallParks', 'XPhone.blfDirectedCallParks', 0), ('addOnModules', 'XPhone.addOnModules', 0), ('userLocale', 'XUserLocale', 4), ('networkLocale', 'XCountry', 4), ('idleTimeout', 'XInteger', 4), ('authenticationUrl', 'xsd:string', 0), ('directoryUrl', 'xsd:string', 0), ('idleUrl', 'xsd:string', 0), ('informationUrl', 'xsd:string', 0), ('messagesUrl', 'xsd:string', 0), ('proxyServerUrl', 'xsd:string', 0), ('servicesUrl', 'xsd:string', 0), ('services', 'XPhone.services', 0), ('softkeyTemplateName', 'XFkType', 4), ('defaultProfileName', 'XFkType', 4), ('enableExtensionMobility', 'boolean', 0), ('singleButtonBarge', 'XBarge', 0), ('joinAcrossLines', 'XStatus', 0), ('builtInBridgeStatus', 'XStatus', 1), ('callInfoPrivacyStatus', 'XStatus', 0), ('hlogStatus', 'XStatus', 0), ('ownerUserName', 'XFkType', 4), ('ignorePresentationIndicators', 'boolean', 0), ('packetCaptureMode', 'XPacketCaptureMode', 1), ('packetCaptureDuration', 'XInteger', 4), ('subscribeCallingSearchSpaceName', 'XFkType', 4), ('rerouteCallingSearchSpaceName', 'XFkType', 4), ('allowCtiControlFlag', 'boolean', 0), ('presenceGroupName', 'XFkType', 0), ('unattendedPort', 'boolean', 0), ('requireDtmfReception', 'boolean', 0), ('rfc2833Disabled', 'boolean', 0), ('certificateOperation', 'XCertificateOperation', 1), ('authenticationMode', 'XAuthenticationMode', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('authenticationString', 'String128', 0), ('upgradeFinishTime', 'xsd:string', 0), ('deviceMobilityMode', 'XStatus', 1), ('remoteDevice', 'boolean', 0), ('dndOption', 'XDNDOption', 0), ('dndRingSetting', 'XRingSetting', 4), ('dndStatus', 'boolean', 0), ('isActive', 'boolean', 0), ('isDualMode', 'boolean', 0), ('mobilityUserIdName', 'XFkType', 4), ('phoneSuite', 'XPhonePersonalization', 0), ('phoneServiceDisplay', 'XPhoneServiceDisplay', 0), ('isProtected', 'boolean', 0), ('mtpRequired', 'boolean', 0), ('mtpPreferedCodec', 'XSIPCodec', 0), ('dialRulesName', 'XFkType', 4), ('sshUserId', 'String50', 0), ('sshPwd', 'String255', 0), ('digestUser', 'String255', 0), ('outboundCallRollover', 'XOutboundCallRollover', 0), ('hotlineDevice', 'boolean', 0), ('secureInformationUrl', 'String255', 0), ('secureDirectoryUrl', 'String255', 0), ('secureMessageUrl', 'String255', 0), ('secureServicesUrl', 'String255', 0), ('secureAuthenticationUrl', 'String255', 0), ('secureIdleUrl', 'String255', 0), ('alwaysUsePrimeLine', 'XStatus', 0), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 0), ('featureControlPolicy', 'XFkType', 4), ('deviceTrustMode', 'XDeviceTrustMode', 0), ('earlyOfferSupportForVoiceCall', 'boolean', 0), ('requireThirdPartyRegistration', 'boolean', 0), ('blockIncomingCallsWhenRoaming', 'boolean', 0), ('homeNetworkId', 'xsd:string', 0), ('AllowPresentationSharingUsingBfcp', 'boolean', 0), ('confidentialAccess', 'XPhone.confidentialAccess', 0), ('requireOffPremiseLocation', 'boolean', 0), ('allowiXApplicableMedia', 'boolean', 0), ('cgpnIngressDN', 'XFkType', 4), ('useDevicePoolCgpnIngressDN', 'boolean', 0), ('msisdn', 'String128', 4), ('enableCallRoutingToRdWhenNoneIsActive', 'boolean', 0), ('wifiHotspotProfile', 'XFkType', 4), ('wirelessLanProfileGroup', 'XFkType', 4), ('elinGroup', 'XFkType', 4), ('enableActivationID', 'boolean', 0), ('mraServiceDomain', 'XFkType', 4), ('allowMraMode', 'boolean', 0)), frozenset({'ctiid'}), None, False),
+    'XPhone.addOnModules': ((('addOnModule', 'XAddOnModule', 2),), frozenset(), None, False),
+    'XPhone.blfDirectedCallParks': ((('blfDirectedCallPark', 'XBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'XPhone.busyLampFields': ((('busyLampField', 'XBusyLampField', 2),), frozenset(), None, False),
+    'XPhone.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XPhone.lines': ((('line', 'XPhoneLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'XPhone.services': ((('service', 'XSubscribedService', 2),), frozenset(), None, False),
+    'XPhone.speeddials': ((('speeddial', 'XSpeeddial', 2),), frozenset(), None, False),
+    'XPhoneActivationCode': ((('activationCodeExpiry', 'XInteger', 0), ('phoneName', 'String255', 1)), frozenset(), None, False),
+    'XPhoneButtonTemplate': ((('name', 'xsd:string', 1), ('basePhoneTemplateName', 'XFkType', 1), ('buttons', 'XPhoneButtonTemplate.buttons', 0)), frozenset(), None, False),
+    'XPhoneButtonTemplate.buttons': ((('button', 'XButton', 2),), frozenset(), None, False),
+    'XPhoneLine': ((('index', 'XInteger', 1), ('label', 'String50', 0), ('display', 'String50', 0), ('dirn', 'XDirn', 1), ('ringSetting', 'XRingSetting', 0), ('consecutiveRingSetting', 'XRingSetting', 4), ('ringSettingIdlePickupAlert', 'XRingSetting', 4), ('ringSettingActivePickupAlert', 'XRingSetting', 4), ('displayAscii', 'String50', 0), ('e164Mask', 'String255', 4), ('mwlPolicy', 'XMWLPolicy', 0), ('maxNumCalls', 'XInteger', 0), ('busyTrigger', 'XInteger', 0), ('callInfoDisplay', 'XPhoneLine.callInfoDisplay', 0), ('recordingProfileName', 'XFkType', 4), ('monitoringCssName', 'XFkType', 4), ('recordingFlag', 'XRecordingFlag', 0), ('audibleMwi', 'XStatus', 0), ('speedDial', 'xsd:string', 4), ('partitionUsage', 'XPartitionUsage', 0), ('associatedEndusers', 'XPhoneLine.associatedEndusers', 0), ('missedCallLogging', 'boolean', 0), ('recordingMediaSource', 'XPreferredMediaSource', 0)), frozenset({'ctiid'}), None, False),
+    'XPhoneLine.associatedEndusers': ((('enduser', 'XEnduserMember', 2),), frozenset(), None, False),
+    'XPhoneLine.callInfoDisplay': ((('callerName', 'boolean', 0), ('callerNumber', 'boolean', 0), ('redirectedNumber', 'boolean', 0), ('dialedNumber', 'boolean', 0)), frozenset(), None, False),
+    'XPhoneNtp': ((('ipAddress', 'xsd:string', 1), ('ipv6Address', 'xsd:string', 1), ('description', 'xsd:string', 0), ('mode', 'XZzntpmode', 1)), frozenset(), None, False),
+    'XPhoneSecurityProfile': ((('phoneType', 'XModel', 4), ('protocol', 'XDeviceProtocol', 4), ('name', 'xsd:string', 1), ('description', 'xsd:string', 4), ('deviceSecurityMode', 'XDeviceSecurityMode', 4), ('authenticationMode', 'XAuthenticationMode', 0), ('keySize', 'XKeySize', 0), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('tftpEncryptedConfig', 'boolean', 0), ('EnableOAuthAuthentication', 'boolean', 0), ('nonceValidityTime', 'XInteger', 0), ('transportType', 'XTransport', 0), ('sipPhonePort', 'XInteger', 0), ('enableDigestAuthentication', 'boolean', 0), ('excludeDigestCredentials', 'boolean', 0)), frozenset(), None, False),
+    'XPhysicalLocation': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0)), frozenset(), None, False),
+    'XPickupGroupMember': ((('priority', 'XInteger', 1), ('pickupGroupName', 'XFkType', 0), ('pickupDnAndPartition', 'XPickupGroupMember.pickupDnAndPartition', 0)), frozenset(), None, False),
+    'XPickupGroupMember.pickupDnAndPartition': ((('dnPattern', 'String255', 1), ('routePartitionName', 'XFkType', 0)), frozenset(), None, False),
+    'XPolicyRelationship': ((('geoLocationPolicyAName', 'XFkType', 4), ('geoLocationDeviceA', 'XGeoLocationDevice', 1), ('geoLocationPolicyBName', 'XFkType', 4), ('geoLocationDeviceB', 'XGeoLocationDevice', 1), ('logicalPartitionPolicy', 'XLogicalPartitionPolicy', 1)), frozenset(), None, False),
+    'XPresenceGroup': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 4), ('presenceGroups', 'XPresenceGroup.presenceGroups', 0)), frozenset(), None, False),
+    'XPresenceGroup.presenceGroups': ((('presenceGroup', 'XPresenceGroupMember', 2),), frozenset(), None, False),
+    'XPresenceGroupMember': ((('presenceGroupName', 'XFkType', 1), ('subscriptionPermission', 'XMatrixValue', 1)), frozenset(), None, False),
+    'XPresenceRedundancyGroup': ((('name', 'String255', 1), ('description', 'String255', 0), ('server1', 'XFkType', 4), ('server2', 'XFkType', 4), ('haEnabled', 'boolean', 0)), frozenset(), None, False),
+    'XProcessNode': ((('name', 'String255', 1), ('description', 'String50', 0), ('mac', 'XMacAddress', 0), ('ipv6Name', 'xsd:string', 0), ('lbmHubGroup', 'XFkType', 4), ('processNodeRole', 'XProcessNodeRole', 1), ('cupDomain', 'xsd:string', 0)), frozenset(), None, False),
+    'XProcessNodes': ((('lbmAssignedServices', 'XFkType', 4),), frozenset(), None, False),
+    'XRecordingProfile': ((('name', 'String50', 1), ('recordingCssName', 'XFkType', 4), ('recorderDestination', 'xsd:string', 1)), frozenset(), None, False),
+    'XRegion': ((('name', 'String50', 1), ('relatedRegions', 'XRegion.relatedRegions', 0), ('defaultCodec', 'xsd:string', 0)), frozenset(), None, False),
+    'XRegion.relatedRegions': ((('relatedRegion', 'XRegionRelationship', 3),), frozenset(), None, False),
+    'XRegionRelationship': ((('regionName', 'XFkType', 1), ('bandwidth', 'xsd:string', 1), ('videoBandwidth', 'XInteger', 1), ('lossyNetwork', 'XLossyNetwork', 0), ('codecPreference', 'XFkType', 4), ('immersiveVideoBandwidth', 'XInteger', 1)), frozenset(), None, False),
+    'XRemoteCluster': ((('clusterId', 'String255', 1), ('description', 'xsd:string', 0), ('fullyQualifiedName', 'String50', 1), ('emcc', 'XRemoteClusterMember', 0), ('pstnAccess', 'XRemoteClusterMember', 0), ('rsvpAgent', 'XRemoteClusterMember', 0), ('tftp', 'XRemoteClusterMember', 0), ('lbm', 'XRemoteClusterMember', 0), ('uds', 'XRemoteClusterMember', 0)), frozenset(), None, False),
+    'XRemoteClusterMember': ((('enabled', 'boolean', 1),), frozenset(), None, False),
+    'XRemoteDestination': ((('name', 'xsd:string', 0), ('destination', 'xsd:string', 1), ('answerTooSoonTimer', 'XInteger', 1), ('answerTooLateTimer', 'XInteger', 1), ('delayBeforeRingingCell', 'XInteger', 1), ('ownerUserId', 'XFkType', 1), ('enableUnifiedMobility', 'boolean', 0), ('remoteDestinationProfileName', 'XFkType', 4), ('enableExtendAndConnect', 'boolean', 0), ('ctiRemoteDeviceName', 'XFkType', 4), ('dualModeDeviceName', 'XFkType', 4), ('isMobilePhone', 'boolean', 0), ('enableMobileConnect', 'boolean', 0), ('lineAssociations', 'XRemoteDestination.lineAssociations', 0), ('timeZone', 'XTimeZone', 0), ('todAccessName', 'XFkType', 4), ('mobileSmartClientName', 'XFkType', 4), ('mobilityProfileName', 'XFkType', 4), ('singleNumberReachVoicemail', 'XVMAvoidancePolicy', 0), ('dialViaOfficeReverseVoicemail', 'XVMAvoidancePolicy', 0), ('ringSchedule', 'XRemoteDestination.ringSchedule', 0), ('accessListName', 'XFkType', 4)), frozenset(), None, False),
+    'XRemoteDestination.lineAssociations': ((('lineAssociation', 'XLineAssociation', 3),), frozenset(), None, False),
+    'XRemoteDestination.ringSchedule': ((('member', 'XRingingSchedule', 3),), frozenset(), None, False),
+    'XRemoteDestinationProfile': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('lines', 'XRemoteDestinationProfile.lines', 0), ('callInfoPrivacyStatus', 'XStatus', 1), ('userId', 'xsd:string', 4), ('ignorePresentationIndicators', 'boolean', 0), ('rerouteCallingSearchSpaceName', 'XFkType', 4), ('cgpnTransformationCssName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('userLocale', 'XUserLocale', 4), ('networkLocale', 'XCountry', 4), ('primaryPhoneName', 'XFkType', 4), ('dndOption', 'XDNDOption', 0), ('dndStatus', 'boolean', 0), ('mobileSmartClientProfileName', 'XFkType', 4)), frozenset({'ctiid'}), None, False),
+    'XRemoteDestinationProfile.lines': ((('line', 'XPhoneLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'XResourcePriorityNamespace': ((('namespace', 'String10', 1), ('description', 'xsd:string', 0), ('isDefault', 'boolean', 0)), frozenset(), None, False),
+    'XResourcePriorityNamespaceList': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('members', 'XResourcePriorityNamespaceList.members', 0)), frozenset(), None, False),
+    'XResourcePriorityNamespaceList.members': ((('member', 'XResourcePriorityNamespaceListMember', 3),), frozenset(), None, False),
+    'XResourcePriorityNamespaceListMember': ((('resourcePriorityNamespaceName', 'XFkType', 1), ('index', 'XInteger', 1)), frozenset(), None, False),
+    'XRingingSchedule': ((('startTime', 'XTimeOfDay', 0), ('endTime', 'XTimeOfDay', 0), ('startDay', 'XDayOfWeek', 0), ('endDay', 'XDayOfWeek', 0)), frozenset(), None, False),
+    'XRouteFilter': ((('name', 'xsd:string', 1), ('dialPlanName', 'XFkType', 1), ('members', 'XRouteFilter.members', 1)), frozenset(), None, False),
+    'XRouteFilter.members': ((('member', 'XRouteFilterMember', 2),), frozenset(), None, False),
+    'XRouteFilterMember': ((('dialPlanTagName', 'XFkType', 1), ('digits', 'String50', 0), ('operator', 'XOperator', 1), ('priority', 'XInteger', 1)), frozenset(), None, False),
+    'XRouteGroup': ((('distributionAlgorithm', 'XDistributeAlgorithm', 1), ('members', 'XRouteGroup.members', 1), ('name', 'xsd:string', 1)), frozenset(), None, False),
+    'XRouteGroup.members': ((('member', 'XRouteGroupMember', 3),), frozenset(), None, False),
+    'XRouteGroupMember': ((('deviceSelectionOrder', 'XInteger', 1), ('deviceName', 'XFkType', 1), ('port', 'XInteger', 1)), frozenset(), None, False),
+    'XRouteList': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('callManagerGroupName', 'XFkType', 4), ('routeListEnabled', 'boolean', 0), ('members', 'XRouteList.members', 0), ('runOnEveryNode', 'boolean', 0)), frozenset(), None, False),
+    'XRouteList.members': ((('member', 'XRouteListMember', 2),), frozenset(), None, False),
+    'XRouteListMember': ((('routeGroupName', 'XFkType', 4), ('selectionOrder', 'XInteger', 1), ('calledPartyTransformationMask', 'String50', 4), ('callingPartyTransformationMask', 'String50', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('callingPartyPrefixDigits', 'String50', 4), ('prefixDigitsOut', 'String50', 4), ('useFullyQualifiedCallingPartyNumber', 'XStatus', 1), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0)), frozenset(), None, False),
+    'XRoutePartition': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('timeScheduleIdName', 'XFkType', 4), ('useOriginatingDeviceTimeZone', 'boolean', 0), ('timeZone', 'XTimeZone', 0), ('partitionUsage', 'XPartitionUsage', 0)), frozenset(), None, False),
+    'XRoutePattern': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('routePartitionName', 'XFkType', 4), ('blockEnable', 'boolean', 1), ('calledPartyTransformationMask', 'xsd:string', 4), ('callingPartyTransformationMask', 'xsd:string', 4), ('useCallingPartyPhoneMask', 'XStatus', 1), ('callingPartyPrefixDigits', 'String50', 4), ('dialPlanName', 'XFkType', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 1), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 4), ('routeFilterName', 'XFkType', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('supportOverlapSending', 'boolean', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('releaseClause', 'XReleaseCauseValue', 0), ('allowDeviceOverride', 'boolean', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('destination', 'XRoutePattern.destination', 1), ('authorizationCodeRequired', 'boolean', 0), ('authorizationLevelRequired', 'XInteger', 0), ('clientCodeRequired', 'boolean', 0), ('isdnNsfInfoElement', 'XRoutePattern.isdnNsfInfoElement', 0), ('resourcePriorityNamespaceName', 'XFkType', 4), ('routeClass', 'XPatternRouteClass', 0), ('enableDccEnforcement', 'boolean', 0), ('blockedCallPercentage', 'xsd:string', 4), ('externalCallControl', 'XFkType', 4), ('isEmergencyServiceNumber', 'boolean', 0)), frozenset(), None, False),
+    'XRoutePattern.destination': ((('gatewayName', 'XFkType', 0), ('routeListName', 'XFkType', 0)), frozenset(), None, False),
+    'XRoutePattern.isdnNsfInfoElement': ((('cic', 'xsd:string', 0), ('networkServiceProtocol', 'XPriProtocol', 1), ('networkService', 'XNSFService', 0), ('paramValue', 'xsd:string', 0)), frozenset(), None, False),
+    'XSIPNormalizationScript': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('content', 'xsd:string', 1), ('scriptExecutionErrorRecoveryAction', 'XSIPScriptErrorHandling', 1), ('systemResourceErrorRecoveryAction', 'XSIPScriptErrorHandling', 1), ('maxMemoryThreshold', 'xsd:string', 1), ('maxLuaInstructionsThreshold', 'xsd:string', 1), ('isStandard', 'boolean', 1)), frozenset(), None, False),
+    'XSafCcdPurgeBlockLearnedRoutes': ((('learnedPattern', 'String50', 0), ('learnedPatternPrefix', 'String50', 0), ('callControlIdentity', 'String50', 0), ('ipAddress', 'String50', 0)), frozenset(), None, False),
+    'XSafForwarder': ((('name', 'String255', 1), ('description', 'String255', 0), ('clientLabel', 'String255', 1), ('safSecurityProfile', 'XFkType', 1), ('ipAddress', 'String255', 1), ('port', 'XInteger', 0), ('enableTcpKeepAlive', 'boolean', 0), ('safReconnectInterval', 'XInteger', 0), ('safNotificationsWindowSize', 'XInteger', 0), ('associatedCucms', 'XSafForwarder.associatedCucms', 0)), frozenset(), None, False),
+    'XSafForwarder.associatedCucms': ((('associatedCucm', 'XSafForwarderMember', 3),), frozenset(), None, False),
+    'XSafForwarderMember': ((('callManagerName', 'XFkType', 1),), frozenset(), None, False),
+    'XSafSecurityProfile': ((('name', 'String255', 1), ('description', 'String255', 0), ('userid', 'String50', 1), ('password', 'String128', 1)), frozenset(), None, False),
+    'XSdpTransparencyProfile': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('attributeSet', 'XSdpTransparencyProfile.attributeSet', 3)), frozenset(), None, False),
+    'XSdpTransparencyProfile.attributeSet': ((('attributeNameString', 'xsd:string', 1), ('sdpAttributeHandling', 'xsd:string', 1), ('allowedValue', 'xsd:string', 2)), frozenset(), None, False),
+    'XSelfProvision': ((('name', 'XUserLocale', 0), ('priority', 'xsd:integer', 0)), frozenset(), None, False),
+    'XSelfProvisionRemove': ((('name', 'XUserLocale', 0),), frozenset(), None, False),
+    'XServiceProfile': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('isDefault', 'boolean', 0), ('serviceProfileInfos', 'XServiceProfile.serviceProfileInfos', 0)), frozenset(), None, False),
+    'XServiceProfile.serviceProfileInfos': ((('serviceProfileInfo', 'XServiceProfileList', 2), ('jabberClientConfigurationProfileInfo', 'XJabberClientConfigurationProfile', 0)), frozenset(), None, False),
+    'XServiceProfileList': ((('profileName', 'xsd:string', 1), ('primary', 'xsd:string', 4), ('secondary', 'xsd:string', 4), ('tertiary', 'xsd:string', 4), ('serverCertificateVerification', 'XCertificateVerificationLevel', 4), ('serviceProfileXml', 'XVendorConfig', 0)), frozenset(), None, False),
+    'XSipDialRules': ((('dialPattern', 'XDialPattern', 1), ('name', 'String50', 1), ('description', 'xsd:string', 4), ('patterns', 'XSipDialRules.patterns', 0), ('plars', 'XSipDialRules.plars', 0)), frozenset(), None, False),
+    'XSipDialRules.patterns': ((('pattern', 'XPatternMember', 3),), frozenset(), None, False),
+    'XSipDialRules.plars': ((('plar', 'XPatternMember', 3),), frozenset(), None, False),
+    'XSipProfile': ((('name', 'String50', 1), ('description', 'String100', 4), ('defaultTelephonyEventPayloadType', 'XInteger', 0), ('redirectByApplication', 'boolean', 0), ('ringing180', 'boolean', 0), ('timerInvite', 'XInteger', 0), ('timerRegisterDelta', 'XInteger', 0), ('timerRegister', 'XInteger', 0), ('timerT1', 'XInteger', 0), ('timerT2', 'XInteger', 0), ('retryInvite', 'XInteger', 0), ('retryNotInvite', 'XInteger', 0), ('startMediaPort', 'XInteger', 0), ('stopMediaPort', 'XInteger', 0), ('startVideoPort', 'XInteger', 0), ('stopVideoPort', 'XInteger', 0), ('dscpForAudioCalls', 'xsd:string', 4), ('dscpForVideoCalls', 'xsd:string', 4), ('dscpForAudioPortionOfVideoCalls', 'xsd:string', 4), ('dscpForTelePresenceCalls', 'xsd:string', 4), ('dscpForAudioPortionOfTelePresenceCalls', 'xsd:string', 4), ('callpickupListUri', 'String128', 0), ('callpickupGroupUri', 'String128', 0), ('meetmeServiceUrl', 'String128', 0), ('userInfo', 'XZzuserInfo', 0), ('dtmfDbLevel', 'XZzdtmfDbLevel', 0), ('callHoldRingback', 'XZzpreff', 0), ('anonymousCallBlock', 'XZzpreff', 0), ('callerIdBlock', 'XZzpreff', 0), ('dndControl', 'XZzdndcontrol', 0), ('telnetLevel', 'XTelnetLevel', 0), ('timerKeepAlive', 'XInteger', 0), ('timerSubscribe', 'XInteger', 0), ('timerSubscribeDelta', 'XInteger', 0), ('maxRedirects', 'XInteger', 0), ('timerOffHookToFirstDigit', 'XInteger', 0), ('callForwardUri', 'String128', 0), ('abbreviatedDialUri', 'String128', 0), ('confJointEnable', 'boolean', 0), ('rfc2543Hold', 'boolean', 0), ('semiAttendedTransfer', 'boolean', 0), ('enableVad', 'boolean', 0), ('stutterMsgWaiting', 'boolean', 0), ('callStats', 'boolean', 0), ('t38Invite', 'boolean', 0), ('faxInvite', 'boolean', 0), ('rerouteIncomingRequest', 'XSIPReroute', 0), ('resourcePriorityNamespaceListName', 'XFkType', 4), ('enableAnatForEarlyOfferCalls', 'boolean', 0), ('rsvpOverSip', 'XRSVPOverSIP', 0), ('fallbackToLocalRsvp', 'boolean', 0), ('sipRe11XxEnabled', 'XSIPRel1XXOptions', 0), ('gClear', 'XGClear', 0), ('sendRecvSDPInMidCallInvite', 'boolean', 0), ('enableOutboundOptionsPing', 'boolean', 0), ('optionsPingIntervalWhenStatusOK', 'XInteger', 0), ('optionsPingIntervalWhenStatusNotOK', 'XInteger', 0), ('deliverConferenceBridgeIdentifier', 'boolean', 0), ('sipOptionsRetryCount', 'XInteger', 0), ('sipOptionsRetryTimer', 'XInteger', 0), ('sipBandwidthModifier', 'XSIPBandwidthModifier', 1), ('enableUriOutdialSupport', 'xsd:string', 0), ('userAgentServerHeaderInfo', 'XUserAgentServerHeaderInfo', 1), ('allowPresentationSharingUsingBfcp', 'boolean', 0), ('scriptParameters', 'xsd:string', 0), ('isScriptTraceEnabled', 'boolean', 0), ('sipNormalizationScript', 'XFkType', 4), ('allowiXApplicationMedia', 'boolean', 0), ('dialStringInterpretation', 'XURIDisambiguationPolicy', 1), ('acceptAudioCodecPreferences', 'XStatus', 0), ('mlppUserAuthorization', 'boolean', 0), ('isAssuredSipServiceEnabled', 'boolean', 0), ('enableExternalQoS', 'boolean', 0), ('resourcePriorityNamespace', 'XFkType', 4), ('useCallerIdCallerNameinUriOutgoingRequest', 'boolean', 0), ('externalPresentationInfo', 'XSipProfile.externalPresentationInfo', 0), ('callingLineIdentification', 'XCallingLineIdentification', 1), ('rejectAnonymousIncomingCall', 'boolean', 0), ('callpickupUri', 'String128', 0), ('rejectAnonymousOutgoingCall', 'boolean', 0), ('videoCallTrafficClass', 'XVideoCallTrafficClass', 0), ('sdpTransparency', 'XFkType', 4), ('allowMultipleCodecs', 'boolean', 0), ('sipSessionRefreshMethod', 'XSipSessionRefreshMethod', 1), ('earlyOfferSuppVoiceCall', 'XEOSuppVoiceCall', 1), ('cucmVersionInSipHeader', 'XCUCMVersionInSipHeader', 1), ('confidentialAccessLevelHeaders', 'XCALHeaders', 1), ('destRouteString', 'boolean', 0), ('inactiveSDPRequired', 'boolean', 0), ('allowRRAndRSBandwidthModifier', 'boolean', 0), ('connectCallBeforePlayingAnnouncement', 'boolean', 0)), frozenset(), None, False),
+    'XSipProfile.externalPresentationInfo': ((('isAnonymous', 'boolean', 0), ('presentationInfo', 'XSipProfile.externalPresentationInfo.presentationInfo', 0)), frozenset(), None, False),
+    'XSipProfile.externalPresentationInfo.presentationInfo': ((('externalPresentationNumber', 'xsd:string', 4), ('externalPresentationName', 'String50', 4)), frozenset(), None, False),
+    'XSipRealm': ((('realm', 'xsd:string', 1), ('userid', 'xsd:string', 1), ('digestCredentials', 'xsd:string', 1)), frozenset(), None, False),
+    'XSipRoutePattern': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 1), ('routePartitionName', 'XFkType', 4), ('blockEnable', 'boolean', 0), ('callingPartyTransformationMask', 'xsd:string', 4), ('useCallingPartyPhoneMask', 'XStatus', 1), ('callingPartyPrefixDigits', 'String50', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('sipTrunkName', 'XFkType', 1), ('dnOrPatternIpv6', 'xsd:string', 0), ('routeOnUserPart', 'boolean', 0), ('useCallerCss', 'boolean', 0), ('domainRoutingCssName', 'XFkType', 4)), frozenset(), None, False),
+    'XSipTrunk': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('networkLocation', 'XNetworkLocation', 0), ('locationName', 'XFkType', 1), ('mediaResourceListName', 'XFkType', 4), ('networkHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('userHoldMohAudioSourceId', 'XMOHAudioSourceId', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('packetCaptureMode', 'XPacketCaptureMode', 0), ('packetCaptureDuration', 'XInteger', 4), ('loadInformation', 'XLoadInformation', 4), ('traceFlag', 'boolean', 0), ('mlppDomainId', 'String128', 4), ('mlppIndicationStatus', 'XStatus', 0), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('securityProfileName', 'XFkType', 4), ('sipProfileName', 'XFkType', 4), ('cgpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCss', 'boolean', 0), ('geoLocationName', 'XFkType', 4), ('geoLocationFilterName', 'XFkType', 4), ('sendGeoLocation', 'boolean', 0), ('cdpnTransformationCssName', 'XFkType', 4), ('useDevicePoolCdpnTransformCss', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('transmitUtf8', 'boolean', 0), ('subscribeCallingSearchSpaceName', 'XFkType', 4), ('rerouteCallingSearchSpaceName', 'XFkType', 4), ('referCallingSearchSpaceName', 'XFkType', 4), ('mtpRequired', 'boolean', 0), ('presenceGroupName', 'XFkType', 1), ('unknownPrefix', 'String16', 0), ('destAddrIsSrv', 'boolean', 0), ('tkSipCodec', 'XSIPCodec', 0), ('sigDigits', 'XSipTrunk.sigDigits', 4), ('connectedNamePresentation', 'XPresentationBit', 0), ('connectedPartyIdPresentation', 'XPresentationBit', 0), ('callingPartySelection', 'XCallingPartySelection', 0), ('callingname', 'XPresentationBit', 0), ('callingLineIdPresentation', 'XPresentationBit', 0), ('prefixDn', 'String50', 4), ('externalPresentationInfo', 'XSipTrunk.externalPresentationInfo', 0), ('acceptInboundRdnis', 'boolean', 0), ('acceptOutboundRdnis', 'boolean', 0), ('srtpAllowed', 'boolean', 0), ('srtpFallbackAllowed', 'boolean', 0), ('isPaiEnabled', 'boolean', 0), ('sipPrivacy', 'XSipPrivacy', 0), ('isRpidEnabled', 'boolean', 0), ('sipAssertedType', 'XSipAssertedType', 0), ('trustReceivedIdentity', 'XTrustReceivedIdentity', 4), ('dtmfSignalingMethod', 'XDTMFSignaling', 0), ('routeClassSignalling', 'XStatus', 0), ('sipTrunkType', 'XTrunkService', 0), ('pstnAccess', 'boolean', 0), ('imeE164TransformationName', 'XFkType', 4), ('useImePublicIpPort', 'boolean', 0), ('useDevicePoolCntdPnTransformationCss', 'boolean', 0), ('cntdPnTransformationCssName', 'XFkType', 4), ('useDevicePoolCgpnTransformCssUnkn', 'boolean', 0), ('rdnTransformationCssName', 'XFkType', 4), ('useDevicePoolRdnTransformCss', 'boolean', 0), ('useOrigCallingPartyPresOnDivert', 'boolean', 0), ('sipNormalizationScriptName', 'XFkType', 4), ('runOnEveryNode', 'boolean', 0), ('destinations', 'XSipTrunk.destinations', 0), ('unknownStripDigits', 'XInteger', 4), ('cgpnTransformationUnknownCssName', 'XFkType', 4), ('tunneledProtocol', 'XTunneledProtocol', 0), ('asn1RoseOidEncoding', 'XASN1RoseOidEncoding', 0), ('qsigVariant', 'XQSIGVariant', 0), ('pathReplacementSupport', 'boolean', 0), ('enableQsigUtf8', 'boolean', 0), ('scriptParameters', 'xsd:string', 0), ('scriptTraceEnabled', 'boolean', 0), ('trunkTrafficSecure', 'XSIPTrunkCallLegSecurity', 0), ('callingAndCalledPartyInfoFormat', 'XSIPIdentityBlend', 1), ('useCallerIdCallerNameinUriOutgoingRequest', 'boolean', 0), ('service', 'xsd:string', 0), ('parameterLabel', 'xsd:string', 0), ('originatingParameterValue', 'xsd:string', 0), ('terminatingParameterValue', 'xsd:string', 0), ('outboundUriRoutingInstructions', 'xsd:string', 0), ('requestUriDomainName', 'xsd:string', 0), ('enableCiscoRecordingQsigTunneling', 'boolean', 0), ('recordingInformation', 'xsd:string', 0), ('calledPartyUnknownTransformationCssName', 'XFkType', 4), ('calledPartyUnknownPrefix', 'String16', 0), ('calledPartyUnknownStripDigits', 'XInteger', 4), ('useDevicePoolCalledCssUnkn', 'boolean', 0), ('confidentialAccess', 'XSipTrunk.confidentialAccess', 0)), frozenset({'ctiid'}), None, False),
+    'XSipTrunk.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XSipTrunk.destinations': ((('destination', 'XSipTrunkDestination', 2),), frozenset(), None, False),
+    'XSipTrunk.externalPresentationInfo': ((('isAnonymous', 'boolean', 0), ('presentationInfo', 'XSipTrunk.externalPresentationInfo.presentationInfo', 0)), frozenset(), None, False),
+    'XSipTrunk.externalPresentationInfo.presentationInfo': ((('externalPresentationNumber', 'xsd:string', 4), ('externalPresentationName', 'String50', 4)), frozenset(), None, False),
+    'XSipTrunk.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'XSipTrunkDestination': ((('addressIpv4', 'String255', 0), ('addressIpv6', 'String255', 0), ('port', 'XInteger', 0), ('sortOrder', 'XInteger', 1)), frozenset(), None, False),
+    'XSipTrunkSecurityProfile': ((('name', 'String75', 1), ('description', 'String100', 4), ('securityMode', 'XDeviceSecurityMode', 4), ('incomingTransport', 'XTransport', 0), ('outgoingTransport', 'XTransport', 4), ('digestAuthentication', 'boolean', 0), ('noncePolicyTime', 'XInteger', 0), ('x509SubjectName', 'String4096', 0), ('incomingPort', 'XInteger', 0), ('applLevelAuthentication', 'boolean', 0), ('acceptPresenceSubscription', 'boolean', 0), ('acceptOutOfDialogRefer', 'boolean', 0), ('acceptUnsolicitedNotification', 'boolean', 0), ('allowReplaceHeader', 'boolean', 0), ('transmitSecurityStatus', 'boolean', 0), ('sipV150OutboundSdpOfferFiltering', 'XV150SDPFilter', 1), ('allowChargingHeader', 'boolean', 0)), frozenset(), None, False),
+    'XSoftKeyMember': ((('positionId', 'xsd:nonNegativeInteger', 0), ('softKeyName', 'xsd:string', 0)), frozenset(), None, False),
+    'XSoftKeyTemplate': ((('name', 'String100', 1), ('description', 'String100', 1), ('baseSoftkeyTemplateName', 'XFkType', 1), ('isDefault', 'boolean', 0)), frozenset(), None, False),
+    'XSpeeddial': ((('dirn', 'String255', 1), ('label', 'xsd:string', 1), ('index', 'XInteger', 1)), frozenset(), None, False),
+    'XSrst': ((('name', 'xsd:string', 1), ('port', 'XInteger', 1), ('ipAddress', 'xsd:string', 1), ('ipv6Address', 'xsd:string', 4), ('SipNetwork', 'xsd:string', 0), ('SipPort', 'XInteger', 1), ('isSecure', 'boolean', 0)), frozenset(), None, False),
+    'XSubscribedService': ((('telecasterServiceName', 'XFkType', 1), ('name', 'String100', 1), ('url', 'xsd:string', 4), ('urlButtonIndex', 'XInteger', 0), ('urlLabel', 'String50', 0), ('serviceNameAscii', 'String50', 0)), frozenset(), None, False),
+    'XSyslogConfig': ((('AlarmLevelEvent', 'XAlarmSeverity', 1), ('RemoteServerName1', 'xsd:string', 1), ('RemoteServerName2', 'xsd:string', 1), ('RemoteServerName3', 'xsd:string', 1), ('RemoteServerName4', 'xsd:string', 1), ('RemoteServerName5', 'xsd:string', 1), ('monitor', 'xsd:string', 1), ('Enable', 'boolean', 1)), frozenset(), None, False),
+    'XT1Port': ((('portNumber', 'XInteger', 1), ('attendantDn', 'String255', 0), ('unattendedPort', 'boolean', 4), ('callerIdDn', 'String255', 4), ('callerIdEnable', 'boolean', 1), ('callingPartySelection', 'XCallingPartySelection', 1), ('digitSending', 'XDigitSending', 1), ('expectedDigits', 'XInteger', 1), ('sigDigits', 'XT1Port.sigDigits', 1), ('prefixDn', 'String255', 4), ('presentationBit', 'XPresentationBit', 1), ('silenceSuppressionThreshold', 'XSilenceSuppressionThreshold', 1), ('startDialProtocol', 'XStartDialProtocol', 1), ('trunk', 'XTrunk', 1), ('trunkDirection', 'XTrunkDirection', 1), ('trunkLevel', 'XTrunkLevel', 1), ('trunkPadRx', 'XTrunkPad', 1), ('trunkPadTx', 'XTrunkPad', 1), ('vendorConfig', 'XVendorConfig', 4), ('callerId', 'XCallerID', 1), ('endpointId', 'String128', 0), ('timer1', 'XInteger', 0), ('timer2', 'XInteger', 0), ('timer3', 'XInteger', 0), ('timer4', 'XInteger', 0), ('timer5', 'XInteger', 0), ('timer6', 'XInteger', 0)), frozenset(), None, False),
+    'XT1Port.sigDigits': ((), frozenset({'enable'}), 'XInteger', False),
+    'XTODAccessMember': ((('timeScheduleName', 'XFkType', 4), ('accessListName', 'XFkType', 4)), frozenset(), None, False),
+    'XTimePeriod': ((('name', 'String50', 1), ('startTime', 'XTimeOfDay', 0), ('endTime', 'XTimeOfDay', 0), ('startDay', 'XDayOfWeek', 0), ('endDay', 'XDayOfWeek', 0), ('monthOfYear', 'XMonthOfYear', 0), ('dayOfMonth', 'XInteger', 0), ('description', 'String255', 0), ('isPublished', 'boolean', 0), ('todOwnerIdName', 'XFkType', 4), ('dayOfMonthEnd', 'XInteger', 0), ('monthOfYearEnd', 'XMonthOfYear', 0)), frozenset(), None, False),
+    'XTimeSchedule': ((('name', 'String50', 1), ('members', 'XTimeSchedule.members', 1), ('description', 'String255', 0), ('isPublished', 'boolean', 0), ('timeScheduleCategory', 'XTimeScheduleCategory', 0), ('todOwnerIdName', 'XFkType', 4)), frozenset(), None, False),
+    'XTimeSchedule.members': ((('member', 'XTimeScheduleTimePeriod', 3),), frozenset(), None, False),
+    'XTimeScheduleTimePeriod': ((('timePeriodName', 'XFkType', 1),), frozenset(), None, False),
+    'XTodAccess': ((('name', 'String128', 1), ('description', 'String255', 0), ('ownerIdName', 'XFkType', 1), ('members', 'XTodAccess.members', 0)), frozenset(), None, False),
+    'XTodAccess.members': ((('member', 'XTODAccessMember', 1),), frozenset(), None, False),
+    'XTransPattern': ((('pattern', 'xsd:string', 1), ('description', 'xsd:string', 0), ('usage', 'XPatternUsage', 1), ('routePartitionName', 'XFkType', 4), ('blockEnable', 'boolean', 0), ('calledPartyTransformationMask', 'xsd:string', 4), ('callingPartyTransformationMask', 'xsd:string', 4), ('useCallingPartyPhoneMask', 'XStatus', 0), ('callingPartyPrefixDigits', 'String50', 4), ('dialPlanName', 'XFkType', 4), ('digitDiscardInstructionName', 'XFkType', 4), ('patternUrgency', 'boolean', 0), ('prefixDigitsOut', 'xsd:string', 4), ('routeFilterName', 'XFkType', 4), ('callingLinePresentationBit', 'XPresentationBit', 0), ('callingNamePresentationBit', 'XPresentationBit', 0), ('connectedLinePresentationBit', 'XPresentationBit', 0), ('connectedNamePresentationBit', 'XPresentationBit', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('provideOutsideDialtone', 'boolean', 0), ('callingPartyNumberingPlan', 'XNumberingPlan', 0), ('callingPartyNumberType', 'XPriOfNumber', 0), ('calledPartyNumberingPlan', 'XNumberingPlan', 0), ('calledPartyNumberType', 'XPriOfNumber', 0), ('callingSearchSpaceName', 'XFkType', 4), ('resourcePriorityNamespaceName', 'XFkType', 4), ('routeNextHopByCgpn', 'boolean', 0), ('routeClass', 'XPatternRouteClass', 0), ('callInterceptProfileName', 'XFkType', 4), ('releaseClause', 'XReleaseCauseValue', 0), ('useOriginatorCss', 'boolean', 0), ('dontWaitForIDTOnSubsequentHops', 'boolean', 0), ('isEmergencyServiceNumber', 'boolean', 0)), frozenset(), None, False),
+    'XTranscoder': ((('name', 'UniqueString255', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('subUnit', 'XInteger', 0), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('loadInformation', 'XLoadInformation', 4), ('vendorConfig', 'XVendorConfig', 0), ('isTrustedRelayPoint', 'boolean', 0), ('maximumCapacity', 'XInteger', 0)), frozenset(), None, False),
+    'XTransformationProfile': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('nationalStripDigits', 'XInteger', 4), ('internationalStripDigits', 'XInteger', 4), ('unknownStripDigits', 'XInteger', 4), ('subscriberStripDigits', 'XInteger', 4), ('nationalPrefix', 'String16', 0), ('internationalPrefix', 'String16', 0), ('unknownPrefix', 'String16', 0), ('subscriberPrefix', 'String16', 0), ('nationalCssName', 'XFkType', 4), ('internationalCssName', 'XFkType', 4), ('unknownCssName', 'XFkType', 4), ('subscriberCssName', 'XFkType', 4)), frozenset(), None, False),
+    'XUDTLine': ((('index', 'XInteger', 1), ('label', 'String50', 0), ('display', 'String50', 0), ('e164Mask', 'String255', 4), ('dirn', 'XDirn', 1), ('maxNumCalls', 'XInteger', 0), ('missedCallLogging', 'boolean', 0), ('mwlPolicy', 'XMWLPolicy', 0), ('busyTrigger', 'XInteger', 0), ('ringSetting', 'XRingSetting', 0), ('consecutiveRingSetting', 'XRingSetting', 4), ('audibleMwi', 'XStatus', 0), ('ringSettingActivePickupAlert', 'XRingSetting', 4), ('ringSettingIdlePickupAlert', 'XRingSetting', 4), ('monitoringCssName', 'XFkType', 4), ('recordingProfileName', 'XFkType', 4), ('recordingFlag', 'XRecordingFlag', 0), ('recordingMediaSource', 'XPreferredMediaSource', 0), ('callInfoDisplay', 'XUDTLine.callInfoDisplay', 0)), frozenset({'ctiid'}), None, False),
+    'XUDTLine.callInfoDisplay': ((('callerName', 'boolean', 0), ('callerNumber', 'boolean', 0), ('redirectedNumber', 'boolean', 0), ('dialedNumber', 'boolean', 0)), frozenset(), None, False),
+    'XUcService': ((('serviceType', 'XUCService', 1), ('productType', 'XUCProduct', 4), ('name', 'String50', 1), ('description', 'xsd:string', 0), ('hostnameorip', 'String255', 1), ('port', 'XInteger', 4), ('protocol', 'XConnectProtocol', 4), ('ucServiceXml', 'XVendorConfig', 0)), frozenset(), None, False),
+    'XUnitsToGateway': ((('domainName', 'xsd:string', 0), ('gatewayUuid', 'XUUID', 0), ('units', 'XUnitsToGateway.units', 1)), frozenset(), None, False),
+    'XUnitsToGateway.units': ((('unit', 'XUnitsToGateway.units.unit', 3),), frozenset(), None, False),
+    'XUnitsToGateway.units.unit': ((('index', 'XInteger', 1), ('product', 'XMGCPSlotModule', 4), ('subunits', 'XUnitsToGateway.units.unit.subunits', 0)), frozenset(), None, False),
+    'XUnitsToGateway.units.unit.subunits': ((('subunit', 'XUnitsToGateway.units.unit.subunits.subunit', 3),), frozenset(), None, False),
+    'XUnitsToGateway.units.unit.subunits.subunit': ((('index', 'XInteger', 4), ('product', 'XMGCPVic', 4), ('beginPort', 'XInteger', 4)), frozenset(), None, False),
+    'XUniversalDeviceTemplate': ((('name', 'xsd:string', 1), ('deviceDescription', 'xsd:string', 0), ('devicePool', 'XFkType', 4), ('deviceSecurityProfile', 'XFkType', 4), ('sipProfile', 'XFkType', 4), ('phoneButtonTemplate', 'XFkType', 4), ('sipDialRules', 'XFkType', 4), ('callingSearchSpace', 'XFkType', 4), ('callingPartyTransformationCSSForInboundCalls', 'XFkType', 4), ('callingPartyTransformationCSSForOutboundCalls', 'XFkType', 4), ('reroutingCallingSearchSpace', 'XFkType', 4), ('subscribeCallingSearchSpaceName', 'XFkType', 4), ('useDevicePoolCallingPartyTransformationCSSforInboundCalls', 'boolean', 0), ('useDevicePoolCallingPartyTransformationCSSforOutboundCalls', 'boolean', 0), ('commonPhoneProfile', 'XFkType', 1), ('commonDeviceConfiguration', 'XFkType', 4), ('softkeyTemplate', 'XFkType', 4), ('featureControlPolicy', 'XFkType', 4), ('phonePersonalization', 'XPhonePersonalization', 1), ('mtpPreferredOriginatingCodec', 'XSIPCodec', 1), ('outboundCallRollover', 'XOutboundCallRollover', 1), ('mediaTerminationPointRequired', 'boolean', 0), ('unattendedPort', 'boolean', 0), ('requiredDtmfReception', 'boolean', 0), ('rfc2833Disabled', 'boolean', 0), ('speeddials', 'XUniversalDeviceTemplate.speeddials', 0), ('lines', 'XUniversalDeviceTemplate.lines', 0), ('blfDirectedCallParks', 'XUniversalDeviceTemplate.blfDirectedCallParks', 0), ('busyLampFields', 'XUniversalDeviceTemplate.busyLampFields', 0), ('useTrustedRelayPoint', 'XStatus', 1), ('protectedDevice', 'boolean', 0), ('certificateOperation', 'XCertificateOperation', 1), ('authenticationMode', 'XAuthenticationMode', 1), ('authenticationString', 'xsd:string', 0), ('keySize', 'XKeySize', 1), ('keyOrder', 'XKeyOrder', 0), ('ecKeySize', 'XECKeySize', 0), ('servicesProvisioning', 'XPhoneServiceDisplay', 1), ('packetCaptureMode', 'XPacketCaptureMode', 1), ('packetCaptureDuration', 'XInteger', 4), ('secureShellUser', 'xsd:string', 0), ('secureShellPassword', 'xsd:string', 0), ('userLocale', 'XUserLocale', 4), ('networkLocale', 'XCountry', 4), ('mlppDomain', 'XFkType', 4), ('mlppIndication', 'XStatus', 1), ('mlppPreemption', 'XPreemption', 1), ('doNotDisturb', 'boolean', 0), ('dndOption', 'XDNDOption', 1), ('dndIncomingCallAlert', 'XRingSetting', 4), ('aarGroup', 'XFkType', 4), ('aarCallingSearchSpace', 'XFkType', 4), ('blfPresenceGroup', 'XFkType', 1), ('blfAudibleAlertSettingPhoneBusy', 'XStatus', 1), ('blfAudibleAlertSettingPhoneIdle', 'XStatus', 1), ('userHoldMohAudioSource', 'XInteger', 4), ('networkHoldMohAudioSource', 'XInteger', 4), ('location', 'XFkType', 1), ('geoLocation', 'XFkType', 4), ('deviceMobilityMode', 'XStatus', 1), ('mediaResourceGroupList', 'XFkType', 4), ('remoteDevice', 'boolean', 0), ('hotlineDevice', 'boolean', 0), ('retryVideoCallAsAudio', 'boolean', 0), ('requireOffPremiseLocation', 'boolean', 0), ('ownerUserId', 'XFkType', 4), ('mobilityUserId', 'XFkType', 4), ('joinAcrossLines', 'XStatus', 1), ('alwaysUsePrimeLine', 'XStatus', 1), ('alwaysUsePrimeLineForVoiceMessage', 'XStatus', 1), ('singleButtonBarge', 'XBarge', 1), ('builtInBridge', 'XStatus', 1), ('allowControlOfDeviceFromCti', 'boolean', 0), ('ignorePresentationIndicators', 'boolean', 0), ('enableExtensionMobility', 'boolean', 0), ('privacy', 'XStatus', 1), ('loggedIntoHuntGroup', 'boolean', 0), ('proxyServer', 'xsd:string', 0), ('servicesUrl', 'xsd:string', 0), ('idle', 'xsd:string', 0), ('idleTimer', 'XInteger', 4), ('secureDirUrl', 'xsd:string', 0), ('messages', 'xsd:string', 0), ('secureIdleUrl', 'xsd:string', 0), ('authenticationServer', 'xsd:string', 0), ('directory', 'xsd:string', 0), ('secureServicesUrl', 'xsd:string', 0), ('information', 'xsd:string', 0), ('secureMessagesUrl', 'xsd:string', 0), ('secureInformationUrl', 'xsd:string', 0), ('secureAuthenticationUrl', 'xsd:string', 0), ('confidentialAccess', 'XUniversalDeviceTemplate.confidentialAccess', 0), ('services', 'XUniversalDeviceTemplate.services', 0)), frozenset(), None, False),
+    'XUniversalDeviceTemplate.blfDirectedCallParks': ((('blfDirectedCallPark', 'XBLFDirectedCallPark', 2),), frozenset(), None, False),
+    'XUniversalDeviceTemplate.busyLampFields': ((('busyLampField', 'XBusyLampField', 2),), frozenset(), None, False),
+    'XUniversalDeviceTemplate.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XUniversalDeviceTemplate.lines': ((('line', 'XUDTLine', 2), ('lineIdentifier', 'XNumplanIdentifier', 2)), frozenset(), None, False),
+    'XUniversalDeviceTemplate.services': ((('service', 'XSubscribedService', 2),), frozenset(), None, False),
+    'XUniversalDeviceTemplate.speeddials': ((('speeddial', 'XSpeeddial', 2),), frozenset(), None, False),
+    'XUniversalLineTemplate': ((('name', 'xsd:string', 1), ('urgentPriority', 'boolean', 0), ('lineDescription', 'xsd:string', 0), ('routePartition', 'XFkType', 4), ('voiceMailProfile', 'XFkType', 4), ('callingSearchSpace', 'XFkType', 4), ('alertingName', 'xsd:string', 0), ('extCallControlProfile', 'XFkType', 4), ('blfPresenceGroup', 'XFkType', 1), ('callPickupGroup', 'XFkType', 0), ('partyEntranceTone', 'XStatus', 1), ('autoAnswer', 'XAutoAnswer', 1), ('rejectAnonymousCall', 'boolean', 0), ('userHoldMohAudioSource', 'XMOHAudioSourceId', 4), ('networkHoldMohAudioSource', 'XMOHAudioSourceId', 4), ('aarDestinationMask', 'String128', 4), ('aarGroup', 'XFkType', 4), ('retainDestInCallFwdHistory', 'boolean', 0), ('forwardDestAllCalls', 'xsd:string', 0), ('primaryCssForwardingAllCalls', 'XFkType', 4), ('secondaryCssForwardingAllCalls', 'XFkType', 4), ('CssActivationPolicy', 'XCFACSSActivationPolicy', 0), ('fwdDestExtCallsWhenNotRetrieved', 'xsd:string', 4), ('cssFwdExtCallsWhenNotRetrieved', 'XFkType', 4), ('fwdDestInternalCallsWhenNotRetrieved', 'xsd:string', 0), ('cssFwdInternalCallsWhenNotRetrieved', 'XFkType', 4), ('parkMonitorReversionTime', 'XInteger', 4), ('target', 'xsd:string', 4), ('mlppCss', 'XFkType', 4), ('mlppNoAnsRingDuration', 'XInteger', 4), ('confidentialAccess', 'XUniversalLineTemplate.confidentialAccess', 0), ('holdReversionRingDuration', 'XInteger', 4), ('holdReversionNotificationInterval', 'XInteger', 4), ('busyIntCallsDestination', 'xsd:string', 0), ('busyIntCallsCss', 'XFkType', 4), ('busyExtCallsDestination', 'xsd:string', 0), ('busyExtCallsCss', 'XFkType', 4), ('noAnsIntCallsDestination', 'xsd:string', 0), ('noAnsIntCallsCss', 'XFkType', 4), ('noAnsExtCallsDestination', 'xsd:string', 0), ('noAnsExtCallsCss', 'XFkType', 4), ('noCoverageIntCallsDestination', 'xsd:string', 0), ('noCoverageIntCallsCss', 'XFkType', 4), ('noCoverageExtCallsDestination', 'xsd:string', 0), ('noCoverageExtCallsCss', 'XFkType', 4), ('unregisteredIntCallsDestination', 'xsd:string', 0), ('unregisteredIntCallsCss', 'XFkType', 4), ('unregisteredExtCallsDestination', 'xsd:string', 0), ('unregisteredExtCallsCss', 'XFkType', 4), ('ctiFailureDestination', 'xsd:string', 0), ('ctiFailureCss', 'XFkType', 4), ('callControlAgentProfile', 'xsd:string', 0), ('noAnswerRingDuration', 'XInteger', 4), ('enterpriseAltNum', 'XUniversalLineTemplate.enterpriseAltNum', 0), ('e164AltNum', 'XUniversalLineTemplate.e164AltNum', 0), ('advertisedFailoverNumber', 'xsd:string', 0)), frozenset(), None, False),
+    'XUniversalLineTemplate.confidentialAccess': ((('confidentialAccessMode', 'XCALMode', 4), ('confidentialAccessLevel', 'XInteger', 4)), frozenset(), None, False),
+    'XUniversalLineTemplate.e164AltNum': ((('member', 'XE164AltNum', 0),), frozenset(), None, False),
+    'XUniversalLineTemplate.enterpriseAltNum': ((('member', 'XEnterpriseAltNum', 0),), frozenset(), None, False),
+    'XUser': ((('firstName', 'xsd:string', 0), ('displayName', 'xsd:string', 0), ('middleName', 'xsd:string', 0), ('lastName', 'xsd:string', 1), ('emMaxLoginTime', 'XInteger', 4), ('userid', 'xsd:string', 1), ('password', 'xsd:string', 0), ('pin', 'xsd:string', 0), ('mailid', 'xsd:string', 0), ('department', 'xsd:string', 0), ('manager', 'xsd:string', 0), ('userLocale', 'XUserLocale', 4), ('associatedDevices', 'XUser.associatedDevices', 0), ('primaryExtension', 'XUser.primaryExtension', 0), ('associatedPc', 'xsd:string', 0), ('associatedGroups', 'XUser.associatedGroups', 0), ('enableCti', 'boolean', 0), ('digestCredentials', 'xsd:string', 4), ('phoneProfiles', 'XUser.phoneProfiles', 0), ('defaultProfile', 'XFkType', 0), ('presenceGroupName', 'XFkType', 1), ('subscribeCallingSearchSpaceName', 'XFkType', 4), ('enableMobility', 'boolean', 0), ('enableMobileVoiceAccess', 'boolean', 0), ('maxDeskPickupWaitTime', 'XInteger', 0), ('remoteDestinationLimit', 'XInteger', 0), ('passwordCredentials', 'XUser.passwordCredentials', 0), ('pinCredentials', 'XUser.pinCredentials', 0), ('enableEmcc', 'boolean', 0), ('ctiControlledDeviceProfiles', 'XUser.ctiControlledDeviceProfiles', 0), ('patternPrecedence', 'XPatternPrecedence', 0), ('numericUserId', 'xsd:string', 0), ('mlppPassword', 'xsd:string', 4), ('customUserFields', 'XUser.customUserFields', 0), ('homeCluster', 'boolean', 0), ('imAndPresenceEnable', 'boolean', 0), ('serviceProfile', 'XFkType', 4), ('lineAppearanceAssociationForPresences', 'XUser.lineAppearanceAssociationForPresences', 0), ('directoryUri', 'xsd:string', 4), ('telephoneNumber', 'xsd:string', 0), ('title', 'xsd:string', 0), ('mobileNumber', 'xsd:string', 0), ('homeNumber', 'xsd:string', 0), ('pagerNumber', 'xsd:string', 0), ('extensionsInfo', 'XUser.extensionsInfo', 0), ('selfService', 'UniqueString50', 4), ('userProfile', 'XFkType', 4), ('calendarPresence', 'boolean', 0), ('ldapDirectoryName', 'XFkType', 4), ('userIdentity', 'xsd:string', 0), ('nameDialing', 'xsd:string', 0), ('ipccExtension', 'XFkType', 4), ('ipccRoutePartition', 'XFkType', 4), ('convertUserAccount', 'XFkType', 4), ('enableUserToHostConferenceNow', 'boolean', 0), ('attendeesAccessCode', 'xsd:string', 0), ('zeroHop', 'boolean', 0), ('customerName', 'XFkType', 4)), frozenset(), None, False),
+    'XUser.associatedDevices': ((('device', 'String50', 2),), frozenset(), None, False),
+    'XUser.associatedGroups': ((('userGroup', 'XUser.associatedGroups.userGroup', 2),), frozenset(), None, False),
+    'XUser.associatedGroups.userGroup': ((('name', 'String100', 1), ('userRoles', 'XUser.associatedGroups.userGroup.userRoles', 0)), frozenset(), None, False),
+    'XUser.associatedGroups.userGroup.userRoles': ((('userRole', 'String100', 2),), frozenset(), None, False),
+    'XUser.ctiControlledDeviceProfiles': ((('profileName', 'XFkType', 3),), frozenset(), None, False),
+    'XUser.customUserFields': ((('customUserField', 'XUserCustomUserField', 2),), frozenset(), None, False),
+    'XUser.extensionsInfo': ((('extension', 'XExtension', 2),), frozenset(), None, False),
+    'XUser.lineAppearanceAssociationForPresences': ((('lineAppearanceAssociationForPresence', 'XLineAppearanceAssociationForPresence', 2),), frozenset(), None, False),
+    'XUser.passwordCredentials': ((('pwdCredPolicyName', 'XFkType', 0), ('pwdCredUserCantChange', 'boolean', 0), ('pwdCredUserMustChange', 'boolean', 0), ('pwdCredDoesNotExpire', 'boolean', 0), ('pwdCredTimeChanged', 'xsd:string', 0), ('pwdCredTimeAdminLockout', 'xsd:string', 4), ('pwdCredLockedByAdministrator', 'boolean', 0), ('pwdResetHackCount', 'boolean', 0)), frozenset(), None, False),
+    'XUser.phoneProfiles': ((('profileName', 'XFkType', 3),), frozenset(), None, False),
+    'XUser.pinCredentials': ((('pinCredPolicyName', 'XFkType', 0), ('pinCredUserCantChange', 'boolean', 0), ('pinCredUserMustChange', 'boolean', 0), ('pinCredDoesNotExpire', 'boolean', 0), ('pinCredTimeChanged', 'boolean', 0), ('pinCredTimeAdminLockout', 'xsd:string', 4), ('pinCredLockedByAdministrator', 'boolean', 0), ('pinResetHackCount', 'boolean', 0)), frozenset(), None, False),
+    'XUser.primaryExtension': ((('pattern', 'String255', 1), ('routePartitionName', 'String50', 0)), frozenset(), None, False),
+    'XUserCustomUserField': ((('name', 'xsd:string', 0), ('value', 'xsd:string', 0)), frozenset(), None, False),
+    'XUserGroup': ((('members', 'XUserGroup.members', 0), ('userRoles', 'XUserGroup.userRoles', 0), ('name', 'UniqueString128', 1)), frozenset(), None, False),
+    'XUserGroup.members': ((('member', 'XUserGroupMember', 2),), frozenset(), None, False),
+    'XUserGroup.userRoles': ((('userRole', 'XUserGroupRoles', 2),), frozenset(), None, False),
+    'XUserGroupMember': ((('userId', 'xsd:string', 1),), frozenset(), None, False),
+    'XUserGroupRoles': ((('roleName', 'XFkType', 1),), frozenset(), None, False),
+    'XUserPhoneAssociation': ((('userId', 'xsd:string', 1), ('password', 'xsd:string', 0), ('pin', 'XInteger', 0), ('lastName', 'xsd:string', 1), ('middleName', 'xsd:string', 0), ('firstName', 'xsd:string', 0), ('productType', 'XModel', 4), ('name', 'UniqueString128', 1), ('dnCssName', 'XFkType', 4), ('phoneCssName', 'XFkType', 4), ('e164Mask', 'xsd:string', 4), ('extension', 'xsd:string', 1), ('routePartitionName', 'XFkType', 4), ('voiceMailProfileName', 'XFkType', 4), ('enableExtensionMobility', 'boolean', 0), ('DirectoryURI', 'xsd:string', 4), ('DirectoryNumberURIPartition', 'XFkType', 4)), frozenset(), None, False),
+    'XUserProfileProvision': ((('name', 'String50', 1), ('description', 'String255', 0), ('deskPhones', 'XFkType', 0), ('mobileDevices', 'XFkType', 0), ('profile', 'XFkType', 0), ('universalLineTemplate', 'XFkType', 0), ('allowProvision', 'boolean', 0), ('limitProvision', 'XInteger', 0), ('defaultUserProfile', 'XFkType', 0), ('enableMra', 'boolean', 0), ('mraPolicy_Desktop', 'XMRAPolicy', 0), ('mraPolicy_Mobile', 'XMRAPolicy', 0), ('allowProvisionEMMaxLoginTime', 'boolean', 0)), frozenset(), None, False),
+    'XVendorConfig': ((), frozenset(), None, True),
+    'XVg224': ((('domainName', 'xsd:string', 1), ('description', 'xsd:string', 0), ('product', 'XProduct', 4), ('protocol', 'XDeviceProtocol', 1), ('callManagerGroupName', 'XFkType', 4), ('units', 'XVg224.units', 0), ('vendorConfig', 'XVendorConfig', 4), ('versionStamp', 'String128', 0)), frozenset(), None, False),
+    'XVg224.units': ((('unit', 'XVg224.units.unit', 1),), frozenset(), None, False),
+    'XVg224.units.unit': ((('index', 'XInteger', 1), ('product', 'XMGCPSlotModule', 4), ('subunits', 'XVg224.units.unit.subunits', 0)), frozenset(), None, False),
+    'XVg224.units.unit.subunits': ((('subunit', 'XVg224.units.unit.subunits.subunit', 1),), frozenset(), None, False),
+    'XVg224.units.unit.subunits.subunit': ((('index', 'XInteger', 4), ('product', 'XMGCPVic', 4), ('beginPort', 'XInteger', 4)), frozenset(), None, False),
+    'XVmPilot': ((('dirn', 'String50', 4), ('cssName', 'XFkType', 4)), frozenset({'uuid'}), None, False),
+    'XVohServer': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('sipTrunkName', 'XFkType', 1), ('defaultVideoStreamId', 'xsd:string', 1)), frozenset(), None, False),
+    'XVoiceMailPilot': ((('dirn', 'String255', 4), ('description', 'String50', 0), ('cssName', 'XFkType', 4), ('isDefault', 'boolean', 1)), frozenset(), None, False),
+    'XVoiceMailPort': ((('name', 'UniqueString128', 1), ('description', 'String128', 0), ('product', 'XProduct', 1), ('class', 'XClass', 1), ('protocol', 'XDeviceProtocol', 1), ('protocolSide', 'XProtocolSide', 1), ('callingSearchSpaceName', 'XFkType', 4), ('devicePoolName', 'XFkType', 4), ('commonDeviceConfigName', 'XFkType', 4), ('locationName', 'XFkType', 1), ('preemption', 'XPreemption', 0), ('useTrustedRelayPoint', 'XStatus', 1), ('securityProfileName', 'XFkType', 4), ('geoLocationName', 'XFkType', 4), ('automatedAlternateRoutingCssName', 'XFkType', 4), ('dnPattern', 'xsd:string', 1), ('routePartition', 'XFkType', 4), ('dnCallingSearchSpace', 'XFkType', 4), ('aarNeighborhoodName', 'XFkType', 4), ('callerIdDisplay', 'String128', 0), ('callerIdDisplayAscii', 'String50', 0), ('externalMask', 'xsd:string', 4)), frozenset({'ctiid'}), None, False),
+    'XVoiceMailProfile': ((('name', 'String50', 1), ('description', 'String50', 0), ('isDefault', 'boolean', 0), ('voiceMailboxMask', 'xsd:string', 4), ('voiceMailPilot', 'XVmPilot', 1)), frozenset(), None, False),
+    'XVpnGateway': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('url', 'String255', 1), ('certificates', 'XVpnGateway.certificates', 1)), frozenset(), None, False),
+    'XVpnGateway.certificates': ((('certificate', 'XVpnGatewayMember', 3),), frozenset(), None, False),
+    'XVpnGatewayMember': ((('issuerName', 'String255', 1), ('serialNumber', 'String50', 1)), frozenset(), None, False),
+    'XVpnGroup': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('vpnGateways', 'XVpnGroup.vpnGateways', 0)), frozenset(), None, False),
+    'XVpnGroup.vpnGateways': ((('vpnGateway', 'XVpnGroupMember', 2),), frozenset(), None, False),
+    'XVpnGroupMember': ((('vpnGatewayName', 'XFkType', 1), ('priority', 'XInteger', 1)), frozenset(), None, False),
+    'XVpnProfile': ((('name', 'String50', 1), ('description', 'xsd:string', 0), ('autoNetworkDetection', 'boolean', 0), ('mtu', 'XInteger', 0), ('failToConnect', 'XInteger', 0), ('clientAuthentication', 'XVPNClientAuthentication', 0), ('pwdPersistant', 'boolean', 0), ('enableHostIdCheck', 'boolean', 0)), frozenset(), None, False),
+    'XWLANProfile': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 0), ('ssid', 'xsd:string', 1), ('frequencyBand', 'XWiFiFrequency', 1), ('userModifiable', 'XWLANProfileChanges', 1), ('authMethod', 'XWiFiAuthenticationMethod', 1), ('userName', 'xsd:string', 0), ('password', 'xsd:string', 0), ('pskPassphrase', 'xsd:string', 0), ('wepKey', 'xsd:string', 0), ('passwordDescription', 'xsd:string', 0), ('networkAccessProfile', 'XFkType', 4)), frozenset(), None, False),
+    'XWifiHotspot': ((('name', 'UniqueString50', 1), ('description', 'String255', 0), ('ssidPrefix', 'xsd:string', 1), ('userModifiable', 'XWLANProfileChanges', 0), ('frequencyBand', 'XWiFiFrequency', 1), ('authenticationMethod', 'XHotspotAuthenticationMethod', 1), ('hostName', 'String64', 0), ('port', 'XInteger', 0), ('sharedSecret', 'xsd:string', 4), ('pskPassPhrase', 'xsd:string', 4), ('wepKey', 'xsd:string', 4), ('passwordDescription', 'String255', 0)), frozenset(), None, False),
+    'XWirelessAccessPointControllers': ((('name', 'String255', 1), ('description', 'xsd:string', 0), ('snmpVersion', 'XSNMPVersion', 0), ('snmpUserIdOrCommunityString', 'xsd:string', 1), ('snmpAuthenticationProtocol', 'XSNMPAuthenticationProtocol', 0), ('snmpAuthenticationPassword', 'xsd:string', 0), ('snmpPrivacyProtocol', 'XSNMPPrivacyProtocol', 0), ('snmpPrivacyPassword', 'xsd:string', 0), ('syncNow', 'boolean', 0), ('resyncInterval', 'XInteger', 1), ('nextSyncTime', 'XInteger', 0), ('scheduleUnit', 'XScheduleUnit', 0)), frozenset(), None, False),
+    'XWirelessLanProfileGroup': ((('wirelessProfile', 'XFkType', 0), ('index', 'XInteger', 0)), frozenset(), None, False),
+    'XWlanProfileGroup': ((('name', 'xsd:string', 1), ('description', 'xsd:string', 1), ('members', 'XWlanProfileGroup.members', 0)), frozenset(), None, False),
+    'XWlanProfileGroup.members': ((('member', 'XWirelessLanProfileGroup', 2),), frozenset(), None, False),
+    'executeSQLQueryInactiveReq': ((('sql', 'xsd:string', 1),), frozenset({'sequence'}), None, False),
+    'removeApplicationToSoftkeyTemplateReq': ((('softKeyTemplateName', 'XFkType', 1), ('applicationName', 'String100', 1)), frozenset({'sequence'}), None, False),
+}
+
+# Operation -> request type
+OPERATIONS = {
+    'addAarGroup': 'AddAarGroupReq',
+    'addAdvertisedPatterns': 'AddAdvertisedPatternsReq',
+    'addAnnouncement': 'AddAnnouncementReq',
+    'addAppServerInfo': 'AddAppServerInfoReq',
+    'addAppUser': 'AddAppUserReq',
+    'addApplicationDialRules': 'AddApplicationDialRulesReq',
+    'addApplicationServer': 'AddApplicationServerReq',
+    'addApplicationToSoftkeyTemplate': 'AddApplicationToSoftkeyTemplateReq',
+    'addApplicationUserCapfProfile': 'AddApplicationUserCapfProfileReq',
+    'addAudioCodecPreferenceList': 'AddAudioCodecPreferenceListReq',
+    'addBillingServer': 'AddBillingServerReq',
+    'addBlockedLearnedPatterns': 'AddBlockedLearnedPatternsReq',
+    'addCCAProfiles': 'AddCCAProfilesReq',
+    'addCallManagerGroup': 'AddCallManagerGroupReq',
+    'addCallPark': 'AddCallParkReq',
+    'addCallPickupGroup': 'AddCallPickupGroupReq',
+    'addCalledPartyTracing': 'AddCalledPartyTracingReq',
+    'addCalledPartyTransformationPattern': 'AddCalledPartyTransformationPatternReq',
+    'addCallerFilterList': 'AddCallerFilterListReq',
+    'addCallingPartyTransformationPattern': 'AddCallingPartyTransformationPatternReq',
+    'addCcdAdvertisingService': 'AddCcdAdvertisingServiceReq',
+    'addCcdHostedDN': 'AddCcdHostedDNReq',
+    'addCcdHostedDNGroup': 'AddCcdHostedDNGroupReq',
+    'addCcdRequestingService': 'AddCcdRequestingServiceReq',
+    'addCiscoCatalyst600024PortFXSGateway': 'AddCiscoCatalyst600024PortFXSGatewayReq',
+    'addCiscoCatalyst6000E1VoIPGateway': 'AddCiscoCatalyst6000E1VoIPGatewayReq',
+    'addCiscoCatalyst6000T1VoIPGatewayPri': 'AddCiscoCatalyst6000T1VoIPGatewayPriReq',
+    'addCiscoCatalyst6000T1VoIPGatewayT1': 'AddCiscoCatalyst6000T1VoIPGatewayT1Req',
+    'addCmcInfo': 'AddCmcInfoReq',
+    'addCommonDeviceConfig': 'AddCommonDeviceConfigReq',
+    'addCommonPhoneConfig': 'AddCommonPhoneConfigReq',
+    'addConferenceBridge': 'AddConferenceBridgeReq',
+    'addConferenceNow': 'AddConferenceNowReq',
+    'addCredentialPolicy': 'AddCredentialPolicyReq',
+    'addCss': 'AddCssReq',
+    'addCtiRoutePoint': 'AddCtiRoutePointReq',
+    'addCumaServerSecurityProfile': 'AddCumaServerSecurityProfileReq',
+    'addCustomUserField': 'AddCustomUserFieldReq',
+    'addCustomer': 'AddCustomerReq',
+    'addDateTimeGroup': 'AddDateTimeGroupReq',
+    'addDefaultDeviceProfile': 'AddDefaultDeviceProfileReq',
+    'addDeviceMobility': 'AddDeviceMobilityReq',
+    'addDeviceMobilityGroup': 'AddDeviceMobilityGroupReq',
+    'addDevicePool': 'AddDevicePoolReq',
+    'addDeviceProfile': 'AddDeviceProfileReq',
+    'addDhcpServer': 'AddDhcpServerReq',
+    'addDhcpSubnet': 'AddDhcpSubnetReq',
+    'addDirNumberAliasLookupandSync': 'AddDirNumberAliasLookupandSyncReq',
+    'addDirectedCallPark': 'AddDirectedCallParkReq',
+    'addDirectoryLookupDialRules': 'AddDirectoryLookupDialRulesReq',
+    'addElinGroup': 'AddElinGroupReq',
+    'addEndUserCapfProfile': 'AddEndUserCapfProfileReq',
+    'addEnterpriseFeatureAccessConfiguration': 'AddEnterpriseFeatureAccessConfigurationReq',
+    'addExpresswayCConfiguration': 'AddExpresswayCConfigurationReq',
+    'addExternalCallControlProfile': 'AddExternalCallControlProfileReq',
+    'addFacInfo': 'AddFacInfoReq',
+    'addFallbackProfile': 'AddFallbackProfileReq',
+    'addFeatureControlPolicy': 'AddFeatureControlPolicyReq',
+    'addFeatureGroupTemplate': 'AddFeatureGroupTemplateReq',
+    'addGatekeeper': 'AddGatekeeperReq',
+    'addGateway': 'AddGatewayReq',
+    'addGatewayEndpointAnalogAccess': 'AddGatewayEndpointAnalogAccessReq',
+    'addGatewayEndpointDigitalAccessBri': 'AddGatewayEndpointDigitalAccessBriReq',
+    'addGatewayEndpointDigitalAccessPri': 'AddGatewayEndpointDigitalAccessPriReq',
+    'addGatewayEndpointDigitalAccessT1': 'AddGatewayEndpointDigitalAccessT1Req',
+    'addGatewaySccpEndpoints': 'AddGatewaySccpEndpointsReq',
+    'addGatewaySubunits': 'AddGatewaySubunitsReq',
+    'addGeoLocation': 'AddGeoLocationReq',
+    'addGeoLocationFilter': 'AddGeoLocationFilterReq',
+    'addGeoLocationPolicy': 'AddGeoLocationPolicyReq',
+    'addH323Gateway': 'AddH323GatewayReq',
+    'addH323Phone': 'AddH323PhoneReq',
+    'addH323Trunk': 'AddH323TrunkReq',
+    'addHandoffConfiguration': 'AddHandoffConfigurationReq',
+    'addHttpProfile': 'AddHttpProfileReq',
+    'addHuntList': 'AddHuntListReq',
+    'addHuntPilot': 'AddHuntPilotReq',
+    'addImeClient': 'AddImeClientReq',
+    'addImeE164Transformation': 'AddImeE164TransformationReq',
+    'addImeEnrolledPattern': 'AddImeEnrolledPatternReq',
+    'addImeEnrolledPatternGroup': 'AddImeEnrolledPatternGroupReq',
+    'addImeExclusionNumber': 'AddImeExclusionNumberReq',
+    'addImeExclusionNumberGroup': 'AddImeExclusionNumberGroupReq',
+    'addImeFirewall': 'AddImeFirewallReq',
+    'addImeRouteFilterElement': 'AddImeRouteFilterElementReq',
+    'addImeRouteFilterGroup': 'AddImeRouteFilterGroupReq',
+    'addImeServer': 'AddImeServerReq',
+    'addImportedDirectoryUriCatalogs': 'AddImportedDirectoryUriCatalogsReq',
+    'addInfrastructureDevice': 'AddInfrastructureDeviceReq',
+    'addIpPhoneServices': 'AddIpPhoneServicesReq',
+    'addIvrUserLocale': 'AddIvrUserLocaleReq',
+    'addLbmGroup': 'AddLbmGroupReq',
+    'addLbmHubGroup': 'AddLbmHubGroupReq',
+    'addLdapDirectory': 'AddLdapDirectoryReq',
+    'addLdapFilter': 'AddLdapFilterReq',
+    'addLdapSyncCustomField': 'AddLdapSyncCustomFieldReq',
+    'addLine': 'AddLineReq',
+    'addLineGroup': 'AddLineGroupReq',
+    'addLocalRouteGroup': 'AddLocalRouteGroupReq',
+    'addLocation': 'AddLocationReq',
+    'addMediaResourceGroup': 'AddMediaResourceGroupReq',
+    'addMediaResourceList': 'AddMediaResourceListReq',
+    'addMeetMe': 'AddMeetMeReq',
+    'addMessageWaiting': 'AddMessageWaitingReq',
+    'addMlppDomain': 'AddMlppDomainReq',
+    'addMobileVoiceAccess': 'AddMobileVoiceAccessReq',
+    'addMobility': 'AddMobilityReq',
+    'addMobilityProfile': 'AddMobilityProfileReq',
+    'addMraServiceDomain': 'AddMraServiceDomainReq',
+    'addMtp': 'AddMtpReq',
+    'addNetworkAccessProfile': 'AddNetworkAccessProfileReq',
+    'addPhone': 'AddPhoneReq',
+    'addPhoneActivationCode': 'AddPhoneActivationCodeReq',
+    'addPhoneButtonTemplate': 'AddPhoneButtonTemplateReq',
+    'addPhoneNtp': 'AddPhoneNtpReq',
+    'addPhoneSecurityProfile': 'AddPhoneSecurityProfileReq',
+    'addPhysicalLocation': 'AddPhysicalLocationReq',
+    'addPresenceGroup': 'AddPresenceGroupReq',
+    'addPresenceRedundancyGroup': 'AddPresenceRedundancyGroupReq',
+    'addProcessNode': 'AddProcessNodeReq',
+    'addRecordingProfile': 'AddRecordingProfileReq',
+    'addRegion': 'AddRegionReq',
+    'addRemoteCluster': 'AddRemoteClusterReq',
+    'addRemoteDestination': 'AddRemoteDestinationReq',
+    'addRemoteDestinationProfile': 'AddRemoteDestinationProfileReq',
+    'addResourcePriorityNamespace': 'AddResourcePriorityNamespaceReq',
+    'addResourcePriorityNamespaceList': 'AddResourcePriorityNamespaceListReq',
+    'addRouteFilter': 'AddRouteFilterReq',
+    'addRouteGroup': 'AddRouteGroupReq',
+    'addRouteList': 'AddRouteListReq',
+    'addRoutePartition': 'AddRoutePartitionReq',
+    'addRoutePattern': 'AddRoutePatternReq',
+    'addSIPNormalizationScript': 'AddSIPNormalizationScriptReq',
+    'addSNMPCommunityString': 'AddSNMPCommunityStringReq',
+    'addSNMPUser': 'AddSNMPUserReq',
+    'addSafCcdPurgeBlockLearnedRoutes': 'AddSafCcdPurgeBlockLearnedRoutesReq',
+    'addSafForwarder': 'AddSafForwarderReq',
+    'addSafSecurityProfile': 'AddSafSecurityProfileReq',
+    'addSdpTransparencyProfile': 'AddSdpTransparencyProfileReq',
+    'addServiceProfile': 'AddServiceProfileReq',
+    'addSipDialRules': 'AddSipDialRulesReq',
+    'addSipProfile': 'AddSipProfileReq',
+    'addSipRealm': 'AddSipRealmReq',
+    'addSipRoutePattern': 'AddSipRoutePatternReq',
+    'addSipTrunk': 'AddSipTrunkReq',
+    'addSipTrunkSecurityProfile': 'AddSipTrunkSecurityProfileReq',
+    'addSoftKeyTemplate': 'AddSoftKeyTemplateReq',
+    'addSrst': 'AddSrstReq',
+    'addTimePeriod': 'AddTimePeriodReq',
+    'addTimeSchedule': 'AddTimeScheduleReq',
+    'addTodAccess': 'AddTodAccessReq',
+    'addTransPattern': 'AddTransPatternReq',
+    'addTranscoder': 'AddTranscoderReq',
+    'addTransformationProfile': 'AddTransformationProfileReq',
+    'addUcService': 'AddUcServiceReq',
+    'addUnitsToGateway': 'AddUnitsToGatewayReq',
+    'addUniversalDeviceTemplate': 'AddUniversalDeviceTemplateReq',
+    'addUniversalLineTemplate': 'AddUniversalLineTemplateReq',
+    'addUser': 'AddUserReq',
+    'addUserGroup': 'AddUserGroupReq',
+    'addUserPhoneAssociation': 'AddUserPhoneAssociationReq',
+    'addUserProfileProvision': 'AddUserProfileProvisionReq',
+    'addVg224': 'AddVg224Req',
+    'addVohServer': 'AddVohServerReq',
+    'addVoiceMailPilot': 'AddVoiceMailPilotReq',
+    'addVoiceMailPort': 'AddVoiceMailPortReq',
+    'addVoiceMailProfile': 'AddVoiceMailProfileReq',
+    'addVpnGateway': 'AddVpnGatewayReq',
+    'addVpnGroup': 'AddVpnGroupReq',
+    'addVpnProfile': 'AddVpnProfileReq',
+    'addWLANProfile': 'AddWLANProfileReq',
+    'addWifiHotspot': 'AddWifiHotspotReq',
+    'addWirelessAccessPointControllers': 'AddWirelessAccessPointControllersReq',
+    'addWlanProfileGroup': 'AddWlanProfileGroupReq',
+    'applyCallManager': 'NameAndGUIDRequest',
+    'applyCallManagerGroup': 'NameAndGUIDRequest',
+    'applyCiscoCatalyst600024PortFXSGateway': 'NameAndGUIDRequest',
+    'applyCiscoCatalyst6000E1VoIPGateway': 'NameAndGUIDRequest',
+    'applyCiscoCatalyst6000T1VoIPGatewayPri': 'NameAndGUIDRequest',
+    'applyCiscoCatalyst6000T1VoIPGatewayT1': 'NameAndGUIDRequest',
+    'applyCommonDeviceConfig': 'NameAndGUIDRequest',
+    'applyCommonPhoneConfig': 'NameAndGUIDRequest',
+    'applyConferenceBridge': 'NameAndGUIDRequest',
+    'applyConfigEnterpriseParameters': 'ApplyConfigEnterpriseParametersReq',
+    'applyCtiRoutePoint': 'NameAndGUIDRequest',
+    'applyDateTimeGroup': 'NameAndGUIDRequest',
+    'applyDevicePool': 'NameAndGUIDRequest',
+    'applyDirectedCallPark': 'ApplyDirectedCallParkReq',
+    'applyGatekeeper': 'NameAndGUIDRequest',
+    'applyGateway': 'ApplyGatewayReq',
+    'applyH323Gateway': 'NameAndGUIDRequest',
+    'applyH323Phone': 'NameAndGUIDRequest',
+    'applyHuntList': 'NameAndGUIDRequest',
+    'applyLine': 'ApplyLineReq',
+    'applyMtp': 'NameAndGUIDRequest',
+    'applyPhone': 'NameAndGUIDRequest',
+    'applyPhoneButtonTemplate': 'NameAndGUIDRequest',
+    'applyPhoneSecurityProfile': 'NameAndGUIDRequest',
+    'applyRegion': 'NameAndGUIDRequest',
+    'applyResourcePriorityNamespace': 'ApplyResourcePriorityNamespaceReq',
+    'applyResourcePriorityNamespaceList': 'NameAndGUIDRequest',
+    'applyRouteList': 'NameAndGUIDRequest',
+    'applyRoutePartition': 'NameAndGUIDRequest',
+    'applySipProfile': 'NameAndGUIDRequest',
+    'applySipTrunkSecurityProfile': 'NameAndGUIDRequest',
+    'applySoftKeyTemplate': 'NameAndGUIDRequest',
+    'applySrst': 'NameAndGUIDRequest',
+    'applyTranscoder': 'NameAndGUIDRequest',
+    'applyUcService': 'NameAndGUIDRequest',
+    'applyVoiceMailPort': 'NameAndGUIDRequest',
+    'applyVoiceMailProfile': 'NameAndGUIDRequest',
+    'assignPresenceUser': 'AssignPresenceUserReq',
+    'axlError': 'AXLError',
+    'doAuthenticateUser': 'DoAuthenticateUserReq',
+    'doChangeDNDStatus': 'DoChangeDNDStatusReq',
+    'doDeviceLogin': 'DoDeviceLoginReq',
+    'doDeviceLogout': 'DoDeviceLogoutReq',
+    'doDeviceReset': 'DoDeviceResetReq',
+    'doEnterpriseParametersReset': 'DoEnterpriseParametersResetReq',
+    'doLdapSync': 'DoLdapSyncReq',
+    'doServiceParametersReset': 'DoServiceParametersResetReq',
+    'doSmartEntitlementRequest': 'DoSmartEntitlementRequestReq',
+    'doSmartLicenseDeRegister': 'DoSmartLicenseDeRegisterReq',
+    'doSmartLicenseReRegister': 'DoSmartLicenseReRegisterReq',
+    'doSmartLicenseRegister': 'DoSmartLicenseRegisterReq',
+    'doSmartLicenseRenewAuthorization': 'DoSmartLicenseRenewAuthorizationReq',
+    'doSmartLicenseRenewRegistration': 'DoSmartLicenseRenewRegistrationReq',
+    'doUpdateLicenseUsage': 'DoUpdateLicenseUsageReq',
+    'doUpdateRemoteCluster': 'DoUpdateRemoteClusterReq',
+    'doUpdateTransportSettings': 'DoUpdateTransportSettingsReq',
+    'executeSQLQuery': 'ExecuteSQLQueryReq',
+    'executeSQLQueryInactive': 'executeSQLQueryInactiveReq',
+    'executeSQLUpdate': 'ExecuteSQLUpdateReq',
+    'getAarGroup': 'GetAarGroupReq',
+    'getAdvertisedPatterns': 'GetAdvertisedPatternsReq',
+    'getAnnouncement': 'GetAnnouncementReq',
+    'getAnnunciator': 'GetAnnunciatorReq',
+    'getAppServerInfo': 'GetAppServerInfoReq',
+    'getAppUser': 'GetAppUserReq',
+    'getApplicationDialRules': 'GetApplicationDialRulesReq',
+    'getApplicationServer': 'GetApplicationServerReq',
+    'getApplicationUserCapfProfile': 'GetApplicationUserCapfProfileReq',
+    'getAudioCodecPreferenceList': 'GetAudioCodecPreferenceListReq',
+    'getBillingServer': 'GetBillingServerReq',
+    'getBlockedLearnedPatterns': 'GetBlockedLearnedPatternsReq',
+    'getCCAProfiles': 'GetCCAProfilesReq',
+    'getCCMVersion': 'GetCCMVersionReq',
+    'getCallManager': 'GetCallManagerReq',
+    'getCallManagerGroup': 'GetCallManagerGroupReq',
+    'getCallPark': 'GetCallParkReq',
+    'getCallPickupGroup': 'GetCallPickupGroupReq',
+    'getCalledPartyTransformationPattern': 'GetCalledPartyTransformationPatternReq',
+    'getCallerFilterList': 'GetCallerFilterListReq',
+    'getCallingPartyTransformationPattern': 'GetCallingPartyTransformationPatternReq',
+    'getCcdAdvertisingService': 'GetCcdAdvertisingServiceReq',
+    'getCcdFeatureConfig': 'GetCcdFeatureConfigReq',
+    'getCcdHostedDN': 'GetCcdHostedDNReq',
+    'getCcdHostedDNGroup': 'GetCcdHostedDNGroupReq',
+    'getCcdRequestingService': 'GetCcdRequestingServiceReq',
+    'getCiscoCatalyst600024PortFXSGateway': 'GetCiscoCatalyst600024PortFXSGatewayReq',
+    'getCiscoCatalyst6000E1VoIPGateway': 'GetCiscoCatalyst6000E1VoIPGatewayReq',
+    'getCiscoCatalyst6000T1VoIPGatewayPri': 'GetCiscoCatalyst6000T1VoIPGatewayPriReq',
+    'getCiscoCatalyst6000T1VoIPGatewayT1': 'GetCiscoCatalyst6000T1VoIPGatewayT1Req',
+    'getCmcInfo': 'GetCmcInfoReq',
+    'getCommonDeviceConfig': 'GetCommonDeviceConfigReq',
+    'getCommonPhoneConfig': 'GetCommonPhoneConfigReq',
+    'getConferenceBridge': 'GetConferenceBridgeReq',
+    'getConferenceNow': 'GetConferenceNowReq',
+    'getCredentialPolicy': 'GetCredentialPolicyReq',
+    'getCredentialPolicyDefault': 'GetCredentialPolicyDefaultReq',
+    'getCss': 'GetCssReq',
+    'getCtiRoutePoint': 'GetCtiRoutePointReq',
+    'getCumaServerSecurityProfile': 'GetCumaServerSecurityProfileReq',
+    'getCustomUserField': 'GetCustomUserFieldReq',
+    'getCustomer': 'GetCustomerReq',
+    'getDateTimeGroup': 'GetDateTimeGroupReq',
+    'getDdi': 'GetDdiReq',
+    'getDefaultDeviceProfile': 'GetDefaultDeviceProfileReq',
+    'getDeviceDefaults': 'GetDeviceDefaultsReq',
+    'getDeviceMobility': 'GetDeviceMobilityReq',
+    'getDeviceMobilityGroup': 'GetDeviceMobilityGroupReq',
+    'getDevicePool': 'GetDevicePoolReq',
+    'getDeviceProfile': 'GetDeviceProfileReq',
+    'getDeviceProfileOptions': 'GetDeviceProfileOptionsReq',
+    'getDhcpServer': 'GetDhcpServerReq',
+    'getDhcpSubnet': 'GetDhcpSubnetReq',
+    'getDialPlan': 'GetDialPlanReq',
+    'getDialPlanTag': 'GetDialPlanTagReq',
+    'getDirNumberAliasLookupandSync': 'GetDirNumberAliasLookupandSyncReq',
+    'getDirectedCallPark': 'GetDirectedCallParkReq',
+    'getDirectoryLookupDialRules': 'GetDirectoryLookupDialRulesReq',
+    'getElinGroup': 'GetElinGroupReq',
+    'getEmccFeatureConfig': 'GetEmccFeatureConfigReq',
+    'getEndUserCapfProfile': 'GetEndUserCapfProfileReq',
+    'getEnterpriseFeatureAccessConfiguration': 'GetEnterpriseFeatureAccessConfigurationReq',
+    'getEnterprisePhoneConfig': 'GetEnterprisePhoneConfigReq',
+    'getExpresswayCConfiguration': 'GetExpresswayCConfigurationReq',
+    'getExternalCallControlProfile': 'GetExternalCallControlProfileReq',
+    'getFacInfo': 'GetFacInfoReq',
+    'getFallbackFeatureConfig': 'GetFallbackFeatureConfigReq',
+    'getFallbackProfile': 'GetFallbackProfileReq',
+    'getFeatureControlPolicy': 'GetFeatureControlPolicyReq',
+    'getFeatureGroupTemplate': 'GetFeatureGroupTemplateReq',
+    'getFixedMohAudioSource': 'GetFixedMohAudioSourceReq',
+    'getGatekeeper': 'GetGatekeeperReq',
+    'getGateway': 'GetGatewayReq',
+    'getGatewayEndpointAnalogAccess': 'GetGatewayEndpointAnalogAccessReq',
+    'getGatewayEndpointDigitalAccessBri': 'GetGatewayEndpointDigitalAccessBriReq',
+    'getGatewayEndpointDigitalAccessPri': 'GetGatewayEndpointDigitalAccessPriReq',
+    'getGatewayEndpointDigitalAccessT1': 'GetGatewayEndpointDigitalAccessT1Req',
+    'getGatewaySccpEndpoints': 'GetGatewaySccpEndpointsReq',
+    'getGeoLocation': 'GetGeoLocationReq',
+    'getGeoLocationFilter': 'GetGeoLocationFilterReq',
+    'getGeoLocationPolicy': 'GetGeoLocationPolicyReq',
+    'getH323Gateway': 'GetH323GatewayReq',
+    'getH323Phone': 'GetH323PhoneReq',
+    'getH323Trunk': 'GetH323TrunkReq',
+    'getHandoffConfiguration': 'GetHandoffConfigurationReq',
+    'getHttpProfile': 'GetHttpProfileReq',
+    'getHuntList': 'GetHuntListReq',
+    'getHuntPilot': 'GetHuntPilotReq',
+    'getIlsConfig': 'GetIlsConfigReq',
+    'getImeClient': 'GetImeClientReq',
+    'getImeE164Transformation': 'GetImeE164TransformationReq',
+    'getImeEnrolledPattern': 'GetImeEnrolledPatternReq',
+    'getImeEnrolledPatternGroup': 'GetImeEnrolledPatternGroupReq',
+    'getImeExclusionNumber': 'GetImeExclusionNumberReq',
+    'getImeExclusionNumberGroup': 'GetImeExclusionNumberGroupReq',
+    'getImeFeatureConfig': 'GetImeFeatureConfigReq',
+    'getImeFirewall': 'GetImeFirewallReq',
+    'getImeLearnedRoutes': 'GetImeLearnedRoutesReq',
+    'getImeRouteFilterElement': 'GetImeRouteFilterElementReq',
+    'getImeRouteFilterGroup': 'GetImeRouteFilterGroupReq',
+    'getImeServer': 'GetImeServerReq',
+    'getImportedDirectoryUriCatalogs': 'GetImportedDirectoryUriCatalogsReq',
+    'getInfrastructureDevice': 'GetInfrastructureDeviceReq',
+    'getInterClusterServiceProfile': 'GetInterClusterServiceProfileReq',
+    'getIpPhoneServices': 'GetIpPhoneServicesReq',
+    'getIvrUserLocale': 'GetIvrUserLocaleReq',
+    'getLbmGroup': 'GetLbmGroupReq',
+    'getLbmHubGroup': 'GetLbmHubGroupReq',
+    'getLdapAuthentication': 'GetLdapAuthenticationReq',
+    'getLdapDirectory': 'GetLdapDirectoryReq',
+    'getLdapFilter': 'GetLdapFilterReq',
+    'getLdapSearch': 'GetLdapSearchReq',
+    'getLdapSyncCustomField': 'GetLdapSyncCustomFieldReq',
+    'getLdapSyncStatus': 'GetLdapSyncStatusReq',
+    'getLdapSystem': 'GetLdapSystemReq',
+    'getLicensedUser': 'GetLicensedUserReq',
+    'getLine': 'GetLineReq',
+    'getLineGroup': 'GetLineGroupReq',
+    'getLineOptions': 'GetLineOptionsReq',
+    'getLocalRouteGroup': 'GetLocalRouteGroupReq',
+    'getLocation': 'GetLocationReq',
+    'getMediaResourceGroup': 'GetMediaResourceGroupReq',
+    'getMediaResourceList': 'GetMediaResourceListReq',
+    'getMeetMe': 'GetMeetMeReq',
+    'getMessageWaiting': 'GetMessageWaitingReq',
+    'getMlppDomain': 'GetMlppDomainReq',
+    'getMobileSmartClientProfile': 'GetMobileSmartClientProfileReq',
+    'getMobileVoiceAccess': 'GetMobileVoiceAccessReq',
+    'getMobility': 'GetMobilityReq',
+    'getMobilityProfile': 'GetMobilityProfileReq',
+    'getMohAudioSource': 'GetMohAudioSourceReq',
+    'getMohServer': 'GetMohServerReq',
+    'getMraServiceDomain': 'GetMraServiceDomainReq',
+    'getMtp': 'GetMtpReq',
+    'getNetworkAccessProfile': 'GetNetworkAccessProfileReq',
+    'getNumDevices': 'GetNumDevicesReq',
+    'getOSVersion': 'GetOSVersionReq',
+    'getPageLayoutPreferences': 'GetPageLayoutPreferencesReq',
+    'getPhone': 'GetPhoneReq',
+    'getPhoneButtonTemplate': 'GetPhoneButtonTemplateReq',
+    'getPhoneNtp': 'GetPhoneNtpReq',
+    'getPhoneOptions': 'GetPhoneOptionsReq',
+    'getPhoneSecurityProfile': 'GetPhoneSecurityProfileReq',
+    'getPhoneTypeDisplayInstance': 'GetPhoneTypeDisplayInstanceReq',
+    'getPhysicalLocation': 'GetPhysicalLocationReq',
+    'getPresenceGroup': 'GetPresenceGroupReq',
+    'getPresenceRedundancyGroup': 'GetPresenceRedundancyGroupReq',
+    'getProcessNode': 'GetProcessNodeReq',
+    'getProcessNodeService': 'GetProcessNodeServiceReq',
+    'getRecordingProfile': 'GetRecordingProfileReq',
+    'getRegion': 'GetRegionReq',
+    'getRegistrationDynamic': 'GetRegistrationDynamicReq',
+    'getRemoteCluster': 'GetRemoteClusterReq',
+    'getRemoteDestination': 'GetRemoteDestinationReq',
+    'getRemoteDestinationProfile': 'GetRemoteDestinationProfileReq',
+    'getResourcePriorityNamespace': 'GetResourcePriorityNamespaceReq',
+    'getResourcePriorityNamespaceList': 'GetResourcePriorityNamespaceListReq',
+    'getRouteFilter': 'GetRouteFilterReq',
+    'getRouteGroup': 'GetRouteGroupReq',
+    'getRouteList': 'GetRouteListReq',
+    'getRoutePartition': 'GetRoutePartitionReq',
+    'getRoutePattern': 'GetRoutePatternReq',
+    'getSIPNormalizationScript': 'GetSIPNormalizationScriptReq',
+    'getSNMPCommunityString': 'GetSNMPCommunityStringReq',
+    'getSNMPMIB2List': 'GetSNMPMIB2ListReq',
+    'getSNMPUser': 'GetSNMPUserReq',
+    'getSafCcdPurgeBlockLearnedRoutes': 'GetSafCcdPurgeBlockLearnedRoutesReq',
+    'getSafForwarder': 'GetSafForwarderReq',
+    'getSafSecurityProfile': 'GetSafSecurityProfileReq',
+    'getSdpTransparencyProfile': 'GetSdpTransparencyProfileReq',
+    'getSecureConfig': 'GetSecureConfigReq',
+    'getServiceParameter': 'GetServiceParameterReq',
+    'getServiceProfile': 'GetServiceProfileReq',
+    'getSipDialRules': 'GetSipDialRulesReq',
+    'getSipProfile': 'GetSipProfileReq',
+    'getSipProfileOptions': 'GetSipProfileOptionsReq',
+    'getSipRealm': 'GetSipRealmReq',
+    'getSipRoutePattern': 'GetSipRoutePatternReq',
+    'getSipTrunk': 'GetSipTrunkReq',
+    'getSipTrunkSecurityProfile': 'GetSipTrunkSecurityProfileReq',
+    'getSmartLicenseStatus': 'GetSmartLicenseStatusReq',
+    'getSoftKeySet': 'GetSoftKeySetReq',
+    'getSoftKeyTemplate': 'GetSoftKeyTemplateReq',
+    'getSrst': 'GetSrstReq',
+    'getSyslogConfiguration': 'GetSyslogConfigurationReq',
+    'getTimePeriod': 'GetTimePeriodReq',
+    'getTimeSchedule': 'GetTimeScheduleReq',
+    'getTodAccess': 'GetTodAccessReq',
+    'getTransPattern': 'GetTransPatternReq',
+    'getTransPatternOptions': 'GetTransPatternOptionsReq',
+    'getTranscoder': 'GetTranscoderReq',
+    'getTransformationProfile': 'GetTransformationProfileReq',
+    'getTransportSettings': 'GetTransportSettingsReq',
+    'getTvsCertificate': 'GetTvsCertificateReq',
+    'getUcService': 'GetUcServiceReq',
+    'getUniversalDeviceTemplate': 'GetUniversalDeviceTemplateReq',
+    'getUniversalLineTemplate': 'GetUniversalLineTemplateReq',
+    'getUser': 'GetUserReq',
+    'getUserGroup': 'GetUserGroupReq',
+    'getUserProfileProvision': 'GetUserProfileProvisionReq',
+    'getVg224': 'GetVg224Req',
+    'getVohServer': 'GetVohServerReq',
+    'getVoiceMailPilot': 'GetVoiceMailPilotReq',
+    'getVoiceMailPort': 'GetVoiceMailPortReq',
+    'getVoiceMailProfile': 'GetVoiceMailProfileReq',
+    'getVpnGateway': 'GetVpnGatewayReq',
+    'getVpnGroup': 'GetVpnGroupReq',
+    'getVpnProfile': 'GetVpnProfileReq',
+    'getWLANProfile': 'GetWLANProfileReq',
+    'getWifiHotspot': 'GetWifiHotspotReq',
+    'getWirelessAccessPointControllers': 'GetWirelessAccessPointControllersReq',
+    'getWlanProfileGroup': 'GetWlanProfileGroupReq',
+    'listAarGroup': 'ListAarGroupReq',
+    'listAdvertisedPatterns': 'ListAdvertisedPatternsReq',
+    'listAnnouncement': 'ListAnnouncementReq',
+    'listAnnunciator': 'ListAnnunciatorReq',
+    'listAppUser': 'ListAppUserReq',
+    'listApplicationDialRules': 'ListApplicationDialRulesReq',
+    'listApplicationServer': 'ListApplicationServerReq',
+    'listApplicationUserCapfProfile': 'ListApplicationUserCapfProfileReq',
+    'listAssignedPresenceServers': 'ListAssignedPresenceServersReq',
+    'listAssignedPresenceUsers': 'ListAssignedPresenceUsersReq',
+    'listAudioCodecPreferenceList': 'ListAudioCodecPreferenceListReq',
+    'listBillingServer': 'ListBillingServerReq',
+    'listBlockedLearnedPatterns': 'ListBlockedLearnedPatternsReq',
+    'listCCAProfiles': 'ListCCAProfilesReq',
+    'listCallManager': 'ListCallManagerReq',
+    'listCallManagerGroup': 'ListCallManagerGroupReq',
+    'listCallPark': 'ListCallParkReq',
+    'listCallPickupGroup': 'ListCallPickupGroupReq',
+    'listCalledPartyTracing': 'ListCalledPartyTracingReq',
+    'listCalledPartyTransformationPattern': 'ListCalledPartyTransformationPatternReq',
+    'listCallerFilterList': 'ListCallerFilterListReq',
+    'listCallingPartyTransformationPattern': 'ListCallingPartyTransformationPatternReq',
+    'listCcdAdvertisingService': 'ListCcdAdvertisingServiceReq',
+    'listCcdHostedDN': 'ListCcdHostedDNReq',
+    'listCcdHostedDNGroup': 'ListCcdHostedDNGroupReq',
+    'listChange': 'ListChangeReq',
+    'listCiscoCatalyst600024PortFXSGateway': 'ListCiscoCatalyst600024PortFXSGatewayReq',
+    'listCiscoCatalyst6000E1VoIPGateway': 'ListCiscoCatalyst6000E1VoIPGatewayReq',
+    'listCiscoCatalyst6000T1VoIPGatewayPri': 'ListCiscoCatalyst6000T1VoIPGatewayPriReq',
+    'listCiscoCatalyst6000T1VoIPGatewayT1': 'ListCiscoCatalyst6000T1VoIPGatewayT1Req',
+    'listCiscoCloudOnboarding': 'ListCiscoCloudOnboardingReq',
+    'listCmcInfo': 'ListCmcInfoReq',
+    'listCommonDeviceConfig': 'ListCommonDeviceConfigReq',
+    'listCommonPhoneConfig': 'ListCommonPhoneConfigReq',
+    'listConferenceBridge': 'ListConferenceBridgeReq',
+    'listConferenceNow': 'ListConferenceNowReq',
+    'listCredentialPolicy': 'ListCredentialPolicyReq',
+    'listCss': 'ListCssReq',
+    'listCtiRoutePoint': 'ListCtiRoutePointReq',
+    'listCumaServerSecurityProfile': 'ListCumaServerSecurityProfileReq',
+    'listCustomUserField': 'ListCustomUserFieldReq',
+    'listCustomer': 'ListCustomerReq',
+    'listDateTimeGroup': 'ListDateTimeGroupReq',
+    'listDdi': 'ListDdiReq',
+    'listDefaultDeviceProfile': 'ListDefaultDeviceProfileReq',
+    'listDeviceDefaults': 'ListDeviceDefaultsReq',
+    'listDeviceMobility': 'ListDeviceMobilityReq',
+    'listDeviceMobilityGroup': 'ListDeviceMobilityGroupReq',
+    'listDevicePool': 'ListDevicePoolReq',
+    'listDeviceProfile': 'ListDeviceProfileReq',
+    'listDhcpServer': 'ListDhcpServerReq',
+    'listDhcpSubnet': 'ListDhcpSubnetReq',
+    'listDialPlan': 'ListDialPlanReq',
+    'listDialPlanTag': 'ListDialPlanTagReq',
+    'listDirNumberAliasLookupandSync': 'ListDirNumberAliasLookupandSyncReq',
+    'listDirectedCallPark': 'ListDirectedCallParkReq',
+    'listDirectoryLookupDialRules': 'ListDirectoryLookupDialRulesReq',
+    'listElinGroup': 'ListElinGroupReq',
+    'listEndUserCapfProfile': 'ListEndUserCapfProfileReq',
+    'listEnterpriseFeatureAccessConfiguration': 'ListEnterpriseFeatureAccessConfigurationReq',
+    'listExpresswayCConfiguration': 'ListExpresswayCConfigurationReq',
+    'listExternalCallControlProfile': 'ListExternalCallControlProfileReq',
+    'listFacInfo': 'ListFacInfoReq',
+    'listFallbackProfile': 'ListFallbackProfileReq',
+    'listFeatureControlPolicy': 'ListFeatureControlPolicyReq',
+    'listFeatureGroupTemplate': 'ListFeatureGroupTemplateReq',
+    'listGatekeeper': 'ListGatekeeperReq',
+    'listGateway': 'ListGatewayReq',
+    'listGeoLocation': 'ListGeoLocationReq',
+    'listGeoLocationFilter': 'ListGeoLocationFilterReq',
+    'listGeoLocationPolicy': 'ListGeoLocationPolicyReq',
+    'listH323Gateway': 'ListH323GatewayReq',
+    'listH323Phone': 'ListH323PhoneReq',
+    'listH323Trunk': 'ListH323TrunkReq',
+    'listHuntList': 'ListHuntListReq',
+    'listHuntPilot': 'ListHuntPilotReq',
+    'listImeClient': 'ListImeClientReq',
+    'listImeE164Transformation': 'ListImeE164TransformationReq',
+    'listImeEnrolledPattern': 'ListImeEnrolledPatternReq',
+    'listImeEnrolledPatternGroup': 'ListImeEnrolledPatternGroupReq',
+    'listImeExclusionNumber': 'ListImeExclusionNumberReq',
+    'listImeExclusionNumberGroup': 'ListImeExclusionNumberGroupReq',
+    'listImeFirewall': 'ListImeFirewallReq',
+    'listImeRouteFilterElement': 'ListImeRouteFilterElementReq',
+    'listImeRouteFilterGroup': 'ListImeRouteFilterGroupReq',
+    'listImeServer': 'ListImeServerReq',
+    'listImportedDirectoryUriCatalogs': 'ListImportedDirectoryUriCatalogsReq',
+    'listInfrastructureDevice': 'ListInfrastructureDeviceReq',
+    'listIpPhoneServices': 'ListIpPhoneServicesReq',
+    'listIvrUserLocale': 'ListIvrUserLocaleReq',
+    'listLbmGroup': 'ListLbmGroupReq',
+    'listLbmHubGroup': 'ListLbmHubGroupReq',
+    'listLdapDirectory': 'ListLdapDirectoryReq',
+    'listLdapFilter': 'ListLdapFilterReq',
+    'listLdapSearch': 'ListLdapSearchReq',
+    'listLdapSyncCustomField': 'ListLdapSyncCustomFieldReq',
+    'listLicensedUser': 'ListLicensedUserReq',
+    'listLine': 'ListLineReq',
+    'listLineGroup': 'ListLineGroupReq',
+    'listLocalRouteGroup': 'ListLocalRouteGroupReq',
+    'listLocation': 'ListLocationReq',
+    'listMediaResourceGroup': 'ListMediaResourceGroupReq',
+    'listMediaResourceList': 'ListMediaResourceListReq',
+    'listMeetMe': 'ListMeetMeReq',
+    'listMessageWaiting': 'ListMessageWaitingReq',
+    'listMlppDomain': 'ListMlppDomainReq',
+    'listMobileSmartClientProfile': 'ListMobileSmartClientProfileReq',
+    'listMobilityProfile': 'ListMobilityProfileReq',
+    'listMohAudioSource': 'ListMohAudioSourceReq',
+    'listMohServer': 'ListMohServerReq',
+    'listMraServiceDomain': 'ListMraServiceDomainReq',
+    'listMtp': 'ListMtpReq',
+    'listNetworkAccessProfile': 'ListNetworkAccessProfileReq',
+    'listPhone': 'ListPhoneReq',
+    'listPhoneActivationCode': 'ListPhoneActivationCodeReq',
+    'listPhoneButtonTemplate': 'ListPhoneButtonTemplateReq',
+    'listPhoneNtp': 'ListPhoneNtpReq',
+    'listPhoneSecurityProfile': 'ListPhoneSecurityProfileReq',
+    'listPhysicalLocation': 'ListPhysicalLocationReq',
+    'listPresenceGroup': 'ListPresenceGroupReq',
+    'listPresenceRedundancyGroup': 'ListPresenceRedundancyGroupReq',
+    'listProcessNode': 'ListProcessNodeReq',
+    'listProcessNodeService': 'ListProcessNodeServiceReq',
+    'listRecordingProfile': 'ListRecordingProfileReq',
+    'listRegion': 'ListRegionReq',
+    'listRegistrationDynamic': 'ListRegistrationDynamicReq',
+    'listRemoteCluster': 'ListRemoteClusterReq',
+    'listRemoteDestination': 'ListRemoteDestinationReq',
+    'listRemoteDestinationProfile': 'ListRemoteDestinationProfileReq',
+    'listResourcePriorityNamespace': 'ListResourcePriorityNamespaceReq',
+    'listResourcePriorityNamespaceList': 'ListResourcePriorityNamespaceListReq',
+    'listRouteFilter': 'ListRouteFilterReq',
+    'listRouteGroup': 'ListRouteGroupReq',
+    'listRouteList': 'ListRouteListReq',
+    'listRoutePartition': 'ListRoutePartitionReq',
+    'listRoutePattern': 'ListRoutePatternReq',
+    'listRoutePlan': 'ListRoutePlanReq',
+    'listSIPNormalizationScript': 'ListSIPNormalizationScriptReq',
+    'listSafCcdPurgeBlockLearnedRoutes': 'ListSafCcdPurgeBlockLearnedRoutesReq',
+    'listSafForwarder': 'ListSafForwarderReq',
+    'listSafSecurityProfile': 'ListSafSecurityProfileReq',
+    'listSdpTransparencyProfile': 'ListSdpTransparencyProfileReq',
+    'listServiceParameter': 'ListServiceParameterReq',
+    'listServiceProfile': 'ListServiceProfileReq',
+    'listSipDialRules': 'ListSipDialRulesReq',
+    'listSipProfile': 'ListSipProfileReq',
+    'listSipRealm': 'ListSipRealmReq',
+    'listSipRoutePattern': 'ListSipRoutePatternReq',
+    'listSipTrunk': 'ListSipTrunkReq',
+    'listSipTrunkSecurityProfile': 'ListSipTrunkSecurityProfileReq',
+    'listSoftKeyTemplate': 'ListSoftKeyTemplateReq',
+    'listSrst': 'ListSrstReq',
+    'listTimePeriod': 'ListTimePeriodReq',
+    'listTimeSchedule': 'ListTimeScheduleReq',
+    'listTodAccess': 'ListTodAccessReq',
+    'listTransPattern': 'ListTransPatternReq',
+    'listTranscoder': 'ListTranscoderReq',
+    'listTransformationProfile': 'ListTransformationProfileReq',
+    'listTvsCertificate': 'ListTvsCertificateReq',
+    'listUcService': 'ListUcServiceReq',
+    'listUnassignedDevice': 'ListUnassignedDeviceReq',
+    'listUnassignedPresenceServers': 'ListUnassignedPresenceServersReq',
+    'listUnassignedPresenceUsers': 'ListUnassignedPresenceUsersReq',
+    'listUniversalDeviceTemplate': 'ListUniversalDeviceTemplateReq',
+    'listUniversalLineTemplate': 'ListUniversalLineTemplateReq',
+    'listUser': 'ListUserReq',
+    'listUserGroup': 'ListUserGroupReq',
+    'listUserProfileProvision': 'ListUserProfileProvisionReq',
+    'listVohServer': 'ListVohServerReq',
+    'listVoiceMailPilot': 'ListVoiceMailPilotReq',
+    'listVoiceMailPort': 'ListVoiceMailPortReq',
+    'listVoiceMailProfile': 'ListVoiceMailProfileReq',
+    'listVpnGateway': 'ListVpnGatewayReq',
+    'listVpnGroup': 'ListVpnGroupReq',
+    'listVpnProfile': 'ListVpnProfileReq',
+    'listWLANProfile': 'ListWLANProfileReq',
+    'listWifiHotspot': 'ListWifiHotspotReq',
+    'listWirelessAccessPointControllers': 'ListWirelessAccessPointControllersReq',
+    'listWlanProfileGroup': 'ListWlanProfileGroupReq',
+    'lockPhone': 'NameAndGUIDRequest',
+    'removeAarGroup': 'NameAndGUIDRequest',
+    'removeAdvertisedPatterns': 'RemoveAdvertisedPatternsReq',
+    'removeAnnouncement': 'NameAndGUIDRequest',
+    'removeAppServerInfo': 'RemoveAppServerInfoReq',
+    'removeAppUser': 'RemoveAppUserReq',
+    'removeApplicationDialRules': 'NameAndGUIDRequest',
+    'removeApplicationServer': 'RemoveApplicationServerReq',
+    'removeApplicationToSoftkeyTemplate': 'removeApplicationToSoftkeyTemplateReq',
+    'removeApplicationUserCapfProfile': 'RemoveApplicationUserCapfProfileReq',
+    'removeAudioCodecPreferenceList': 'NameAndGUIDRequest',
+    'removeBillingServer': 'RemoveBillingServerReq',
+    'removeBlockedLearnedPatterns': 'RemoveBlockedLearnedPatternsReq',
+    'removeCCAProfiles': 'RemoveCCAProfilesReq',
+    'removeCallManagerGroup': 'NameAndGUIDRequest',
+    'removeCallPark': 'RemoveCallParkReq',
+    'removeCallPickupGroup': 'RemoveCallPickupGroupReq',
+    'removeCalledPartyTracing': 'RemoveCalledPartyTracingReq',
+    'removeCalledPartyTransformationPattern': 'RemoveCalledPartyTransformationPatternReq',
+    'removeCallerFilterList': 'NameAndGUIDRequest',
+    'removeCallingPartyTransformationPattern': 'RemoveCallingPartyTransformationPatternReq',
+    'removeCcdAdvertisingService': 'NameAndGUIDRequest',
+    'removeCcdHostedDN': 'RemoveCcdHostedDNReq',
+    'removeCcdHostedDNGroup': 'NameAndGUIDRequest',
+    'removeCcdRequestingService': 'NameAndGUIDRequest',
+    'removeCiscoCatalyst600024PortFXSGateway': 'NameAndGUIDRequest',
+    'removeCiscoCatalyst6000E1VoIPGateway': 'NameAndGUIDRequest',
+    'removeCiscoCatalyst6000T1VoIPGatewayPri': 'NameAndGUIDRequest',
+    'removeCiscoCatalyst6000T1VoIPGatewayT1': 'NameAndGUIDRequest',
+    'removeCmcInfo': 'RemoveCmcInfoReq',
+    'removeCommonDeviceConfig': 'NameAndGUIDRequest',
+    'removeCommonPhoneConfig': 'NameAndGUIDRequest',
+    'removeConferenceBridge': 'NameAndGUIDRequest',
+    'removeConferenceNow': 'RemoveConferenceNowReq',
+    'removeCredentialPolicy': 'NameAndGUIDRequest',
+    'removeCss': 'NameAndGUIDRequest',
+    'removeCtiRoutePoint': 'NameAndGUIDRequest',
+    'removeCumaServerSecurityProfile': 'NameAndGUIDRequest',
+    'removeCustomUserField': 'RemoveCustomUserFieldReq',
+    'removeCustomer': 'NameAndGUIDRequest',
+    'removeDateTimeGroup': 'NameAndGUIDRequest',
+    'removeDefaultDeviceProfile': 'NameAndGUIDRequest',
+    'removeDeviceMobility': 'NameAndGUIDRequest',
+    'removeDeviceMobilityGroup': 'NameAndGUIDRequest',
+    'removeDevicePool': 'NameAndGUIDRequest',
+    'removeDeviceProfile': 'NameAndGUIDRequest',
+    'removeDhcpServer': 'RemoveDhcpServerReq',
+    'removeDhcpSubnet': 'RemoveDhcpSubnetReq',
+    'removeDirNumberAliasLookupandSync': 'NameAndGUIDRequest',
+    'removeDirectedCallPark': 'RemoveDirectedCallParkReq',
+    'removeDirectoryLookupDialRules': 'NameAndGUIDRequest',
+    'removeElinGroup': 'NameAndGUIDRequest',
+    'removeEndUserCapfProfile': 'RemoveEndUserCapfProfileReq',
+    'removeEnterpriseFeatureAccessConfiguration': 'RemoveEnterpriseFeatureAccessConfigurationReq',
+    'removeExpresswayCConfiguration': 'RemoveExpresswayCConfigurationReq',
+    'removeExternalCallControlProfile': 'NameAndGUIDRequest',
+    'removeFacInfo': 'NameAndGUIDRequest',
+    'removeFallbackProfile': 'NameAndGUIDRequest',
+    'removeFeatureControlPolicy': 'NameAndGUIDRequest',
+    'removeFeatureGroupTemplate': 'NameAndGUIDRequest',
+    'removeGatekeeper': 'NameAndGUIDRequest',
+    'removeGateway': 'RemoveGatewayReq',
+    'removeGatewayEndpointAnalogAccess': 'NameAndGUIDRequest',
+    'removeGatewayEndpointDigitalAccessBri': 'NameAndGUIDRequest',
+    'removeGatewayEndpointDigitalAccessPri': 'NameAndGUIDRequest',
+    'removeGatewayEndpointDigitalAccessT1': 'NameAndGUIDRequest',
+    'removeGatewaySccpEndpoints': 'NameAndGUIDRequest',
+    'removeGatewaySubunits': 'RemoveGatewaySubunitsReq',
+    'removeGeoLocation': 'NameAndGUIDRequest',
+    'removeGeoLocationFilter': 'NameAndGUIDRequest',
+    'removeGeoLocationPolicy': 'NameAndGUIDRequest',
+    'removeH323Gateway': 'NameAndGUIDRequest',
+    'removeH323Phone': 'NameAndGUIDRequest',
+    'removeH323Trunk': 'NameAndGUIDRequest',
+    'removeHandoffConfiguration': 'RemoveHandoffConfigurationReq',
+    'removeHttpProfile': 'NameAndGUIDRequest',
+    'removeHuntList': 'NameAndGUIDRequest',
+    'removeHuntPilot': 'RemoveHuntPilotReq',
+    'removeImeClient': 'NameAndGUIDRequest',
+    'removeImeE164Transformation': 'NameAndGUIDRequest',
+    'removeImeEnrolledPattern': 'RemoveImeEnrolledPatternReq',
+    'removeImeEnrolledPatternGroup': 'NameAndGUIDRequest',
+    'removeImeExclusionNumber': 'RemoveImeExclusionNumberReq',
+    'removeImeExclusionNumberGroup': 'NameAndGUIDRequest',
+    'removeImeFirewall': 'NameAndGUIDRequest',
+    'removeImeLearnedRoutes': 'RemoveImeLearnedRoutesReq',
+    'removeImeRouteFilterElement': 'NameAndGUIDRequest',
+    'removeImeRouteFilterGroup': 'NameAndGUIDRequest',
+    'removeImeServer': 'NameAndGUIDRequest',
+    'removeImportedDirectoryUriCatalogs': 'NameAndGUIDRequest',
+    'removeInfrastructureDevice': 'RemoveInfrastructureDeviceReq',
+    'removeIpPhoneServices': 'RemoveIpPhoneServicesReq',
+    'removeIvrUserLocale': 'RemoveIvrUserLocaleReq',
+    'removeLbmGroup': 'NameAndGUIDRequest',
+    'removeLbmHubGroup': 'NameAndGUIDRequest',
+    'removeLdapDirectory': 'NameAndGUIDRequest',
+    'removeLdapFilter': 'NameAndGUIDRequest',
+    'removeLdapSyncCustomField': 'RemoveLdapSyncCustomFieldReq',
+    'removeLine': 'RemoveLineReq',
+    'removeLineGroup': 'NameAndGUIDRequest',
+    'removeLocalRouteGroup': 'NameAndGUIDRequest',
+    'removeLocation': 'NameAndGUIDRequest',
+    'removeMediaResourceGroup': 'NameAndGUIDRequest',
+    'removeMediaResourceList': 'NameAndGUIDRequest',
+    'removeMeetMe': 'RemoveMeetMeReq',
+    'removeMessageWaiting': 'RemoveMessageWaitingReq',
+    'removeMlppDomain': 'RemoveMlppDomainReq',
+    'removeMobileVoiceAccess': 'RemoveMobileVoiceAccessReq',
+    'removeMobilityProfile': 'NameAndGUIDRequest',
+    'removeMohAudioSource': 'RemoveMohAudioSourceReq',
+    'removeMraServiceDomain': 'NameAndGUIDRequest',
+    'removeMtp': 'NameAndGUIDRequest',
+    'removeNetworkAccessProfile': 'NameAndGUIDRequest',
+    'removePhone': 'NameAndGUIDRequest',
+    'removePhoneActivationCode': 'RemovePhoneActivationCodeReq',
+    'removePhoneButtonTemplate': 'NameAndGUIDRequest',
+    'removePhoneNtp': 'RemovePhoneNtpReq',
+    'removePhoneSecurityProfile': 'NameAndGUIDRequest',
+    'removePhysicalLocation': 'NameAndGUIDRequest',
+    'removePresenceGroup': 'NameAndGUIDRequest',
+    'removePresenceRedundancyGroup': 'NameAndGUIDRequest',
+    'removeProcessNode': 'NameAndGUIDRequest',
+    'removeRecordingProfile': 'NameAndGUIDRequest',
+    'removeRegion': 'NameAndGUIDRequest',
+    'removeRemoteCluster': 'RemoveRemoteClusterReq',
+    'removeRemoteDestination': 'RemoveRemoteDestinationReq',
+    'removeRemoteDestinationProfile': 'NameAndGUIDRequest',
+    'removeResourcePriorityNamespace': 'RemoveResourcePriorityNamespaceReq',
+    'removeResourcePriorityNamespaceList': 'NameAndGUIDRequest',
+    'removeRouteFilter': 'NameAndGUIDRequest',
+    'removeRouteGroup': 'NameAndGUIDRequest',
+    'removeRouteList': 'NameAndGUIDRequest',
+    'removeRoutePartition': 'NameAndGUIDRequest',
+    'removeRoutePattern': 'RemoveRoutePatternReq',
+    'removeSIPNormalizationScript': 'NameAndGUIDRequest',
+    'removeSNMPCommunityString': 'RemoveSNMPCommunityStringReq',
+    'removeSNMPUser': 'RemoveSNMPUserReq',
+    'removeSafCcdPurgeBlockLearnedRoutes': 'RemoveSafCcdPurgeBlockLearnedRoutesReq',
+    'removeSafForwarder': 'NameAndGUIDRequest',
+    'removeSafSecurityProfile': 'NameAndGUIDRequest',
+    'removeSdpTransparencyProfile': 'NameAndGUIDRequest',
+    'removeServiceProfile': 'NameAndGUIDRequest',
+    'removeSipDialRules': 'NameAndGUIDRequest',
+    'removeSipProfile': 'NameAndGUIDRequest',
+    'removeSipRealm': 'RemoveSipRealmReq',
+    'removeSipRoutePattern': 'RemoveSipRoutePatternReq',
+    'removeSipTrunk': 'NameAndGUIDRequest',
+    'removeSipTrunkSecurityProfile': 'NameAndGUIDRequest',
+    'removeSoftKeyTemplate': 'NameAndGUIDRequest',
+    'removeSrst': 'NameAndGUIDRequest',
+    'removeTimePeriod': 'NameAndGUIDRequest',
+    'removeTimeSchedule': 'NameAndGUIDRequest',
+    'removeTodAccess': 'NameAndGUIDRequest',
+    'removeTransPattern': 'RemoveTransPatternReq',
+    'removeTranscoder': 'NameAndGUIDRequest',
+    'removeTransformationProfile': 'NameAndGUIDRequest',
+    'removeUcService': 'NameAndGUIDRequest',
+    'removeUnitsToGateway': 'RemoveUnitsToGatewayReq',
+    'removeUniversalDeviceTemplate': 'NameAndGUIDRequest',
+    'removeUniversalLineTemplate': 'NameAndGUIDRequest',
+    'removeUser': 'RemoveUserReq',
+    'removeUserGroup': 'NameAndGUIDRequest',
+    'removeUserProfileProvision': 'NameAndGUIDRequest',
+    'removeVg224': 'RemoveVg224Req',
+    'removeVohServer': 'NameAndGUIDRequest',
+    'removeVoiceMailPilot': 'RemoveVoiceMailPilotReq',
+    'removeVoiceMailPort': 'NameAndGUIDRequest',
+    'removeVoiceMailProfile': 'NameAndGUIDRequest',
+    'removeVpnGateway': 'NameAndGUIDRequest',
+    'removeVpnGroup': 'NameAndGUIDRequest',
+    'removeVpnProfile': 'NameAndGUIDRequest',
+    'removeWLANProfile': 'NameAndGUIDRequest',
+    'removeWifiHotspot': 'NameAndGUIDRequest',
+    'removeWirelessAccessPointControllers': 'NameAndGUIDRequest',
+    'removeWlanProfileGroup': 'NameAndGUIDRequest',
+    'resetCallManager': 'NameAndGUIDRequest',
+    'resetCallManagerGroup': 'NameAndGUIDRequest',
+    'resetCiscoCatalyst600024PortFXSGateway': 'NameAndGUIDRequest',
+    'resetCiscoCatalyst6000E1VoIPGateway': 'NameAndGUIDRequest',
+    'resetCiscoCatalyst6000T1VoIPGatewayPri': 'NameAndGUIDRequest',
+    'resetCiscoCatalyst6000T1VoIPGatewayT1': 'NameAndGUIDRequest',
+    'resetCommonDeviceConfig': 'NameAndGUIDRequest',
+    'resetCommonPhoneConfig': 'NameAndGUIDRequest',
+    'resetConferenceBridge': 'NameAndGUIDRequest',
+    'resetCtiRoutePoint': 'NameAndGUIDRequest',
+    'resetDateTimeGroup': 'NameAndGUIDRequest',
+    'resetDevicePool': 'NameAndGUIDRequest',
+    'resetDirectedCallPark': 'ResetDirectedCallParkReq',
+    'resetEnterpriseParameters': 'ResetEnterpriseParametersReq',
+    'resetGatekeeper': 'NameAndGUIDRequest',
+    'resetGateway': 'ResetGatewayReq',
+    'resetH323Gateway': 'NameAndGUIDRequest',
+    'resetH323Phone': 'NameAndGUIDRequest',
+    'resetH323Trunk': 'NameAndGUIDRequest',
+    'resetHuntList': 'NameAndGUIDRequest',
+    'resetLine': 'ResetLineReq',
+    'resetMtp': 'NameAndGUIDRequest',
+    'resetPhone': 'NameAndGUIDRequest',
+    'resetPhoneSecurityProfile': 'NameAndGUIDRequest',
+    'resetResourcePriorityNamespace': 'ResetResourcePriorityNamespaceReq',
+    'resetResourcePriorityNamespaceList': 'NameAndGUIDRequest',
+    'resetRouteList': 'NameAndGUIDRequest',
+    'resetSipTrunk': 'NameAndGUIDRequest',
+    'resetSipTrunkSecurityProfile': 'NameAndGUIDRequest',
+    'resetSrst': 'NameAndGUIDRequest',
+    'resetTranscoder': 'NameAndGUIDRequest',
+    'resetUcService': 'NameAndGUIDRequest',
+    'resetVg224': 'ResetVg224Req',
+    'resetVoiceMailPort': 'NameAndGUIDRequest',
+    'resetVoiceMailProfile': 'NameAndGUIDRequest',
+    'restartCallManager': 'NameAndGUIDRequest',
+    'restartCiscoCatalyst600024PortFXSGateway': 'NameAndGUIDRequest',
+    'restartCiscoCatalyst6000E1VoIPGateway': 'NameAndGUIDRequest',
+    'restartCiscoCatalyst6000T1VoIPGatewayPri': 'NameAndGUIDRequest',
+    'restartCiscoCatalyst6000T1VoIPGatewayT1': 'NameAndGUIDRequest',
+    'restartConferenceBridge': 'NameAndGUIDRequest',
+    'restartCtiRoutePoint': 'NameAndGUIDRequest',
+    'restartDevicePool': 'NameAndGUIDRequest',
+    'restartEnterpriseParameters': 'RestartEnterpriseParametersReq',
+    'restartGatekeeper': 'NameAndGUIDRequest',
+    'restartGateway': 'RestartGatewayReq',
+    'restartH323Gateway': 'NameAndGUIDRequest',
+    'restartH323Phone': 'NameAndGUIDRequest',
+    'restartH323Trunk': 'NameAndGUIDRequest',
+    'restartLine': 'RestartLineReq',
+    'restartMtp': 'NameAndGUIDRequest',
+    'restartPhone': 'NameAndGUIDRequest',
+    'restartPhoneButtonTemplate': 'NameAndGUIDRequest',
+    'restartRegion': 'NameAndGUIDRequest',
+    'restartResourcePriorityNamespace': 'RestartResourcePriorityNamespaceReq',
+    'restartResourcePriorityNamespaceList': 'NameAndGUIDRequest',
+    'restartRoutePartition': 'NameAndGUIDRequest',
+    'restartSipProfile': 'NameAndGUIDRequest',
+    'restartSipTrunk': 'NameAndGUIDRequest',
+    'restartSoftKeyTemplate': 'NameAndGUIDRequest',
+    'restartSrst': 'NameAndGUIDRequest',
+    'restartUcService': 'NameAndGUIDRequest',
+    'restartVg224': 'RestartVg224Req',
+    'restartVoiceMailPort': 'NameAndGUIDRequest',
+    'restartVoiceMailProfile': 'NameAndGUIDRequest',
+    'unassignPresenceUser': 'UnassignPresenceUserReq',
+    'updateAarGroup': 'UpdateAarGroupReq',
+    'updateAarGroupMatrix': 'UpdateAarGroupMatrixReq',
+    'updateAdvertisedPatterns': 'UpdateAdvertisedPatternsReq',
+    'updateAnnouncement': 'UpdateAnnouncementReq',
+    'updateAnnunciator': 'UpdateAnnunciatorReq',
+    'updateAppServerInfo': 'UpdateAppServerInfoReq',
+    'updateAppUser': 'UpdateAppUserReq',
+    'updateApplicationDialRules': 'UpdateApplicationDialRulesReq',
+    'updateApplicationServer': 'UpdateApplicationServerReq',
+    'updateApplicationUserCapfProfile': 'UpdateApplicationUserCapfProfileReq',
+    'updateAudioCodecPreferenceList': 'UpdateAudioCodecPreferenceListReq',
+    'updateBillingServer': 'UpdateBillingServerReq',
+    'updateBlockedLearnedPatterns': 'UpdateBlockedLearnedPatternsReq',
+    'updateCCAProfiles': 'UpdateCCAProfilesReq',
+    'updateCallManager': 'UpdateCallManagerReq',
+    'updateCallManagerGroup': 'UpdateCallManagerGroupReq',
+    'updateCallPark': 'UpdateCallParkReq',
+    'updateCallPickupGroup': 'UpdateCallPickupGroupReq',
+    'updateCalledPartyTransformationPattern': 'UpdateCalledPartyTransformationPatternReq',
+    'updateCallerFilterList': 'UpdateCallerFilterListReq',
+    'updateCallingPartyTransformationPattern': 'UpdateCallingPartyTransformationPatternReq',
+    'updateCcdAdvertisingService': 'UpdateCcdAdvertisingServiceReq',
+    'updateCcdFeatureConfig': 'UpdateCcdFeatureConfigReq',
+    'updateCcdHostedDN': 'UpdateCcdHostedDNReq',
+    'updateCcdHostedDNGroup': 'UpdateCcdHostedDNGroupReq',
+    'updateCcdRequestingService': 'UpdateCcdRequestingServiceReq',
+    'updateCiscoCatalyst600024PortFXSGateway': 'UpdateCiscoCatalyst600024PortFXSGatewayReq',
+    'updateCiscoCatalyst6000E1VoIPGateway': 'UpdateCiscoCatalyst6000E1VoIPGatewayReq',
+    'updateCiscoCatalyst6000T1VoIPGatewayPri': 'UpdateCiscoCatalyst6000T1VoIPGatewayPriReq',
+    'updateCiscoCatalyst6000T1VoIPGatewayT1': 'UpdateCiscoCatalyst6000T1VoIPGatewayT1Req',
+    'updateCiscoCloudOnboarding': 'UpdateCiscoCloudOnboardingReq',
+    'updateCmcInfo': 'UpdateCmcInfoReq',
+    'updateCommonDeviceConfig': 'UpdateCommonDeviceConfigReq',
+    'updateCommonPhoneConfig': 'UpdateCommonPhoneConfigReq',
+    'updateConferenceBridge': 'UpdateConferenceBridgeReq',
+    'updateConferenceNow': 'UpdateConferenceNowReq',
+    'updateCredentialPolicy': 'UpdateCredentialPolicyReq',
+    'updateCredentialPolicyDefault': 'UpdateCredentialPolicyDefaultReq',
+    'updateCss': 'UpdateCssReq',
+    'updateCtiRoutePoint': 'UpdateCtiRoutePointReq',
+    'updateCumaServerSecurityProfile': 'UpdateCumaServerSecurityProfileReq',
+    'updateCustomUserField': 'UpdateCustomUserFieldReq',
+    'updateCustomer': 'UpdateCustomerReq',
+    'updateDateTimeGroup': 'UpdateDateTimeGroupReq',
+    'updateDefaultDeviceProfile': 'UpdateDefaultDeviceProfileReq',
+    'updateDeviceDefaults': 'UpdateDeviceDefaultsReq',
+    'updateDeviceMobility': 'UpdateDeviceMobilityReq',
+    'updateDeviceMobilityGroup': 'UpdateDeviceMobilityGroupReq',
+    'updateDevicePool': 'UpdateDevicePoolReq',
+    'updateDeviceProfile': 'UpdateDeviceProfileReq',
+    'updateDhcpServer': 'UpdateDhcpServerReq',
+    'updateDhcpSubnet': 'UpdateDhcpSubnetReq',
+    'updateDirNumberAliasLookupandSync': 'UpdateDirNumberAliasLookupandSyncReq',
+    'updateDirectedCallPark': 'UpdateDirectedCallParkReq',
+    'updateDirectoryLookupDialRules': 'UpdateDirectoryLookupDialRulesReq',
+    'updateElinGroup': 'UpdateElinGroupReq',
+    'updateEmccFeatureConfig': 'UpdateEmccFeatureConfigReq',
+    'updateEndUserCapfProfile': 'UpdateEndUserCapfProfileReq',
+    'updateEnterpriseFeatureAccessConfiguration': 'UpdateEnterpriseFeatureAccessConfigurationReq',
+    'updateEnterprisePhoneConfig': 'UpdateEnterprisePhoneConfigReq',
+    'updateExpresswayCConfiguration': 'UpdateExpresswayCConfigurationReq',
+    'updateExternalCallControlProfile': 'UpdateExternalCallControlProfileReq',
+    'updateFacInfo': 'UpdateFacInfoReq',
+    'updateFallbackFeatureConfig': 'UpdateFallbackFeatureConfigReq',
+    'updateFallbackProfile': 'UpdateFallbackProfileReq',
+    'updateFeatureControlPolicy': 'UpdateFeatureControlPolicyReq',
+    'updateFeatureGroupTemplate': 'UpdateFeatureGroupTemplateReq',
+    'updateFixedMohAudioSource': 'UpdateFixedMohAudioSourceReq',
+    'updateGatekeeper': 'UpdateGatekeeperReq',
+    'updateGateway': 'UpdateGatewayReq',
+    'updateGatewayEndpointAnalogAccess': 'UpdateGatewayEndpointAnalogAccessReq',
+    'updateGatewayEndpointDigitalAccessBri': 'UpdateGatewayEndpointDigitalAccessBriReq',
+    'updateGatewayEndpointDigitalAccessPri': 'UpdateGatewayEndpointDigitalAccessPriReq',
+    'updateGatewayEndpointDigitalAccessT1': 'UpdateGatewayEndpointDigitalAccessT1Req',
+    'updateGatewaySccpEndpoints': 'UpdateGatewaySccpEndpointsReq',
+    'updateGeoLocation': 'UpdateGeoLocationReq',
+    'updateGeoLocationFilter': 'UpdateGeoLocationFilterReq',
+    'updateGeoLocationPolicy': 'UpdateGeoLocationPolicyReq',
+    'updateH323Gateway': 'UpdateH323GatewayReq',
+    'updateH323Phone': 'UpdateH323PhoneReq',
+    'updateH323Trunk': 'UpdateH323TrunkReq',
+    'updateHandoffConfiguration': 'UpdateHandoffConfigurationReq',
+    'updateHttpProfile': 'UpdateHttpProfileReq',
+    'updateHuntList': 'UpdateHuntListReq',
+    'updateHuntPilot': 'UpdateHuntPilotReq',
+    'updateIlsConfig': 'UpdateIlsConfigReq',
+    'updateImeClient': 'UpdateImeClientReq',
+    'updateImeE164Transformation': 'UpdateImeE164TransformationReq',
+    'updateImeEnrolledPattern': 'UpdateImeEnrolledPatternReq',
+    'updateImeEnrolledPatternGroup': 'UpdateImeEnrolledPatternGroupReq',
+    'updateImeExclusionNumber': 'UpdateImeExclusionNumberReq',
+    'updateImeExclusionNumberGroup': 'UpdateImeExclusionNumberGroupReq',
+    'updateImeFeatureConfig': 'UpdateImeFeatureConfigReq',
+    'updateImeFirewall': 'UpdateImeFirewallReq',
+    'updateImeLearnedRoutes': 'UpdateImeLearnedRoutesReq',
+    'updateImeRouteFilterElement': 'UpdateImeRouteFilterElementReq',
+    'updateImeRouteFilterGroup': 'UpdateImeRouteFilterGroupReq',
+    'updateImeServer': 'UpdateImeServerReq',
+    'updateImportedDirectoryUriCatalogs': 'UpdateImportedDirectoryUriCatalogsReq',
+    'updateInfrastructureDevice': 'UpdateInfrastructureDeviceReq',
+    'updateInterClusterDirectoryUri': 'UpdateInterClusterDirectoryUriReq',
+    'updateInterClusterServiceProfile': 'UpdateInterClusterServiceProfileReq',
+    'updateIpPhoneServices': 'UpdateIpPhoneServicesReq',
+    'updateIvrUserLocale': 'UpdateIvrUserLocaleReq',
+    'updateLbmGroup': 'UpdateLbmGroupReq',
+    'updateLbmHubGroup': 'UpdateLbmHubGroupReq',
+    'updateLdapAuthentication': 'UpdateLdapAuthenticationReq',
+    'updateLdapDirectory': 'UpdateLdapDirectoryReq',
+    'updateLdapFilter': 'UpdateLdapFilterReq',
+    'updateLdapSearch': 'UpdateLdapSearchReq',
+    'updateLdapSyncCustomField': 'UpdateLdapSyncCustomFieldReq',
+    'updateLdapSystem': 'UpdateLdapSystemReq',
+    'updateLine': 'UpdateLineReq',
+    'updateLineGroup': 'UpdateLineGroupReq',
+    'updateLocalRouteGroup': 'UpdateLocalRouteGroupReq',
+    'updateLocation': 'UpdateLocationReq',
+    'updateMediaResourceGroup': 'UpdateMediaResourceGroupReq',
+    'updateMediaResourceList': 'UpdateMediaResourceListReq',
+    'updateMeetMe': 'UpdateMeetMeReq',
+    'updateMessageWaiting': 'UpdateMessageWaitingReq',
+    'updateMlppDomain': 'UpdateMlppDomainReq',
+    'updateMobileVoiceAccess': 'UpdateMobileVoiceAccessReq',
+    'updateMobility': 'UpdateMobilityReq',
+    'updateMobilityProfile': 'UpdateMobilityProfileReq',
+    'updateMohAudioSource': 'UpdateMohAudioSourceReq',
+    'updateMohServer': 'UpdateMohServerReq',
+    'updateMraServiceDomain': 'UpdateMraServiceDomainReq',
+    'updateMtp': 'UpdateMtpReq',
+    'updateNetworkAccessProfile': 'UpdateNetworkAccessProfileReq',
+    'updatePageLayoutPreferences': 'UpdatePageLayoutPreferencesReq',
+    'updatePhone': 'UpdatePhoneReq',
+    'updatePhoneButtonTemplate': 'UpdatePhoneButtonTemplateReq',
+    'updatePhoneNtp': 'UpdatePhoneNtpReq',
+    'updatePhoneSecurityProfile': 'UpdatePhoneSecurityProfileReq',
+    'updatePhysicalLocation': 'UpdatePhysicalLocationReq',
+    'updatePresenceGroup': 'UpdatePresenceGroupReq',
+    'updatePresenceRedundancyGroup': 'UpdatePresenceRedundancyGroupReq',
+    'updateProcessNode': 'UpdateProcessNodeReq',
+    'updateProcessNodeService': 'UpdateProcessNodeServiceReq',
+    'updateRecordingProfile': 'UpdateRecordingProfileReq',
+    'updateRegion': 'UpdateRegionReq',
+    'updateRegionMatrix': 'UpdateRegionMatrixReq',
+    'updateRemoteCluster': 'UpdateRemoteClusterReq',
+    'updateRemoteDestination': 'UpdateRemoteDestinationReq',
+    'updateRemoteDestinationProfile': 'UpdateRemoteDestinationProfileReq',
+    'updateResourcePriorityNamespace': 'UpdateResourcePriorityNamespaceReq',
+    'updateResourcePriorityNamespaceList': 'UpdateResourcePriorityNamespaceListReq',
+    'updateRouteFilter': 'UpdateRouteFilterReq',
+    'updateRouteGroup': 'UpdateRouteGroupReq',
+    'updateRouteList': 'UpdateRouteListReq',
+    'updateRoutePartition': 'UpdateRoutePartitionReq',
+    'updateRoutePartitionsForLearnedPatterns': 'UpdateRoutePartitionsForLearnedPatternsReq',
+    'updateRoutePattern': 'UpdateRoutePatternReq',
+    'updateSIPNormalizationScript': 'UpdateSIPNormalizationScriptReq',
+    'updateSNMPCommunityString': 'UpdateSNMPCommunityStringReq',
+    'updateSNMPMIB2List': 'UpdateSNMPMIB2ListReq',
+    'updateSNMPUser': 'UpdateSNMPUserReq',
+    'updateSafCcdPurgeBlockLearnedRoutes': 'UpdateSafCcdPurgeBlockLearnedRoutesReq',
+    'updateSafForwarder': 'UpdateSafForwarderReq',
+    'updateSafSecurityProfile': 'UpdateSafSecurityProfileReq',
+    'updateSdpTransparencyProfile': 'UpdateSdpTransparencyProfileReq',
+    'updateSecureConfig': 'UpdateSecureConfigReq',
+    'updateSelfProvisioning': 'UpdateSelfProvisioningReq',
+    'updateServiceParameter': 'UpdateServiceParameterReq',
+    'updateServiceProfile': 'UpdateServiceProfileReq',
+    'updateSipDialRules': 'UpdateSipDialRulesReq',
+    'updateSipProfile': 'UpdateSipProfileReq',
+    'updateSipRealm': 'UpdateSipRealmReq',
+    'updateSipRoutePattern': 'UpdateSipRoutePatternReq',
+    'updateSipTrunk': 'UpdateSipTrunkReq',
+    'updateSipTrunkSecurityProfile': 'UpdateSipTrunkSecurityProfileReq',
+    'updateSoftKeySet': 'UpdateSoftKeySetReq',
+    'updateSoftKeyTemplate': 'UpdateSoftKeyTemplateReq',
+    'updateSrst': 'UpdateSrstReq',
+    'updateSyslogConfiguration': 'UpdateSyslogConfigurationReq',
+    'updateTimePeriod': 'UpdateTimePeriodReq',
+    'updateTimeSchedule': 'UpdateTimeScheduleReq',
+    'updateTodAccess': 'UpdateTodAccessReq',
+    'updateTransPattern': 'UpdateTransPatternReq',
+    'updateTranscoder': 'UpdateTranscoderReq',
+    'updateTransformationProfile': 'UpdateTransformationProfileReq',
+    'updateTvsCertificate': 'UpdateTvsCertificateReq',
+    'updateUcService': 'UpdateUcServiceReq',
+    'updateUniversalDeviceTemplate': 'UpdateUniversalDeviceTemplateReq',
+    'updateUniversalLineTemplate': 'UpdateUniversalLineTemplateReq',
+    'updateUser': 'UpdateUserReq',
+    'updateUserGroup': 'UpdateUserGroupReq',
+    'updateUserProfileProvision': 'UpdateUserProfileProvisionReq',
+    'updateVg224': 'UpdateVg224Req',
+    'updateVohServer': 'UpdateVohServerReq',
+    'updateVoiceMailPilot': 'UpdateVoiceMailPilotReq',
+    'updateVoiceMailPort': 'UpdateVoiceMailPortReq',
+    'updateVoiceMailProfile': 'UpdateVoiceMailProfileReq',
+    'updateVpnGateway': 'UpdateVpnGatewayReq',
+    'updateVpnGroup': 'UpdateVpnGroupReq',
+    'updateVpnProfile': 'UpdateVpnProfileReq',
+    'updateWLANProfile': 'UpdateWLANProfileReq',
+    'updateWifiHotspot': 'UpdateWifiHotspotReq',
+    'updateWirelessAccessPointControllers': 'UpdateWirelessAccessPointControllersReq',
+    'updateWlanProfileGroup': 'UpdateWlanProfileGroupReq',
+    'wipePhone': 'NameAndGUIDRequest',
+}
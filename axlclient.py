@@ -0,0 +1,497 @@
+"""zeep based AXL client.
+
+Importing zeep, lxml and requests takes most of the CLI's startup time, so
+lab.py only imports this module once a command actually talks to <uc>.
+"""
+import atexit
+import copy
+import gzip
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from typing import List
+
+import urllib3
+from lxml import etree
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from zeep import Client, Settings, Plugin, xsd
+from zeep.exceptions import Fault
+from zeep.transports import Transport
+
+from capabilities import CACHE_DIR
+from cassette import Cassette
+from profiling import add_network_time, add_received, network_time, received
+from projection import ProjectionStore, track
+from results import record
+from validation import default_validator
+
+# The WSDL is a local file which contains the CUCM Schema
+WSDL_FILE = 'schema/AXLAPI.wsdl'
+
+
+PROJECTIONS_FILE = os.path.join(CACHE_DIR, 'projections.json')
+
+# Always in a get response, whatever returnedTags asks for
+ALWAYS_RETURNED = {'uuid'}
+
+# The Fault of a list request matching more rows than the cluster will return
+TOO_MANY_ROWS = re.compile(r'query request too large.*?less than (\d+) rows',
+                           re.IGNORECASE | re.DOTALL)
+
+_schema_lock = threading.Lock()
+_schema_clients = {}
+_projections = None
+
+
+class RateLimiter:
+    """Token bucket allowing rate requests per second, shared by the
+    threads using one cluster's transport."""
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens +
+                                   (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class ValidationError(Fault):
+    """A payload failed validation against the schema. A Fault, like the
+    cluster would raise for it, so the existing error handling reports it
+    without the round trip."""
+    def __init__(self, operation: str, errors: List[str]):
+        super().__init__(f'Payload failed schema validation: '
+                         f'{"; ".join(errors)}')
+        self.operation = operation
+        self.errors = errors
+
+
+class ResponseTooLarge(Fault):
+    """A response body exceeded the cluster's max_response_bytes.
+
+    A Fault, so the helpers' error handling reports it like any failed
+    request. Capping the body also bounds the memory taken by parsing it,
+    which grows with its size; parsed memory itself is only measured (with
+    tracemalloc), not capped."""
+    def __init__(self, size: int, limit: int):
+        super().__init__(f'response larger than {limit} bytes '
+                         f'(read {size} so far)')
+        self.size = size
+        self.limit = limit
+
+
+class AXLTransport(Transport):
+    """Transport which holds requests to one cluster to its rate limit,
+    optionally gzips request bodies and refuses response bodies over
+    max_response_bytes.
+
+    With compress_requests, the first request is sent gzipped. If the
+    cluster refuses it (HTTP 415 or 400) the request is sent again
+    uncompressed, and so are all the following ones."""
+    def __init__(self, *args, rate_limit: float = None,
+                 compress_requests: bool = False,
+                 max_response_bytes: int = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.compress_requests = compress_requests
+        # None until the cluster has answered a gzipped request
+        self.gzip_accepted = None
+        self.max_response_bytes = max_response_bytes
+
+    def post(self, address, message, headers):
+        if self.limiter:
+            self.limiter.acquire()
+        started = time.perf_counter()
+        try:
+            response = self._exchange(address, message, headers)
+        finally:
+            add_network_time(time.perf_counter() - started)
+        add_received(len(response.content))
+        return response
+
+    def _exchange(self, address, message, headers):
+        if not self.compress_requests or self.gzip_accepted is False:
+            return self._send(address, message, headers)
+
+        if isinstance(message, str):
+            message = message.encode('utf-8')
+        response = self._send(address, gzip.compress(message, compresslevel=5),
+                              {**headers, 'Content-Encoding': 'gzip'})
+        if self.gzip_accepted is None:
+            self.gzip_accepted = response.status_code not in (400, 415)
+            if not self.gzip_accepted:
+                return self._send(address, message, headers)
+        return response
+
+    def _send(self, address, message, headers):
+        # Read the body as it arrives, giving up as soon as it is too large
+        # rather than after it has all been buffered and parsed
+        response = self.session.post(address, data=message, headers=headers,
+                                     timeout=self.operation_timeout,
+                                     stream=True)
+        body = bytearray()
+        try:
+            for chunk in response.iter_content(64 * 1024):
+                body += chunk
+                self._check_size(len(body))
+        finally:
+            response.close()
+        response._content = bytes(body)
+        return response
+
+    def _check_size(self, size: int):
+        if self.max_response_bytes and size > self.max_response_bytes:
+            raise ResponseTooLarge(size, self.max_response_bytes)
+
+
+class RecordingTransport(AXLTransport):
+    """Transport which also records every exchange into a cassette."""
+    def __init__(self, *args, cassette: Cassette, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cassette = cassette
+
+    def _exchange(self, address, message, headers):
+        started = time.perf_counter()
+        try:
+            response = super()._exchange(address, message, headers)
+        except ResponseTooLarge as err:
+            # Recorded too, so a replay takes the same paging path
+            self.cassette.add(address, headers, message, 0, '', b'',
+                              time.perf_counter() - started,
+                              oversize=err.size)
+            raise
+        self.cassette.add(address, headers, message, response.status_code,
+                          response.headers.get('Content-Type', 'text/xml'),
+                          response.content, time.perf_counter() - started)
+        return response
+
+
+class ReplayTransport(AXLTransport):
+    """Transport answering from a cassette instead of the cluster, after
+    the recorded latency multiplied by latency (0 to answer at once).
+
+    A response which was over max_response_bytes while recording raises
+    ResponseTooLarge again, as does one over this run's limit."""
+    def __init__(self, *args, cassette: Cassette, latency: float = 1.0,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cassette = cassette
+        self.latency = latency
+
+    def _exchange(self, address, message, headers):
+        exchange = self.cassette.take(address, headers, message)
+        if self.latency:
+            time.sleep(exchange['elapsed'] * self.latency)
+        if 'oversize' in exchange:
+            raise ResponseTooLarge(exchange['oversize'],
+                                   self.max_response_bytes or
+                                   exchange['oversize'] - 1)
+        self._check_size(len(exchange['body']))
+        response = Response()
+        response.status_code = exchange['status']
+        response.headers['Content-Type'] = exchange['content_type']
+        response._content = exchange['body'].encode('utf-8')
+        response.url = address
+        return response
+
+
+def schema_client(wsdl_file: str) -> Client:
+    """A Client holding the parsed schema, built once per process.
+
+    Parsing the WSDL and its 4.5 MB of XSD is by far the largest cost of a
+    client, so every cluster's client is a shallow copy of this one with its
+    own transport, sharing the parsed schema."""
+    with _schema_lock:
+        if wsdl_file not in _schema_clients:
+            # strict=False is not always necessary, but it allows zeep to parse imperfect XML
+            # huge_tree is only lifted for the local schema files, see connect()
+            settings = Settings(strict=False, xml_huge_tree=True)
+            _schema_clients[wsdl_file] = Client(wsdl_file, settings=settings)
+        return _schema_clients[wsdl_file]
+
+
+def projection_store() -> ProjectionStore:
+    """The returnedTags learnt at each call site, saved at exit."""
+    global _projections
+    with _schema_lock:
+        if _projections is None:
+            _projections = ProjectionStore(PROJECTIONS_FILE)
+            atexit.register(_projections.save)
+        return _projections
+
+
+def _call_site(operation: str) -> str:
+    """operation@file:function of the code making the request, skipping
+    the client wrappers (all named call) in between."""
+    frame = sys._getframe(1)
+    while frame is not None and (frame.f_code.co_filename == __file__ or
+                                 frame.f_code.co_name == 'call'):
+        frame = frame.f_back
+    if frame is None:
+        return operation
+    return (f'{operation}@{os.path.basename(frame.f_code.co_filename)}:'
+            f'{frame.f_code.co_name}')
+
+
+# This class lets you view the incoming and outgoing http headers and/or XML
+class MyLoggingPlugin(Plugin):
+    def egress(self, envelope, http_headers, operation, binding_options):
+        # Format the request body as pretty printed XML
+        xml = etree.tostring(envelope, pretty_print=True, encoding='unicode')
+
+        print(f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}')
+
+    def ingress(self, envelope, http_headers, operation):
+        # Format the response body as pretty printed XML
+        xml = etree.tostring(envelope, pretty_print=True, encoding='unicode')
+
+        print(f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}')
+
+
+class SingleFlight:
+    """Lets concurrent identical calls share one execution: the first caller
+    runs it, the others wait for and receive the same result or exception."""
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+def _request_key(value):
+    """Hashable form of a request's arguments."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _request_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_request_key(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def is_read(operation: str) -> bool:
+    return operation.startswith(('get', 'list'))
+
+
+class AXLService:
+    """Wraps the zeep ServiceProxy so every request payload is checked
+    locally against the schema before it is sent.
+
+    A payload which fails validation raises a Fault, like the cluster would,
+    so the existing error handling reports it without the round trip.
+
+    Concurrent identical get/list requests, such as every site task reading
+    listRegion or the hub trunk at the same moment, are coalesced into one
+    request whose result they all receive. Callers must not modify it.
+
+    get requests made without returnedTags ask only for the fields their
+    call site was seen to read (see projection.py).
+
+    A list request too large for the cluster, or for max_response_bytes, is
+    fetched again page_size rows at a time."""
+    def __init__(self, service, validate: bool = True, coalesce: bool = True,
+                 address: str = None, project: bool = True,
+                 page_size: int = 1000):
+        self._service = service
+        self.page_size = page_size
+        self._validator = default_validator() if validate else None
+        self._single_flight = SingleFlight() if coalesce else None
+        self._projections = projection_store() if project else None
+        self.address = address
+
+    def __getattr__(self, operation: str):
+        method = getattr(self._service, operation)
+
+        def send(args: tuple, kwargs: dict):
+            if self._single_flight is None or not is_read(operation):
+                return method(*args, **kwargs)
+            key = (operation, _request_key(args), _request_key(kwargs))
+            return self._single_flight.do(
+                key, lambda: method(*args, **kwargs))
+
+        def request(args: tuple, kwargs: dict):
+            started = time.perf_counter()
+            cpu, network, size = time.thread_time(), network_time(), received()
+            tracing = tracemalloc.is_tracing()
+            memory = tracemalloc.get_traced_memory()[0] if tracing else 0
+
+            def spent() -> dict:
+                return {'cpu': time.thread_time() - cpu,
+                        'network': network_time() - network,
+                        'received': received() - size,
+                        'memory': max(tracemalloc.get_traced_memory()[0] -
+                                      memory, 0) if tracing else 0}
+            try:
+                response = send(args, kwargs)
+            except Fault as err:
+                record(operation, args, kwargs, started, status='fault',
+                       fault=str(err), cluster=self.address, **spent())
+                raise
+            record(operation, args, kwargs, started, response=response,
+                   cluster=self.address, **spent())
+            return response
+
+        def call(*args, **kwargs):
+            if self._validator is not None:
+                errors = self._validator.validate(operation, args, kwargs)
+                if errors:
+                    err = ValidationError(operation, errors)
+                    record(operation, args, kwargs, time.perf_counter(),
+                           status='invalid', fault=str(err),
+                           cluster=self.address)
+                    raise err
+            if (operation.startswith('list') and not args and
+                    'skip' not in kwargs and 'first' not in kwargs):
+                return self._list(request, kwargs)
+            if (self._projections is None or args or
+                    not operation.startswith('get') or
+                    'returnedTags' in kwargs):
+                return request(args, kwargs)
+
+            site = _call_site(operation)
+            fields = self._projections.fields(site)
+            if fields is not None:
+                fields -= ALWAYS_RETURNED
+                tags = default_validator().returned_tags(operation)
+                # Nested objects cannot be selected with a bare tag
+                if not fields or not all(tags.get(f) for f in fields):
+                    fields = None
+            if fields is None:
+                response = request(args, kwargs)
+            else:
+                response = request(args, {
+                    **kwargs, 'returnedTags': {f: xsd.Nil for f in fields}})
+            return track(response, site, self._projections, fields,
+                         lambda: request(args, kwargs))
+        return call
+
+    def _list(self, request, kwargs: dict):
+        """A list request, fetched again in pages of skip/first when the
+        cluster refuses to return that many rows at once or the response
+        is over the size limit."""
+        try:
+            return request((), kwargs)
+        except ResponseTooLarge:
+            first = self.page_size
+        except Fault as err:
+            match = TOO_MANY_ROWS.search(str(err))
+            if not match:
+                raise
+            first = min(self.page_size, int(match.group(1)) - 1)
+
+        # The pages may be shared with coalesced callers, so their rows are
+        # gathered into a new response rather than into the first page
+        tag, rows, skip = None, [], 0
+        while True:
+            try:
+                response = request((), {**kwargs, 'skip': skip,
+                                        'first': first})
+            except ResponseTooLarge:
+                if first == 1:
+                    raise
+                first //= 2
+                continue
+            result = response['return']
+            page = []
+            if result:
+                tag = next(iter(result))
+                page = result[tag] or []
+            rows.extend(page)
+            if len(page) < first:
+                return {'return': {tag: rows} if tag else None}
+            skip += len(page)
+
+
+def connect(username: str, password: str, address: str,
+            validate: bool = True, wsdl_file: str = WSDL_FILE,
+            rate_limit: float = None, max_connections: int = 10,
+            coalesce: bool = True, project: bool = True,
+            compress_requests: bool = False, record: Cassette = None,
+            replay: Cassette = None, replay_latency: float = 1.0,
+            xml_huge_tree: bool = False, max_response_bytes: int = None,
+            page_size: int = 1000) -> AXLService:
+    # Change to true to enable output of request/response headers and XML
+    debug = False
+
+    session = Session()
+    session.verify = False
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    session.auth = HTTPBasicAuth(username, password)
+    # Each cluster gets its own connection pool
+    session.mount('https://', HTTPAdapter(pool_connections=1,
+                                          pool_maxsize=max_connections))
+
+    # Create a Zeep transport and set a reasonable timeout value
+    options = {'session': session, 'timeout': 10, 'rate_limit': rate_limit,
+               'compress_requests': compress_requests,
+               'max_response_bytes': max_response_bytes}
+    if replay:
+        transport = ReplayTransport(cassette=replay, latency=replay_latency,
+                                    **options)
+    elif record:
+        transport = RecordingTransport(cassette=record, **options)
+    else:
+        transport = AXLTransport(**options)
+
+    # If debug output is requested, add the MyLoggingPlugin callback
+    plugin = [MyLoggingPlugin()] if debug else []
+
+    # Share the parsed schema, with this cluster's transport and plugins
+    client = copy.copy(schema_client(wsdl_file))
+    client.transport = transport
+    client.plugins = plugin
+    # Responses are parsed with lxml's limits on text size and nesting
+    # depth unless the cluster is known to need them lifted
+    client.settings = Settings(strict=False, xml_huge_tree=xml_huge_tree)
+
+    # Return the ServiceProxy object, validating payloads before sending
+    return AXLService(client.create_service(
+        '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
+        f'https://{address}:8443/axl/'), validate=validate, coalesce=coalesce,
+        address=address, project=project, page_size=page_size)
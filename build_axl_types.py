@@ -0,0 +1,108 @@
+"""Generate axl_types.py from the schema files.
+
+Compiling AXLEnums.xsd and AXLSoap.xsd takes a few hundred milliseconds, so
+the enum sets and type metadata used by validation.py are written out once
+as Python literals. Importing the generated module is then a matter of
+loading its bytecode. Run this again whenever the files in schema/ change:
+
+    python build_axl_types.py
+    python build_axl_types.py --check   # exit 1 if axl_types.py is stale
+"""
+import hashlib
+import os
+import py_compile
+import sys
+
+from validation import ENUMS_FILE, SOAP_FILE, _compile_enums, compile_schema
+
+OUTPUT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           'axl_types.py')
+
+
+def schema_digest() -> str:
+    digest = hashlib.sha1()
+    for path in (ENUMS_FILE, SOAP_FILE):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def literal(value) -> str:
+    """repr() with frozensets sorted, so the output is reproducible."""
+    if isinstance(value, frozenset):
+        return f'frozenset({{{", ".join(sorted(map(repr, value)))}}})' \
+            if value else 'frozenset()'
+    if isinstance(value, tuple):
+        items = ', '.join(literal(item) for item in value)
+        return f'({items},)' if len(value) == 1 else f'({items})'
+    return repr(value)
+
+
+def render() -> str:
+    simple_types, complex_types, operations = compile_schema()
+    enums = _compile_enums(ENUMS_FILE)
+    lines = [
+        '"""AXL schema lookup tables, generated by build_axl_types.py from',
+        'schema/AXLEnums.xsd and schema/AXLSoap.xsd. Do not edit."""',
+        f'SCHEMA_DIGEST = {schema_digest()!r}',
+        '',
+        '# Enum type -> allowed values',
+        'ENUMS = {',
+    ]
+    lines += [f'    {name!r}: {literal(enums[name])},' for name in sorted(enums)]
+    lines += [
+        '}',
+        '',
+        '# Simple type -> ("any",) | ("union", specs) |',
+        '#     ("restriction", base, values, pattern, max length, min, max)',
+        'SIMPLE_TYPES = {',
+    ]
+    for name in sorted(simple_types):
+        spec = literal(simple_types[name])
+        if name in enums:
+            # Share the value set with ENUMS rather than repeating it
+            spec = spec.replace(literal(enums[name]), f'ENUMS[{name!r}]', 1)
+        lines.append(f'    {name!r}: {spec},')
+    lines += [
+        '}',
+        '',
+        '# Complex type -> (fields as (name, type, flags), attributes,',
+        '#     simple content base, accepts any element)',
+        'COMPLEX_TYPES = {',
+    ]
+    lines += [f'    {name!r}: {literal(complex_types[name])},'
+              for name in sorted(complex_types)]
+    lines += [
+        '}',
+        '',
+        '# Operation -> request type',
+        'OPERATIONS = {',
+    ]
+    lines += [f'    {name!r}: {operations[name]!r},'
+              for name in sorted(operations)]
+    lines += ['}', '']
+    return '\n'.join(lines)
+
+
+def main():
+    source = render()
+    if '--check' in sys.argv[1:]:
+        try:
+            with open(OUTPUT_FILE) as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            print(f'{OUTPUT_FILE} is out of date, run build_axl_types.py')
+            sys.exit(1)
+        return
+
+    with open(OUTPUT_FILE, 'w') as f:
+        f.write(source)
+    # Write the bytecode now so the first import is fast too
+    py_compile.compile(OUTPUT_FILE)
+    print(f'Wrote {OUTPUT_FILE} ({len(source) // 1024} KB)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""On-disk cache of each cluster's version and the schema to use with it.
+
+Probing getCCMVersion() costs a full AXL round trip, so the result is kept
+per cluster address for CACHE_TTL seconds and only refreshed when it expires
+or the cluster answers with a Fault that points at a version mismatch.
+"""
+import json
+import os
+import re
+import time
+from typing import Optional
+
+CACHE_DIR = os.environ.get(
+    'UCAUTOMATION_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'ucautomation'))
+CACHE_TTL = int(os.environ.get('UCAUTOMATION_CACHE_TTL', 24 * 60 * 60))
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema')
+DEFAULT_WSDL = os.path.join(SCHEMA_DIR, 'AXLAPI.wsdl')
+
+# Faults like these mean the cached version no longer matches the cluster
+VERSION_FAULT = re.compile(r'version|not supported|unknown operation',
+                           re.IGNORECASE)
+
+
+def _path(address: str) -> str:
+    return os.path.join(CACHE_DIR, f'capabilities-{address}.json')
+
+
+def load_capabilities(address: str, ttl: int = CACHE_TTL) -> Optional[dict]:
+    """The cached record for address, or None if missing or expired."""
+    try:
+        with open(_path(address)) as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - record.get('fetched', 0) > ttl:
+        return None
+    return record
+
+
+def capabilities_record(address: str, version: str) -> dict:
+    major_minor = '.'.join(version.split('.')[:2])
+    return {
+        'address': address,
+        'version': version,
+        'schema_version': major_minor,
+        'wsdl': schema_wsdl(major_minor),
+        'fetched': time.time(),
+    }
+
+
+def save_capabilities(address: str, version: str) -> dict:
+    record = capabilities_record(address, version)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    # Write then rename so concurrent runs never read a partial file
+    tmp = f'{_path(address)}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(record, f, indent=2)
+    os.replace(tmp, _path(address))
+    return record
+
+
+def forget_capabilities(address: str):
+    try:
+        os.remove(_path(address))
+    except FileNotFoundError:
+        pass
+
+
+def schema_wsdl(schema_version: str) -> str:
+    """WSDL matching a cluster's AXL version, if schema/<version>/ holds one,
+    otherwise the default schema shipped in schema/."""
+    candidate = os.path.join(SCHEMA_DIR, schema_version, 'AXLAPI.wsdl')
+    return candidate if os.path.exists(candidate) else DEFAULT_WSDL
+
+
+def is_version_fault(err: Exception) -> bool:
+    return bool(VERSION_FAULT.search(str(err)))
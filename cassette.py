@@ -0,0 +1,98 @@
+"""Recorded AXL traffic, to re-run commands without a cluster.
+
+A cassette holds every request/response exchange of a run along with how
+long the cluster took to answer, gzipped JSON lines on disk. Replaying it
+serves the same responses, at the recorded latency or a multiple of it, so
+a command such as add-full-site can be re-timed offline and the client's
+own CPU cost compared between commits.
+
+Requests are matched on the cluster address, SOAPAction and a digest of the
+request body. A request made several times (a get before and after an
+update) is answered with its recorded responses in order, the last one
+repeating once they run out. A response abandoned for being too large is
+recorded as such, so replaying it falls back to paging in the same way.
+"""
+import gzip
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, Tuple
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMiss(Exception):
+    """The replayed run made a request the recorded run did not."""
+
+
+def _key(address: str, headers: dict, message) -> Tuple[str, str, str]:
+    if isinstance(message, str):
+        message = message.encode('utf-8')
+    action = headers.get('SOAPAction', '')
+    return address, action, hashlib.sha1(message).hexdigest()
+
+
+class Cassette:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._exchanges = []
+        self._queues: Dict[tuple, deque] = defaultdict(deque)
+        self._last = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'Cassette':
+        cassette = cls(path)
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            header = json.loads(next(f))
+            if header.get('version') != CASSETTE_VERSION:
+                raise ValueError(f'{path}: unsupported cassette version '
+                                 f'{header.get("version")}')
+            for line in f:
+                exchange = json.loads(line)
+                key = (exchange['address'], exchange['action'],
+                       exchange['request'])
+                cassette._queues[key].append(exchange)
+                cassette._exchanges.append(exchange)
+        return cassette
+
+    def add(self, address: str, headers: dict, message, status: int,
+            content_type: str, body: bytes, elapsed: float,
+            oversize: int = None):
+        """Record an exchange. oversize is the size read from a response
+        abandoned for being too large, recorded without its body."""
+        address, action, digest = _key(address, headers, message)
+        exchange = {
+            'address': address, 'action': action, 'request': digest,
+            'status': status, 'content_type': content_type,
+            'body': body.decode('utf-8', errors='replace'),
+            'elapsed': round(elapsed, 6)}
+        if oversize is not None:
+            exchange['oversize'] = oversize
+        with self._lock:
+            self._exchanges.append(exchange)
+
+    def take(self, address: str, headers: dict, message) -> dict:
+        """The recorded exchange answering this request."""
+        key = _key(address, headers, message)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            if key not in self._last:
+                raise CassetteMiss(
+                    f'{key[1] or "request"} to {address} was not recorded '
+                    f'in {self.path}')
+            return self._last[key]
+
+    def save(self):
+        with self._lock:
+            exchanges = list(self._exchanges)
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            f.write(json.dumps({'version': CASSETTE_VERSION,
+                                'recorded': time.time(),
+                                'exchanges': len(exchanges)}) + '\n')
+            for exchange in exchanges:
+                f.write(json.dumps(exchange) + '\n')
@@ -0,0 +1,103 @@
+"""Cluster inventory and running a command against many clusters at once.
+
+The inventory is a JSON file listing each cluster, for example:
+
+    {"clusters": [
+        {"name": "lab", "address": "10.10.20.1",
+         "username_env": "LAB_USERNAME", "password_env": "LAB_PASSWORD",
+         "rate_limit": 5, "max_connections": 4}
+    ]}
+
+username_env/password_env name the environment variables holding the
+base64 encoded credentials, rate_limit is in requests per second.
+compress_requests gzips request bodies, falling back to plain ones if the
+cluster refuses the first.
+max_response_bytes caps the size of a response body; list requests over it
+are fetched page_size rows at a time. xml_huge_tree lifts lxml's limits on
+text size and nesting depth when parsing responses.
+"""
+import contextvars
+import fnmatch
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+INVENTORY_FILE = os.environ.get('UCAUTOMATION_CLUSTERS', 'clusters.json')
+
+CLUSTER_DEFAULTS = {
+    'username_env': 'LAB_USERNAME',
+    'password_env': 'LAB_PASSWORD',
+    'rate_limit': None,
+    'max_connections': 10,
+    'compress_requests': False,
+    'xml_huge_tree': False,
+    'max_response_bytes': 64 * 1024 * 1024,
+    'page_size': 1000,
+}
+
+
+def load_inventory(path: str = INVENTORY_FILE) -> List[dict]:
+    with open(path) as f:
+        clusters = json.load(f)['clusters']
+    for cluster in clusters:
+        if 'name' not in cluster or 'address' not in cluster:
+            raise ValueError(f'{path}: every cluster needs a name and address')
+    return [{**CLUSTER_DEFAULTS, **cluster} for cluster in clusters]
+
+
+def select_clusters(clusters: List[dict], patterns: List[str]) -> List[dict]:
+    return [c for c in clusters
+            if any(fnmatch.fnmatch(c['name'], p) for p in patterns)]
+
+
+class ThreadOutput(io.TextIOBase):
+    """sys.stdout replacement sending each fan-out task's prints to its own
+    buffer, so the output of every cluster can be shown separately.
+
+    The buffer is a context variable, so threads a command starts with
+    workerpool.thread_map print into its cluster's buffer too."""
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffer = contextvars.ContextVar('output_buffer', default=None)
+
+    def capture(self) -> io.StringIO:
+        buffer = io.StringIO()
+        self._buffer.set(buffer)
+        return buffer
+
+    def write(self, text: str) -> int:
+        return (self._buffer.get() or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+
+def fan_out(clusters: List[dict], run: Callable[[dict], int],
+            workers: int = None) -> Dict[str, dict]:
+    """Call run(cluster) for every cluster in parallel, collecting each
+    cluster's exit code, duration, output and exception."""
+    output = ThreadOutput(sys.stdout)
+
+    def task(cluster: dict) -> dict:
+        buffer = output.capture()
+        start = time.perf_counter()
+        result = {'code': 0, 'error': None}
+        try:
+            result['code'] = run(cluster) or 0
+        except Exception as err:
+            result.update(code=1, error=f'{type(err).__name__}: {err}')
+        result['duration'] = time.perf_counter() - start
+        result['output'] = buffer.getvalue()
+        return result
+
+    previous, sys.stdout = sys.stdout, output
+    try:
+        with ThreadPoolExecutor(max_workers=workers or len(clusters)) as pool:
+            results = list(pool.map(task, clusters))
+    finally:
+        sys.stdout = previous
+    return {c['name']: r for c, r in zip(clusters, results)}
@@ -0,0 +1,111 @@
+"""Offline analysis of the dial plan: which partitions each CSS can reach.
+
+Every CSS is stored as a bitset (a Python int) over an index of partitions,
+and every partition as a bitset over the index of CSSes. A reachability or
+"which CSSes include partition X" query is then a single AND/bit test
+instead of a walk over each CSS object, so the whole cluster can be checked
+on every change.
+"""
+import fnmatch
+import json
+from typing import Dict, Iterable, List
+
+
+class CssIndex:
+    def __init__(self, memberships: Dict[str, List[str]]):
+        # memberships maps a CSS name to its ordered list of partition names
+        self.css_names = sorted(memberships)
+        self.partition_names = sorted(
+            {pt for members in memberships.values() for pt in members})
+
+        self._css_pos = {name: i for i, name in enumerate(self.css_names)}
+        self._pt_pos = {name: i for i, name in
+                        enumerate(self.partition_names)}
+
+        # Row bitsets: CSS -> partitions, column bitsets: partition -> CSSes
+        self._rows = [0] * len(self.css_names)
+        self._cols = [0] * len(self.partition_names)
+        for css, members in memberships.items():
+            c = self._css_pos[css]
+            for pt in members:
+                p = self._pt_pos[pt]
+                self._rows[c] |= 1 << p
+                self._cols[p] |= 1 << c
+
+    @classmethod
+    def from_clauses(cls, rows: Iterable[dict]) -> 'CssIndex':
+        """Build the index from listCss rows returning 'name' and 'clause'.
+
+        AXL does not return CSS members from listCss, but the read-only
+        'clause' field holds the same ordered partition list separated by
+        colons, so one list request covers the whole cluster."""
+        return cls({row['name']: [pt for pt in (row['clause'] or '').split(':')
+                                  if pt]
+                    for row in rows})
+
+    @classmethod
+    def load(cls, path: str) -> 'CssIndex':
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def dump(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.memberships(), f, indent=2, sort_keys=True)
+
+    def memberships(self) -> Dict[str, List[str]]:
+        return {css: self._names(self._rows[i], self.partition_names)
+                for i, css in enumerate(self.css_names)}
+
+    @staticmethod
+    def _names(bits: int, names: List[str]) -> List[str]:
+        found = []
+        while bits:
+            low = bits & -bits
+            found.append(names[low.bit_length() - 1])
+            bits ^= low
+        return found
+
+    def _partition_mask(self, partitions: Iterable[str]) -> int:
+        mask = 0
+        for pt in partitions:
+            if pt in self._pt_pos:
+                mask |= 1 << self._pt_pos[pt]
+        return mask
+
+    def _css_mask(self, patterns: Iterable[str]) -> int:
+        mask = 0
+        for pattern in patterns:
+            for css in fnmatch.filter(self.css_names, pattern):
+                mask |= 1 << self._css_pos[css]
+        return mask
+
+    def css_including(self, *partitions: str) -> List[str]:
+        """CSSes which include any of the given partitions."""
+        mask = 0
+        for pt in partitions:
+            if pt in self._pt_pos:
+                mask |= self._cols[self._pt_pos[pt]]
+        return self._names(mask, self.css_names)
+
+    def reachability(self, css_patterns: Iterable[str],
+                     partitions: Iterable[str]) -> Dict[str, List[str]]:
+        """For every CSS matching css_patterns, which of partitions it reaches."""
+        wanted = self._partition_mask(partitions)
+        selected = self._css_mask(css_patterns)
+        return {css: self._names(self._rows[i] & wanted, self.partition_names)
+                for css, i in self._css_pos.items() if selected >> i & 1}
+
+    def violations(self, partition: str,
+                   allowed: Iterable[str]) -> List[str]:
+        """CSSes reaching partition which do not match any allowed pattern."""
+        if partition not in self._pt_pos:
+            return []
+        offending = self._cols[self._pt_pos[partition]] & ~self._css_mask(
+            allowed)
+        return self._names(offending, self.css_names)
+
+
+# Per standard, only these CSSes may reach the long distance partition
+TOLL_FRAUD_RULES = {
+    'Centralized-LD-PT': ['Centralized-LD-CSS', '*-LD-Forwarding-CSS'],
+}
@@ -1,64 +1,258 @@
 import base64
+import contextvars
+import csv
+import fnmatch
+import importlib
+import json
 import os
+import re
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
 import typer
-import urllib3
-from dotenv import load_dotenv
-from lxml import etree
-from requests import Session
-from requests.auth import HTTPBasicAuth
-from zeep import Client, Settings, Plugin, xsd
-from zeep.transports import Transport
-from zeep.exceptions import Fault
-
-# The WSDL is a local file which contains the CUCM Schema
-WSDL_FILE = 'schema/AXLAPI.wsdl'
-CUCM_ADDRESS = '10.10.20.1'
-
-app = typer.Typer()
-
-
-# This class lets you view the incoming and outgoing http headers and/or XML
-class MyLoggingPlugin(Plugin):
-    def egress(self, envelope, http_headers, operation, binding_options):
-        # Format the request body as pretty printed XML
-        xml = etree.tostring(envelope, pretty_print=True, encoding='unicode')
-
-        print(f'\nRequest\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}')
-
-    def ingress(self, envelope, http_headers, operation):
-        # Format the response body as pretty printed XML
-        xml = etree.tostring(envelope, pretty_print=True, encoding='unicode')
 
-        print(f'\nResponse\n-------\nHeaders:\n{http_headers}\n\nBody:\n{xml}')
+from capabilities import (DEFAULT_WSDL, capabilities_record,
+                          forget_capabilities, is_version_fault,
+                          load_capabilities, save_capabilities, schema_wsdl)
+from cassette import Cassette
+from clusters import (CLUSTER_DEFAULTS, INVENTORY_FILE, fan_out,
+                      load_inventory, select_clusters)
+from dialplan import CssIndex, TOLL_FRAUD_RULES
+from profiling import SamplingProfiler, operation_times
+from results import current_log, start_log
+from schedules import ScheduleSet
+from workerpool import process_map, thread_map
 
+CUCM_ADDRESS = '10.10.20.1'
+# Every site's route group falls back to this trunk at the hub
+HUB_TRUNK = 'Markham-GW-Trunk'
 
-def connect_to_cucm(username: str, password: str) -> Client.service:
-    # Change to true to enable output of request/response headers and XML
-    debug = False
-
-    session = Session()
-    session.verify = False
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    session.auth = HTTPBasicAuth(username, password)
+# Modules which must not be imported until a command talks to <uc>
+HEAVY_MODULES = ['zeep', 'lxml', 'requests', 'urllib3', 'dotenv']
 
-    # Create a Zeep transport and set a reasonable timeout value
-    transport = Transport(session=session, timeout=10)
+# Set by --verbose: print every AXL response as it arrives
+VERBOSE = False
 
-    # strict=False is not always necessary, but it allows zeep to parse imperfect XML
-    settings = Settings(strict=False, xml_huge_tree=True)
+# Set by --record/--replay: the cassette every client records to or
+# replays from
+TRANSPORT_OPTIONS = {}
 
-    # If debug output is requested, add the MyLoggingPlugin callback
-    plugin = [MyLoggingPlugin()] if debug else []
+app = typer.Typer()
 
-    # Create the Zeep client with the specified settings
-    client = Client(WSDL_FILE, settings=settings, transport=transport,
-                    plugins=plugin)
 
-    # Return the ServiceProxy object
-    return client.create_service(
-        '{http://www.cisco.com/AXLAPIService/}AXLAPIBinding',
-        f'https://{CUCM_ADDRESS}:8443/axl/')
+@app.callback()
+def main(ctx: typer.Context,
+         verbose: bool = typer.Option(
+             False, help='Print every AXL response'),
+         results: Optional[str] = typer.Option(
+             None, help='Write every AXL operation as JSON lines to this '
+                        'file, or - for stdout'),
+         summary: bool = typer.Option(
+             True, help='Print a table of the AXL operations at the end'),
+         profile: Optional[str] = typer.Option(
+             None, help='Sample the command\'s stacks into this file: '
+                        'speedscope JSON if it ends with .json, else '
+                        'collapsed stacks for flame graphs'),
+         profile_interval: float = typer.Option(
+             0.005, help='Seconds between profile samples'),
+         record: Optional[str] = typer.Option(
+             None, help='Record the AXL traffic into this cassette file'),
+         replay: Optional[str] = typer.Option(
+             None, help='Answer AXL requests from this cassette file '
+                        'instead of <uc>'),
+         replay_latency: float = typer.Option(
+             1.0, help='Multiple of the recorded latency to replay at, '
+                       '0 to answer at once'),
+         trace_memory: bool = typer.Option(
+             False, help='Measure the memory taken by parsing each AXL '
+                         'response, shown in the summary. Measured process '
+                         'wide, so approximate when requests run '
+                         'concurrently')):
+    """Automation for a Cisco Unified Communications environment."""
+    global VERBOSE
+    VERBOSE = verbose
+    log = start_log()
+    # Under fanout, each cluster's run keeps the cassette of the whole run
+    if record or replay:
+        if record and replay:
+            raise typer.BadParameter('--record and --replay are exclusive')
+        TRANSPORT_OPTIONS.clear()
+        # Learnt projections would change the requests between runs
+        TRANSPORT_OPTIONS['project'] = False
+        if replay:
+            TRANSPORT_OPTIONS.update(replay=Cassette.load(replay),
+                                     replay_latency=replay_latency)
+        else:
+            TRANSPORT_OPTIONS['record'] = Cassette(record)
+            ctx.call_on_close(TRANSPORT_OPTIONS['record'].save)
+    profiler = None
+    if profile:
+        profiler = SamplingProfiler(profile_interval)
+        profiler.start()
+    # Under fanout the outer run traces for every cluster
+    tracing = trace_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+
+    def finish():
+        if tracing:
+            tracemalloc.stop()
+        if profiler:
+            profiler.stop()
+            profiler.write(profile)
+            print(f'\n{sum(profiler.samples.values())} samples over '
+                  f'{profiler.duration:.1f}s written to {profile}')
+            if log.results:
+                print('\n' + operation_times(log.results))
+        if not log.results:
+            return
+        if results == '-':
+            log.write_jsonl(sys.stdout)
+        elif results:
+            with open(results, 'w') as f:
+                log.write_jsonl(f)
+        if summary:
+            print('\n' + log.summary())
+    ctx.call_on_close(finish)
+
+
+def report(message: str, *responses):
+    """Print a progress message and responses only with --verbose, so
+    responses are not even formatted otherwise."""
+    if VERBOSE:
+        print(message, *responses, sep='\n ')
+
+
+class LazyModule:
+    """Stands in for a module which is imported on first attribute access."""
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr: str):
+        return getattr(importlib.import_module(self._name), attr)
+
+
+xsd = LazyModule('zeep.xsd')
+
+
+class Fault(Exception):
+    """Placeholder for zeep.exceptions.Fault until zeep is imported.
+
+    Nothing can raise a Fault before the client exists, and connect_to_cucm()
+    rebinds this name to zeep's Fault, so 'except Fault' keeps working."""
+
+
+def connect_to_cucm(username: str, password: str, validate: bool = True,
+                    address: str = CUCM_ADDRESS,
+                    wsdl_file: str = DEFAULT_WSDL, **transport_options):
+    global Fault
+    from axlclient import Fault, connect
+    return connect(username, password, address, validate=validate,
+                   wsdl_file=wsdl_file, **transport_options)
+
+
+class LazyClient:
+    """The AXL client, created on first use so that commands which never
+    talk to <uc> do not import zeep or touch the network.
+
+    The cluster version comes from the capabilities cache, so getCCMVersion()
+    is only called when the cached record has expired, or after a Fault
+    suggesting the cluster was upgraded."""
+    def __init__(self, cluster: dict = None):
+        self.cluster = cluster or {**CLUSTER_DEFAULTS, 'name': 'default',
+                                   'address': CUCM_ADDRESS}
+        self.address = self.cluster['address']
+        self.capabilities = None
+        # The WSDL the connected client was built from
+        self.wsdl = None
+        self._service = None
+        self._credentials = None
+        self._lock = threading.Lock()
+
+    def ensure_connected(self):
+        # Concurrent site tasks must not each open their own client
+        with self._lock:
+            if self._service is None:
+                self._connect()
+
+    def _connect(self):
+        from dotenv import load_dotenv
+        load_dotenv()
+        # A replayed run needs no credentials
+        default = '' if 'replay' in TRANSPORT_OPTIONS else None
+        self._credentials = (
+            base64.b64decode(os.getenv(self.cluster['username_env'], default)
+                             ).decode("utf-8"),
+            base64.b64decode(os.getenv(self.cluster['password_env'], default)
+                             ).decode("utf-8")
+        )
+        # Recorded and replayed runs always probe the version, so that a
+        # replay makes the same requests whatever the local cache holds
+        record = None if self.cassette_mode() \
+            else load_capabilities(self.address)
+        wsdl = schema_wsdl(record['schema_version']) if record \
+            else DEFAULT_WSDL
+        self._service = self._connect_with(wsdl)
+        self.capabilities = record or self.refresh()
+
+    @staticmethod
+    def cassette_mode() -> bool:
+        return 'record' in TRANSPORT_OPTIONS or 'replay' in TRANSPORT_OPTIONS
+
+    def _connect_with(self, wsdl: str):
+        # Every inventory setting but the credentials configures the client
+        options = {key: self.cluster[key] for key in CLUSTER_DEFAULTS
+                   if not key.endswith('_env')}
+        self.wsdl = wsdl
+        return connect_to_cucm(*self._credentials, address=self.address,
+                               wsdl_file=wsdl, **options, **TRANSPORT_OPTIONS)
+
+    def refresh(self) -> dict:
+        """Probe the cluster version and update the capabilities cache,
+        switching schema if the version calls for a different one."""
+        version = self._service.getCCMVersion()['return'][
+            'componentVersion']['version']
+        record = capabilities_record(self.address, version) \
+            if self.cassette_mode() else save_capabilities(self.address,
+                                                           version)
+        self.capabilities = record
+        if self._credentials and record['wsdl'] != self.wsdl:
+            self._service = self._connect_with(record['wsdl'])
+        return record
+
+    def __getattr__(self, operation: str):
+        self.ensure_connected()
+        method = getattr(self._service, operation)
+
+        def call(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except Fault as err:
+                if is_version_fault(err):
+                    forget_capabilities(self.address)
+                    try:
+                        self.refresh()
+                    except Fault:
+                        pass
+                raise
+        return call
+
+
+class CurrentClient:
+    """Delegates to the client of the cluster the running command targets:
+    the default cluster, or each cluster in turn under fanout."""
+    def __getattr__(self, attr: str):
+        return getattr(_current_client.get(default_client), attr)
+
+
+default_client = LazyClient()
+_current_client = contextvars.ContextVar('current_client')
+cucm = CurrentClient()
 
 
 @app.command()
@@ -175,10 +369,10 @@ def prep_env():
             'connectCallBeforePlayingAnnouncement': 'false',
         }
 
-        print('\naddSipProfile response:\n')
+        report('\naddSipProfile response:\n')
         try:
             resp = cucm.addSipProfile(sip)
-            print(f'SipProfile successfully added:\n {resp}')
+            report('SipProfile successfully added:', resp)
         except Fault as err:
             print(f'Error: addSipProfile: {err}')
 
@@ -193,10 +387,10 @@ def prep_env():
             'useOriginatingDeviceTimeZone': 'true',
             'timeZone': 'Etc/GMT'
         }
-        print('\naddPartition response:\n')
+        report('\naddPartition response:\n')
         try:
             resp = cucm.addRoutePartition(partition)
-            print(f'Partition successfully added:\n {resp}')
+            report('Partition successfully added:', resp)
         except Fault as err:
             print(f'Error: addPartition: {err}')
 
@@ -228,10 +422,10 @@ def prep_env():
             'name': 'MarkhamGW-Trunk-Incoming-CSS',
         }
 
-        print('\naddCSS response:\n')
+        report('\naddCSS response:\n')
         try:
             resp = cucm.addCss(css)
-            print(f'CSS successfully added:\n {resp}')
+            report('CSS successfully added:', resp)
         except Fault as err:
             print(f'Error: addCSS: {err}')
 
@@ -251,10 +445,10 @@ def prep_env():
             'name': 'Incoming-ANI-E164-CSS',
         }
 
-        print('\naddCSS response:\n')
+        report('\naddCSS response:\n')
         try:
             resp = cucm.addCss(css)
-            print(f'CSS successfully added:\n {resp}')
+            report('CSS successfully added:', resp)
         except Fault as err:
             print(f'Error: addCSS: {err}')
 
@@ -292,10 +486,10 @@ def prep_env():
             'name': 'Centralized-LD-CSS',
         }
 
-        print('\naddCSS response:\n')
+        report('\naddCSS response:\n')
         try:
             resp = cucm.addCss(css)
-            print(f'CSS successfully added:\n {resp}')
+            report('CSS successfully added:', resp)
         except Fault as err:
             print(f'Error: addCSS: {err}')
 
@@ -330,10 +524,10 @@ def prep_env():
             "networkLocale": None,
         }
 
-        print('\naddDevicePool response:\n')
+        report('\naddDevicePool response:\n')
         try:
             resp = cucm.addDevicePool(dp)
-            print(f'Device Pool successfully added:\n {resp}')
+            report('Device Pool successfully added:', resp)
         except Fault as err:
             print(f'Error: addDevicePool: {err}')
 
@@ -372,10 +566,10 @@ def prep_env():
             }
         )
 
-        print('\nadd SIP Trunk response:\n')
+        report('\nadd SIP Trunk response:\n')
         try:
             resp = cucm.addSipTrunk(sip_trunk_data)
-            print(f'SIP Trunk successfully added:\n {resp}')
+            report('SIP Trunk successfully added:', resp)
         except Fault as err:
             print(f'Error: add SIP Trunk: {err}')
 
@@ -437,14 +631,41 @@ def add_location(name: str):
     location['relatedLocations']['relatedLocation'].append(related_location)
     location['betweenLocations']['betweenLocation'].append(between_location)
 
-    print('\naddLocation response:\n')
+    report('\naddLocation response:\n')
     try:
         resp = cucm.addLocation(location)
-        print(f'Location successfully added:\n {resp}')
+        report('Location successfully added:', resp)
     except Fault as err:
         print(f'Error: addLocation: {err}')
 
 
+def related_region(region: str) -> dict:
+    """The standard relationship of a site's region with region: 64 kbps,
+    except 8 kbps with 'G729-Region'."""
+    return {
+        'regionName': region,
+        # Per standard, this specific region is set to a different bandwidth
+        'bandwidth': '8 kbps' if region == 'G729-Region' else '64 kbps',
+        'videoBandwidth': -2,
+        'lossyNetwork': 'Use System Default',
+        'codecPreference': {
+            '_value_1': 'Use System Default',
+            'uuid': ''
+        },
+        'immersiveVideoBandwidth': -2,
+    }
+
+
+def region_payload(name: str, regions: List[str]) -> dict:
+    """The site's region, related to every region in regions."""
+    return {
+        'name': f'{name}-Region',
+        'relatedRegions': {
+            'relatedRegion': [related_region(region) for region in regions]
+        }
+    }
+
+
 def add_region(name: str):
     """Tested in sandbox to be creating a region in the same fashion as exists in
     production.
@@ -453,14 +674,6 @@ def add_region(name: str):
     at other regions in the environment. The related region, 'G729-Region',
     sets the maximum audio bit rate to 8 kbps, as per the standard found in
     production."""
-    # Create a region
-    new_region = {
-        'name': f'{name}-Region',
-        'relatedRegions': {
-            'relatedRegion': []
-        }
-    }
-
     # List of all regions
     all_regions = [region['name'] for region in
                    cucm.listRegion(
@@ -468,31 +681,14 @@ def add_region(name: str):
                        returnedTags={'name': xsd.Nil}
                    )['return']['region']]
 
-    # Create a relatedRegion sub object per each region in all_regions
-    for region in all_regions:
-        related_region = {
-            'regionName': region,
-            'bandwidth': '64 kbps',
-            'videoBandwidth': -2,
-            'lossyNetwork': 'Use System Default',
-            'codecPreference': {
-                '_value_1': 'Use System Default',
-                'uuid': ''
-            },
-            'immersiveVideoBandwidth': -2,
-        }
-        # Per standard, this specific region is set to a different bandwidth
-        if region == 'G729-Region':
-            related_region['bandwidth'] = '8 kbps'
-
-        # Add the relatedRegion to the region.relatedRegions array
-        new_region['relatedRegions']['relatedRegion'].append(related_region)
+    # Create the region with a relatedRegion per each region in all_regions
+    new_region = region_payload(name, all_regions)
 
     # Execute the addRegion request
-    print('\naddRegion response:\n')
+    report('\naddRegion response:\n')
     try:
         resp = cucm.addRegion(new_region)
-        print(f'Region successfully added:\n {resp}')
+        report('Region successfully added:', resp)
     except Fault as err:
         print(f'Error: addRegion: {err}')
 
@@ -514,10 +710,10 @@ def add_srst(name: str, ip: str):
         'isSecure': 'false',
     }
     # Execute the addRegion request
-    print('\naddSRST response:\n')
+    report('\naddSRST response:\n')
     try:
         resp = cucm.addSrst(srst)
-        print(f'SRST successfully added:\n {resp}')
+        report('SRST successfully added:', resp)
     except Fault as err:
         print(f'Error: addRegion: {err}')
 
@@ -563,14 +759,14 @@ def add_algo_time_period(name: str, open_time: str, close_time: str):
         'monthOfYearEnd': 'None',
     }
 
-    print('\nadd Time Period response:\n')
+    report('\nadd Time Period response:\n')
     try:
         resp = cucm.addTimePeriod(time_period1)
-        print(f'Time Period 1 successfully added:\n {resp}')
+        report('Time Period 1 successfully added:', resp)
         resp = cucm.addTimePeriod(time_period2)
-        print(f'Time Period 2 successfully added:\n {resp}')
+        report('Time Period 2 successfully added:', resp)
         resp = cucm.addTimePeriod(time_period3)
-        print(f'Time Period 3 successfully added:\n {resp}')
+        report('Time Period 3 successfully added:', resp)
     except Fault as err:
         print(f'Error: add Time Period: {err}')
 
@@ -589,17 +785,17 @@ def add_algo_time_schedule(name: str, open_time: str, close_time: str):
         'members': {'member': [{'timePeriodName': f'{name}-Algo-OpenMS'}]}
     }
 
-    print('\nadd Time Schedule response:\n')
+    report('\nadd Time Schedule response:\n')
     try:
         resp = cucm.addTimeSchedule(time_schedule_closed)
-        print(f'Time Schedule Closed successfully added:\n {resp}')
+        report('Time Schedule Closed successfully added:', resp)
         resp = cucm.addTimeSchedule(time_schedule_open)
-        print(f'Time Schedule Open successfully added:\n {resp}')
+        report('Time Schedule Open successfully added:', resp)
     except Fault as err:
         print(f'Error: add Time Schedule: {err}')
 
 
-def add_SIP_trunk(name: str, ip: str):
+def sip_trunk_payload(name: str, ip: str) -> dict:
     # Create an object with the new SIP trunk fields and data
     sip_trunk_data = {
         'name': f'{name}-GW',
@@ -626,52 +822,129 @@ def add_SIP_trunk(name: str, ip: str):
             'addressIpv4': f'{ip}', 'port': '5060', 'sortOrder': 1}
         }
     )
+    return sip_trunk_data
+
+
+def add_SIP_trunk(name: str, ip: str):
+    sip_trunk_data = sip_trunk_payload(name, ip)
 
-    print('\nadd SIP Trunk response:\n')
+    report('\nadd SIP Trunk response:\n')
     try:
         resp = cucm.addSipTrunk(sip_trunk_data)
-        print(f'SIP Trunk successfully added:\n {resp}')
+        report('SIP Trunk successfully added:', resp)
     except Fault as err:
         print(f'Error: add SIP Trunk: {err}')
 
 
-def add_route_group(name: str):
-    """Tested in sandbox to be creating a Route Group in the same fashion as exists in production.
-
-    Create a Route Group in <uc> environment called <name>, matching standards set at SRSTs in the environment.
-    IMPORTANT: This function assumes that the Trunk "<name>-GW" already exists!"""
-    rg = {
+def route_group_payload(name: str, site_trunk: str,
+                        hub_trunk: str = HUB_TRUNK) -> dict:
+    """The site's trunk first, then the hub trunk, in a Top Down group."""
+    return {
         'name': f'{name}-RG',
         'distributionAlgorithm': 'Top Down',
-        'members': {'member': []}
-    }
-    rg['members']['member'].extend(
-        [
+        'members': {'member': [
             {
-                'deviceName':
-                    cucm.getSipTrunk(name=f'{name}-GW')['return']['sipTrunk'][
-                        'name'],
+                'deviceName': site_trunk,
                 'deviceSelectionOrder': 1,
                 'port': '0'
             },
             {
-                'deviceName':
-                    cucm.getSipTrunk(name=f'Markham-GW-Trunk')['return'][
-                        'sipTrunk']['name'],
+                'deviceName': hub_trunk,
                 'deviceSelectionOrder': 2,
                 'port': '0'
             }
-        ]
-    )
-    print('\naddRouteGroup response:\n')
+        ]}
+    }
+
+
+def add_route_group(name: str):
+    """Tested in sandbox to be creating a Route Group in the same fashion as exists in production.
+
+    Create a Route Group in <uc> environment called <name>, matching standards set at SRSTs in the environment.
+    IMPORTANT: This function assumes that the Trunk "<name>-GW" already exists!"""
+    rg = route_group_payload(
+        name,
+        cucm.getSipTrunk(name=f'{name}-GW')['return']['sipTrunk']['name'],
+        cucm.getSipTrunk(name=HUB_TRUNK)['return']['sipTrunk']['name'])
+    report('\naddRouteGroup response:\n')
     try:
         resp = cucm.addRouteGroup(rg)
-        print(f'Route Group successfully added:\n {resp}')
+        report('Route Group successfully added:', resp)
     except Fault as err:
         print(f'Error: addRouteGroup: {err}')
 
 
-def add_device_pool(name: str):
+def list_rows(response, tag: str) -> list:
+    """Rows of a list* response, which is empty when nothing matched."""
+    result = response['return']
+    return (result[tag] if result else None) or []
+
+
+def build_trunks_and_route_groups(sites: List[dict], workers: int = 8
+                                  ) -> Dict[str, int]:
+    """Create every site's '<name>-GW' trunk and '<name>-RG' route group
+    (site trunk then hub trunk) in one batch.
+
+    Two list requests find the trunks and route groups which already exist,
+    only the existing route groups are read back to compare their members,
+    and just the missing trunks, missing route groups and route groups whose
+    members differ are written, in parallel within the cluster rate limit.
+    Existing trunks are left as they are."""
+    trunks = {row['name'] for row in list_rows(cucm.listSipTrunk(
+        searchCriteria={'name': '%'},
+        returnedTags={'name': xsd.Nil}), 'sipTrunk')}
+    if HUB_TRUNK not in trunks:
+        raise typer.BadParameter(f'The hub trunk {HUB_TRUNK} does not exist')
+    route_groups = {row['name'] for row in list_rows(cucm.listRouteGroup(
+        searchCriteria={'name': '%-RG'},
+        returnedTags={'name': xsd.Nil}), 'routeGroup')}
+
+    def members(payload: dict) -> list:
+        return [(m['deviceSelectionOrder'], m['deviceName'])
+                for m in payload['members']['member']]
+
+    def current_members(rg_name: str) -> list:
+        rg = cucm.getRouteGroup(name=rg_name)['return']['routeGroup']
+        found = rg['members']['member'] if rg['members'] else []
+        return sorted((int(m['deviceSelectionOrder']),
+                       m['deviceName']['_value_1']) for m in found)
+
+    counts = {'trunks added': 0, 'route groups added': 0,
+              'route groups updated': 0, 'unchanged': 0, 'failed': 0}
+    lock = threading.Lock()
+
+    def count(key: str):
+        with lock:
+            counts[key] += 1
+
+    def build(site: dict):
+        name = site['name']
+        try:
+            if f'{name}-GW' not in trunks:
+                cucm.addSipTrunk(sip_trunk_payload(name, site['srst_ip']))
+                count('trunks added')
+            rg = route_group_payload(name, f'{name}-GW')
+            if rg['name'] not in route_groups:
+                cucm.addRouteGroup(rg)
+                count('route groups added')
+            elif current_members(rg['name']) != members(rg):
+                cucm.updateRouteGroup(name=rg['name'],
+                                      distributionAlgorithm='Top Down',
+                                      members=rg['members'])
+                count('route groups updated')
+            else:
+                count('unchanged')
+        except Fault as err:
+            count('failed')
+            print(f'Error: {name}: {err}')
+
+    # In the caller's context, for its cluster's client and result log
+    thread_map(build, sites, workers)
+    return counts
+
+
+def device_pool_payloads(name: str) -> List[dict]:
+    """The site's device pool and its WebEx device pool."""
     dp = {
         "name": f'{name}-DP',
         "dateTimeSettingName": 'CMLocal',  # update to state timezone
@@ -711,11 +984,17 @@ def add_device_pool(name: str):
         'callingPartySubscriberPrefix': '+1',
     }
 
-    print('\naddDevicePool response:\n')
+    return [dp, dp_webex]
+
+
+def add_device_pool(name: str):
+    dp, dp_webex = device_pool_payloads(name)
+
+    report('\naddDevicePool response:\n')
     try:
         resp = cucm.addDevicePool(dp)
         resp_webex = cucm.addDevicePool(dp_webex)
-        print(f'Device Pool successfully added:\n {resp} \nand\n {resp_webex}')
+        report('Device Pool successfully added:', resp, 'and', resp_webex)
     except Fault as err:
         print(f'Error: addDevicePool: {err}')
 
@@ -767,27 +1046,28 @@ def add_default_partitions(name: str, gmt_value: int, sd: bool, pool: bool):
             'useOriginatingDeviceTimeZone': 'true',
             'timeZone': 'Etc/GMT'
         }
-    print('\nadd Partition response:\n')
+    report('\nadd Partition response:\n')
     try:
         resp = cucm.addRoutePartition(partition_closed)
-        print(f'Closed Partition successfully added:\n {resp}')
+        report('Closed Partition successfully added:', resp)
         resp = cucm.addRoutePartition(partition_open)
-        print(f'Open Partition successfully added:\n {resp}')
+        report('Open Partition successfully added:', resp)
         resp = cucm.addRoutePartition(partition_internal)
-        print(f'Internal Partition successfully added:\n {resp}')
+        report('Internal Partition successfully added:', resp)
         resp = cucm.addRoutePartition(partition_mi)
-        print(f'MI Partition successfully added:\n {resp}')
+        report('MI Partition successfully added:', resp)
         if sd:
             resp = cucm.addRoutePartition(partition_sd)
-            print(f'SD Partition successfully added:\n {resp}')
+            report('SD Partition successfully added:', resp)
         if pool:
             resp = cucm.addRoutePartition(partition_pool)
-            print(f'Pool Partition successfully added:\n {resp}')
+            report('Pool Partition successfully added:', resp)
     except Fault as err:
         print(f'Error: addPartition: {err}')
 
 
-def add_css(name: str, sd: bool, pool: bool):
+def css_payloads(name: str, sd: bool, pool: bool) -> List[dict]:
+    """The site's CSSes, their members in the standard order."""
     device_css = {
         'name': f'{name}-Device-CSS',
         'description': f'{name}-Device-CSS',
@@ -979,21 +1259,16 @@ def add_css(name: str, sd: bool, pool: bool):
             }
         }
 
-    print('\nadd CSS response:\n')
+    return [device_css, ld_forwarding_css, mi_css, mwi_css,
+            trunk_incoming_css] + ([pool_css] if pool else [])
+
+
+def add_css(name: str, sd: bool, pool: bool):
+    report('\nadd CSS response:\n')
     try:
-        resp = cucm.addCss(device_css)
-        print(f'{name} Device CSS successfully added:\n {resp}')
-        resp = cucm.addCss(ld_forwarding_css)
-        print(f'{name} LD ForwardingCSS successfully added:\n {resp}')
-        resp = cucm.addCss(mi_css)
-        print(f'{name} MI CSS successfully added:\n {resp}')
-        resp = cucm.addCss(mwi_css)
-        print(f'{name} MWI CSS successfully added:\n {resp}')
-        resp = cucm.addCss(trunk_incoming_css)
-        print(f'{name} Trunk Incoming CSS successfully added:\n {resp}')
-        if pool:
-            resp = cucm.addCss(pool_css)
-            print(f'Device Pool CSS successfully added:\n {resp}')
+        for css in css_payloads(name, sd, pool):
+            resp = cucm.addCss(css)
+            report(f'{css["name"]} successfully added:', resp)
     except Fault as err:
         print(f'Error: add CSS: {err}')
 
@@ -1016,13 +1291,566 @@ def add_full_site(name: str, srst_ip: str, algo_open: str = '06:00', algo_close:
     add_route_group(name)
 
 
-if __name__ == '__main__':
-    running = True
-    load_dotenv()
-    cucm = connect_to_cucm(
-        base64.b64decode(os.getenv('LAB_USERNAME')).decode("utf-8"),
-        base64.b64decode(os.getenv('LAB_PASSWORD')).decode("utf-8")
-    )
-    cucm.getCCMVersion()
+def load_css_index() -> CssIndex:
+    """Load every CSS and its partitions from <uc> with a single listCss."""
+    rows = list_rows(cucm.listCss(
+        searchCriteria={'name': '%'},
+        returnedTags={'name': xsd.Nil, 'clause': xsd.Nil}), 'css')
+    return CssIndex.from_clauses(rows)
+
+
+@app.command()
+def audit_css(snapshot: Optional[str] = typer.Option(
+                  None, help='Read memberships from a JSON snapshot instead of <uc>'),
+              save: Optional[str] = typer.Option(
+                  None, help='Write the memberships to a JSON snapshot'),
+              partition: Optional[List[str]] = typer.Option(
+                  None, help='List the CSSes which include this partition'),
+              css: Optional[List[str]] = typer.Option(
+                  None, help='List the partitions reached by the CSSes '
+                             'matching this pattern (only those given with '
+                             '--partition, if any)')):
+    """Check which partitions every CSS can reach.
+
+    Without --partition or --css, report CSSes that reach a restricted
+    partition (such as Centralized-LD-PT) without being allowed to by the
+    standard."""
+    index = CssIndex.load(snapshot) if snapshot else load_css_index()
+    if save:
+        index.dump(save)
+
+    print(f'{len(index.css_names)} CSSes, '
+          f'{len(index.partition_names)} partitions')
+    if css:
+        reached = index.reachability(css, partition or index.partition_names)
+        for name, partitions in reached.items():
+            print(f'\n{name} reaches {len(partitions)} partitions:')
+            for pt in partitions:
+                print(f'  {pt}')
+        return
+    if partition:
+        for pt in partition:
+            including = index.css_including(pt)
+            print(f'\n{pt} is included in {len(including)} CSSes:')
+            for css in including:
+                print(f'  {css}')
+        return
+
+    failed = False
+    for pt, allowed in TOLL_FRAUD_RULES.items():
+        for css in index.violations(pt, allowed):
+            failed = True
+            print(f'Violation: {css} reaches {pt}')
+    if failed:
+        raise typer.Exit(code=1)
+    print('No violations found')
+
+
+def export_schedules() -> dict:
+    """Read every time period, time schedule and scheduled partition from
+    <uc> in the format used by ScheduleSet.load."""
+    from zeep.helpers import serialize_object
+
+    def fk_name(value):
+        return value['_value_1'] if value else None
+
+    period_tags = ['name', 'startTime', 'endTime', 'startDay', 'endDay',
+                   'monthOfYear', 'dayOfMonth', 'monthOfYearEnd',
+                   'dayOfMonthEnd']
+    periods = list_rows(cucm.listTimePeriod(
+        searchCriteria={'name': '%'},
+        returnedTags={tag: xsd.Nil for tag in period_tags}), 'timePeriod')
+
+    # listTimeSchedule does not return the members, so get each schedule
+    schedules = {}
+    for row in list_rows(cucm.listTimeSchedule(
+            searchCriteria={'name': '%'},
+            returnedTags={'name': xsd.Nil}), 'timeSchedule'):
+        schedule = cucm.getTimeSchedule(name=row['name'])['return'][
+            'timeSchedule']
+        members = schedule['members']['member'] if schedule['members'] else []
+        schedules[row['name']] = [fk_name(m['timePeriodName'])
+                                  for m in members]
+
+    partitions = list_rows(cucm.listRoutePartition(
+        searchCriteria={'name': '%'},
+        returnedTags={'name': xsd.Nil, 'timeScheduleIdName': xsd.Nil,
+                      'useOriginatingDeviceTimeZone': xsd.Nil,
+                      'timeZone': xsd.Nil}), 'routePartition')
+
+    return {
+        'timePeriods': [{tag: serialize_object(p[tag]) for tag in period_tags}
+                        for p in periods],
+        'timeSchedules': schedules,
+        'partitions': [
+            {'name': p['name'],
+             'timeScheduleIdName': fk_name(p['timeScheduleIdName']),
+             'useOriginatingDeviceTimeZone': p['useOriginatingDeviceTimeZone'],
+             'timeZone': p['timeZone']}
+            for p in partitions if p['timeScheduleIdName']],
+    }
 
+
+@app.command()
+def check_schedules(snapshot: Optional[str] = typer.Option(
+                        None, help='Read schedules from a JSON snapshot instead of <uc>'),
+                    save: Optional[str] = typer.Option(
+                        None, help='Write the schedules to a JSON snapshot'),
+                    at: Optional[List[datetime]] = typer.Option(
+                        None, help='Show the partitions active at this UTC time')):
+    """Check every site's Algo Open/Closed schedules for gaps and overlaps,
+    and optionally which scheduled partitions are active at given times."""
+    if snapshot:
+        schedule_set = ScheduleSet.load(snapshot)
+    else:
+        data = export_schedules()
+        if save:
+            with open(save, 'w') as f:
+                json.dump(data, f, indent=2)
+        schedule_set = ScheduleSet(data['timePeriods'], data['timeSchedules'],
+                                   data['partitions'])
+
+    if at:
+        timestamps = [t.replace(tzinfo=timezone.utc).timestamp() for t in at]
+        active = schedule_set.active(timestamps)
+        for i, t in enumerate(at):
+            names = [name for name, flags in active.items() if flags[i]]
+            print(f'\n{t:%Y-%m-%d %H:%M} UTC: {len(names)} active partitions')
+            for name in names:
+                print(f'  {name}')
+
+    problems = schedule_set.check_sites()
+    labels = {'gaps': 'gap', 'overlaps': 'overlap', 'missing': 'missing'}
+    for site, found in problems.items():
+        for kind, values in found.items():
+            for value in values:
+                print(f'{site}: {labels[kind]} {value}')
+    if schedule_set.device_time_zone:
+        print(f'{len(schedule_set.device_time_zone)} scheduled partitions use '
+              f'the originating device time zone and were evaluated as GMT')
+    if problems:
+        raise typer.Exit(code=1)
+    print('No gaps or overlaps found')
+
+
+def preload_schema():
+    """Parse the schema and load the validation tables in this process."""
+    from axlclient import schema_client
+    from validation import default_validator
+    record = load_capabilities(_current_client.get(default_client).address)
+    schema_client(schema_wsdl(record['schema_version']) if record
+                  else DEFAULT_WSDL)
+    default_validator()
+
+
+def read_sites(path: str) -> List[dict]:
+    """Sites to add, one CSV row per site with a header naming the
+    add_full_site arguments: name and srst_ip, optionally algo_open,
+    algo_close, gmt_value, sd and pool."""
+    booleans = {'sd', 'pool'}
+    with open(path, newline='') as f:
+        sites = []
+        for row in csv.DictReader(f):
+            site = {key: value for key, value in row.items() if value != ''}
+            for key in booleans & set(site):
+                site[key] = site[key].strip().lower() in ('1', 'true', 'yes')
+            if 'gmt_value' in site:
+                site['gmt_value'] = int(site['gmt_value'])
+            sites.append(site)
+    return sites
+
+
+@app.command()
+def add_sites(sites_file: str,
+              processes: int = typer.Option(4, help='Sites added at once')):
+    """Add every site listed in a CSV file, see read_sites, on a pool of
+    processes sharing one parsed copy of the schema."""
+    sites = read_sites(sites_file)
+
+    def start_worker():
+        # Each forked worker opens its own connections to the cluster this
+        # command targets, splitting its rate limit
+        cluster = dict(_current_client.get(default_client).cluster)
+        if cluster['rate_limit']:
+            cluster['rate_limit'] /= processes
+        _current_client.set(LazyClient(cluster))
+
+    def add_site(site: dict) -> list:
+        # Hand this site's operation results back to the parent
+        log = start_log()
+        add_full_site(**site)
+        return log.results
+
+    results = process_map(add_site, sites, processes, preload=preload_schema,
+                          initializer=start_worker)
+    for result in results:
+        current_log().extend(result['value'] or [])
+
+    failed = 0
+    for site, result in zip(sites, results):
+        status = 'ok' if not result['code'] and not result['error'] \
+            else 'failed'
+        print(f'\n=== {site["name"]}: {status} in {result["duration"]:.1f}s ===')
+        print(result['output'], end='')
+        if result['error']:
+            print(result['error'])
+        failed += status != 'ok'
+    print(f'\n{len(sites) - failed}/{len(sites)} sites added')
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def add_trunks_bulk(sites_file: str,
+                    workers: int = typer.Option(8, help='Sites built at once')):
+    """Create the SIP trunks and route groups of every site in a CSV file
+    (see read_sites) as one batch."""
+    counts = build_trunks_and_route_groups(read_sites(sites_file), workers)
+    print(', '.join(f'{value} {key}' for key, value in counts.items()))
+    if counts['failed']:
+        raise typer.Exit(code=1)
+
+
+# Device pool settings which are the same at every site, so patch keeps
+# them in line with device_pool_payloads
+DEVICE_POOL_STANDARD = ['mediaResourceListName', 'callManagerGroupName',
+                        'cgpnTransformationCssName',
+                        'callingPartyNationalPrefix',
+                        'callingPartyInternationalPrefix',
+                        'callingPartyUnknownPrefix',
+                        'callingPartySubscriberPrefix']
+
+PATCH_OBJECTS = ['css', 'device-pool', 'region']
+
+
+def field_value(value) -> str:
+    """A response field as a plain string, the name of an XFkType and ''
+    when empty."""
+    if value is None:
+        return ''
+    try:
+        value = value['_value_1']
+    except (KeyError, TypeError):
+        pass
+    return '' if value is None else str(value)
+
+
+def find_sites(pattern: str) -> Dict[str, dict]:
+    """Existing sites whose name matches pattern, with the sd/pool flags
+    they were built with and the current standard settings of their device
+    pools.
+
+    A site is a '<name>-DP' device pool whose '<name>-Region' region and
+    '<name>-Loc' location exist too, which leaves out other pools such as
+    the hub's Hub-GW-DP."""
+    pools = {row['name']: row for row in list_rows(cucm.listDevicePool(
+        searchCriteria={'name': '%-DP'},
+        returnedTags={tag: xsd.Nil
+                      for tag in ['name'] + DEVICE_POOL_STANDARD}),
+        'devicePool')}
+    partitions = {row['name'] for row in list_rows(cucm.listRoutePartition(
+        searchCriteria={'name': '%-PT'},
+        returnedTags={'name': xsd.Nil}), 'routePartition')}
+    regions = {row['name'] for row in list_rows(cucm.listRegion(
+        searchCriteria={'name': '%-Region'},
+        returnedTags={'name': xsd.Nil}), 'region')}
+    locations = {row['name'] for row in list_rows(cucm.listLocation(
+        searchCriteria={'name': '%-Loc'},
+        returnedTags={'name': xsd.Nil}), 'location')}
+
+    sites = {}
+    for pool_name in pools:
+        name = pool_name[:-len('-DP')]
+        if (name.endswith('-WebEx') or not fnmatch.fnmatch(name, pattern) or
+                f'{name}-Region' not in regions or
+                f'{name}-Loc' not in locations):
+            continue
+        sites[name] = {
+            'sd': f'{name}-SD-PT' in partitions,
+            'pool': f'{name}-Pool-PT' in partitions,
+            'device_pools': {dp['name']: pools.get(dp['name'])
+                             for dp in device_pool_payloads(name)},
+        }
+    return sites
+
+
+def css_patches(sites: Dict[str, dict]) -> List[tuple]:
+    """updateCss for every site CSS whose members differ from css_payloads,
+    compared with one listCss."""
+    # CUCM returns partition names as stored, whatever their case in the
+    # payloads, and names are not case sensitive
+    clauses = {row['name']: (row['clause'] or '').casefold().split(':')
+               for row in list_rows(cucm.listCss(
+                   searchCriteria={'name': '%'},
+                   returnedTags={'name': xsd.Nil, 'clause': xsd.Nil}),
+                   'css')}
+    patches = []
+    for name, site in sites.items():
+        for css in css_payloads(name, site['sd'], site['pool']):
+            wanted = [m['routePartitionName']['_value_1'].casefold()
+                      for m in css['members']['member']]
+            if css['name'] in clauses and clauses[css['name']] != wanted:
+                patches.append(('updateCss', {'name': css['name'],
+                                              'members': css['members']}))
+    return patches
+
+
+def device_pool_patches(sites: Dict[str, dict]) -> List[tuple]:
+    """updateDevicePool with just the standard settings which differ from
+    device_pool_payloads."""
+    patches = []
+    for name, site in sites.items():
+        for dp in device_pool_payloads(name):
+            current = site['device_pools'].get(dp['name'])
+            if current is None:
+                continue
+            delta = {tag: dp[tag] for tag in DEVICE_POOL_STANDARD
+                     if field_value(current[tag]).casefold() !=
+                     dp[tag].casefold()}
+            if delta:
+                patches.append(('updateDevicePool',
+                                {'name': dp['name'], **delta}))
+    return patches
+
+
+def region_patches(sites: Dict[str, dict], workers: int) -> List[tuple]:
+    """updateRegion with just the relationships whose bandwidth differs
+    from related_region, or which are missing.
+
+    listRegion does not return relationships, so each site's region is read
+    with getRegion, in parallel."""
+    regions = [row['name'] for row in list_rows(cucm.listRegion(
+        searchCriteria={'name': '%'},
+        returnedTags={'name': xsd.Nil}), 'region')]
+
+    def patch_region(name: str) -> Optional[tuple]:
+        region_name = f'{name}-Region'
+        try:
+            region = cucm.getRegion(
+                name=region_name,
+                returnedTags={'relatedRegions': {'relatedRegion': {
+                    'regionName': xsd.Nil, 'bandwidth': xsd.Nil}}}
+            )['return']['region']
+        except Fault:
+            return None
+        related = region['relatedRegions']
+        current = {field_value(r['regionName']): field_value(r['bandwidth'])
+                   for r in (related['relatedRegion'] if related else [])}
+        changed = [related_region(other) for other in regions
+                   if other != region_name and
+                   current.get(other) != related_region(other)['bandwidth']]
+        if not changed:
+            return None
+        return ('updateRegion', {'name': region_name,
+                                 'relatedRegions': {'relatedRegion': changed}})
+
+    return [p for p in thread_map(patch_region, sites, workers) if p]
+
+
+# Faults which are worth retrying: the cluster is busy rather than the
+# request wrong
+TRANSIENT_FAULT = re.compile(r'throttl|too many|try again|timed? ?out|'
+                             r'temporarily|memory allocation', re.IGNORECASE)
+
+
+def is_transient(err: Exception) -> bool:
+    """Connection errors and Faults such as AXL throttling, but neither
+    payloads failing validation nor requests the cluster rejects."""
+    if isinstance(err, Fault):
+        return bool(TRANSIENT_FAULT.search(str(err)))
+    return isinstance(err, OSError)
+
+
+def with_retries(func, retries: int, delay: float = 0.5):
+    """func(), retried after a transient error with an exponential
+    backoff."""
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except (Fault, OSError) as err:
+            if attempt == retries or not is_transient(err):
+                raise
+            time.sleep(delay * 2 ** attempt)
+
+
+def apply_patches(patches: List[tuple], workers: int = 8, retries: int = 2
+                  ) -> Dict[str, int]:
+    """Send the update requests in parallel, within the cluster rate limit,
+    with a progress bar."""
+    counts = {'updated': 0, 'failed': 0}
+    lock = threading.Lock()
+
+    with typer.progressbar(length=len(patches), label='Patching') as progress:
+        def apply(patch: tuple):
+            operation, payload = patch
+            try:
+                with_retries(lambda: getattr(cucm, operation)(**payload),
+                             retries)
+                key = 'updated'
+            except (Fault, OSError) as err:
+                key = 'failed'
+                print(f'\nError: {operation} {payload["name"]}: {err}')
+            with lock:
+                counts[key] += 1
+                progress.update(1)
+
+        thread_map(apply, patches, workers)
+    return counts
+
+
+@app.command()
+def patch(pattern: str = typer.Argument(
+              '*', help='Name pattern of the sites to patch, such as "Tor*"'),
+          objects: List[str] = typer.Option(
+              PATCH_OBJECTS, '--object',
+              help=f'Objects to bring in line with the standard: '
+                   f'{", ".join(PATCH_OBJECTS)}'),
+          dry_run: bool = typer.Option(
+              False, help='Only count the changes and estimate their time'),
+          workers: int = typer.Option(8, help='Requests sent at once'),
+          retries: int = typer.Option(2, help='Retries of a failed update')):
+    """Bring the CSSes, device pools and regions of existing sites in line
+    with the current standard after it changed.
+
+    Every object is compared with what add_full_site would create today,
+    from a few bulk list requests, and only the fields which differ are
+    updated."""
+    unknown = set(objects) - set(PATCH_OBJECTS)
+    if unknown:
+        raise typer.BadParameter(f'unknown object {", ".join(unknown)}')
+
+    sites = find_sites(pattern)
+    print(f'{len(sites)} sites match {pattern}')
+    patches = []
+    if 'css' in objects:
+        patches += css_patches(sites)
+    if 'device-pool' in objects:
+        patches += device_pool_patches(sites)
+    if 'region' in objects:
+        patches += region_patches(sites, workers)
+
+    by_operation = {}
+    for operation, payload in patches:
+        by_operation[operation] = by_operation.get(operation, 0) + 1
+        report(f'{operation} {payload["name"]}: '
+               f'{", ".join(k for k in payload if k != "name")}')
+    for operation, count in sorted(by_operation.items()):
+        print(f'  {operation}: {count}')
+    if not patches:
+        print('Everything matches the standard')
+        return
+
+    if dry_run:
+        # From the latency of the snapshot requests just made
+        reads = current_log().results
+        latency = sum(r.latency for r in reads) / max(len(reads), 1)
+        estimate = len(patches) * latency / workers
+        rate_limit = cucm.cluster['rate_limit']
+        if rate_limit:
+            estimate = max(estimate, len(patches) / rate_limit)
+        print(f'{len(patches)} updates, about {estimate:.0f}s to apply')
+        return
+
+    counts = apply_patches(patches, workers, retries)
+    print(', '.join(f'{value} {key}' for key, value in counts.items()))
+    if counts['failed']:
+        raise typer.Exit(code=1)
+
+
+@app.command(context_settings={'allow_extra_args': True,
+                               'ignore_unknown_options': True})
+def fanout(ctx: typer.Context,
+           cluster: List[str] = typer.Option(
+               ['*'], help='Name or pattern of the clusters to run against'),
+           inventory: str = INVENTORY_FILE,
+           workers: int = typer.Option(0, help='Clusters run at once, 0 for all')):
+    """Run a command against many clusters in parallel, each with its own
+    client, connection pool and rate limit, for example:
+
+    python lab.py fanout --cluster 'prod-*' -- audit-css --save '{cluster}.json'
+
+    '{cluster}' in the command's arguments, and in --results, is replaced by
+    each cluster name."""
+    if not ctx.args:
+        raise typer.BadParameter('missing the command to run')
+    selected = select_clusters(load_inventory(inventory), cluster)
+    if not selected:
+        raise typer.BadParameter(f'no cluster in {inventory} matches {cluster}')
+    command = typer.main.get_command(app)
+
+    # Pass the global options on to each cluster's run
+    options = ctx.parent.params
+    global_args = ['--verbose'] if options['verbose'] else []
+    global_args += ['--summary'] if options['summary'] else ['--no-summary']
+    if options['results']:
+        global_args += ['--results', options['results']]
+
+    def run(target: dict) -> int:
+        _current_client.set(LazyClient(target))
+        args = [arg.replace('{cluster}', target['name'])
+                for arg in global_args + ctx.args]
+        code = command.main(args=args, prog_name='lab.py',
+                            standalone_mode=False)
+        return code if isinstance(code, int) else 0
+
+    results = fan_out(selected, run, workers=workers or None)
+
+    failed = 0
+    for target in selected:
+        result = results[target['name']]
+        status = 'ok' if not result['code'] else f'failed ({result["code"]})'
+        print(f'\n=== {target["name"]} ({target["address"]}): {status} '
+              f'in {result["duration"]:.1f}s ===')
+        print(result['output'], end='')
+        if result['error']:
+            print(result['error'])
+        failed += bool(result['code'])
+    print(f'\n{len(selected) - failed}/{len(selected)} clusters succeeded')
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def cluster_version(refresh: bool = False):
+    """Show the cached version of <uc>, probing it if needed."""
+    if refresh:
+        forget_capabilities(cucm.address)
+    cucm.ensure_connected()
+    record = cucm.capabilities
+    print(f'{record["address"]}: version {record["version"]}, '
+          f'schema {record["schema_version"]} ({record["wsdl"]})')
+
+
+@app.command()
+def startup_report(top: int = 15):
+    """Report what importing this CLI costs, and fail if a module which
+    should only be imported on first use of the client is loaded."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import lab'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True)
+
+    # Lines look like 'import time:  self [us] | cumulative | imported package'
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Nested imports are indented below the module importing them
+        imports.append((int(cumulative), name[1:]))
+
+    top_level = [(us, name) for us, name in imports
+                 if not name.startswith(' ')]
+    print(f'Total import time: {sum(us for us, _ in top_level) / 1000:.1f} ms')
+    for us, name in sorted(top_level, reverse=True)[:top]:
+        print(f'{us / 1000:8.1f} ms  {name}')
+
+    loaded = sorted({name.strip().split('.')[0] for _, name in imports}
+                    & set(HEAVY_MODULES))
+    if loaded:
+        print(f'Imported at startup: {", ".join(loaded)}')
+        raise typer.Exit(code=1)
+
+
+if __name__ == '__main__':
     app()
@@ -0,0 +1,158 @@
+"""Sampling profiler for whole CLI commands.
+
+A background thread samples the stack of every thread at a fixed interval,
+which costs the command little and sees the site worker threads as well as
+the main one. The samples are written as collapsed stacks (one
+'frame;frame;frame count' line per stack, for flamegraph.pl, inferno or
+speedscope) or as a speedscope JSON profile.
+
+Time spent on the wire is measured separately by the transport, see
+network_time(), so each AXL operation's latency can be split into network
+wait and client CPU (building the request with zeep, parsing the response
+with lxml).
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import List
+
+_network = threading.local()
+
+
+def add_network_time(seconds: float):
+    """Called by the transport with the duration of each HTTP exchange."""
+    _network.total = getattr(_network, 'total', 0.0) + seconds
+
+
+def network_time() -> float:
+    """Total time this thread has spent waiting on HTTP exchanges."""
+    return getattr(_network, 'total', 0.0)
+
+
+def add_received(size: int):
+    """Called by the transport with the size of each response body."""
+    _network.received = getattr(_network, 'received', 0) + size
+
+
+def received() -> int:
+    """Total bytes of response bodies this thread has received."""
+    return getattr(_network, 'received', 0)
+
+
+def _frame_name(code) -> str:
+    return (f'{code.co_name} ({os.path.basename(code.co_filename)}:'
+            f'{code.co_firstlineno})')
+
+
+class SamplingProfiler:
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples = Counter()
+        # Seconds each stack was seen for: a busy thread holding the GIL
+        # can stretch the time between samples well past the interval
+        self.seconds = Counter()
+        self.duration = 0.0
+        self._switch_interval = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = 0.0
+
+    def start(self):
+        # Let the sampling thread take the GIL as often as it asks for it
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='profiler')
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+        self.duration = time.perf_counter() - self._started
+
+    def _run(self):
+        own = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_name(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f'thread-{ident}'))
+                stack = tuple(reversed(stack))
+                self.samples[stack] += 1
+                self.seconds[stack] += elapsed
+
+    def collapsed(self) -> List[str]:
+        return [f'{";".join(stack)} {count}'
+                for stack, count in sorted(self.samples.items())]
+
+    def speedscope(self) -> dict:
+        """A speedscope 'sampled' profile, one per thread."""
+        frames, index = [], {}
+        profiles = {}
+        for stack in sorted(self.samples):
+            thread, *calls = stack
+            ids = []
+            for name in calls:
+                if name not in index:
+                    index[name] = len(frames)
+                    func, _, location = name.rpartition(' (')
+                    file, _, line = location.rstrip(')').rpartition(':')
+                    frames.append({'name': func, 'file': file,
+                                   'line': int(line)})
+                ids.append(index[name])
+            profile = profiles.setdefault(thread, {
+                'type': 'sampled', 'name': thread, 'unit': 'seconds',
+                'startValue': 0, 'endValue': 0, 'samples': [], 'weights': []})
+            profile['samples'].append(ids)
+            profile['weights'].append(self.seconds[stack])
+            profile['endValue'] += self.seconds[stack]
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': frames},
+            'profiles': list(profiles.values()),
+            'exporter': 'lab.py --profile',
+        }
+
+    def write(self, path: str):
+        """Write speedscope JSON if path ends with .json, else collapsed
+        stacks."""
+        with open(path, 'w') as f:
+            if path.endswith('.json'):
+                json.dump(self.speedscope(), f)
+            else:
+                f.write('\n'.join(self.collapsed()) + '\n')
+
+
+def operation_times(results) -> str:
+    """Per AXL operation, how its latency splits between network wait,
+    client CPU and the rest (waiting on the rate limit, a coalesced
+    request or the GIL), as a table."""
+    rows = {}
+    for result in results:
+        row = rows.setdefault(result.operation, [0, 0.0, 0.0, 0.0])
+        row[0] += 1
+        row[1] += result.latency
+        row[2] += result.network
+        row[3] += result.cpu
+
+    lines = [f'{"operation":<28}{"count":>6}{"total s":>9}{"network":>9}'
+             f'{"cpu":>9}{"other":>9}']
+    for operation, (count, total, network, cpu) in sorted(
+            rows.items(), key=lambda item: -item[1][1]):
+        other = max(total - network - cpu, 0.0)
+        lines.append(f'{operation:<28}{count:>6}{total:>9.2f}{network:>9.2f}'
+                     f'{cpu:>9.2f}{other:>9.2f}')
+    return '\n'.join(lines)
@@ -0,0 +1,147 @@
+"""Automatic returnedTags for get requests, learnt from what callers read.
+
+A get request without returnedTags makes the cluster serialise, and zeep
+parse, the whole object even when the caller only reads its name. The first
+response at each call site is wrapped in a tracker recording which fields of
+the returned object are read; later requests from that call site ask for
+just those fields. If a caller reads a field that was not requested (the
+code changed since the projection was learnt) the full object is fetched
+once and the field added to the projection, so a projection can never hide
+data from its caller. Projections are kept on disk between runs.
+"""
+import json
+import os
+import threading
+from typing import Callable, Dict, Optional, Set
+
+# A call site whose response was used as a whole (printed, iterated...)
+FULL = None
+
+
+class ProjectionStore:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(path) as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            stored = {}
+        self._sites: Dict[str, Optional[Set[str]]] = {
+            site: set(fields) if fields is not None else FULL
+            for site, fields in stored.items()}
+
+    def fields(self, site: str) -> Optional[Set[str]]:
+        """Fields to request for site, or None to request everything."""
+        with self._lock:
+            fields = self._sites.get(site)
+            return set(fields) if fields else None
+
+    def learn(self, site: str, field: Optional[str]):
+        with self._lock:
+            if site in self._sites and self._sites[site] is FULL:
+                return
+            if field is FULL:
+                self._sites[site] = FULL
+            else:
+                fields = self._sites.setdefault(site, set())
+                if field in fields:
+                    return
+                fields.add(field)
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            sites = {site: set(fields) if fields is not FULL else FULL
+                     for site, fields in self._sites.items()}
+            self._dirty = False
+        # Merge with what other processes saved meanwhile
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            stored = {}
+        for site, fields in sites.items():
+            if fields is FULL or stored.get(site, []) is None:
+                stored[site] = None
+            else:
+                stored[site] = sorted(fields | set(stored.get(site, [])))
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+class Tracked:
+    """Proxy over a zeep get response, response['return'][tag][field],
+    reporting each field of the returned object that is read."""
+    __slots__ = ('_value', '_level', '_tag', '_context')
+
+    def __init__(self, value, level: int, context: dict, tag: str = None):
+        self._value = value
+        self._level = level
+        self._context = context
+        self._tag = tag
+
+    def _child(self, key, value):
+        if self._level < 2:
+            return Tracked(value, self._level + 1, self._context,
+                           tag=key if self._level == 1 else None)
+
+        context = self._context
+        context['learn'](key)
+        projected = context['projected']
+        if projected is not None and key not in projected:
+            # Not requested, read it from the full object instead
+            if context.get('full') is None:
+                context['full'] = context['refetch']()
+            return context['full']['return'][self._tag][key]
+        return value
+
+    def __getitem__(self, key):
+        return self._child(key, self._value[key])
+
+    def __getattr__(self, key):
+        return self._child(key, getattr(self._value, key))
+
+    def __bool__(self):
+        return bool(self._value)
+
+    def _whole(self):
+        """The caller uses the value as a whole, so stop projecting."""
+        self._context['learn'](FULL)
+        if self._context['projected'] is not None:
+            if self._context.get('full') is None:
+                self._context['full'] = self._context['refetch']()
+            value = self._context['full']
+            for key in ['return', self._tag][:self._level]:
+                value = value[key]
+            return value
+        return self._value
+
+    def __iter__(self):
+        return iter(self._whole())
+
+    def __len__(self):
+        return len(self._whole())
+
+    def __repr__(self):
+        return repr(self._whole())
+
+    def __str__(self):
+        return str(self._whole())
+
+
+def track(response, site: str, store: ProjectionStore,
+          projected: Optional[Set[str]], refetch: Callable):
+    """Wrap response, learning the fields read at site into store."""
+    context = {
+        'learn': lambda field: store.learn(site, field),
+        'projected': projected,
+        'refetch': refetch,
+    }
+    return Tracked(response, 0, context)
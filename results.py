@@ -0,0 +1,125 @@
+"""Structured results of AXL operations.
+
+Every request made through the client is recorded as an OperationResult in
+the log of the running command, instead of its zeep response being printed.
+The log is written out once at the end as JSON lines and/or a summary table,
+so a bulk run spends no time formatting responses.
+"""
+import contextvars
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Optional, TextIO
+
+
+@dataclass
+class OperationResult:
+    operation: str
+    name: Optional[str]
+    uuid: Optional[str]
+    latency: float
+    status: str  # ok, fault or invalid
+    fault: Optional[str] = None
+    cluster: Optional[str] = None
+    timestamp: float = 0.0
+    network: float = 0.0  # of the latency, spent waiting on HTTP
+    cpu: float = 0.0  # of the latency, spent by this thread on the CPU
+    received: int = 0  # bytes of response body
+    # Bytes allocated while parsing it, with tracemalloc on. Traced process
+    # wide, so it includes other threads' allocations meanwhile
+    memory: int = 0
+
+
+class ResultLog:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.results: List[OperationResult] = []
+
+    def add(self, result: OperationResult):
+        with self._lock:
+            self.results.append(result)
+
+    def extend(self, results: List[OperationResult]):
+        with self._lock:
+            self.results.extend(results)
+
+    def write_jsonl(self, stream: TextIO):
+        for result in self.results:
+            stream.write(json.dumps(asdict(result)) + '\n')
+
+    def summary(self) -> str:
+        """Count, latency and largest response of every operation, and the
+        most memory parsing one took when tracemalloc is on, as a table."""
+        rows = {}
+        for result in self.results:
+            row = rows.setdefault(result.operation,
+                                  {'ok': 0, 'fault': 0, 'invalid': 0,
+                                   'total': 0.0, 'max': 0.0, 'size': 0,
+                                   'memory': 0})
+            row[result.status] += 1
+            row['total'] += result.latency
+            row['max'] = max(row['max'], result.latency)
+            row['size'] = max(row['size'], result.received)
+            row['memory'] = max(row['memory'], result.memory)
+        traced = any(row['memory'] for row in rows.values())
+
+        lines = [f'{"operation":<28}{"ok":>6}{"fault":>7}{"invalid":>9}'
+                 f'{"avg ms":>9}{"max ms":>9}{"max kB":>9}' +
+                 (f'{"mem kB":>9}' if traced else '')]
+        for operation, row in sorted(rows.items()):
+            count = row['ok'] + row['fault'] + row['invalid']
+            lines.append(f'{operation:<28}{row["ok"]:>6}{row["fault"]:>7}'
+                         f'{row["invalid"]:>9}'
+                         f'{row["total"] / count * 1000:>9.1f}'
+                         f'{row["max"] * 1000:>9.1f}'
+                         f'{row["size"] / 1024:>9.0f}' +
+                         (f'{row["memory"] / 1024:>9.0f}' if traced else ''))
+        return '\n'.join(lines)
+
+
+_current_log = contextvars.ContextVar('result_log')
+_default_log = ResultLog()
+
+
+def current_log() -> ResultLog:
+    return _current_log.get(_default_log)
+
+
+def start_log() -> ResultLog:
+    """Start a new log for the command running in this context."""
+    log = ResultLog()
+    _current_log.set(log)
+    return log
+
+
+def _payload_name(args: tuple, kwargs: dict) -> Optional[str]:
+    if 'name' in kwargs:
+        return str(kwargs['name'])
+    for value in list(args) + list(kwargs.values()):
+        if isinstance(value, dict) and 'name' in value:
+            return str(value['name'])
+    return None
+
+
+def _response_uuid(response) -> Optional[str]:
+    # add and update requests return the uuid of the object
+    try:
+        value = response['return']
+    except (KeyError, TypeError):
+        return None
+    if isinstance(value, str):
+        return value
+    return None
+
+
+def record(operation: str, args: tuple, kwargs: dict, started: float,
+           response=None, status: str = 'ok', fault: str = None,
+           cluster: str = None, network: float = 0.0, cpu: float = 0.0,
+           received: int = 0, memory: int = 0):
+    current_log().add(OperationResult(
+        operation=operation, name=_payload_name(args, kwargs),
+        uuid=_response_uuid(response) if response is not None else None,
+        latency=time.perf_counter() - started, status=status, fault=fault,
+        cluster=cluster, timestamp=time.time(), network=network, cpu=cpu,
+        received=received, memory=memory))
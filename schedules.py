@@ -0,0 +1,220 @@
+"""Offline evaluation of time periods, time schedules and partitions.
+
+A recurring weekly time period is turned into a bitmap (a Python int) with
+one bit per minute of the week, a schedule is the OR of its periods and a
+partition's schedule is rotated from its own time zone into UTC once. Whether
+a partition is active at a timestamp is then a single bit test, and
+partitions sharing the same hours (every site with the default Algo times)
+share one bitmap, so checking hundreds of sites over many timestamps is
+cheap. Periods bound to a date (monthOfYear/dayOfMonth) are evaluated per
+timestamp instead.
+"""
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Tuple
+
+DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep',
+          'Oct', 'Nov', 'Dec']
+DAY_MINUTES = 24 * 60
+WEEK_MINUTES = 7 * DAY_MINUTES
+FULL_WEEK = (1 << WEEK_MINUTES) - 1
+
+# The Unix epoch was a Thursday, i.e. minute 3 * 1440 of a Monday based week
+_EPOCH_WEEK_OFFSET = 3 * DAY_MINUTES
+
+
+def _minutes(hhmm: str) -> int:
+    hours, minutes = hhmm.split(':')
+    return int(hours) * 60 + int(minutes)
+
+
+def _span(start: int, end: int) -> int:
+    """Bitmap with the minutes [start, end) of the week set."""
+    return ((1 << end) - 1) ^ ((1 << start) - 1)
+
+
+def _rotate(bitmap: int, minutes: int) -> int:
+    """Shift a weekly bitmap forward by minutes, wrapping around Sunday."""
+    minutes %= WEEK_MINUTES
+    return ((bitmap << minutes) | (bitmap >> (WEEK_MINUTES - minutes))) \
+        & FULL_WEEK
+
+
+def gmt_offset_minutes(time_zone: str) -> int:
+    """Offset from UTC of an 'Etc/GMT+N' zone, which are POSIX style:
+    Etc/GMT+5 is five hours behind UTC."""
+    match = re.fullmatch(r'Etc/GMT(?:([+-])(\d+))?', time_zone or 'Etc/GMT')
+    if not match:
+        raise ValueError(f'Unsupported time zone: {time_zone}')
+    if not match.group(1):
+        return 0
+    hours = int(match.group(2))
+    return -hours * 60 if match.group(1) == '+' else hours * 60
+
+
+def _is_dated(period: dict) -> bool:
+    return (period.get('monthOfYear') or 'None') != 'None'
+
+
+def period_bitmap(period: dict) -> int:
+    """Weekly bitmap of a recurring (startDay..endDay) time period."""
+    start, end = _minutes(period['startTime']), _minutes(period['endTime'])
+    if end <= start:
+        return 0
+    first, last = DAYS.index(period['startDay']), DAYS.index(
+        period['endDay'])
+    days = range(first, last + 1) if first <= last else \
+        list(range(first, 7)) + list(range(0, last + 1))
+    bitmap = 0
+    for day in days:
+        bitmap |= _span(day * DAY_MINUTES + start, day * DAY_MINUTES + end)
+    return bitmap
+
+
+def _dated_active(period: dict, local: datetime) -> bool:
+    start = (MONTHS.index(period['monthOfYear']) + 1,
+             int(period.get('dayOfMonth') or 0))
+    end_month = period.get('monthOfYearEnd') or 'None'
+    end = (MONTHS.index(end_month) + 1,
+           int(period.get('dayOfMonthEnd') or 0)) if end_month != 'None' \
+        else start
+    if not start <= (local.month, local.day) <= end:
+        return False
+    minute = local.hour * 60 + local.minute
+    return _minutes(period['startTime']) <= minute < _minutes(
+        period['endTime'])
+
+
+def _format_range(start: int, end: int) -> str:
+    def clock(minute: int, is_end: bool) -> str:
+        day, rest = divmod(minute, DAY_MINUTES)
+        if is_end and rest == 0:
+            day, rest = day - 1, DAY_MINUTES
+        return f'{DAYS[day]} {rest // 60:02}:{rest % 60:02}'
+    return f'{clock(start, False)} - {clock(end, True)}'
+
+
+def format_minutes(bitmap: int) -> List[str]:
+    """Human readable ranges ('Mon 00:00 - Mon 06:00') of the set minutes."""
+    ranges = []
+    minute = 0
+    while bitmap >> minute:
+        rest = bitmap >> minute
+        if not rest & 1:
+            # Skip straight to the next set minute
+            minute += (rest & -rest).bit_length() - 1
+            continue
+        start = minute
+        while bitmap >> minute & 1:
+            minute += 1
+        ranges.append(_format_range(start, minute))
+    return ranges
+
+
+class ScheduleSet:
+    def __init__(self, periods: Iterable[dict], schedules: Dict[str, List[str]],
+                 partitions: Iterable[dict]):
+        """periods are time period rows as returned by listTimePeriod,
+        schedules map a time schedule name to its member period names and
+        partitions are route partition rows with 'name', 'timeScheduleIdName',
+        'useOriginatingDeviceTimeZone' and 'timeZone'."""
+        self.periods = {p['name']: p for p in periods}
+        self.schedules = schedules
+
+        # Local weekly bitmap and date bound periods per schedule
+        self.weekly = {}
+        self.dated = {}
+        for name, members in schedules.items():
+            bitmap = 0
+            dated = []
+            for member in members:
+                period = self.periods[member]
+                if _is_dated(period):
+                    dated.append(period)
+                else:
+                    bitmap |= period_bitmap(period)
+            self.weekly[name] = bitmap
+            self.dated[name] = dated
+
+        # Partitions without a schedule are always active
+        self.partitions = {}
+        self.device_time_zone = []
+        for row in partitions:
+            schedule = row.get('timeScheduleIdName')
+            if not schedule:
+                continue
+            if str(row.get('useOriginatingDeviceTimeZone')).lower() in (
+                    'true', 't', '1'):
+                # Depends on the calling device, evaluate it as GMT
+                self.device_time_zone.append(row['name'])
+                offset = 0
+            else:
+                offset = gmt_offset_minutes(row.get('timeZone'))
+            self.partitions[row['name']] = (schedule, offset)
+
+    @classmethod
+    def load(cls, path: str) -> 'ScheduleSet':
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data['timePeriods'], data['timeSchedules'],
+                   data['partitions'])
+
+    def _utc_bitmap(self, partition: str) -> Tuple[int, int]:
+        schedule, offset = self.partitions[partition]
+        # Local minute m is UTC minute m - offset
+        return _rotate(self.weekly[schedule], -offset), offset
+
+    def active(self, timestamps: List[float],
+               partitions: Iterable[str] = None) -> Dict[str, List[bool]]:
+        """Whether each scheduled partition is active at each UTC timestamp."""
+        names = list(partitions) if partitions is not None else \
+            list(self.partitions)
+        minutes = [(int(ts) // 60 + _EPOCH_WEEK_OFFSET) % WEEK_MINUTES
+                   for ts in timestamps]
+
+        # Partitions with the same hours in UTC share one evaluation
+        shared = {}
+        result = {}
+        for name in names:
+            bitmap, offset = self._utc_bitmap(name)
+            if bitmap not in shared:
+                shared[bitmap] = [bool(bitmap >> m & 1) for m in minutes]
+            flags = shared[bitmap]
+
+            dated = self.dated[self.partitions[name][0]]
+            if dated:
+                flags = list(flags)
+                zone = timezone(timedelta(minutes=offset))
+                for i, ts in enumerate(timestamps):
+                    if not flags[i]:
+                        local = datetime.fromtimestamp(ts, zone)
+                        flags[i] = any(_dated_active(p, local) for p in dated)
+            result[name] = flags
+        return result
+
+    def check_pair(self, first: str, second: str) -> Tuple[int, int]:
+        """Gap and overlap bitmaps of two schedules meant to cover the week
+        exactly once between them (such as the Algo Open and Closed)."""
+        a, b = self.weekly[first], self.weekly[second]
+        return FULL_WEEK & ~(a | b), a & b
+
+    def check_sites(self, open_suffix: str = '-Algo-Open',
+                    closed_suffix: str = '-Algo-Closed'
+                    ) -> Dict[str, Dict[str, List[str]]]:
+        """Gaps and overlaps between each site's Open and Closed schedules."""
+        problems = {}
+        for name in self.schedules:
+            if not name.endswith(open_suffix):
+                continue
+            site = name[:-len(open_suffix)]
+            closed = site + closed_suffix
+            if closed not in self.schedules:
+                problems[site] = {'missing': [closed]}
+                continue
+            gap, overlap = self.check_pair(name, closed)
+            if gap or overlap:
+                problems[site] = {'gaps': format_minutes(gap),
+                                  'overlaps': format_minutes(overlap)}
+        return problems
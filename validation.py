@@ -0,0 +1,359 @@
+"""Local validation of AXL request payloads against the schema.
+
+connect_to_cucm() runs zeep with strict=False, so a payload with a misspelt
+field or an enum value the cluster does not know is only rejected by a Fault
+after a full round trip. The schema is compiled once into plain lookup
+tables (enum value sets, simple type facets and the fields of every complex
+type) and every payload is checked against them before it is sent.
+
+Enum values are taken from AXLEnums.xsd: in AXLSoap.xsd the same types are
+a union with an unrestricted string, so they would accept anything.
+"""
+import difflib
+import os
+import re
+import xml.etree.ElementTree as ET
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'schema')
+ENUMS_FILE = os.path.join(SCHEMA_DIR, 'AXLEnums.xsd')
+SOAP_FILE = os.path.join(SCHEMA_DIR, 'AXLSoap.xsd')
+
+XS = '{http://www.w3.org/2001/XMLSchema}'
+
+# Flags of a complex type field
+REQUIRED = 1
+REPEATED = 2
+NILLABLE = 4
+
+INTEGER_TYPES = {'xsd:integer', 'xsd:int', 'xsd:long', 'xsd:short',
+                 'xsd:unsignedLong', 'xsd:unsignedInt', 'xsd:unsignedShort',
+                 'xsd:nonNegativeInteger', 'xsd:positiveInteger'}
+BOOLEAN_VALUES = {'true', 'false', '1', '0'}
+
+
+def _type_name(value: str) -> str:
+    """'axlapi:XFkType' -> 'XFkType', builtins keep their 'xsd:' prefix."""
+    prefix, _, name = value.rpartition(':')
+    return f'xsd:{name}' if prefix == 'xsd' else name
+
+
+def _compile_enums(path: str) -> Dict[str, frozenset]:
+    enums = {}
+    for simple in ET.parse(path).getroot().iter(f'{XS}simpleType'):
+        values = [e.get('value') for e in simple.iter(f'{XS}enumeration')]
+        if simple.get('name') and values:
+            enums[simple.get('name')] = frozenset(values)
+    return enums
+
+
+def _simple_spec(node: ET.Element, enums: Dict[str, frozenset]) -> tuple:
+    """Compile an xsd:simpleType into one of:
+    ('any',), ('union', specs) or
+    ('restriction', base, enum values, pattern, max length, min, max)."""
+    union = node.find(f'{XS}union')
+    if union is not None:
+        members = [('restriction', _type_name(t), None, None, None, None, None)
+                   for t in (union.get('memberTypes') or '').split()]
+        members += [_simple_spec(s, enums)
+                    for s in union.findall(f'{XS}simpleType')]
+        if any(m == ('any',) for m in members):
+            return ('any',)
+        return ('union', tuple(members))
+
+    restriction = node.find(f'{XS}restriction')
+    if restriction is None:
+        return ('any',)
+    base = _type_name(restriction.get('base'))
+    values = frozenset(e.get('value') for e in
+                       restriction.findall(f'{XS}enumeration')) or None
+
+    def facet(tag, convert=str):
+        found = restriction.find(f'{XS}{tag}')
+        return convert(found.get('value')) if found is not None else None
+
+    spec = ('restriction', base, values, facet('pattern'),
+            facet('maxLength', int), facet('minInclusive', int),
+            facet('maxInclusive', int))
+    if spec == ('restriction', 'xsd:string', None, None, None, None, None):
+        return ('any',)
+    return spec
+
+
+def _compile_soap(path: str, enums: Dict[str, frozenset]):
+    root = ET.parse(path).getroot()
+    simple_types = {}
+    complex_types = {}
+    operations = {}
+    bases = {}
+
+    def element_type(element: ET.Element, key: str) -> str:
+        if element.get('type'):
+            return _type_name(element.get('type'))
+        inline = element.find(f'{XS}complexType')
+        if inline is not None:
+            compile_complex(inline, key)
+            return key
+        inline = element.find(f'{XS}simpleType')
+        if inline is not None:
+            simple_types[key] = _simple_spec(inline, enums)
+            return key
+        return 'xsd:anyType'
+
+    def collect(group: ET.Element, key: str, fields: list, optional: bool,
+                top: bool) -> bool:
+        """Append the elements of a sequence/choice/all group to fields,
+        returning whether the group contains an xsd:any."""
+        is_open = False
+        # The top level sequence of AXL objects is minOccurs=0 but its
+        # required members are still required whenever the object is sent
+        optional = optional or group.tag == f'{XS}choice' or (
+            not top and group.get('minOccurs') == '0')
+        for child in group:
+            if child.tag == f'{XS}element':
+                name = child.get('name')
+                nillable = child.get('nillable') == 'true'
+                # zeep sends a missing nillable element as xsi:nil
+                required = not optional and not nillable and \
+                    child.get('minOccurs', '1') != '0'
+                repeated = child.get('maxOccurs', '1') != '1'
+                flags = required * REQUIRED | repeated * REPEATED | \
+                    nillable * NILLABLE
+                fields.append((name, element_type(child, f'{key}.{name}'),
+                               flags))
+            elif child.tag in (f'{XS}sequence', f'{XS}choice', f'{XS}all'):
+                is_open |= collect(child, key, fields, optional, False)
+            elif child.tag == f'{XS}any':
+                is_open = True
+        return is_open
+
+    def compile_complex(node: ET.Element, key: str):
+        fields = []
+        attributes = set()
+        simple_base = None
+        is_open = False
+        body = node
+        for content in (f'{XS}complexContent', f'{XS}simpleContent'):
+            wrapper = node.find(content)
+            if wrapper is None:
+                continue
+            derived = wrapper.find(f'{XS}extension')
+            if derived is None:
+                derived = wrapper.find(f'{XS}restriction')
+            base = _type_name(derived.get('base'))
+            if content == f'{XS}simpleContent':
+                simple_base = base
+            elif derived.tag == f'{XS}extension':
+                bases[key] = base
+            body = derived
+        for child in body:
+            if child.tag in (f'{XS}sequence', f'{XS}choice', f'{XS}all'):
+                is_open |= collect(child, key, fields, False, True)
+            elif child.tag == f'{XS}attribute':
+                attributes.add(child.get('name'))
+        complex_types[key] = (fields, attributes, simple_base, is_open)
+
+    for node in root:
+        if node.tag == f'{XS}simpleType':
+            simple_types[node.get('name')] = _simple_spec(node, enums)
+        elif node.tag == f'{XS}complexType':
+            compile_complex(node, node.get('name'))
+        elif node.tag == f'{XS}element' and node.get('type'):
+            operations[node.get('name')] = _type_name(node.get('type'))
+
+    # Flatten extensions so each type lists its inherited fields first
+    def flatten(key: str) -> tuple:
+        fields, attributes, simple_base, is_open = complex_types[key]
+        base = bases.pop(key, None)
+        if base in complex_types:
+            base_fields, base_attributes, base_simple, base_open = \
+                flatten(base)
+            fields = list(base_fields) + fields
+            attributes = set(base_attributes) | attributes
+            simple_base = simple_base or base_simple
+            is_open = is_open or base_open
+        complex_types[key] = (tuple(fields), frozenset(attributes),
+                              simple_base, is_open)
+        return complex_types[key]
+
+    for key in list(complex_types):
+        flatten(key)
+
+    # Enum types are checked against AXLEnums.xsd rather than the open union
+    for name, values in enums.items():
+        simple_types[name] = ('restriction', 'xsd:string', values, None, None,
+                              None, None)
+
+    # Only keep what can appear in a request
+    operations = {op: request for op, request in operations.items()
+                  if not op.endswith('Response')}
+    reachable = set()
+    pending = list(operations.values())
+    while pending:
+        key = pending.pop()
+        if key in reachable or key not in complex_types:
+            continue
+        reachable.add(key)
+        fields, _, simple_base, _ = complex_types[key]
+        pending.extend(field_type for _, field_type, _ in fields)
+        if simple_base:
+            pending.append(simple_base)
+    complex_types = {key: value for key, value in complex_types.items()
+                     if key in reachable}
+    return simple_types, complex_types, operations
+
+
+def compile_schema(enums_file: str = ENUMS_FILE,
+                   soap_file: str = SOAP_FILE) -> Tuple[dict, dict, dict]:
+    """Compile the XSD files into (simple types, complex types, operation
+    request types)."""
+    return _compile_soap(soap_file, _compile_enums(enums_file))
+
+
+@lru_cache(maxsize=None)
+def schema_tables() -> Tuple[dict, dict, dict]:
+    """The compiled tables, from the module generated by build_axl_types.py
+    when it exists, otherwise compiled from the XSD files."""
+    try:
+        import axl_types
+    except ImportError:
+        return compile_schema()
+    return (axl_types.SIMPLE_TYPES, axl_types.COMPLEX_TYPES,
+            axl_types.OPERATIONS)
+
+
+def _check_simple(spec: tuple, value) -> str:
+    """Return an error description, or '' if value is valid."""
+    kind = spec[0]
+    if kind == 'any':
+        return ''
+    if kind == 'union':
+        problems = [_check_simple(member, value) for member in spec[1]]
+        return '' if not all(problems) else problems[0]
+
+    _, base, values, pattern, max_length, minimum, maximum = spec
+    text = str(value).lower() if isinstance(value, bool) else str(value)
+    if values is not None and text not in values:
+        close = difflib.get_close_matches(text, values, n=1)
+        hint = f", did you mean '{close[0]}'?" if close else ''
+        return f"'{text}' is not one of the {len(values)} allowed values{hint}"
+    if pattern and not re.fullmatch(pattern, text):
+        return f"'{text}' does not match {pattern}"
+    if max_length is not None and len(text) > max_length:
+        return f'{len(text)} characters is longer than {max_length}'
+    problem = _check_builtin(base, value)
+    if problem:
+        return problem
+    if minimum is not None or maximum is not None:
+        number = int(text)
+        if (minimum is not None and number < minimum) or (
+                maximum is not None and number > maximum):
+            return f'{number} is outside {minimum}..{maximum}'
+    return ''
+
+
+def _check_builtin(name: str, value) -> str:
+    text = str(value).lower() if isinstance(value, bool) else str(value)
+    if name in INTEGER_TYPES and not re.fullmatch(r'[+-]?\d+', text):
+        return f"'{text}' is not an integer"
+    if name == 'xsd:boolean' and text not in BOOLEAN_VALUES:
+        return f"'{text}' is not a boolean"
+    return ''
+
+
+class Validator:
+    def __init__(self, tables: Tuple[dict, dict, dict] = None):
+        self.simple_types, self.complex_types, self.operations = \
+            tables or schema_tables()
+        self._fields = {}
+
+    def validate(self, operation: str, args: tuple = (),
+                 kwargs: dict = None) -> List[str]:
+        """Check the arguments of a ServiceProxy call, returning a list of
+        problems (empty when the payload is valid)."""
+        request = self.operations.get(operation)
+        if request not in self.complex_types:
+            return [f'unknown operation {operation}']
+        fields = self.complex_types[request][0]
+        payload = dict(kwargs or {})
+        for (name, *_), value in zip(fields, args):
+            payload[name] = value
+        errors = []
+        self._check_complex(request, payload, operation, errors)
+        return errors
+
+    def _check(self, type_name: str, value, path: str, errors: List[str]):
+        # None and zeep markers such as xsd.Nil/xsd.SkipValue are not checked
+        if value is None or not isinstance(value, (str, int, float, dict,
+                                                   list, tuple)):
+            return
+        if isinstance(value, (list, tuple)):
+            for i, item in enumerate(value):
+                self._check(type_name, item, f'{path}[{i}]', errors)
+            return
+        if type_name in self.complex_types:
+            self._check_complex(type_name, value, path, errors)
+        elif isinstance(value, dict):
+            errors.append(f'{path}: expected a value, not an object')
+        elif type_name in self.simple_types:
+            problem = _check_simple(self.simple_types[type_name], value)
+            if problem:
+                errors.append(f'{path}: {problem}')
+        else:
+            problem = _check_builtin(type_name, value)
+            if problem:
+                errors.append(f'{path}: {problem}')
+
+    def _check_complex(self, type_name: str, value, path: str,
+                       errors: List[str]):
+        fields, attributes, simple_base, is_open = \
+            self.complex_types[type_name]
+        if simple_base is not None:
+            # Such as XFkType, passed as 'name' or {'_value_1': 'name'}
+            if isinstance(value, dict):
+                unknown = set(value) - attributes - {'_value_1'}
+                for key in sorted(unknown):
+                    errors.append(f'{path}: unknown field {key}')
+                value = value.get('_value_1')
+            self._check(simple_base, value, path, errors)
+            return
+        if not isinstance(value, dict):
+            errors.append(f'{path}: expected an object')
+            return
+
+        by_name = self._fields.get(type_name)
+        if by_name is None:
+            by_name = self._fields[type_name] = {
+                name: (field_type, flags) for name, field_type, flags in fields}
+        for key, item in value.items():
+            if key in by_name:
+                field_type, flags = by_name[key]
+                # An empty string clears a nillable field
+                if not (flags & NILLABLE and item == ''):
+                    self._check(field_type, item, f'{path}.{key}', errors)
+            elif key not in attributes and not is_open:
+                close = difflib.get_close_matches(key, by_name, n=1)
+                hint = f', did you mean {close[0]}?' if close else ''
+                errors.append(f'{path}: unknown field {key}{hint}')
+        for name, (_, flags) in by_name.items():
+            if flags & REQUIRED and name not in value:
+                errors.append(f'{path}: missing required field {name}')
+
+    def returned_tags(self, operation: str) -> Dict[str, bool]:
+        """The fields an operation's returnedTags can select, each mapped
+        to whether it is a plain value (rather than a nested object)."""
+        request = self.operations.get(operation)
+        fields = self.complex_types.get(request, ((),))[0]
+        tags = next((t for name, t, _ in fields if name == 'returnedTags'),
+                    None)
+        if tags not in self.complex_types:
+            return {}
+        return {name: field_type not in self.complex_types or
+                self.complex_types[field_type][2] is not None
+                for name, field_type, _ in self.complex_types[tags][0]}
+
+
+@lru_cache(maxsize=None)
+def default_validator() -> Validator:
+    return Validator()
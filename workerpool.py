@@ -0,0 +1,96 @@
+"""Process pool whose workers share the parent's parsed schema.
+
+Building a zeep Client parses the WSDL and 4.5 MB of XSD into a large object
+graph. The parent process parses it once, freezes it out of the garbage
+collector's reach and then forks the workers, which inherit it copy-on-write:
+worker startup is instant and the schema's memory is shared by the whole
+pool instead of being duplicated per worker.
+
+Where fork is not available (Windows) the work runs on threads in the
+parent process instead, which shares the schema just the same.
+"""
+import contextlib
+import contextvars
+import gc
+import io
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List
+
+
+def can_fork() -> bool:
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _run(func: Callable, item, capture: bool = True) -> dict:
+    """Call func(item), collecting its return value, exit code, duration
+    and output."""
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    result = {'code': 0, 'error': None, 'value': None}
+    try:
+        with contextlib.redirect_stdout(buffer) if capture else \
+                contextlib.nullcontext():
+            result['value'] = func(item)
+    except SystemExit as err:
+        result['code'] = err.code or 0
+    except Exception as err:
+        # typer.Exit carries an exit code rather than being an error
+        if hasattr(err, 'exit_code'):
+            result['code'] = err.exit_code
+        else:
+            result.update(code=1, error=f'{type(err).__name__}: {err}')
+    result['duration'] = time.perf_counter() - start
+    result['output'] = buffer.getvalue()
+    return result
+
+
+_worker_func = None
+
+
+def _worker_task(item) -> dict:
+    return _run(_worker_func, item)
+
+
+def process_map(func: Callable, items: Iterable, processes: int,
+                preload: Callable = None, initializer: Callable = None
+                ) -> List[dict]:
+    """Run func over items on a pool of forked processes.
+
+    preload runs once in the parent before forking (load the schema there),
+    initializer once in each forked worker (create its own connections
+    there, as sockets must not be shared between processes). The threads
+    used where fork is not available share the parent's connections, so
+    the initializer does not run for them."""
+    global _worker_func
+    items = list(items)
+    if preload:
+        preload()
+
+    if not can_fork():
+        # redirect_stdout is process wide, so threads print as they go
+        return thread_map(lambda item: _run(func, item, capture=False),
+                          items, processes)
+
+    # Objects which already exist are never collected, so the collector
+    # leaves their pages alone and they stay shared with the workers
+    gc.freeze()
+    _worker_func = func
+    try:
+        context = multiprocessing.get_context('fork')
+        with context.Pool(processes, initializer=initializer) as pool:
+            return pool.map(_worker_task, items, chunksize=1)
+    finally:
+        _worker_func = None
+        gc.unfreeze()
+
+
+def thread_map(func: Callable, items: Iterable, workers: int) -> list:
+    """func over items on a pool of threads, each call running in a copy of
+    the caller's context, so it sees the caller's cluster client, result
+    log and fanout output buffer rather than the defaults."""
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda item: context.copy().run(func, item),
+                             items))